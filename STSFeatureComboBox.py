@@ -1,19 +1,158 @@
-#  this class defines an live-update / auto-update combo box; whenever the combo
-#   box is opened, it rebuilds and displays the list of all sartopo features
-#   of the associated feature type in the map associated with the open sartopo session
+#  this class defines an live-update / auto-update combo box; it displays the list of
+#   all sartopo features of the associated feature type in the map associated with
+#   the open sartopo session
+
+#  the list is not kept in the combo box itself: all combo boxes of the same feature
+#   class share one FeatureListModel, over the parent's local copy of the features
+#   (which the parent keeps up to date in the background), and each combo box views
+#   it through its own FeatureFilterProxyModel, which does the folder filtering and
+#   shows its header first; when features are added or changed, only the changed rows
+#   are signalled to the views, so nothing is rebuilt, even while the popup is open
 
 #  to create a live-update combo box, follow these steps:
 #   1. if using Qt Designer, create a combo box and promote it to STSFeatureComboBox
 #   2. in code, define a function updateFeatureList to retrieve the list; it will be called
 #       automatically when the combo box popup is shown, in this class's overridden showPopup
+#   3. call setFeatureModel with the model for the feature class
 
-# TODO: right now, functions used to rebuild the combo box are split between
-#  this class and the calling class.  See if that can be simplified, to bring all
-#  functionality into this class.
 
+import logging
 
+from PyQt5.QtCore import Qt,QAbstractListModel,QSortFilterProxyModel,QModelIndex
 from PyQt5.QtWidgets import QComboBox
 
+from feature_list import featureTitle
+
+log=logging.getLogger(__name__)
+
+# FeatureListModel: list model of a FeatureList, in title order, after any header
+#  rows; a header row is shown only by the combo box whose headerText it is (see
+#  FeatureFilterProxyModel), and it stands for the feature with the same title, if
+#  there is one (i.e. in case it has any already-existing variant data such as a
+#  folderID), or else is a plain string with no data.  The item data is the
+#  feature id for folders, or [id,properties] for other features.
+#  All changes to the FeatureList must be made through merge and clear.
+class FeatureListModel(QAbstractListModel):
+    def __init__(self,featureClass,featureList,parent=None):
+        QAbstractListModel.__init__(self,parent)
+        self.featureClass=featureClass
+        self.featureList=featureList
+        self.headers=[]
+
+    def rowCount(self,parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.headers)+len(self.featureList)
+
+    def isHeader(self,row):
+        return row<len(self.headers)
+
+    # feature: the feature at the row, or for a header row, the feature with the
+    #  same title, if any
+    def feature(self,row):
+        if row<len(self.headers):
+            return self.featureList.withTitle(self.headers[row])
+        return self.featureList.at(row-len(self.headers))
+
+    def title(self,row):
+        if row<len(self.headers):
+            return self.headers[row]
+        return featureTitle(self.featureList.at(row-len(self.headers)))
+
+    def data(self,index,role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role==Qt.DisplayRole or role==Qt.EditRole:
+            return self.title(index.row())
+        if role==Qt.UserRole:
+            feature=self.feature(index.row())
+            if feature is None:
+                return None
+            if self.featureClass=="Folder":
+                return feature["id"]
+            return [feature["id"],feature.get("properties",{})]
+        return None
+
+    def addHeader(self,headerText):
+        if headerText in self.headers:
+            return
+        n=len(self.headers)
+        self.beginInsertRows(QModelIndex(),n,n)
+        self.headers.append(headerText)
+        self.endInsertRows()
+
+    # merge: add new features, and replace any previous versions (by id); a
+    #  changed feature whose title is unchanged keeps its row; the first
+    #  features of a map are added all at once, since nothing can be selected yet
+    def merge(self,features):
+        if len(self.featureList)==0:
+            self.beginResetModel()
+            self.featureList.merge(features)
+            self.endResetModel()
+            return
+        n=len(self.headers)
+        for feature in features:
+            old=self.featureList.get(feature["id"])
+            if old is not None:
+                if featureTitle(old)==featureTitle(feature):
+                    k=self.featureList.add(feature)
+                    self.dataChanged.emit(self.index(n+k),self.index(n+k))
+                    continue
+                k=self.featureList.position(feature["id"])
+                self.beginRemoveRows(QModelIndex(),n+k,n+k)
+                self.featureList.remove(feature["id"])
+                self.endRemoveRows()
+                self.headerChanged(featureTitle(old))
+            k=self.featureList.insertPosition(feature)
+            self.beginInsertRows(QModelIndex(),n+k,n+k)
+            self.featureList.add(feature)
+            self.endInsertRows()
+            self.headerChanged(featureTitle(feature))
+
+    # headerChanged: a feature with this title was added or removed, so if it is
+    #  also a header, the header row's data may have changed
+    def headerChanged(self,title):
+        if title in self.headers:
+            row=self.headers.index(title)
+            self.dataChanged.emit(self.index(row),self.index(row))
+
+    def clear(self):
+        self.beginResetModel()
+        self.featureList.clear()
+        self.endResetModel()
+
+# FeatureFilterProxyModel: the rows of a FeatureListModel that one combo box shows:
+#  its own header row (which comes first, since the header rows do), then the
+#  other features in the filter folder (or all of them, if folderId is None), in
+#  the same order; nothing is sorted here
+class FeatureFilterProxyModel(QSortFilterProxyModel):
+    def __init__(self,parent=None):
+        QSortFilterProxyModel.__init__(self,parent)
+        self.headerText=None
+        self.folderId=None
+        self.setDynamicSortFilter(True)
+
+    def setHeaderText(self,headerText):
+        if headerText!=self.headerText:
+            self.headerText=headerText
+            self.invalidateFilter()
+
+    def setFolderId(self,folderId):
+        if folderId!=self.folderId:
+            self.folderId=folderId
+            self.invalidateFilter()
+
+    def filterAcceptsRow(self,sourceRow,sourceParent):
+        model=self.sourceModel()
+        if model.isHeader(sourceRow):
+            return model.title(sourceRow)==self.headerText
+        feature=model.feature(sourceRow)
+        if featureTitle(feature)==self.headerText:
+            return False
+        if self.folderId is None:
+            return True
+        return feature.get("properties",{}).get("folderId",0)==self.folderId
+
 # since there is no onShowPopup or similar signal, the recommended
 #  way to perform an action when the combobox is opened is to subclass
 #  and overload showPopup:
@@ -23,30 +162,35 @@ class STSFeatureComboBox(QComboBox):
         self.parent=parent
         self.headerText=None
         self.featureClass=None
-#         self.filterFolderId=None
-#       avoid storing the list of items as a custom instance attribute; it's redundant with
-#         the internal list of items, and it's hard to keep both lists in sync; instead,
-#         just use .getItems()
+        self.featureModel=None
+        self.proxyModel=None
         # self.filterFolderComboBox = ui combobox object
         #  that contains the id (in currentData) of the folder to filter with
         self.filterFolderComboBox=None
-        self.extraItems=[] # list of extra items to add even if they do not exist on the map
         super(STSFeatureComboBox,self).__init__(parent)
-   
+
+    # setFeatureModel: show the features of the (shared) FeatureListModel; this is
+    #  part of setting up the combo box, so the initial selection doesn't signal
+    def setFeatureModel(self,featureModel):
+        self.featureModel=featureModel
+        self.proxyModel=FeatureFilterProxyModel(self)
+        self.proxyModel.setSourceModel(featureModel)
+        self.blockSignals(True)
+        self.setModel(self.proxyModel)
+        if self.headerText is not None:
+            self.setHeader(self.headerText)
+        self.blockSignals(False)
+
     def showPopup(self):
         ffid=None
         if self.filterFolderComboBox:
             if self.filterFolderComboBox.currentText()!=self.filterFolderComboBox.headerText:
                 ffid=self.filterFolderComboBox.currentData()
-                print("Filtering using folder id "+str(ffid))
-        # also pass self as the widget to call setItems on
-        # self.parent.updateFeatureList(self.featureClass,ffid,self)
-        self.parent.updateFeatureList(self.featureClass,ffid)
-        for i in self.extraItems:
-            if i not in self.getTexts():
-                self.addItem(i)
+                log.debug("Filtering using folder id %s",ffid)
+        self.proxyModel.setFolderId(ffid)
+        self.parent.updateFeatureList(self.featureClass)
         if self.headerText is not None:
-            self.setHeader(self.headerText)
+            self.setCurrentIndex(0)
         QComboBox.showPopup(self)
         # expand the drop-down list width to fit the longest choice
         #   from stackoverflow.com/questions/3151798
@@ -58,39 +202,13 @@ class STSFeatureComboBox(QComboBox):
     def getItems(self):
         return [[self.itemText(i),self.itemData(i)] for i in range(self.count())]
 
-    # setItems: rebuild the list of selections; prepend with Edit and a separator;
-    #  each item should be a sartopo feature name and its corresponding sartopo id
-    def setItems(self,l):
-        self.clear()
-        # if self.headerText is not None:
-        #     self.addItem(self.headerText)
-        #     self.insertSeparator(1)
-        for i in l:
-            self.addItem(i[0],i[1])
-
-    # setHeader: set the first item of the combo box to be either a simple string
-    #   equal to the headerText argument, or, if an item with that string already
-    #   exists, move that item to be the first argument (i.e. in case it has any
-    #   already-existing variant data such as a folderID)
+    # setHeader: make the first item of the combo box either a simple string
+    #   equal to the headerText argument, or, if a feature with that title
+    #   exists, that feature (i.e. in case it has any already-existing variant
+    #   data such as a folderID), and select it
     def setHeader(self,headerText):
-        print("setHeader called with headerText="+headerText)
-        items=self.getItems()
-        print("  items:"+str(items))
-        for n in range(self.count()):
-            item=items[n]
-            if item[0]==headerText:
-                if n==0:
-                    print("  "+headerText+" already exists at the top of the list; returning")
-                    self.setCurrentIndex(0)
-                    return
-                print("  "+headerText+" found at index "+str(n)+"; moving to top")
-                self.removeItem(n)
-                print("     items after remove:"+str(self.getItems()))
-                self.insertItem(0,item[0],item[1])
-                print("     items after insert:"+str(self.getItems()))
-                self.setCurrentIndex(0)
-                return
-        print("  "+headerText+" not found in the existing list; adding to top as a simple string")
-        self.insertItem(0,headerText)
+        log.debug("setHeader called with headerText=%s",headerText)
+        self.headerText=headerText
+        self.featureModel.addHeader(headerText)
+        self.proxyModel.setHeaderText(headerText)
         self.setCurrentIndex(0)
-        
\ No newline at end of file
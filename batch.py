@@ -0,0 +1,151 @@
+#  batch.py - place markers for a whole list of addresses in one run: each row
+#   of a batch csv file is resolved against the location database, and a
+#   marker is added for each resolved row, several requests at a time, using
+#   one sartopo session and one folder for the whole batch
+
+#  a batch csv file has the address in the first column and, optionally, the
+#   marker description in the second column; a first row whose first column
+#   is 'address' is taken as a header and skipped.  Since addresses contain a
+#   comma before the city, a row whose first column isn't a known address is
+#   also tried with the first two columns joined (i.e. an unquoted address, or
+#   separate street address and city columns), in which case the description
+#   is in the third column.  Rows that can't be
+#   resolved exactly are not placed (a wrong marker is worse than a missing
+#   one); they are reported, with the closest known address as a suggestion
+#   if the fuzzy search index is available.
+
+#  nothing here depends on PyQt, so that the same code serves the GUI (in the
+#   request worker thread) and the command line (see sartopo_address_cli.py);
+#   sartopo_python is only imported when a session is actually opened.
+
+import csv
+import logging
+from concurrent.futures import ThreadPoolExecutor,as_completed
+
+from location_db import streetLabel
+
+log=logging.getLogger(__name__)
+
+maxConcurrentRequests=4
+
+# requestError: whether an exception raised while making sartopo requests
+#  means that the request failed (as opposed to the program being asked to
+#  exit); sartopo_python's STSException derives from BaseException rather
+#  than Exception, so callers catch BaseException and re-raise the rest
+def requestError(e):
+	return not isinstance(e,(SystemExit,KeyboardInterrupt,GeneratorExit))
+
+# BatchRow: one row of a batch csv file, and what became of it
+class BatchRow():
+	def __init__(self,lineNumber,fields):
+		self.lineNumber=lineNumber
+		self.fields=fields
+		self.address=fields[0]
+		self.description=fields[1] if len(fields)>1 and fields[1] else None
+		self.row=None # row index in the location store, once resolved
+		self.title=None
+		self.lat=None
+		self.lon=None
+		self.suggestion=None # closest known address, if the row couldn't be resolved
+		self.error=None # error message, if the marker couldn't be added
+
+def readBatchCsv(fileName):
+	rows=[]
+	with open(fileName,'r',newline='') as csvFile:
+		for (lineNumber,row) in enumerate(csv.reader(csvFile),1):
+			if not row or not row[0].strip():
+				continue
+			if not rows and row[0].strip().lower()=="address":
+				continue
+			rows.append(BatchRow(lineNumber,[f.strip() for f in row]))
+	return rows
+
+# resolveBatch: look up each row in the location catalog; returns the lists
+#  of resolved and unresolved rows
+def resolveBatch(db,rows):
+	resolved=[]
+	unresolved=[]
+	for r in rows:
+		i=db.lookup(r.address)
+		if i is None and len(r.fields)>1:
+			i=db.lookup(r.fields[0]+", "+r.fields[1])
+			if i is not None:
+				r.address=r.fields[0]+", "+r.fields[1]
+				r.description=r.fields[2] if len(r.fields)>2 and r.fields[2] else None
+		if i is None:
+			matches=db.fuzzySearch(r.address,1)
+			if matches:
+				r.suggestion=db.key(matches[0])
+			unresolved.append(r)
+			continue
+		r.row=i
+		r.title=streetLabel(db.key(i))
+		r.lat=db.lat(i)
+		r.lon=db.lon(i)
+		resolved.append(r)
+	return (resolved,unresolved)
+
+# openSession: open a sartopo session for the map url, the same way as the GUI
+def openSession(url,accountName=""):
+	from sartopo_python import SartopoSession
+	parse=url.rstrip("#").replace("http://","").replace("https://","").split("/")
+	domainAndPort=parse[0]
+	mapID=parse[-1]
+	log.info("calling SartopoSession with domainAndPort=%s mapID=%s",domainAndPort,mapID)
+	if 'sartopo.com' in domainAndPort.lower():
+		log.info("  creating online session for user %s",accountName)
+		return SartopoSession(domainAndPort=domainAndPort,mapID=mapID,
+								configpath="../sts.ini",
+								account=accountName)
+	else:
+		return SartopoSession(domainAndPort=domainAndPort,mapID=mapID)
+
+# findFolder: return the id of the folder with the given title, making the
+#  folder if it doesn't already exist
+def findFolder(sts,folderName):
+	for folder in sts.getFeatures("Folder") or []:
+		if folder["properties"]["title"]==folderName:
+			return folder["id"]
+	fid=sts.addFolder(folderName)
+	if not fid:
+		raise RuntimeError("could not add folder "+folderName)
+	return fid
+
+# placeMarkers: add a marker for each resolved row, with at most maxWorkers
+#  requests in flight at a time; if specified, progress is called with the
+#  number of rows done so far and the total, as each one finishes; returns the
+#  list of rows that failed (each with its error set)
+def placeMarkers(sts,rows,folderId,symbol="point",description=None,maxWorkers=maxConcurrentRequests,progress=None):
+	def place(r):
+		rval=sts.addMarker(r.lat,r.lon,r.title,r.description or description,"FF0000",symbol,None,folderId)
+		if not rval:
+			raise RuntimeError("no response")
+		return rval
+	failed=[]
+	done=0
+	with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+		futures={executor.submit(place,r):r for r in rows}
+		for f in as_completed(futures):
+			r=futures[f]
+			try:
+				f.result()
+			except BaseException as e:
+				if not requestError(e):
+					raise
+				r.error=str(e) or type(e).__name__
+				failed.append(r)
+			done+=1
+			if progress:
+				progress(done,len(rows))
+	failed.sort(key=lambda r: r.lineNumber)
+	return failed
+
+# writeReport: write the rows that were not placed (unresolved or failed) to a
+#  csv file, so they can be fixed and run again
+def writeReport(fileName,rows):
+	with open(fileName,'w',newline='') as csvFile:
+		w=csv.writer(csvFile)
+		w.writerow(["address","description","line","problem","suggestion"])
+		for r in rows:
+			problem=r.error if r.error else "address not found"
+			w.writerow([r.address,r.description or "",r.lineNumber,problem,r.suggestion or ""])
@@ -0,0 +1,83 @@
+#  feature_list.py - the locally known sartopo features of one class (Folder,
+#   Marker, etc.), kept up to date from the incremental results of getFeatures
+
+#  features are kept in a dict by id, so that a new version of a feature
+#   (returned by the API when its attributes have changed) replaces the old one
+#   without a search; the title order is kept in a separate sorted list of
+#   (title,id) pairs, which is updated by binary search for each changed
+#   feature instead of re-sorting the whole list, so merging k changed features
+#   into n known ones costs O(k log n) comparisons.
+
+import bisect
+
+def featureTitle(feature):
+	return feature.get("properties",{}).get("title","UNNAMED")
+
+class FeatureList():
+	def __init__(self):
+		self.features={} # id -> feature
+		self.order=[] # sorted list of (title,id)
+
+	def __len__(self):
+		return len(self.features)
+
+	# __iter__: the features in title order
+	def __iter__(self):
+		for (title,id) in self.order:
+			yield self.features[id]
+
+	def get(self,id):
+		return self.features.get(id)
+
+	# at: the feature at position k in title order
+	def at(self,k):
+		return self.features[self.order[k][1]]
+
+	# position: the position of the feature with this id in title order, or
+	#  None if there is none
+	def position(self,id):
+		feature=self.features.get(id)
+		if feature is None:
+			return None
+		return bisect.bisect_left(self.order,(featureTitle(feature),id))
+
+	# insertPosition: the position that the feature would have if it were
+	#  added now
+	def insertPosition(self,feature):
+		return bisect.bisect_left(self.order,(featureTitle(feature),feature["id"]))
+
+	# withTitle: the (first) feature with this title, or None
+	def withTitle(self,title):
+		k=bisect.bisect_left(self.order,(title,))
+		if k<len(self.order) and self.order[k][0]==title:
+			return self.features[self.order[k][1]]
+		return None
+
+	def clear(self):
+		self.features={}
+		self.order=[]
+
+	# add: add a feature whose id is not in the list yet, or replace the
+	#  previous version of one whose title has not changed; returns its position
+	def add(self,feature):
+		id=feature["id"]
+		k=self.insertPosition(feature)
+		if id not in self.features:
+			self.order.insert(k,(featureTitle(feature),id))
+		self.features[id]=feature
+		return k
+
+	# remove: remove the feature with this id; returns its old position
+	def remove(self,id):
+		k=self.position(id)
+		del self.order[k]
+		del self.features[id]
+		return k
+
+	# merge: add new features, and replace any previous versions (by id)
+	def merge(self,features):
+		for feature in features:
+			old=self.features.get(feature["id"])
+			if old is not None and featureTitle(old)!=featureTitle(feature):
+				self.remove(feature["id"])
+			self.add(feature)
@@ -0,0 +1,1473 @@
+#  location_db.py - read the location lookup table (address,lat,lon, and
+#   optionally city, zip code, and parcel number) from a csv file into a
+#   compact AddressStore, and keep a compiled cache of the store next to the
+#   csv file so that later loads don't need to re-parse the csv or rebuild the
+#   street table; the csv file is read as a stream, and written straight into
+#   the cache, which the store is then mapped from
+
+#  the cache is only used if the csv file's size and modification time match
+#   the values recorded in the cache; otherwise the csv is parsed and the cache
+#   is rewritten.  A missing, unreadable, or stale cache file is never an error;
+#   it just means the csv gets parsed again.
+
+#  the cache file is laid out so that it can be memory-mapped and used in place:
+#   a fixed-size header, then the key offsets, normalized key offsets, lat, lon,
+#   street index, street line offsets, street line lat and lon, and normalized
+#   key order arrays (all 8-byte items), then the utf-8 key blob and the utf-8
+#   normalized key blob.  Nothing is copied into python objects until a
+#   particular row is asked for, so a cached store is ready to use as soon as
+#   it is mapped.
+
+#  normalized keys (see normalizeAddress) are what the exact, word, and fuzzy
+#   indexes are built from, so that e.g. 'Ln' and 'Lane' or 'Hwy 49' and
+#   'Highway 49' are the same; they are computed once per row when the store is
+#   built from the csv file, and the same normalization is applied to the text
+#   being looked up.
+
+import os
+import sys
+import csv
+import re
+import string
+import mmap
+import struct
+import pickle
+import shutil
+import tempfile
+import heapq
+import itertools
+import operator
+import collections
+import bisect
+import math
+import logging
+from array import array
+
+log=logging.getLogger(__name__)
+
+cacheMagic=b"SAADDRDB"
+cacheVersion=8
+# magic, version, byte order, csv size, csv mtime (ns), row count, address count, street count,
+#  street line point count, blob length, normalized blob length
+cacheHeader=struct.Struct("<8sII8q")
+
+# USPS standard street suffix abbreviations (Publication 28, appendix C1) for
+#  the suffixes in common use, including common alternate spellings
+suffixAbbreviations={
+	"alley":"aly","allee":"aly","ally":"aly",
+	"avenue":"ave","av":"ave","aven":"ave","avenu":"ave","avn":"ave","avnue":"ave",
+	"boulevard":"blvd","boul":"blvd","boulv":"blvd",
+	"canyon":"cyn","canyn":"cyn","cnyn":"cyn",
+	"circle":"cir","circ":"cir","circl":"cir","crcl":"cir","crcle":"cir",
+	"court":"ct","crt":"ct",
+	"cove":"cv",
+	"creek":"crk",
+	"crossing":"xing","crssng":"xing",
+	"drive":"dr","driv":"dr","drv":"dr",
+	"expressway":"expy","expr":"expy","express":"expy","expw":"expy",
+	"freeway":"fwy","freewy":"fwy","frway":"fwy","frwy":"fwy",
+	"grade":"grade",
+	"heights":"hts","ht":"hts",
+	"highway":"hwy","highwy":"hwy","hiway":"hwy","hiwy":"hwy","hway":"hwy",
+	"hill":"hl",
+	"hollow":"holw","hllw":"holw","hollows":"holw","holws":"holw",
+	"junction":"jct","jction":"jct","jctn":"jct","junctn":"jct","juncton":"jct",
+	"lake":"lk",
+	"lane":"ln",
+	"loop":"loop","loops":"loop",
+	"meadow":"mdw",
+	"meadows":"mdws","medows":"mdws",
+	"mountain":"mtn","mntain":"mtn","mntn":"mtn","mountin":"mtn","mtin":"mtn",
+	"parkway":"pkwy","parkwy":"pkwy","pkway":"pkwy","pky":"pkwy",
+	"place":"pl",
+	"point":"pt",
+	"ranch":"rnch","ranches":"rnch","rnchs":"rnch",
+	"ridge":"rdg","rdge":"rdg",
+	"road":"rd",
+	"route":"rte",
+	"square":"sq","sqr":"sq","sqre":"sq","squ":"sq",
+	"street":"st","strt":"st","str":"st",
+	"terrace":"ter","terr":"ter",
+	"trail":"trl","trails":"trl","trls":"trl",
+	"view":"vw",
+	"vista":"vis","vist":"vis","vst":"vis","vsta":"vis",
+	"way":"way","wy":"way",
+}
+
+# USPS directional abbreviations (Publication 28, appendix B)
+directionalAbbreviations={
+	"north":"n","south":"s","east":"e","west":"w",
+	"northeast":"ne","northwest":"nw","southeast":"se","southwest":"sw",
+}
+
+addressAbbreviations=dict(suffixAbbreviations)
+addressAbbreviations.update(directionalAbbreviations)
+
+# translate all punctuation to spaces; str.translate is much faster than a regex
+punctuationTable=str.maketrans({c:" " for c in string.punctuation})
+
+# normalizeAddress: lowercase, strip punctuation, collapse whitespace, and
+#  replace street suffixes and directions with their standard abbreviations;
+#  normalizing an already-normalized string doesn't change it
+def normalizeAddress(text):
+	words=text.lower().translate(punctuationTable).split()
+	return " ".join([addressAbbreviations.get(w,w) for w in words])
+
+# streetLabel: the marker label for an address or street-and-city entry: all
+#  words up to but excluding the street suffix, which is assumed to be the
+#  word that ends with a comma (this rule works for exact addresses and for
+#  streets)
+def streetLabel(addr):
+	parse=addr.split()
+	n=0
+	for n in range(len(parse)):
+		if parse[n][len(parse[n])-1]==",":
+			break
+	if n==0:
+		n=2
+	return ' '.join(parse[0:n])
+
+def cacheFileName(fileName):
+	return fileName+".cache"
+
+# fileStamp: the (size, modification time in ns) of the file, which is how a
+#  cache file identifies the version of the csv file that it was made from
+def fileStamp(fileName):
+	st=os.stat(fileName)
+	return (st.st_size,st.st_mtime_ns)
+
+# AddressStore: compact, read-only table of locations, sorted by lowercase key;
+#  row i has key(i), normKey(i), lat(i), lon(i); streets is the (ascending)
+#  list of row indices of the street-and-city entries, and for the k-th street,
+#  the points lineLats/lineLons[lineOffsets[k]:lineOffsets[k+1]] are its
+#  addresses in house number order; normOrder is the list of all row indices,
+#  sorted by normalized key, for exact lookups (see findAll); stamp is the
+#  fileStamp of the csv file that the store was read from
+class AddressStore():
+	def __init__(self,blob=b"",offsets=None,lats=None,lons=None,streets=None,addressCount=0,
+			normBlob=b"",normOffsets=None,lineOffsets=None,lineLats=None,lineLons=None,normOrder=None):
+		self.blob=blob
+		self.offsets=offsets if offsets is not None else array('q',[0])
+		self.normBlob=normBlob
+		self.normOffsets=normOffsets if normOffsets is not None else array('q',[0])
+		self.lats=lats if lats is not None else array('d')
+		self.lons=lons if lons is not None else array('d')
+		self.streets=streets if streets is not None else array('q')
+		self.lineOffsets=lineOffsets if lineOffsets is not None else array('q',[0])
+		self.lineLats=lineLats if lineLats is not None else array('d')
+		self.lineLons=lineLons if lineLons is not None else array('d')
+		self.normOrder=normOrder if normOrder is not None else array('q')
+		self.addressCount=addressCount
+		self.stamp=None
+		self.mm=None # mmap object, if the store is mapped from a cache file
+
+	def __len__(self):
+		return len(self.offsets)-1
+
+	def key(self,i):
+		return str(self.blob[self.offsets[i]:self.offsets[i+1]],'utf-8')
+
+	def normKey(self,i):
+		return str(self.normBlob[self.normOffsets[i]:self.normOffsets[i+1]],'utf-8')
+
+	def normKeyBytes(self,i):
+		return bytes(self.normBlob[self.normOffsets[i]:self.normOffsets[i+1]])
+
+	def lat(self,i):
+		return self.lats[i]
+
+	def lon(self,i):
+		return self.lons[i]
+
+	def row(self,i):
+		return [self.key(i),self.lats[i],self.lons[i]]
+
+	def keys(self):
+		for i in range(len(self)):
+			yield self.key(i)
+
+	# streetLine: return the list of (lat,lon) points along the street, in house
+	#  number order, if row i is a street-and-city entry; otherwise None
+	def streetLine(self,i):
+		k=bisect.bisect_left(self.streets,i)
+		if k==len(self.streets) or self.streets[k]!=i:
+			return None
+		(start,end)=(self.lineOffsets[k],self.lineOffsets[k+1])
+		return list(zip(self.lineLats[start:end],self.lineLons[start:end]))
+
+	# findAll: generate the row indices of the rows whose normalized key is
+	#  norm (there can be more than one); found by binary search in
+	#  normOrder, comparing utf-8 bytes (which sort the same as the strings),
+	#  so there is nothing to build when the store is loaded
+	def findAll(self,norm):
+		target=norm.encode('utf-8')
+		order=self.normOrder
+		lo=0
+		hi=len(order)
+		while lo<hi:
+			mid=(lo+hi)//2
+			if self.normKeyBytes(order[mid])<target:
+				lo=mid+1
+			else:
+				hi=mid
+		while lo<len(order) and self.normKeyBytes(order[lo])==target:
+			yield order[lo]
+			lo+=1
+
+	# prefixRange: return (lo,hi) such that rows lo through hi-1 are exactly the
+	#  rows whose key starts with prefix, ignoring case; found by binary search,
+	#  so only a few dozen keys are decoded no matter how large the store is
+	def prefixRange(self,prefix):
+		prefix=prefix.lower()
+		n=len(prefix)
+		lo=0
+		hi=len(self)
+		while lo<hi:
+			mid=(lo+hi)//2
+			if self.key(mid).lower()<prefix:
+				lo=mid+1
+			else:
+				hi=mid
+		start=lo
+		hi=len(self)
+		while lo<hi:
+			mid=(lo+hi)//2
+			if self.key(mid).lower()[:n]<=prefix:
+				lo=mid+1
+			else:
+				hi=mid
+		return start,lo
+
+	# fromRows: build a store from an iterable of (key,lat,lon,line) tuples,
+	#  where line is None for an address, or the list of (lat,lon) points along
+	#  the street for a street-and-city entry; the tuples must already be sorted
+	#  by lowercase key
+	@classmethod
+	def fromRows(cls,rows,addressCount):
+		blob=bytearray()
+		offsets=array('q',[0])
+		normBlob=bytearray()
+		normOffsets=array('q',[0])
+		lats=array('d')
+		lons=array('d')
+		streets=array('q')
+		lineOffsets=array('q',[0])
+		lineLats=array('d')
+		lineLons=array('d')
+		normKeys=[]
+		for (key,lat,lon,line) in rows:
+			if line is not None:
+				streets.append(len(lats))
+				for (pLat,pLon) in line:
+					lineLats.append(pLat)
+					lineLons.append(pLon)
+				lineOffsets.append(len(lineLats))
+			blob+=key.encode('utf-8')
+			offsets.append(len(blob))
+			norm=normalizeAddress(key).encode('utf-8')
+			normKeys.append(norm)
+			normBlob+=norm
+			normOffsets.append(len(normBlob))
+			lats.append(lat)
+			lons.append(lon)
+		# the sort is stable, so the first of any rows with the same normalized
+		#  key comes first
+		normOrder=array('q',sorted(range(len(normKeys)),key=normKeys.__getitem__))
+		return cls(bytes(blob),offsets,lats,lons,streets,addressCount,bytes(normBlob),normOffsets,
+				lineOffsets,lineLats,lineLons,normOrder)
+
+	# load: map the cache file and return a store that reads directly from
+	#  the mapping, or None if the file is not a valid cache for the
+	#  specified csv size and mtime
+	@classmethod
+	def load(cls,cacheName,csvSize,csvMtime):
+		with open(cacheName,'rb') as f:
+			mm=mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+		if len(mm)<cacheHeader.size:
+			mm.close()
+			return None
+		(magic,version,little,size,mtime,n,addressCount,nStreets,nLinePoints,blobLen,normBlobLen)=cacheHeader.unpack_from(mm,0)
+		counts=(n+1,n+1,n,n,nStreets,nStreets+1,nLinePoints,nLinePoints,n)
+		if magic!=cacheMagic or version!=cacheVersion or little!=(sys.byteorder=="little") \
+				or size!=csvSize or mtime!=csvMtime \
+				or len(mm)!=cacheHeader.size+8*sum(counts)+blobLen+normBlobLen:
+			mm.close()
+			return None
+		mv=memoryview(mm)
+		pos=cacheHeader.size
+		sections=[]
+		for count in counts:
+			sections.append(mv[pos:pos+8*count])
+			pos+=8*count
+		store=cls(mv[pos:pos+blobLen],
+				sections[0].cast('q'),sections[2].cast('d'),sections[3].cast('d'),sections[4].cast('q'),
+				addressCount,
+				mv[pos+blobLen:pos+blobLen+normBlobLen],sections[1].cast('q'),
+				sections[5].cast('q'),sections[6].cast('d'),sections[7].cast('d'),sections[8].cast('q'))
+		store.stamp=(csvSize,csvMtime)
+		store.mm=mm
+		return store
+
+# houseNumber: the numeric part of the first word of an address, for sorting
+#  the addresses along a street; None if the address doesn't start with a number
+houseNumberPattern=re.compile(r"\d+")
+def houseNumber(word):
+	m=houseNumberPattern.match(word)
+	return int(m.group(0)) if m else None
+
+# streetPoints: the addresses of one street, as (number,lat,lon) tuples, sorted
+#  by house number; addresses without a number go at the end
+def streetPoints(points):
+	return sorted(points,key=lambda p: (p[0] is None,p[0] or 0))
+
+# streetAndCity: the street-and-city part of an address, i.e. all but the
+#  first word
+def streetAndCity(addr):
+	return ' '.join(addr.split()[1:])
+
+# location csv files: the first row is taken as a header if it names the
+#  columns (see columnNames, matched ignoring case, spaces, and underscores);
+#  the address, lat, and lon columns are required, and the city and zip code
+#  columns, if there are any, are added to the address (as 'address, city',
+#  or 'address, zip' if there is no city).  A row with no address but with a
+#  parcel number (APN) is keyed by the parcel number, e.g. 'APN 012-345-678'.
+#  Without a header, the columns are address, lat, lon.  Rows with missing,
+#  non-numeric, out of range, or zero coordinates are skipped.
+columnNames={
+	"address":("address","addr","fulladdress","siteaddress","situsaddress","situs","streetaddress","location"),
+	"city":("city","community","town","municipality","situscity"),
+	"zip":("zip","zipcode","postalcode","postcode","situszip"),
+	"lat":("lat","latitude","y","pointy"),
+	"lon":("lon","long","lng","longitude","x","pointx"),
+	"apn":("apn","parcel","parcelid","parcelnumber","apnnumber"),
+}
+defaultColumns={"address":0,"lat":1,"lon":2}
+parcelPrefix="APN "
+
+def columnName(text):
+	return text.strip().lower().replace("_","").replace(" ","").replace("-","")
+
+# headerColumns: the column indices (name -> index) named by the row, or None
+#  if the row is not a header that names at least the lat and lon columns and
+#  either the address or the parcel number column
+def headerColumns(row):
+	columns={}
+	for (k,text) in enumerate(row):
+		name=columnName(text)
+		for (column,aliases) in columnNames.items():
+			if name in aliases and column not in columns:
+				columns[column]=k
+	if "lat" in columns and "lon" in columns and ("address" in columns or "apn" in columns):
+		return columns
+	return None
+
+# parseCoordinate: the value as a float, or None if it isn't a finite number
+#  in the range -limit to limit
+def parseCoordinate(text,limit):
+	try:
+		value=float(text)
+	except ValueError:
+		return None
+	if not -limit<=value<=limit: # also false for nan
+		return None
+	return value
+
+# readLocationRecords: parse the csv file, and yield its locations one at a
+#  time, as (key,lat,lon) tuples; if specified, progress is called with the
+#  number of locations read so far, every progressInterval rows
+progressInterval=10000
+def readLocationRecords(fileName,progress=None):
+	count=0
+	skipped=0
+	with open(fileName,'r',newline='') as csvFile:
+		csvReader=csv.reader(csvFile)
+		columns=None
+		for row in csvReader:
+			if not any(cell.strip() for cell in row):
+				continue
+			if columns is None:
+				columns=headerColumns(row)
+				header=columns is not None
+				if header:
+					log.info("Columns of %s: %s",fileName,", ".join(c+"="+row[k] for (c,k) in columns.items()))
+				else:
+					columns=defaultColumns
+				(addrCol,cityCol,zipCol,latCol,lonCol,apnCol)=[columns.get(c) for c in ("address","city","zip","lat","lon","apn")]
+				width=max(columns.values())+1
+				if header or len(row)<3 or parseCoordinate(row[1],90) is None: # unrecognized header
+					continue
+			if len(row)<width:
+				row+=[""]*(width-len(row))
+			lat=parseCoordinate(row[latCol],90)
+			lon=parseCoordinate(row[lonCol],180)
+			key=row[addrCol].strip() if addrCol is not None else ""
+			if key:
+				place=(row[cityCol].strip() if cityCol is not None else "") or (row[zipCol].strip() if zipCol is not None else "")
+				# add the city (or zip) unless the address already ends with it,
+				#  e.g. "12345 Penn Valley Drive" in Penn Valley still gets it
+				if place and not ("," in key and normalizeAddress(key.rpartition(",")[2])==normalizeAddress(place)):
+					key+=", "+place
+			elif apnCol is not None and row[apnCol].strip():
+				key=parcelPrefix+row[apnCol].strip()
+			if lat is None or lon is None or (lat==0 and lon==0) or not key:
+				skipped+=1
+				log.debug("Skipping line %d of %s: %s",csvReader.line_num,fileName,row)
+				continue
+			yield (key,lat,lon)
+			count+=1
+			if progress and count%progressInterval==0:
+				progress(count)
+	if skipped:
+		log.warning("Skipped %d rows of %s with no address or invalid coordinates",skipped,fileName)
+
+# streetKey: the street-and-city that a location (whose key split into
+#  words is addrParse) is grouped into (see streetEntries), or None for a
+#  parcel number
+def streetKey(addr,addrParse):
+	if len(addrParse)==0 or addr.startswith(parcelPrefix):
+		return None
+	return ' '.join(addrParse[1:])
+
+# streetEntries: one street-and-city entry, as a (key,lat,lon,line) tuple,
+#  for each street of the addresses; its coordinates are those of the median
+#  address by house number, which (unlike the centroid of a curving street) is
+#  always a point on the street, and its line is all of its addresses in house
+#  number order; sorting each street separately keeps this close to linear in
+#  the number of addresses
+def streetEntries(rows):
+	streetDict={} # street-and-city -> list of (number,lat,lon) of its addresses
+	for (addr,lat,lon) in rows:
+		addrParse=addr.split()
+		key=streetKey(addr,addrParse)
+		if key is not None:
+			point=(houseNumber(addrParse[0]),lat,lon)
+			l=streetDict.get(key)
+			if l is None:
+				streetDict[key]=[point]
+			else:
+				l.append(point)
+	entries=[]
+	for key,points in streetDict.items():
+		entries.append(streetEntry(key,streetPoints(points)))
+	return entries
+
+def streetEntry(key,points):
+	median=points[(len(points)-1)//2]
+	return (key,median[1],median[2],[(p[1],p[2]) for p in points])
+
+# ExternalSort: sort a stream of tuples without holding all of them in memory:
+#  they are collected in chunks of chunkSize, and each chunk is sorted and
+#  written to a temporary file; iterating then merges the sorted chunks as they
+#  are read back.  A stream that fits in one chunk is just sorted in memory.
+class ExternalSort():
+	chunkSize=50000
+	batchSize=1000 # tuples per pickle in the temporary files
+
+	def __init__(self):
+		self.chunk=[]
+		self.runs=[]
+
+	def extend(self,items):
+		self.chunk+=items
+		if len(self.chunk)>=self.chunkSize:
+			self.chunk.sort()
+			f=tempfile.TemporaryFile()
+			for k in range(0,len(self.chunk),self.batchSize):
+				pickle.dump(self.chunk[k:k+self.batchSize],f,pickle.HIGHEST_PROTOCOL)
+			f.seek(0)
+			self.runs.append(f)
+			self.chunk=[]
+
+	@staticmethod
+	def readRun(f):
+		with f:
+			while True:
+				try:
+					batch=pickle.load(f)
+				except EOFError:
+					return
+				yield from batch
+
+	def __iter__(self):
+		self.chunk.sort()
+		if not self.runs:
+			return iter(self.chunk)
+		return heapq.merge(*[self.readRun(f) for f in self.runs],self.chunk)
+
+# CacheSection: one array section of a cache file (see AddressStore.load),
+#  written to a temporary file; items are appended to buffer, which is
+#  written out by flush
+class CacheSection():
+	def __init__(self,typecode,first=()):
+		self.file=tempfile.TemporaryFile()
+		self.buffer=array(typecode,first)
+		self.written=0
+
+	def __len__(self):
+		return self.written+len(self.buffer)
+
+	def flush(self):
+		self.file.write(self.buffer.tobytes())
+		self.written+=len(self.buffer)
+		del self.buffer[:]
+
+	def copyTo(self,f):
+		self.flush()
+		self.file.seek(0)
+		shutil.copyfileobj(self.file,f)
+		self.file.close()
+
+# writeLocationCache: write the cache file for the locations of the csv file
+#  (in the layout that AddressStore.load expects) without building the store in
+#  memory: the locations and their street points are sorted by ExternalSort,
+#  the streets are made one at a time from the sorted points, and the merged
+#  rows are written to the cache sections as they come, so memory use doesn't
+#  grow with the size of the file (except for the longest street, which is
+#  held while its entry is made); the sections are then copied into the
+#  cache file.  Ties are broken by order in the file, as a stable sort would.
+batchRows=8192 # rows handled between writes to the temporary files
+def writeLocationCache(fileName,f,progress=None):
+	stamp=fileStamp(fileName) # before reading, in case it changes meanwhile
+	locations=ExternalSort()
+	points=ExternalSort()
+	(locationBatch,pointBatch)=([],[])
+	addressCount=0
+	for (key,lat,lon) in readLocationRecords(fileName,progress):
+		locationBatch.append((key.lower(),0,addressCount,key,lat,lon,None))
+		addrParse=key.split()
+		street=streetKey(key,addrParse)
+		if street is not None:
+			number=houseNumber(addrParse[0])
+			pointBatch.append((street.lower(),street,number is None,number or 0,addressCount,lat,lon))
+		addressCount+=1
+		if len(locationBatch)>=batchRows:
+			locations.extend(locationBatch)
+			points.extend(pointBatch)
+			(locationBatch,pointBatch)=([],[])
+	locations.extend(locationBatch)
+	points.extend(pointBatch)
+	# the merged rows are (lowercase key,0,order in file,key,lat,lon,None) for
+	#  addresses and (lowercase key,1,0,key,lat,lon,line) for streets, so that
+	#  they sort in the same order as the rows of AddressStore.fromRows
+	def streets():
+		street=None
+		streetPoints=[]
+		for (lower,key,noNumber,number,seq,lat,lon) in points:
+			if key!=street:
+				if streetPoints:
+					yield (street.lower(),1,0)+streetEntry(street,streetPoints)
+				street=key
+				streetPoints=[]
+			streetPoints.append((number,lat,lon))
+		if streetPoints:
+			yield (street.lower(),1,0)+streetEntry(street,streetPoints)
+	sections=[CacheSection('q',[0]),CacheSection('q',[0]),CacheSection('d'),CacheSection('d'),CacheSection('q'),
+			CacheSection('q',[0]),CacheSection('d'),CacheSection('d'),CacheSection('q'),CacheSection('B'),CacheSection('B')]
+	(offsets,normOffsets,lats,lons,streetRows,lineOffsets,lineLats,lineLons,normOrder,blob,normBlob)=sections
+	normKeys=ExternalSort()
+	normBatch=[]
+	(n,blobLen,normBlobLen,lineLen)=(0,0,0,0)
+	# performance speedup: sort alphabetically (ignoring case) on the column
+	#  that will be used for lookup, so that prefix matches can be found by
+	#  binary search; see AddressStore.prefixRange
+	for (lower,isStreet,seq,key,lat,lon,line) in heapq.merge(locations,streets()):
+		if line is not None:
+			streetRows.buffer.append(n)
+			for (pLat,pLon) in line:
+				lineLats.buffer.append(pLat)
+				lineLons.buffer.append(pLon)
+			lineLen+=len(line)
+			lineOffsets.buffer.append(lineLen)
+		b=key.encode('utf-8')
+		blob.buffer.frombytes(b)
+		blobLen+=len(b)
+		offsets.buffer.append(blobLen)
+		norm=normalizeAddress(key).encode('utf-8')
+		normBlob.buffer.frombytes(norm)
+		normBlobLen+=len(norm)
+		normOffsets.buffer.append(normBlobLen)
+		normBatch.append((norm,n))
+		lats.buffer.append(lat)
+		lons.buffer.append(lon)
+		n+=1
+		if len(normBatch)>=batchRows:
+			for section in sections:
+				section.flush()
+			normKeys.extend(normBatch)
+			normBatch=[]
+	normKeys.extend(normBatch)
+	for (norm,r) in normKeys:
+		normOrder.buffer.append(r)
+	f.write(cacheHeader.pack(cacheMagic,cacheVersion,sys.byteorder=="little",
+			stamp[0],stamp[1],n,addressCount,len(streetRows),lineLen,blobLen,normBlobLen))
+	for section in sections:
+		section.copyTo(f)
+	return stamp
+
+# writeCache: write a cache file by calling write(f), with f open for reading
+#  and writing, and return load(name,r), where r is what write returned and
+#  name is the file it wrote: cacheName, which is only replaced once the new
+#  file is complete, or, if that can't be written (read-only folder, or the
+#  old cache still mapped on Windows), a temporary file, which is removed
+#  again once it has been loaded
+def writeCache(cacheName,write,load):
+	name=cacheName
+	tmpName=cacheName+".tmp"
+	try:
+		with open(tmpName,'w+b') as f:
+			r=write(f)
+		os.replace(tmpName,cacheName)
+	except OSError as e:
+		log.warning("Could not write cache file %s: %s",cacheName,e)
+		(fd,name)=tempfile.mkstemp(suffix=".cache")
+		with os.fdopen(fd,'w+b') as f:
+			r=write(f)
+	result=load(name,r)
+	if name!=cacheName:
+		try:
+			os.remove(name) # the mapping stays valid, except on Windows
+		except OSError:
+			pass
+	return result
+
+# readLocationCsv: parse the csv file and return an AddressStore holding the
+#  locations and one street-and-city entry per street, mapped from the cache
+#  file that it is written to (see writeLocationCache and writeCache)
+def readLocationCsv(fileName,progress=None):
+	return writeCache(cacheFileName(fileName),lambda f: writeLocationCache(fileName,f,progress),
+			lambda name,stamp: AddressStore.load(name,*stamp))
+
+def readCache(fileName):
+	try:
+		return AddressStore.load(cacheFileName(fileName),*fileStamp(fileName))
+	except (OSError,ValueError,struct.error):
+		return None
+
+# loadLocationTable: return the AddressStore for the csv file, mapped from the
+#  cache if it is current, otherwise read from the csv file (and then write the
+#  cache); the second return value is True if the cache was used
+def loadLocationTable(fileName,progress=None):
+	store=readCache(fileName)
+	if store is not None:
+		return store,True
+	return readLocationCsv(fileName,progress),False
+
+indexVersion=5
+# magic, version, byte order, csv size, csv mtime (ns), row count, feature count,
+#  feature blob length, postings count
+indexHeader=struct.Struct("<8sII6q")
+
+def pad8(n):
+	return (8-n%8)%8
+
+# trigrams: the set of 3-character substrings of the normalized text, padded
+#  with a space at each end so that the first and last letters count too
+def trigrams(text):
+	t=" "+normalizeAddress(text)+" "
+	return {t[i:i+3] for i in range(len(t)-2)}
+
+# tokens: the set of words in the normalized text
+def tokens(text):
+	return set(normalizeAddress(text).split())
+
+# intersectSorted: the sorted list of items that are in both sorted sequences;
+#  each item of the shorter sequence is binary-searched in the longer one, so
+#  the cost depends mostly on the length of the shorter sequence
+def intersectSorted(a,b):
+	if len(a)>len(b):
+		(a,b)=(b,a)
+	rval=[]
+	k=0
+	n=len(b)
+	for x in a:
+		k=bisect.bisect_left(b,x,k,n)
+		if k==n:
+			break
+		if b[k]==x:
+			rval.append(x)
+	return rval
+
+# PostingsIndex: inverted index over an AddressStore: for each feature (word,
+#  trigram, etc. as returned by the features function that each subclass
+#  defines), the sorted list of rows whose normalized key has that feature,
+#  as a slice of one shared postings array; plus the number of distinct
+#  features of each row, for ranking.  The features are kept sorted, utf-8
+#  encoded back to back in one blob, like the keys of the store, and the k-th
+#  feature's rows are postings[starts[k]:starts[k+1]].  Each kind of index is
+#  cached in its own memory-mappable file next to the csv file, since it takes
+#  much longer to build than the store itself; like the store, it is read
+#  in place, so there is nothing to build when it is loaded
+class PostingsIndex():
+	magic=None
+	cacheSuffix=None
+
+	def __init__(self,featureBlob=b"",featureOffsets=None,starts=None,counts=None,postings=None):
+		self.featureBlob=featureBlob
+		self.featureOffsets=featureOffsets if featureOffsets is not None else array('q',[0])
+		self.starts=starts if starts is not None else array('q',[0])
+		self.counts=counts if counts is not None else array('H')
+		self.postings=postings if postings is not None else array('I')
+		self.store=None # set by loadIndex
+		self.mm=None
+
+	def featureCount(self):
+		return len(self.featureOffsets)-1
+
+	def rowCount(self):
+		return len(self.counts)
+
+	def feature(self,k):
+		return str(self.featureBlob[self.featureOffsets[k]:self.featureOffsets[k+1]],'utf-8')
+
+	# featureIndex: the position of the first feature that is not less than x,
+	#  found by binary search comparing utf-8 bytes (see AddressStore.findAll)
+	def featureIndex(self,x):
+		target=x.encode('utf-8')
+		lo=0
+		hi=self.featureCount()
+		while lo<hi:
+			mid=(lo+hi)//2
+			if bytes(self.featureBlob[self.featureOffsets[mid]:self.featureOffsets[mid+1]])<target:
+				lo=mid+1
+			else:
+				hi=mid
+		return lo
+
+	# span: the (start,end) of the rows that have the feature in postings, or
+	#  None if no row has it
+	def span(self,feature):
+		k=self.featureIndex(feature)
+		if k<self.featureCount() and self.feature(k)==feature:
+			return (self.starts[k],self.starts[k+1])
+		return None
+
+	def rows(self,feature):
+		(start,end)=self.span(feature) or (0,0)
+		return self.postings[start:end]
+
+	# layout: the sorted features of the rows of the store, as (featureBlob,
+	#  featureOffsets,starts,counts); only the number of rows of each feature
+	#  is kept, not the rows themselves (see fill)
+	@classmethod
+	def layout(cls,store):
+		sizes={}
+		counts=array('H')
+		for i in range(len(store)):
+			g=cls.features(store.normKey(i))
+			counts.append(min(len(g),65535))
+			for x in g:
+				sizes[x]=sizes.get(x,0)+1
+		featureBlob=bytearray()
+		featureOffsets=array('q',[0])
+		starts=array('q',[0])
+		for x in sorted(sizes):
+			featureBlob+=x.encode('utf-8')
+			featureOffsets.append(len(featureBlob))
+			starts.append(starts[-1]+sizes[x])
+		return (bytes(featureBlob),featureOffsets,starts,counts)
+
+	# fill: put the rows of each feature into postings (any writable sequence of
+	#  starts[-1] unsigned ints), at the places given by the layout; the rows
+	#  are visited in order, so the rows of each feature come out sorted
+	@classmethod
+	def fill(cls,store,featureBlob,featureOffsets,starts,postings):
+		position={} # feature -> where its next row goes
+		for k in range(len(starts)-1):
+			position[str(featureBlob[featureOffsets[k]:featureOffsets[k+1]],'utf-8')]=starts[k]
+		for i in range(len(store)):
+			for x in cls.features(store.normKey(i)):
+				k=position[x]
+				postings[k]=i
+				position[x]=k+1
+
+	# build: make the index in memory (see write)
+	@classmethod
+	def build(cls,store):
+		(featureBlob,featureOffsets,starts,counts)=cls.layout(store)
+		postings=array('I',bytes(4*starts[-1]))
+		cls.fill(store,featureBlob,featureOffsets,starts,postings)
+		return cls(featureBlob,featureOffsets,starts,counts,postings)
+
+	# write: write the index cache file of the store (in the layout that load
+	#  expects; f must be open for reading and writing) without building the
+	#  index in memory: the postings are filled in directly in the mapped file,
+	#  so only the features and the per-row counts are held, and memory use
+	#  doesn't grow with the number of postings
+	@classmethod
+	def write(cls,store,f,csvSize,csvMtime):
+		(featureBlob,featureOffsets,starts,counts)=cls.layout(store)
+		blobLen=len(featureBlob)
+		nPostings=starts[-1]
+		f.write(indexHeader.pack(cls.magic,indexVersion,sys.byteorder=="little",
+				csvSize,csvMtime,len(counts),len(featureOffsets)-1,blobLen,nPostings))
+		f.write(featureOffsets.tobytes())
+		f.write(starts.tobytes())
+		f.write(featureBlob+bytes(pad8(blobLen)))
+		c=counts.tobytes()
+		f.write(c+bytes(pad8(len(c))))
+		if nPostings==0:
+			return
+		pos=f.tell()
+		f.truncate(pos+4*nPostings)
+		f.flush()
+		mm=mmap.mmap(f.fileno(),0)
+		try:
+			with memoryview(mm) as mv, mv[pos:pos+4*nPostings].cast('I') as postings:
+				cls.fill(store,featureBlob,featureOffsets,starts,postings)
+		finally:
+			mm.close()
+
+	# load: map the cache file and return an index that reads directly from
+	#  the mapping, or None if the file is not a valid index cache for the
+	#  specified csv size and mtime
+	@classmethod
+	def load(cls,cacheName,csvSize,csvMtime):
+		with open(cacheName,'rb') as f:
+			mm=mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+		if len(mm)<indexHeader.size:
+			mm.close()
+			return None
+		(magic,version,little,size,mtime,n,nFeatures,blobLen,nPostings)=indexHeader.unpack_from(mm,0)
+		offsetsPos=indexHeader.size
+		startsPos=offsetsPos+8*(nFeatures+1)
+		blobPos=startsPos+8*(nFeatures+1)
+		countsPos=blobPos+blobLen+pad8(blobLen)
+		postingsPos=countsPos+2*n+pad8(2*n)
+		if magic!=cls.magic or version!=indexVersion or little!=(sys.byteorder=="little") \
+				or size!=csvSize or mtime!=csvMtime or min(n,nFeatures,blobLen,nPostings)<0 \
+				or len(mm)!=postingsPos+4*nPostings:
+			mm.close()
+			return None
+		mv=memoryview(mm)
+		index=cls(mv[blobPos:blobPos+blobLen],
+				mv[offsetsPos:startsPos].cast('q'),
+				mv[startsPos:blobPos].cast('q'),
+				mv[countsPos:countsPos+2*n].cast('H'),
+				mv[postingsPos:postingsPos+4*nPostings].cast('I'))
+		if index.featureOffsets[-1]!=blobLen or index.starts[-1]!=nPostings:
+			mm.close()
+			return None
+		index.mm=mm
+		return index
+
+# TrigramIndex: typo-tolerant search; rows are ranked by how many of the
+#  query's trigrams they contain
+class TrigramIndex(PostingsIndex):
+	magic=b"SATRIGRM"
+	cacheSuffix=".trigram.cache"
+	features=staticmethod(trigrams)
+
+	# search: return up to limit row indices, best match first, that contain at
+	#  least the fraction threshold of the text's trigrams (so a partial or
+	#  misspelled address still matches the full key); ties go to the row with
+	#  the fewest other trigrams, i.e. the closest overall match.  The posting
+	#  lists are counted rarest first, up to maxCandidatePostings in all; the
+	#  rows found there that could still reach the threshold are the candidates,
+	#  which are then looked up in the remaining (common) lists, dropping each
+	#  one as soon as it can no longer qualify.  A row that contains none of the
+	#  rare trigrams is not found, and a text made only of common trigrams (such
+	#  as just a city name), which would leave more than maxCandidates rows to
+	#  rank, finds nothing; the word search covers those, and this way the search
+	#  stays fast enough to run as the address is typed
+	maxCandidatePostings=50000
+	maxCandidates=2000
+	def search(self,text,limit=20,threshold=0.6,exclude=()):
+		return [r for (contained,similarity,r) in self.scoredSearch(text,limit,threshold,exclude)]
+
+	# scoredSearch: like search, but return (contained,similarity,row) tuples,
+	#  so that the results of several indexes can be ranked together (see
+	#  LocationCatalog.fuzzySearch); the rows in exclude are never candidates
+	def scoredSearch(self,text,limit=20,threshold=0.6,exclude=()):
+		g=trigrams(text)
+		spans=sorted((s for s in map(self.span,g) if s is not None),key=lambda s: s[1]-s[0])
+		m=len(g)
+		need=max(1,math.ceil(threshold*m))
+		p=self.postings
+		hits=collections.Counter()
+		total=0
+		j=0
+		while j<=len(spans)-need and total+spans[j][1]-spans[j][0]<=self.maxCandidatePostings:
+			(start,end)=spans[j]
+			hits.update(p[start:end])
+			total+=end-start
+			j+=1
+		if exclude:
+			hits=collections.Counter({r:h for r,h in hits.items() if r not in exclude})
+		if not hits:
+			return []
+		# each list left can add at most one to a row's count; if there are still
+		#  too many candidates, keep those that have the most of the rare trigrams
+		left=len(spans)-j
+		least=need-left
+		if len(hits)>self.maxCandidates:
+			n=0
+			for (h,c) in sorted(collections.Counter(hits.values()).items(),reverse=True):
+				n+=c
+				if n>self.maxCandidates:
+					least=max(least,h+1)
+					break
+		if least>1:
+			hits={r:h for r,h in hits.items() if h>=least}
+		for (start,end) in spans[j:]:
+			if end-start>32*len(hits):
+				for r in hits:
+					k=bisect.bisect_left(p,r,start,end)
+					if k<end and p[k]==r:
+						hits[r]+=1
+			else:
+				for r in set(hits).intersection(p[start:end]):
+					hits[r]+=1
+			left-=1
+			hits={r:h for r,h in hits.items() if h+left>=need}
+			if not hits:
+				return []
+		scored=[(h/m,h/(m+self.counts[r]-h),r) for r,h in hits.items() if h>=need]
+		return heapq.nlargest(limit,scored)
+
+# TokenIndex: word search; every word of the query must appear in the row's
+#  key, in any order
+class TokenIndex(PostingsIndex):
+	magic=b"SATOKENS"
+	cacheSuffix=".token.cache"
+	features=staticmethod(tokens)
+
+	# search: return up to limit row indices of the rows that contain every
+	#  word of the text, fewest extra words first; unless the text ends with a
+	#  space or punctuation, the last word is treated as a prefix (it is
+	#  probably still being typed).  The posting lists of the complete words are intersected
+	#  shortest first; the rows that survive are then checked for the prefix
+	#  word, or, if there are no complete words, the posting lists of all words
+	#  starting with the prefix are merged, as long as there are no more than
+	#  maxPrefixTokens of them.  When there are more, the words of each
+	#  surviving row are checked for the prefix, but only of the first
+	#  maxPrefixRows rows (in key order), since decoding the key of every row
+	#  of a common word would take far too long.  The rows in exclude are
+	#  skipped
+	maxPrefixTokens=200
+	maxPrefixRows=2000
+	def search(self,text,limit=200,exclude=()):
+		words=normalizeAddress(text).split()
+		prefix=None
+		if words and text[-1:].isalnum():
+			prefix=words.pop()
+		words=set(words)
+		rows=None
+		for w in sorted(words,key=lambda w: len(self.rows(w))):
+			rows=self.rows(w) if rows is None else intersectSorted(rows,self.rows(w))
+			if len(rows)==0:
+				return []
+		if prefix:
+			k=self.featureIndex(prefix)
+			matches=[]
+			while k<self.featureCount() and len(matches)<=self.maxPrefixTokens:
+				t=self.feature(k)
+				if not t.startswith(prefix):
+					break
+				matches.append(t)
+				k+=1
+			if rows is None:
+				if not matches or len(matches)>self.maxPrefixTokens:
+					return []
+				rows=sorted(set().union(*(self.rows(t) for t in matches)))
+			elif len(matches)<=self.maxPrefixTokens and len(rows)>1000:
+				matching=set().union(*(self.rows(t) for t in matches))
+				rows=[r for r in rows if r in matching]
+			else:
+				rows=[r for r in itertools.islice((r for r in rows if r not in exclude),self.maxPrefixRows)
+						if any(t.startswith(prefix) for t in self.store.normKey(r).split())]
+		if rows is None:
+			return []
+		return heapq.nsmallest(limit,(r for r in rows if r not in exclude),key=lambda r: self.counts[r])
+
+# loadIndex: like loadLocationTable, but for an index (a PostingsIndex
+#  subclass, or SpatialIndex) of the store that was loaded from the same csv
+#  file; the index cache is matched to the version of the csv file that the
+#  store was read from, which is not necessarily the current one (see
+#  patchLocationDatabase).  Like the store, a new index is written straight
+#  into its cache file and then mapped from it (see writeCache).
+def loadIndex(indexClass,fileName,store):
+	cacheName=fileName+indexClass.cacheSuffix
+	(size,mtime)=store.stamp
+	index=None
+	try:
+		index=indexClass.load(cacheName,size,mtime)
+		if index is not None and index.rowCount()!=len(store):
+			index=None
+	except (OSError,ValueError,struct.error):
+		pass
+	if index is None:
+		index=writeCache(cacheName,lambda f: indexClass.write(store,f,size,mtime),
+				lambda name,r: indexClass.load(name,size,mtime))
+	index.store=store
+	return index
+
+metersPerDegree=111195.0 # one degree of latitude (great circle arc) on the mean-radius earth
+
+# parseLatLon: return (lat,lon) if the text is a pair of decimal-degree
+#  coordinates, separated by a space and/or a comma, otherwise None
+def parseLatLon(text):
+	parts=text.replace(","," ").split()
+	if len(parts)!=2 or "." not in parts[0] or "." not in parts[1]:
+		return None
+	try:
+		lat=float(parts[0])
+		lon=float(parts[1])
+	except ValueError:
+		return None
+	if -90<=lat<=90 and -180<=lon<=180:
+		return (lat,lon)
+	return None
+
+# magic, version, byte order, csv size, csv mtime (ns), row count, cell count,
+#  rows in cells, and the bounds (iMin,iMax,jMin,jMax) of the cells
+spatialHeader=struct.Struct("<8sII9q")
+
+# cellKey: a single sortable number for the grid cell (i,j), which are cell
+#  numbers of latitude and longitude; cellOffset makes both positive
+cellOffset=1<<20
+def cellKey(i,j):
+	return ((i+cellOffset)<<21)|(j+cellOffset)
+
+# SpatialIndex: grid of square cells (cellSize degrees on a side) over the
+#  address rows of an AddressStore (street-and-city rows are left out, since
+#  their coordinates only stand in for the whole street), for reverse
+#  geocoding: finding the nearest addresses to a point.  Like a PostingsIndex,
+#  it is cached next to the csv file and read in place: cellKeys is the sorted
+#  list of the cellKey of each cell that has any rows, and the k-th cell's
+#  rows are rows[starts[k]:starts[k+1]]
+class SpatialIndex():
+	magic=b"SASPATIA"
+	cacheSuffix=".spatial.cache"
+	cellSize=0.01 # about 1.1 km north-south
+
+	def __init__(self,cellKeys=None,starts=None,rows=None,bounds=None,storeRows=0):
+		self.cellKeys=cellKeys if cellKeys is not None else array('q')
+		self.starts=starts if starts is not None else array('q',[0])
+		self.rows=rows if rows is not None else array('I')
+		self.bounds=bounds # (iMin,iMax,jMin,jMax), or None if there are no rows
+		self.storeRows=storeRows # number of rows in the store, to check the cache
+		self.store=None # set by build or loadIndex
+		self.mm=None
+
+	def rowCount(self):
+		return self.storeRows
+
+	def cellRows(self,i,j):
+		key=cellKey(i,j)
+		k=bisect.bisect_left(self.cellKeys,key)
+		if k<len(self.cellKeys) and self.cellKeys[k]==key:
+			return self.rows[self.starts[k]:self.starts[k+1]]
+		return ()
+
+	@classmethod
+	def build(cls,store):
+		streets=set(store.streets)
+		cells={}
+		lats=store.lats
+		lons=store.lons
+		cs=cls.cellSize
+		for r in range(len(store)):
+			if r in streets:
+				continue
+			cell=(math.floor(lats[r]/cs),math.floor(lons[r]/cs))
+			l=cells.get(cell)
+			if l is None:
+				cells[cell]=[r]
+			else:
+				l.append(r)
+		bounds=None
+		if cells:
+			bounds=(min(c[0] for c in cells),max(c[0] for c in cells),
+					min(c[1] for c in cells),max(c[1] for c in cells))
+		cellKeys=array('q')
+		starts=array('q',[0])
+		rows=array('I')
+		for cell in sorted(cells):
+			cellKeys.append(cellKey(*cell))
+			rows.extend(cells[cell])
+			starts.append(len(rows))
+		index=cls(cellKeys,starts,rows,bounds,len(store))
+		index.store=store
+		return index
+
+	# write: write the index cache file of the store; the grid holds only one
+	#  entry per address, so it is just built in memory first
+	@classmethod
+	def write(cls,store,f,csvSize,csvMtime):
+		index=cls.build(store)
+		f.write(spatialHeader.pack(cls.magic,indexVersion,sys.byteorder=="little",
+				csvSize,csvMtime,index.storeRows,len(index.cellKeys),len(index.rows),*(index.bounds or (0,0,0,0))))
+		f.write(index.cellKeys.tobytes())
+		f.write(index.starts.tobytes())
+		f.write(index.rows.tobytes())
+
+	# load: like PostingsIndex.load
+	@classmethod
+	def load(cls,cacheName,csvSize,csvMtime):
+		with open(cacheName,'rb') as f:
+			mm=mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+		if len(mm)<spatialHeader.size:
+			mm.close()
+			return None
+		(magic,version,little,size,mtime,n,nCells,nRows,iMin,iMax,jMin,jMax)=spatialHeader.unpack_from(mm,0)
+		keysPos=spatialHeader.size
+		startsPos=keysPos+8*nCells
+		rowsPos=startsPos+8*(nCells+1)
+		if magic!=cls.magic or version!=indexVersion or little!=(sys.byteorder=="little") \
+				or size!=csvSize or mtime!=csvMtime or min(n,nCells,nRows)<0 \
+				or len(mm)!=rowsPos+4*nRows:
+			mm.close()
+			return None
+		mv=memoryview(mm)
+		index=cls(mv[keysPos:startsPos].cast('q'),mv[startsPos:rowsPos].cast('q'),
+				mv[rowsPos:rowsPos+4*nRows].cast('I'),(iMin,iMax,jMin,jMax) if nCells else None,n)
+		if index.starts[-1]!=nRows:
+			mm.close()
+			return None
+		index.mm=mm
+		return index
+
+	# nearest: return a list of up to n (row,distance in meters) tuples, nearest
+	#  first; the cells are searched in rings of increasing size around the
+	#  point, stopping as soon as no point outside the rings searched so far
+	#  could be nearer than the n-th nearest found; the rows in exclude are
+	#  skipped
+	def nearest(self,lat,lon,n=10,exclude=()):
+		if self.bounds is None or n<1:
+			return []
+		(iMin,iMax,jMin,jMax)=self.bounds
+		cs=self.cellSize
+		ci=math.floor(lat/cs)
+		cj=math.floor(lon/cs)
+		cosLat=max(math.cos(math.radians(lat)),0.01)
+		lats=self.store.lats
+		lons=self.store.lons
+		best=[] # heap of (-distance,row), holding the n nearest so far
+		# rings closer than this contain no cells with any rows
+		firstRing=max(0,iMin-ci,ci-iMax,jMin-cj,cj-jMax)
+		lastRing=max(abs(ci-iMin),abs(ci-iMax),abs(cj-jMin),abs(cj-jMax))
+		for ring in range(firstRing,lastRing+1):
+			if ring==0:
+				ringCells=[(ci,cj)]
+			else:
+				ringCells=[(ci+di,cj+dj) for di in (-ring,ring) for dj in range(-ring,ring+1)]
+				ringCells+=[(ci+di,cj+dj) for dj in (-ring,ring) for di in range(-ring+1,ring)]
+			for cell in ringCells:
+				for r in self.cellRows(*cell):
+					if r in exclude:
+						continue
+					dy=lats[r]-lat
+					dx=(lons[r]-lon)*cosLat
+					d=math.sqrt(dx*dx+dy*dy)*metersPerDegree
+					if len(best)<n:
+						heapq.heappush(best,(-d,r))
+					elif d<-best[0][0]:
+						heapq.heapreplace(best,(-d,r))
+			# anything outside this ring is at least this far away
+			if len(best)==n and ring*cs*cosLat*metersPerDegree>=-best[0][0]:
+				break
+		return [(r,-negD) for (negD,r) in sorted(best,reverse=True)]
+
+# LocationDatabase: an AddressStore together with its lookup indexes: exact
+#  (normalized) and prefix lookups are done by the store itself, and the
+#  word, fuzzy trigram, and spatial indexes are attached later when they
+#  become available (see loadIndexes); fileName is the csv file that the
+#  store was loaded from, if any.  The hidden rows (those that have since been
+#  removed from the csv file or changed; see patchLocationDatabase) are left
+#  out of all results.
+class LocationDatabase():
+	def __init__(self,store,fileName=None,hidden=()):
+		self.store=store
+		self.fileName=fileName
+		self.hidden=frozenset(hidden)
+		self.hiddenRows=sorted(self.hidden)
+		hiddenStreets=sum(1 for r in self.hiddenRows if store.streetLine(r) is not None)
+		self.addressCount=store.addressCount-(len(self.hiddenRows)-hiddenStreets)
+		self.streetCount=len(store.streets)-hiddenStreets
+		self.isPatch=False # see patchLocationDatabase
+		self.tokenIndex=None
+		self.fuzzyIndex=None
+		self.spatialIndex=None
+
+	# lookup: return the row index for an exact match (after normalization of
+	#  both the text and the keys) that isn't hidden, or None
+	def lookup(self,text):
+		return next((r for r in self.store.findAll(normalizeAddress(text)) if r not in self.hidden),None)
+
+	# prefixRanges: the list of (lo,hi) row ranges, in order, of the rows whose
+	#  key starts with prefix, ignoring case: the store's prefixRange, split
+	#  around any hidden rows
+	def prefixRanges(self,prefix):
+		(lo,hi)=self.store.prefixRange(prefix)
+		ranges=[]
+		k=bisect.bisect_left(self.hiddenRows,lo)
+		while k<len(self.hiddenRows) and self.hiddenRows[k]<hi:
+			if self.hiddenRows[k]>lo:
+				ranges.append((lo,self.hiddenRows[k]))
+			lo=self.hiddenRows[k]+1
+			k+=1
+		if lo<hi:
+			ranges.append((lo,hi))
+		return ranges
+
+	# tokenSearch: return a list of row indices of rows that contain all the
+	#  words of the text, in any order; empty if the word index isn't available yet
+	def tokenSearch(self,text,limit=200):
+		if self.tokenIndex is None:
+			return []
+		return self.tokenIndex.search(text,limit,exclude=self.hidden)
+
+	# fuzzySearch: return a list of row indices of approximate matches, best first;
+	#  empty if the fuzzy index isn't available yet
+	def fuzzySearch(self,text,limit=20):
+		return [r for (contained,similarity,r) in self.scoredFuzzySearch(text,limit)]
+
+	# scoredFuzzySearch: like fuzzySearch, but return (contained,similarity,row)
+	#  tuples (see TrigramIndex.scoredSearch)
+	def scoredFuzzySearch(self,text,limit=20):
+		if self.fuzzyIndex is None:
+			return []
+		return self.fuzzyIndex.scoredSearch(text,limit,exclude=self.hidden)
+
+	# nearest: return a list of up to n (row,distance in meters) tuples for the
+	#  addresses nearest to the point, nearest first; empty if the spatial
+	#  index isn't available yet
+	def nearest(self,lat,lon,n=10):
+		if self.spatialIndex is None:
+			return []
+		return self.spatialIndex.nearest(lat,lon,n,exclude=self.hidden)
+
+	# streetLine: return the list of (lat,lon) points along the street for a
+	#  street-and-city row, in house number order, or None for an address row
+	def streetLine(self,row):
+		return self.store.streetLine(row)
+
+# indexNames: the attribute names of the LocationDatabase indexes, in the
+#  order that loadIndexes makes them
+indexNames=("spatialIndex","tokenIndex","fuzzyIndex")
+indexClasses={"spatialIndex":SpatialIndex,"tokenIndex":TokenIndex,"fuzzyIndex":TrigramIndex}
+
+# loadIndexes: make each of the named indexes of the store that was loaded
+#  from the csv file (loading them from their caches when possible), and yield (name,index) as each one is ready; this is a
+#  generator, so that the caller can decide whether and in which thread to
+#  attach each index to the database
+def loadIndexes(fileName,store,names=indexNames):
+	for name in indexNames:
+		if name not in names:
+			continue
+		yield (name,loadIndex(indexClasses[name],fileName,store))
+
+# location catalogs: the location file can be either a location csv file, or
+#  a catalog (a .txt file) listing several of them, one per line, e.g. one per
+#  county plus a landmarks file; blank lines and lines starting with # are
+#  skipped, so a source is disabled by putting a # in front of it, and a
+#  relative path is relative to the folder of the catalog.  Each source has
+#  its own caches and indexes next to its own csv file, so adding or changing
+#  one source doesn't rebuild any of the others.
+catalogSuffix=".txt"
+
+def isCatalogFile(fileName):
+	return fileName.lower().endswith(catalogSuffix)
+
+# locationSources: the list of enabled location csv files for the location
+#  file (which is just the file itself, unless it is a catalog)
+def locationSources(fileName):
+	if not isCatalogFile(fileName):
+		return [fileName]
+	folder=os.path.dirname(os.path.abspath(fileName))
+	sources=[]
+	with open(fileName,'r') as catalogFile:
+		for line in catalogFile:
+			line=line.strip()
+			if line and not line.startswith("#"):
+				sources.append(os.path.join(folder,line))
+	return sources
+
+# LocationCatalog: the LocationDatabases of all of the enabled sources,
+#  searched together; rows are numbered consecutively through the sources, in
+#  catalog order (see locate), so that a row number identifies both the
+#  source and its row there.  Each search is made in every source that has the
+#  needed index, and the results are merged by the same ranking that each
+#  index uses for its own results; an exact match in an earlier source wins.
+class LocationCatalog():
+	def __init__(self,databases=()):
+		self.databases=list(databases)
+		self.bases=array('q',[0])
+		for db in self.databases:
+			self.bases.append(self.bases[-1]+len(db.store))
+		self.addressCount=sum(db.addressCount for db in self.databases)
+		self.streetCount=sum(db.streetCount for db in self.databases)
+
+	# sourceDatabases: the databases of the catalog that were loaded from the
+	#  location csv file
+	def sourceDatabases(self,fileName):
+		path=os.path.abspath(fileName)
+		return [db for db in self.databases if db.fileName and os.path.abspath(db.fileName)==path]
+
+	def __len__(self):
+		return self.bases[-1]
+
+	# locate: the source database and its own row index for row i
+	def locate(self,i):
+		k=bisect.bisect_right(self.bases,i)-1
+		return self.databases[k],i-self.bases[k]
+
+	def key(self,i):
+		(db,r)=self.locate(i)
+		return db.store.key(r)
+
+	def lat(self,i):
+		(db,r)=self.locate(i)
+		return db.store.lat(r)
+
+	def lon(self,i):
+		(db,r)=self.locate(i)
+		return db.store.lon(r)
+
+	def streetLine(self,i):
+		(db,r)=self.locate(i)
+		return db.store.streetLine(r)
+
+	# prefixRanges: the list of (lo,hi) row ranges, one for each source that has
+	#  any, of the rows whose key starts with prefix, ignoring case; each range
+	#  is sorted, but the sources aren't sorted with respect to each other
+	def prefixRanges(self,prefix):
+		ranges=[]
+		for (k,db) in enumerate(self.databases):
+			ranges+=[(self.bases[k]+lo,self.bases[k]+hi) for (lo,hi) in db.prefixRanges(prefix)]
+		return ranges
+
+	def lookup(self,text):
+		for (k,db) in enumerate(self.databases):
+			r=db.lookup(text)
+			if r is not None:
+				return self.bases[k]+r
+		return None
+
+	# tokenSearch: fewest extra words first, as for a single source
+	def tokenSearch(self,text,limit=200):
+		matches=[]
+		for (k,db) in enumerate(self.databases):
+			if db.tokenIndex is not None:
+				counts=db.tokenIndex.counts
+				matches+=[(counts[r],self.bases[k]+r) for r in db.tokenSearch(text,limit)]
+		return [r for (count,r) in heapq.nsmallest(limit,matches)]
+
+	def fuzzySearch(self,text,limit=20):
+		matches=[]
+		for (k,db) in enumerate(self.databases):
+			matches+=[(contained,similarity,self.bases[k]+r) for (contained,similarity,r)
+					in db.scoredFuzzySearch(text,limit)]
+		return [r for (contained,similarity,r) in heapq.nlargest(limit,matches,key=lambda m: m[:2])]
+
+	def nearest(self,lat,lon,n=10):
+		lists=[]
+		for (k,db) in enumerate(self.databases):
+			lists.append([(self.bases[k]+r,d) for (r,d) in db.nearest(lat,lon,n)])
+		return list(heapq.merge(*lists,key=lambda m: m[1]))[:n]
+
+# patchLocationDatabase: the databases for a new version of the csv file that
+#  base (a database, not itself a patch, of an earlier version of the file) was
+#  loaded from, made by applying only the changes, so that the work done
+#  (other than reading and comparing the rows) is in proportion to the size of
+#  the change: the rows of base that are no longer in the file (an address
+#  whose coordinates changed counts as removed and added), and the
+#  street-and-city entries of the streets that had any address added or
+#  removed, are hidden in a copy of base that shares its store and indexes;
+#  the added addresses and new entries for those streets go into a small patch
+#  database, whose indexes are built right away.  Returns [patch,base copy],
+#  or None if more than maxPatchFraction of the addresses changed, since then
+#  the whole file might as well be loaded again.  The patch is not cached;
+#  the next time the file is loaded from scratch, its caches are rebuilt.
+#  The rows of the file are compared with those of the store in key order,
+#  after an ExternalSort, and the file is read again for the rows of the
+#  changed streets, so that the file is never held in memory.
+maxPatchFraction=0.1
+def patchLocationDatabase(base,fileName,progress=None):
+	stamp=fileStamp(fileName)
+	store=base.store
+	streets=set(store.streets)
+	records=ExternalSort()
+	batch=[]
+	for (key,lat,lon) in readLocationRecords(fileName,progress):
+		batch.append((key.lower(),1,key,lat,lon,0))
+		if len(batch)>=batchRows:
+			records.extend(batch)
+			batch=[]
+	records.extend(batch)
+	def baseRecords():
+		for r in range(len(store)):
+			if r not in streets:
+				key=store.key(r)
+				yield (key.lower(),0,key,store.lats[r],store.lons[r],r)
+	removed=[]
+	added=[]
+	limit=maxPatchFraction*max(store.addressCount,1)
+	for (lower,group) in itertools.groupby(heapq.merge(baseRecords(),records),key=operator.itemgetter(0)):
+		group=list(group)
+		if len(group)==2 and group[0][1]!=group[1][1] and group[0][2:5]==group[1][2:5]:
+			continue # the usual case: the same address, unchanged
+		baseRows={} # (address,lat,lon) -> list of rows
+		newRows=set()
+		for (lower,isNew,key,lat,lon,r) in group:
+			if isNew:
+				newRows.add((key,lat,lon))
+			else:
+				baseRows.setdefault((key,lat,lon),[]).append(r)
+		removed+=[r for (row,l) in baseRows.items() if row not in newRows for r in l]
+		added+=[row for row in newRows if row not in baseRows]
+		if len(removed)+len(added)>limit:
+			return None
+	changedStreets={streetAndCity(row[0]) for row in added}|{streetAndCity(store.key(r)) for r in removed}
+	hidden=list(removed)
+	for street in changedStreets:
+		(lo,hi)=store.prefixRange(street)
+		hidden+=[r for r in range(lo,hi) if r in streets and store.key(r)==street]
+	streetRows=[row for row in readLocationRecords(fileName) if streetAndCity(row[0]) in changedStreets] \
+			if changedStreets else []
+	entries=[(addr,lat,lon,None) for (addr,lat,lon) in added]+streetEntries(streetRows)
+	entries.sort(key=lambda x: x[0].lower())
+	patchStore=AddressStore.fromRows(entries,len(added))
+	patchStore.stamp=stamp
+	patch=LocationDatabase(patchStore,fileName)
+	patch.isPatch=True
+	for (name,indexClass) in indexClasses.items():
+		index=indexClass.build(patchStore)
+		index.store=patchStore
+		setattr(patch,name,index)
+	copy=LocationDatabase(store,fileName,hidden)
+	for name in indexNames:
+		setattr(copy,name,getattr(base,name))
+	log.info("Patched %s: %d addresses added, %d removed, %d streets changed",
+			fileName,len(added),len(removed),len(changedStreets))
+	return [patch,copy]
+
+# loadLocationSource: the list of databases for the location csv file: when
+#  previous (the databases of the same file in the catalog that is in use, if
+#  any) is given, the same databases if the file hasn't changed, or else
+#  patched with the changes (see patchLocationDatabase) if that is possible;
+#  otherwise, the one database of the file, from loadLocationTable.  The
+#  second return value is True if the csv file didn't have to be read.
+def loadLocationSource(fileName,previous=(),progress=None):
+	stamp=fileStamp(fileName)
+	if previous and previous[0].store.stamp==stamp:
+		return list(previous),True
+	for db in previous:
+		if not db.isPatch and db.store.stamp!=stamp:
+			databases=patchLocationDatabase(db,fileName,progress)
+			if databases is not None:
+				return databases,False
+	(store,cached)=loadLocationTable(fileName,progress)
+	return [LocationDatabase(store,fileName)],cached
+
+# openLocationCatalog: load the location table of each source (from its cache
+#  when possible) with the named indexes already attached
+def openLocationCatalog(fileName,names=(),progress=None):
+	databases=[]
+	for source in locationSources(fileName):
+		(store,cached)=loadLocationTable(source,progress)
+		db=LocationDatabase(store,source)
+		for (name,index) in loadIndexes(source,store,names):
+			setattr(db,name,index)
+		databases.append(db)
+	return LocationCatalog(databases)
@@ -0,0 +1,26 @@
+#  log_setup.py - configure diagnostic logging for the GUI and the command line
+
+#  each module logs to its own logger (logging.getLogger(__name__)) and never
+#   formats a message itself; arguments are passed separately, so that a
+#   message below the current level costs only the level check.  Anything that
+#   is expensive to compute just for a message (e.g. a list of all combo box
+#   items) is guarded by log.isEnabledFor.
+
+#  the level is the default given by the program, unless it is overridden by
+#   the SARTOPO_ADDRESS_LOG_LEVEL environment variable (DEBUG, INFO, WARNING,
+#   ERROR); messages go to stderr.
+
+import os
+import logging
+
+logLevelVariable="SARTOPO_ADDRESS_LOG_LEVEL"
+logFormat="%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+def setupLogging(defaultLevel=logging.INFO):
+	level=defaultLevel
+	name=os.environ.get(logLevelVariable,"").upper()
+	if name:
+		level=logging.getLevelName(name)
+		if not isinstance(level,int):
+			level=defaultLevel
+	logging.basicConfig(level=level,format=logFormat)
@@ -53,6 +53,13 @@ class Ui_optionsDialog(object):
         font.setPointSize(9)
         self.closeButton.setFont(font)
         self.closeButton.setObjectName("closeButton")
+        self.importButton = QtWidgets.QPushButton(optionsDialog)
+        self.importButton.setGeometry(QtCore.QRect(15, 219, 71, 28))
+        font = QtGui.QFont()
+        font.setFamily("Segoe UI")
+        font.setPointSize(9)
+        self.importButton.setFont(font)
+        self.importButton.setObjectName("importButton")
         self.folderComboBox = STSFeatureComboBox(optionsDialog)
         self.folderComboBox.setGeometry(QtCore.QRect(257, 83, 185, 25))
         font = QtGui.QFont()
@@ -130,6 +137,7 @@ class Ui_optionsDialog(object):
         self.browseForMarkerFileButton.clicked.connect(optionsDialog.browseForMarkerFile)
         self.browseForLocationFileButton.clicked.connect(optionsDialog.browseForLocationFile)
         self.accountNameField.textChanged['QString'].connect(optionsDialog.accountNameTextChanged)
+        self.importButton.clicked.connect(optionsDialog.browseForBatchFile)
         QtCore.QMetaObject.connectSlotsByName(optionsDialog)
         optionsDialog.setTabOrder(self.urlField, self.accountNameField)
         optionsDialog.setTabOrder(self.accountNameField, self.folderComboBox)
@@ -137,7 +145,8 @@ class Ui_optionsDialog(object):
         optionsDialog.setTabOrder(self.locationFileField, self.browseForLocationFileButton)
         optionsDialog.setTabOrder(self.browseForLocationFileButton, self.markerFileField)
         optionsDialog.setTabOrder(self.markerFileField, self.browseForMarkerFileButton)
-        optionsDialog.setTabOrder(self.browseForMarkerFileButton, self.reloadButton)
+        optionsDialog.setTabOrder(self.browseForMarkerFileButton, self.importButton)
+        optionsDialog.setTabOrder(self.importButton, self.reloadButton)
         optionsDialog.setTabOrder(self.reloadButton, self.closeButton)
         optionsDialog.setTabOrder(self.closeButton, self.linkIndicator)
 
@@ -145,9 +154,10 @@ class Ui_optionsDialog(object):
         _translate = QtCore.QCoreApplication.translate
         optionsDialog.setWindowTitle(_translate("optionsDialog", "Options"))
         self.locationCountLabel.setText(_translate("optionsDialog", "0 Locations loaded"))
-        self.label.setText(_translate("optionsDialog", "Location Lookup File (.csv):"))
+        self.label.setText(_translate("optionsDialog", "Location File (.csv or .txt):"))
         self.browseForLocationFileButton.setText(_translate("optionsDialog", "Browse"))
         self.closeButton.setText(_translate("optionsDialog", "Close"))
+        self.importButton.setText(_translate("optionsDialog", "Import..."))
         self.label_2.setText(_translate("optionsDialog", "Only list existing markers from fodler(s):"))
         self.label_3.setText(_translate("optionsDialog", "Saved map URL:"))
         self.accountNameLabel.setText(_translate("optionsDialog", "Sartopo.com account name:"))
@@ -0,0 +1,74 @@
+#  outbox.py - durable queue of marker operations (add and move) that have not
+#   yet been accepted by the sartopo server
+
+#  every operation is written to an sqlite database before it is sent, and is
+#   only removed once the server has accepted it, so that operations made while
+#   the server is unreachable (or while the program is not even running) are
+#   sent, in the order they were made, when the link comes back.
+
+#  moves of an existing marker are coalesced: a new move of a marker replaces
+#   any move of the same marker that is still waiting, so only the latest
+#   position is sent.
+
+import json
+import time
+import sqlite3
+
+# Operation: one queued operation; params is a dict of the marker fields
+class Operation():
+	def __init__(self,opId,kind,url,markerId,params,created):
+		self.opId=opId
+		self.kind=kind # "add" or "move"
+		self.url=url # map url that the operation is meant for
+		self.markerId=markerId # id of the marker being moved; None for an add
+		self.params=params
+		self.created=created
+
+class Outbox():
+	def __init__(self,fileName):
+		self.fileName=fileName
+		self.db=sqlite3.connect(fileName)
+		self.db.execute("""CREATE TABLE IF NOT EXISTS operations(
+				opId INTEGER PRIMARY KEY AUTOINCREMENT,
+				kind TEXT NOT NULL,
+				url TEXT NOT NULL,
+				markerId TEXT,
+				params TEXT NOT NULL,
+				created REAL NOT NULL)""")
+		self.db.commit()
+
+	def __len__(self):
+		return self.db.execute("SELECT COUNT(*) FROM operations").fetchone()[0]
+
+	# add: queue an operation, and return its id; a move replaces any move of
+	#  the same marker (on the same map) that is still queued
+	def add(self,kind,url,params,markerId=None):
+		with self.db:
+			if kind=="move" and markerId is not None:
+				self.db.execute("DELETE FROM operations WHERE kind='move' AND url=? AND markerId=?",
+						(url,markerId))
+			cur=self.db.execute("INSERT INTO operations(kind,url,markerId,params,created) VALUES (?,?,?,?,?)",
+					(kind,url,markerId,json.dumps(params),time.time()))
+		return cur.lastrowid
+
+	# first: return the oldest queued operation for the map url, or None
+	def first(self,url):
+		row=self.db.execute("SELECT opId,kind,url,markerId,params,created FROM operations "
+				"WHERE url=? ORDER BY opId LIMIT 1",(url,)).fetchone()
+		if row is None:
+			return None
+		(opId,kind,url,markerId,params,created)=row
+		return Operation(opId,kind,url,markerId,json.loads(params),created)
+
+	# count: number of queued operations for the map url
+	def count(self,url):
+		return self.db.execute("SELECT COUNT(*) FROM operations WHERE url=?",(url,)).fetchone()[0]
+
+	# remove: remove an operation once it has been accepted; it may already be
+	#  gone, if it was replaced by a later move while it was being sent
+	def remove(self,opId):
+		with self.db:
+			self.db.execute("DELETE FROM operations WHERE opId=?",(opId,))
+
+	def close(self):
+		self.db.close()
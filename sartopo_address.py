@@ -67,32 +67,82 @@
 #
 # ############################################################################
 
-from PyQt5.QtCore import *
-from PyQt5.QtGui import *
-from PyQt5.QtWidgets import *
+import time
+# startup report: with --startup-report, the time from here to each step of
+#  startup (see startupStep) is printed, and the program exits as soon as the
+#  location table and its indexes are ready; for the time taken by each module
+#  that is imported, also run python with -X importtime
+startupStartTime=time.perf_counter()
 
 import os
 import sys
 import csv
 import json
 import re
-import time
+import queue
+import heapq
+import logging
 from datetime import datetime
+from importlib.metadata import version,PackageNotFoundError
+
+from log_setup import setupLogging
+
+startupReport="--startup-report" in sys.argv
+
+def startupStep(step):
+	if startupReport:
+		print("%8.1f ms  %s"%((time.perf_counter()-startupStartTime)*1000,step),file=sys.stderr,flush=True)
+
+startupStep("standard library imported")
+
+# the command line subcommands (see sartopo_address_cli.py) don't need PyQt,
+#  so hand off to them before it is imported
+if __name__=='__main__' and len(sys.argv)>1:
+	import sartopo_address_cli
+	if sys.argv[1] in sartopo_address_cli.commands:
+		sys.exit(sartopo_address_cli.main(sys.argv[1:]))
+
+from PyQt5.QtCore import *
+from PyQt5.QtGui import *
+from PyQt5.QtWidgets import *
+
+startupStep("PyQt5 imported")
+
+log=logging.getLogger("sartopo_address")
+if __name__=='__main__':
+	setupLogging(logging.INFO)
 
 sartopo_python_min_version="1.1.2"
 
-import pkg_resources
-sartopo_python_installed_version=pkg_resources.get_distribution("sartopo-python").version
-print("sartopo_python version:"+str(sartopo_python_installed_version))
-if pkg_resources.parse_version(sartopo_python_installed_version)<pkg_resources.parse_version(sartopo_python_min_version):
-	print("ABORTING: installed sartopo_python version "+str(sartopo_python_installed_version)+" is less than minimum required version "+sartopo_python_min_version)
+# versionTuple: the leading numeric part of a version string, for comparison,
+#  e.g. (1,1,2) for "1.1.2" or "1.1.2rc1"
+def versionTuple(v):
+	m=re.match(r"\d+(\.\d+)*",v)
+	return tuple(int(n) for n in m.group(0).split(".")) if m else ()
+
+# check the version from the installed package metadata only; sartopo_python
+#  itself (which takes longer to import than everything else put together) is
+#  not imported until a map URL is entered (see batch.openSession)
+try:
+	sartopo_python_installed_version=version("sartopo-python")
+except PackageNotFoundError:
+	log.error("ABORTING: sartopo_python is not installed")
+	exit()
+log.info("sartopo_python version: %s",sartopo_python_installed_version)
+if versionTuple(sartopo_python_installed_version)<versionTuple(sartopo_python_min_version):
+	log.error("ABORTING: installed sartopo_python version %s is less than minimum required version %s",sartopo_python_installed_version,sartopo_python_min_version)
 	exit()
-	
-from sartopo_python import SartopoSession
 
+from outbox import Outbox
+from STSFeatureComboBox import FeatureListModel
+from feature_list import FeatureList,featureTitle
+from batch import readBatchCsv,resolveBatch,openSession,findFolder,placeMarkers,writeReport,requestError
+from location_db import LocationCatalog,locationSources,isCatalogFile,loadLocationSource,loadIndexes,indexNames,parseLatLon,streetLabel
 from sartopo_address_ui import Ui_Dialog
 from options_dialog_ui import Ui_optionsDialog
 
+startupStep("application modules imported")
+
 markerSymbolDict={}
 markerSymbolDict["Animal Issue"]="usar-14"
 markerSymbolDict["IC"]="cp"
@@ -115,24 +165,110 @@ markerSymbolDict["Follow up"]="usar-8"
 markerSymbolDict["Shelter In Place"]="usar-13"
 markerSymbolDict["Route Blocked"]="usar-20"
 
-def sortByTitle(item):
-	return item["properties"]["title"]
+# defaultMarkerList: the marker definitions to use if the marker file can't be
+#  read, with the same columns as the marker file: label, icon file, sartopo
+#  symbol, folder
+defaultMarkerList=[
+	["Default","dot.png","point","Addresses"],
+	["Assisted","assisted.png","usar-5","Addresses"],
+	["Evacuated","evacuated.png","usar-6","Addresses"],
+	["Rescued","rescued.png","usar-7","Addresses"],
+	["Follow-up","follow_up.png","usar-8","Addresses"],
+	["Animal Issue","animal_issue.png","usar-14","Addresses"],
+	["Shelter In Place","shelter_in_place.png","usar-13","Addresses"],
+	["No Damage","structure_no_damage.png","usar-1","Addresses"],
+	["Damaged","structure_damaged.png","usar-2","Addresses"],
+	["Failed","structure_failed.png","usar-3","Addresses"],
+	["Destroyed","structure_destroyed.png","usar-4","Addresses"],
+	["Warning","warning.png","warning","Addresses"],
+	["Route Blocked","route_blocked.png","usar-20","Addresses"]]
+
+# markerIcon: the icon for a marker definition; marker icons are not compiled
+#  into the resource module (which is loaded at startup), but read from the
+#  sartopo_markers directory next to this file (or from the given path, if it
+#  is absolute) when they are first needed, and kept for when the marker file
+#  is loaded again
+markerIconDir=os.path.join(os.path.dirname(os.path.abspath(__file__)),"sartopo_markers")
+markerIcons={} # icon file name -> QIcon
+
+def markerIcon(fileName):
+	icon=markerIcons.get(fileName)
+	if icon is None:
+		icon=QIcon(os.path.join(markerIconDir,fileName))
+		markerIcons[fileName]=icon
+	return icon
+
+# addMarkerJob: add a marker (in the request worker thread); the folder id
+#  normally comes from the folder id cache, but if the folder title isn't
+#  there, first check for folders that were added to the map since the last
+#  update, to avoid making a duplicate folder; returns the folder id, the
+#  folders that were checked (if any), and the response
+def addMarkerJob(sts,params,folderId,since):
+	folderName=params["folderName"]
+	folders=None
+	if not folderId:
+		folders=sts.getFeatures("Folder",since)
+		for folder in folders or []:
+			if folder["properties"]["title"]==folderName:
+				folderId=folder["id"]
+	if not folderId:
+		folderId=sts.addFolder(folderName)
+		if not folderId:
+			raise RuntimeError("could not add folder "+folderName)
+	rval=sts.addMarker(params["lat"],params["lon"],params["title"],params["description"],"FF0000",params["symbol"],None,folderId)
+	if not rval:
+		raise RuntimeError("no response")
+	return (folderId,folders,rval)
+
+# moveMarkerJob: move an existing marker (in the request worker thread)
+def moveMarkerJob(sts,markerId,params):
+	rval=sts.addMarker(params["lat"],params["lon"],params["title"],description=params["description"],
+			symbol=params["symbol"],folderId=params["folderId"],existingId=markerId)
+	if not rval:
+		raise RuntimeError("no response")
+	return rval
+
+outboxMinRetryDelay=2 # seconds
+outboxMaxRetryDelay=60 # seconds
+defaultSyncInterval=10 # seconds; see syncFeatureLists
+fileWatchDelay=2 # seconds; see fileChanged
+
+def formatDistance(meters):
+	if meters<1000:
+		return str(int(round(meters)))+" m"
+	return "{:.1f} km".format(meters/1000)
 
 class MyWindow(QDialog,Ui_Dialog):
+	batchProgress=pyqtSignal(int,int) # emitted from the request worker thread; see batchImport
+
 	def __init__(self,parent):
 		QDialog.__init__(self)
 		self.parent=parent
 		self.rcFileName="sartopo_address.rc"
+		self.outboxFileName="sartopo_address_outbox.db"
 		self.ui=Ui_Dialog()
 		self.ui.setupUi(self)
 		self.locationFileName="sartopo_address.csv"
 		self.markerFileName="sartopo_markers.csv"
 		self.accountName=""
+		self.syncInterval=defaultSyncInterval
 		self.previousComment=""
+		self.existingMarkerSelection=None # see existingMarkerComboBoxCB
+
+		# the local copy of each feature list is shown by all of the combo boxes
+		#  of that feature class, through a shared model; see STSFeatureComboBox
+		self.featureListDict={}
+		self.featureListDict["Folder"]=FeatureList()
+		self.featureListDict["Marker"]=FeatureList()
+		self.featureListModels={}
+		for featureClass in self.featureListDict:
+			self.featureListModels[featureClass]=FeatureListModel(featureClass,self.featureListDict[featureClass],self)
+
 		self.optionsDialog=optionsDialog(self)
 		self.setWindowFlags(Qt.WindowStaysOnTopHint)
 		self.setAttribute(Qt.WA_DeleteOnClose)
-		self.url=None
+		self.url=None # the map url that was entered, even if it can't be opened (yet)
+		self.connecting=False # whether the map is being opened, or will be tried again; see openMap
 		self.folderId=None
 		self.sts=None
 		self.link=-1
@@ -142,8 +278,11 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.h=250
 		self.lat=None
 		self.lon=None
-		self.addrTable=[["","",""]]
-		self.streetAndCityTable=[["","",""]]
+		self.locationDb=LocationCatalog() # all locations and their lookup indexes; see location_db.py
+		self.nearestCount=10 # number of nearest addresses to offer when coordinates are entered
+		self.labelAddress=None # address to use for the marker label (the matched or nearest key), if not the entered text
+		self.locationLoader=None
+		self.pendingLocationFileName=None
 		self.sinceFolder=0 # sartopo wants integer milliseconds
 		self.sinceMarker=0 # sartopo wants integer milliseconds
 		self.markerList=[] # list of all sartopo markers and their ids
@@ -154,43 +293,105 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.ui.folderComboBox.featureClass="Folder"
 		# self.ui.folderComboBox.headerText="Folder"
 
+		self.ui.existingMarkerComboBox.setFeatureModel(self.featureListModels["Marker"])
+		self.ui.folderComboBox.setFeatureModel(self.featureListModels["Folder"])
+
 		self.loadRcFile()
 		self.loadMarkerFile()
 
 		self.setGeometry(int(self.x),int(self.y),int(self.w),int(self.h))
-		self.buildTableFromCsv(self.locationFileName)
-		
-		self.addrTableModel=MyTableModel(self.addrTable,self)
 		
-		# using a simple string list is easier than an AbstractTableModel subclass
-		self.completer=QCompleter([x[0] for x in self.addrTable])
-#         self.completer=QCompleter()
-#         self.completer.setModel(self.addrTableModel)
-
+		# the completer reads directly from the location stores through addrModel,
+		#  which holds only the rows that match the current text (see
+		#  AddressCompletionModel below); it is created once, and a reload just
+		#  points the model at the new catalog
+		self.addrModel=AddressCompletionModel(self.locationDb,self)
+		self.completer=QCompleter(self.addrModel,self)
+		self.completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
 		# performance speedups: see https://stackoverflow.com/questions/33447843
 		self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-		self.completer.setModelSorting(QCompleter.CaseSensitivelySortedModel)
+		self.completer.setModelSorting(QCompleter.CaseInsensitivelySortedModel)
 		self.completer.popup().setUniformItemSizes(True)
 		self.completer.popup().setLayoutMode(QListView.Batched)
-		
 		self.ui.addrField.setCompleter(self.completer)
 		self.ui.addrField.textChanged.connect(self.lookupFromAddrField)
+		# the word search and fuzzy (typo-tolerant) search are only done when
+		#  there are few or no prefix matches, and only after typing pauses,
+		#  since they are much slower than the prefix and exact lookups; they
+		#  run in the search thread, so that even a slow search never holds up
+		#  typing
+		self.searchTimer=QTimer(self)
+		self.searchTimer.setSingleShot(True)
+		self.searchTimer.setInterval(300)
+		self.searchTimer.timeout.connect(self.searchFromAddrField)
+		self.addressSearcher=AddressSearcher()
+		self.addressSearcher.found.connect(self.searchFinished)
+		self.addressSearcher.start()
 		self.ui.optionsButton.clicked.connect(self.optionsDialog.show)
 
-		self.featureListWidgetsToUpdate={}
-		self.featureListWidgetsToUpdate["Folder"]=[self.ui.folderComboBox,self.optionsDialog.ui.folderComboBox]
-		self.featureListWidgetsToUpdate["Marker"]=[self.ui.existingMarkerComboBox]
-		
 		self.since={}
 		self.since["Folder"]=0
 		self.since["Marker"]=0
 		
-		self.featureListDict={}
-		self.featureListDict["Folder"]=[]
-		self.featureListDict["Marker"]=[]
+		self.featureListPending={} # whether a request for the feature list is pending
+		self.featureListPending["Folder"]=False
+		self.featureListPending["Marker"]=False
+
+		# folder title -> folder id, kept up to date by updateFeatureList and
+		#  addMarker, so that addMarker doesn't need to get all folders first
+		self.folderIdDict={}
+
+		# all sartopo requests are made in the request worker thread, so that a
+		#  slow or unreachable server doesn't freeze the window; see request
+		self.requests={} # job id -> [description,onSuccess,onFailure] of pending requests
+		self.lastRequestDescription=None
+		self.lastRequestState=None
+		self.windowTitleBase=self.windowTitle()
+		self.requestWorker=SartopoWorker()
+		self.requestWorker.jobFinished.connect(self.requestFinished)
+		self.requestWorker.jobFailed.connect(self.requestFailed)
+		self.requestWorker.start()
+
+		# marker operations go through the outbox, so that they are not lost
+		#  if the server can't be reached; see queueOperation
+		self.outbox=Outbox(self.outboxFileName)
+		self.outboxOp=None # the operation being sent, if any
+		self.outboxCount=0 # number of operations in the outbox for the current map
+		self.outboxRetryDelay=outboxMinRetryDelay
+		self.outboxTimer=QTimer(self)
+		self.outboxTimer.setSingleShot(True)
+		self.outboxTimer.timeout.connect(self.sendOutbox)
+		# a map that can't be opened is tried again in the same way; see sessionFailed
+		self.sessionRetryDelay=outboxMinRetryDelay
+		self.sessionTimer=QTimer(self)
+		self.sessionTimer.setSingleShot(True)
+		self.sessionTimer.timeout.connect(self.openMap)
+		self.batchProgress.connect(self.batchProgressChanged)
+
+		# while there is a link, the feature lists are kept up to date in the
+		#  background, so that the combo boxes always show the current lists
+		#  and open immediately; see syncFeatureLists
+		self.syncTimer=QTimer(self)
+		self.syncTimer.timeout.connect(self.syncFeatureLists)
+
+		# the location and marker files are watched, and loaded again when they
+		#  change, so that the latest versions are always in use; see fileChanged
+		self.fileWatcher=QFileSystemWatcher(self)
+		self.fileWatcher.fileChanged.connect(self.fileChanged)
+		self.watchedLocationFiles=[]
+		self.locationFileTimer=QTimer(self)
+		self.locationFileTimer.setSingleShot(True)
+		self.locationFileTimer.setInterval(int(fileWatchDelay*1000))
+		self.locationFileTimer.timeout.connect(self.locationFileChanged)
+		self.markerFileTimer=QTimer(self)
+		self.markerFileTimer.setSingleShot(True)
+		self.markerFileTimer.setInterval(int(fileWatchDelay*1000))
+		self.markerFileTimer.timeout.connect(self.markerFileChanged)
+		self.watchFiles()
 	
 		self.modeChanged()
 		self.ui.goButton.setEnabled(False) # only enable the button when ready
+		self.buildTableFromCsv(self.locationFileName)
 		
 		# use the filter folder combo box selection to filter the edit marker combo box items
 		self.ui.existingMarkerComboBox.filterFolderComboBox=self.optionsDialog.ui.folderComboBox
@@ -202,107 +403,194 @@ class MyWindow(QDialog,Ui_Dialog):
 		if event.key()!=Qt.Key_Escape:
 			QDialog.keyPressEvent(self,event)
 	
+	# buildTableFromCsv: load the location table in a background thread (see
+	#  LocationLoader below); the previous table, if any, stays in use until the
+	#  new one is completely loaded and swapped in by locationLoaderFinished.
+	#  Only the changes since the previous table was loaded are read in (see
+	#  location_db.loadLocationSource), so reloading after a small edit of the
+	#  location file is quick.
 	def buildTableFromCsv(self,fileName):
-		self.addrTable=[["","",""]]
-		self.scLowestDict={}
-		with open(fileName,'r') as csvFile:
-			csvReader=csv.reader(csvFile)
-			n=0
-			for row in csvReader:
-				n=n+1
-				self.addrTable.append(row)
-			# also add each street-and-city (just once) as its own entry;
-			#  for coordinates (for now), use a fixed offset from the
-			#  coordinates of the lowest number on that street
-			for row in self.addrTable:
-#                 print("row:"+str(row))
-				addrParse=row[0].split()
-#                 print("parse:"+str(addrParse))
-				if len(addrParse)>0:
-					number=addrParse[0]
-					streetAndCity=' '.join(addrParse[1:])
-	#                 streetAndCity=re.sub(r'^[0-9]+ ','',row[0])
-	#                 scRow=[streetAndCity,row[1],row[2]]
-	#                 scnRow=[streetAndCity,number,row[1],row[2]]
-#                     if streetAndCity=="Whispering Pines Lane, Grass Valley":
-#                         print("street found: number="+str(number)+"  "+str(row))
-#                         print("   existing dict entry="+str(self.scLowestDict.get(streetAndCity,'none')))
-#                     if (not streetAndCity in self.scLowestDict) or (number<self.scLowestDict[streetAndCity][0]):
-					if not streetAndCity in self.scLowestDict:
-						self.scLowestDict[streetAndCity]=[number,row[1],row[2]]
-#                         if streetAndCity=="Whispering Pines Lane, Grass Valley":
-#                             print("lowest number so far for street: "+str(number)+" "+streetAndCity)
-	#                     self.scnTable.append(scnRow)
-#                 else: # it does exist; but if the current number is lower,
-					# replace the existing entry with the current entry
-#                     print("adding street: "+streetAndCity)
-#                     if number<self.scLowestDict[streetAndCity]:
-#                         self.scnTable
-#             self.addrTable=self.addrTable+self.streetAndCityTable
-			for key,value in self.scLowestDict.items():
-				row=[key,value[1],value[2]]
-				self.addrTable.append(row)
-#                 print("adding "+str(row))
-			# performance speedup: sort alphabetically on the column that 
-			#  will be used for lookup; see setModelSorting docs
-			self.addrTable.sort(key=lambda x: x[0])
-			self.completer=QCompleter([x[0] for x in self.addrTable])
-			# performance speedups: see https://stackoverflow.com/questions/33447843
-			self.completer.setCaseSensitivity(Qt.CaseInsensitive)
-			self.completer.setModelSorting(QCompleter.CaseSensitivelySortedModel)
-			self.completer.popup().setUniformItemSizes(True)
-			self.completer.popup().setLayoutMode(QListView.Batched)
-			
-			self.ui.addrField.setCompleter(self.completer)
-			print("Finished reading "+str(n)+" addresses.")
-			print("Added "+str(len(self.scLowestDict))+" street names.")
-			self.ui.locationCountLabel.setText(str(n)+" locations loaded")
-			self.optionsDialog.ui.locationCountLabel.setText(str(n)+" locations loaded")
+		if self.locationLoader is not None and self.locationLoader.isRunning():
+			log.info("Location file load already in progress; will load %s when it finishes.",fileName)
+			self.pendingLocationFileName=fileName
+			return
+		self.pendingLocationFileName=None
+		self.locationLoader=LocationLoader(fileName,self.locationDb)
+		self.locationLoader.progress.connect(self.locationLoaderProgress)
+		self.locationLoader.loaded.connect(self.locationLoaderFinished)
+		self.locationLoader.indexLoaded.connect(self.locationLoaderIndexFinished)
+		self.locationLoader.failed.connect(self.locationLoaderFailed)
+		self.locationLoader.finished.connect(self.locationLoaderDone)
+		self.setLocationCountText("Loading locations...")
+		self.locationLoader.start()
+
+	def setLocationCountText(self,text):
+		self.ui.locationCountLabel.setText(text)
+		self.optionsDialog.ui.locationCountLabel.setText(text)
+
+	def locationLoaderProgress(self,n):
+		self.setLocationCountText("Loading... "+str(n)+" locations")
+
+	def locationLoaderFinished(self,db,cached):
+		self.locationDb=db
+		n=db.addressCount
+		self.addrModel.setDatabase(db)
+		log.info("Finished reading %d addresses from %d location files%s",n,len({d.fileName for d in db.databases})," (from cache)." if cached else ".")
+		log.info("Added %d street names.",db.streetCount)
+		self.setLocationCountText(str(n)+" locations loaded")
+		# re-check the current entry against the new table
+		self.lookupFromAddrField()
+		startupStep("location table loaded ("+str(n)+" addresses)")
+
+	# locationLoaderIndexFinished: db is the LocationDatabase of one source of
+	#  the catalog; the catalog searches each source that has the index
+	def locationLoaderIndexFinished(self,db,name,index):
+		setattr(db,name,index)
+		log.info("%s ready for %s.",name,db.fileName)
+
+	def locationLoaderFailed(self,fileName,msg):
+		log.warning("Could not load location file %s: %s",fileName,msg)
+		if len(self.locationDb)>0:
+			self.setLocationCountText(str(self.locationDb.addressCount)+" locations loaded")
+		else:
+			self.setLocationCountText("No locations loaded")
+
+	# watchFiles: watch the location file (and, if it is a catalog, each of the
+	#  location files that it lists) and the marker file; this is called again
+	#  whenever they may have changed, since the list of sources may have
+	#  changed, and a file that was replaced (e.g. saved by writing a new file
+	#  and renaming it) is no longer watched
+	def watchFiles(self):
+		locationFiles=[self.locationFileName]
+		if isCatalogFile(self.locationFileName):
+			try:
+				locationFiles+=locationSources(self.locationFileName)
+			except OSError:
+				pass
+		self.watchedLocationFiles=[os.path.abspath(f) for f in locationFiles]
+		paths=[f for f in self.watchedLocationFiles+[os.path.abspath(self.markerFileName)] if os.path.isfile(f)]
+		watched=self.fileWatcher.files()
+		stale=[f for f in watched if f not in paths]
+		if stale:
+			self.fileWatcher.removePaths(stale)
+		new=[f for f in paths if f not in watched]
+		if new:
+			self.fileWatcher.addPaths(new)
+
+	# fileChanged: a file is often written in several bursts, so it is only
+	#  loaded again once it has stopped changing for fileWatchDelay seconds;
+	#  the location table is loaded in the background, and the current one
+	#  stays in use until the new one is swapped in (see buildTableFromCsv)
+	def fileChanged(self,path):
+		if path in self.watchedLocationFiles:
+			self.locationFileTimer.start()
+		if path==os.path.abspath(self.markerFileName):
+			self.markerFileTimer.start()
+
+	def locationFileChanged(self):
+		self.watchFiles()
+		if os.path.isfile(self.locationFileName):
+			log.info("Location file changed; loading %s again",self.locationFileName)
+			self.buildTableFromCsv(self.locationFileName)
 
+	# markerFileChanged: load the marker file again, keeping the current marker
+	#  selection if it is still there
+	def markerFileChanged(self):
+		self.watchFiles()
+		if os.path.isfile(self.markerFileName):
+			log.info("Marker file changed; loading %s again",self.markerFileName)
+			label=self.ui.markerSymbolComboBox.currentText()
+			self.loadMarkerFile()
+			k=self.ui.markerSymbolComboBox.findText(label)
+			if k>=0:
+				self.ui.markerSymbolComboBox.setCurrentIndex(k)
+
+	def locationLoaderDone(self):
+		if self.pendingLocationFileName:
+			self.buildTableFromCsv(self.pendingLocationFileName)
+		elif startupReport:
+			startupStep("location indexes ready")
+			self.shutDown() # not close, which would rewrite the rc file
+
+	# updateLinkIndicator: red if there is no map link; otherwise yellow while
+	#  any requests are pending or there are operations waiting in the outbox,
+	#  orange if the latest request failed, or green
 	def updateLinkIndicator(self):
-		if self.link==1:
-			self.ui.linkIndicator.setStyleSheet("background-color:#00ff00")
-			self.optionsDialog.ui.linkIndicator.setStyleSheet("background-color:#00ff00")
+		if self.link!=1:
+			color="#ff0000"
+		elif self.requests or self.outboxCount:
+			color="#ffff00"
+		elif self.lastRequestState and self.lastRequestState.startswith("failed"):
+			color="#ff8000"
 		else:
-			self.ui.linkIndicator.setStyleSheet("background-color:#ff0000")
-			self.optionsDialog.ui.linkIndicator.setStyleSheet("background-color:#ff0000")
+			color="#00ff00"
+		self.ui.linkIndicator.setStyleSheet("background-color:"+color)
+		self.optionsDialog.ui.linkIndicator.setStyleSheet("background-color:"+color)
 
 	def createSTS(self):
-		print("\ncreateSTS called:")
+		log.debug("createSTS called")
+		u=self.optionsDialog.ui.urlField.text()
+		if u.endswith("#"): # pound sign at end of URL causes crash; brute force fix it here
+			u=u[:-1]
+			self.optionsDialog.ui.urlField.setText(u)
+		if u and u==self.url and (self.sts is not None or self.connecting):
+			# url has not changed; keep the existing link and folder list, or, if
+			#  the map is waiting to be tried again, try it now
+			if self.sessionTimer.isActive():
+				self.sessionTimer.stop()
+				self.openMap()
+			return
+		self.sessionTimer.stop()
+		self.connecting=False
 		if self.sts is not None: # close out any previous session
-			print("Closing previous SartopoSession")
+			log.info("Closing previous SartopoSession")
+			self.syncTimer.stop()
 			self.sts=None
 			self.ui.linkIndicator.setText("")
 			self.updateLinkIndicator()
 			self.link=-1
 			self.updateFeatureList("Folder")
 			self.updateFeatureList("Marker")
-		if self.optionsDialog.ui.urlField.text():
-			u=self.optionsDialog.ui.urlField.text()
-			if u==self.url: # url has not changed; keep the existing link and folder list
-				return
+		if u:
 			self.url=u
-			if self.url.endswith("#"): # pound sign at end of URL causes crash; brute force fix it here
-				self.url=self.url[:-1]
-				self.optionsDialog.ui.urlField.setText(self.url)
-			parse=self.url.replace("http://","").replace("https://","").split("/")
-			domainAndPort=parse[0]
-			mapID=parse[-1]
-			print("calling SartopoSession with domainAndPort="+domainAndPort+" mapID="+mapID)
-			if 'sartopo.com' in domainAndPort.lower():
-				print("  creating online session for user "+self.accountName)
-				self.sts=SartopoSession(domainAndPort=domainAndPort,mapID=mapID,
-										configpath="../sts.ini",
-										account=self.accountName)
-			else:
-				self.sts=SartopoSession(domainAndPort=domainAndPort,mapID=mapID)
-			self.link=self.sts.apiVersion
-			print("link status:"+str(self.link))
-			self.updateLinkIndicator()
-			if self.link>0:
-				self.ui.linkIndicator.setText(self.sts.mapID)
-				self.updateFeatureList("Folder")
-			self.optionsDialog.ui.folderComboBox.setHeader("Select a Folder...")
+			self.sessionRetryDelay=outboxMinRetryDelay
+			self.updateOutboxState()
+			self.openMap()
+		else:
+			self.url=None
+			self.updateOutboxState()
+
+	# openMap: open the session for the map url in the request worker thread;
+	#  until it is open, markers are still queued in the outbox for that url
+	def openMap(self):
+		url=self.url
+		accountName=self.accountName
+		self.connecting=True
+		self.request("Open map "+url.split("/")[-1],lambda: openSession(url,accountName),
+				lambda sts: self.sessionCreated(url,sts),lambda msg: self.sessionFailed(url,msg))
+
+	def sessionCreated(self,url,sts):
+		if url!=self.url or not self.connecting: # the url has changed again while connecting
+			return
+		log.info("link status: %s",sts.apiVersion)
+		if sts.apiVersion<=0: # no link after all
+			self.sessionFailed(url,"no link")
+			return
+		self.connecting=False
+		self.sessionRetryDelay=outboxMinRetryDelay
+		self.sts=sts
+		self.link=self.sts.apiVersion
+		self.updateLinkIndicator()
+		self.ui.linkIndicator.setText(self.sts.mapID)
+		self.updateFeatureList("Folder")
+		if self.syncInterval>0:
+			self.syncTimer.start(int(self.syncInterval*1000))
+			self.syncFeatureLists()
+		self.optionsDialog.ui.folderComboBox.setHeader("Select a Folder...")
+		# send anything that was queued for this map while there was no link
+		self.outboxRetryDelay=outboxMinRetryDelay
+		self.updateOutboxState()
+		self.sendOutbox()
 			
 	# def folderComboBoxActivated(self):
 	# 	self.featureListWidgetToUpdate["Folder"]=self.ui.folderComboBox
@@ -323,29 +611,81 @@ class MyWindow(QDialog,Ui_Dialog):
 #         print("url 2:'"+url_2+"'")
 	
 	def lookupFromAddrField(self):
-		addr=self.ui.addrField.text().lower()
-#         # reduce lag by skipping lookup until more than 3 characters
-#         #  have been entered
-#         if len(addr)<4:
-#             return
-		for row in self.addrTable:
-			if row[0].lower()==addr:
-				self.lat=row[1]
-				self.lon=row[2]
-				self.ui.latLonField.setText(str(self.lat)+" "+str(self.lon))
-				# self.ui.latLonField.setText(str(row[1]+" "+str(row[2])))
-				self.goButtonSetEnabled()
-				self.ui.existingMarkerComboBox.setEnabled(True)
-				self.updateTimestamp()
-				return
+		# narrow the completer's model to the matching rows first; this slot
+		#  runs before the line edit asks the completer to show its popup
+		addr=self.ui.addrField.text()
+		self.labelAddress=None
+		# if coordinates were entered, offer the nearest addresses instead
+		#  (reverse geocoding), and use the entered coordinates for the marker,
+		#  labeled with the nearest address
+		point=parseLatLon(addr)
+		if point is not None:
+			self.searchTimer.stop()
+			nearest=self.locationDb.nearest(point[0],point[1],self.nearestCount)
+			self.addrModel.setRows([r for (r,d) in nearest],[formatDistance(d) for (r,d) in nearest])
+			if nearest:
+				self.labelAddress=self.locationDb.key(nearest[0][0])
+			(self.lat,self.lon)=point
+			self.ui.latLonField.setText(str(self.lat)+" "+str(self.lon))
+			self.goButtonSetEnabled()
+			self.ui.existingMarkerComboBox.setEnabled(True)
+			self.updateTimestamp()
+			return
+		self.addrModel.setPrefix(addr)
+		self.searchTimer.stop()
+		if self.addrModel.rowCount()<self.addrModel.minRows and len(addr)>2:
+			self.searchTimer.start()
+		i=self.locationDb.lookup(addr)
+		if i is not None:
+			# label the marker from the stored key, as batch import does, since
+			#  the typed text may be normalized differently (e.g. "rd" for "Road")
+			self.labelAddress=self.locationDb.key(i)
+			self.lat=self.locationDb.lat(i)
+			self.lon=self.locationDb.lon(i)
+			self.ui.latLonField.setText(str(self.lat)+" "+str(self.lon))
+			# self.ui.latLonField.setText(str(row[1]+" "+str(row[2])))
+			self.goButtonSetEnabled()
+			self.ui.existingMarkerComboBox.setEnabled(True)
+			self.updateTimestamp()
+			return
 		self.lat=None
 		self.lon=None
 		self.ui.latLonField.setText("")
 		self.goButtonSetEnabled()
 		self.ui.existingMarkerComboBox.setEnabled(False)
 
+	# searchFromAddrField: if there are only a few prefix matches, also offer
+	#  the rows that contain all of the typed words in any order, and if there
+	#  are none of either, offer approximate matches; the searches are made in
+	#  the search thread, and the matches are shown by searchFinished, unless
+	#  the text has changed in the meantime
+	def searchFromAddrField(self):
+		db=self.locationDb
+		prefixCount=self.addrModel.rowCount()
+		def search(addr):
+			rows=db.tokenSearch(addr)
+			if rows or prefixCount>0 or len(addr)<4:
+				return (rows,False)
+			return (db.fuzzySearch(addr),True)
+		self.addressSearcher.search(self.ui.addrField.text(),search)
+
+	def searchFinished(self,addr,result):
+		(rows,fuzzy)=result
+		if addr!=self.ui.addrField.text() or not rows:
+			return
+		count=self.addrModel.rowCount()
+		if fuzzy:
+			if count>0:
+				return
+			self.addrModel.setRows(rows)
+		else:
+			self.addrModel.extendRows(rows)
+		# don't pop the list up again over an address that was just picked from it
+		if self.addrModel.rowCount()>count and self.locationDb.lookup(addr) is None:
+			self.completer.complete()
+
 	def saveRcFile(self):
-		print("saving...")
+		log.info("saving rc file %s",self.rcFileName)
 		(x,y,w,h)=self.geometry().getRect()
 		rcFile=QFile(self.rcFileName)
 		if not rcFile.open(QFile.WriteOnly|QFile.Text):
@@ -360,6 +700,7 @@ class MyWindow(QDialog,Ui_Dialog):
 		out << "locationFileName=" << self.locationFileName << "\n"
 		out << "markerFileName=" << self.markerFileName << "\n"
 		out << "accountName=" << self.accountName << "\n"
+		out << "syncInterval=" << self.syncInterval << "\n"
 		out << "x=" << x << "\n"
 		out << "y=" << y << "\n"
 		out << "w=" << w << "\n"
@@ -367,7 +708,7 @@ class MyWindow(QDialog,Ui_Dialog):
 		rcFile.close()
 
 	def loadMarkerFile(self):
-		print("loading marker file...")
+		log.info("loading marker file %s",self.markerFileName)
 		markerFile=QFile(self.markerFileName)
 		if not markerFile.open(QFile.ReadOnly|QFile.Text):
 			warn=QMessageBox(QMessageBox.Warning,"Error","Cannot read marker file " + self.markerFileName + "; using default marker settings. "+markerFile.errorString(),
@@ -375,6 +716,7 @@ class MyWindow(QDialog,Ui_Dialog):
 			warn.show()
 			warn.raise_()
 			warn.exec_()
+			self.loadDefaultMarkers()
 			return
 		inStr=QTextStream(markerFile)
 		line=inStr.readLine()
@@ -385,6 +727,7 @@ class MyWindow(QDialog,Ui_Dialog):
 			warn.raise_()
 			warn.exec_()
 			markerFile.close()
+			self.loadDefaultMarkers()
 			return
 		markerFile.close()
 		with open(self.markerFileName,'r') as markerFile:
@@ -395,15 +738,19 @@ class MyWindow(QDialog,Ui_Dialog):
 					self.markerList.append(row)
 			self.buildMarkerSymbolComboBox()
 
+	def loadDefaultMarkers(self):
+		self.markerList=[list(marker) for marker in defaultMarkerList]
+		self.buildMarkerSymbolComboBox()
+
 	def buildMarkerSymbolComboBox(self):
 		self.ui.markerSymbolComboBox.clear()
 		for marker in self.markerList:
-			self.ui.markerSymbolComboBox.addItem(
-					QIcon(":/sartopo_address/sartopo_markers/"+marker[1]),marker[0],marker[2:])
+			self.ui.markerSymbolComboBox.addItem(markerIcon(marker[1]),marker[0],marker[2:])
 
 	def markerSymbolComboBoxCB(self):
 		data=self.ui.markerSymbolComboBox.currentData()
-		print("\nmarkerSymbolComboBoxCB called:\n  folderComboBox items:"+str(self.ui.folderComboBox.getItems())+"\n  currentData:"+str(data))
+		if log.isEnabledFor(logging.DEBUG):
+			log.debug("markerSymbolComboBoxCB called: folderComboBox items: %s  currentData: %s",self.ui.folderComboBox.getItems(),data)
 		if data is not None and isinstance(data,list):
 			self.markerSymbol=data[0]
 			self.markerFolder=data[1]
@@ -420,7 +767,7 @@ class MyWindow(QDialog,Ui_Dialog):
 			self.ui.folderComboBox.setCurrentIndex(0)
 
 	def loadRcFile(self):
-		print("loading rc file "+self.rcFileName+"...")
+		log.info("loading rc file %s",self.rcFileName)
 		rcFile=QFile(self.rcFileName)
 		if not rcFile.open(QFile.ReadOnly|QFile.Text):
 			warn=QMessageBox(QMessageBox.Warning,"Error","Cannot read resource file " + self.rcFileName + "; using default settings. "+rcFile.errorString(),
@@ -456,6 +803,8 @@ class MyWindow(QDialog,Ui_Dialog):
 				self.markerFileName=tokens[1]
 			elif tokens[0]=="accountName":
 				self.accountName=tokens[1]
+			elif tokens[0]=="syncInterval":
+				self.syncInterval=int(tokens[1])
 			elif tokens[0]=="font-size":
 				self.fontSize=int(tokens[1].replace('pt',''))
 		d=QApplication.desktop()
@@ -466,17 +815,7 @@ class MyWindow(QDialog,Ui_Dialog):
 		rcFile.close()
 	
 	def getStreetLabel(self):
-		addr=self.ui.addrField.text()
-		parse=addr.split()
-		# assume that the street suffix token ends with a comma
-		n=0
-		for n in range(len(parse)):
-			# print("testing "+parse[n])
-			if parse[n][len(parse[n])-1]==",":
-				break
-		if n==0:
-			n=2
-		return ' '.join(parse[0:n])
+		return streetLabel(self.labelAddress or self.ui.addrField.text())
 	
 	# def getMarkerSymbol(self):
 	# 	t=self.ui.markerSymbolComboBox.currentText()
@@ -498,103 +837,298 @@ class MyWindow(QDialog,Ui_Dialog):
 #         if self.firstMarker:
 #             self.folderId=self.sts.addFolder("Addresses")
 #             self.firstMarker=False
-		folders=self.sts.getFeatures("Folder")
-		fid=False
 		folderName=self.ui.folderComboBox.currentText()
 		if folderName=="Folder":
 			folderName="Addresses"
-		for folder in folders:
-			if folder["properties"]["title"]==folderName:
-				fid=folder["id"]
-		# make a folder by the selected name if it doesn't already exist
-		if not fid:
-			fid=self.sts.addFolder(folderName)
-		self.folderId=fid
 		# rval=self.sts.addMarker(self.ui.latField.text(),self.ui.lonField.text(),self.getStreetLabel(),self.getDescription(),"FF0000",self.getMarkerSymbol(),None,self.folderId)
-		rval=self.sts.addMarker(self.lat,self.lon,self.getStreetLabel(),self.getDescription(),"FF0000",self.markerSymbol,None,self.folderId)
-		print("addMarker response:"+str(rval))
-	
-	def updateFeatureList(self,featureClass,filterFolderId=None):
-		# unfiltered feature list should be kept as an object;
-		#  filtered feature list (i.e. combobox items) should be recalculated here on each call 
-		print("updateFeatureList called: "+featureClass+"  filterFolderId="+str(filterFolderId))
+		self.queueOperation("add",{"lat":self.lat,"lon":self.lon,"title":self.getStreetLabel(),
+				"description":self.getDescription(),"symbol":self.markerSymbol,"folderName":folderName})
+
+	def markerAdded(self,sts,folderName,folderId,folders,rval):
+		log.debug("addMarker response: %s",rval)
+		if sts is not self.sts: # the map has changed since the request was made
+			return
+		if folders:
+			self.mergeFeatures("Folder",folders)
+		self.folderIdDict[folderName]=folderId
+		self.folderId=folderId
+
+	# queueOperation: record a marker operation in the outbox, then send it
+	#  (along with any older ones that are still waiting) if there is a link;
+	#  everything the operation needs from the window is read now, since the
+	#  fields may have changed by the time it is sent
+	def queueOperation(self,kind,params,markerId=None):
+		if not self.url:
+			warn=QMessageBox(QMessageBox.Warning,"Error","No map URL has been entered; the marker was not added. Enter the map URL in the options dialog first.",
+							QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+			warn.show()
+			warn.raise_()
+			warn.exec_()
+			return
+		self.outbox.add(kind,self.url,params,markerId)
+		self.sendOutbox()
+		self.updateOutboxState()
+
+	# sendOutbox: send the oldest operation in the outbox for the current map,
+	#  unless one is already being sent or there is no link; each operation is
+	#  only removed from the outbox once the server has accepted it, and then
+	#  the next one is sent, so operations are always sent in order.  (If the
+	#  server accepts an operation but the response is lost, it will be sent
+	#  again.)
+	def sendOutbox(self):
+		if self.outboxOp is not None or not (self.sts and self.link>0):
+			return
+		op=self.outbox.first(self.url)
+		if op is None:
+			return
+		self.outboxOp=op
+		sts=self.sts
+		params=op.params
+		if op.kind=="add":
+			fid=self.folderIdDict.get(params["folderName"])
+			since=self.since["Folder"]
+			self.request("Add marker '"+params["title"]+"'",lambda: addMarkerJob(sts,params,fid,since),
+					lambda rval: self.outboxSent(op,sts,rval),lambda msg: self.outboxFailed(op,msg))
+		else:
+			self.request("Move marker '"+params["title"]+"'",lambda: moveMarkerJob(sts,op.markerId,params),
+					lambda rval: self.outboxSent(op,sts,rval),lambda msg: self.outboxFailed(op,msg))
+
+	def outboxSent(self,op,sts,rval):
+		self.outbox.remove(op.opId)
+		self.outboxOp=None
+		self.outboxRetryDelay=outboxMinRetryDelay
+		if op.kind=="add":
+			self.markerAdded(sts,op.params["folderName"],*rval)
+		self.updateOutboxState()
+		self.sendOutbox()
+
+	# sessionFailed: try opening the map again later, backing off like
+	#  outboxFailed; the url is kept, so that markers are still queued for it
+	def sessionFailed(self,url,msg):
+		if url!=self.url or not self.connecting: # the url has changed again while connecting
+			return
+		log.warning("Could not open map %s (%s); trying again in %d seconds",url,msg,self.sessionRetryDelay)
+		self.sessionTimer.start(self.sessionRetryDelay*1000)
+		self.sessionRetryDelay=min(2*self.sessionRetryDelay,outboxMaxRetryDelay)
+
+	# outboxFailed: try again later, waiting twice as long after each
+	#  consecutive failure, up to outboxMaxRetryDelay
+	def outboxFailed(self,op,msg):
+		self.outboxOp=None
+		log.warning("Could not send queued operation (%s); trying again in %d seconds",msg,self.outboxRetryDelay)
+		self.outboxTimer.start(self.outboxRetryDelay*1000)
+		self.outboxRetryDelay=min(2*self.outboxRetryDelay,outboxMaxRetryDelay)
+		self.updateOutboxState()
+
+	# batchImport: place a marker for every address in a batch csv file (see
+	#  batch.py), in the selected folder and with the selected symbol; the
+	#  whole batch is one request, which makes several marker requests at a
+	#  time itself
+	def batchImport(self,fileName):
+		if not (self.sts and self.link>0):
+			warn=QMessageBox(QMessageBox.Warning,"Error","No map link has been established yet; cannot import "+fileName+".",
+							QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+			warn.show()
+			warn.raise_()
+			warn.exec_()
+			return
+		folderName=self.ui.folderComboBox.currentText()
+		if folderName=="Folder":
+			folderName="Addresses"
+		sts=self.sts
+		url=self.url
+		db=self.locationDb
+		fid=self.folderIdDict.get(folderName)
+		(symbol,description)=(self.markerSymbol,self.getDescription())
+		def job():
+			rows=readBatchCsv(fileName)
+			(resolved,unresolved)=resolveBatch(db,rows)
+			folderId=fid or findFolder(sts,folderName)
+			failed=placeMarkers(sts,resolved,folderId,symbol,description,progress=self.batchProgress.emit)
+			return (rows,resolved,unresolved,failed,folderId)
+		self.request("Import "+os.path.basename(fileName),job,
+				lambda r: self.batchImported(fileName,sts,url,folderName,symbol,description,*r))
+
+	def batchProgressChanged(self,done,total):
+		self.setWindowTitle(self.windowTitleBase+" - Import: "+str(done)+" of "+str(total)+" placed")
+
+	# batchImported: markers that could not be added go into the outbox, to be
+	#  sent again like any other, to the map they were imported to; addresses
+	#  that were not found are listed in a report file next to the batch file
+	def batchImported(self,fileName,sts,url,folderName,symbol,description,rows,resolved,unresolved,failed,folderId):
+		if sts is self.sts:
+			self.folderIdDict[folderName]=folderId
+		for r in failed:
+			self.outbox.add("add",url,{"lat":r.lat,"lon":r.lon,"title":r.title,
+					"description":r.description or description,"symbol":symbol,"folderName":folderName})
+		msg=str(len(resolved)-len(failed))+" of "+str(len(rows))+" addresses placed."
+		if failed:
+			msg+="\n"+str(len(failed))+" could not be sent now; they are in the outbox, to be sent again."
+		if unresolved:
+			reportName=os.path.splitext(fileName)[0]+"_unresolved.csv"
+			msg+="\n"+str(len(unresolved))+" addresses were not found"
+			try:
+				writeReport(reportName,unresolved)
+				msg+="; they are listed in "+reportName+"."
+			except OSError as e:
+				msg+=", and could not be listed in "+reportName+": "+str(e)
+		log.info("batch import: %s",msg)
+		box=QMessageBox(QMessageBox.Information,"Import",msg,
+						QMessageBox.Ok,self,Qt.WindowTitleHint|Qt.WindowCloseButtonHint|Qt.Dialog|Qt.MSWindowsFixedSizeDialogHint|Qt.WindowStaysOnTopHint)
+		box.show()
+		box.raise_()
+		box.exec_()
+		self.updateOutboxState()
+		self.sendOutbox()
+
+	def updateOutboxState(self):
+		self.outboxCount=self.outbox.count(self.url) if self.url else 0
+		self.updateWindowTitle()
+
+	# updateFeatureList: called when a combo box of the feature class is opened;
+	#  unless the features are being kept up to date in the background (see
+	#  syncFeatureLists), request any that have been added or changed since the
+	#  last update (the combo boxes show them as soon as the response arrives)
+	def updateFeatureList(self,featureClass):
+		log.debug("updateFeatureList called: %s",featureClass)
 		if self.sts and self.link>0:
-			rval=self.sts.getFeatures(featureClass,self.since[featureClass])
-			self.since[featureClass]=int(time.time()*1000) # sartopo wants integer milliseconds
-			
-			# update and sort the unfiltered list only if there are new features in rval;
-			#  note that old features may be returned from the API if their attributes have changed
-			#  (name, symbol, folder id, etc etc);
-			#  we want to make sure the unfiltered list always has the latest, so, if
-			#  a new version of an old object was returned by the API, first remove the old
-			#  version from the unfiltered list, then add the new version
-			if rval:
-				print("rval:"+str(rval))
-				for feature in rval:
-					# if there's a previous version of the same feature (based on ID only),
-					#  remove the previous version from the list
-					for oldFeature in self.featureListDict[featureClass]:
-						if feature["id"]==oldFeature["id"]:
-							self.featureListDict[featureClass].remove(oldFeature)
-					self.featureListDict[featureClass].append(feature)
-				self.featureListDict[featureClass].sort(key=sortByTitle)
-				
-			# recreate the filtered list regardless of whether there were new features in rval    
-			items=[]
-			for feature in self.featureListDict[featureClass]:
-				id=feature.get("id",0)
-				prop=feature.get("properties",{})
-				name=prop.get("title","UNNAMED")
-				add=True
-				if filterFolderId:
-					fid=prop.get("folderId",0)
-					if fid!=filterFolderId:
-						add=False
-						print("      filtering out feature:"+str(id))
-				if add:
-					print("    adding feature:"+str(id))
-					if featureClass=="Folder":
-						items.append([name,id])
-					else:
-						items.append([name,[id,prop]])
-			else:
-				print("no return data, i.e. no new features of this class since the last check")
+			if not self.syncTimer.isActive():
+				self.requestFeatureList(featureClass)
 		else:
-			print("No map link has been established yet.  Could not get Folder objects.")
-			self.featureListDict[featureClass]=[]
+			log.debug("No map link has been established yet.  Could not get %s objects.",featureClass)
+			self.featureListModels[featureClass].clear()
+			self.featureListPending[featureClass]=False
 			self.since[featureClass]=0
-			items=[]
-		print("  unfiltered list:"+str(self.featureListDict[featureClass]))
-		print("  filtered list:"+str(items))
-		
-		# add custom default folder at start of list if needed
-		
-		# update the specified combo box's items
-		for w in self.featureListWidgetsToUpdate[featureClass]:
-			print("updating "+str(w.objectName()))
-			w.setItems(items)
-		
+			if featureClass=="Folder":
+				self.folderIdDict={}
+
+	# requestFeatureList: request the features of the class that have been added
+	#  or changed since the last request, unless a request is already pending
+	def requestFeatureList(self,featureClass):
+		if self.featureListPending[featureClass]:
+			return
+		sts=self.sts
+		since=self.since[featureClass]
+		self.since[featureClass]=int(time.time()*1000) # sartopo wants integer milliseconds
+		self.featureListPending[featureClass]=True
+		def failed(msg):
+			self.featureListPending[featureClass]=False
+			self.since[featureClass]=since # get the same features again next time
+		self.request("Get "+featureClass+" list",lambda: sts.getFeatures(featureClass,since),
+				lambda rval: self.featureListReceived(featureClass,sts,rval),failed)
+
+	# syncFeatureLists: called every syncInterval seconds while there is a link
+	#  (if syncInterval is 0, the lists are only requested when a combo box is
+	#  opened); only the changes since the last request are sent by the server,
+	#  so this costs little when nothing has changed
+	def syncFeatureLists(self):
+		if self.sts and self.link>0:
+			for featureClass in self.featureListDict:
+				self.requestFeatureList(featureClass)
+
+	def featureListReceived(self,featureClass,sts,rval):
+		if sts is not self.sts: # the map has changed since the request was made
+			return
+		self.featureListPending[featureClass]=False
+		if rval:
+			self.mergeFeatures(featureClass,rval)
+		else:
+			log.debug("no new %s features since the last check",featureClass)
+
+	# mergeFeatures: update the unfiltered list with new features;
+	#  note that old features may be returned from the API if their attributes have changed
+	#  (name, symbol, folder id, etc etc);
+	#  we want to make sure the unfiltered list always has the latest, so a new
+	#  version of an old object replaces the old version (see FeatureList); the
+	#  merge is made through the model, which updates the combo boxes
+	def mergeFeatures(self,featureClass,rval):
+		log.debug("merging %d new or changed %s features",len(rval),featureClass)
+		if featureClass=="Folder":
+			for feature in rval:
+				# forget the old title of a renamed folder
+				old=self.featureListDict[featureClass].get(feature["id"])
+				if old is not None and self.folderIdDict.get(featureTitle(old))==feature["id"]:
+					del self.folderIdDict[featureTitle(old)]
+				self.folderIdDict[featureTitle(feature)]=feature["id"]
+		self.featureListModels[featureClass].merge(rval)
+
 	def editMarker(self):
 		name=self.ui.existingMarkerComboBox.currentText()
 		data=self.ui.existingMarkerComboBox.currentData()
 		id=data[0]
 		prop=data[1]
-		print("editMarker called: selection="+name+"  id="+id)
+		log.debug("editMarker called: selection=%s  id=%s",name,id)
 		# now set current index to -1 so that subsequent focus action will trigger
 		#  populateComboBox again (from the highlighted slot)
 		fid=prop.get("folderId",None)
 		symbol=prop.get("marker-symbol","point")
-		self.sts.addMarker(self.lat,self.lon,name,description=self.getDescription(),symbol=symbol,folderId=fid,existingId=id)
+		self.queueOperation("move",{"lat":self.lat,"lon":self.lon,"title":name,
+				"description":self.getDescription(),"symbol":symbol,"folderId":fid},id)
 		self.ui.existingMarkerComboBox.setCurrentIndex(0)
-		
+
+	# request: run a sartopo request (fn, which is called with no arguments) in
+	#  the request worker thread; when it is done, onSuccess is called with
+	#  its return value, or onFailure with the error message; the state of
+	#  each request is shown by the link indicator and the window title
+	def request(self,description,fn,onSuccess=None,onFailure=None):
+		log.debug("request: %s",description)
+		jobId=self.requestWorker.submit(fn)
+		self.requests[jobId]=[description,onSuccess,onFailure]
+		self.showRequestState(description,"pending")
+
+	def requestFinished(self,jobId,rval):
+		(description,onSuccess,onFailure)=self.requests.pop(jobId)
+		self.showRequestState(description,"done")
+		if onSuccess:
+			onSuccess(rval)
+
+	def requestFailed(self,jobId,msg):
+		(description,onSuccess,onFailure)=self.requests.pop(jobId)
+		log.warning("request failed: %s: %s",description,msg)
+		self.showRequestState(description,"failed: "+msg)
+		if onFailure:
+			onFailure(msg)
+
+	def showRequestState(self,description,state):
+		self.lastRequestDescription=description
+		self.lastRequestState=state
+		self.updateWindowTitle()
+
+	# updateWindowTitle: show the state of the latest request and the number
+	#  of operations in the outbox in the window title, and update the link
+	#  indicator to match
+	def updateWindowTitle(self):
+		text=""
+		if self.lastRequestDescription:
+			text=self.lastRequestDescription+": "+self.lastRequestState
+			if self.lastRequestState!="pending" and self.requests:
+				text+="  ("+str(len(self.requests))+" more pending)"
+		if self.outboxCount:
+			text+="  ("+str(self.outboxCount)+" in outbox)"
+		self.setWindowTitle(self.windowTitleBase+(" - "+text.strip() if text else ""))
+		self.updateLinkIndicator()
+
 	def closeEvent(self,event):
 		self.saveRcFile()
 		event.accept()
+		self.shutDown()
+
+	# shutDown: stop the timers and worker threads, and quit the application
+	def shutDown(self):
+		self.syncTimer.stop()
+		self.sessionTimer.stop()
+		self.locationFileTimer.stop()
+		self.markerFileTimer.stop()
+		self.requestWorker.stop()
+		self.requestWorker.wait(1000)
+		self.addressSearcher.stop()
+		self.addressSearcher.wait(1000)
+		self.outbox.close()
 		self.parent.quit()
 		
 	def modeChanged(self):
 		self.mode=self.ui.modeComboBox.currentText()
-		print("mode changed to '"+self.mode+"'")
+		log.debug("mode changed to '%s'",self.mode)
 		if self.mode=="Add":
 			showAddFields=True
 			showMoveFields=False
@@ -633,14 +1167,20 @@ class MyWindow(QDialog,Ui_Dialog):
 		self.goButtonSetEnabled()
 		box=self.ui.existingMarkerComboBox
 		data=box.currentData()
+		# the index also changes when features are added or removed above the
+		#  selected one (e.g. by the background sync); that isn't a new selection,
+		#  and shouldn't reset the comment
+		selection=(box.currentText(),data[0] if data is not None else None)
+		if selection==self.existingMarkerSelection:
+			return
+		self.existingMarkerSelection=selection
 		self.ui.commentField.setText("")
-		print("Existing marker selected:"+str(box.currentText()))		
+		log.debug("Existing marker selected: %s",box.currentText())
 		if data is not None:
 			try:
-				print("  data:"+str(box.currentData()))
-				print("    json:"+str(box.currentData()[1]))
-				self.previousComment=box.currentData()[1]["description"]
-				print("  comment:"+str(self.previousComment))
+				log.debug("  data: %s",data)
+				self.previousComment=data[1]["description"]
+				log.debug("  comment: %s",self.previousComment)
 				self.updateComment()
 			except:
 				pass
@@ -684,7 +1224,7 @@ class optionsDialog(QDialog,Ui_optionsDialog):
 		self.setFixedSize(self.size())
 		self.ui.folderComboBox.featureClass="Folder"
 		self.ui.folderComboBox.headerText="Select a Folder..."
-		self.ui.folderComboBox.setItems([])
+		self.ui.folderComboBox.setFeatureModel(self.parent.featureListModels["Folder"])
 
 	def showEvent(self,event):
 		# clear focus from all fields, otherwise previously edited field gets focus on next show,
@@ -697,13 +1237,9 @@ class optionsDialog(QDialog,Ui_optionsDialog):
 		self.ui.accountNameField.setText(self.parent.accountName)
 		self.ui.urlField.setFocus()
 	
-	def updateFeatureList(self,featureClass,filterFolderId):
-		self.parent.updateFeatureList(featureClass,filterFolderId)
+	def updateFeatureList(self,featureClass):
+		self.parent.updateFeatureList(featureClass)
 		
-	def displayLocationCount(self):
-		self.ui.locationCountLabel.setText(str(len(self.parent.addrTable))+" locations loaded")
-		self.parent.ui.locationCountLabel.setText(str(len(self.parent.addrTable))+" locations loaded")
-
 	def browseForMarkerFile(self):
 		fileDialog=QFileDialog()
 		fileDialog.setOption(QFileDialog.DontUseNativeDialog)
@@ -715,6 +1251,7 @@ class optionsDialog(QDialog,Ui_optionsDialog):
 			fileName=fileDialog.selectedFiles()[0]
 			self.ui.markerFileField.setText(fileName)
 			self.parent.markerFileName=fileName
+			self.parent.watchFiles()
 		else: # user pressed cancel on the file browser dialog
 			return
 
@@ -723,19 +1260,28 @@ class optionsDialog(QDialog,Ui_optionsDialog):
 		fileDialog.setOption(QFileDialog.DontUseNativeDialog)
 		fileDialog.setWindowFlags(Qt.WindowStaysOnTopHint)
 #         fileDialog.setProxyModel(CSVFileSortFilterProxyModel(self))
-		fileDialog.setNameFilter("CSV Location Lookup Files (*.csv)")
+		fileDialog.setNameFilters(["CSV Location Lookup Files (*.csv)","Location Catalogs (*.txt)"])
 #         fileDialog.setDirectory(self.firstWorkingDir)
 		if fileDialog.exec_():
 			fileName=fileDialog.selectedFiles()[0]
 			self.ui.locationFileField.setText(fileName)
 			self.parent.locationFileName=fileName
+			self.parent.watchFiles()
 		else: # user pressed cancel on the file browser dialog
 			return
 		
 	def reload(self):
-#         self.parent.addrTable=[[]]
 		self.parent.buildTableFromCsv(self.ui.locationFileField.text())
-		self.displayLocationCount()
+
+	def browseForBatchFile(self):
+		fileDialog=QFileDialog()
+		fileDialog.setOption(QFileDialog.DontUseNativeDialog)
+		fileDialog.setWindowFlags(Qt.WindowStaysOnTopHint)
+		fileDialog.setNameFilter("CSV Address List Files (*.csv)")
+		if fileDialog.exec_():
+			self.parent.batchImport(fileDialog.selectedFiles()[0])
+		else: # user pressed cancel on the file browser dialog
+			return
 	
 	def urlEditingFinished(self):
 		url=self.ui.urlField.text()
@@ -771,6 +1317,7 @@ class optionsDialog(QDialog,Ui_optionsDialog):
 			warn.exec_()
 			return
 		self.parent.markerFileName=mf
+		self.parent.watchFiles()
 
 	def locationFileEditingFinished(self):
 		lf=self.ui.locationFileField.text()
@@ -782,40 +1329,241 @@ class optionsDialog(QDialog,Ui_optionsDialog):
 			warn.exec_()
 			return
 		self.parent.locationFileName=lf
+		self.parent.watchFiles()
 		
 		
-class MyTableModel(QAbstractTableModel):
-	def __init__(self, datain, parent=None, *args):
-		QAbstractTableModel.__init__(self, parent, *args)
-		self.arraydata=datain
+# AddressCompletionModel: list model of the keys in a LocationCatalog whose
+#  text starts with the current prefix; the matching range of each source is
+#  found by binary search in its sorted store, and keys are only decoded when
+#  the completer's popup actually displays them, so no list of strings is ever
+#  built (except to merge the ranges of several sources into one sorted list,
+#  when there are no more than mergeLimit matches in all);
+#  alternatively, the model can hold an explicit list of rows (e.g. the
+#  results of a word, fuzzy, or nearest-address search) until the next
+#  setPrefix, optionally with a note to show next to each one in the popup
+class AddressCompletionModel(QAbstractListModel):
+	minRows=50 # see lookupFromAddrField
+	mergeLimit=2000
+	def __init__(self,db,parent=None):
+		QAbstractListModel.__init__(self,parent)
+		self.db=db
+		self.prefix=""
+		self.ranges=db.prefixRanges("")
+		self.merged=None # rows of the ranges in key order, if merged
+		self.rows=None
+		self.notes=None
 
-	def rowCount(self, parent):
-		return len(self.arraydata)
+	def setDatabase(self,db):
+		self.beginResetModel()
+		self.db=db
+		self.setRanges(db.prefixRanges(self.prefix))
+		self.rows=None
+		self.notes=None
+		self.endResetModel()
 
-	def columnCount(self, parent):
-		return len(self.arraydata[0])
+	def setPrefix(self,prefix):
+		ranges=self.db.prefixRanges(prefix)
+		self.prefix=prefix
+		if ranges==self.ranges and self.rows is None:
+			return
+		self.beginResetModel()
+		self.setRanges(ranges)
+		self.rows=None
+		self.notes=None
+		self.endResetModel()
 
-	def data(self, index, role):
-		if not index.isValid():
-			return QVariant()
-		elif role != Qt.EditRole:
+	def setRanges(self,ranges):
+		self.ranges=ranges
+		self.merged=None
+		if len(ranges)>1 and sum(hi-lo for (lo,hi) in ranges)<=self.mergeLimit:
+			self.merged=list(heapq.merge(*(range(lo,hi) for (lo,hi) in ranges),key=lambda r: self.db.key(r).lower()))
+
+	# rangeRows: the rows of the prefix matches, in the order they are listed
+	def rangeRows(self):
+		if self.merged is not None:
+			return self.merged
+		return [r for (lo,hi) in self.ranges for r in range(lo,hi)]
+
+	# rangeRow: the row at position k of the prefix matches
+	def rangeRow(self,k):
+		if self.merged is not None:
+			return self.merged[k]
+		for (lo,hi) in self.ranges:
+			if k<hi-lo:
+				return lo+k
+			k-=hi-lo
+
+	def setRows(self,rows,notes=None):
+		self.beginResetModel()
+		self.rows=rows
+		self.notes=notes
+		self.endResetModel()
+
+	# extendRows: add rows after the current prefix matches, skipping any
+	#  that are already in the list
+	def extendRows(self,rows):
+		if not rows:
+			return
+		current=self.rows if self.rows is not None else self.rangeRows()
+		currentSet=set(current)
+		self.setRows(list(current)+[r for r in rows if r not in currentSet])
+
+	def rowCount(self,parent=QModelIndex()):
+		if parent.isValid():
+			return 0
+		if self.rows is not None:
+			return len(self.rows)
+		return sum(hi-lo for (lo,hi) in self.ranges)
+
+	def data(self,index,role=Qt.DisplayRole):
+		if not index.isValid() or role not in (Qt.DisplayRole,Qt.EditRole):
 			return QVariant()
+		if self.rows is not None:
+			key=self.db.key(self.rows[index.row()])
+			# the note is only displayed; the completer inserts the EditRole text
+			if self.notes is not None and role==Qt.DisplayRole:
+				return key+"  ("+self.notes[index.row()]+")"
+			return key
+		return self.db.key(self.rangeRow(index.row()))
+
+
+# SartopoWorker: make sartopo requests in a background thread, one at a time
+#  and in the order they were submitted; each job is a function that is
+#  called with no arguments in the worker thread, and its outcome is handed
+#  back to the GUI thread by the jobFinished (job id and return value) or
+#  jobFailed (job id and error message) signal
+class SartopoWorker(QThread):
+	jobFinished=pyqtSignal(int,object)
+	jobFailed=pyqtSignal(int,str)
+
+	def __init__(self):
+		QThread.__init__(self)
+		self.jobQueue=queue.Queue()
+		self.nextJobId=1
+
+	# submit: queue the job, and return its job id
+	def submit(self,fn):
+		jobId=self.nextJobId
+		self.nextJobId+=1
+		self.jobQueue.put((jobId,fn))
+		return jobId
+
+	# stop: end the thread after any jobs that are already queued
+	def stop(self):
+		self.jobQueue.put(None)
+
+	def run(self):
+		while True:
+			job=self.jobQueue.get()
+			if job is None:
+				return
+			(jobId,fn)=job
+			try:
+				rval=fn()
+			except BaseException as e: # see requestError
+				if not requestError(e):
+					raise
+				self.jobFailed.emit(jobId,str(e) or type(e).__name__)
+				continue
+			self.jobFinished.emit(jobId,rval)
+
+# AddressSearcher: run address searches in a background thread; only the
+#  latest search that was submitted is made, since any earlier ones are for
+#  text that has since changed, and its result is handed back to the GUI
+#  thread by the found signal, along with the text that was searched for
+class AddressSearcher(QThread):
+	found=pyqtSignal(str,object)
+
+	def __init__(self):
+		QThread.__init__(self)
+		self.searchQueue=queue.Queue()
+
+	# search: queue a search for text; fn is called with the text in the
+	#  search thread, and returns the result
+	def search(self,text,fn):
+		self.searchQueue.put((text,fn))
+
+	# stop: end the thread after the search in progress, if any
+	def stop(self):
+		self.searchQueue.put(None)
+
+	def run(self):
+		while True:
+			job=self.searchQueue.get()
+			while job is not None and not self.searchQueue.empty():
+				job=self.searchQueue.get()
+			if job is None:
+				return
+			(text,fn)=job
+			try:
+				rval=fn(text)
+			except Exception as e:
+				log.warning("Address search for '%s' failed: %s",text,e)
+				continue
+			self.found.emit(text,rval)
+
+# LocationLoader: read the location table (and build its lookup indexes) in a
+#  background thread, so that the window is usable while a large location
+#  file is loading; the results are handed back to the GUI thread by signals:
+#  loaded (with the LocationCatalog of all of the sources) as soon as exact
+#  and prefix lookups can be done, then indexLoaded (with the LocationDatabase
+#  of one source) as each of the (slower to build) spatial, word, and fuzzy
+#  search indexes is ready.  Each source is loaded separately, from its own
+#  caches, so a source that can't be read is left out, and the others are
+#  still loaded; the databases of the previous catalog are used again for
+#  the sources that haven't changed, and patched for those that have.
+class LocationLoader(QThread):
+	progress=pyqtSignal(int)
+	loaded=pyqtSignal(object,bool)
+	indexLoaded=pyqtSignal(object,str,object)
+	failed=pyqtSignal(str,str)
+
+	def __init__(self,fileName,previous):
+		QThread.__init__(self)
+		self.fileName=fileName
+		self.previous=previous
+
+	def run(self):
 		try:
-			rval=QVariant(self.arraydata[index.row()][index.column()])
-		except:
-			row=index.row()
-			col=index.column()
-			rprint("Row="+str(row)+" Col="+str(col))
-			rprint("arraydata:")
-			rprint(self.arraydata)
-		else:
-			return rval
-		
-		
+			sources=locationSources(self.fileName)
+		except Exception as e:
+			self.failed.emit(self.fileName,str(e))
+			return
+		databases=[]
+		allCached=True
+		for source in sources:
+			done=sum(db.addressCount for db in databases)
+			try:
+				sourceDatabases,cached=loadLocationSource(source,self.previous.sourceDatabases(source),
+						lambda n: self.progress.emit(done+n))
+			except Exception as e:
+				self.failed.emit(source,str(e))
+				continue
+			databases+=sourceDatabases
+			allCached=allCached and cached
+		if not databases:
+			if not sources:
+				self.failed.emit(self.fileName,"no location files are enabled")
+			return
+		self.loaded.emit(LocationCatalog(databases),allCached)
+		for name in indexNames:
+			for db in databases:
+				if getattr(db,name) is not None: # already loaded, or built with a patch
+					continue
+				try:
+					for (name,index) in loadIndexes(db.fileName,db.store,(name,)):
+						self.indexLoaded.emit(db,name,index)
+				except Exception as e:
+					log.warning("Could not build %s for %s: %s",name,db.fileName,e)
+
+
 def main():
 	app = QApplication(sys.argv)
+	startupStep("application created")
 	w = MyWindow(app)
+	startupStep("window created")
 	w.show()
+	QTimer.singleShot(0,lambda: startupStep("window shown"))
 	sys.exit(app.exec_())
 
 if __name__ == '__main__':
@@ -0,0 +1,181 @@
+#  sartopo_address_cli.py - command line interface, for use without the GUI
+#   (and without PyQt); run as
+#     python sartopo_address.py <command> [options]
+#   where command is one of the commands below; see
+#     python sartopo_address.py <command> -h
+
+#  lookup: print the location of each address given on the command line (or,
+#   if none are given, of each line read from stdin), as tab-separated
+#     query, address, lat, lon, match
+#   where match is 'exact'; or 'nearest' followed by the distance in meters,
+#   for a query that is a pair of coordinates (the --nearest closest addresses
+#   are printed); or, for a query that isn't an exact match, 'word' or 'fuzzy',
+#   for each of up to --suggest candidates, best first, or else 'not found'
+#   with the address, lat, and lon left empty.  With --json, one json object
+#   per query is printed instead.  The exit status is 0 only if every query
+#   was found.  The location table is mapped from its cache, and the other
+#   indexes are only loaded if a query needs them, so a lookup takes a small
+#   fraction of a second.  The location file can also be a catalog of several
+#   location files (see location_db.py); each of them is searched.
+
+#  batch: place a marker for every address in a batch csv file (see batch.py);
+#   progress and the summary are written to stderr, and the rows that were not
+#   placed are written to a report file, so the exit status is 0 only if every
+#   row was placed
+
+#  settings that the GUI saves in its rc file (the location file and the
+#   account name) are used as defaults.
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+from log_setup import setupLogging
+from location_db import openLocationCatalog,loadIndexes,parseLatLon
+import batch
+
+rcFileName="sartopo_address.rc"
+defaultLocationFileName="sartopo_address.csv"
+
+# readRcFile: the settings saved by the GUI, as a dict; empty if the file
+#  can't be read
+def readRcFile(fileName=rcFileName):
+	settings={}
+	try:
+		with open(fileName,'r') as rcFile:
+			if rcFile.readline().strip()!="[sartopo_address]":
+				return settings
+			for line in rcFile:
+				tokens=line.rstrip("\n").split("=",1)
+				if len(tokens)==2:
+					settings[tokens[0]]=tokens[1]
+	except OSError:
+		pass
+	return settings
+
+# needIndex: attach the named index to each source database of the catalog,
+#  if it isn't already
+def needIndex(catalog,name):
+	for db in catalog.databases:
+		if getattr(db,name) is None:
+			for (name,index) in loadIndexes(db.fileName,db.store,(name,)):
+				setattr(db,name,index)
+
+# lookupMatches: the list of (row,match,distance) for the query, where
+#  distance is None unless match is 'nearest'; see lookup above
+def lookupMatches(db,query,suggest,nearest):
+	point=parseLatLon(query)
+	if point is not None:
+		needIndex(db,"spatialIndex")
+		return [(r,"nearest",int(round(d))) for (r,d) in db.nearest(point[0],point[1],nearest)]
+	i=db.lookup(query)
+	if i is not None:
+		return [(i,"exact",None)]
+	matches=[]
+	if suggest>0:
+		needIndex(db,"tokenIndex")
+		matches=[(r,"word",None) for r in db.tokenSearch(query,suggest)]
+		if len(matches)<suggest:
+			needIndex(db,"fuzzyIndex")
+			rows={r for (r,m,d) in matches}
+			matches+=[(r,"fuzzy",None) for r in db.fuzzySearch(query,suggest) if r not in rows]
+	return matches[:suggest]
+
+def lookupCommand(args):
+	db=openLocationCatalog(args.locations)
+	queries=args.queries or (line.strip() for line in sys.stdin)
+	found=True
+	for query in queries:
+		if not query:
+			continue
+		matches=lookupMatches(db,query,args.suggest,args.nearest)
+		found=found and bool(matches) and matches[0][1] in ("exact","nearest")
+		if args.json:
+			print(json.dumps({"query":query,"matches":[{"address":db.key(r),"lat":db.lat(r),
+					"lon":db.lon(r),"match":m,"distance":d} for (r,m,d) in matches]}))
+			continue
+		if not matches:
+			print(query+"\t\t\t\tnot found")
+		for (r,m,d) in matches:
+			if d is not None:
+				m+=" "+str(d)
+			print(query+"\t"+db.key(r)+"\t"+str(db.lat(r))+"\t"+str(db.lon(r))+"\t"+m)
+		sys.stdout.flush()
+	return 0 if found else 1
+
+def printProgress(done,total):
+	print("\rplaced "+str(done)+" of "+str(total),end="\n" if done==total else "",file=sys.stderr,flush=True)
+
+def batchCommand(args):
+	db=openLocationCatalog(args.locations,() if args.no_suggestions else ("fuzzyIndex",))
+	rows=batch.readBatchCsv(args.file)
+	(resolved,unresolved)=batch.resolveBatch(db,rows)
+	print(str(len(resolved))+" of "+str(len(rows))+" addresses found",file=sys.stderr)
+	failed=[]
+	if args.dry_run:
+		for r in resolved:
+			print(r.address+"\t"+str(r.lat)+"\t"+str(r.lon)+"\t"+r.title)
+	else:
+		try:
+			sts=batch.openSession(args.url,args.account)
+			folderId=batch.findFolder(sts,args.folder)
+		except BaseException as e:
+			if not batch.requestError(e):
+				raise
+			print("Could not open the map at "+args.url+": "+(str(e) or type(e).__name__),file=sys.stderr)
+			return 2
+		failed=batch.placeMarkers(sts,resolved,folderId,args.symbol,args.description,args.workers,printProgress)
+		print(str(len(resolved)-len(failed))+" markers placed",file=sys.stderr)
+	notPlaced=sorted(unresolved+failed,key=lambda r: r.lineNumber)
+	for r in notPlaced:
+		problem=r.error if r.error else "not found"+(" (did you mean "+r.suggestion+"?)" if r.suggestion else "")
+		print("line "+str(r.lineNumber)+": "+r.address+": "+problem,file=sys.stderr)
+	if notPlaced:
+		reportName=args.report or os.path.splitext(args.file)[0]+"_unresolved.csv"
+		batch.writeReport(reportName,notPlaced)
+		print(str(len(notPlaced))+" rows not placed; see "+reportName,file=sys.stderr)
+		return 1
+	return 0
+
+def makeParser():
+	settings=readRcFile()
+	parser=argparse.ArgumentParser(prog="sartopo_address")
+	subparsers=parser.add_subparsers(dest="command",required=True)
+	p=subparsers.add_parser("lookup",help="print the location of addresses, or the addresses nearest to coordinates")
+	p.add_argument("queries",nargs="*",help="addresses or coordinates to look up (default: one per line from stdin)")
+	p.add_argument("--locations",default=settings.get("locationFileName",defaultLocationFileName),help="location lookup file (.csv), or catalog of location files (.txt)")
+	p.add_argument("--suggest",type=int,default=0,help="number of close matches to print for a query that isn't found exactly")
+	p.add_argument("--nearest",type=int,default=1,help="number of addresses to print for coordinates")
+	p.add_argument("--json",action="store_true",help="print one json object per query")
+	p.set_defaults(func=lookupCommand)
+	p=subparsers.add_parser("batch",help="place a marker for every address in a csv file")
+	p.add_argument("file",help="csv file with the address in the first column and, optionally, the marker description in the second")
+	p.add_argument("--url",help="map URL (required unless --dry-run)")
+	p.add_argument("--account",default=settings.get("accountName",""),help="sartopo.com account name")
+	p.add_argument("--locations",default=settings.get("locationFileName",defaultLocationFileName),help="location lookup file (.csv), or catalog of location files (.txt)")
+	p.add_argument("--folder",default="Addresses",help="folder for the markers (made if needed)")
+	p.add_argument("--symbol",default="point",help="marker symbol")
+	p.add_argument("--description",help="marker description, for rows that don't have one")
+	p.add_argument("--workers",type=int,default=batch.maxConcurrentRequests,help="maximum number of requests at a time")
+	p.add_argument("--report",help="file for the rows that were not placed (default: <file>_unresolved.csv)")
+	p.add_argument("--no-suggestions",action="store_true",help="don't suggest the closest address for rows that aren't found")
+	p.add_argument("--dry-run",action="store_true",help="only resolve the addresses, and print them; don't place any markers")
+	p.set_defaults(func=batchCommand)
+	return parser
+
+commands=("lookup","batch")
+
+def main(argv=None):
+	# stdout is for results only; diagnostics go to stderr, and only warnings
+	#  unless more are asked for (see log_setup.py)
+	setupLogging(logging.WARNING)
+	parser=makeParser()
+	args=parser.parse_args(argv)
+	if args.command=="batch" and not args.dry_run and not args.url:
+		parser.error("--url is required unless --dry-run is given")
+	return args.func(args)
+
+if __name__=='__main__':
+	sys.exit(main())
@@ -2,2488 +2,13 @@
 
 # Resource object code
 #
-# Created by: The Resource Compiler for PyQt5 (Qt v5.11.1)
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
 #
 # WARNING! All changes made in this file will be lost!
 
 from PyQt5 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x9a\x8f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x09\x29\x00\x00\x09\x60\x08\x03\x00\x00\x00\x59\x3c\xd0\x36\
-\x00\x00\x00\x03\x73\x42\x49\x54\x08\x08\x08\xdb\xe1\x4f\xe0\x00\
-\x00\x00\x09\x70\x48\x59\x73\x00\x02\x55\x30\x00\x02\x55\x30\x01\
-\xc2\xef\xc2\x47\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\x66\x74\
-\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\x61\x70\
-\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x11\x74\x45\x58\
-\x74\x54\x69\x74\x6c\x65\x00\x52\x65\x6c\x6f\x61\x64\x20\x69\x63\
-\x6f\x6e\x8b\xad\x6a\x24\x00\x00\x00\x0f\x74\x45\x58\x74\x41\x75\
-\x74\x68\x6f\x72\x00\x6d\x6c\x61\x6d\x70\x72\x65\x74\x1c\x9c\xb4\
-\x2a\x00\x00\x00\x28\x74\x45\x58\x74\x44\x65\x73\x63\x72\x69\x70\
-\x74\x69\x6f\x6e\x00\x73\x69\x6d\x70\x6c\x65\x20\x72\x65\x6c\x6f\
-\x61\x64\x20\x2f\x20\x72\x65\x63\x79\x63\x6c\x65\x20\x69\x63\x6f\
-\x6e\x15\xec\xa4\x00\x00\x00\x00\x21\x74\x45\x58\x74\x43\x72\x65\
-\x61\x74\x69\x6f\x6e\x20\x54\x69\x6d\x65\x00\x32\x30\x31\x32\x2d\
-\x30\x37\x2d\x30\x36\x54\x31\x34\x3a\x33\x30\x3a\x31\x35\xdd\xd0\
-\xbf\x11\x00\x00\x00\x4b\x74\x45\x58\x74\x53\x6f\x75\x72\x63\x65\
-\x00\x68\x74\x74\x70\x73\x3a\x2f\x2f\x6f\x70\x65\x6e\x63\x6c\x69\
-\x70\x61\x72\x74\x2e\x6f\x72\x67\x2f\x64\x65\x74\x61\x69\x6c\x2f\
-\x31\x37\x31\x30\x37\x34\x2f\x72\x65\x6c\x6f\x61\x64\x2d\x69\x63\
-\x6f\x6e\x2d\x62\x79\x2d\x6d\x6c\x61\x6d\x70\x72\x65\x74\x2d\x31\
-\x37\x31\x30\x37\x34\x8e\xb9\xa8\x7c\x00\x00\x00\x58\x74\x45\x58\
-\x74\x43\x6f\x70\x79\x72\x69\x67\x68\x74\x00\x43\x43\x30\x20\x50\
-\x75\x62\x6c\x69\x63\x20\x44\x6f\x6d\x61\x69\x6e\x20\x44\x65\x64\
-\x69\x63\x61\x74\x69\x6f\x6e\x20\x68\x74\x74\x70\x3a\x2f\x2f\x63\
-\x72\x65\x61\x74\x69\x76\x65\x63\x6f\x6d\x6d\x6f\x6e\x73\x2e\x6f\
-\x72\x67\x2f\x70\x75\x62\x6c\x69\x63\x64\x6f\x6d\x61\x69\x6e\x2f\
-\x7a\x65\x72\x6f\x2f\x31\x2e\x30\x2f\xc6\xe3\xbd\xf9\x00\x00\x03\
-\x00\x50\x4c\x54\x45\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xb3\x30\xf4\x88\x00\x00\x00\xff\x74\x52\x4e\
-\x53\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e\
-\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19\x1a\x1b\x1c\x1d\x1e\
-\x1f\x20\x21\x22\x23\x24\x25\x26\x27\x28\x29\x2a\x2b\x2c\x2d\x2e\
-\x2f\x30\x31\x32\x33\x34\x35\x36\x37\x38\x39\x3a\x3b\x3c\x3d\x3e\
-\x3f\x40\x41\x42\x43\x44\x45\x46\x47\x48\x49\x4a\x4b\x4c\x4d\x4e\
-\x4f\x50\x51\x52\x53\x54\x55\x56\x57\x58\x59\x5a\x5b\x5c\x5d\x5e\
-\x5f\x60\x61\x62\x63\x64\x65\x66\x67\x68\x69\x6a\x6b\x6c\x6d\x6e\
-\x6f\x70\x71\x72\x73\x74\x75\x76\x77\x78\x79\x7a\x7b\x7c\x7d\x7e\
-\x7f\x80\x81\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x8b\x8c\x8d\x8e\
-\x8f\x90\x91\x92\x93\x94\x95\x96\x97\x98\x99\x9a\x9b\x9c\x9d\x9e\
-\x9f\xa0\xa1\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xab\xac\xad\xae\
-\xaf\xb0\xb1\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xbb\xbc\xbd\xbe\
-\xbf\xc0\xc1\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xcb\xcc\xcd\xce\
-\xcf\xd0\xd1\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xdb\xdc\xdd\xde\
-\xdf\xe0\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xeb\xec\xed\xee\
-\xef\xf0\xf1\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xfb\xfc\xfd\xfe\
-\xeb\x08\xd9\x35\x00\x00\x94\xa2\x49\x44\x41\x54\x18\x19\xec\xc1\
-\x09\x7c\xdf\x05\x7d\xff\xf1\xf7\x2f\x47\xd3\xbb\xf4\xa2\xd0\x96\
-\x2b\xf4\x40\xe4\x6c\x05\x11\xca\xa1\x74\x20\x47\x70\x2a\x15\x15\
-\x88\xb2\x41\x14\x8f\x65\x9b\x47\x36\x9d\x33\xba\xf9\xdf\x6f\xba\
-\x87\x9a\xcd\xa9\x19\x22\x52\x3c\x20\x22\x87\x05\x45\xc2\x25\x56\
-\x28\x50\x40\xa0\xfd\x14\x85\x96\xbb\xa5\x2d\xbd\xcf\xa4\xc9\xef\
-\xf3\x07\x44\x28\x6d\xd2\xfc\xce\xef\xf9\x7a\x3e\x05\x00\x00\x80\
-\x3e\x8d\xf9\xb6\x00\x00\x00\xd0\x97\x23\x97\x9a\x00\x00\x00\xd0\
-\x87\x0f\x6d\x71\x13\x00\x00\x00\x76\x53\x93\x75\x77\x13\x00\x00\
-\x00\x76\x35\xee\x36\x7f\x99\x09\x00\x00\x00\xbb\x38\xfa\x29\x7f\
-\x85\x09\x00\x00\x00\x6f\x76\xc1\x56\x7f\x95\x09\x00\x00\x00\x3b\
-\xab\xc9\xfa\x6b\x4c\x00\x00\x00\xd8\xc9\xf8\x3b\xfd\x2f\x4c\x00\
-\x00\x00\x78\xc3\xf1\xcb\xfd\x75\x26\x00\x00\x00\xbc\xae\xa9\xcb\
-\xdf\x60\x02\x00\x00\xc0\x6b\xea\x2e\xf3\x9d\x99\x00\x00\x00\xf0\
-\x67\x93\x16\xf8\x9b\x98\x00\x00\x00\xf0\xaa\x13\x57\xf8\x9b\x99\
-\x00\x00\x00\xf0\x8a\xa6\x6e\xdf\x85\x09\x00\x00\x00\xd2\xe0\x2b\
-\x7c\x37\x26\x00\x00\x00\x68\xbf\x07\x7c\x77\x26\x00\x00\x00\x9c\
-\xb2\xd2\xfb\x60\x02\x00\x00\x48\xbb\x4c\xf3\x0e\xef\x8b\x09\x00\
-\x00\x20\xe5\x86\x77\x78\xdf\x4c\x00\x00\x00\xe9\x36\xe5\x31\xef\
-\x87\x09\x00\x00\x20\xd5\xce\x5c\xeb\xfd\x31\x01\x00\x00\xa4\x58\
-\xa6\xa5\xd7\xfb\x65\x02\x00\x00\x48\xaf\x11\xd7\xf9\x1e\x98\x00\
-\x00\x00\x52\x6b\xda\x62\xdf\x13\x13\x00\x00\x40\x5a\x35\xac\xf7\
-\x3d\x32\x01\x00\x00\xa4\x53\xa6\xa5\xd7\xf7\xcc\x04\x00\x00\x90\
-\x4a\x23\x6f\xf4\x81\x98\x00\x00\x00\xd2\xe8\x88\xa5\x3e\x20\x13\
-\x00\x00\x40\x0a\x7d\x70\xb3\x0f\xcc\x04\x00\x00\x90\x3a\xd5\xd9\
-\x9c\xe7\xc1\x04\x00\x00\x90\x36\x63\x3b\x3d\x2f\x26\x00\x00\x80\
-\x94\x39\xfa\x29\xcf\x8f\x09\x00\x22\x61\xf8\xe8\xd1\xe3\xeb\xeb\
-\xeb\x8f\x9c\xf9\xaa\x59\xb3\xfb\xf0\xb6\x99\x2f\x3b\xb2\xbe\xbe\
-\x7e\xf2\xe8\xd1\xa3\x87\x0a\x00\x8a\xf4\x91\x6d\x9e\x27\x13\x00\
-\x04\x23\x33\x7a\xd2\x94\x99\x27\x9d\x36\xe7\xa3\x1f\x6b\x69\xf9\
-\x8f\xec\xf7\xda\x7f\xd6\xf1\xeb\xce\x7b\x16\xda\xd2\xe5\x6b\xd7\
-\x6e\xf0\xa2\xe4\xd6\xae\x7d\x6e\xe9\xe3\x0b\x17\xde\xd6\x79\x63\
-\xc7\xcf\xda\xbf\x93\xfd\x52\xcb\xc7\x2e\x9a\x73\xe6\xec\x99\x87\
-\xd7\x4f\x18\x29\x00\xe8\x47\xed\x77\x3c\x6f\x26\x00\xa8\x84\xbd\
-\xf6\x3f\xec\x84\x33\xce\x6b\xfa\xfc\xd7\xfe\xe7\xca\x1b\x3a\x17\
-\x2e\x5e\xb6\x76\xbb\x07\x6b\xfd\xf3\x8f\x2f\xec\xbc\xfe\xc7\xdf\
-\xcf\x7e\xb1\xf9\x6f\xde\xf7\xae\x19\xf5\x63\xaa\x04\x00\x2f\xdb\
-\xe7\x77\x9e\x3f\x13\x00\x94\xc5\xb0\xfd\x8e\x38\xe5\x7d\x17\x7f\
-\xfe\x3f\x2f\xfb\xc5\x9d\x8f\x3c\xb3\xde\x23\x68\xc3\x33\x8f\xfc\
-\xf6\xc6\x2b\xdb\xbe\xfc\xe9\x0f\x9f\xfe\xb6\x03\x47\x08\x40\x3a\
-\x1d\xf7\xbc\x17\xc0\x04\x00\xc5\xca\xec\x7d\xe8\xc9\x73\x3e\xf9\
-\xe5\xef\x74\xdc\xb5\x68\xf9\x76\x8f\x99\xee\x15\x8b\xee\xbe\xfe\
-\x07\xd9\x7f\xb8\xe0\xf4\x23\x27\xd6\x0a\x40\x5a\x34\x6d\xf7\x42\
-\x98\x00\xa0\x20\x35\x13\x67\x9c\xfd\xb7\x5f\xfa\x9f\x6b\xee\x5a\
-\xf4\x62\xaf\x27\xc5\x9a\x25\x77\x5f\xfb\x9d\xd6\x4f\x9c\x73\xec\
-\xc4\x6a\x01\x48\xb0\xba\xcb\xbc\x30\x26\x00\xc8\xc3\xe0\x83\x67\
-\x9d\xfb\xe9\x7f\xbf\xe2\xe6\x3f\xac\xe8\xf5\x44\xeb\x59\xfe\xc0\
-\x2f\xbf\xfb\xaf\x7f\x73\xe6\xe1\xe3\x05\x20\x71\x26\x2f\xf0\x02\
-\x99\x00\xa0\x7f\x43\xea\x67\xcd\x69\x69\xeb\x58\xb8\xbc\xd7\x53\
-\xa7\x6b\xf9\xc2\x79\xed\xad\x4d\x0d\x33\x27\x0a\x40\x32\xcc\x5a\
-\xe1\x85\x32\x01\xc0\x6e\xea\xa6\xfd\xd5\xc5\x5f\xb9\xe2\xd6\xc5\
-\x1b\x1d\x2f\xdb\xbc\xe4\xce\x2b\xbf\x7a\xf1\x69\x87\x0c\x16\x80\
-\x38\xfb\xbb\x6e\x2f\x98\x09\x00\x5e\x37\xec\xad\x67\x5d\x9a\xfd\
-\xd9\x3d\xcb\x1d\x7d\x7a\xf1\xfe\x6b\xbf\xd9\xfc\xd7\x47\x8f\x16\
-\x80\xf8\x19\x32\xd7\x8b\x60\x02\x00\xd5\x4e\x39\xed\xe3\xdf\xf8\
-\xc5\xc2\xd5\x8e\xbc\xac\x7b\xf0\xda\xaf\x5f\x7a\xfa\xb4\x41\x02\
-\x10\x1b\x07\x3c\xe8\xc5\x30\x01\x48\xb3\xbd\x66\x9c\xdb\xd2\xde\
-\xb9\x6c\x87\xa3\x08\xbd\xcf\xde\x75\xc5\x97\x3e\x34\x73\xa4\x00\
-\x44\xde\xa9\xab\xbd\x28\x26\x00\xa9\xb4\xd7\x31\xe7\x7f\xf5\x67\
-\xf7\xbf\xe4\x28\x83\x15\x77\x5d\xf6\xb9\xbf\x7e\xcb\x20\x01\x88\
-\xaa\xcc\xe7\x7a\xbc\x38\x26\x00\xe9\x32\xa8\x7e\x76\x73\x7b\xe7\
-\xd2\x9c\xa3\xdc\x96\x77\xb6\xb7\x34\xd4\x57\x0b\x40\xd4\x0c\xbf\
-\xc6\x8b\x65\x02\x90\x16\x93\x4e\xfd\xd4\x77\x7e\xf3\x54\xaf\xa3\
-\xa2\xb6\x3d\x7a\xed\x7f\xfc\xcd\x09\xe3\x05\x20\x32\xa6\x3c\xea\
-\x45\x33\x01\x48\xbc\xea\x83\x1b\x3e\xff\xc3\x05\xeb\x1d\x01\x5a\
-\x7b\xdf\x55\x5f\x78\xef\xd4\x6a\x01\x08\xdd\x19\x6b\xbd\x78\x26\
-\x00\x09\x36\xe8\xf0\x0f\x7c\xf9\xea\x3f\x6c\x77\x84\x64\xfb\x1f\
-\x7e\xf6\xc5\xf7\x4d\xaf\x11\x80\xd0\x64\xfe\xa5\xd7\x4b\x60\x02\
-\x90\x48\x99\xfa\xf7\x7c\xf1\xea\x45\xdd\x8e\x08\xe8\x7a\xe4\xea\
-\x7f\x79\xdf\xc1\x55\x02\x10\xbc\x91\xd7\x7b\x49\x4c\x00\x92\x66\
-\xf4\xac\xa6\xb6\xf9\x9b\x1c\x11\xd3\xb5\x78\x6e\x4b\xc3\x04\x01\
-\x08\xd2\xb4\x45\x5e\x1a\x13\x80\xe4\x18\x74\xf4\x47\xbf\x75\xdb\
-\x2a\x47\x84\xbd\x70\xcb\xd7\x2f\x3c\x6a\x90\x00\x04\xe2\x3d\x1b\
-\xbc\x44\x26\x00\x89\x30\x6a\x56\x73\xfb\xfc\x6d\x8e\x58\xd8\xb1\
-\x78\x6e\xf3\xac\x61\x02\x50\x59\x99\x96\x5e\x2f\x95\x09\x40\xdc\
-\x4d\x6c\x68\xed\x58\x9c\x73\xc4\x4c\xcf\xd2\x79\xad\x0d\xe3\x04\
-\xa0\x52\x46\x5e\xef\xa5\x33\x01\x88\xaf\xcc\xb4\x0f\xfd\xd7\x9d\
-\xeb\x1d\xf1\x95\x7b\xa2\xe3\x9f\x4e\x1b\x2f\x00\xe5\x77\xf8\x13\
-\x5e\x06\x26\x00\xf1\x34\xb1\xa1\x75\xde\x4b\x8e\x44\x58\x3e\x2f\
-\xdb\xf8\x56\x01\x28\xa7\xf3\x36\x7b\x39\x98\x00\xc4\x4d\x66\xca\
-\x79\xdf\xb8\x63\xbd\x23\x61\x56\xfe\xfa\xff\x9d\x5b\x2f\x00\x65\
-\x51\xfd\xf5\x9c\x97\x85\x09\x40\x9c\xec\x35\xbb\x75\xde\x6a\x47\
-\x62\xad\xef\x6c\x6d\x18\x23\x00\x25\x1a\x7b\xab\x97\x89\x09\x40\
-\x4c\xd4\xce\x6c\x9e\xbb\x38\xe7\x48\xbe\xa5\x73\x9b\x67\xd5\x0a\
-\x40\xd1\x8e\x5a\xe6\xe5\x62\x02\x10\x03\xf5\x8d\x6d\xf3\xb7\x3b\
-\x52\x64\xd3\xfc\xb6\x39\x13\x04\xa0\x18\x1f\xde\xe2\x65\x63\x02\
-\x10\x6d\x7b\x9d\xf1\xd5\xdb\x36\x3a\x52\x69\xe9\x4f\xfe\xee\xed\
-\x83\x04\xa0\x20\xb5\x6d\x5e\x46\x26\x00\xd1\x35\x71\x4e\xdb\xc2\
-\x5e\x47\xaa\xed\x58\xdc\xde\xf8\xd6\x8c\x00\xe4\x69\xdc\xed\x5e\
-\x4e\x26\x00\x91\x34\xf4\xa4\x7f\xfe\xe5\x6a\x07\x5e\xb5\xe2\x86\
-\xcf\xbd\xa3\x56\x00\x06\x76\xec\x73\x5e\x56\x26\x00\x91\xb3\xf7\
-\xfb\xbe\x75\x7f\xb7\x03\x6f\xb2\xf9\xb6\x2f\x9f\x32\x44\x00\xf6\
-\xe8\xe2\xed\x5e\x5e\x26\x00\x91\x32\x71\x4e\xdb\xc2\x9c\x03\x7d\
-\xda\xb1\xb0\x6d\xce\x18\x01\xe8\xc7\xa0\x36\x2f\x37\x13\x80\xc8\
-\xa8\x6f\x6c\x5f\xe6\xc0\x9e\xf5\x2c\x6e\x6f\x9c\x2c\x00\xbb\x9b\
-\x78\x8f\x97\x9d\x09\x40\x14\x54\x1f\xf3\x8f\x37\xac\x76\x20\x3f\
-\x39\xfb\xfe\xf9\x93\x05\xe0\x4d\x66\xad\xf0\xf2\x33\x01\x08\x5b\
-\xd5\x5b\x9b\x3a\xd6\x3a\x50\xa0\xe5\x1d\xcd\x33\x33\x02\xf0\x9a\
-\xa6\x2e\xaf\x00\x13\x80\x30\x55\x1d\xd1\x7c\xc3\x5a\x07\x8a\xb4\
-\xe2\x9a\x4f\x1e\x22\x00\xd2\xe0\x2b\xbc\x22\x4c\x00\x42\x53\xdf\
-\xd4\xb1\xda\x81\x12\xbd\xd8\xd1\xb4\x9f\x80\x94\x9b\x7c\x9f\x57\
-\x86\x09\x40\x28\xea\x9b\xae\x59\xe9\x40\x99\x2c\xfa\x76\xc3\x08\
-\x01\xe9\xf5\xce\x55\x5e\x21\x26\x00\x81\x1b\x3b\xa7\x7d\xa9\x03\
-\xe5\xd5\xb3\x30\x3b\xbb\x4e\x40\x2a\x35\x75\x7b\xa5\x98\x00\x04\
-\x6a\xc8\xec\xec\xc2\x5e\x07\x2a\x62\x4b\x67\xcb\xcc\x8c\x80\x94\
-\x19\xfc\x23\xaf\x1c\x13\x80\xc0\x54\xcd\x6c\xe9\xdc\xe6\x40\x45\
-\xad\xea\x68\x3a\x50\x40\x8a\xec\xff\x80\x57\x90\x09\x40\x30\x26\
-\xfd\x6d\xc7\x1a\x07\x02\xf1\xa7\xef\xbe\x7f\x8c\x80\x74\x38\x7d\
-\x8d\x57\x92\x09\x40\xe5\xd5\xcd\xfe\xc6\xa3\x0e\x04\xa9\xe7\xfe\
-\xaf\xbc\xbd\x4a\x40\xd2\x65\xfe\xb9\xc7\x2b\xca\x04\xa0\xc2\xea\
-\x9b\x3a\x36\x38\x10\x82\x97\x3a\x9a\xf6\x11\x90\x64\xc3\x7f\xee\
-\x15\x66\x02\x50\x41\x43\x67\x67\x17\x3b\x10\x9e\xde\x85\xd9\x59\
-\x55\x02\x12\x6a\xea\x63\x5e\x69\x26\x00\x95\x32\xfd\x1f\x6f\xeb\
-\x72\x20\x74\xcb\x2f\x3f\x77\x94\x80\x04\x6a\x58\xef\x15\x67\x02\
-\x50\x09\x35\xb3\xb2\xe6\x40\x54\xf4\x2c\x6c\x9d\x99\x11\x90\x28\
-\x99\x96\x5e\xaf\x3c\x13\x80\xb2\xdb\xbb\xb1\x63\x83\x03\x11\xf3\
-\xe2\xdc\x39\x23\x05\x24\xc6\x88\xeb\x3c\x08\x26\x00\x65\x55\x35\
-\xb3\x65\x7e\xce\x81\x48\xda\x31\xbf\x65\xa6\x80\x44\x98\x6e\x1e\
-\x08\x13\x80\xf2\x19\xfe\xfe\x2b\x57\x3b\x10\x69\x4f\xfe\xf7\xa9\
-\x35\x02\xe2\xee\xfd\x9b\x3c\x18\x26\x00\x65\x32\xbe\xb1\x63\xb3\
-\x03\x31\xb0\xb6\xa3\x71\x84\x80\x18\xab\x6e\xcd\x79\x40\x4c\x00\
-\xca\xa1\xbe\x79\x7e\xaf\x03\xb1\xb1\xad\xb3\x79\x1f\x01\x31\x35\
-\xe6\x37\x1e\x18\x13\x80\x52\x55\xcf\xca\x2e\x71\x20\x6e\x7a\xe7\
-\xb7\x4c\x17\x10\x43\x47\x2e\xf5\xe0\x98\x00\x94\x64\xe8\xfb\xaf\
-\x5a\xe3\x40\x4c\xfd\xe1\x2b\x47\x0b\x88\x99\x0f\x6f\xf1\x00\x99\
-\x00\x14\x6f\xaf\x39\x73\x37\x39\x10\x6b\xcf\xb4\x37\xd4\x0a\x88\
-\x8d\x9a\xac\x07\xca\x04\xa0\x48\x63\x1b\xe7\x75\x39\x90\x00\x6b\
-\x3a\x1a\x47\x08\x88\x85\x71\xb7\x79\xb0\x4c\x00\x8a\xb1\x7f\x73\
-\xe7\x0e\x07\x12\x63\xdb\xbc\xa6\x7d\x04\x44\xde\xd1\x4f\x79\xc0\
-\x4c\x00\x0a\xf6\x96\x2f\x2e\x74\x20\x69\x7a\x6e\xff\xd8\x38\x01\
-\x91\x76\xd1\x36\x0f\x9a\x09\x40\x61\xea\x5b\x16\x3b\x90\x4c\x3d\
-\xf3\x9b\xf7\x16\x10\x55\x35\x59\x0f\x9e\x09\x40\x01\xea\x9b\xe7\
-\x3b\x90\x64\x3d\xf3\x9b\xc7\x0b\x88\xa2\xf1\x77\x7a\x08\x4c\x00\
-\xf2\x55\xdf\x3c\xdf\x81\xe4\xeb\x99\xdf\x3c\x4e\x40\xd4\x1c\xbf\
-\xdc\xc3\x60\x02\x90\x97\x83\x9a\xe7\x3b\x90\x16\xdb\xe7\x35\x8e\
-\x14\x10\x25\x4d\x5d\x1e\x0a\x13\x80\x81\x4d\xfb\xd2\x63\x0e\xa4\
-\xcb\xb6\xeb\x3e\x38\x5c\x40\x44\x0c\xbe\xdc\x43\x62\x02\x30\x80\
-\x49\xcd\xf3\x73\x0e\xa4\xd0\xb6\x79\x8d\x23\x04\x44\xc0\xa4\x05\
-\x1e\x16\x13\x80\x3d\x19\xdd\x38\xaf\xc7\x81\xd4\xda\x3a\xaf\x71\
-\xb8\x80\x90\x9d\xb8\xc2\x43\x63\x02\xd0\xaf\x91\x17\xfe\x6a\x87\
-\x03\x29\xb7\xe9\x27\x67\xd6\x08\x08\x51\xf3\x0e\x0f\x8f\x09\x40\
-\xdf\xea\x1a\xe6\x6e\x76\x00\x2f\x5b\xd3\x3e\x2b\x23\x20\x1c\x83\
-\x7f\xe8\x61\x32\x01\xe8\x43\xd5\xa9\x57\xac\x77\x00\xaf\xb3\x2f\
-\x1e\x20\x20\x04\x07\x3e\xe4\xa1\x32\x01\xd8\xcd\xa1\xad\xcb\x1c\
-\xc0\x2e\x16\x36\x8f\x13\x10\xb0\x93\x57\x7a\xb8\x4c\x00\xde\x6c\
-\xdf\xe6\xf9\x0e\xa0\x2f\xdb\xe7\xcd\x19\x24\x20\x38\x99\xe6\x1d\
-\x1e\x32\x13\x80\x9d\x0c\x99\x33\x6f\x87\x03\xe8\xd7\xda\xb9\xb3\
-\x33\x02\x82\x31\xbc\xc3\x43\x67\x02\xf0\x17\x55\xb3\xda\x37\x3a\
-\x80\x01\x3c\x93\x9d\x2a\x20\x00\x53\x1e\xf3\xf0\x99\x00\xfc\xd9\
-\x5b\xbf\xb1\xdc\x01\xe4\x23\xf7\xfb\x4b\xc7\x08\xa8\xb0\xb3\xd6\
-\x79\x04\x98\x00\xbc\x6c\xaf\xa6\xf9\x0e\x20\x7f\x3d\x9d\x8d\x43\
-\x05\x54\x4e\xa6\xa5\xd7\xa3\xc0\x04\xa0\xfa\xac\x8e\xed\x0e\xa0\
-\x40\x6b\xff\x77\x86\x80\x0a\x19\x79\xa3\x47\x83\x09\x48\xbb\x43\
-\x5a\x9f\x76\x00\x45\x59\xdc\x32\x4e\x40\x05\x4c\x5b\xec\x11\x61\
-\x02\x52\x6d\x54\xd3\x7c\x07\x50\xbc\xed\x1d\x0d\xd5\x02\xca\xec\
-\xec\xf5\x1e\x15\x26\x20\xbd\xaa\x4e\xbb\x7a\x9b\x03\x28\xd1\xb2\
-\x7f\xdd\x4f\x40\x19\x55\xfd\x7b\xce\x23\xc3\x04\xa4\xd5\xc4\x96\
-\xa5\x0e\xa0\x1c\x7a\x3b\x1b\x87\x08\x28\x93\x91\x37\x78\x84\x98\
-\x80\x54\xaa\x9e\xdd\xb1\xc3\x01\x94\xcd\xba\xf6\xa3\x04\x94\xc3\
-\x11\x4f\x7a\x94\x98\x80\x14\x9a\x96\x7d\xd1\x01\x94\xd9\xc2\xe6\
-\x31\x02\x4a\x75\xde\x66\x8f\x14\x13\x90\x36\x83\xe7\x74\xe6\x1c\
-\x40\x05\x6c\xeb\x98\x9d\x11\x50\x82\xea\x6c\xce\xa3\xc5\x04\xa4\
-\xcb\xcc\xef\xad\x77\x00\x15\xf3\xc7\x96\x7d\x05\x14\x6b\xdc\xed\
-\x1e\x35\x26\x20\x45\x86\x5d\xfc\x80\x03\xa8\xac\x1d\x37\x9e\x59\
-\x25\xa0\x18\x33\x9e\xf6\xc8\x31\x01\xa9\x71\x48\x76\x8d\x03\x08\
-\xc0\xf3\xad\x7b\x0b\x28\xd8\xf9\x5b\x3c\x7a\x4c\x40\x3a\xd4\xcd\
-\xe9\x74\x00\x41\xe9\xea\x98\x2d\xa0\x20\x35\x59\x8f\x22\x13\x90\
-\x06\xd3\xb2\xab\x1d\x40\xa0\x96\xb4\x8c\x16\x90\xb7\xf1\xb7\x7b\
-\x24\x99\x80\xc4\x1b\x34\xa7\x33\xe7\x00\x02\xb7\xb1\xfd\x48\x01\
-\xf9\x99\xf9\x8c\x47\x93\x09\x48\xb8\x03\xb3\xab\x1d\x40\x48\xee\
-\xfe\xd0\x20\x01\x03\xbb\x64\xbb\x47\x94\x09\x48\xb2\xcc\xec\x8e\
-\x1d\x0e\x20\x44\x2b\xb3\x07\x09\xd8\xb3\xba\x76\x8f\x2c\x13\x90\
-\x5c\x23\x9b\x16\x39\x80\xb0\xf5\x76\xce\xa9\x16\xd0\xbf\x49\xf7\
-\x7a\x74\x99\x80\xa4\x3a\xa4\x6d\x93\x03\x88\x84\xe7\x5b\xc7\x0b\
-\xe8\xc7\xac\x15\x1e\x61\x26\x20\x91\xaa\x1b\x3a\x73\x0e\x20\x32\
-\xba\x3a\x66\x0b\xe8\x4b\x53\x97\x47\x99\x09\x48\xa0\x89\x5f\x59\
-\xee\x00\x22\xe6\x0f\x17\xd5\x09\xd8\xc5\x90\x2b\x3d\xda\x4c\x40\
-\xe2\xcc\x6c\xdf\xe6\x00\x22\x68\x65\x76\xb2\x80\x9d\x4d\xbe\xcf\
-\x23\xce\x04\x24\x4b\xed\x9c\x4e\x07\x10\x55\x5d\x1d\xc7\x09\x78\
-\xdd\x49\x2f\x7a\xd4\x99\x80\x24\x19\xdf\xf2\xac\x03\x88\xb4\x85\
-\x8d\x35\x02\x5e\xd5\xd4\xed\x91\x67\x02\x92\xe3\xa8\xf6\xad\x0e\
-\x20\xf2\x96\xb5\x8c\x11\xa0\xc1\x57\x7a\x0c\x98\x80\x84\xa8\x6a\
-\xe8\x74\x00\xf1\xb0\xa9\xfd\x2d\x42\xda\x1d\xfc\xa8\xc7\x81\x09\
-\x48\x84\x51\x9f\x7b\xda\x01\xc4\x47\xef\x8d\xef\x12\x52\xed\x8c\
-\xb5\x1e\x0b\x26\x20\x01\x0e\xcc\xae\x73\x00\x31\xf3\x78\xf3\x50\
-\x21\xad\x32\x2d\x3d\x1e\x0f\x26\x20\xf6\x66\xce\xdd\xe1\x00\x62\
-\x68\x55\x76\xb2\x90\x4a\xc3\xaf\xf5\xb8\x30\x01\xf1\x56\xd5\xd0\
-\xe9\x00\xe2\xaa\xab\xe3\x38\x21\x7d\xa6\x2e\xf2\xd8\x30\x01\x71\
-\x36\xfc\xef\x96\x3a\x80\x58\xfb\xed\x39\x55\x42\xba\xbc\x67\x83\
-\xc7\x87\x09\x88\xaf\x7d\x5a\xd7\x38\x80\xd8\x7b\xa2\x79\xb0\x90\
-\x1e\x99\x96\x5e\x8f\x11\x13\x10\x57\x47\x5c\xd5\xed\x00\x12\xe1\
-\xf9\xcf\x8e\x14\x52\x62\xaf\x9b\x3c\x56\x4c\x40\x3c\xcd\x9a\x97\
-\x73\x00\x89\xb1\xb1\x6d\x92\x90\x06\x87\x98\xc7\x8b\x09\x88\xa1\
-\xaa\x86\x7b\x1d\x40\xb2\x74\xcd\x7d\x8b\x90\x78\xe7\x6c\xf0\x98\
-\x31\x01\xb1\x53\xd7\xb8\xc4\x01\x24\x4f\xef\xbc\x77\x08\x89\x56\
-\x9d\xcd\x79\xdc\x98\x80\x98\x19\xd9\xfc\x82\x03\x48\xa8\xf9\x0d\
-\x19\x21\xb1\xc6\xfe\xc6\xe3\xc7\x04\xc4\xca\x3e\xad\xeb\x1d\x40\
-\x82\x3d\xda\x58\x2b\x24\xd3\x51\xcb\x3c\x86\x4c\x40\x8c\x1c\x3a\
-\xb7\xdb\x01\x24\xdc\xd3\x7f\x37\x4c\x48\xa0\x0b\xb6\x7a\x1c\x99\
-\x80\xd8\x38\x6a\x6e\x8f\x03\x48\x81\xf5\x6d\xfb\x0a\x09\x53\x93\
-\xf5\x78\x32\x01\x31\x31\x6b\x5e\xce\x01\xa4\xc4\xf6\xb9\xd3\x84\
-\x24\x19\x77\x9b\xc7\x94\x09\x88\x83\xcc\x59\xbf\x77\x00\x69\xb2\
-\xe3\xc7\x87\x0a\x89\x71\xec\x73\x1e\x57\x26\x20\xfa\xaa\x1a\x1e\
-\x70\x00\x69\xd3\x3b\x6f\xa6\x90\x0c\x17\x6e\xf5\xd8\x32\x01\x51\
-\x57\xdb\xb8\xc4\x01\xa4\x51\x6e\xde\x31\x42\xfc\xd5\x64\x3d\xc6\
-\x4c\x40\xb4\x0d\xf9\xbb\x67\x1d\x40\x5a\xe5\x6e\x3a\x4e\x88\xb9\
-\x89\xbf\xf7\x38\x33\x01\x51\x36\xac\xf9\x05\x07\x90\x6a\xf3\x4f\
-\x15\xe2\xec\x84\xe5\x1e\x6b\x26\x20\xba\x86\x37\x2f\x77\x00\xa9\
-\x37\xbf\x41\x88\xad\xa6\x2e\x8f\x37\x13\x10\x55\xc3\x9b\x5f\x74\
-\x00\x78\xd9\xef\x1b\x32\x42\x1c\xd5\xfd\xc0\xe3\xce\x04\x44\xd3\
-\x88\x96\x35\x0e\x00\xaf\xf9\xc3\x9c\x8c\x10\x3b\x93\x17\x78\xec\
-\x99\x80\x28\x1a\xdb\xba\xce\x01\x60\x27\x8f\x36\x56\x0b\xf1\x72\
-\xe2\x8b\x1e\x7f\x26\x20\x7a\xc6\xb5\xae\x77\x00\xd8\xc5\xa2\xc6\
-\x6a\x21\x46\x9a\xba\x3d\x01\x4c\x40\xd4\x8c\x6d\xdd\xe0\x00\xd0\
-\x87\xa5\x4d\x35\x42\x4c\x0c\xbe\xc2\x13\xc1\x04\x44\xcb\x98\xaf\
-\x6d\x74\x00\xe8\xc7\x93\x1f\xa9\x16\xe2\xe0\xa0\x3f\x78\x32\x98\
-\x80\x28\x19\xd1\xb2\xce\x01\x60\x0f\x96\x35\x55\x0b\x91\x77\xca\
-\x4a\x4f\x08\x13\x10\x1d\xc3\x5b\xd6\x3a\x00\x0c\x60\xd1\x9c\x8c\
-\x10\x69\x99\x96\x1e\x4f\x0a\x13\x10\x15\xc3\x9a\x57\x3a\x00\xe4\
-\xe1\x91\x39\x42\x84\x0d\xff\xb9\x27\x87\x09\x88\x86\x61\xcd\x2b\
-\x1c\x00\xf2\x74\xcf\xbb\x84\xa8\x9a\xf2\x98\x27\x88\x09\x88\x82\
-\xc1\xff\xb0\xd2\x01\xa0\x00\xb7\x1e\x2b\x44\xd2\xd9\xeb\x3d\x49\
-\x4c\x40\xf8\x6a\x1b\x97\x39\x00\x14\xa8\x73\x86\x10\x39\x99\x96\
-\x5e\x4f\x14\x13\x10\xb6\xaa\x39\x7f\x72\x00\x28\x5c\x6e\xde\x91\
-\x42\xb4\x8c\xb8\xce\x13\xc6\x04\x84\x6c\xf6\x43\x0e\x00\xc5\xe9\
-\xed\x98\x2a\x44\xc8\x74\xf3\xa4\x31\x01\xa1\x9a\xf5\x5b\x07\x80\
-\xe2\x75\xcf\x3d\x48\x88\x8a\x86\xf5\x9e\x38\x26\x20\x44\x6f\xbf\
-\xcd\x01\xa0\x34\x5d\xed\xfb\x0a\x51\x90\x69\xe9\xf5\xe4\x31\x01\
-\xa1\x39\xb4\x23\xe7\x00\x50\xb2\x2d\x6d\x13\x84\xd0\x8d\xb9\xc5\
-\x93\xc8\x04\x84\xa4\xfe\x27\xbd\x0e\x00\x65\xb1\xe1\x0b\x43\x85\
-\x70\x1d\xb9\xd4\x13\xc9\x04\x84\x62\x6c\x76\xbb\x03\x40\xd9\xbc\
-\xd0\x54\x23\x84\xe8\x83\x9b\x3d\x99\x4c\x40\x08\x86\xb5\xac\x77\
-\x00\x28\xab\x25\x73\x32\x42\x48\xaa\xb3\x9e\x54\x26\x20\x70\xb5\
-\x4d\xcb\x1d\x00\xca\xee\xde\x13\x85\x50\x8c\xeb\xf4\xc4\x32\x01\
-\x01\xcb\xcc\xf9\x93\x03\x40\x45\x74\x1e\x26\x04\xef\xe8\xa7\x3c\
-\xb9\x4c\x40\xb0\x4e\x5d\xe8\x00\x50\x29\x3b\xda\xf7\x15\x02\x76\
-\xfe\x16\x4f\x30\x13\x10\xa4\xb7\x76\x38\x00\x54\xd2\xe6\xec\x48\
-\x21\x40\x35\x59\x4f\x34\x13\x10\x9c\xfd\xaf\xea\x75\x00\xa8\xb0\
-\x15\x97\xd6\x0a\x41\xd9\xf7\x77\x9e\x6c\x26\x20\x28\xc3\x5b\xb7\
-\x3a\x00\x04\xe0\x8f\x73\x32\x42\x20\x66\x3e\xe3\x09\x67\x02\x82\
-\x51\xdb\xf4\xa2\x03\x40\x40\xee\x3b\x59\x08\x40\x53\x97\x27\x9d\
-\x09\x08\xc4\xec\x45\x0e\x00\x01\xea\x3c\x42\xa8\xb0\xba\xff\xf3\
-\xe4\x33\x01\x01\x38\xe6\xb7\x0e\x00\xc1\xea\xed\x38\x40\xa8\xa4\
-\x49\xf7\x7a\x0a\x98\x80\x8a\xab\xbf\x26\xe7\x00\x10\xb8\x2d\x5f\
-\x19\x26\x54\xcc\x49\x2f\x7a\x1a\x98\x80\x0a\x1b\x9d\xdd\xe6\x00\
-\x10\x8a\x17\x9a\xaa\x84\xca\x68\xea\xf6\x54\x30\x01\x15\x55\xd3\
-\xb4\xca\x01\x20\x34\x0b\x67\x09\x15\x30\xf8\x87\x9e\x12\x26\xa0\
-\x92\x66\x3f\xe6\x00\x10\xaa\x79\x07\x0a\xe5\xb6\xdf\xfd\x9e\x16\
-\x26\xa0\x72\xa6\xdf\xe4\x00\x10\xb6\xad\xd9\x11\x42\x59\x9d\xbc\
-\xd2\x53\xc3\x04\x54\xca\x98\xb6\x1d\x0e\x00\x11\xf0\x42\x53\x95\
-\x50\x3e\x4d\x3b\x3c\x3d\x4c\x40\x65\xd4\x36\xad\x76\x00\x88\x88\
-\x85\xb3\x84\x32\x19\x7e\x8d\xa7\x89\x09\xa8\x88\xd9\x8b\x1c\x00\
-\x22\x64\xde\x81\x42\x39\x4c\x79\xd4\x53\xc5\x04\x54\xc0\x21\x37\
-\x3b\x00\x44\xcb\xd6\xec\x08\xa1\x64\x67\xac\xf5\x74\x31\x01\x65\
-\x37\xf6\xbb\x3d\x0e\x00\x91\xf3\xdc\x05\x19\xa1\x24\x99\x2f\xf5\
-\x7a\xca\x98\x80\x32\xab\x6a\x5c\xe5\x00\x10\x49\x0f\xcc\x12\x4a\
-\x30\xe2\x5a\x4f\x1d\x13\x50\x5e\x27\x3f\xe2\x00\x10\x59\xf3\x0e\
-\x14\x8a\x35\x6d\xb1\xa7\x8f\x09\x28\xa7\xfd\xaf\x71\x00\x88\xb2\
-\x2d\xad\x43\x85\xa2\xfc\xf5\x06\x4f\x21\x13\x50\x3e\x43\x5a\x36\
-\x39\x00\x44\xdc\xf3\x8d\x42\xe1\x32\x2d\xbd\x9e\x46\x26\xa0\x6c\
-\x1a\x96\x39\x00\xc4\xc0\x1d\x87\x0a\x05\x1a\x79\x83\xa7\x93\x09\
-\x28\x93\xe9\xbf\x76\x00\x88\x87\xee\xb6\x11\x42\x21\x0e\x59\xe2\
-\x29\x65\x02\xca\x62\xd4\xb7\x77\x38\x00\xc4\xc6\xb3\xef\x17\xf2\
-\x77\xde\x66\x4f\x2b\x13\x50\x0e\x0d\xcf\x39\x00\xc4\xca\x1d\x87\
-\x0a\xf9\xa9\xce\xe6\x3c\xb5\x4c\x40\xe9\xa6\xdf\xea\x00\x10\x37\
-\xdd\x6d\x23\x84\x3c\x8c\xbd\xd5\x53\xcc\x04\x94\x6a\x58\x6b\x97\
-\x03\x40\x0c\x3d\xdf\x28\x0c\xe8\xa8\x65\x9e\x66\x26\xa0\x44\x0d\
-\xcf\x3a\x00\xc4\xd4\x1d\x87\x0a\x7b\xf6\xe1\x2d\x9e\x6a\x26\xa0\
-\x24\xd3\x7e\xe3\x00\x10\x5f\xdd\x6d\x23\x84\xfe\xd5\x64\x3d\xe5\
-\x4c\x40\x09\x86\xb6\x6e\x77\x00\x88\xb5\xe7\x1b\x85\xfe\x8c\xbb\
-\xdd\xd3\xce\x04\x14\xef\x03\xcf\x3b\x00\xc4\xde\x6f\xa6\x0b\x7d\
-\x7a\xfb\xf3\x9e\x7a\x26\xa0\x58\xf5\xbf\x76\x00\x48\x82\xee\xb6\
-\x11\xc2\xee\x1a\xb7\x3a\x4c\x40\x71\x6a\x9b\x37\x3b\x00\x24\xc4\
-\xf3\x8d\xc2\x2e\xea\xda\x1c\xee\x26\xa0\x28\x27\x2d\x76\x00\x48\
-\x90\x3b\xa6\x09\x3b\x9b\x78\x8f\xe3\x65\x26\xa0\x08\x63\xda\x73\
-\x0e\x00\x89\xb2\xb5\x75\x90\xf0\xba\x13\x96\x3b\x5e\x61\x02\x0a\
-\x96\x69\x5c\xed\x00\x90\x38\x8f\x1c\x27\xbc\xa6\xa9\xcb\xf1\x2a\
-\x13\x50\xa8\x23\x7e\xef\x00\x90\x44\xbd\xed\x23\x85\x97\xd5\x5d\
-\xee\x78\x8d\x09\x28\xcc\xd0\xd6\x2e\x07\x80\x84\x5a\x7e\xae\xa0\
-\xc9\xf7\x39\xfe\xc2\x04\x14\xa4\xe1\x19\x07\x80\x04\xbb\x6e\x92\
-\xd2\xee\x5d\xab\x1c\xaf\x33\x01\x05\x98\x30\xd7\x01\x20\xd9\x36\
-\xb7\x54\x2b\xd5\x9a\xba\x1d\x6f\x30\x01\x79\xcb\x34\xbe\xe4\x00\
-\x90\x78\x0f\xbd\x4d\xe9\x35\xf8\x47\x8e\x9d\x99\x80\x7c\x4d\xb9\
-\xcd\x01\x20\x0d\x76\xb4\x0d\x57\x4a\xed\xbf\xd0\xf1\x26\x26\x20\
-\x3f\xb5\x2d\xdb\x1c\x00\x52\x62\xd9\xbb\x95\x4a\xef\x5e\xe3\x78\
-\x33\x13\x90\x97\xe3\x17\x39\x00\xa4\xc8\xbc\x49\x4a\x9d\x4c\x4b\
-\x8f\x63\x17\x26\x20\x0f\x23\xdb\x7a\x1c\x00\x52\x65\x5d\x73\x95\
-\xd2\x65\xf8\xcf\x1d\xbb\x31\x01\x03\x6b\x78\xd6\x01\x20\x75\x7e\
-\x77\xa8\xd2\x64\xea\x22\xc7\xee\x4c\xc0\x40\xf6\xb9\xd6\x01\x20\
-\x8d\xb6\x7f\x79\x90\x52\xe3\x9c\xf5\x8e\x3e\x98\x80\x01\xcc\x59\
-\xed\x00\x90\x52\x8f\x1d\xa3\x74\xc8\xb4\xf4\x3a\xfa\x62\x02\xf6\
-\x68\xe2\x0d\x0e\x00\xe9\xb5\x23\x3b\x58\x29\x30\xf2\x7a\x47\xdf\
-\x4c\xc0\x1e\x64\x9a\x36\x38\x00\xa4\xda\x13\x27\x29\xf1\xa6\x9b\
-\xa3\x1f\x26\xa0\x7f\xf5\xb7\x3b\x00\xa4\x5d\x6f\xfb\x30\x25\xdb\
-\x39\xeb\x1d\xfd\x31\x01\xfd\xa9\x6a\xda\xec\x00\x00\x5f\xfa\x4e\
-\x25\x58\x75\x6b\xce\xd1\x2f\x13\xd0\x8f\xc3\xee\x73\x00\xc0\x2b\
-\x72\xed\x23\x94\x54\x63\x7e\xe3\xd8\x03\x13\xd0\xa7\x41\xad\x5d\
-\x0e\x00\x78\xcd\xb2\x77\x29\x99\x8e\x5a\xe6\xd8\x13\x13\xd0\x97\
-\xc3\x1f\x74\x00\xc0\x1b\x72\x73\x47\x2b\x81\x3e\xb4\xc5\xb1\x47\
-\x26\x60\x77\x35\x2d\x5d\x0e\x00\x78\x93\xe5\xe7\x28\x69\x6a\xb2\
-\x8e\x01\x98\x80\xdd\x1c\xbe\xd0\x01\x00\xbb\xe9\x18\xab\x44\x19\
-\x77\x9b\x63\x20\x26\x60\x17\x35\x2d\x5d\x0e\x00\xe8\xc3\x8a\xf7\
-\x2a\x41\x8e\x7e\xca\x31\x20\x13\xf0\x66\x87\x3d\xe0\x00\x80\x7e\
-\x74\x8c\x53\x52\x5c\xb0\xd5\x31\x30\x13\xb0\xb3\x9a\x96\xed\x0e\
-\x00\xe8\xd7\xca\x73\x95\x08\x35\x59\x47\x3e\x4c\xc0\x4e\x0e\x5b\
-\xe8\x00\x80\x3d\xba\x66\x9c\xe2\x6f\xdf\xdf\x3b\xf2\x62\x02\x5e\
-\x57\xf3\x85\xed\x0e\x00\x18\xc0\x8a\xb3\x15\x77\xc7\x2f\x77\xe4\
-\xc7\x04\xfc\x45\xfd\xef\x1c\x00\x90\x87\xb9\x23\x14\x6b\x4d\x5d\
-\x8e\x3c\x99\x80\x3f\xcb\x34\x6d\x76\x00\x40\x5e\x9e\x3a\x59\xf1\
-\x55\x77\x99\x23\x6f\x26\xe0\x55\xfb\xde\xec\x00\x80\x7c\xe5\xda\
-\xea\x14\x53\x93\x16\x38\xf2\x67\x02\x5e\x31\x67\x8d\x03\x00\x0a\
-\xb0\xe8\x68\xc5\xd2\x89\x2b\x1c\x05\x30\x01\xd2\xf8\xeb\x1c\x00\
-\x50\x98\xee\xd6\x6a\xc5\x4f\x53\xb7\xa3\x10\x26\x40\x67\x2c\x77\
-\x00\x40\xc1\xee\x9d\xaa\x98\x19\x7c\x85\xa3\x30\x26\xa4\xde\xc8\
-\x76\x07\x00\x14\x63\x4b\x73\x46\x71\xb2\xdf\x03\x8e\x02\x99\x90\
-\x76\xb3\x9e\x74\x00\x40\x91\x6e\x99\xa4\xf8\x38\x65\xa5\xa3\x50\
-\x26\xa4\x5b\x5d\xb6\xd7\x01\x00\x45\x5b\x77\xbe\x62\x22\xd3\xbc\
-\xc3\x51\x30\x13\x52\xed\xd0\x87\x1d\x00\x50\x92\x8e\x31\x8a\x83\
-\xe1\x1d\x8e\x22\x98\x90\x62\x99\xa6\x2d\x0e\x00\x28\xd1\x8a\xb3\
-\x14\x7d\x53\x1e\x73\x14\xc3\x84\xf4\x9a\x70\xb3\x03\x00\x4a\x97\
-\x6b\x1f\xa6\x88\x3b\x73\xad\xa3\x28\x26\xa4\xd6\xb9\x6b\x1c\x00\
-\x50\x16\x4b\x8e\x51\x94\x65\xfe\xb5\xd7\x51\x1c\x13\x52\x6a\x44\
-\xbb\x03\x00\xca\x65\x47\x6b\xb5\x22\x6b\xc4\x2f\x1c\xc5\x32\x21\
-\x9d\xde\xfe\x84\x03\x00\xca\xe8\xce\xc9\x8a\xa8\x69\x8b\x1d\x45\
-\x33\x21\x8d\x6a\x5a\xba\x1d\x00\x50\x56\xeb\x3f\xa8\x48\x6a\x58\
-\xef\x28\x9e\x09\x29\x34\xe5\x3e\x07\x00\x94\xdd\xf7\x87\x28\x72\
-\xaa\xbf\x96\x73\x94\xc0\x84\xf4\x99\xb3\xce\x01\x00\x15\xb0\xe4\
-\x28\x45\xcc\xc8\x1b\x1c\x25\x31\x21\x6d\x46\x5e\xe5\x00\x80\xca\
-\xd8\xde\x52\xa5\x28\x39\x62\xa9\xa3\x34\x26\xa4\xcc\x31\x4f\x38\
-\x00\xa0\x62\x6e\xdd\x57\xd1\xf1\xc1\xcd\x8e\x12\x99\x90\x2a\x99\
-\xe6\x6e\x07\x00\x54\xd0\xca\x33\x15\x11\xd5\xd9\x9c\xa3\x54\x26\
-\xa4\xc9\x3e\xb7\x38\x00\xa0\xb2\x72\x6d\x75\x8a\x82\xb1\x9d\x8e\
-\xd2\x99\x90\x22\x7f\xfd\x92\x03\x00\x2a\xee\xb1\xc3\x14\xbe\xa3\
-\x9f\x72\x94\x81\x09\xa9\x31\xb8\xcd\x01\x00\x41\xd8\xda\xac\xb0\
-\x9d\xbf\xc5\x51\x0e\x26\xa4\xc5\xe1\x8b\x1d\x00\x10\x90\x6b\xf6\
-\x52\x98\x6a\xff\xc7\x51\x1e\x26\xa4\x44\xe3\x16\x07\x00\x04\xe6\
-\xd9\x93\x14\x9e\xf1\x77\x38\xca\xc4\x84\x54\x18\xf9\x53\x07\x00\
-\x04\xa9\x27\x5b\xab\x90\xcc\x7c\xc6\x51\x2e\x26\xa4\xc1\xdb\x96\
-\x3a\x00\x20\x60\xf3\x0f\x50\x28\x9a\xb6\x3b\xca\xc6\x84\xe4\xcb\
-\x34\x77\x39\x00\x20\x70\xeb\xcf\x55\xf0\xea\xfe\xcf\x51\x46\x26\
-\x24\xde\xa8\x9f\x3b\x00\x20\x0c\xb9\xb6\x41\x0a\xd8\xa4\x7b\x1d\
-\xe5\x64\x42\xd2\x1d\xbb\xcc\x01\x00\x21\xb9\xff\x20\x05\x6a\xd6\
-\x0a\x47\x59\x99\x90\x6c\x99\xe6\x6e\x07\x00\x84\xe6\xa5\xb3\x14\
-\xa0\xa6\x6e\x47\x79\x99\x90\x68\xe3\x7f\xed\x00\x80\x30\xe5\xda\
-\x6a\x15\x90\xc1\x97\x3b\xca\xcd\x84\x24\x7b\xe7\x0a\x07\x00\x84\
-\xec\x77\x93\x15\x88\x03\x1e\x74\x94\x9d\x09\xc9\x95\x69\xee\x76\
-\x00\x40\xe8\x56\x9f\xa1\x00\x9c\xbc\xd2\x51\x7e\x26\x24\xd6\xd8\
-\x5f\x39\x00\x20\x0a\x72\x6d\xb5\xaa\xb4\xa6\x6e\x47\x05\x98\x90\
-\x54\xc7\x3c\xe5\x00\x80\x88\xf8\xed\x44\x55\xd4\x90\x2b\x1d\x15\
-\x61\x42\x32\x65\x9a\xbb\x1c\x00\x10\x19\xab\xdf\xad\x0a\x9a\xf2\
-\xa8\xa3\x32\x4c\x48\xa4\x91\x1d\x0e\x00\x88\x92\x5c\xb6\x5a\x95\
-\x72\xc6\x5a\x47\x85\x98\x90\x44\x33\x9e\x74\x00\x40\xc4\xdc\x35\
-\x51\x15\x91\x69\xe9\x75\x54\x8a\x09\x09\xd4\xb8\xd5\x01\x00\x91\
-\xb3\xea\x34\x55\xc0\x88\x6b\x1d\x95\x63\x42\xe2\x8c\xb8\xda\x01\
-\x00\x51\xd4\xf3\xe5\x2a\x95\xdb\x21\x4b\x1c\x15\x64\x42\xd2\x4c\
-\x5f\xe4\x00\x80\x88\xba\x63\x5f\x95\xd7\xd9\xeb\x1c\x95\x64\x42\
-\xc2\x7c\x60\x93\x03\x00\x22\xeb\x85\xe3\x55\x46\x55\xff\x96\x73\
-\x54\x94\x09\x89\x52\x93\xcd\x39\x00\x20\xc2\x76\xb4\xa8\x6c\x46\
-\x5e\xef\xa8\x30\x13\x92\x64\xfc\xed\x0e\x00\x88\xb8\x1f\x0f\x55\
-\x79\x1c\xb2\xc4\x51\x69\x26\x24\xc8\xac\xe5\x0e\x00\x88\xbc\x87\
-\xeb\x55\x0e\xe7\x6d\x76\x54\x9c\x09\xc9\xd1\xd4\xed\x00\x80\x18\
-\x58\xf3\x6e\x95\xac\x3a\x9b\x73\x54\x9e\x09\x49\x31\xfc\x6a\x07\
-\x00\xc4\x43\x2e\x5b\xa5\xd2\x8c\xbd\xd5\x11\x04\x13\x12\x62\xda\
-\x63\x0e\x00\x88\x8d\x9b\xf6\x52\x29\x8e\x5a\xe6\x08\x84\x09\xc9\
-\x70\xee\x46\x07\x00\xc4\xc8\x1f\xdf\xaa\xe2\x5d\xb8\xd5\x11\x0c\
-\x13\x92\x20\xd3\x92\x73\x00\x40\xac\x6c\x3a\x4f\x45\xaa\xc9\x3a\
-\x82\x62\x42\x02\x8c\xb9\xc5\x01\x00\xb1\xd3\x5e\xab\x62\x8c\xbb\
-\xdd\x11\x18\x13\xe2\xef\x88\xa5\x0e\x00\x88\xa1\xbb\xf7\x51\xe1\
-\x66\x3c\xed\x08\x8e\x09\xb1\x77\xde\x66\x07\x00\xc4\xd2\xf3\xef\
-\x50\xa1\x2e\xdc\xea\x08\x90\x09\x31\x57\x9d\xcd\x39\x00\x20\xa6\
-\xb6\x37\xab\x20\x83\xda\x1c\x81\x32\x21\xde\xc6\xde\xea\x00\x80\
-\x18\xbb\x6a\xa8\xf2\x37\xf1\x1e\x47\xb0\x4c\x88\xb5\xa3\x96\x39\
-\x00\x20\xd6\x1e\x3a\x48\xf9\x3a\x61\xb9\x23\x60\x26\xc4\xd9\xf9\
-\x5b\x1d\x00\x10\x73\xab\x67\x2b\x3f\x9f\xec\x76\x04\xcd\x84\xf8\
-\xaa\xf9\xa6\x03\x00\xe2\x6f\x47\xb3\xf2\x30\xf8\x0a\x47\xf0\x4c\
-\x88\xad\x31\xb7\x3a\x00\x20\x11\x7e\x3c\x44\x03\x99\x7c\x9f\x23\
-\x04\x26\xc4\xd5\xb4\x25\x0e\x00\x48\x88\x7b\xf6\xd1\x9e\x9d\xf4\
-\xa2\x23\x0c\x26\xc4\xd4\x19\xeb\x1d\x00\x90\x18\xcf\xbf\x4d\x7b\
-\xd2\xd4\xed\x08\x85\x09\xb1\x94\x69\xe9\x75\x00\x40\x82\x6c\xbb\
-\x40\xfd\x1a\xfc\x23\x47\x48\x4c\x88\xa3\xc1\x57\x3a\x00\x20\x59\
-\x72\xd9\x2a\xf5\x6d\xff\x07\x1c\x61\x31\x21\x86\x26\xdd\xef\x00\
-\x80\xc4\xb9\x69\xa4\xfa\x72\xfa\x1a\x47\x68\x4c\x88\x9f\xe3\x57\
-\x38\x00\x20\x81\x1e\x3d\x48\xbb\xc9\xb4\xf4\x38\xc2\x63\x42\xec\
-\x9c\xbf\xcd\x01\x00\x89\xf4\xd2\xbb\xb4\x8b\xe1\x3f\x77\x84\xc9\
-\x84\x98\xa9\xf9\x6f\x07\x00\x24\x55\xf7\xc7\xf5\x26\xd3\x16\x3b\
-\x42\x65\x42\xbc\x8c\x98\xe7\x00\x80\x04\x6b\xaf\xd5\x1b\xce\x5c\
-\xe7\x08\x97\x09\xb1\x72\xf0\x62\x07\x00\x24\xda\xef\xf6\xd6\x6b\
-\x32\x2d\xbd\x8e\x90\x99\x10\x27\x27\xac\x72\x00\x40\xc2\x3d\x3b\
-\x43\xaf\x1a\x71\x9d\x23\x74\x26\xc4\xc8\xdf\x76\x39\x00\x20\xf1\
-\x36\xbd\x57\x2f\x9b\x6e\x8e\xf0\x99\x10\x1b\xd5\x59\x07\x00\xa4\
-\x41\x2e\x9b\x51\xc3\x7a\x47\x04\x98\x10\x17\x23\x6f\x76\x00\x40\
-\x4a\x5c\x9d\xcd\x39\xa2\xc0\x84\x98\x38\x68\x91\x03\x00\x80\x60\
-\x99\x10\x0f\xc7\xaf\x74\x00\x00\x10\x30\x13\x62\xe1\xa3\x5d\x0e\
-\x00\x00\x82\x66\x42\x0c\x64\x5a\x1d\x00\x00\x04\xcf\x84\xe8\xab\
-\xfb\x89\x03\x00\x80\x10\x98\x10\x79\x63\xef\x76\x00\x00\x10\x06\
-\x13\xa2\x6e\xea\x9f\x1c\x00\x00\x84\xc2\x84\x88\x3b\x75\x9d\x03\
-\x00\x80\x70\x98\x10\x6d\x17\x75\x3b\x00\x00\x08\x89\x09\x51\x96\
-\x69\x75\x00\x00\x10\x1a\x13\x22\xac\xee\x27\x0e\x00\x00\xc2\x63\
-\x42\x74\x8d\xbd\xdb\x01\x00\x40\x88\x4c\x88\xac\xe9\x4b\x1d\x00\
-\x00\x84\xc9\x84\xa8\x3a\x6e\x95\x03\x00\x80\x50\x99\x10\x51\xef\
-\xdb\xea\x00\x00\x20\x5c\x26\x44\x53\x73\xaf\x03\x00\x80\x90\x99\
-\x10\x45\x99\xff\x74\x00\x00\x10\x3a\x13\x22\xa8\xee\x1a\x07\x00\
-\x00\xe1\x33\x21\x7a\xc6\xfc\xce\x01\x00\x40\x04\x98\x10\x39\xf5\
-\x8f\x3b\x00\x00\x88\x02\x13\xa2\xe6\xed\x2b\x1d\x00\x00\x44\x82\
-\x09\x11\xf3\xd7\x5b\x1d\x00\x00\x44\x83\x09\xd1\x72\xd1\x0e\x07\
-\x00\x00\x11\x61\x42\xa4\xb4\x38\x00\x00\x88\x0c\x13\x22\xa4\xfa\
-\x7b\x0e\x00\x00\xa2\xc3\x84\xe8\xa8\xfb\xb9\x03\x00\x80\x08\x31\
-\x21\x32\x46\xdf\xed\x00\x00\x20\x4a\x4c\x88\x8a\x89\x8f\x38\x00\
-\x00\x88\x14\x13\x22\xe2\xd0\x67\x1c\x00\x00\x44\x8b\x09\xd1\x70\
-\xdc\x6a\x07\x00\x00\x11\x63\x42\x24\xbc\x67\xab\x03\x00\x80\xa8\
-\x31\x21\x0a\x2e\xe9\x71\x00\x00\x10\x39\x26\x44\x40\x73\xce\x01\
-\x00\x40\xf4\x98\x10\xba\xcc\xd7\x1d\x00\x00\x44\x91\x09\x61\xab\
-\xfe\x81\x03\x00\x80\x48\x32\x21\x64\x75\xd7\x3a\x00\x00\x88\x26\
-\x13\xc2\x35\xbc\xd3\x01\x00\x40\x44\x99\x10\xaa\x09\x0f\x39\x00\
-\x00\x88\x2a\x13\xc2\x74\xe0\x9f\x1c\x00\x00\x44\x96\x09\x21\x3a\
-\xf4\x39\x07\x00\x00\xd1\x65\x42\x78\x8e\x5f\xeb\x00\x00\x20\xc2\
-\x4c\x08\xcd\x3b\x37\x3a\x00\x00\x88\x32\x13\xc2\xd2\xb0\xcd\x01\
-\x00\x40\xa4\x99\x10\x92\x0f\xef\x70\x00\x00\x10\x6d\x26\x84\xe3\
-\xe3\xbd\x0e\x00\x00\x22\xce\x84\x50\xb4\x38\x00\x00\x88\x3c\x13\
-\xc2\xd0\xea\x00\x00\x20\xfa\x4c\x08\x5e\xe6\xdb\x0e\x00\x00\x62\
-\xc0\x84\xc0\x55\x5f\xe1\x00\x00\x20\x0e\x4c\x08\xda\xa0\x6b\x1d\
-\x00\x00\xc4\x82\x09\x01\x1b\xd6\xe9\x00\x00\x20\x1e\x4c\x08\xd6\
-\xb0\x3b\x1c\x00\x00\xc4\x84\x09\x81\xda\xeb\x5e\x07\x00\x00\x71\
-\x61\x42\x90\x46\xdf\xef\x00\x00\x20\x36\x4c\x08\xd0\x84\x47\x1d\
-\x00\x00\xc4\x87\x09\xc1\xd9\x77\xb1\x03\x00\x80\x18\x31\x21\x30\
-\x07\x3c\xe9\x00\x00\x20\x4e\x4c\x08\xca\x41\xcb\x1c\x00\x00\xc4\
-\x8a\x09\x01\x39\xe4\x79\x07\x00\x00\xf1\x62\x42\x30\x8e\x5a\xe5\
-\x00\x00\x20\x66\x4c\x08\xc4\xdb\xd6\x38\x00\x00\x88\x1b\x13\x82\
-\x30\x63\x8d\x03\x00\x80\xd8\x31\x21\x00\x33\xd7\x38\x00\x00\x88\
-\x1f\x13\x2a\xef\xf8\x0d\x0e\x00\x00\x62\xc8\x84\x8a\x3b\x61\x83\
-\x03\x00\x80\x38\x32\xa1\xd2\x66\x6d\x74\x00\x00\x10\x4b\x26\x54\
-\xd8\x89\x1b\x1d\x00\x00\xc4\x93\x09\x95\x75\xd2\x26\x07\x00\x00\
-\x31\x65\x42\x45\x9d\xbc\xc9\x01\x00\x40\x5c\x99\x50\x49\xa7\x6d\
-\x75\x00\x00\x10\x5b\x26\x54\xd0\xe9\xdb\x1c\x00\x00\xc4\x97\x09\
-\x95\xf3\x57\x5b\x1d\x00\x00\xc4\x98\x09\x15\x73\xd2\x66\x07\x00\
-\x00\x71\x66\x42\xa5\x9c\xb8\xc9\x01\x00\x40\xac\x99\x50\x21\xb3\
-\x36\x39\x00\x00\x88\x37\x13\x2a\xe3\x84\x8d\x0e\x00\x00\x62\xce\
-\x84\x8a\x38\x7e\xa3\x03\x00\x80\xb8\x33\xa1\x12\xde\xb1\xd1\x01\
-\x00\x40\xec\x99\x50\x01\x33\xd7\x3a\x00\x00\x88\x3f\x13\xca\x6f\
-\xc6\x5a\x07\x00\x00\x09\x60\x42\xd9\xbd\x6d\x9d\x03\x00\x80\x24\
-\x30\xa1\xdc\x8e\x78\xc9\x01\x00\x40\x22\x98\x50\x66\xd3\x56\x38\
-\x00\x00\x48\x06\x13\xca\x6b\xca\x0b\x0e\x00\x00\x12\xc2\x84\xb2\
-\xda\xef\x29\x07\x00\x00\x49\x61\x42\x39\x4d\x7a\xd2\x01\x00\x40\
-\x62\x98\x50\x46\x7b\x9b\x03\x00\x80\xe4\x30\xa1\x7c\xc6\x3d\xe6\
-\x00\x00\x20\x41\x4c\x28\x9b\x51\x0f\x38\x00\x00\x48\x12\x13\xca\
-\x65\xd8\xef\x1c\x00\x00\x24\x8a\x09\x65\x32\xf4\x4e\x07\x00\x00\
-\xc9\x62\x42\x79\x0c\xfa\x95\x03\x00\x80\x84\x31\xa1\x2c\xaa\x3b\
-\x1c\x00\x00\x24\x8d\x09\xe5\x90\xf9\x81\x03\x00\x80\xc4\x31\xa1\
-\x1c\xbe\xe9\x00\x00\x20\x79\x4c\x28\x83\xff\x70\x00\x00\x90\x40\
-\x26\x94\xee\xef\x1d\x00\x00\x24\x91\x09\x25\xfb\x84\x03\x00\x80\
-\x44\x32\xa1\x54\x17\xf4\x3a\x00\x00\x48\x24\x13\x4a\xf4\x9e\x1d\
-\x0e\x00\x00\x92\xc9\x84\xd2\x9c\xba\xcd\x01\x00\x40\x42\x99\x50\
-\x92\x77\x6c\x76\x00\x00\x90\x54\x26\x94\xe2\xad\x6b\x1c\x00\x00\
-\x24\x96\x09\x25\xd8\xef\x59\x07\x00\x00\xc9\x65\x42\xf1\xc6\x3f\
-\xee\x00\x00\x20\xc1\x4c\x28\xda\xc8\x07\x1d\x00\x00\x24\x99\x09\
-\xc5\x1a\x72\x97\x03\x00\x80\x44\x33\xa1\x48\xd5\xd7\x3a\x00\x00\
-\x48\x36\x13\x8a\x93\xf9\x81\x03\x00\x80\x84\x33\xa1\x38\xdf\x70\
-\x00\x00\x90\x74\x26\x14\xe5\x9f\x1d\x00\x00\x24\x9e\x09\xc5\xb8\
-\x38\xe7\x00\x00\x20\xf1\x4c\x28\x42\xc3\x0e\x07\x00\x00\xc9\x67\
-\x42\xe1\xde\xbe\xd9\x01\x00\x40\x0a\x98\x50\xb0\x43\xd7\x38\x00\
-\x00\x48\x03\x13\x0a\x35\xe9\x69\x07\x00\x00\xa9\x60\x42\x81\x46\
-\xfd\xc1\x01\x00\x40\x3a\x98\x50\x98\x21\x77\x3b\x00\x00\x48\x09\
-\x13\x0a\x52\x7d\xad\x03\x00\x80\xb4\x30\xa1\x20\xff\xe3\x00\x00\
-\x20\x35\x4c\x28\x44\xab\x03\x00\x80\xf4\x30\xa1\x00\x97\x38\x00\
-\x00\x48\x11\x13\xf2\x77\x4e\x8f\x03\x00\x80\x14\x31\x21\x6f\x6f\
-\xdb\xec\x00\x00\x20\x4d\x4c\xc8\xd7\x41\x2f\x3a\x00\x00\x48\x15\
-\x13\xf2\x34\xf6\x71\x07\x00\x00\xe9\x62\x42\x7e\x06\xcf\x77\x00\
-\x00\x90\x32\x26\xe4\xa5\xea\x5a\x07\x00\x00\x69\x63\x42\x5e\xbe\
-\xe5\x00\x00\x20\x75\x4c\xc8\xc7\x3f\x38\x00\x00\x48\x1f\x13\xf2\
-\xd0\xd0\xe3\x00\x00\x20\x7d\x4c\x18\xd8\xb1\x5b\x1c\x00\x00\xa4\
-\x90\x09\x03\x3a\x78\xa5\x03\x00\x80\x34\x32\x61\x20\xe3\x9e\x74\
-\x00\x00\x90\x4a\x26\x0c\x60\xf0\xef\x1d\x00\x00\xa4\x93\x09\x7b\
-\x96\xb9\xca\x01\x00\x40\x4a\x99\xb0\x67\xff\xe6\x00\x00\x20\xad\
-\x4c\xd8\xa3\x0f\xe6\x1c\x00\x00\xa4\x95\x09\x7b\x72\xd2\x76\x07\
-\x00\x00\xa9\x65\xc2\x1e\x1c\xbc\xda\x01\x00\x40\x7a\x99\xd0\xbf\
-\xb1\x7f\x72\x00\x00\x90\x62\x26\xf4\x6b\xd0\x9d\x0e\x00\x00\xd2\
-\xcc\x84\xfe\x64\xae\x72\x00\x00\x90\x6a\x26\xf4\xe7\xdf\x1c\x00\
-\x00\xa4\x9b\x09\xfd\xb8\x30\xe7\x00\x00\x20\xdd\x4c\xe8\xdb\xf1\
-\xdb\x1d\x40\x30\x7a\xd6\x2e\x5f\xfa\xc8\xc2\xce\x5f\x75\x5c\xd9\
-\xde\xfe\xad\xec\xcb\xbe\xda\xf2\xb2\xcf\x35\xbd\xe2\xbc\x39\x2f\
-\xbb\xa4\xe9\x55\x9f\x6d\x79\xd9\x97\xb3\xdf\x68\x6f\xbf\xba\xe3\
-\xa6\xce\xbb\x16\x2e\x5c\xba\x74\xd5\x66\x07\x80\x0a\x32\xa1\x4f\
-\x07\xbc\xe8\x00\x2a\x61\xf3\x73\x8f\xfd\xee\x97\x73\xff\xfb\x2b\
-\xff\x70\xd1\x9c\xd3\xdf\x35\xf3\xb0\xfa\x09\xa3\x33\x2a\xc9\x5e\
-\x93\xa6\xce\x3c\xe5\xac\x39\x4d\xff\xf0\xc5\xec\x77\x7f\xf2\xeb\
-\x05\x7f\x5c\xdd\xe3\x00\x50\x2e\x26\xf4\x65\xc4\x23\x0e\xa0\x4c\
-\xb6\x3e\x7d\xef\x8d\x97\x65\x5b\x3e\xf6\x81\xd3\x8e\x9d\x36\xbe\
-\x56\x95\x37\xea\xc0\xa3\x4f\x3d\xf7\x92\x96\xff\xfc\xe1\xbc\x05\
-\x4f\x6f\x71\x00\x28\x81\x09\x7d\xa8\xfa\xa5\x03\x28\xc9\x96\x65\
-\xf7\xdc\xf0\xfd\xaf\x7c\xf2\xfd\xb3\xa6\x8f\x50\xa8\x86\x1d\xfc\
-\x8e\x73\x2e\xf9\x97\xb6\x9f\xde\xb9\x78\x83\x03\x40\xa1\x4c\xe8\
-\xc3\xd7\x1d\x40\x31\x72\xcb\x17\xfc\xfc\x9b\xcd\xef\x3f\x61\xea\
-\x70\x45\xd0\xf0\xb7\x9c\xda\xf8\xc5\xef\xdc\xf8\xc0\xf2\x9c\x03\
-\x40\x7e\x4c\xd8\xdd\x45\x0e\xa0\x20\x1b\x17\xdd\xfc\xfd\x7f\xb9\
-\xf0\xe4\xfa\x41\x8a\x85\xda\xfd\x8e\xff\xc0\xe7\xbe\xfb\x2b\xdb\
-\xea\x00\xb0\x67\x26\xec\xe6\xc4\x2e\x07\x90\x97\x4d\x0f\x77\xfc\
-\xc7\xa5\x67\x1f\x36\x4a\x31\xb5\xcf\x71\x1f\xfc\xa7\xef\xff\xe6\
-\x8f\xdb\x1d\x00\xfa\x66\xc2\xae\x0e\x5a\xe5\x00\x06\xb0\xe1\xc1\
-\x6b\xbe\x76\xd1\x89\xfb\x28\x19\x32\x93\x4e\xb9\xe4\xeb\xd7\x2f\
-\xde\xee\x00\xb0\x0b\x13\x76\x31\xe2\x51\x07\xd0\xaf\x6d\x8b\x3b\
-\xb2\x4d\xb3\xeb\x33\x4a\xa2\xd1\xb3\x9a\xb2\x1d\x0b\xb7\x39\x00\
-\xfc\x85\x09\x6f\x56\x7d\xb3\x03\xe8\xcb\x8a\xce\xb6\xa6\x13\xc6\
-\x2b\xf9\x6a\xa7\xbd\xf7\x0b\x3f\x7d\x78\x9b\x03\x80\xbb\x09\x6f\
-\xf6\x5f\x0e\x60\x17\xab\xee\xf8\xce\xc7\x4f\x1a\xa3\x74\xa9\x9e\
-\xf2\x9e\x7f\xbe\xea\xc1\xad\x0e\x20\xdd\x4c\x78\x93\x46\x07\xf0\
-\x86\x97\xee\xfa\xee\x27\xde\x39\x4e\xe9\x55\x55\xdf\xf0\x4f\x57\
-\x2f\xe9\x71\x00\x69\x65\xc2\xce\xde\xbe\xcd\x01\xbc\xa2\x67\xd1\
-\xdc\xbf\x3f\x75\x82\xf0\x8a\xa1\xc7\x36\xfd\xef\xfc\x8d\x0e\x20\
-\x85\x4c\xd8\xc9\xbe\xcf\x3b\x80\x1d\x8b\xe7\x36\xcf\x1a\x26\xec\
-\x62\x62\x43\x6b\xc7\xe2\x9c\x03\x48\x15\x13\xde\x30\xf8\x3e\x07\
-\xd2\xad\x7b\xf1\xdc\xe6\x59\x43\x84\x7e\x8d\x9a\xd5\x3c\x77\xb1\
-\x03\x48\x0d\x13\xde\x70\xb9\x03\xe9\xb5\x71\x7e\x5b\xd3\xac\x3a\
-\x21\x0f\xfb\x36\xb4\xce\x7b\xd1\x01\xa4\x81\x09\xaf\xfb\xac\x03\
-\xe9\xd4\xbb\xf8\xf2\x8b\x0f\xab\x12\x0a\x72\xc0\xb9\xd9\xdb\x37\
-\x3a\x80\x84\x33\xe1\x2f\x4e\xeb\x71\x20\x7d\x36\xce\xcf\x36\x8c\
-\x15\x8a\x53\xfd\xd6\xc6\xf6\xc5\x39\x07\x90\x5c\x26\xbc\x66\xfa\
-\x3a\x07\x52\x66\xe9\xdc\xe6\x99\x55\x42\x89\x46\xcd\x6e\xed\xdc\
-\xe2\x00\x92\xc9\x84\x3f\xdb\xeb\x71\x07\x52\x64\xcd\xcd\x5f\x9a\
-\x3d\x52\x28\x97\xda\x63\x9b\xaf\x7e\xce\x01\x24\x8f\x09\xaf\xaa\
-\xfe\x95\x03\x69\xf1\xe2\x35\x9f\x38\x34\x23\x94\x5d\xfd\x47\xaf\
-\x58\xea\x00\x92\xc5\x84\x57\xfd\xa7\x03\xa9\xb0\xfc\x67\x1f\x7f\
-\x8b\x50\x39\x93\xcf\x6f\x5f\xe2\x00\x92\xc3\x84\x57\xbc\x37\xe7\
-\x40\xe2\xbd\xd8\xd1\x3c\x33\x23\x54\xdc\xde\x0d\xd9\x85\xbd\x0e\
-\x20\x11\x4c\x78\xd9\xe1\x9b\x1d\x48\xb6\xe7\xae\xba\x78\xaa\x10\
-\x9c\x71\xe7\x7e\xef\x09\x07\x10\x7f\x26\x48\xa3\x9f\x70\x20\xc1\
-\x56\xfe\xf8\x6f\x0e\x16\x82\x77\xe0\xc5\x3f\x5b\xe5\x00\xe2\xcd\
-\x04\x55\xdd\xec\x40\x52\xed\x58\xd8\x3a\xb3\x4a\x08\x4d\x7d\x53\
-\xc7\x06\x07\x10\x5f\x26\xe8\x6b\x0e\x24\xd3\xe3\x6d\x67\x0d\x13\
-\xc2\x36\xe8\x94\x7f\x5b\xd0\xeb\x00\xe2\xc9\x84\xf7\xe4\x1c\x48\
-\x9e\x4d\x9d\xcd\x07\x0a\x51\x31\x76\x4e\xfb\x0b\x0e\x20\x86\x4c\
-\xa9\x37\x7d\x83\x03\x09\xd3\xb3\x30\x3b\xbb\x56\x88\x96\xaa\x99\
-\x2d\x9d\x3b\x1c\x40\xcc\x98\xd2\x6e\xd4\x1f\x1d\x48\x94\x15\x97\
-\xbd\x7f\x2f\x21\x9a\xc6\x9d\xff\x93\xd5\x0e\x20\x4e\x4c\x29\x57\
-\x35\xcf\x81\x04\x79\xe4\xdf\x8f\xad\x12\xa2\xac\xea\xed\xad\x0f\
-\x3a\x80\xd8\x30\xa5\xdc\x57\x1d\x48\x8a\x9e\xf9\x2d\xd3\x84\x38\
-\xd8\xbb\x71\xde\x76\x07\x10\x0b\xa6\x74\x3b\x27\xe7\x40\x22\xbc\
-\x74\xd5\x9c\x91\x42\x7c\x8c\xfc\xc0\x8f\xd7\x3a\x80\xe8\x33\xa5\
-\xda\x94\x75\x0e\x24\xc0\xd2\xb6\xd9\xb5\x42\xdc\x54\xcf\xca\x2e\
-\x71\x00\x11\x67\x4a\xb3\xa1\x8f\x38\x10\x77\x3d\x77\x7f\x6e\xba\
-\x10\x57\x87\x7f\x61\xa1\x03\x88\x32\x53\x9a\x5d\xe1\x40\xbc\xf5\
-\xcc\x6f\xde\x57\x88\xb7\xfd\x9b\xe7\xe7\x1c\x40\x54\x99\x52\xec\
-\x93\x0e\xc4\x59\xcf\xfc\xe6\x7d\x84\x24\x98\xdc\x34\x6f\x87\x03\
-\x88\x24\x53\x7a\xbd\x7d\xbb\x03\xb1\xd5\x33\xbf\x79\x82\x90\x1c\
-\xe3\x1a\xe7\x75\x3b\x80\xe8\x31\xa5\xd6\xde\xcf\x39\x10\x53\x5d\
-\x37\x5f\x34\x46\x48\x9a\x71\x97\xdc\xd2\xed\x00\x22\xc6\x94\x56\
-\x55\xbf\x71\x20\x96\x7a\xe6\x37\x8f\x17\x92\x69\x74\xe3\xbc\x1d\
-\x0e\x20\x4a\x4c\x69\xf5\x1f\x0e\xc4\x50\xd7\x8d\x17\x8e\x12\x92\
-\x6c\xf2\x3f\x3e\xe0\x00\xa2\xc3\x94\x52\xe7\xe4\x1c\x88\x9d\x85\
-\xcd\xe3\x85\xe4\x3b\xa0\xf9\x21\x07\x10\x11\xa6\x74\x9a\xba\xde\
-\x81\x98\x59\xd2\x3a\x45\x48\x8b\xb7\xb6\x3e\xe1\x00\xa2\xc0\x94\
-\x4a\xc3\x1e\x75\x20\x56\x56\x7c\x6b\xa6\x90\x2a\x99\x13\xbe\xbb\
-\xd6\x01\x84\xce\x94\x4a\x3f\x72\x20\x46\xb6\x76\x34\xd4\x0a\xe9\
-\x53\xd7\xd0\xd1\xe5\x00\xc2\x65\x4a\xa3\x8b\x1d\x88\x8d\x9e\xce\
-\xc6\xe1\x42\x5a\x8d\x6e\x9a\xef\x00\xc2\x64\x4a\xa1\xc3\xb7\x38\
-\x10\x13\x8b\x5b\xf6\x11\xd2\xed\x2d\xad\x4f\x39\x80\xd0\x98\xd2\
-\x67\xf8\x12\x07\x62\x61\x6d\xfb\x11\x02\x54\x35\xab\x7d\x93\x03\
-\x08\x87\x29\x7d\xae\x71\x20\x06\x7a\x6e\x7a\x6f\xad\x80\x3f\x1b\
-\x79\xc9\x7d\x0e\x20\x0c\xa6\xd4\xf9\x94\x03\xd1\xf7\x6c\xf6\x00\
-\x01\x3b\x7b\x4b\x76\x95\x03\x08\x9c\x29\x6d\xde\xb6\xdd\x81\x88\
-\xdb\xde\x31\x3b\x23\x60\x57\x75\x73\x3a\x73\x0e\x20\x58\xa6\x94\
-\xd9\x6b\xa9\x03\xd1\xb6\xb8\x65\xac\x80\xbe\x4d\x6e\x79\xda\x01\
-\x04\xc9\x94\x2e\x99\xeb\x1c\x88\xb2\xf5\xed\x33\x04\xec\x41\xd5\
-\xec\x8e\x6e\x07\x10\x18\x53\xba\x7c\xd6\x81\xe8\xca\xdd\xfe\xe1\
-\xc1\x02\x06\x32\xf1\x4b\xcf\x39\x80\x80\x98\x52\xe5\xb8\x2e\x07\
-\xa2\x6a\x63\xfb\xe1\x02\xf2\x52\x35\xbb\xa3\xc7\x01\x04\xc1\x94\
-\x26\x63\x9f\x73\x20\xa2\x1e\xfd\xf8\x70\x01\xf9\x9b\xfa\x5f\x6b\
-\x1c\x40\xe5\x99\x52\x24\x73\x83\x03\x91\xd4\x33\x6f\x76\x46\x40\
-\x61\xea\xe6\x74\x3a\x80\x4a\x33\xa5\xc8\x67\x1c\x88\xa2\x15\xd9\
-\xfd\x04\x14\x63\x46\xfb\x26\x07\x50\x51\xa6\xf4\x38\xb6\xcb\x81\
-\xc8\xc9\xdd\xf1\xfe\x1a\x01\xc5\x1a\xf5\xf7\x4f\x3a\x80\x0a\x32\
-\xa5\xc6\xa8\xa5\x0e\x44\xcd\xc6\xf6\xc3\x05\x94\xa4\x6a\xf6\xbc\
-\x9c\x03\xa8\x14\x53\x6a\x74\x38\x10\x31\x8b\x2e\x1d\x21\xa0\x74\
-\x87\xb5\x6f\x71\x00\x95\x61\x4a\x8b\x4b\x1d\x88\x96\xf9\x0d\x19\
-\x01\xe5\x31\xaa\xf9\x69\x07\x50\x09\xa6\x94\x38\x6c\xab\x03\x11\
-\xd2\x35\xf7\x70\x01\x65\x54\xd5\xd0\xe9\x00\xca\xcf\x94\x0e\xc3\
-\x1f\x77\x20\x3a\x56\x7d\x65\x82\x80\x72\x9b\x39\xb7\xcb\x01\x94\
-\x99\x29\x1d\xae\x74\x20\x32\xfe\xd4\x3c\x54\x40\x25\x4c\x68\x5d\
-\xe3\x00\xca\xca\x94\x0a\x1f\x75\x20\x2a\xe6\x37\x64\x04\x54\xca\
-\xf0\xe6\x67\x1c\x40\x19\x99\xd2\xe0\x90\xcd\x0e\x44\xc2\xf6\x2b\
-\x8e\x10\x50\x51\xb5\x17\x3c\xec\x00\xca\xc6\x94\x02\x75\x0f\x39\
-\x10\x05\xeb\xdb\x26\x0b\xa8\xbc\x59\xf3\x72\x0e\xa0\x3c\x4c\x29\
-\xf0\x2d\x07\x22\xe0\xa9\x4f\x0c\x11\x10\x8c\x23\xe7\x76\x3b\x80\
-\x72\x30\x25\xdf\x19\x39\x07\x42\xb7\xf8\xc2\x1a\x01\xc1\xd9\xef\
-\x9b\x9b\x1d\x40\xe9\x4c\x89\xb7\xf7\x0a\x07\xc2\xf6\x70\x63\xb5\
-\x80\x60\x8d\x6d\x5d\xe3\x00\x4a\x65\x4a\xba\xcc\x4d\x0e\x84\x6c\
-\x7e\x43\x46\x40\xf0\x86\x37\xbf\xe0\x00\x4a\x63\x4a\xba\xcf\x38\
-\x10\xae\xce\x77\x08\x08\x49\x5d\xe3\x13\x0e\xa0\x14\xa6\x84\x9b\
-\xd1\xe5\x40\x88\x7a\xe7\xbd\x4d\x40\x88\x6a\x1b\xcd\x01\x14\xcf\
-\x94\x6c\xc3\x96\x38\x10\x9e\xae\xb9\xd3\x05\x84\xac\xaa\xe1\x7e\
-\x07\x50\x2c\x53\xb2\x5d\xee\x40\x68\x36\x7f\x73\x92\x80\x08\xc8\
-\x9c\xb9\xc0\x01\x14\xc7\x94\x68\x1f\x70\x20\x2c\x9b\xb2\xe3\x04\
-\x44\xc5\x19\x0b\x1c\x40\x31\x4c\x49\xb6\xdf\x1a\x07\xc2\xb1\xa5\
-\x6d\x1f\x01\x51\x32\x7b\x81\x03\x28\x9c\x29\xc1\xaa\x7f\xe7\x40\
-\x28\xb6\x7e\x73\x82\x80\xa8\x39\x63\x81\x03\x28\x94\x29\xc1\xbe\
-\xe8\x40\x18\xba\xda\x27\x0a\x88\xa2\xd9\x0b\x1c\x40\x61\x4c\xc9\
-\x35\xa3\xcb\x81\xe0\x75\xb5\x4f\x16\x10\x55\xb3\x17\x38\x80\x42\
-\x98\x12\x6b\xd8\xe3\x0e\x04\xae\xeb\xfb\xfb\x0b\x88\xb2\x33\x1f\
-\x74\x00\xf9\x33\x25\xd6\xf7\x1d\x08\x5a\xf7\xdc\x29\x02\x22\x2e\
-\xd3\xf0\x88\x03\xc8\x97\x29\xa9\xde\x9d\x73\x20\x58\xbd\x1d\x53\
-\x05\xc4\x40\xd5\x9c\x27\x1d\x40\x7e\x4c\x09\x35\x61\xa5\x03\x81\
-\xea\xfd\xc9\x54\x01\x31\x31\xe8\x53\x2b\x1c\x40\x3e\x4c\xc9\x94\
-\xf9\xa5\x03\x81\xea\x9c\x21\x20\x46\x86\x36\xaf\x74\x00\x03\x33\
-\x25\xd3\x27\x1c\x08\xd2\x03\xa7\x0a\x88\x99\xe1\x2d\x1b\x1c\xc0\
-\x40\x4c\x89\x74\xc8\x16\x07\x82\xf3\xc4\x79\x19\x01\xf1\xb3\xf7\
-\xb7\xb6\x3b\x80\x3d\x33\x25\x51\xcd\x7d\x0e\x04\x66\x75\x4b\x9d\
-\x80\x78\xda\xaf\xbd\xd7\x01\xec\x89\x29\x89\xbe\xe6\x40\x50\x36\
-\xfe\xeb\x70\x01\xf1\x35\xf3\x76\x07\xb0\x07\xa6\x04\x3a\xbe\xc7\
-\x81\x60\x74\xb7\xef\x23\x20\xde\x66\x3f\xec\x00\xfa\x65\x4a\x9e\
-\x61\x7f\x72\x20\x10\xb9\x8e\x29\x02\x62\xaf\x6a\xce\x53\x0e\xa0\
-\x1f\xa6\xe4\xf9\x9e\x03\x81\xe8\x9c\x21\x20\x11\x06\x35\xaf\x73\
-\x00\x7d\x32\x25\xce\xe9\x39\x07\x02\xf0\xd8\x5f\x09\x48\x8c\xb1\
-\xdf\xea\x72\x00\x7d\x30\x25\xcd\xe8\xe7\x1d\xa8\xbc\xd5\x97\xd6\
-\x08\x48\x92\xfa\x6b\x1d\xc0\xee\x4c\x49\xf3\x53\x07\x2a\xae\xbb\
-\x6d\x2f\x01\x49\x73\xdc\xbd\x0e\x60\x57\xa6\x84\x79\xaf\x03\x15\
-\xd7\x79\xa8\x80\x04\xaa\x6a\x5c\xee\x00\xde\xcc\x94\x2c\x7b\xaf\
-\x74\xa0\xc2\xec\x0c\x01\x09\x35\xac\x75\x9b\x03\xd8\x99\x29\x59\
-\x6e\x72\xa0\xb2\x5e\x6a\xae\x16\x90\x5c\x93\xe7\xe6\x1c\xc0\x1b\
-\x4c\x89\x72\x89\x03\x15\xd5\xdd\x36\x4a\x40\xb2\x1d\x7b\x8f\x03\
-\x78\x9d\x29\x49\x0e\xda\xe8\x40\x25\x5d\x77\xb0\x80\xc4\xab\xfa\
-\xe8\x72\x07\xf0\x1a\x53\x82\x54\xdd\xe5\x40\x05\x3d\xfc\x4e\x01\
-\xa9\x30\xe2\xeb\xdd\x0e\xe0\x55\xa6\x04\x69\x76\xa0\x72\xd6\x7c\
-\xac\x5a\x40\x5a\x1c\x72\xab\x03\x78\x85\x29\x39\xea\x37\x3b\x50\
-\x29\xb9\xb9\x7b\x0b\x48\x93\x86\xa7\x1c\x80\xbb\x29\x31\xaa\xee\
-\x76\xa0\x52\x1e\x3e\x5e\x40\xca\x0c\x69\xdd\xe6\x00\x4c\x89\xf1\
-\x19\x07\x2a\x64\x5d\x73\xb5\x80\xf4\xa9\xef\x70\x20\xf5\x4c\x49\
-\x31\x7d\xab\x03\x15\x91\x9b\x3b\x41\x40\x3a\x9d\x6a\x0e\xa4\x9c\
-\x29\x21\xaa\xef\x71\xa0\x22\x1e\x99\x25\x20\xb5\xea\xbe\xb0\xc5\
-\x81\x54\x33\x25\xc4\xe7\x1d\xa8\x84\xcd\xad\x83\x04\xa4\xd9\xa4\
-\x9f\x3b\x90\x66\xa6\x64\x38\x64\xab\x03\x15\x30\x6f\x3f\x01\x69\
-\xd7\xf0\xb4\x03\xe9\x65\x4a\x84\xaa\xf9\x0e\x94\xdf\x1f\x4f\x13\
-\x00\x0d\x6d\xed\x72\x20\xad\x4c\x89\xd0\xe2\x40\xd9\x6d\xfe\x5c\
-\xad\x00\xbc\xe2\xa8\x05\x0e\xa4\x94\x29\x09\x0e\xd9\xe6\x40\xb9\
-\xdd\x39\x55\x00\x5e\x93\x69\x7c\xc9\x81\x54\x32\x25\x40\xcd\xfd\
-\x0e\x94\xd9\xaa\xf3\x05\x60\x27\xfb\xfc\xc4\x81\x34\x32\x25\xc0\
-\xe7\x1d\x28\xb3\x2b\xc7\x09\xc0\x9b\xcd\xfe\x93\x03\xe9\x63\x8a\
-\xbf\x69\x5b\x1d\x28\xab\x65\xa7\x0b\xc0\x6e\x06\xb7\x76\x39\x90\
-\x36\xa6\xd8\xab\xba\xdb\x81\x72\xda\xd1\x36\x5c\x00\xfa\x72\xc4\
-\x7d\x0e\xa4\x8c\x29\xf6\x3e\xe5\x40\x39\xfd\xe1\x18\x01\xe8\x47\
-\x55\xd3\x26\x07\x52\xc5\x14\x77\xfb\x6f\x74\xa0\x7c\xb6\xb6\xd6\
-\x0a\x40\xff\x0e\xba\xd5\x81\x34\x31\xc5\xdd\xaf\x1d\x28\x9f\xbb\
-\xa6\x09\xc0\x9e\xcd\x59\xed\x40\x7a\x98\x62\xee\xa3\x0e\x94\xcd\
-\xda\xa6\x8c\x00\x0c\x64\xc2\x5c\x07\x52\xc3\x14\x6f\xfb\xac\x75\
-\xa0\x5c\x7e\x3a\x5e\x00\xf2\xf1\x9e\xe7\x1d\x48\x09\x53\xbc\xfd\
-\xc2\x81\x32\x59\xf9\x3e\x01\xc8\xd3\xa8\xcb\x72\x0e\xa4\x82\x29\
-\xd6\xe6\x38\x50\x26\x1d\xe3\x05\x20\x7f\xa7\x3d\xe3\x40\x1a\x98\
-\xe2\x6c\xec\x8b\x0e\x94\xc5\xba\x26\x01\x28\xc8\xc8\xf6\x9c\x03\
-\xc9\x67\x8a\xb3\xb9\x0e\x94\xc5\xf5\x13\x04\xa0\x50\xef\x7e\xce\
-\x81\xc4\x33\xc5\xd8\xbb\x72\x0e\x94\xc1\xba\x26\x01\x28\xc2\xc8\
-\xf6\x9c\x03\x09\x67\x8a\xaf\xa1\x4f\x3a\x50\x06\xbf\x9e\x2c\x00\
-\xc5\x39\xfd\x59\x07\x92\xcd\x14\x5f\xff\xe5\x40\xe9\xd6\x37\x09\
-\x40\xd1\x46\xb5\xe7\x1c\x48\x32\x53\x6c\xcd\xd8\xe1\x40\xc9\x6e\
-\x99\x2c\x00\xa5\x38\x6b\x8b\x03\x09\x66\x8a\xab\xea\x85\x0e\x94\
-\x6a\x43\x53\x46\x00\x4a\x31\xf8\x0a\x07\x92\xcc\x14\x57\x9f\x71\
-\xa0\x54\xb7\x1f\x20\x00\x25\x39\xe8\x61\x07\x12\xcd\x14\x53\x07\
-\x6c\x72\xa0\x34\xdd\xad\x55\x02\x50\x92\x93\x57\x3a\x90\x6c\xa6\
-\x98\x9a\xe7\x40\x69\xec\x68\x01\x28\x4d\xd3\x0e\x07\x12\xce\x14\
-\x4f\x17\x38\x50\x92\x5c\xfb\x30\x01\x28\xc9\xf0\x6b\x1c\x48\x3c\
-\x53\x2c\x8d\x5d\xe9\x40\x29\x56\x9e\x2d\x00\xa5\x99\xf2\xa8\x03\
-\xc9\x67\x8a\xa5\x2b\x1d\x28\xc5\x2d\xfb\x0a\x40\x69\xce\x58\xeb\
-\x40\x0a\x98\xe2\x68\x76\xce\x81\xe2\x6d\xf9\x98\x00\x94\x26\xf3\
-\xc5\x5e\x07\xd2\xc0\x14\x43\x75\x8f\x3b\x50\xbc\x07\xa6\x0b\x40\
-\x69\x86\x5f\xeb\x40\x3a\x98\x62\xe8\x2b\x0e\x14\x2d\xd7\x36\x48\
-\x00\x4a\x33\x75\x91\x03\x29\x61\x8a\x9f\xa9\xdb\x1c\x28\xd6\x33\
-\x27\x0b\x40\x89\xce\x5a\xe7\x40\x5a\x98\xe2\xe7\x36\x07\x8a\xd5\
-\x31\x46\x00\x4a\x93\x69\xe9\x75\x20\x35\x4c\xb1\x73\x81\x03\x45\
-\xda\xd4\x28\x00\x25\x1a\x35\xcf\x81\x14\x31\xc5\xcd\xa8\xe5\x0e\
-\x14\xc7\x0e\x13\x80\x12\x4d\x37\x07\xd2\xc4\x14\x37\xdf\x77\xa0\
-\x38\x73\x87\x0a\x40\x89\x1a\xd6\x3b\x90\x2a\xa6\x98\x39\xa6\xd7\
-\x81\x62\x6c\xfc\xb0\x00\x94\x28\xd3\xd2\xeb\x40\xba\x98\xe2\xa5\
-\xe6\x21\x07\x8a\xf1\xd0\x54\x01\x28\xd1\xc8\x1b\x1d\x48\x1b\x53\
-\xbc\x7c\xc6\x81\x62\xcc\x1d\x2a\x00\x25\x3a\x62\xa9\x03\xa9\x63\
-\x8a\x95\xfd\x36\x39\x50\xb8\x0d\x1f\x14\x80\x52\x9d\xb7\xd9\x81\
-\xf4\x31\xc5\xca\xf5\x0e\x14\x6e\xe1\x14\x01\x28\x51\x75\x36\xe7\
-\x40\x0a\x99\xe2\xe4\x2c\x07\x0a\x96\xfb\xf6\x20\x01\x28\xd1\xb8\
-\xdb\x1c\x48\x25\x53\x8c\xd4\xfd\xd1\x81\x42\xad\x9f\x23\x00\xa5\
-\x3a\x6a\x99\x03\xe9\x64\x8a\x91\x56\x07\x0a\xf5\x40\xbd\x00\x94\
-\xea\xc3\x5b\x1c\x48\x29\x53\x7c\x1c\xbc\xcd\x81\x02\xb5\x0f\x12\
-\x80\x12\xd5\x64\x1d\x48\x2d\x53\x7c\xcc\x73\xa0\x30\xdb\x2e\x12\
-\x80\x52\x8d\xbb\xdd\x81\xf4\x32\xc5\xc6\x7b\x1c\x28\xcc\x13\x47\
-\x08\x40\xa9\x66\x3c\xed\x40\x8a\x99\xe2\x62\xc8\x32\x07\x0a\x72\
-\xd3\x68\x01\x28\xd5\x05\x5b\x1d\x48\x33\x53\x5c\x7c\xd5\x81\x42\
-\xe4\xb2\x55\x02\x50\xa2\x9a\xac\x03\xe9\x66\x8a\x89\x29\xdb\x1c\
-\x28\xc0\x4b\xa7\x0b\x40\xa9\xc6\xdf\xe9\x40\xca\x99\x62\xe2\x66\
-\x07\x0a\xf0\xd0\x41\x02\x50\xaa\xe3\x97\x3b\x90\x76\xa6\x78\x78\
-\x9f\x03\x05\x98\x3b\x54\x00\x4a\xd5\xd4\xe5\x40\xea\x99\x62\x61\
-\xc8\x53\x0e\xe4\x6d\x7b\xb3\x00\x94\xaa\xee\xff\x1c\x80\x9b\x62\
-\xe1\xdf\x1d\xc8\xdb\xb3\xc7\x0a\x40\xa9\x26\x2f\x70\x00\xee\xa6\
-\x38\xa8\xdf\xe6\x40\xbe\xee\x9a\x20\x00\xa5\x9a\xb5\xc2\x01\xbc\
-\xcc\x14\x07\x37\x38\x90\xaf\xff\xaa\x16\x80\x52\x7d\xba\xdb\x01\
-\xbc\xc2\x14\x03\xb3\x1d\xc8\xd3\xf6\x8b\x04\xa0\x54\x83\x2f\x77\
-\x00\x7f\x66\x8a\xbe\xda\x25\x0e\xe4\x67\xf5\x49\x02\x50\xaa\xc9\
-\xf7\x39\x80\xd7\x98\xa2\xef\x33\x0e\xe4\xe7\x0f\x07\x08\x40\xa9\
-\x4e\x7a\xd1\x01\xfc\x85\x29\xf2\xf6\x5e\xef\x40\x5e\x3a\x86\x0a\
-\x40\xa9\x9a\xba\x1d\xc0\xeb\x4c\x91\xf7\x43\x07\xf2\x91\xcb\x56\
-\x09\x40\x89\x06\xff\xc8\x01\xec\xc4\x14\x75\x33\x7b\x1d\xc8\xc3\
-\xa6\xf7\x09\x40\xa9\xf6\x7f\xc0\x01\xec\xcc\x14\x71\x99\x05\x0e\
-\xe4\xe1\xb9\x99\x02\x50\xaa\x53\x56\x39\x80\x37\x31\x45\xdc\x45\
-\x0e\xe4\x61\xfe\x04\x01\x28\x51\xa6\xa5\xc7\x01\xbc\x99\x29\xda\
-\x46\x2c\x77\x60\x60\x97\x0d\x12\x80\x12\x0d\xef\x70\x00\xbb\x32\
-\x45\xdb\x37\x1c\x18\xd0\x8e\x4f\x0b\x40\xa9\xa6\x2e\x72\x00\xbb\
-\x31\x45\xda\xd4\x2e\x07\x06\xb2\x76\xb6\x00\x94\xea\xac\x75\x0e\
-\x60\x77\xa6\x48\xbb\xd1\x81\x81\x2c\x7b\x8b\x00\x94\x28\xd3\xd2\
-\xeb\x00\xfa\x60\x8a\xb2\x77\x3a\x30\x90\x05\x13\x04\xa0\x44\x23\
-\x7e\xe1\x00\xfa\x64\x8a\xb0\xea\x47\x1c\x18\xc0\x2f\x86\x0a\x40\
-\x89\xa6\x2d\x76\x00\x7d\x33\x45\xd8\xc7\x1c\x18\x40\x5b\x95\x00\
-\x94\xe8\xec\x75\x0e\xa0\x1f\xa6\xe8\x1a\xb1\xc2\x81\x3d\xea\xf9\
-\xa4\x00\x94\x28\xd3\xd2\xeb\x00\xfa\x63\x8a\xae\xaf\x3b\xb0\x47\
-\x9b\xce\x16\x80\x12\x8d\xbc\xde\x01\xf4\xcf\x14\x59\xf5\xdb\x1d\
-\xd8\x93\x17\x66\x08\x40\x89\xa6\x9b\x03\xd8\x03\x53\x64\x5d\xe7\
-\xc0\x9e\x3c\xba\x9f\x00\x94\xe8\x9c\x0d\x0e\x60\x4f\x4c\x51\x75\
-\x8a\x03\x7b\xf2\x9b\x91\x02\x50\x9a\xea\xd6\x9c\x03\xd8\x23\x53\
-\x44\x55\x2d\x74\x60\x0f\x2e\xab\x11\x80\xd2\x8c\xf9\x8d\x03\x18\
-\x80\x29\xa2\x2e\x76\xa0\x7f\xb9\x56\x01\x28\xd1\x91\x4b\x1d\xc0\
-\x40\x4c\xd1\x34\x7c\x85\x03\xfd\xda\xfa\x3e\x01\x28\xd1\x87\xb7\
-\x38\x80\x01\x99\xa2\xe9\xab\x0e\xf4\x6b\xdd\x89\x02\x50\x9a\xea\
-\xac\x03\xc8\x83\x29\x92\x26\x6e\x76\xa0\x3f\xcb\x8f\x12\x80\xd2\
-\x8c\xed\x74\x00\xf9\x30\x45\xd2\xe5\x0e\xf4\xe7\xc9\x83\x05\xa0\
-\x34\x47\x3f\xe5\x00\xf2\x62\x8a\xa2\xc3\x7b\x1c\xe8\xc7\x03\xe3\
-\x05\xa0\x34\xe7\x6f\x71\x00\xf9\x31\x45\xd1\x2d\x0e\xf4\xe3\xb6\
-\x11\x02\x50\x92\x9a\xac\x03\xc8\x97\x29\x82\xde\xe5\x40\x3f\x7e\
-\x5c\x2b\x00\x25\x19\x7f\xbb\x03\xc8\x9b\x29\x7a\xaa\x1e\x72\xa0\
-\x6f\x6d\x55\x02\x50\x92\x19\x4f\x3b\x80\xfc\x99\xa2\xe7\x6f\x1c\
-\xe8\x53\xae\x55\x00\x4a\x73\xe1\x56\x07\x50\x00\x53\xe4\x0c\x79\
-\xd6\x81\xbe\xf4\x5c\x2c\x00\x25\x19\xd4\xe6\x00\x0a\x62\x8a\x9c\
-\x2f\x39\xd0\x97\x2d\x67\x09\x40\x49\x26\xde\xe3\x00\x0a\x63\x8a\
-\x9a\xbd\x37\x38\xd0\x87\xb5\x27\x08\x40\x49\x4e\x58\xee\x00\x0a\
-\x64\x8a\x9a\xef\x39\xd0\x87\x67\x0f\x15\x80\x92\x5c\xda\xe5\x00\
-\x0a\x65\x8a\x98\x69\x3b\x1c\xd8\xdd\xb2\x7a\x01\x28\x45\xdd\x65\
-\x0e\xa0\x70\xa6\x88\xf9\x85\x03\xbb\xb3\x49\x02\x50\x8a\x49\x0b\
-\x1c\x40\x11\x4c\xd1\x72\x6c\xce\x81\xdd\x3c\x38\x4e\x00\x4a\x71\
-\xe2\x0a\x07\x50\x0c\x53\xb4\xdc\xe1\xc0\x6e\xee\x1b\x23\x00\xa5\
-\x68\xea\x76\x00\x45\x31\x45\xca\x59\x0e\xec\xe6\xce\x11\x02\x50\
-\x82\xc1\x3f\x74\x00\x45\x32\x45\x49\xd5\xc3\x0e\xec\xea\xa6\xc1\
-\x02\x50\x82\xfd\xee\x77\x00\xc5\x32\x45\xc9\x47\x1c\xd8\xd5\xd5\
-\xb5\x02\x50\x82\x93\x57\x3a\x80\xa2\x99\x22\x64\xd0\x52\x07\x76\
-\x71\x55\x8d\x00\x94\xa0\xa9\xdb\x01\x14\xcf\x14\x21\x9f\x71\x60\
-\x17\xff\x5b\x25\x00\xc5\x1b\x7c\xa5\x03\x28\x85\x29\x3a\x46\xbd\
-\xe4\xc0\x9b\x65\x05\xa0\x04\x07\x3f\xea\x00\x4a\x62\x8a\x8e\xff\
-\xe7\xc0\x9b\x7d\x59\x00\x4a\xf0\xee\xb5\x0e\xa0\x34\xa6\xc8\xd8\
-\x77\x8b\x03\x3b\xcb\xfd\xbd\x00\x14\x2f\xd3\xd2\xe3\x00\x4a\x64\
-\x8a\x8c\xef\x3b\xb0\xb3\xde\xbf\x15\x80\xe2\x8d\xf8\x85\x03\x28\
-\x99\x29\x2a\x0e\xea\x72\x60\x27\xb9\x8f\x0b\x40\xf1\xa6\x3e\xe6\
-\x00\x4a\x67\x8a\x8a\x9f\x38\xb0\x93\xdc\xc7\x05\xa0\x78\x67\xae\
-\x73\x00\x65\x60\x8a\x88\xc3\x7a\x1d\x78\x43\xee\x63\x02\x50\xb4\
-\x4c\x4b\xaf\x03\x28\x07\x53\x44\xdc\xe0\xc0\x1b\x72\x1f\x13\x80\
-\xa2\x8d\xb8\xce\x01\x94\x87\x29\x1a\x8e\xc9\x39\xf0\xba\xde\x8f\
-\x0a\x40\xd1\xa6\x2d\x76\x00\x65\x62\x8a\x86\xdb\x1c\x78\x5d\xef\
-\x47\x04\xa0\x68\x67\xaf\x77\x00\xe5\x62\x8a\x84\x93\x1c\x78\x5d\
-\xef\x47\x04\xa0\x58\x99\x96\x5e\x07\x50\x36\xa6\x48\xb8\xc7\x81\
-\xbf\xe8\xfd\x88\x00\x14\x6b\xe4\x0d\x0e\xa0\x8c\x4c\x51\x70\x8e\
-\x03\x7f\xd1\xfb\x11\x01\x28\xd6\x21\x4b\x1c\x40\x39\x99\x22\xa0\
-\xea\x61\x07\x5e\xd3\xfb\x11\x01\x28\xd6\x79\x9b\x1d\x40\x59\x99\
-\x22\xe0\xc3\x0e\xbc\xa6\xf7\x23\x02\x50\xa4\xea\x6c\xce\x01\x94\
-\x97\x29\x7c\xd5\x8f\x3b\xf0\x67\xbd\x1f\x11\x80\x22\x8d\xbd\xd5\
-\x01\x94\x9b\x29\x7c\x17\x3b\xf0\x67\xb9\x8f\x0a\x40\x91\x8e\x7e\
-\xca\x01\x94\x9d\x29\x74\xb5\xcb\x1c\x78\x55\xee\x13\x02\x50\xa4\
-\x0f\x6d\x71\x00\xe5\x67\x0a\xdd\xa5\x0e\xfc\x59\x8b\x00\x14\xa7\
-\x26\xeb\x00\x2a\xc1\x14\xb6\x41\x4f\x3b\xf0\xaa\x56\x01\x28\xce\
-\xb8\xdb\x1c\x40\x45\x98\xc2\xf6\x29\x07\x5e\xf5\x6d\x01\x28\xce\
-\xd1\x4f\x39\x80\xca\x30\x85\x6c\xf0\x73\x0e\xbc\xe2\xf2\x8c\x00\
-\x14\xe5\x82\xad\x0e\xa0\x42\x4c\x21\xfb\x7b\x07\x5e\x71\x65\x95\
-\x00\x14\xa3\x26\xeb\x00\x2a\xc6\x14\xae\xc1\x2f\x38\xf0\xb2\x5f\
-\xd4\x08\x40\x31\xc6\xdf\xe1\x00\x2a\xc7\x14\xae\xcf\x3a\xf0\xb2\
-\x5b\xea\x04\xa0\x18\x33\x9f\x71\x00\x15\x64\x0a\xd5\xb0\x95\x0e\
-\xb8\xdf\x36\x58\x00\x8a\xd1\xb8\xcd\x01\x54\x92\x29\x54\xff\xe4\
-\x80\xfb\x3d\xc3\x05\xa0\x08\x75\xff\xe7\x00\x2a\xcb\x14\xa6\xe1\
-\xab\x1c\xf0\x87\x47\x0b\x40\x11\x26\xde\xeb\x00\x2a\xcc\x14\xa6\
-\x7f\x71\xc0\x1f\x1d\x2b\x00\x45\x38\x61\xb9\x03\xa8\x34\x53\x88\
-\x46\xae\x71\xe0\x89\x09\x02\x50\x84\x4f\x76\x3b\x80\x8a\x33\x85\
-\xe8\x0b\x0e\xac\x9c\x2a\x00\x85\xab\xfb\x81\x03\x08\x80\x29\x3c\
-\xc3\x56\x39\x52\x6f\xc3\xd1\x02\x50\xb8\xc9\xf7\x39\x80\x20\x98\
-\xc2\xf3\x79\x47\xea\x75\xcd\x16\x80\xc2\x9d\xf4\xa2\x03\x08\x84\
-\x29\x34\x83\x97\x3b\xd2\xae\xe7\xfd\x02\x50\xb8\xa6\x6e\x07\x10\
-\x0c\x53\x68\xfe\xd1\x91\x76\xb9\x8b\x05\xa0\x60\x83\xaf\x70\x00\
-\x41\x31\x85\x65\xf0\x0b\x8e\xb4\xfb\x82\x00\x14\x6c\xbf\x07\x1c\
-\x40\x60\x4c\x61\xf9\xb4\x23\xed\xfe\x57\x00\x0a\x76\xf2\x4a\x07\
-\x10\x1c\x53\x48\x06\x3d\xed\x48\xb9\x9f\x55\x09\x40\x81\x32\xcd\
-\x3b\x1c\x40\x80\x4c\x21\xb9\xd4\x91\x72\xb7\xd7\x09\x40\x81\x86\
-\x77\x38\x80\x40\x99\xc2\x51\xfb\x94\x23\xdd\x1e\x18\x2e\x00\x05\
-\x9a\xf2\xa8\x03\x08\x96\x29\x1c\x97\x38\xd2\xed\x89\x09\x02\x50\
-\xa0\x33\xd6\x3a\x80\x80\x99\x42\x51\xfd\x27\x47\xaa\xbd\x70\xa0\
-\x00\x14\x26\xd3\xd2\xeb\x00\x82\x66\x0a\x45\xa3\x23\xd5\xd6\x1e\
-\x26\x00\x85\x19\x71\xbd\x03\x08\x9e\x29\x0c\x55\x8b\x1c\x69\xd6\
-\x7d\xaa\x00\x14\x66\xea\x22\x07\x10\x02\x53\x18\xce\x75\xa4\x59\
-\xae\x51\x00\x0a\x73\xd6\x3a\x07\x10\x06\x53\x18\x1e\x70\xa4\xd9\
-\x97\x04\xa0\x20\x99\x96\x5e\x07\x10\x0a\x53\x08\xde\xed\x48\xb3\
-\x1f\x0a\x40\x41\x46\x5c\xef\x00\x42\x62\x0a\xc1\x6f\x1d\x29\x76\
-\xe7\x20\x01\x28\xc4\x74\x73\x00\x61\x31\x05\xef\x1d\x8e\x14\x5b\
-\xbc\x97\x00\x14\xa2\x61\xbd\x03\x08\x8d\x29\x78\xbf\x72\xa4\xd7\
-\xf2\x03\x04\xa0\x00\x99\x96\x5e\x07\x10\x1e\x53\xe0\x8e\xcc\x39\
-\x52\x6b\xcb\xb1\x02\x50\x80\x31\xb7\x38\x80\x30\x99\x02\xd7\xe1\
-\x48\xad\x9e\xf7\x08\x40\x01\x8e\x58\xea\x00\x42\x65\x0a\xda\xf4\
-\x5e\x47\x6a\x7d\x4a\x00\x0a\xf0\xc1\xcd\x0e\x20\x5c\xa6\xa0\x5d\
-\xe1\x48\xad\xaf\x0b\x40\xfe\xaa\xb3\x39\x07\x10\x32\x53\xc0\xf6\
-\xeb\x72\xa4\xd5\xcf\xab\x04\x20\x6f\x63\x6f\x75\x00\xa1\x33\x05\
-\xec\xbf\x1d\x69\xf5\xfb\x21\x02\x90\xb7\x19\x4f\x3b\x80\xf0\x99\
-\x82\x35\x76\xb3\x23\xa5\x9e\x1c\x27\x00\x79\xbb\x70\xab\x03\x88\
-\x00\x53\xb0\x5a\x1d\x29\xb5\xf1\x30\x01\xc8\x57\x4d\xd6\x01\x44\
-\x82\x29\x50\x43\x57\x39\xd2\xa9\xf7\x6c\x01\xc8\xd7\xb8\xdb\x1d\
-\x40\x34\x98\x02\xf5\x29\x47\x4a\x7d\x56\x00\xf2\x35\xe3\x69\x07\
-\x10\x11\xa6\x20\x55\x3f\xe9\x48\xa7\xb9\x02\x90\xaf\x0b\xb6\x3a\
-\x80\xa8\x30\x05\xe9\x43\x8e\x74\xba\xa7\x4e\x00\xf2\x53\x93\x75\
-\x00\xd1\x61\x0a\xd2\x83\x8e\x54\x7a\x61\xa2\x00\xe4\x67\xfc\x9d\
-\x0e\x20\x42\x4c\x01\x3a\xcd\x91\x4a\x5b\x8f\x11\x80\xfc\x1c\xbf\
-\xdc\x01\x44\x89\x29\x40\x9d\x8e\x34\xca\x9d\x27\x00\xf9\x69\xea\
-\x72\x00\x91\x62\x0a\xce\x91\x39\x47\x1a\x7d\x59\x00\xf2\x52\x77\
-\x99\x03\x88\x18\x53\x70\xae\x76\xa4\xd1\x2f\x32\x02\x90\x8f\x49\
-\xf7\x3a\x80\xa8\x31\x05\xe6\xa0\x1d\x8e\x14\x7a\x78\x98\x00\xe4\
-\x63\xd6\x0a\x07\x10\x39\xa6\xc0\xfc\x8f\x23\x85\x56\xec\x27\x00\
-\xf9\xf8\x74\xb7\x03\x88\x1e\x53\x50\x46\x6f\x72\xa4\xcf\xb6\xe3\
-\x04\x20\x0f\x83\x2f\x77\x00\x51\x64\x0a\xca\x3f\x39\x52\xa8\x51\
-\x00\xf2\x70\xc0\x83\x0e\x20\x92\x4c\x01\xa9\x7d\xce\x91\x3e\x6d\
-\x02\x90\x87\x93\x5e\x74\x00\xd1\x64\x0a\x48\xa3\x23\x7d\xee\x19\
-\x24\x00\x03\x6b\xea\x76\x00\x11\x65\x0a\xc8\xc3\x8e\xd4\x59\x31\
-\x51\x00\x06\x34\xf8\x47\x0e\x20\xb2\x4c\xc1\x38\xd5\x91\x3a\xdd\
-\x27\x0a\xc0\x80\xf6\x7f\xc0\x01\x44\x97\x29\x18\xbf\x72\xa4\xce\
-\x27\x05\x60\x40\xa7\xac\x72\x00\x11\x66\xfa\xff\xec\xc1\x09\x80\
-\xa7\xf7\x7c\x30\xf0\xef\xec\x19\x91\x6b\x73\x91\x89\x88\x44\xbc\
-\xc5\xb4\xae\xad\x57\x31\x24\xd8\xb6\xae\x41\xc3\xba\xd2\x8e\xa2\
-\xb6\xa5\x7d\x3b\xa5\xfa\x6e\x83\xea\x94\x92\x2d\x55\xa6\xa5\xac\
-\xaa\x63\x42\xcb\xba\xc2\x54\x1d\x4b\x68\x33\xc8\x9b\xae\x2b\xcc\
-\x23\xd2\x6c\xe3\xa8\x4d\x36\x09\x39\xf6\xc8\xb1\x33\xf3\x7d\x4b\
-\x22\x36\xc9\x1e\x73\xfc\x9f\x67\xe7\xf7\xfc\x3f\x9f\x4f\x23\x7e\
-\x61\x2a\xe9\x36\xef\x0d\x60\x7f\x7a\xd6\x4e\x26\xb0\x90\x55\xd1\
-\x88\x7f\x48\xba\xcd\xd7\x0f\x0e\x60\x3f\x0e\xf9\x60\x02\x0b\x5b\
-\x15\x4d\x38\x66\x67\xd2\x65\x7e\x7c\x72\x00\xfb\x71\xca\x37\x13\
-\x58\xe0\xaa\x68\xc2\x70\xd2\x65\xa6\x1e\x17\xc0\x7e\x3c\xfe\xc7\
-\x09\x2c\x74\x55\x34\x60\xf9\xe5\x49\x97\x79\x59\x00\xfb\xd6\xb3\
-\x76\x2a\x81\x05\xaf\x8a\x06\xfc\x4e\xd2\x65\xce\xe9\x09\x60\x9f\
-\x0e\x3b\x27\x81\x02\x54\xd1\x80\x6f\x24\xdd\xe5\x3b\x87\x07\xb0\
-\x4f\xff\x6b\x22\x81\x12\x54\x51\xbf\x47\x27\xdd\x65\x5b\x5f\x00\
-\xfb\xf4\xc4\x6b\x12\x28\x42\x15\xf5\x3b\x27\xe9\x2a\xd3\xab\x03\
-\xd8\x97\x45\xaf\x9e\x4e\xa0\x0c\x55\xd4\xee\x1e\x93\x49\x57\x79\
-\x63\x00\xfb\x72\xd8\x47\x13\x28\x45\x15\xb5\xfb\x9b\xa4\xab\x5c\
-\xb0\x2c\x80\x7d\xb8\xf7\xb7\x13\x28\x46\x15\x75\x3b\xe4\x9a\xa4\
-\x9b\x5c\x7d\x52\x00\xfb\xf0\xa4\x6b\x13\x28\x47\x15\x75\xfb\x83\
-\xa4\x9b\x4c\x9f\x1e\xc0\xde\x2d\x5e\x37\x9d\x40\x41\xaa\xa8\x59\
-\xcf\xb7\x93\x6e\xf2\xc6\x00\xf6\xee\xc8\x4f\x27\x50\x94\x2a\x6a\
-\xf6\xb8\xa4\x9b\x5c\xb0\x2c\x80\xbd\xba\xff\xe6\x04\xca\x52\x45\
-\xcd\x3e\x99\x74\x91\xab\x4f\x0a\x60\xaf\x9e\xb9\x3d\x81\xc2\x54\
-\x51\xaf\x7b\x4d\x25\x5d\xe4\xf4\x00\xf6\x66\xf1\xba\x04\x8a\x53\
-\x45\xbd\xde\x9c\x74\x91\x37\x05\xb0\x37\x47\x6f\x4c\xa0\x3c\x55\
-\xd4\xea\xf0\x6d\x49\xf7\xb8\x60\x59\x00\x7b\xb1\xf2\x7b\x09\x14\
-\xa8\x8a\x5a\x0d\x25\xdd\xe3\xea\x93\x03\xd8\x8b\x33\x76\x24\x50\
-\xa2\x2a\xea\xd4\x73\x51\xd2\x3d\x4e\x0f\x60\xcf\x96\xac\x4b\xa0\
-\x4c\x55\xd4\xe9\xd7\x92\xee\xf1\xa6\x00\xf6\xec\x98\x73\x13\x28\
-\x54\x15\x75\xfa\x58\xd2\x35\xfe\x63\x79\x00\x7b\xf4\xa0\xef\x26\
-\x50\xaa\x2a\x6a\x74\xe2\x64\xd2\x2d\xae\x39\x39\x80\x3d\x7a\xc1\
-\x0d\x09\x14\xab\x8a\x1a\xad\x4b\xba\xc6\x19\x01\xec\xc9\xf2\x91\
-\x04\x0a\x56\x45\x7d\x96\x6f\x4d\xba\xc5\xd9\x01\xec\x49\xef\x97\
-\x12\x28\x59\x15\xf5\x79\x4e\xd2\x2d\xbe\xbf\x22\x80\x3d\x78\xf8\
-\x96\x04\x8a\x56\x45\x7d\x2e\x48\xba\xc4\xd4\xa9\x01\xec\xc1\x9a\
-\x1b\x13\x28\x5b\x15\xb5\x79\x50\xd2\x2d\x86\x03\xb8\xa3\xe5\xef\
-\x48\xa0\x74\x55\xd4\xe6\xdd\x49\x97\xb8\x60\x69\x00\x77\x70\xfc\
-\xf9\x09\x14\xaf\x8a\xba\x1c\x7d\x7d\xd2\x1d\xb6\xdd\x2b\x80\x3b\
-\x78\xc4\x65\x09\x94\xaf\x8a\xba\xac\x4d\xba\xc4\x6f\x06\x70\x07\
-\x6b\x6e\x4a\xa0\x05\xaa\xa8\xc9\xa2\xcd\x49\x77\xf8\xa7\x00\x6e\
-\xef\x4e\x67\x27\xd0\x0a\x55\xd4\xe4\xb1\x49\x77\xf8\xfe\x8a\x00\
-\x6e\xe7\x84\x0b\x12\x68\x87\x2a\x6a\xf2\xd1\xa4\x2b\x4c\x9d\x16\
-\xc0\xed\x9c\xba\x35\x81\x96\xa8\xa2\x1e\xc7\xdd\x94\x74\x85\x57\
-\x05\x70\x3b\x6b\x76\x25\xd0\x16\x55\xd4\xe3\x95\x49\x57\xb8\x60\
-\x69\x00\xb7\x71\xa7\xf7\x24\xd0\x1e\x55\xd4\x62\xf1\x77\x93\x6e\
-\xb0\xed\x5e\x01\xdc\xc6\x3d\x2f\x4c\xa0\x45\xaa\xa8\xc5\x40\xd2\
-\x15\x7e\x3b\x80\xdb\x78\xdc\x8f\x13\x68\x93\x2a\x6a\xf1\x2f\x49\
-\x37\xf8\x78\x00\xbb\xeb\x59\x3b\x99\x40\xab\x54\x51\x87\x13\x26\
-\x93\x2e\x70\xd5\x5d\x03\xd8\xcd\x21\x1f\x4c\xa0\x65\xaa\xa8\xc3\
-\xab\x93\x6e\xf0\xf4\x00\x76\x73\xaf\x6f\x25\xd0\x36\x55\xd4\x60\
-\xc9\x0f\x93\x2e\xf0\xd1\x00\x76\xf3\xf8\xab\x13\x68\x9d\x2a\x6a\
-\xf0\xd4\xa4\x0b\x5c\x71\x6c\x00\xb7\xea\x59\x3b\x95\x40\xfb\x54\
-\x51\x83\xcf\x24\x5d\xe0\xf4\x00\x6e\x75\xe8\x47\x12\x68\xa3\x2a\
-\x3a\xef\xe4\xa9\xa4\xfd\x46\x03\xb8\xd5\x7d\xbf\x93\x40\x2b\x55\
-\xd1\x79\xaf\x49\xda\xef\x87\x2b\x02\xf8\x99\x81\x6b\x12\x68\xa7\
-\x2a\x3a\x6e\xc9\x0f\x93\xd6\x9b\x7e\x5c\x00\xb7\xe8\x59\x3b\x95\
-\x40\x4b\x55\xd1\x71\x03\x49\xfb\xad\x0f\xe0\x16\x87\x9d\x93\x40\
-\x6b\x55\xd1\x71\xe7\x24\xad\x77\xe9\xa1\x01\xdc\xec\x7e\x97\x24\
-\xd0\x5e\x55\x74\xda\x5d\x6f\x4a\xda\x6e\xea\xb4\x00\x6e\xf6\x8c\
-\xed\x09\xb4\x58\x15\x9d\x76\x66\xd2\x7a\x23\x01\xfc\xd4\xe2\x75\
-\xd3\x09\xb4\x59\x15\x1d\xd6\x73\x71\xd2\x76\x9b\x0f\x09\xe0\x27\
-\x8e\xfa\x4c\x02\xed\x56\x45\x87\x9d\x96\xb4\xdd\xd4\xc3\x02\xf8\
-\x89\x07\x5e\x9a\x40\xcb\x55\xd1\x61\xef\x4d\xda\x6e\x24\x80\x9f\
-\x78\xd6\x8e\x04\xda\xae\x8a\xce\x3a\x7c\x47\xd2\x72\xdf\x3b\x34\
-\x80\x88\x25\xeb\x12\x68\xbf\x2a\x3a\xeb\x0f\x92\xb6\x1b\x08\x20\
-\xe2\xe8\xcf\x26\xd0\x05\xaa\xe8\xac\xaf\x26\x2d\x37\x1a\x40\xc4\
-\x03\x2f\x4d\xa0\x1b\x54\xd1\x51\xbf\x9c\xb4\xdc\x95\xc7\x06\x10\
-\xbf\xb9\x33\x81\xae\x50\x45\x47\xbd\x25\x69\xb9\x67\x07\xb0\xec\
-\x2d\x09\x74\x89\x2a\x3a\x69\xd9\x55\x49\xbb\xfd\x6b\x00\xc7\x9c\
-\x9b\x40\xb7\xa8\xa2\x93\x9e\x91\xb4\xdb\x75\x27\x04\x74\xbd\x95\
-\xdf\x4b\xa0\x6b\x54\xd1\x49\xff\x9a\xb4\xdb\x8b\x02\xba\xde\x9a\
-\x1b\x13\xe8\x1e\x55\x74\x50\xef\x64\xd2\x6a\x5f\x5e\x14\xd0\xe5\
-\x96\xbf\x3d\x81\x6e\x52\x45\x07\xad\x4d\x5a\xed\x86\xfb\x06\x74\
-\xb9\xe3\xbf\x9c\x40\x57\xa9\xa2\x83\xaa\xa4\xd5\x5e\x11\xd0\xe5\
-\x1e\x7e\x59\x02\xdd\xa5\x8a\xce\x79\x48\xd2\x6a\x17\x2e\x0b\xe8\
-\x6e\x6b\x6e\x4c\xa0\xcb\x54\xd1\x39\x6f\x4d\xda\x6c\xea\xa1\x01\
-\x5d\x6d\xf9\x3f\x26\xd0\x75\xaa\xe8\x98\x83\x7e\x9c\xb4\xd9\x1b\
-\x02\xba\xda\xdd\x37\x25\xd0\x7d\xaa\xe8\x98\x67\x26\x6d\xf6\xfd\
-\x43\x02\xba\xd9\x23\x2f\x4f\xa0\x0b\x55\xd1\x31\x9f\x4c\xda\xec\
-\x37\x02\xba\xd9\x9a\x9b\x12\xe8\x46\x55\x74\xca\xf1\x93\x49\x8b\
-\x7d\x2a\xa0\x8b\x1d\xf4\xae\x04\xba\x53\x15\x9d\xf2\xa7\x49\x8b\
-\xed\x3c\x39\xa0\x7b\x9d\xf4\xb5\x04\xba\x54\x15\x9d\xf2\xcd\xa4\
-\xc5\xfe\x2c\xa0\x7b\x9d\xb6\x35\x81\x6e\x55\x45\x87\x3c\x28\x69\
-\xb1\x8b\x0f\x0a\xe8\x56\x3d\x43\xbb\x12\xe8\x5a\x55\x74\xc8\x1b\
-\x93\x16\x7b\x5c\x40\xb7\x3a\x64\x43\x02\x5d\xac\x8a\xce\x58\x72\
-\x59\xd2\x5e\xff\x1c\xd0\xad\x4e\xb9\x30\x81\x6e\x56\x45\x67\x3c\
-\x2e\x69\xaf\xeb\x8e\x0f\xe8\x52\x8f\xfb\x71\x02\x5d\xad\x8a\xce\
-\x78\x5f\xd2\x5e\x7f\x14\xd0\x9d\x7a\xd6\x4e\x25\xd0\xdd\xaa\xe8\
-\x88\x3b\x6f\x4b\x5a\xeb\xc2\xa5\x01\x5d\xe9\xd0\x0f\x25\xd0\xed\
-\xaa\xe8\x88\xe7\x24\xad\x35\xf5\xd0\x80\xae\x74\xaf\x6f\x25\xd0\
-\xf5\xaa\xe8\x88\xcf\x26\xad\xf5\xf6\x80\xae\xf4\x84\xab\x13\xa0\
-\x8a\x4e\xe8\x9d\x4c\xda\xea\x47\x47\x07\x74\xa1\x9e\xb5\x53\x09\
-\x90\x55\x74\xc2\xff\x4d\x5a\xeb\xf9\x01\x5d\xe8\xb0\x8f\x26\xc0\
-\xff\xa8\xa2\x13\x2e\x4c\xda\xea\x4b\x3d\x01\xdd\xa7\xef\xe2\x04\
-\xf8\x89\x2a\x3a\xe0\xfe\x49\x5b\x4d\x3d\x38\xa0\xfb\x3c\xe9\x9a\
-\x04\xf8\xa9\x2a\x3a\xe0\xf5\x49\x5b\xbd\x33\xa0\xeb\x2c\x3e\x6b\
-\x3a\x01\x6e\x56\xc5\xfc\xf5\x7c\x37\x69\xa9\xeb\x8e\x0b\xe8\x36\
-\x47\x7e\x2a\x01\x7e\xa6\x8a\xf9\x7b\x64\xd2\x56\x7f\x12\xd0\x6d\
-\xee\xb7\x39\x01\x6e\x55\xc5\xfc\xbd\x35\x69\xa9\x4b\x96\x07\x74\
-\x99\x67\x6e\x4f\x80\x9f\xab\x62\xde\x96\x6c\x4d\x5a\x6a\x20\xa0\
-\xbb\x2c\x5e\x37\x9d\x00\xbb\xa9\x62\xde\x1e\x97\xb4\xd4\x67\x03\
-\xba\xcb\x51\x1b\x13\xe0\x36\xaa\x98\xb7\xd1\xa4\x9d\x76\xfd\x62\
-\x40\x57\x79\xc0\x7f\x25\xc0\x6d\x55\x31\x5f\x07\x5d\x93\xb4\xd3\
-\x9b\x02\xba\xca\xb3\x77\x24\xc0\xed\x54\x31\x5f\x4f\x4b\xda\xe9\
-\x47\x47\x05\x74\x91\x25\xeb\x12\xe0\x0e\xaa\x98\xaf\x0f\x27\xed\
-\xf4\xc2\x80\x2e\x72\xf4\xe7\x12\xe0\x8e\xaa\x98\xa7\xc3\x76\x26\
-\xad\xf4\xad\x25\x01\xdd\xe3\x41\xdf\x4d\x80\x3d\xa8\x62\x9e\x9e\
-\x93\xb4\xd3\xaf\x06\x74\x8f\xdf\xda\x99\x00\x7b\x52\xc5\x3c\x7d\
-\x2a\x69\xa5\x0f\x07\x74\x8d\x25\xeb\x12\x60\xcf\xaa\x98\x9f\x63\
-\x76\x25\x6d\x74\xe3\xbd\x02\xba\x45\xef\x97\x12\x60\x2f\xaa\x98\
-\x9f\xdf\x4b\x5a\xe9\xac\x80\x6e\xf1\xb0\x2d\x09\xb0\x37\x55\xcc\
-\xcf\xb9\x49\x1b\x5d\x79\x78\x40\x97\x58\x73\x63\x02\xec\x55\x15\
-\xf3\x72\x97\xc9\xa4\x8d\xfe\x30\xa0\x3b\x2c\xff\x87\x04\xd8\x87\
-\x2a\xe6\xe5\x45\x49\x1b\xfd\xd7\xf2\x80\xae\x70\xfc\xf9\x09\xb0\
-\x2f\x55\xcc\xcb\xe7\x93\x36\x7a\x46\x40\x57\xe8\xbf\x2c\x01\xf6\
-\xa9\x8a\xf9\xb8\xcb\x64\xd2\x42\x17\xf4\x04\x74\x83\x35\x37\x25\
-\xc0\xbe\x55\x31\x1f\x2f\x4a\xda\xe8\xd1\x01\x5d\xe0\xa0\x77\x26\
-\xc0\xfe\x54\x31\x1f\x9f\x4f\x5a\xe8\xe3\x01\x5d\xe0\x6e\x17\x24\
-\xc0\x7e\x55\x31\x0f\x77\x99\x4c\xda\x67\xb2\x2f\xa0\xfd\x1e\x79\
-\x79\x02\xec\x5f\x15\xf3\xf0\xfb\x49\x0b\xfd\x43\x40\xfb\xad\xb9\
-\x29\x01\x66\xa0\x8a\x79\xf8\x42\xd2\x3e\x3b\x4f\x08\x68\xbb\x83\
-\xde\x9d\x00\x33\x52\xc5\xdc\xdd\x75\x32\x69\x9f\x57\x07\xb4\xdd\
-\xdd\x37\x25\xc0\xcc\x54\x31\x77\xbf\x9f\xb4\xcf\x95\x87\x05\xb4\
-\xdc\x63\x7f\x94\x00\x33\x54\xc5\xdc\x7d\x3e\x69\x9f\xff\x13\xd0\
-\x6e\x3d\x67\x4e\x26\xc0\x4c\x55\x31\x67\x77\x99\x4c\x5a\x67\xf3\
-\xb2\x80\x56\x3b\xe4\x83\x09\x30\x73\x55\xcc\xd9\x9a\xa4\x7d\x56\
-\x07\xb4\xda\x29\xdf\x4c\x80\x59\xa8\x62\xce\x3e\x99\xb4\xce\xff\
-\xeb\x09\x68\xb3\x27\x5e\x9d\x00\xb3\x51\xc5\x5c\x1d\x7e\x63\xd2\
-\x3a\xbf\x1a\xd0\x62\x3d\x6b\xa7\x12\x60\x56\xaa\x98\xab\xdf\x4c\
-\x5a\xe7\xbc\x80\x16\x3b\xf4\xc3\x09\x30\x4b\x55\xcc\xd5\x87\x93\
-\xd6\x39\x35\xa0\xbd\xfe\xd7\x44\x02\xcc\x56\x15\x73\x74\xf0\xf6\
-\xa4\x6d\x3e\x15\xd0\x5e\x4f\xbc\x26\x01\x66\xad\x8a\x39\x3a\x3d\
-\x69\x9d\x87\x04\xb4\x55\xcf\xda\xa9\x04\x98\xbd\x2a\xe6\xe8\xec\
-\xa4\x6d\xce\x09\x68\xab\xc3\xce\x49\x80\xb9\xa8\x62\x6e\x96\xfe\
-\x38\x69\x99\xe9\x07\x04\xb4\xd4\xbd\xbf\x9d\x00\x73\x52\xc5\xdc\
-\x3c\x36\x69\x9b\x7f\x0e\x68\xa9\x27\x5d\x9b\x00\x73\x53\xc5\xdc\
-\xac\x4f\x5a\x66\xf2\x3e\x01\xad\xb4\x78\xdd\x74\x02\xcc\x51\x15\
-\x73\xb2\xe8\xb2\xa4\x65\xde\x15\xd0\x4a\x47\x7e\x3a\x01\xe6\xac\
-\x8a\x39\x79\x44\xd2\x32\x37\x9d\x1c\xd0\x46\x0f\xf8\xaf\x04\x98\
-\xbb\x2a\xe6\xe4\x0d\x49\xcb\xbc\x35\xa0\x8d\x9e\xb5\x23\x01\xe6\
-\xa1\x8a\x39\xb9\x38\x69\x97\xeb\x4f\x08\x68\x9f\x25\xeb\x12\x60\
-\x5e\xaa\x98\x8b\xfb\x26\x2d\xf3\xc6\x80\xf6\x39\xfa\xb3\x09\x30\
-\x3f\x55\xcc\xc5\x99\x49\xbb\x6c\xbf\x4b\x40\xeb\x3c\xf0\xd2\x04\
-\x98\xa7\x2a\xe6\xe2\x4b\x49\xbb\xac\x0b\x68\x9d\xdf\xbe\x3e\x01\
-\xe6\xab\x8a\x39\xb8\xcb\x54\xd2\x2a\xdb\x8f\x09\x68\x99\x25\xeb\
-\x12\x60\xfe\xaa\x98\x83\x17\x24\xed\xf2\xfa\x80\x96\x39\xe6\xdc\
-\x04\xe8\x80\x2a\xe6\x60\x2c\x69\x95\xeb\x7b\x03\xda\x65\xe5\xf7\
-\x12\xa0\x13\xaa\x98\xbd\x83\x77\x24\xad\xf2\xb7\x01\xed\x32\xb8\
-\x33\x01\x3a\xa2\x8a\xd9\xfb\x8d\xa4\x55\x6e\x3a\x31\xa0\x4d\x96\
-\x8f\x24\x40\x87\x54\x31\x7b\xef\x4e\x5a\xe5\xed\x01\x6d\xd2\xfb\
-\xa5\x04\xe8\x94\x2a\x66\x6d\xf1\x95\x49\x9b\x4c\xde\x2b\xa0\x45\
-\x1e\xbe\x25\x01\x3a\xa6\x8a\x59\x7b\x44\xd2\x2a\xef\x09\x68\x91\
-\x35\x37\x26\x40\xe7\x54\x31\x6b\xaf\x4b\xda\x64\xea\xde\x01\xad\
-\x71\xd0\xbb\x12\xa0\x93\xaa\x98\xb5\x8b\x92\x36\x79\x7f\x40\x6b\
-\xdc\xed\xfc\x04\xe8\xa8\x2a\x66\xeb\xe4\xa4\x4d\xa6\xef\x17\xd0\
-\x16\x8f\xb8\x3c\x01\x3a\xab\x8a\xd9\xfa\xc3\xa4\x4d\xce\x09\x68\
-\x8b\x35\x37\x25\x40\x87\x55\x31\x5b\x9f\x4e\xda\xe4\xc1\x01\xed\
-\x70\xd0\xbb\x12\xa0\xe3\xaa\x98\xa5\x3b\x5f\x9f\xb4\xc8\x27\x03\
-\xda\xe1\x84\x0b\x12\xa0\xf3\xaa\x98\xa5\x27\x27\x6d\xf2\x88\x80\
-\x56\x38\x75\x6b\x02\xd4\xa0\x8a\x59\x7a\x7b\xd2\x22\x9f\x0f\x68\
-\x85\x35\xbb\x12\xa0\x0e\x55\xcc\x4e\xcf\x0f\x92\x16\x59\x15\xd0\
-\x02\x77\xfe\x40\x02\xd4\xa3\x8a\xd9\x79\x40\xd2\x22\x5f\xef\x09\
-\x28\xdf\x3d\x2f\x4c\x80\x9a\x54\x31\x3b\x2f\x4f\x5a\xe4\x99\x01\
-\xe5\x7b\xec\x8f\x13\xa0\x2e\x55\xcc\xce\x97\x92\xf6\xb8\x74\x49\
-\x40\xe9\x7a\xd6\x4e\x26\x40\x6d\xaa\x98\x95\x23\x27\x93\xf6\xf8\
-\xc3\x80\xd2\x1d\xf2\xa1\x04\xa8\x51\x15\xb3\x72\x46\xd2\x1e\x3f\
-\x3e\x24\xa0\x70\x27\x54\x09\x50\xa7\x2a\x66\xe5\x7d\x49\x7b\xbc\
-\x36\xa0\x78\x47\x3e\xfa\xc5\xef\xfe\xda\x8d\x09\x50\x93\x2a\x66\
-\x63\xd1\x15\x49\x6b\xdc\x70\x5c\x40\x3b\x2c\xe9\x5b\x3d\x3c\x76\
-\x79\x02\x74\x5e\x15\xb3\xf1\x90\xa4\x3d\xfe\x21\xa0\x55\x7a\x57\
-\x0d\x8d\x4e\x4c\x25\x40\x27\x55\x31\x1b\xaf\x4c\x5a\x63\xfa\xbe\
-\x01\xed\xb3\xac\x6f\x70\x64\x7c\x5b\x02\x74\x48\x15\xb3\xf1\xc5\
-\xa4\x35\x3e\x16\xd0\x5a\xbd\x03\xc3\x1b\x26\xa6\x13\x60\xde\xaa\
-\x98\x85\x15\xbb\x92\xd6\xe8\x0f\x68\xb7\x23\xfa\x87\xd6\x8f\x5f\
-\x9f\x00\xf3\x51\xc5\x2c\xac\x4e\x5a\xe3\x82\x80\x6e\xb0\xa4\x6f\
-\x70\xdd\xd8\xd6\x04\x98\xa3\x2a\x66\xe1\x1d\x49\x6b\x3c\x35\xa0\
-\x7b\xf4\xae\x1a\x1a\x9d\x98\x4a\x80\x59\xab\x62\x16\xbe\x9f\xb4\
-\xc5\xe6\xc5\x01\x5d\xe6\xd0\x95\x83\x23\xe3\xdb\x13\x60\x36\xaa\
-\x98\xb9\x5f\x4a\x5a\xe3\x85\x01\xdd\xa9\x77\x60\x78\x6c\x73\x02\
-\xcc\x50\x15\x33\xf7\xd2\xa4\x2d\xae\xba\x73\x40\x17\x3b\xa2\x7f\
-\x68\xfd\xf8\xf5\x09\xb0\x5f\x55\xcc\xdc\xc6\xa4\x2d\x5e\x15\xd0\
-\xf5\x96\x3f\xe8\xb9\x23\x5f\xb8\x3a\x01\xf6\xa5\x8a\x19\xbb\xf3\
-\x0d\x49\x4b\xdc\x74\x7c\x00\x3f\xd5\x3b\xb0\x76\x74\x62\x2a\x01\
-\xf6\xac\x8a\x19\x7b\x42\xd2\x16\xef\x0b\x60\x37\x87\xae\x1c\x1c\
-\x19\xdf\x9e\x00\x77\x50\xc5\x8c\xfd\x6d\xd2\x16\x0f\x0d\xe0\xf6\
-\x16\xdf\xe7\x99\xeb\x3e\xb9\x25\x01\x76\x57\xc5\x8c\x5d\x94\xb4\
-\xc4\x57\x02\xd8\x8b\x15\xfd\x43\xa3\x9b\x6e\x48\x80\x9b\x55\x31\
-\x53\xc7\x27\x6d\x31\x18\xc0\xbe\x2c\xed\x1b\x5c\x37\x76\x45\x02\
-\x64\x15\x33\xf5\xdc\xa4\x25\xae\x38\x28\x80\xfd\xeb\x1d\x58\x3b\
-\x3a\x31\x95\x40\x57\xab\x62\xa6\xde\x9b\xb4\xc4\xab\x02\x98\xa9\
-\xc3\x56\x0e\x8e\x8c\xef\x48\xa0\x5b\x55\x31\x43\x3d\x5b\x92\x76\
-\xd8\x75\xb7\x00\x66\x65\xf1\xc9\x03\xc3\x63\x5b\x12\xe8\x42\x55\
-\xcc\xd0\x2f\x25\x2d\xf1\xfe\x00\xe6\x62\x45\xff\xd0\xe8\xa6\x1b\
-\x12\xe8\x2a\x55\xcc\xd0\x8b\x93\x96\x78\x78\x00\x73\xb6\xb4\x6f\
-\x70\x64\xe3\x95\x09\x74\x8b\x2a\x66\xe8\x13\x49\x3b\x7c\x35\x80\
-\xf9\xea\x1d\x58\x3b\x3a\x31\x9d\x40\xfb\x55\x31\x33\x4b\xaf\x4b\
-\xda\xe1\xb7\x03\xe8\x88\xc3\xfa\xd7\x8c\x8c\xef\x48\xa0\xd5\xaa\
-\x98\x99\x47\x26\xed\x70\xe5\x41\x01\x74\xce\x92\x93\x07\x86\xc7\
-\xb6\x24\xd0\x56\x55\xcc\xcc\x5f\x24\xed\xf0\x9a\x00\x3a\x6e\x45\
-\xff\xd0\xe8\xc4\x64\x02\xed\x53\xc5\xcc\x7c\x31\x69\x85\x5d\x27\
-\x04\x50\x8f\xa5\x7d\x83\x23\x1b\xaf\x4a\xa0\x55\xaa\x98\x91\x43\
-\x6f\x4a\x5a\x61\x43\x00\xb5\xea\x1d\x18\xde\x30\x31\x9d\x40\x4b\
-\x54\x31\x23\x03\x49\x3b\x9c\x16\x40\xfd\x56\x9c\x36\xf4\xae\xaf\
-\xdc\x98\x40\xf9\xaa\x98\x91\x37\x25\xad\xf0\xed\x9e\x00\x1a\xb2\
-\xf4\x7e\xbf\xf5\xd7\x1b\xaf\x4c\xa0\x68\x55\xcc\xc8\x37\x92\x56\
-\x78\x49\x00\xcd\x5a\xd1\x3f\x34\x3a\x31\x99\x40\xa1\xaa\x98\x89\
-\xa3\xa6\x92\x36\xb8\xf1\x98\x00\x0e\x80\x65\x7d\x83\x23\x1b\x7f\
-\x94\x40\x79\xaa\x98\x89\xa7\x26\xad\xf0\xbe\x00\x0e\x9c\xde\x81\
-\xe1\x0d\x13\xd3\x09\x94\xa4\x8a\x99\x78\x73\xd2\x0a\xa7\x06\x70\
-\x80\x1d\xde\x3f\xb4\x7e\x7c\x67\x02\x85\xa8\x62\x26\xbe\x95\xb4\
-\xc1\x45\x3d\x01\x2c\x04\x4b\xfa\x56\x0f\x8f\x5d\x9e\xc0\xc2\x57\
-\xc5\x0c\x1c\x3b\x9d\xb4\xc1\x4b\x02\x58\x40\x7a\x57\x0d\x8d\x4e\
-\x4c\x25\xb0\x90\x55\x31\x03\x4f\x4f\xda\xe0\xc6\x63\x02\x58\x68\
-\x96\xf5\x0d\x8e\x8c\x6f\x4b\x60\x81\xaa\x62\x06\xde\x9a\xb4\xc1\
-\xfb\x02\x58\xa0\x7a\x07\x86\x37\x4c\x4c\x27\xb0\xe0\x54\x31\x03\
-\x17\x25\x6d\x70\x6a\x00\x0b\xd9\x11\xfd\x43\xeb\xc7\xaf\x4f\x60\
-\x21\xa9\x62\xff\x8e\x4b\xda\xe0\xa2\x9e\x00\x16\xbc\x25\x7d\x83\
-\xeb\xc6\xb6\x26\xb0\x40\x54\xb1\x7f\xcf\x4e\xda\xe0\x25\x01\x94\
-\xa2\x77\xd5\xd0\xe8\xc4\x54\x02\x07\x5c\x15\xfb\xf7\xf6\xa4\x05\
-\x6e\x3c\x26\x80\xa2\x1c\xb2\x72\x70\x64\x7c\x7b\x02\x07\x52\x15\
-\xfb\xf7\x9f\x49\x0b\xbc\x2f\x80\x12\xf5\x0e\x0c\x8f\x6d\x4e\xe0\
-\x00\xa9\x62\xbf\x8e\x4f\xda\xe0\xb4\x00\x8a\x75\xcc\xaa\x97\x9e\
-\x7d\xe1\x4d\x09\x34\xae\x8a\xfd\x7a\x56\xd2\x02\x17\xf5\x04\x50\
-\xb6\xa5\x7d\x83\xeb\xc6\xae\x48\xa0\x49\x55\xec\xd7\x5b\x92\x16\
-\xf8\xe3\x00\x5a\xe1\xc4\x27\xbd\xf2\xc3\x97\x4c\x27\xd0\x8c\x2a\
-\xf6\xeb\x9b\x49\xf9\x76\xdd\x35\x80\xf6\x38\x74\xe5\xe0\xc8\xf8\
-\xf6\x04\x6a\x57\xc5\xfe\xac\x98\x4a\xca\x37\x16\x40\xdb\x2c\x3e\
-\x79\x60\x78\x6c\x73\x02\x75\xaa\x62\x7f\x9e\x94\xb4\xc0\xd3\x02\
-\x68\xa7\x15\xfd\x43\xa3\x9b\x6e\x48\xa0\x1e\x55\xec\xcf\xeb\x93\
-\xf2\xfd\x78\x79\x00\x2d\xb6\xb4\x6f\x70\xdd\xd8\x15\x09\x74\x5c\
-\x15\xfb\x73\x7e\x52\xbe\xbf\x0f\xa0\xfd\x7a\x07\xd6\x8e\x4e\x4c\
-\x25\xd0\x41\x55\xec\xc7\xc1\x37\x26\xe5\x7b\x48\x00\x5d\xe2\xd0\
-\x95\x83\x23\xe3\x3b\x12\xe8\x8c\x2a\xf6\xe3\x31\x49\xf9\xbe\xd3\
-\x13\x40\x37\x59\x7c\xf2\xc0\xf0\xd8\x96\x04\xe6\xad\x8a\xfd\x18\
-\x4e\xca\x77\x66\x00\x5d\x68\x45\xff\xd0\xe8\xa6\x1b\x12\x98\x87\
-\x2a\xf6\xe3\x73\x49\xf1\xa6\x4e\x08\xa0\x5b\x2d\xed\x1b\x1c\xd9\
-\x78\x65\x02\x73\x53\xc5\xbe\x2d\xdd\x91\x14\xef\x33\x01\x74\xb9\
-\xde\x81\xb5\xa3\x13\xd3\x09\xcc\x56\x15\xfb\xf6\x2b\x49\xf9\xce\
-\x08\x80\x88\xc3\xfa\xd7\x8c\x8c\xef\x48\x60\x16\xaa\xd8\xb7\x3f\
-\x49\x8a\x77\xdd\xc1\x01\x70\x8b\x25\xbf\x78\xc6\xeb\x3e\xb3\x35\
-\x81\x99\xa9\x62\xdf\xce\x49\x8a\xf7\x8f\x01\x70\x5b\x2b\xfa\x87\
-\x46\x37\xdd\x98\xc0\xfe\x54\xb1\x6f\x97\x27\xc5\x7b\x64\x00\xec\
-\xc1\xd2\xbe\xc1\x91\x8d\x57\x25\xb0\x0f\x55\xec\xd3\x29\x49\xf1\
-\x2e\xed\x09\x80\xbd\xea\x1d\x18\xde\x30\x31\x9d\xc0\x1e\x55\xb1\
-\x4f\x83\x49\xf1\x86\x03\x60\x3f\x0e\xef\x5f\x33\x32\xbe\x33\x81\
-\xdb\xab\x62\x9f\xde\x9a\x94\x6e\xfa\x9e\x01\x30\x13\x4b\xfa\x56\
-\x0f\x8f\x5d\x96\xc0\x6e\xaa\xd8\xa7\x6f\x24\xa5\xfb\x62\x00\xcc\
-\xc2\xf1\x8f\x3f\xf3\x03\x17\x4d\x26\xf0\x53\x55\xec\xcb\x61\x93\
-\x49\xe9\xfe\x20\x00\x66\x6b\x59\xdf\xe0\xc8\xc6\x1f\x25\x50\xc5\
-\xbe\xfc\x5a\x52\xba\xa9\xde\x00\x98\x9b\xde\x81\xe1\x0d\x13\xd3\
-\x09\xdd\xac\x8a\x7d\x19\x4e\x4a\xb7\x31\x00\xe6\xe3\xf0\xfe\xa1\
-\xf5\xe3\x3b\x13\xba\x54\x15\xfb\xf2\xe9\xa4\x74\xbf\x13\x00\xf3\
-\xb6\xa4\x6f\xf5\xf0\xd8\xe5\x09\xdd\xa7\x8a\x7d\x58\x74\x4d\x52\
-\xb8\x9b\x8e\x0a\x80\x0e\xe9\x5d\x35\x34\x3a\x31\x99\xd0\x4d\xaa\
-\xd8\x87\xfb\x25\xa5\xfb\x78\x00\x74\xd4\xb2\xbe\xc1\x91\xf1\x6d\
-\x09\x5d\xa2\x8a\x7d\xf8\xbd\xa4\x74\x67\x04\x40\x0d\x7a\x07\x86\
-\x37\x4c\x4c\x27\xb4\x5e\x15\xfb\xf0\x9e\xa4\x70\x3b\x0f\x0d\x80\
-\xba\x1c\xf5\x98\x97\xbc\xe7\xeb\x37\x25\xb4\x59\x15\xfb\x70\x71\
-\x52\xb8\x0d\x01\x50\xaf\x25\x7d\xab\x87\xc7\xb6\x26\xb4\x54\x15\
-\x7b\x77\xe4\x74\x52\xb8\xd3\x03\xa0\x09\xbd\xab\x86\x46\x27\xa6\
-\x12\x5a\xa7\x8a\xbd\xfb\xf5\xa4\x70\xd7\xdd\x29\x00\x1a\x73\xc8\
-\xca\xc1\x91\xf1\xed\x09\x6d\x52\xc5\xde\xbd\x32\x29\xdc\x7b\x02\
-\xa0\x69\xbd\x03\xc3\x63\x9b\x13\x5a\xa2\x8a\xbd\xfb\x97\xa4\x70\
-\x8f\x0f\x80\x03\xe2\x88\xfe\xa1\xf5\xe3\xd7\x27\x14\xaf\x8a\xbd\
-\xdb\x9a\x94\xed\x47\xcb\x02\xe0\xc0\x59\xda\x37\xb8\x6e\x6c\x6b\
-\x42\xc9\xaa\xd8\xab\x93\x92\xc2\xbd\x2d\x00\x0e\xb8\xde\x55\x43\
-\xa3\x13\x53\x09\x65\xaa\x62\xaf\x9e\x99\x14\xee\x51\x01\xb0\x30\
-\x1c\xba\x72\x70\x64\x7c\x7b\x42\x71\xaa\xd8\xab\x37\x24\x65\xbb\
-\x6c\x71\x00\x2c\x20\x8b\xef\xf3\xcc\x75\x9f\xdc\x92\x50\x92\x2a\
-\xf6\x6a\x3c\x29\xdb\xdf\x07\xc0\xc2\xb3\xa2\x7f\x68\x74\xd3\x0d\
-\x09\x65\xa8\x62\x6f\x96\xee\x48\xca\xf6\xab\x01\xb0\x40\x2d\xed\
-\x1b\x5c\x37\x76\x45\xc2\x82\x57\xc5\xde\x3c\x28\x29\xdb\xd5\xcb\
-\x02\x60\x41\xeb\x1d\x58\x3b\x3a\x31\x95\xb0\x80\x55\xb1\x37\xbf\
-\x97\x94\x6d\x34\x00\x0a\x70\xe8\xca\xc1\x91\xf1\x1d\x09\x0b\x53\
-\x15\x7b\xf3\xce\xa4\x6c\xbf\x11\x00\xa5\x58\x7c\xf2\xc0\xf0\xd8\
-\xe6\x84\x05\xa7\x8a\xbd\xf9\x66\x52\xb4\x9d\x77\x0e\x80\xb2\xdc\
-\xf5\xd7\xff\xef\x3f\x4d\xec\x4a\x58\x40\xaa\xd8\x8b\x83\x27\x93\
-\xa2\x7d\x34\x00\x4a\xb4\xb4\x6f\x70\x64\xe3\x95\x09\x0b\x43\x15\
-\x7b\xd1\x9f\x94\x6d\x30\x00\xca\xd5\x3b\xb0\x76\x74\x62\x2a\xe1\
-\x40\xab\x62\x2f\x86\x92\xa2\xed\x3a\x3a\x00\x0a\x77\x58\xff\x9a\
-\x91\xf1\x1d\x09\x07\x50\x15\x7b\x31\x9a\x14\xed\xb3\x01\xd0\x0a\
-\x4b\x4e\x1e\x18\x1e\xdb\x92\x70\x60\x54\xb1\x17\x13\x49\xd1\x7e\
-\x3f\x00\x5a\x64\x45\xff\xd0\xe8\xa6\x1b\x13\x9a\x56\xc5\x9e\x1d\
-\x32\x99\x94\x6c\xfa\x6e\x01\xd0\x36\x4b\xfb\x06\x47\x36\x5e\x95\
-\xd0\xa0\x2a\xf6\xac\x3f\x29\xda\xf9\x01\xd0\x52\xbd\x03\xc3\x1b\
-\x26\xa6\x13\x1a\x51\xc5\x9e\xfd\x51\x52\xb4\xb5\x01\xd0\x66\x87\
-\xf5\xaf\x19\x19\xdf\x99\x50\xb7\x2a\xf6\xec\xec\xa4\x68\xbf\x10\
-\x00\xad\xb7\xa4\x6f\xf5\xf0\xd8\x65\x09\x35\xaa\x62\xcf\xaa\xa4\
-\x64\x13\x01\xd0\x2d\x56\xf4\x0f\x8d\x4e\x4c\x26\xd4\xa2\x8a\x3d\
-\x3a\x64\x32\x29\xd9\x5f\x06\x40\x57\x59\xd6\x37\x38\xb2\xf1\xaa\
-\x84\x4e\xab\x62\x8f\xfa\x93\xa2\x3d\x38\x00\xba\xcf\xa2\x53\x9e\
-\xf6\xea\x8f\x7f\x2f\xa1\x83\xaa\xd8\xa3\x3f\x4a\x4a\x76\x59\x4f\
-\x00\x74\xab\xc3\xfb\xd7\x8c\x8c\xef\x4c\xe8\x88\x2a\xf6\x68\x34\
-\x29\xd9\x3b\x03\xa0\xbb\x2d\xbd\xff\xe0\x1b\x3e\x7b\x55\xc2\x7c\
-\x55\xb1\x47\xdf\x4a\x4a\xf6\xb4\x00\x20\xa2\x77\xd5\xd0\xe8\xc4\
-\x64\xc2\xdc\x55\xb1\x27\x07\xed\x4a\x0a\x76\xd3\x11\x01\xc0\x2d\
-\x96\xf5\x0d\x8e\x8c\x6f\x4b\x98\x93\x2a\xf6\xe4\xc1\x49\xc9\xce\
-\x0d\x00\x6e\xab\x77\x60\x78\xc3\xc4\x74\xc2\x2c\x55\xb1\x27\x2f\
-\x48\x4a\xf6\xd2\x00\x60\x0f\x0e\xef\x1f\x5a\x3f\x7e\x7d\xc2\xcc\
-\x55\xb1\x27\x6f\x4e\x4a\x76\xdf\x00\x60\x6f\x96\xf4\xad\x1e\x1e\
-\xdb\x9a\x30\x23\x55\xec\xc9\x78\x52\xb0\xef\x05\x00\xfb\xd1\xbb\
-\x6a\x68\x74\x62\x2a\x61\x3f\xaa\xd8\x83\x9e\x6b\x93\x82\xbd\x39\
-\x00\x98\x89\x43\x56\x0e\x8e\x8c\x6f\x4f\xd8\xbb\x2a\xf6\xe0\x5e\
-\x49\xc9\x1e\x1f\x00\xcc\x5c\xef\xc0\xf0\xd8\xe6\xe9\x84\x3d\xa9\
-\x62\x0f\x9e\x96\x14\x6c\xe7\xc1\x01\xc0\x2c\x1d\xd1\x3f\xb4\x7e\
-\xfc\xfa\x84\xdb\xa9\x62\x0f\x5e\x9d\x14\xec\x13\x01\xc0\x9c\x2c\
-\xed\x1b\x5c\x37\xb6\x35\xe1\xe7\xaa\xd8\x83\xb1\xa4\x60\xbf\x1f\
-\x00\xcc\x43\xef\xaa\xa1\xd1\x89\xa9\x84\x9f\xa8\x62\x0f\x7e\x90\
-\x14\xec\x9e\x01\xc0\x7c\x1d\xba\x72\x70\x64\x7c\x7b\xd2\xf5\xaa\
-\xb8\xa3\xa3\x92\x82\x4d\x04\x00\x1d\xd2\x3b\x30\x3c\xb6\x39\xe9\
-\x66\x55\xdc\xd1\xaa\xa4\x60\xaf\x0f\x00\x3a\xe9\x88\xfe\xa1\xd1\
-\x4d\x37\x24\xdd\xa9\x8a\x3b\x7a\x49\x52\xb0\x47\x05\x00\x1d\xb7\
-\x7c\xe5\xf3\x46\xbe\x70\x75\xd2\x75\xaa\xb8\xa3\x77\x26\xe5\xba\
-\x76\x69\x00\x50\x93\x7b\x3c\xf9\xcf\x3f\xb2\x79\x3a\xe9\x22\x55\
-\xdc\xd1\xa6\xa4\x5c\x1f\x0f\x00\x6a\x75\xe8\xca\xc1\x91\xf1\x1d\
-\x49\x77\xa8\xe2\x0e\x16\x6d\x4f\xca\x35\x14\x00\xd4\x6f\xf1\xc9\
-\x03\xc3\x63\x9b\x93\xd6\xab\xe2\x0e\xee\x95\x14\xac\x2f\x00\x68\
-\xca\x8a\xfe\xa1\xd1\x4d\x37\x24\x2d\x56\xc5\x1d\x9c\x9e\x94\xeb\
-\xf2\x9e\x00\xa0\x51\x4b\xfb\x06\x47\x36\x5e\x99\xb4\x53\x15\x77\
-\xf0\xe7\x49\xb9\xce\x0e\x00\x0e\x84\xde\x81\xb5\xa3\x13\x53\x49\
-\xdb\x54\x71\x07\x1f\x4c\xca\xf5\xdb\x01\xc0\x01\x73\x58\xff\x9a\
-\x91\xf1\x1d\x49\x8b\x54\x71\x07\xdf\x4e\xca\x75\x62\x00\x70\x60\
-\x2d\x39\x79\x60\x78\x6c\x4b\xd2\x0e\x55\xdc\xde\xf2\x5d\x49\xb1\
-\x2e\x0a\x00\x16\x84\x15\xfd\x43\xa3\x9b\x6e\x4c\x4a\x57\xc5\xed\
-\x3d\x30\x29\xd7\x5b\x02\x80\x85\x63\x69\xdf\xe0\xc8\xc6\xab\x92\
-\x82\x55\x71\x7b\x83\x49\xb9\x4e\x0f\x00\x16\x9a\xde\x81\xe1\x0d\
-\x13\xd3\x49\x91\xaa\xb8\xbd\xd7\x25\xc5\x9a\x3c\x32\x00\x58\x90\
-\x0e\xeb\x5f\x33\x32\xbe\x33\x29\x4d\x15\xb7\xf7\xc9\xa4\x58\x17\
-\x04\x00\x0b\xd8\x92\xbe\xd5\xc3\x63\x97\x25\x05\xa9\xe2\xf6\x7e\
-\x90\x14\xeb\xb5\x01\xc0\x82\xb7\xa2\x7f\x68\x74\x62\x32\x29\x42\
-\x15\xb7\x73\x78\x52\xae\xc7\x04\x00\x65\x38\xf8\x21\x6b\xfe\xfe\
-\x8b\xd7\x25\x0b\x5d\x15\xb7\xf3\x2b\x49\xb1\xae\xbf\x53\x00\x50\
-\x92\xde\x81\xe1\x0d\x13\xd3\xc9\xc2\x55\xc5\xed\x3c\x37\x29\xd6\
-\xc6\x00\xa0\x3c\x87\xf7\xaf\x19\x19\xdf\x99\x2c\x48\x55\xdc\xce\
-\xeb\x92\x62\xfd\x69\x00\x50\xa8\x25\x7d\xab\x87\xc7\x2e\x4f\x16\
-\x9a\x2a\x6e\xe7\xe3\x49\xb1\x1e\x1c\x00\x14\xed\x6e\x4f\x78\xd9\
-\x86\xef\x4c\x25\x0b\x47\x15\xb7\x73\x49\x52\xaa\x6d\x4b\x02\x80\
-\xf2\x2d\xeb\x1b\x1c\x19\xdf\x96\x2c\x08\x55\xdc\xd6\x41\x93\x49\
-\xa9\x3e\x1d\x00\xb4\x46\xef\xc0\xf0\x86\x89\xe9\xe4\x00\xab\xe2\
-\xb6\xee\x97\x14\xeb\x15\x01\x40\xbb\x1c\xde\x3f\xb4\x7e\xfc\xfa\
-\xe4\xc0\xa9\xe2\xb6\x9e\x91\x14\xeb\xd4\x00\xa0\x85\x96\xf4\xad\
-\x1e\x1e\xbb\x3c\x39\x20\xaa\xb8\xad\xe1\xa4\x54\x37\x1e\x1c\x00\
-\xb4\x56\xef\xaa\xa1\xd1\x89\xa9\xa4\x61\x55\xdc\xd6\x07\x92\x52\
-\x8d\x07\x00\x2d\x77\xc8\xca\xc1\x91\xf1\xed\x49\x73\xaa\xb8\xad\
-\x0b\x93\x52\x9d\x15\x00\x74\x85\xde\x81\xe1\xb1\xcd\xd3\x49\x13\
-\xaa\xb8\x8d\xc5\xd7\x27\xa5\x7a\x7c\x00\xd0\x3d\x8e\xe8\x1f\x5a\
-\x3f\x7e\x7d\x52\xb3\x2a\x6e\xe3\x5e\x49\xa9\xa6\x8e\x08\x00\xba\
-\xcc\xd2\xbe\xc1\x75\x63\x5b\x93\xfa\x54\x71\x1b\x03\x49\xa9\xbe\
-\x1e\x00\x74\xa7\x13\x9f\xf4\x67\x1f\xba\x64\x3a\xa9\x43\x15\xb7\
-\xf1\x27\x49\xa9\xfe\x2e\x00\xe8\x62\x87\xae\x1c\x1c\x19\xdf\x9e\
-\x74\x58\x15\xb7\xf1\xf6\xa4\x54\x4f\x0f\x00\xba\x5e\xef\xc0\xf0\
-\xd8\xe6\xa4\x73\xaa\xb8\x8d\x2f\x24\xa5\xea\x0d\x00\xf8\x89\x23\
-\xfa\x87\x46\x37\xdd\x90\x74\x42\x15\xb7\xb1\x25\x29\xd4\x25\x01\
-\x00\x3f\xb7\xb4\x6f\x70\xdd\xd8\x15\xc9\x3c\x55\xb1\xbb\x43\xa7\
-\x93\x42\xbd\x2b\x00\xe0\xf6\x7a\x07\xd6\x8e\x4e\x4c\x25\x73\x56\
-\xc5\xee\x56\x26\xa5\x7a\x5e\x00\xc0\x1e\x1d\xba\x72\x70\x64\x7c\
-\x47\x32\x17\x55\xec\xee\x59\x49\xa9\x4e\x09\x00\xd8\xbb\xc5\x27\
-\x0f\x0c\x8f\x6d\x4e\x66\xa9\x8a\xdd\xfd\x79\x52\xa8\xcb\x02\x00\
-\xf6\x6b\x45\xff\xd0\xe8\xa6\x1b\x92\x19\xab\x62\x77\xef\x4d\x0a\
-\xf5\xe1\x00\x80\x99\x59\xda\x37\x38\xb2\xf1\xca\x64\x26\xaa\xd8\
-\xdd\x05\x49\xa1\xd6\x06\x00\xcc\x46\xef\xc0\xda\xd1\x89\xa9\x64\
-\xdf\xaa\xd8\xdd\xd5\x49\xa1\x4e\x0b\x00\x98\xb5\xc3\xfa\xd7\x8c\
-\x8c\xef\x48\xf6\xaa\x8a\xdd\x1c\x9b\x14\x6a\xea\xb0\x00\x80\xb9\
-\x59\x72\xf2\xc0\xf0\xd8\x96\x64\x4f\xaa\xd8\x4d\x7f\x52\xa8\x6f\
-\x06\x00\xcc\xcb\x8a\xfe\xa1\xd1\x4d\x37\x26\xb7\x55\xc5\x6e\x9e\
-\x97\x14\xea\x1d\x01\x00\xf3\xb7\xb4\x6f\x70\x64\xe3\x95\xc9\xad\
-\xaa\xd8\xcd\x59\x49\xa1\x7e\x37\x00\xa0\x43\x7a\x4e\x3e\xfd\x2f\
-\xce\xb9\x34\xf9\x89\x2a\x76\xb3\x21\x29\xd4\x03\x02\x00\x3a\xea\
-\xb0\xfe\x35\x23\xe3\x3b\xb3\xdb\x55\xb1\x9b\x4d\x49\x99\x76\x2c\
-\x09\x00\xe8\xbc\x25\x7d\xab\x87\xc7\x2e\xcb\x2e\x56\xc5\x6e\x7e\
-\x9c\x94\xe9\xbc\x00\x80\xda\xac\xe8\x1f\x1a\x9d\x98\xcc\xae\x54\
-\xc5\xcf\x1d\x99\x14\xea\xaf\x03\x00\xea\xb5\xac\x6f\x70\x64\xe3\
-\x55\xd9\x6d\xaa\xf8\xb9\x5f\x4e\x0a\xf5\xf4\x00\x80\x26\xf4\x0e\
-\x0c\x6f\x98\x98\xce\xee\x51\xc5\xcf\x3d\x23\x29\xd4\x3d\x02\x00\
-\x1a\x73\x78\xff\x9a\x91\xf1\x9d\xd9\x15\xaa\xf8\xb9\x33\x93\x32\
-\x5d\x11\x00\xd0\xb0\x25\x7d\xab\x87\xc7\x2e\xcf\xb6\xab\xe2\xe7\
-\xfe\x21\x29\xd3\x58\x00\xc0\x01\xd1\xbb\x6a\x68\x74\x62\x32\xdb\
-\xab\x8a\x9f\x3b\x37\x29\xd3\x9f\x05\x00\x1c\x38\xcb\xfa\x06\x47\
-\xc6\xb7\x65\x2b\x55\xf1\x73\xdf\x4d\xca\xf4\x6b\x01\x00\x07\x5a\
-\xef\xc0\xf0\x86\x89\xe9\x6c\x99\x2a\x6e\xb5\x6c\x32\x29\xd2\xf4\
-\x51\x01\x00\x0b\xc2\xe1\xfd\x43\xeb\xc7\xaf\xcf\xf6\xa8\xe2\x56\
-\xf7\x4a\xca\x74\x71\x00\xc0\x02\xb2\xec\x01\xcf\xf9\x9b\xcf\xfd\
-\x28\x5b\xa1\x8a\x5b\x3d\x36\x29\xd3\xfb\x03\x00\x16\x9c\xde\x55\
-\x43\xa3\x13\x53\x59\xb8\x2a\x6e\xf5\xfb\x49\x99\xce\x0c\x00\x58\
-\x98\x96\xf5\x0d\x8e\x8c\x6f\xcf\x72\x55\x71\xab\xbf\x4e\xca\xf4\
-\xf8\x00\x80\x05\x6c\xd1\x2f\x3c\xfd\xb5\x9f\xf8\xef\x2c\x52\x15\
-\xb7\xfa\x60\x52\xa6\xe3\x02\x00\x16\xbc\x23\xfa\x87\xd6\x8f\x5f\
-\x9f\x85\xa9\xe2\x56\xff\x91\x14\x69\x6b\x00\x40\x21\x96\xf6\x0d\
-\xae\x1b\xdb\x9a\xe5\xa8\xe2\x56\x57\x24\x45\xfa\x54\x00\x40\x51\
-\x7a\x57\x0d\x8d\x4e\x4c\x65\x09\xaa\xf8\x99\x83\xa7\x93\x22\xad\
-\x0b\x00\x28\xcf\xa1\x2b\x07\x47\xc6\xb7\xe7\x02\x57\xc5\xcf\xdc\
-\x27\x29\xd3\xb3\x02\x00\x4a\xd5\x3b\x30\x3c\xb6\x39\x17\xae\x2a\
-\x7e\xe6\xb1\x49\x99\xee\x13\x00\x50\xb4\x23\xfa\x87\x46\x37\xdd\
-\x90\x0b\x51\x15\x3f\xf3\x7b\x49\x91\x76\x2e\x0e\x00\x28\xdf\xd2\
-\xbe\xc1\x75\x63\x57\xe4\x02\x53\xc5\xcf\x9c\x95\x14\xe9\xfc\x00\
-\x80\xd6\xe8\x1d\x58\x3b\x3a\x31\x95\x0b\x46\x15\x3f\xf3\x4f\x49\
-\x91\xde\x16\x00\xd0\x2e\x87\xae\x1c\x1c\x19\xdf\x91\x0b\x41\x15\
-\x3f\xf3\xc5\xa4\x48\x2f\x0c\x00\x68\xa1\xc5\x27\x0f\x0c\x8f\x6d\
-\xce\x03\xac\x8a\x9f\xf9\x61\x52\xa4\x87\x06\x00\xb4\xd6\x8a\xfe\
-\xa1\xd1\x4d\x37\xe4\x01\x53\xc5\x2d\x96\x4d\x25\x25\x9a\x3a\x24\
-\x00\xa0\xdd\x96\xf6\x0d\xae\x1b\xbb\x32\x0f\x84\x2a\x6e\x71\x4a\
-\x52\xa4\x8b\x02\x00\xba\x42\xef\xc0\xda\xd1\x89\xa9\x6c\x56\x15\
-\xb7\x78\x4c\x52\xa4\xf7\x07\x00\x74\x8f\xc3\xfa\xd7\x8c\x8c\xef\
-\xc8\xc6\x54\x71\x8b\xdf\x4e\x8a\x74\x66\x00\x40\x97\x59\xd2\xf7\
-\xec\xbf\xfa\xf4\xe5\xd9\x84\x2a\x6e\xf1\x8a\xa4\x48\x4f\x08\x00\
-\xe8\x4a\x77\xfd\xf5\xb5\xff\x34\x31\x99\xf5\xaa\xe2\x16\x6f\x4b\
-\x8a\x74\x52\x00\x40\xf7\x5a\xda\x37\x38\xb2\xf1\xca\xac\x4d\x15\
-\xb7\xf8\x97\xa4\x44\x3b\x16\x05\x00\x74\xbb\xde\x81\xb5\xa3\x13\
-\xd3\x59\x83\x2a\x6e\xf1\xf5\xa4\x44\x5f\x0d\x00\xe0\x27\x0e\xeb\
-\x5f\x33\x32\xbe\x33\x3b\xab\x8a\x5b\x5c\x95\x94\xe8\x7d\x01\x00\
-\xdc\x6a\x49\xdf\xea\xe1\xb1\xcb\xb2\x63\xaa\xb8\xd9\x41\xd3\x49\
-\x89\x5e\x11\x00\xc0\xed\xac\xe8\x1f\x1a\x9d\x98\xcc\x0e\xa8\xe2\
-\x66\xa7\x24\x45\x3a\x3d\x00\x80\x3d\x59\xd6\x37\x38\xb2\xf1\xaa\
-\x9c\x9f\x2a\x6e\x76\x5a\x52\xa4\xfb\x04\x00\xb0\x77\xbd\x03\xc3\
-\x1b\x26\xa6\x73\xae\xaa\xb8\xd9\x6f\x26\x25\xba\x69\x69\x00\x00\
-\xfb\x71\x78\xff\x9a\x91\xf1\x9d\x39\x07\x55\xdc\x6c\x6d\x52\xa2\
-\x89\x00\x00\x66\x64\x49\xdf\xea\xe1\xb1\xcb\x72\x76\xaa\xb8\xd9\
-\xdf\x26\x25\xfa\x50\x00\x00\xb3\xb0\xa2\x7f\x68\x74\x62\x32\x67\
-\xaa\x8a\x9b\x7d\x24\x29\xd1\xab\x03\x00\x98\xad\x65\x7d\x83\x23\
-\xe3\xdb\x72\x06\xaa\xb8\xd9\x05\x49\x89\x9e\x1d\x00\xc0\xdc\xf4\
-\x0e\x0c\x6f\x98\x98\xce\x7d\xaa\xe2\x66\x5b\x92\x12\x3d\x20\x00\
-\x80\x79\x38\xbc\x7f\x68\xfd\xf8\xf5\xb9\x37\x55\xfc\xd4\xe2\xc9\
-\xa4\x40\x53\x07\x07\x00\x30\x5f\x4b\xfa\x56\x0f\x8f\x5d\x9e\x7b\
-\x50\xc5\x4f\x1d\x97\x94\x68\x73\x00\x00\x1d\xd2\xbb\x6a\x68\x74\
-\x62\x2a\x6f\xa3\x8a\x9f\x7a\x50\x52\xa2\xb1\x00\x00\x3a\x69\x59\
-\xdf\xe0\xc8\xf8\xb6\xfc\x99\x2a\x7e\xea\x09\x49\x89\x5e\x17\x00\
-\x40\xe7\xf5\x0e\x0c\x8f\x6d\x9e\xce\xcc\x2a\x7e\xea\x79\x49\x89\
-\x9e\x1b\x00\x40\x4d\x8e\x7e\xcc\x1f\x8f\x7e\x28\x7e\xea\x15\x49\
-\x89\x1e\x16\x00\x40\xfd\xde\x9c\x94\xe8\x2e\x01\x00\xd4\xef\xc3\
-\x49\x81\xb6\xf5\x04\x00\x50\xbf\x2f\x25\x05\xfa\x46\x00\x00\x0d\
-\xb8\x34\x29\xd0\x47\x02\x00\x68\xc0\xce\xa4\x40\xaf\x0f\x00\xa0\
-\x7e\x47\x24\x25\xfa\xbd\x00\x00\xea\x77\x9f\xa4\x44\xbf\x1a\x00\
-\x40\xfd\x1e\x9d\x94\xe8\xe4\x00\x00\xea\xf7\xac\xa4\x40\xbb\x96\
-\x04\x00\x50\xbf\x17\x27\x05\xba\x24\x00\x80\x06\xbc\x36\x29\xd0\
-\xa7\x03\x00\x68\xc0\x3b\x92\x02\xfd\x7d\x00\x00\x0d\xf8\x58\x52\
-\xa0\x3f\x0e\x00\xa0\x01\x5f\x4a\x0a\xf4\x94\x00\x00\x1a\x70\x49\
-\x52\xa0\x5f\x0a\x00\xa0\x01\xd7\x26\x05\x3a\x24\x00\x80\xfa\x2d\
-\x4f\x0a\x74\x59\x00\x00\x0d\xb8\x5b\x52\xa0\xf1\x00\x00\x1a\xf0\
-\xa0\xa4\x40\x67\x07\x00\xd0\x80\x5f\x4f\x0a\xf4\xda\x00\x00\x1a\
-\xf0\x5b\x49\x81\x5e\x14\x00\x40\x03\x5e\x92\x14\xe8\x49\x01\x00\
-\x34\xe0\xac\xa4\x40\x0f\x0c\x00\xa0\x01\xef\x48\x0a\x74\x6c\x00\
-\x00\x0d\x38\x27\x29\xcf\xf5\x3d\x01\x00\x34\xe0\xdf\x93\xf2\xfc\
-\x67\x00\x00\x4d\xf8\x56\x52\x9e\xcf\x07\x00\xd0\x84\x2d\x49\x79\
-\x46\x03\x00\x68\xc2\x0d\x49\x79\x5e\x13\x00\x40\x03\xee\x9c\x14\
-\xe8\x85\x01\x00\x34\xe0\x84\xa4\x40\x03\x01\x00\x34\xe0\xfe\x49\
-\x81\x1e\x10\x00\x40\x03\x1e\x95\x14\xe8\xe8\x00\x00\x1a\xf0\xd4\
-\xa4\x3c\xd7\xf7\x04\x00\xd0\x80\x17\x24\xe5\xb9\x38\x00\x80\x26\
-\xac\x4d\xca\xf3\xb9\x00\x00\x9a\xf0\x57\x49\x79\xde\x13\x00\x40\
-\x13\xde\x9e\x94\x67\x5d\x00\x00\x4d\xf8\x50\x52\x9e\x97\x04\x00\
-\xd0\x84\xcf\x25\xe5\x39\x23\x00\x80\x26\xfc\x47\x52\x9e\x55\x01\
-\x00\x34\xe1\xe2\xa4\x3c\xf7\x0b\x00\xa0\x09\x5b\x93\xf2\xdc\x35\
-\x00\x80\x26\xdc\x90\x14\x67\x6a\x49\x00\x00\x0d\x58\x9e\x94\xe7\
-\xca\x00\x00\x9a\x70\x4c\x52\x9e\x6f\x05\x00\xd0\x84\x53\x92\xf2\
-\x9c\x1b\x00\x40\x13\x56\x26\xe5\x79\x7f\x00\x00\x4d\x78\x54\x52\
-\x9e\x91\x00\x00\x9a\xf0\x94\xa4\x3c\xaf\x08\x00\xa0\x09\xcf\x49\
-\xca\xf3\x82\x00\x00\x9a\xf0\x87\x49\x79\x9e\x1c\x00\x40\x13\x5e\
-\x91\x94\xe7\xa1\x01\x00\x34\xe1\xf5\x49\x79\xee\x19\x00\x40\x13\
-\xde\x96\x94\xe7\xd0\x00\x00\x9a\x70\x76\x52\x9c\x9d\x01\x00\x34\
-\xe2\x23\x49\x71\xbe\x17\x00\x40\x23\x3e\x93\x14\xe7\xeb\x01\x00\
-\x34\xe2\x4b\x49\x71\xbe\x10\x00\x40\x23\xbe\x91\x14\xe7\x63\x01\
-\x00\x34\x62\x73\x52\x9c\xf7\x04\x00\xd0\x88\xcb\x93\xe2\x8c\x04\
-\x00\xd0\x88\xed\x49\x71\xfe\x22\x00\x80\x26\xf4\x4c\x25\xc5\x79\
-\x49\x00\x00\x4d\xb8\x73\x52\x9e\xe7\x05\x00\xd0\x84\xbb\x24\xe5\
-\x79\x6a\x00\x00\x4d\x38\x39\x29\xcf\x63\x02\x00\x68\xc2\xfd\x92\
-\xf2\xac\x0c\x00\xa0\x09\x0f\x4d\xca\x73\xcf\x00\x00\x9a\xf0\x98\
-\xa4\x3c\x47\x07\x00\xd0\x84\x27\x26\xe5\x59\x1a\x00\x40\x13\x9e\
-\x96\x14\x67\x5b\x00\x00\x8d\xf8\xad\xa4\x38\x3f\x08\x00\xa0\x11\
-\x2f\x48\x8a\xf3\xcd\x00\x00\x1a\xf1\x7f\x92\xe2\x8c\x07\x00\xd0\
-\x88\x97\x26\xc5\xf9\x44\x00\x00\x8d\x78\x65\x52\x9c\x0f\x04\x00\
-\xd0\x88\xd7\x24\xc5\x79\x77\x00\x00\x8d\x78\x43\x52\x9c\xbf\x0f\
-\x00\xa0\x11\x6f\x49\x8a\xf3\x86\x00\x00\x1a\xf1\xce\xa4\x38\xaf\
-\x0e\x00\xa0\x11\xff\x94\x14\xe7\x65\x01\x00\x34\xe2\x23\x49\x71\
-\x5e\x1c\x00\x40\x23\xfe\x35\x29\xce\xef\x06\x00\xd0\x88\x73\x93\
-\xe2\x0c\x06\x00\xd0\x88\xf3\x92\xe2\x3c\x2d\x00\x80\x46\x9c\x9f\
-\x14\xe7\x09\x01\x00\x34\xe2\x2b\x49\x71\x1e\x15\x00\x40\x23\x2e\
-\x4c\x8a\xf3\x90\x00\x00\x1a\xf1\xed\xa4\x38\xf7\x0b\x00\xa0\x11\
-\x97\x24\xc5\x39\x25\x00\x80\x46\x7c\x2f\x29\xce\xf1\x01\x00\x34\
-\x62\x4b\x52\x9c\x15\x01\x00\x34\xe2\xca\xa4\x38\x07\x05\x00\xd0\
-\x88\x6b\x92\xd2\x4c\xf5\x04\x00\xd0\x88\xed\x49\x69\x76\x06\x00\
-\xd0\x8c\x9b\x92\xd2\x6c\x0b\x00\xa0\x19\xd3\x49\x69\xae\x09\x00\
-\xa0\x19\x49\x71\x7e\x14\x00\x40\x33\x92\xe2\x5c\x11\x00\x40\x33\
-\x92\xe2\x5c\x16\x00\x40\x33\x92\xe2\xfc\x20\x00\x80\x66\x24\xc5\
-\xf9\x6e\x00\x00\xcd\x48\x8a\xb3\x39\x00\x80\x66\x24\xc5\xb9\x38\
-\x00\x80\x66\x24\xc5\xf9\x76\x00\x00\xcd\x48\x8a\xf3\xad\x00\x00\
-\x9a\x91\x14\xe7\x1b\x01\x00\x34\x23\x29\xce\x57\x03\x00\x68\x46\
-\x52\x9c\xff\x08\x00\xa0\x19\x49\x71\xbe\x1c\x00\x40\x33\x92\xe2\
-\x8c\x07\x00\xd0\x8c\xa4\x38\xff\x16\x00\x40\x33\x92\xe2\x9c\x1b\
-\x00\x40\x33\x92\xe2\x6c\x0c\x00\xa0\x19\x49\x71\x3e\x1b\x00\x40\
-\x33\x92\xe2\x7c\x3e\x00\x80\x66\x24\xc5\xf9\xf7\x00\x00\x9a\x91\
-\x14\xe7\x8b\x01\x00\x34\x23\x29\xce\xf9\x01\x00\x34\x23\x29\xce\
-\xa6\x00\x00\x9a\x91\x14\xe7\x6b\x01\x00\x34\x23\x29\xce\x85\x01\
-\x00\x34\x23\x29\xce\x44\x00\x00\xcd\x48\x8a\x73\x51\x00\x00\xcd\
-\x48\x8a\xf3\x9f\x01\x00\x34\x23\x29\xce\x7f\x05\x00\xd0\x8c\xa4\
-\x38\xdf\x0b\x00\xa0\x19\x49\x71\xfe\x3b\x00\x80\x66\x24\xc5\xb9\
-\x3c\x00\x80\x66\x24\xc5\xb9\x32\x00\x80\x66\x24\xc5\xf9\x71\x00\
-\x00\xcd\x98\x4a\x4a\x73\x6d\x00\x00\xcd\xb8\x31\x29\xcd\xf6\x00\
-\x00\x9a\xb1\x2d\x29\xcd\x0d\x01\x00\x34\xe3\xea\xa4\x38\x8b\x02\
-\x00\x68\xc4\x15\x49\x71\xee\x1c\x00\x40\x23\x7e\x98\x14\xe7\xe8\
-\x00\x00\x1a\xf1\xdd\xa4\x38\x77\x0f\x00\xa0\x11\xff\x99\x14\xe7\
-\xde\x01\x00\x34\xa2\x4a\x8a\xf3\xc0\x00\x00\x1a\xf1\x8d\xa4\x38\
-\x0f\x0f\x00\xa0\x11\x9b\x92\xe2\xac\x0a\x00\xa0\x11\x5f\x4e\x8a\
-\xf3\xa4\x00\x00\x1a\xf1\xef\x49\x71\x9e\x11\x00\x40\x23\x3e\x9b\
-\x14\xe7\xb9\x01\x00\x34\xe2\x13\x49\x71\x5e\x14\x00\x40\x23\x3e\
-\x94\x14\xe7\xa5\x01\x00\x34\xe2\xbd\x49\x71\x5e\x19\x00\x40\x23\
-\xde\x91\x14\xe7\xac\x00\x00\x1a\xf1\xe6\xa4\x38\x6f\x0a\x00\xa0\
-\x11\xaf\x4f\x8a\xf3\xf6\x00\x00\x1a\xf1\xea\xa4\x38\x67\x07\x00\
-\xd0\x88\x97\x27\xc5\xf9\x70\x00\x00\x8d\xf8\xe3\xa4\x38\x9f\x09\
-\x00\xa0\x11\xbf\x9f\x14\xe7\x82\x00\x00\x1a\xf1\xfc\xa4\x38\x17\
-\x07\x00\xd0\x88\x33\x92\xe2\x5c\x11\x00\x40\x23\x4e\x4f\x8a\x73\
-\x53\x00\x00\x8d\x78\x7c\x52\x9e\x83\x03\x00\x68\xc2\xa3\x92\xf2\
-\xf4\x06\x00\xd0\x84\x87\x24\xe5\xb9\x6f\x00\x00\x4d\xe8\x4b\xca\
-\xf3\xb0\x00\x00\x9a\x70\x8f\xa4\x3c\x8f\x0f\x00\xa0\x09\x47\x27\
-\xe5\x79\x56\x00\x00\x4d\xb8\x53\x52\x9e\x17\x06\x00\xd0\x88\xc9\
-\xa4\x38\x67\x06\x00\xd0\x88\x6b\x93\xe2\xac\x0b\x00\xa0\x11\x5b\
-\x92\xe2\xbc\x2d\x00\x80\x46\x5c\x9c\x14\xe7\xfd\x01\x00\x34\xe2\
-\x6b\x49\x71\x3e\x15\x00\x40\x23\xce\x4b\x8a\xf3\xe5\x00\x00\x1a\
-\xf1\xa9\xa4\x38\xdf\x0e\x00\xa0\x11\x1f\x4a\x8a\xb3\x35\x00\x80\
-\x46\xbc\x27\x29\xce\xe4\xe2\x00\x00\x9a\xf0\x96\xa4\x3c\xc7\x06\
-\x00\xd0\x84\xb3\x92\xf2\xfc\x52\x00\x00\x4d\x38\x33\x29\xcf\x63\
-\x02\x00\x68\xc2\x8b\x92\xf2\x3c\x2b\x00\x80\x26\x9c\x91\x94\xe7\
-\x8f\x02\x00\x68\xc2\x13\x93\xf2\xbc\x26\x00\x80\x26\x3c\x32\x29\
-\xcf\x3b\x02\x00\x68\xc2\xfd\x93\xf2\x7c\x3c\x00\x80\x26\xdc\x23\
-\x29\xcf\xf9\x01\x00\x34\x61\x45\x52\x9e\x4b\x03\x00\x68\xc2\xe2\
-\xe9\xa4\x38\x3b\x03\x00\x68\xc4\xf6\xa4\x3c\x87\x04\x00\xd0\x84\
-\x1f\x26\xe5\x39\x39\x00\x80\x26\x54\x49\x79\x1e\x1a\x00\x40\x13\
-\xce\x4f\xca\xf3\xe4\x00\x00\x9a\xf0\xa9\xa4\x3c\x2f\x08\x00\xa0\
-\x09\xff\x9c\x94\xe7\x15\x01\x00\x34\xe1\x2d\x49\x79\xfe\x2e\x00\
-\x80\x26\xbc\x2a\x29\xcf\x47\x03\x00\x68\xc2\x8b\x93\xf2\x6c\x0a\
-\x00\xa0\x09\xcf\x49\xca\x73\x79\x00\x00\x4d\x18\x48\xca\x33\xbd\
-\x3c\x00\x80\x06\x3c\x3c\x29\xd0\xc9\x01\x00\x34\xe0\xde\x49\x81\
-\x4e\x0d\x00\xa0\x01\xc7\x26\x05\x3a\x23\x00\x80\x06\x2c\x99\x4e\
-\xca\xf3\xa7\x01\x00\x34\xe1\xda\xa4\x3c\x6f\x0e\x00\xa0\x09\x97\
-\x26\xe5\xf9\x58\x00\x00\x4d\xf8\x4a\x52\x9e\xaf\x06\x00\xd0\x84\
-\x8d\x49\x79\xae\x08\x00\xa0\x09\x1f\x48\xca\x33\x7d\x50\x00\x00\
-\x0d\x78\x73\x52\xa0\x53\x02\x00\x68\xc0\x9f\x27\x05\x7a\x54\x00\
-\x00\x0d\x78\x51\x52\xa0\xdf\x0a\x00\xa0\x01\x4f\x4b\x0a\xf4\xb2\
-\x00\x00\x1a\x70\x6a\x52\xa0\xbf\x0f\x00\xa0\x01\xf7\x4d\x0a\xf4\
-\x2f\x01\x00\x34\xe0\xe8\xa4\x40\x55\x00\x00\x0d\x58\xb4\x2b\x29\
-\xcf\x0d\x8b\x02\x00\x68\xc0\xd6\xa4\x40\x27\x04\x00\xd0\x80\x6f\
-\x26\x05\x3a\x2d\x00\x80\x06\x9c\x9b\x14\xe8\xf9\x01\x00\x34\xe0\
-\xfd\x49\x81\x5e\x1b\x00\x40\x03\xfe\x2e\x29\xd0\x07\x02\x00\x68\
-\xc0\x2b\x93\x02\x7d\x25\x00\x80\x06\xfc\x5e\x52\xa0\x6b\x02\x00\
-\x68\xc0\x53\x92\x12\x1d\x15\x00\x40\xfd\x7e\x25\x29\xd1\xff\x0e\
-\x00\xa0\x7e\x27\x26\x25\x7a\x76\x00\x00\xf5\x5b\x3e\x9d\x14\xe8\
-\xcf\x02\x00\x68\xc0\x8f\x92\x02\xbd\x3b\x00\x80\x06\x4c\x24\x05\
-\x3a\x2f\x00\x80\x06\x7c\x36\x29\xd0\x96\x00\x00\x1a\x70\x76\x52\
-\xa2\x43\x02\x00\xa8\xdf\xeb\x92\x12\xfd\x52\x00\x00\xf5\x7b\x49\
-\x52\xa2\xd3\x03\x00\xa8\xdf\xb3\x92\x12\xbd\x3c\x00\x80\xfa\x9d\
-\x96\x94\xe8\xbd\x01\x00\xd4\xef\xde\x49\x89\xbe\x1a\x00\x40\xfd\
-\x0e\x4f\x4a\xb4\x63\x51\x00\x00\xf5\xdb\x91\x94\xe8\xe4\x00\x00\
-\xea\x77\x71\x52\xa2\x27\x04\x00\x50\xbf\x73\x93\x12\xfd\x49\x00\
-\x00\xf5\x3b\x3b\x29\xd1\x3b\x03\x00\xa8\xdf\x59\x49\x89\xce\x0f\
-\x00\xa0\x7e\x7f\x90\x94\xe8\xda\x9e\x00\x00\x6a\xf7\x94\xa4\x48\
-\x77\x0b\x00\xa0\x76\xbf\x9c\x14\xe9\x57\x03\x00\xa8\xdd\x5d\x93\
-\x22\x0d\x05\x00\x50\xbb\x45\x37\x26\x25\x7a\x5b\x00\x00\xf5\xbb\
-\x34\x29\xd1\xbf\x07\x00\x50\xbf\xf1\xa4\x44\x57\x05\x00\x50\xbf\
-\xf7\x27\x45\x3a\x36\x00\x80\xda\xfd\x75\x52\xa4\x53\x03\x00\xa8\
-\xdd\x1f\x25\x45\xfa\x83\x00\x00\x6a\xf7\xb4\xa4\x48\xef\x08\x00\
-\xa0\x76\xff\x3b\x29\xd2\xa6\x00\x00\x6a\x77\x6c\x52\xa4\x1b\x96\
-\x06\x00\x50\xb7\x9e\x1d\x49\x91\xee\x17\x00\x40\xed\xbe\x9d\x14\
-\x69\x30\x00\x80\xda\x7d\x2a\x29\xd2\xdf\x04\x00\x50\xbb\xb7\x25\
-\x45\x3a\x37\x00\x80\xda\x9d\x99\x14\xe9\xea\x9e\x00\x00\xea\xf6\
-\xec\xa4\x4c\x27\x06\x00\x50\xb7\x87\x27\x65\x7a\x4a\x00\x00\x75\
-\x3b\x3e\x29\xd3\x70\x00\x00\x75\x5b\x74\x43\x52\xa4\x73\x02\x00\
-\xa8\xdd\x25\x49\x91\xbe\x1b\x00\x40\xed\x3e\x97\x94\xe9\xc8\x00\
-\x00\xea\xf6\x8f\x49\x99\x1e\x15\x00\x40\xdd\xfe\x2c\x29\xd3\x8b\
-\x03\x00\xa8\xdb\x19\x49\x99\xde\x13\x00\x40\xdd\x7e\x25\x29\xd3\
-\x85\x01\x00\xd4\xed\xd8\xa4\x4c\x93\x87\x04\x00\x50\xb7\x6b\x93\
-\x32\x9d\x1a\x00\x40\xdd\xbe\x9e\x94\xe9\xff\x06\x00\x50\xb7\x8f\
-\x24\x65\xfa\x50\x00\x00\x75\x7b\x7d\x52\xa6\x1f\x04\x00\x50\xb7\
-\x17\x26\x85\x3a\x3e\x00\x80\x9a\xfd\x5a\x52\xa8\xdf\x08\x00\xa0\
-\x66\xa7\x24\x85\x5a\x17\x00\x40\xcd\x96\xec\x4a\xca\xf4\xf9\x00\
-\x00\xea\xf6\x5f\x49\x99\xb6\x2d\x0e\x00\xa0\x66\x1b\x93\x42\xfd\
-\x62\x00\x00\x35\x5b\x9f\x14\xea\xf9\x01\x00\xd4\xec\xa5\x49\xa1\
-\xde\x1e\x00\x40\xcd\x9e\x9c\x14\xea\x1b\x01\x00\xd4\xec\x3e\x49\
-\xa1\x26\x0f\x09\x00\xa0\x5e\xcb\x76\x25\x85\x3a\x35\x00\x80\x9a\
-\x5d\x92\x14\xea\x4f\x02\x00\xa8\xd9\xbf\x26\x85\xfa\x50\x00\x00\
-\x35\x7b\x53\x52\xa8\xcb\x02\x00\xa8\xd9\x8b\x92\x52\x9d\x12\x00\
-\x40\xbd\x56\x25\xa5\x7a\x6e\x00\x00\xf5\xba\x7b\x52\xaa\x77\x06\
-\x00\x50\xaf\x9e\x1d\x49\xa1\x2e\x09\x00\xa0\x66\xdf\x48\x4a\xd5\
-\x1b\x00\x40\xbd\x3e\x98\x94\xea\x99\x01\x00\xd4\xeb\x35\x49\xa9\
-\xde\x12\x00\x40\xbd\x9e\x93\x94\xea\x9b\x01\x00\xd4\xeb\x21\x49\
-\xa9\xa6\x8f\x0a\x00\xa0\x56\x87\x4d\x27\xa5\x7a\x52\x00\x00\xf5\
-\xfa\xef\xa4\x54\xaf\x0f\x00\xa0\x5e\x1b\x93\x52\x9d\x1f\x00\x40\
-\xbd\xfe\x36\x29\xd5\xae\x43\x03\x00\xa8\xd5\x0b\x93\x62\xad\x0a\
-\x00\xa0\x56\xa7\x26\xc5\xfa\x8b\x00\x00\x6a\x75\x6c\x52\xac\xcf\
-\x07\x00\x50\xaf\xab\x92\x52\xed\x5c\x1e\x00\x40\xad\xce\x4b\x8a\
-\xf5\x88\x00\x00\x6a\xf5\xf6\xa4\x58\xc3\x01\x00\xd4\xea\xc5\x49\
-\xb1\xc6\x03\x00\xa8\xd5\x63\x93\x62\xed\x3a\x2c\x00\x80\x3a\x9d\
-\x98\x94\x6b\x20\x00\x80\x3a\xf5\x6c\x4b\x8a\xf5\xb7\x01\x00\xd4\
-\xea\xfc\xa4\x58\x13\x01\x00\xd4\xea\x1f\x92\x72\xdd\x2d\x00\x80\
-\x3a\x0d\x25\xe5\x1a\x0c\x00\xa0\x4e\x8f\x4e\xca\x35\x1a\x00\x40\
-\x9d\x8e\x4e\xca\x75\x59\x4f\x00\x00\x75\xba\x3c\x29\x57\x5f\x00\
-\x00\x75\xda\x98\x94\x6b\x28\x00\x80\x3a\xbd\x31\x29\xd7\x58\x00\
-\x00\x75\x7a\x5e\x52\xae\xeb\x96\x06\x00\x50\xa3\x07\x27\x05\xeb\
-\x0f\x00\xa0\x46\x07\x4f\x25\xe5\x1a\x0e\x00\xa0\x4e\x97\x24\xe5\
-\x1a\x0f\x00\xa0\x4e\x1f\x49\xca\xb5\xeb\x88\x00\x00\x6a\xf4\x17\
-\x49\xc1\x9e\x1e\x00\x40\x8d\x9e\x9a\x14\xec\x3d\x01\x00\xd4\xe8\
-\x9e\x49\xc1\xae\x58\x14\x00\x40\x7d\x7a\xae\x49\x0a\xf6\x90\x00\
-\x00\x6a\xf4\xef\x49\xc1\x5e\x15\x00\x40\x8d\xfe\x36\x29\xd8\x57\
-\x03\x00\xa8\xd1\xf3\x93\x82\x4d\x1f\x1f\x00\x40\x7d\x56\x26\x25\
-\xfb\x9d\x00\x00\xea\xb3\xfc\xa6\xa4\x60\x1f\x0d\x00\xa0\x46\x17\
-\x26\x05\xdb\x7e\x50\x00\x00\xf5\x19\x4d\x4a\xf6\x6b\x01\x00\xd4\
-\xe7\x8f\x93\x92\x8d\x04\x00\x50\x9f\xc7\x24\x25\xdb\x1c\x00\x40\
-\x7d\x8e\x4a\x8a\xf6\x0b\x01\x00\xd4\xe7\x7b\x49\xc9\x5e\x12\x00\
-\x40\x7d\x3e\x96\x94\xec\x73\x01\x00\xd4\xe7\x95\x49\xc9\x6e\x3a\
-\x22\x00\x80\xda\x3c\x21\x29\xda\x33\x02\x00\xa8\xcd\x5d\x92\xa2\
-\xbd\x3f\x00\x80\xfa\xfc\x20\x29\xd9\xb6\x83\x02\x00\xa8\xcd\x39\
-\x49\xd1\x06\x02\x00\xa8\xcd\x9f\x25\x45\x7b\x67\x00\x00\xb5\x79\
-\x5c\x52\xb4\xab\x96\x04\x00\x50\x97\x63\x92\xb2\x3d\x26\x00\x80\
-\xda\x7c\x3f\x29\xda\x9b\x03\x00\xa8\xcd\x47\x92\xa2\x5d\xb6\x28\
-\x00\x80\xba\xbc\x3c\x29\xdb\x43\x03\x00\xa8\xcb\x63\x93\xb2\xbd\
-\x2e\x00\x80\xba\x1c\x9d\x94\xed\xbf\x02\x00\xa8\xcd\x77\x93\xb2\
-\xdd\x3f\x00\x80\xba\x7c\x30\x29\xdb\x70\x00\x00\x75\x79\x69\x52\
-\xb6\x0b\x03\x00\xa8\xcb\x23\x92\xc2\xfd\x42\x00\x00\x35\x39\x78\
-\x57\x52\xb6\xb5\x01\x00\xd4\xe5\x6b\x49\xd9\xfe\x5f\x00\x00\x75\
-\x59\x9f\x14\xee\x94\x00\x00\x6a\xf2\xbc\xa4\x70\x67\x06\x00\x50\
-\x93\xbe\xa4\x70\x13\x01\x00\xd4\x64\xd1\xb5\x49\xe1\x7e\x31\x00\
-\x80\x9a\x7c\x2e\x29\xdc\x6b\x02\x00\xa8\xc9\x59\x49\xe1\x36\xf7\
-\x04\x00\x50\x8f\xa7\x24\xa5\x7b\x48\x00\x00\xf5\x38\x2e\x29\xdd\
-\x9b\x02\x00\xa8\xc9\xf7\x93\xc2\x5d\xb6\x38\x00\x80\x7a\x6c\x48\
-\x4a\xf7\x98\x00\x00\xea\xf1\xe2\xa4\x74\xef\x08\x00\xa0\x1e\x0f\
-\x49\x4a\x77\xf5\xf2\x00\x00\x6a\xb1\x74\x47\x52\xba\x27\x05\x00\
-\x50\x8f\x7f\x4b\x4a\xf7\xcf\x01\x00\xd4\xe3\xac\xa4\x74\x3b\x0e\
-\x09\x00\xa0\x16\x4f\x4a\x8a\xf7\xec\x00\x00\x6a\x71\xf4\x74\x52\
-\xba\xb1\x00\x00\xea\x71\x51\x52\xba\x1b\x8f\x09\x00\xa0\x16\xef\
-\x4c\x8a\x37\x14\x00\x40\x2d\x5e\x90\x14\xef\xab\x01\x00\xd4\xe2\
-\xbe\x49\xf9\xee\x1f\x00\x40\x1d\x7a\x7e\x94\x14\xef\x8d\x01\x00\
-\xd4\xe2\x13\x49\xf1\xae\x5a\x16\x00\x40\x1d\x5e\x9e\x94\xef\x29\
-\x01\x00\xd4\xe1\xd4\xa4\x7c\x1f\x0d\x00\xa0\x0e\xcb\xaf\x4f\x8a\
-\xb7\xeb\x2e\x01\x00\xd4\xe1\xbc\xa4\x7c\x7f\x14\x00\x40\x1d\x5e\
-\x93\x94\xef\x9b\x01\x00\xd4\xe1\xb1\x49\x0b\x3c\x30\x00\x80\x1a\
-\x1c\xba\x2b\x29\xdf\x9b\x02\x00\xa8\xc3\xa6\xa4\x7c\x57\x2d\x0f\
-\x00\xa0\x06\x6f\x4c\x5a\xe0\xf4\x00\x00\x6a\x70\x7a\xd2\x02\x1f\
-\x0b\x00\xa0\x06\x47\x4f\x27\xe5\xdb\x75\xd7\x00\x00\x6a\x30\x91\
-\xb4\xc0\x4b\x03\x00\xa8\xc1\xdb\x92\x16\xb8\xa4\x27\x00\x80\xce\
-\x3b\x23\x69\x83\x47\x07\x00\xd0\x79\x27\x24\x6d\xb0\x21\x00\x80\
-\x1a\x6c\x4e\x5a\xe0\xa6\xe3\x02\x00\xe8\xbc\x77\x24\x6d\x70\x66\
-\x00\x00\x9d\x77\x46\xd2\x06\xdf\x5b\x1c\x00\x40\xc7\x1d\x97\xb4\
-\xc2\x63\x03\x00\xe8\xbc\xef\x24\x6d\xf0\xd1\x00\x00\x3a\xef\xad\
-\x49\x1b\xec\x3a\x3e\x00\x80\x8e\x7b\x7a\xd2\x0a\xaf\x0c\x00\xa0\
-\xe3\x8e\x9d\x4e\xda\xe0\x07\x8b\x03\x00\xe8\xb8\x6f\x25\xad\x30\
-\x10\x00\x40\xc7\xfd\x5d\xd2\x0a\xff\x12\x00\x40\xc7\x9d\x9e\xb4\
-\xc2\xd4\x3d\x02\x00\xe8\xb4\x23\xa7\x92\x56\xf8\xcb\x00\x00\x3a\
-\xee\x6b\x49\x2b\x5c\xb6\x34\x00\x80\x4e\xfb\x9b\xa4\x1d\x56\x07\
-\x00\xd0\x69\x4f\x48\xda\xe1\xbc\x00\x00\x3a\xed\xce\x37\x26\xed\
-\xf0\xe0\x00\x00\x3a\xed\xdf\x92\x76\x78\x77\x00\x50\xa7\xc5\x77\
-\x0a\xba\xd0\x2b\x93\x76\xb8\xf1\xae\x01\x40\x8d\x56\xef\xda\x34\
-\xb2\x7a\x45\xd0\x65\x1e\x9a\xb4\xc4\x2b\x03\x80\x1a\x8d\xe7\xff\
-\x98\x9c\x58\xbf\xfa\xa8\xa0\x8b\x2c\xbe\x3a\x69\x87\xad\xcb\x03\
-\x80\xda\x3c\x28\x6f\xb5\x79\xfd\xe0\x09\x41\xb7\x38\x27\x69\x89\
-\xdf\x0c\x00\x6a\x73\x76\xde\xc6\xe6\xd1\x35\x27\x05\xdd\xe0\x0f\
-\x92\x96\xf8\x4a\x00\x50\x97\x63\x6f\xc8\x3b\xd8\xb2\x61\x4d\x5f\
-\x4f\xd0\x72\xbf\x90\xb4\xc5\xc3\x02\x80\x9a\xbc\x2a\xf7\xec\xb2\
-\x0d\x43\x2b\x7b\x82\x36\xfb\x7e\xd2\x12\xef\x0f\x00\xea\xb1\xfc\
-\xf2\xdc\xbb\x2b\xc6\xd6\xf6\x2f\x0d\xda\xea\x9d\x49\x4b\xec\x3a\
-\x21\x00\xa8\xc5\x73\x73\x3f\xb6\x6d\x1c\x5e\xb5\x2c\x68\xa3\x67\
-\x27\x6d\xf1\xda\x00\xa0\x16\x5f\xcb\x19\xd8\x3e\xbe\x6e\xd5\x41\
-\x41\xdb\x1c\x3b\x9d\xb4\xc4\x8f\x0e\x0e\x00\x6a\x70\x5a\xce\xd4\
-\xae\x4d\xeb\x06\x0e\x0f\x5a\xe5\xeb\x49\x5b\xfc\x4e\x00\x50\x83\
-\x8f\xe6\x6c\x4c\x6e\x1a\x59\x7d\x64\xd0\x1a\x7f\x95\xb4\xc5\x85\
-\x01\x40\xe7\x9d\x34\x99\xb3\x35\xf9\x95\x37\x3e\xe5\xe8\xa0\x15\
-\x1e\x9d\xb4\xc6\xa3\x03\x80\x8e\xfb\x9b\x9c\x93\xe9\x6f\xbd\xe5\
-\x99\xc7\x05\xc5\x5b\xb6\x2d\x69\x8b\xb1\x00\xa0\xd3\x8e\xb8\x2e\
-\xe7\xee\xe2\x77\x0c\x9e\x18\x94\xed\x63\x49\x5b\x4c\xff\x62\x00\
-\xd0\x61\x67\xe6\x3c\x6d\xd9\x30\xb4\xb2\x27\x28\xd6\x8b\x92\xd6\
-\x78\x57\x00\xd0\x59\xcb\xb7\x64\x07\x5c\x3e\xb6\x76\xe5\xa2\xa0\
-\x48\x27\x25\xad\x71\xd3\xdd\x03\x80\x8e\x7a\x7e\x76\xca\x75\x1b\
-\xd7\xf6\x2f\x0d\xca\xf3\x9d\xa4\x35\xfe\x3a\x00\xe8\xa4\x9e\x89\
-\xec\xa4\x6d\x1b\x87\x57\x2d\x0f\xca\x32\x92\xb4\xc6\x75\x2b\x02\
-\x80\x0e\x7a\x62\x76\xdc\x8e\xf1\x75\xab\xee\x14\x94\xe3\xf1\x49\
-\x7b\xbc\x2c\x00\xe8\xa0\x7f\xcb\x5a\xec\xda\xb4\x6e\xe0\x88\xa0\
-\x0c\x77\xda\x99\xb4\xc6\xd6\x3b\x05\x00\x1d\xf3\xe0\xac\xcf\xe4\
-\xc4\xfa\xd5\x47\x05\x05\xf8\x74\xd2\x1e\xbf\x1b\x00\x74\xcc\x07\
-\xb3\x66\x9b\xd7\x0f\x9e\x10\x2c\x70\x2f\x49\xda\x63\xf3\xe2\x00\
-\xa0\x43\x4e\x9a\xcc\x06\x6c\x1e\x5d\x73\x8f\x60\x01\xbb\x6f\xd2\
-\x22\x4f\x0d\x00\x3a\xe4\x2d\xd9\x94\x2d\x1b\xd6\xf4\x05\x0b\xd5\
-\x77\x93\xf6\xf8\x7f\x01\x40\x67\x1c\xbd\x23\x9b\xf4\xdf\xef\xfb\
-\xdd\xfb\x04\x0b\xd1\x5b\x93\x16\x39\x2d\x00\xe8\x88\x57\x65\xe3\
-\xb6\x7e\xe8\x0f\xef\xbf\x28\x58\x60\x9e\x98\xb4\xc8\xbf\x06\x00\
-\x9d\x70\xd8\x8f\xf3\x80\xb8\x6e\xe3\xf0\xaa\x65\xc1\x02\x72\xa7\
-\x1d\x49\x8b\x3c\x30\x00\xe8\x80\x3f\xcd\x03\x67\xfb\xf8\xba\x55\
-\x07\x05\x0b\xc5\xbf\x24\x2d\x72\x76\x00\x30\x7f\x07\x6d\xc9\x03\
-\x6b\xd7\xa6\x75\x03\x87\x07\x0b\xc1\x8b\x92\x16\xb9\xe9\xc4\x00\
-\x60\xde\xfe\x4f\x2e\x00\x37\x7d\xf1\xac\xc7\x1f\x16\x1c\x68\x27\
-\x24\x6d\xf2\x96\x00\x60\xbe\x96\x7e\x37\x17\x88\xc9\x89\xf5\xab\
-\x8f\x0e\x0e\xa8\x0b\x93\x16\xb9\xe1\x6e\x01\xc0\x3c\xfd\x4e\x2e\
-\x28\x9b\xd7\x0f\xde\x3d\x38\x60\xce\x4a\xda\x64\x24\x00\x98\x9f\
-\xc5\xdf\xc9\x05\x67\xf3\xe8\x9a\x93\x83\x03\xa2\x3f\x69\x93\xeb\
-\x7b\x03\x80\x79\x79\x56\x2e\x4c\x5b\x36\x0c\xad\xec\x09\x9a\xb6\
-\xf8\xaa\xa4\x4d\xde\x10\x00\xcc\x47\xcf\x85\xb9\x70\x5d\x3e\xb6\
-\x76\xe5\xa2\xa0\x51\xef\x4d\xda\xe4\xfa\xe3\x02\x80\x79\x78\x72\
-\x2e\x70\xd7\x6e\x5c\xdb\xbf\x34\x68\xcc\xb3\x92\x56\x79\x5d\x00\
-\x30\x0f\x5f\xca\x02\x6c\xdb\x38\xbc\x6a\x79\xd0\x88\x23\x77\x25\
-\x6d\xb2\xfd\x98\x00\x60\xce\x7e\x2d\x4b\xb1\xfd\xb3\xaf\x3c\xf5\
-\xa0\xa0\x7e\xff\x9e\xb4\xca\x6b\x03\x80\x39\x3b\x2f\x4b\xb2\x6b\
-\xd3\xba\x81\x23\x82\x7a\xfd\x49\xd2\x2a\xdb\x8e\x0e\x00\xe6\xe8\
-\xd7\xb3\x38\x93\x9b\x46\x56\x1f\x15\xd4\xe7\x94\xa4\x5d\x5e\x15\
-\x00\xcc\xd1\x79\x59\xa6\xcd\xeb\x07\xef\x16\xd4\xe4\xdb\x49\xab\
-\x5c\xbb\x22\x00\x98\x93\xc7\x66\xc1\x36\x8f\xae\xb9\x47\x50\x83\
-\x75\x49\xbb\xfc\x79\x00\x30\x27\xe7\x65\xe1\xb6\x6c\x58\xd3\x17\
-\x74\xd8\x43\x93\x76\xb9\xe6\x88\x00\x60\x0e\x1e\x9b\x6d\xb0\x65\
-\xc3\xd0\xca\x9e\xa0\x73\x16\x6d\x49\xda\xe5\xe5\x01\xc0\x1c\x9c\
-\x97\x6d\xb1\x75\x6c\xed\xca\x45\x41\x87\xbc\x3d\x69\x97\x1f\x1d\
-\x1a\x00\xcc\xda\xe3\xb2\x55\xae\xdb\xb8\xb6\x7f\x59\xd0\x01\x4f\
-\x4c\x5a\xe6\xe5\x01\xc0\xac\x7d\x39\x5b\xe7\xba\x4f\xbd\xac\x7f\
-\x59\x30\x4f\xcb\xaf\x4b\xda\xe5\x9a\x23\x03\x80\x59\x7a\x5c\xb6\
-\xd3\x4d\x9b\xd6\x0d\x1c\x16\xcc\xc7\x87\x93\x96\x79\x6d\x00\x30\
-\x4b\xe7\x67\x7b\xed\xda\x34\xb2\x7a\x45\x30\x57\x83\x49\xcb\x6c\
-\xbf\x6b\x00\x30\x2b\x8f\xcf\x96\x9b\xfc\x8f\xbf\x79\xf2\x51\xc1\
-\x5c\x1c\xb9\x2b\x69\x99\x91\x00\x60\x36\x7a\xbe\x9a\xdd\x60\xf3\
-\xfa\xc1\xbb\x07\xb3\xf6\x85\xa4\x65\x6e\x3c\x29\x00\x98\x85\x67\
-\x66\xd7\xd8\x3c\xba\xe6\xa4\x60\x56\x5e\x9c\xb4\xcd\x3b\x03\x80\
-\x99\x5b\xf2\x9d\xec\x2a\x97\xbe\xe7\x79\xf7\x0a\x66\xec\x1e\xd3\
-\x49\xcb\x4c\xde\x27\x00\x98\xb1\x17\x64\xf7\xb9\x7c\x6c\xed\xca\
-\x45\xc1\x8c\x7c\x25\x69\x9b\x0f\x04\x00\x33\x75\xd0\xf7\xb3\x3b\
-\x5d\xbb\x71\x6d\xff\xd2\x60\xbf\x5e\x9e\xb4\xcd\xf4\x83\x02\x80\
-\x19\x7a\x71\x76\xb1\x6d\x1b\x87\x57\x2d\x0f\xf6\xe9\x7f\x25\xad\
-\xf3\x89\x00\x60\x66\x0e\xd9\x9a\x5d\x6e\xc7\xf8\xba\x55\x77\x0a\
-\xf6\x6e\x22\x69\x9d\x53\x03\x80\x19\x79\x65\x92\xb9\x6b\xd3\xba\
-\x81\xc3\x83\x3d\x7b\x75\xd2\x3a\xe7\x05\x00\x33\x71\xd4\xb5\xc9\
-\xcd\x26\x37\x8d\xac\x3e\x32\xb8\xa3\x07\x26\xed\xf3\xd8\x00\x60\
-\x06\x5e\x9f\xec\x66\x6a\x62\xfd\xea\x63\x82\xdb\xb9\x24\x69\x9d\
-\x4d\x3d\x01\xc0\x7e\x1d\xb7\x23\xb9\xbd\xcd\xa3\x6b\x4e\x0c\x76\
-\xf3\xd7\x49\xfb\x3c\x2d\x00\xd8\xaf\xf5\xc9\x1e\xfd\xe7\x3f\x3e\
-\xe7\xa4\xe0\x16\x0f\x4b\xda\xe7\xdb\x4b\x02\x80\xfd\xb8\xcf\xae\
-\x64\xaf\xbe\x7f\xf6\x0b\xee\x1d\xfc\x8f\x9e\x1f\x24\xed\xf3\xa2\
-\x00\x60\x3f\x3e\x9e\xec\xdb\xd6\xb1\xb5\x2b\x17\x45\xd7\x7b\x73\
-\xd2\x3e\x57\x1c\x1e\x00\xec\xd3\x23\x93\x19\xb8\x6e\xe3\xda\xfe\
-\x65\xd1\xd5\x1e\x9d\xb4\xd0\x6b\x03\x80\x7d\xe9\xf9\x52\x32\x43\
-\xdb\x37\x0e\xaf\x3a\x28\xba\xd6\x92\x2b\x93\xf6\xd9\x79\x42\x00\
-\xb0\x0f\xcf\x48\x66\x63\xc7\xb9\x7f\xfe\xa8\x3b\x45\x77\x5a\x9f\
-\xb4\xd0\x68\x00\xb0\x77\xcb\xfe\x33\x99\xad\x5d\x9b\x46\x56\xaf\
-\x88\xee\xb3\x2a\x69\xa1\xe9\x5f\x0e\x00\xf6\xea\xc5\xc9\x9c\x4c\
-\x4e\xac\x5f\x7d\x54\x74\x97\xc5\x5b\x93\x16\xfa\x42\x00\xb0\x37\
-\x47\x5c\x95\xcc\xdd\xe6\xf5\x83\x27\x44\x17\x79\x6b\xd2\x46\x03\
-\x01\xc0\x5e\xfc\x55\x32\x4f\x9b\x47\xd7\x9c\x14\x5d\xe2\xd1\x49\
-\x1b\x5d\xb4\x34\x00\xd8\xa3\xe3\x77\x24\x1d\xb0\x65\xc3\x9a\xbe\
-\x9e\x68\xbf\x45\x5b\x92\x36\x7a\x61\x00\xb0\x47\xa3\x49\xa7\x5c\
-\xb6\x61\x68\x65\x4f\xb4\xdc\x5b\x92\x36\xda\x7a\x58\x00\xb0\x07\
-\x0f\x9a\x4a\x3a\xe9\x8a\x0f\x0f\x3d\x60\x51\xb4\xd8\x69\x49\x2b\
-\xfd\x65\x00\xb0\x07\xff\x96\x74\xdc\xb6\x8d\xc3\xab\x96\x47\x4b\
-\x2d\xfa\x61\xd2\x46\x3b\xef\x1e\x00\xdc\xc1\xea\xa4\x1e\x3b\xc6\
-\xd7\xad\x3a\x28\xda\xe8\xef\x92\x56\x7a\x77\x00\x70\x7b\xcb\x2f\
-\x49\xea\xb3\x6b\xd3\xba\x81\xc3\xa3\x6d\x1e\x91\xb4\xd2\xd4\xca\
-\x00\xe0\x76\x5e\x96\xd4\x6c\x72\xd3\xc8\xea\x23\xa3\x4d\x16\xfd\
-\x30\x69\xa5\x2f\x04\x00\xb7\x75\xdc\x75\x49\x03\x26\xbf\xf2\xc6\
-\xdf\x38\x3a\x5a\xe3\x4d\x49\x3b\x3d\x3d\x00\xb8\x8d\x77\x26\x8d\
-\xd9\xbc\x7e\xf0\xc4\x68\x85\x87\x25\xed\xf4\xfd\x83\x03\x80\xdd\
-\x3c\x68\x2a\x69\xd4\xc5\xef\x18\xbc\x47\x14\xaf\xe7\xd2\xa4\x9d\
-\x5e\x15\x00\xec\xe6\xdf\x92\xe6\x6d\xd9\x30\xb4\xb2\x27\x8a\x76\
-\x56\xd2\x4e\x37\xdc\x2b\x00\xb8\xd5\xd3\x93\x03\xe4\xf2\xb1\xb5\
-\x2b\x17\x45\xb1\xee\x97\xb4\xd4\x47\x03\x80\x9f\x39\xe8\xd2\xe4\
-\x00\xba\x6e\xe3\xda\xfe\x65\x51\xa6\x6f\x25\x2d\xf5\xeb\x01\xc0\
-\x2d\x5e\x96\x1c\x68\xd7\xfe\xeb\x9f\x3e\x6c\x69\x94\xe7\xe5\x49\
-\x4b\x5d\xbc\x3c\x00\xf8\xa9\xbb\x6d\x4b\x16\x82\x1d\xe3\xeb\x56\
-\xdd\x29\xca\x72\xe2\x74\xd2\x52\x7f\x1c\x00\xfc\xd4\xfb\x93\x05\
-\x63\xd7\xa6\x75\x03\x47\x44\x41\xbe\x9c\xb4\xd4\x75\xc7\x05\x00\
-\xff\xe3\x11\xd3\xc9\x82\x32\x39\xb1\x7e\xf5\x51\x51\x88\x3f\x4c\
-\xda\xea\x5d\x01\x40\xc4\x92\x0b\x93\x05\x68\xf3\xfa\xc1\x13\xa2\
-\x00\xc7\xee\x4a\x5a\x6a\xfa\x57\x02\x80\x78\x49\xb2\x50\x6d\x1e\
-\x5d\x73\x8f\x58\xe8\x3e\x93\xb4\xd5\xa6\x45\x01\xd0\xf5\xee\x72\
-\x4d\xb2\x90\x6d\xd9\xb0\xa6\x2f\x16\xb2\xe7\x26\xad\xf5\xfc\x00\
-\xe8\x7a\x67\xe7\xff\x6f\x0f\x4e\x00\xf4\x3e\xe4\x84\x01\xff\x66\
-\x32\xb9\xaf\x26\xbd\xd2\xbb\x4d\x8b\x5e\x8e\x4a\xf5\x20\x28\x82\
-\x3a\xe2\x8e\x75\x66\xad\x23\x6e\x83\xc5\xac\xb5\x3e\x61\xb1\x63\
-\x29\xb2\xec\x32\x8b\x2d\x61\x17\xc1\x6e\x35\xee\xa8\xaa\xa6\x4a\
-\x1b\x54\x34\x55\x6d\xd3\xea\x9d\x1e\x69\xda\xdc\xc7\xcc\xfc\x3e\
-\xb7\x1e\x39\xe6\x78\xe7\x7d\xff\xc7\xf3\x3c\x14\xde\xcd\x4b\x3a\
-\x67\xb5\x45\x41\x4d\xd9\x9c\x54\xd5\x2d\x7b\x05\x40\xcd\x3d\xa2\
-\x3f\x29\x85\x5b\x97\x76\xcd\x6a\x8f\x22\xfa\x5a\x52\x59\x1f\x0d\
-\x80\x7a\x1b\x75\x49\x52\x1e\xeb\x96\xbe\xe5\xa4\x8e\x28\x9a\x67\
-\x25\x95\xb5\xe3\x21\x01\x50\x6b\xaf\x4b\x4a\x66\xc3\x77\xdf\x31\
-\x7b\x6c\x14\xc9\x98\xdb\x93\xca\xba\x68\x54\x00\xd4\xd8\x7e\x77\
-\x24\x25\xb4\x63\x45\xf7\xdc\xa9\x51\x18\x9f\x48\xaa\xeb\x35\x01\
-\x50\x63\xff\x95\x94\xd5\xf6\x0b\xba\x9f\x3c\x25\x0a\xe1\xe1\x49\
-\x75\xdd\x75\x60\x00\xd4\xd6\x23\xfb\x93\x32\xeb\x5d\xd5\x33\x6f\
-\x9f\x68\xbd\xdf\x24\xd5\xf5\xc5\x00\xa8\xab\x31\xab\x92\xf2\x5b\
-\xdd\x33\xff\xd0\x68\xad\x77\x25\x15\xf6\x94\x00\xa8\xa9\x77\x24\
-\x15\xb1\x7a\xf1\x82\x99\xd1\x3a\x87\xf7\x27\xd5\x75\xcd\x84\x00\
-\xa8\xa5\xc3\x37\x26\x15\x72\xd3\x92\xce\x59\x6d\xd1\x1a\xcb\x93\
-\x0a\xfb\xe7\x00\xa8\xa5\x6f\x24\x55\xb3\x66\x69\xd7\xac\xf6\x68\
-\xbe\x57\x26\x15\xb6\xed\xd8\x00\xa8\xa1\xe7\x27\x95\xb4\x7e\x59\
-\xd7\xec\xd1\xd1\x5c\xd3\xb6\x26\x15\xf6\xc3\xb6\x00\xa8\x9d\xbd\
-\x6e\x4e\x2a\xeb\xae\x6f\xbe\xad\x3d\x9a\xe9\xab\x49\x95\xbd\x24\
-\x00\x6a\xe7\x13\x49\x95\x9d\x17\x4d\xf5\xf4\xa4\xca\x6e\xdf\x37\
-\x00\x6a\xe6\xa4\xbe\xa4\xca\x5e\x12\x4d\x35\xfa\xb6\xa4\xca\xfe\
-\x2b\x00\xea\xa5\xe3\x17\x49\x95\x6d\x9c\x1c\xcd\xf5\xb1\xa4\xca\
-\xfa\x1f\x15\x00\xb5\xf2\x96\xa4\xd2\xce\x8c\x26\x9b\x95\x54\xda\
-\xaa\x31\x01\x50\x23\x33\x37\x26\x95\xf6\xe8\x68\xb6\x95\x49\xa5\
-\xfd\xbf\x00\xa8\x8f\xb6\x65\x49\xa5\x5d\xd5\x16\xcd\xf6\xe6\xa4\
-\xd2\xb6\x3d\x30\x00\x6a\xe3\x65\x49\xb5\xfd\x53\x34\xdd\x7e\xdb\
-\x93\x4a\xfb\x79\x47\x00\xd4\xc4\x8c\x3b\x92\x4a\xeb\x3b\x34\x9a\
-\xef\xac\xa4\xda\xde\x1a\x00\x35\xf1\xb5\xa4\xda\x96\x45\x0b\x3c\
-\x3d\xa9\xb6\xad\xc7\x04\x40\x2d\xcc\x4d\x2a\xee\x05\xd1\x02\x1d\
-\x37\x27\xd5\xf6\xe3\xf6\x00\xa8\x81\xa9\x37\x24\xd5\x76\xe7\x84\
-\x68\x85\x33\x92\x8a\x7b\x5d\x00\xd4\xc0\x67\x92\x8a\xfb\x64\xb4\
-\xc4\x71\x49\xc5\x6d\x9c\x19\x00\x95\xf7\x98\xfe\xa4\xe2\x4e\x89\
-\xd6\xb8\x38\xa9\xb8\x73\xda\x02\xa0\xe2\x26\x5c\x95\x54\xdc\x6f\
-\xda\xa2\x35\x5e\x93\x54\xdd\xcb\x02\xa0\xe2\x3e\x9c\x54\xdd\xdb\
-\xa2\x45\xa6\x6d\x49\x2a\x6e\xdd\x81\x01\x50\x69\x27\xf7\x26\x15\
-\xd7\x7b\x60\xb4\xca\x97\x92\xaa\xfb\x46\x00\x54\xd9\xd8\x4b\x93\
-\xaa\xfb\x46\xb4\xcc\x13\x92\xca\x7b\x7e\x00\x54\xd8\x87\x92\xca\
-\x9b\x17\x2d\xd3\x76\x55\x52\x75\xb7\xef\x1f\x00\x95\x75\x6a\x6f\
-\x52\x75\x6b\xc7\x46\xeb\xbc\x33\xa9\xbc\x2f\x05\x40\x55\x4d\xf8\
-\x4d\x52\x79\xff\x16\x2d\x74\x50\x6f\x52\x79\xcf\x0e\x80\x8a\xfa\
-\x68\x52\x7d\x0f\x8d\x56\x5a\x9a\x54\xde\x6d\x33\x02\xa0\x92\x1e\
-\xd1\x97\x54\xde\x25\xd1\x52\x4f\x4f\xaa\xef\x3b\x6d\x01\x50\x41\
-\x13\xaf\x4c\xaa\xef\x95\xd1\x52\x1d\x37\x26\xd5\xf7\xf2\x00\xa8\
-\xa0\xff\x48\xaa\x6f\xc3\x94\x68\xad\xf7\x27\xd5\xb7\xf1\xa8\x00\
-\xa8\x9c\xc7\xf6\x27\xd5\xd7\x13\x2d\x76\x44\x5f\x52\x7d\xcb\x47\
-\x05\x40\xc5\x4c\x5c\x9d\xd4\xc0\x89\xd1\x6a\xdf\x4f\x6a\xe0\x6d\
-\x01\x50\x31\x9f\x4a\x6a\xe0\x67\xd1\x72\xcf\x4b\x6a\x60\xeb\x83\
-\x02\xa0\x52\x4e\xef\x4f\x6a\xe0\x95\xd1\x72\x63\x6e\x4d\x6a\xe0\
-\xd2\x71\x01\x50\x21\xfb\xde\x9c\xd4\xc0\x86\x29\xd1\x7a\x1f\x49\
-\xea\xe0\x5f\x02\xa0\x42\xce\x4e\xea\xa0\x27\x0a\xe0\xd8\xa4\x0e\
-\x7a\x1f\x11\x00\x95\xf1\x8a\xa4\x16\x4e\x8c\x22\xf8\x51\x52\x07\
-\x57\x4f\x0e\x80\x8a\x98\xb9\x3e\xa9\x83\x4b\xa2\x10\x5e\x98\xd4\
-\x42\x4f\x00\x54\x43\xc7\x85\x49\x2d\x2c\x88\x42\x18\x73\x4b\x52\
-\x0b\x4f\x0d\x80\x4a\x78\x57\x52\x0b\x1b\xa6\x44\x31\x7c\x20\xa9\
-\x85\x5b\xf6\x0b\x80\x0a\x98\xb5\x3d\xa9\x85\x9e\x28\x88\x23\xfb\
-\x92\x5a\xf8\xdf\x00\x28\xbf\x89\xbf\x49\xea\xe1\xc4\x28\x8a\xef\
-\x26\xf5\xf0\xaa\x00\x28\xbd\x4f\x26\xf5\x70\x49\x14\xc6\x33\x93\
-\x7a\xd8\x7c\x7c\x00\x94\xdc\x53\xfb\x93\x7a\x78\x65\x14\x46\xc7\
-\x0d\x49\x3d\x5c\x3a\x3e\x00\x4a\x6d\xff\x9b\x93\x7a\xd8\x30\x25\
-\x8a\x63\x61\x52\x13\xff\x1e\x00\x65\xd6\xbe\x2c\xa9\x89\x9e\x28\
-\x90\x03\xb7\x27\x35\xf1\xdc\x00\x28\xb1\xb7\x27\x75\x31\x2b\x8a\
-\xe4\xff\x92\x9a\x58\x7b\x48\x00\x94\xd6\xc9\xdb\x93\x9a\x58\x11\
-\x85\x72\x7a\x52\x17\x3f\x1a\x15\x00\x25\x35\xe9\x8a\xa4\x2e\x5e\
-\x1a\x85\xd2\x7e\x55\x52\x17\xff\x2f\x00\x4a\xea\x7f\x92\xba\xb8\
-\x7d\x7c\x14\xcb\x5b\x93\xba\xe8\x3b\x2d\x00\x4a\xe9\xa5\x49\x6d\
-\x74\x47\xc1\x4c\xdb\x94\xd4\xc5\xf5\xd3\x03\xa0\x84\x8e\x5a\x9f\
-\xd4\x45\xdf\x11\x51\x34\x9f\x4e\x6a\xe3\x6b\x01\x50\x3e\x63\x7f\
-\x9e\xd4\xc6\x59\x51\x38\x0f\x49\xea\x63\x41\x00\x94\xce\x47\x92\
-\xfa\x98\x13\xc5\xb3\x3c\xa9\x8d\x4d\xc7\x06\x40\xc9\x3c\xa5\x3f\
-\xa9\x8d\x5f\xb7\x45\xf1\x3c\x2f\xa9\x8f\x5f\x8e\x0b\x80\x52\x39\
-\xf4\xf6\xa4\x3e\x5e\x17\x05\x34\xfa\x86\xa4\x3e\x3e\x15\x00\x65\
-\xd2\xb1\x3c\xa9\x8f\xf5\x53\xa2\x88\x16\x26\x35\xf2\x92\x00\x28\
-\x91\x33\x92\x1a\xf9\xb7\x28\xa4\x03\xb6\x25\xf5\xb1\xe5\x84\x00\
-\x28\x8d\xa7\xf6\x27\xf5\xd1\x7f\x74\x14\xd3\x17\x93\x1a\xb9\x62\
-\x4a\x00\x94\xc4\xa1\xb7\x27\x35\xf2\xbd\x28\xa8\xd9\x49\x9d\x7c\
-\x39\x00\xca\x61\xf4\x8f\x93\x3a\x79\x5a\x14\xd5\x8a\xa4\x4e\xde\
-\x10\x00\xa5\xb0\x28\xa9\x93\xdf\x8e\x8a\xa2\x7a\x79\x52\x27\xdb\
-\x1f\x11\x00\x25\x30\xb7\x3f\xa9\x93\xb7\x46\x61\x4d\xb8\x3d\xa9\
-\x93\x6b\xf7\x0e\x80\xc2\x9b\x79\x67\x52\x27\x9b\xf7\x8e\xe2\x7a\
-\x7f\x52\x2b\xdf\x1f\x15\x00\x05\x37\x76\x45\x52\x2b\x9f\x8e\x02\
-\x3b\x78\x7b\x52\x2b\xff\x14\x00\x05\xf7\x89\xa4\x5e\x4e\x88\x22\
-\xfb\x62\x52\x2b\x7d\x4f\x08\x80\x42\x7b\x51\x52\x2f\xe7\x47\xa1\
-\x9d\x98\xd4\xcb\x2d\x07\x05\x40\x81\x3d\x78\x53\x52\x2f\xcf\x8b\
-\x62\xfb\x49\x52\x2f\x3f\xea\x08\x80\xc2\x9a\x7e\x75\x52\x2f\x37\
-\x8d\x89\x62\x7b\x7e\x52\x33\xff\x1a\x00\x45\xd5\xfe\xad\xa4\x66\
-\xfe\x31\x0a\x6e\xf4\xf5\x49\xbd\xf4\x3f\x3b\x00\x0a\xea\xdd\x49\
-\xcd\x6c\xda\x3b\x8a\xee\xed\x49\xcd\x6c\x78\x60\x00\x14\xd2\x53\
-\xfb\x92\x9a\xf9\xf7\x28\xbc\x69\x1b\x93\x9a\xb9\x66\x9f\x00\x28\
-\xa0\xc3\x6f\x4f\x6a\xa6\xff\xe8\x28\xbe\x9e\xa4\x6e\x96\x8d\x0a\
-\x80\xc2\x19\xff\xb3\xa4\x6e\xce\x8a\x12\x38\xb6\x3f\xa9\x9b\xee\
-\x00\x28\x9c\x33\x93\xda\x79\x74\x94\xc1\xf7\x92\xba\xe9\xff\x9b\
-\x00\x28\x98\xd7\x25\xb5\xf3\xb3\x28\x85\x27\x27\xb5\xb3\xf1\xc1\
-\x01\x50\x28\x8f\xda\x9e\xd4\xce\x8b\xa2\x14\xda\x2e\x4d\x6a\xe7\
-\xb7\xfb\x06\x40\x81\x1c\x7a\x4b\x52\x3b\x37\x8c\x89\x72\x78\x59\
-\x52\x3f\xdf\xef\x08\x80\xc2\x18\x7f\x71\x52\x3f\x5d\x51\x12\x63\
-\x6f\x4a\xea\xe7\x43\x01\x50\x14\x6d\x5f\x4c\xea\x67\xe3\xde\x51\
-\x16\xff\x94\xd4\xd0\x4b\x02\xa0\x20\xfe\x31\xa9\xa1\x45\x51\x1a\
-\xd3\x37\x26\xf5\xb3\xe5\xc4\x00\x28\x84\x27\xf6\x26\xf5\xd3\x77\
-\x64\x94\xc7\xc7\x93\x1a\xba\x76\xbf\x00\x28\x80\x07\xac\x4b\x6a\
-\xe8\x6b\x51\x22\x47\xf4\x26\x35\x74\xfe\x98\x00\x68\xb9\x29\xab\
-\x92\x3a\x9a\x1d\x65\xf2\xb5\xa4\x8e\x3e\x1e\x00\xad\x36\xea\x9b\
-\x49\x1d\x5d\x14\xa5\xf2\xf0\xa4\x96\x5e\x17\x00\x2d\xf6\x81\xa4\
-\x96\x9e\x17\xe5\xf2\xe3\xa4\x8e\x7a\x4f\x0f\x80\x96\x7a\x61\x7f\
-\x52\x47\xd7\x76\x44\xb9\x3c\x3b\xa9\xa5\xf5\x0f\x0c\x80\x16\x7a\
-\xf8\x96\xa4\x96\xfe\x3e\x4a\xa6\xfd\xca\xa4\x96\xae\xd9\x2f\x00\
-\x5a\xe6\xf0\x35\x49\x2d\xad\x9f\x1a\x65\xf3\xda\xa4\x9e\x2e\x18\
-\x1b\x00\x2d\x32\xe5\xd2\xa4\x9e\xce\x88\xd2\x19\x77\x73\x52\x4f\
-\x5f\x6e\x0b\x80\x96\x18\xb5\x34\xa9\xa7\xed\x87\x46\xf9\xbc\x33\
-\xa9\xa9\x7f\x0a\x80\x96\xf8\x58\x52\x53\x9f\x8e\x12\x9a\xb6\x3e\
-\xa9\xa7\xfe\xe7\x07\x40\x0b\xbc\x3c\xa9\xa9\xbe\x63\xa3\x8c\x3e\
-\x9c\xd4\xd4\x96\x53\x02\xa0\xe9\x9e\xb0\x23\xa9\xa9\xaf\x44\x29\
-\x1d\xbc\x2d\xa9\xa9\x9b\x0f\x0d\x80\x26\x3b\x66\x5d\x52\x57\xa7\
-\x44\x39\x9d\x99\xd4\xd5\xa5\x53\x02\xa0\xa9\xf6\xbe\x32\xa9\xab\
-\x65\x51\x52\xc7\xf4\x25\x75\xf5\xf5\xf6\x00\x68\xa2\x71\xcb\x93\
-\xda\x9a\x13\x65\x75\x56\x52\x5b\x1f\x0a\x80\xe6\x69\xff\x72\x52\
-\x5b\x17\x47\x69\x9d\x94\xd4\xd7\x1b\x02\xa0\x69\x3e\x98\xd4\xd7\
-\xb3\xa3\xbc\xce\x4b\x6a\xab\xef\xd9\x01\xd0\x24\x0b\x92\xfa\xba\
-\xbc\x3d\xca\xeb\xc9\x49\x7d\x6d\x99\x1d\x00\x4d\xf1\x94\x1d\x49\
-\x7d\xbd\x34\xca\xec\x17\x49\x7d\xdd\x7e\x74\x00\x34\xc1\x89\x1b\
-\x93\xfa\xba\x61\x4c\x94\xd9\x0b\x93\x1a\xbb\x7a\x46\x00\x8c\xb8\
-\x99\x6b\x92\x1a\x7b\x73\x94\xda\xa8\x2b\x92\x1a\x5b\x39\x35\x00\
-\x46\xd8\xf4\xcb\x93\x1a\x5b\x3b\x39\xca\xed\x15\x49\x9d\x9d\x33\
-\x26\x00\x46\xd4\x98\x1f\x24\x75\xb6\x30\x4a\x6e\xf4\xb5\x49\x9d\
-\x7d\xa1\x2d\x00\x46\x50\xdb\x17\x92\x3a\xdb\xb4\x6f\x94\xdd\x1b\
-\x92\x5a\x7b\x4f\x00\x8c\xa0\x0f\x26\xb5\xf6\xd1\x28\xbd\x71\x37\
-\x25\xb5\xf6\xda\x00\x18\x31\xaf\x4d\x6a\x6d\xfb\x61\x51\x7e\xff\
-\x90\xd4\x5a\xef\x33\x02\x60\x84\xbc\xa0\x2f\xa9\xb5\x33\xa3\x02\
-\xa6\xdc\x91\xd4\xda\xc6\x93\x02\x60\x44\x9c\xbe\x3d\xa9\xb5\xbe\
-\x63\xa2\x0a\xde\x93\xd4\xdb\x6d\xf7\x0f\x80\x11\xf0\xb0\x0d\x49\
-\xbd\x7d\x29\x2a\x61\xef\x0d\x49\xbd\x5d\xb9\x7f\x00\x34\xdc\xd1\
-\xb7\x25\xf5\xd6\xff\xc0\xa8\x86\x0f\x26\x35\xb7\x72\x7a\x00\x34\
-\xd8\x81\xd7\x24\x35\xf7\xd5\xa8\x88\xfd\x37\x27\x35\x77\xe1\xa4\
-\x00\x68\xa8\xa9\x97\x24\x35\xd7\x3f\x2b\xaa\xe2\xdf\x93\xba\x5b\
-\x36\x36\x00\x1a\x68\xfc\x8f\x92\xba\x3b\x2b\x2a\xe3\xd0\x6d\x49\
-\xdd\x7d\xa9\x3d\x00\x1a\xa6\xe3\xeb\x49\xdd\xf5\xcf\x8a\xea\xe8\
-\x49\x6a\xef\x93\x6d\x01\xd0\x20\x6d\xff\x95\xd4\xde\x37\xa2\x42\
-\x0e\xdd\x96\xd4\xde\xfb\x03\xa0\x41\xfe\x35\xe1\xe1\x51\x25\x9f\
-\x4e\x78\x5b\x00\x34\xc4\xbb\x12\xbe\x1d\x95\x72\xd8\xb6\xa4\xf6\
-\xfa\x17\x04\x40\x03\xbc\x2e\x21\x67\x47\xb5\xfc\x57\x42\xdf\xdf\
-\x04\xc0\xb0\xbd\xb8\x2f\x61\x59\x54\xcc\x91\x3b\x12\xb6\x3f\x29\
-\x00\x86\xe9\x19\x3b\x12\xf2\x51\x51\x35\x67\x26\xe4\xa6\xd9\x01\
-\x30\x2c\x73\xb6\x26\xe4\xb9\x51\x39\x47\xee\x48\xc8\x3b\x4f\x08\
-\x80\x61\x38\x65\x43\x42\xe6\x63\xa2\x7a\x3e\x97\x90\x79\xd3\x51\
-\x01\x30\x64\x27\xdc\x99\x90\x79\x7e\x54\xd0\x51\x3b\x12\x32\xaf\
-\x9f\x19\x00\x43\x74\xbf\x35\x09\xbf\xf3\xf8\xa8\xa2\xc5\x09\xbf\
-\x73\xcd\xa1\x01\x30\x24\x47\x5c\x9f\xf0\x3b\x3f\x8e\x4a\xba\xdf\
-\x8e\x84\xdf\xf9\xed\x61\x01\x30\x04\x87\x5c\x9d\xf0\x7b\x4f\x8a\
-\x6a\xfa\x7c\xc2\xef\x5d\x3e\x23\x00\x06\xed\xa0\xab\x12\x7e\xef\
-\xa2\xa8\xa8\xa3\x76\x24\xfc\xde\xaa\xfd\x02\x60\x90\x0e\xf8\x4d\
-\xc2\x1f\x3c\x35\xaa\xea\x33\x09\x7f\xb0\x72\x9f\x00\x18\x94\x7d\
-\x2f\x4d\xf8\x83\x8b\xda\xa2\xaa\x0e\xdb\x96\xf0\x07\x97\x4c\x0f\
-\x80\x41\x98\xf6\xb3\x84\x3f\x9a\x13\xd5\xf5\x89\x84\x3f\xfa\xf9\
-\xb4\x00\x18\xb0\xa9\x17\x27\xfc\xd1\xf9\x51\x61\x07\x6e\x4e\xf8\
-\xa3\x0b\x27\x07\xc0\x00\x4d\xf9\x69\xc2\x9f\x3c\x3a\xaa\x6c\x51\
-\xc2\x9f\x5c\x30\x29\x00\x06\x64\xe2\x79\x09\x7f\xf2\xad\xa8\xb4\
-\x19\x9b\x12\xfe\xe4\xfc\x89\x01\x30\x00\x13\xce\x4d\xf8\x93\xfe\
-\x93\xa2\xda\x3e\x98\xf0\x67\xdf\x1b\x17\x00\x7b\x34\xe1\x9c\x84\
-\x3f\xfb\x5a\x54\xdc\x3e\xeb\x13\xfe\xec\x9b\xe3\x02\x60\x0f\x26\
-\xfd\x28\xe1\xcf\xfa\x8e\x8f\xaa\x7b\x6f\xc2\x5f\x9c\x3b\x29\x00\
-\x76\x6b\xe2\xb9\x09\x7f\xf1\x85\xa8\xbc\xbd\xee\x48\xf8\x8b\xf3\
-\x26\x07\xc0\x6e\x4c\xfa\x61\xc2\x5f\xf4\x3e\x20\xaa\xef\xff\x25\
-\xfc\xd5\x8f\x26\x07\xc0\x2e\x4d\xbd\x30\xe1\xaf\x3e\x1d\x35\x30\
-\xe9\x96\x84\xbf\xba\x78\x7a\x00\xec\xc2\xd4\x9f\x24\xfc\xd5\xb6\
-\x23\xa2\x0e\xde\x94\x70\x37\x3f\xdb\x3b\x00\x76\x6a\xaf\x9f\x26\
-\xdc\xcd\xc7\xa2\x16\xc6\x5d\x9b\x70\x37\xbf\xd8\x27\x00\x76\x62\
-\xaf\x8b\x12\xee\x66\xcb\x41\x51\x0f\x2f\x4b\xb8\xbb\xcb\x0e\x08\
-\x80\xfb\x98\x76\x51\xc2\xdd\xfd\x6b\xd4\x44\xc7\xe5\x09\x77\x77\
-\xd9\x01\x01\x70\x2f\xfb\x5e\x92\x70\x77\xeb\xf7\x89\xba\x98\x97\
-\x70\x0f\x57\x1c\x1c\x00\xf7\x30\xe3\x57\x09\xf7\xf0\xee\xa8\x8d\
-\xb6\x9f\x26\xdc\xc3\x6f\x67\x06\xc0\xdd\x1c\x76\x65\xc2\x3d\xac\
-\x9b\x16\xf5\xf1\xc4\x84\x7b\xba\xf6\xa8\x00\xf8\x8b\x07\x5c\x97\
-\x70\x4f\x6f\x8f\x3a\x39\x37\xe1\x9e\xae\xbf\x5f\x00\xfc\xc9\x83\
-\xd6\x24\xdc\xd3\x9a\x89\x51\x27\x27\xf5\x27\xdc\xd3\x9a\x87\x04\
-\xc0\x1f\xcc\xba\x2d\xe1\x5e\x5e\x1d\xf5\xf2\xf5\x84\x7b\x59\xf7\
-\x88\x00\xf8\x9d\x47\xde\x95\x70\x2f\x57\x8c\x8e\x7a\x39\xbe\x2f\
-\xe1\x5e\x36\x3d\x29\x00\xe2\x31\x1b\x12\xee\xed\x39\x51\x37\x9f\
-\x4f\xb8\xb7\x6d\xcf\x0d\xa0\xf6\x9e\xb1\x35\xe1\xde\x7e\xda\x16\
-\x75\x73\xf8\xd6\x84\x7b\xeb\x5d\x10\x40\xcd\xbd\x60\x47\xc2\x7d\
-\x9c\x16\xf5\x73\x46\xc2\x7d\x75\x07\x50\x6b\xaf\xe9\x4b\xb8\x8f\
-\x6f\x44\x0d\x4d\x5b\x9b\x70\x5f\x8b\xda\x02\xa8\xaf\xae\x84\xfb\
-\xea\x7b\x48\xd4\x51\x57\xc2\x4e\x7c\xae\x23\x80\x9a\x6a\x3b\x23\
-\x61\x27\xce\x8c\x5a\x1a\x77\x6d\xc2\x4e\x9c\x35\x2e\x80\x5a\xea\
-\x38\x33\x61\x27\xb6\x1c\x1a\xf5\xf4\x77\x09\x3b\x73\xce\xe4\x00\
-\x6a\x68\xc2\xb7\x12\x76\xe6\x03\x51\x53\xed\xbf\x48\xd8\x99\x8b\
-\xf6\x0e\xa0\x76\xf6\x5a\x9e\xb0\x33\xeb\xa6\x47\x5d\x3d\x25\x61\
-\xa7\x56\x1d\x14\x40\xcd\xcc\xb8\x24\x61\xa7\xde\x12\xf5\x75\x6e\
-\xc2\x4e\xad\xbe\x5f\x00\xb5\x72\xd4\xd5\x09\x3b\x75\xdd\xb8\xa8\
-\xaf\x93\xfa\x13\x76\xea\xb6\x53\x02\xa8\x91\x87\xac\x49\xd8\xb9\
-\x97\x44\x9d\x2d\x49\xd8\xb9\x2d\xf3\x02\xa8\x8d\xc7\xde\x99\xb0\
-\x73\x2b\x47\x45\x9d\xcd\xdc\x96\xb0\x73\xbd\xaf\x09\xa0\x26\x5e\
-\xbc\x2d\x61\x17\x9e\x1c\xf5\xf6\x6f\x09\xbb\xf2\xbe\xb6\x00\xea\
-\xe0\xed\xfd\x09\xbb\xf0\xc3\xa8\xb9\x69\x6b\x13\x76\x65\xf1\x98\
-\x00\x2a\x6f\xd4\xc7\x13\x76\xa5\xff\xd4\xa8\xbb\xb7\x24\xec\xd2\
-\x39\x53\x03\xa8\xb8\xb1\x4b\x12\x76\x69\x49\xd4\xde\xd8\xd5\x09\
-\xbb\xf4\x8b\x03\x03\xa8\xb4\xbd\x7f\x9c\xb0\x4b\xdb\xee\x17\xcc\
-\x4b\xd8\xb5\x1b\x1e\x14\x40\x85\x1d\xf1\xeb\x84\x5d\xfb\x50\x10\
-\x71\x7e\xc2\xae\xdd\xf1\xa8\x00\x2a\xeb\x41\x37\x24\xec\xda\xda\
-\xe9\x41\xc4\x29\xfd\x09\xbb\xb6\xe5\x39\x01\x54\xd4\x93\x36\x24\
-\xec\xc6\x6b\x83\xdf\xfb\x62\xc2\x6e\xf4\xbf\x2d\x80\x4a\x7a\xf9\
-\xf6\x84\xdd\xb8\xac\x23\xf8\xbd\xc3\xb7\x24\xec\xce\xa2\x51\x01\
-\x54\x4e\xfb\x87\x13\x76\xeb\xf4\xe0\x8f\x3e\x90\xb0\x5b\xdf\x9d\
-\x1a\x40\xc5\x4c\x3c\x2b\x61\xb7\xbe\x15\xfc\xc9\xe4\x35\x09\xbb\
-\xf5\xab\xc3\x03\xa8\x94\x03\x2e\x4e\xd8\xad\x1d\xc7\x07\x7f\xf6\
-\xda\x84\xdd\xbb\xfd\x51\x01\x54\xc8\x03\xaf\x4d\xd8\xbd\x8f\x05\
-\x7f\xd1\x71\x59\xc2\xee\x6d\x79\x41\x00\x95\xf1\x94\xf5\x09\xbb\
-\xb7\x6e\x9f\xe0\xaf\xe6\x24\xec\x41\x7f\x77\x7b\x00\xd5\xb0\x60\
-\x47\xc2\x1e\xbc\x29\xb8\xbb\x6f\x26\xec\xc9\x57\x26\x04\x50\x01\
-\xa3\xba\x13\xf6\xe4\xaa\xb1\xc1\xdd\x1d\xbd\x3d\x61\x4f\x7e\x32\
-\x23\x80\xd2\x9b\xfc\x8d\x84\x3d\x7a\x7a\x70\x4f\x1f\x49\xd8\xa3\
-\x1b\x1e\x1a\x40\xc9\xcd\xbc\x34\x61\x8f\x7e\x10\xdc\xcb\x5e\xb7\
-\x25\xec\xd1\x86\xa7\x07\x50\x6a\xb3\x6f\x49\xd8\xa3\xbe\x59\xc1\
-\xbd\xbd\x3a\x61\xcf\x7a\xbb\x02\x28\xb1\x05\xdb\x13\xf6\xec\x3f\
-\x83\xfb\x18\xb5\x32\x61\x00\x7a\x46\x07\x50\x52\xa3\xff\x23\x61\
-\x00\xd6\xcf\x08\xee\xeb\x31\x09\x03\xb1\x7c\x46\x00\xa5\x34\xfd\
-\xfb\x09\x03\xf1\x0f\xc1\xce\xfc\x5f\xc2\x40\xdc\x70\x72\x00\x25\
-\x74\xff\xcb\x13\x06\xe2\xea\x71\xc1\xce\x1c\xb9\x35\x61\x20\xb6\
-\xfc\x6d\x00\xa5\xf3\xd4\xbb\x12\x06\xe4\xb9\xc1\xce\x75\x27\x0c\
-\xcc\xa2\x8e\x00\xca\xa5\xab\x2f\x61\x40\xce\x0d\x76\x61\xf2\x4d\
-\x09\x03\x73\xfe\xfe\x01\x94\xc8\xb8\xcf\x26\x0c\xcc\x8e\x07\x05\
-\xbb\xf2\x92\x84\x01\xba\xfe\x61\x01\x94\xc6\xa1\x2b\x12\x06\xe8\
-\xa3\xc1\x2e\xb5\xfd\x38\x61\x80\xb6\xbc\x24\x80\x92\x38\x7d\x6d\
-\xc2\x00\xdd\xb2\x57\xb0\x6b\x0f\xed\x4d\x18\xa8\x9e\xd1\x01\x94\
-\x40\x5b\x57\x6f\xc2\x40\xfd\x5d\xb0\x3b\x3d\x09\x03\x76\xde\x7e\
-\x01\x14\xde\xa4\xaf\x24\x0c\xd8\xc5\xed\xc1\xee\x4c\xbf\x3d\x61\
-\xc0\xae\x3b\x31\x80\x82\x3b\xea\x57\x09\x03\xd6\x77\x52\xb0\x7b\
-\xaf\x4d\x18\xb8\x2d\xf3\x03\x28\xb4\x27\xaf\x4b\x18\xb8\xff\x0c\
-\xf6\x60\xd4\x2f\x12\x06\xa1\x67\x4c\x00\x85\xd5\xd6\xd5\x97\x30\
-\x70\x77\xec\x1b\xec\xc9\xec\xfe\x84\x41\xf8\xf1\x21\x01\x14\xd4\
-\xb4\xb3\x13\x06\xe3\xb5\xc1\x9e\x7d\x3e\x61\x30\x6e\x7f\x52\x00\
-\x85\x74\xc2\x55\x09\x83\xf1\xab\x8e\x60\xcf\xf6\xbf\x33\x61\x30\
-\xfa\xbb\x47\x05\x50\x3c\xf3\x37\x27\x0c\x46\xff\xa3\x83\x81\x78\
-\x6b\xc2\xe0\x9c\x3b\x23\x80\x82\x19\xff\xe9\x84\xc1\xf9\x7c\x30\
-\x20\xa3\x7f\x9d\x30\x38\x37\xcc\x0e\xa0\x50\x1e\xb0\x32\x61\x70\
-\xd6\x1f\x18\x0c\xcc\x9c\x84\x41\xda\xf1\x96\xb6\x00\x8a\xe3\xf9\
-\x1b\x12\x06\xe9\xad\xc1\x40\x7d\x39\x61\xb0\xce\x9e\x16\x40\x41\
-\x74\x74\x27\x0c\xd6\x15\x63\x83\x81\x9a\x71\x67\xc2\x60\x5d\x7b\
-\x52\x00\x85\x70\xc8\x85\x09\x83\xf6\xa4\x60\xe0\xde\x94\x30\x68\
-\x5b\x16\x04\x50\x00\x4f\x5d\x9b\x30\x68\xff\x1b\x0c\x42\xc7\x2f\
-\x13\x06\x6f\xf1\xc4\x00\x5a\x6c\xcc\x87\xfb\x13\x06\x6d\xf3\xe1\
-\xc1\x60\x3c\xa2\x3f\x61\xf0\x7e\x7d\x42\x00\x2d\x75\xd8\x85\x09\
-\x43\xf0\x8e\x60\x70\xfe\x2b\x61\x08\xb6\x76\xb5\x07\xd0\x3a\xcf\
-\x5e\x97\x30\x04\xbf\x19\x1b\x0c\xce\xde\xb7\x25\x0c\xc5\x77\x67\
-\x04\xd0\x22\xe3\x16\x25\x0c\x45\xff\x63\x83\xc1\x7a\x55\xc2\x90\
-\xac\x39\x3d\x80\x96\x38\xe6\x97\x09\x43\x72\x66\x30\x68\xed\x17\
-\x26\x0c\x49\xff\xa2\x31\x01\x34\xdf\xfc\x8d\x09\x43\xb2\x76\xbf\
-\x60\xf0\x1e\xda\x9b\x30\x34\x17\x1d\x15\x40\x93\x4d\xfe\xef\x84\
-\x21\x7a\x59\x30\x14\x1f\x4f\x18\xa2\x3b\x9f\x17\x40\x53\x9d\x74\
-\x55\xc2\x10\x9d\xdf\x16\x0c\xc5\x5e\x37\x27\x0c\xd5\x67\x26\x06\
-\xd0\x34\xa3\xde\xb1\x3d\x61\x88\xb6\x1f\x1f\x0c\xcd\xf3\x13\x86\
-\xec\xf2\x13\x02\x68\x92\x43\xcf\x4b\x18\xb2\xee\x60\xa8\xbe\x91\
-\x30\x64\xdb\x17\xb6\x07\xd0\x0c\xf3\xee\x48\x18\xb2\x6b\x27\x06\
-\x43\x35\x73\x73\xc2\xd0\x7d\x73\xff\x00\x46\xdc\xd4\xff\x4e\x18\
-\x86\xa7\x06\x43\xf7\xf6\x84\x61\xb8\xf5\x59\x01\x8c\xb0\x53\xae\
-\x4a\x18\x86\xaf\x05\xc3\xd0\x71\x49\xc2\x70\x2c\x99\x16\xc0\x08\
-\xea\x58\xd8\x9b\x30\x0c\xeb\x0f\x0e\x86\xe3\xe4\xbe\x84\xe1\xb8\
-\xf6\xb1\x01\x8c\x98\x23\x2e\x48\x18\x96\x37\x05\xc3\xf3\xc9\x84\
-\x61\xe9\xfb\xc8\xf8\x00\x46\x44\xdb\xab\x36\x26\x0c\xcb\xcf\x3b\
-\x82\xe1\x99\x7a\x63\xc2\xf0\x5c\x76\x62\x00\x23\x60\xc6\xd9\x09\
-\xc3\xd3\x77\x6a\x30\x5c\x2f\x48\x18\xa6\x1d\xdd\xa3\x03\x68\xb4\
-\x79\xb7\x27\x0c\xd3\xbf\x07\xc3\xf7\x8d\x84\xe1\xfa\xe9\x03\x02\
-\x68\xa8\x69\x5f\x48\x18\xae\x35\xd3\x82\xe1\x3b\x72\x73\xc2\x70\
-\x6d\x7a\x6d\x5b\x00\x8d\xf3\xb4\x35\x09\xc3\xf6\xfc\xa0\x11\xde\
-\x9e\x30\x7c\xdf\x3b\x38\x80\x06\x99\x7a\x66\xc2\xf0\x7d\x2b\x68\
-\x88\xd1\x97\x24\x0c\xdf\x1d\x2f\x08\xa0\x21\x1e\x77\x6d\xc2\xf0\
-\xad\x3f\x34\x68\x8c\x13\x7b\x13\x1a\xe0\xac\x03\x03\x18\xb6\x09\
-\xff\xd6\x9f\xd0\x00\xaf\x0f\x1a\xe5\x43\x09\x8d\x70\xe7\x82\xb6\
-\x00\x86\x67\xf6\xe5\x09\x8d\xf0\x93\x51\x41\xa3\x4c\xb8\x2a\xa1\
-\x21\xbe\x7b\x58\x00\xc3\x30\xa1\xbb\x2f\xa1\x11\xb6\x1d\x17\x34\
-\xce\x63\xfa\x13\x1a\x62\x53\x57\x7b\x00\x43\xf5\xc4\xdf\x26\x34\
-\xc6\x3b\x83\x46\x3a\x33\xa1\x41\x96\x1f\x1d\xc0\x90\x4c\xed\xe9\
-\x4f\x68\x8c\x95\x63\x82\x46\x9a\xbe\x26\xa1\x41\x36\x77\x8d\x0a\
-\x60\xf0\x9e\x72\x7d\x42\x83\xf4\x9d\x1a\x34\xd6\xdf\x24\x34\xcc\
-\x2f\x4e\x08\x60\x90\xa6\xf5\x24\x34\xcc\x19\x41\xa3\xfd\x5f\x42\
-\xc3\x6c\xef\x1e\x13\xc0\x60\xcc\xbb\x35\xa1\x61\xae\x99\x14\x34\
-\xda\xc1\x77\x25\x34\xce\x25\x0f\x0d\x60\xc0\x0e\xfe\x7a\x42\xe3\
-\xf4\x3f\x3e\x68\xbc\x57\x27\x34\xd0\x8e\xf7\x8f\x0f\x60\x40\x46\
-\xbd\x61\x7d\x42\x03\x9d\x19\x8c\x80\xf6\x1f\x25\x34\xd2\x55\x4f\
-\x08\x60\x00\x1e\xfc\xd3\x84\x46\x5a\x33\x3d\x18\x09\x47\x6c\x4c\
-\x68\xa8\xa5\x07\x07\xb0\x07\xe3\x17\x6e\x4b\x68\xa8\xe7\x04\x23\
-\xe3\xef\x13\x1a\xeb\xce\xce\x51\x01\xec\xce\x69\xbf\x49\x68\xac\
-\xa5\xc1\x08\x69\x3f\x3f\xa1\xc1\x7e\xf6\xb0\x00\x76\x69\x7a\x4f\
-\x42\x83\xdd\x75\x70\x30\x52\x1e\xb0\x25\xa1\xc1\x76\x2c\x9a\x1c\
-\xc0\x4e\xb5\xcd\xbf\x2d\xa1\xd1\x5e\x11\x8c\x9c\x7f\x48\x68\xb8\
-\xeb\x9e\x11\xc0\x4e\x1c\xfb\xc3\x84\x86\x3b\xb7\x2d\x18\x39\x1d\
-\x17\x27\x34\xde\xd7\x0f\x0d\xe0\x5e\x26\x7e\x60\x7b\x42\xc3\x6d\
-\xbe\x5f\x30\x92\x8e\xd9\x92\xd0\x78\x9b\x16\x8e\x09\xe0\xee\xe6\
-\xfe\x36\x61\x04\xbc\x31\x18\x59\xef\x4c\x18\x09\xbf\x3c\x35\x80\
-\xbf\x38\xf2\x5b\x09\x23\xe1\x82\x51\xc1\xc8\x1a\xfd\x8b\x84\x91\
-\xd0\xd7\xb3\x4f\x00\x7f\x30\xfe\x3d\x5b\x13\x46\xc2\xc6\xa3\x82\
-\x91\xf6\xe0\xed\x09\x23\x62\x5d\xd7\x98\x00\x22\xe6\x5e\x9d\x30\
-\x32\x5e\x17\x8c\xbc\x7f\x4e\x18\x21\x97\x3f\x31\xa0\xf6\x0e\x5e\
-\x9c\x30\x42\x7e\xd0\x16\x8c\xbc\xb1\x2b\x13\x46\xca\x97\x0f\x0d\
-\xa8\xb5\x71\xef\xdc\x9c\x30\x42\x36\x1c\x11\x34\xc3\x43\xb6\x25\
-\x8c\x94\xcd\x0b\xc7\x07\xd4\xd7\xdc\xd5\x09\x23\xe6\x55\x41\x73\
-\xbc\x2b\x61\xe4\x5c\x3f\x3f\xa0\xa6\x8e\xfe\x76\xc2\xc8\xf9\x7e\
-\x5b\xd0\x1c\x1d\x17\x25\x8c\xa0\x1f\x1c\x1f\x50\x43\xd3\x16\xed\
-\x48\x18\x39\x77\x1d\x1a\x34\xcb\x31\x5b\x12\x46\xd0\x8e\x45\x53\
-\x03\x6a\xa6\x7d\xfe\xad\x09\x23\xe9\x65\x41\xf3\x74\x25\x8c\xa8\
-\xdb\x3b\xdb\x03\xea\xe4\xb4\x5f\x26\x8c\xa8\xef\xb5\x05\xcd\x33\
-\xea\xc2\x84\x91\xf5\xd3\x87\x07\xd4\xc6\xe1\x5f\x4d\x18\x59\xeb\
-\x0e\x0e\x9a\xe9\x01\x9b\x13\x46\x56\xff\x57\x8e\x0a\xa8\x85\x29\
-\xef\xdb\x92\x30\xc2\xfe\x36\x68\xae\x37\x26\x8c\xb4\xed\x3d\xfb\
-\x05\x54\x5e\xfb\xfc\x9b\x13\x46\xda\xd2\xa0\xc9\xda\xcf\x4d\x18\
-\x71\x77\x74\x8d\x0b\xa8\xb6\x39\x2b\x13\x46\xdc\xba\x83\x83\x66\
-\x3b\x7c\x7d\xc2\xc8\xbb\x6e\x7e\x5b\x40\x75\x1d\xf7\xcd\x84\x26\
-\x78\x41\xd0\x7c\xaf\x4a\x68\x86\x8b\x1e\x15\x50\x51\x07\xf5\xf4\
-\x26\x34\xc1\xd7\x83\x16\x68\xfb\x4e\x42\x53\x7c\xed\x7e\x01\x15\
-\x34\xf9\xbd\x9b\x12\x9a\xe1\xb6\xfd\x83\x56\x38\x70\x6d\x42\x53\
-\x6c\x5f\xb4\x77\x40\xc5\x74\xbc\x72\x4d\x42\x73\x3c\x27\x68\x8d\
-\x67\x26\x34\xc9\x86\x85\xe3\x02\xaa\x64\xce\xca\x84\x26\xf9\x6c\
-\xd0\x2a\x5f\x48\x68\x96\x6b\xfe\x76\x54\x40\x55\x3c\xf6\xa2\x84\
-\x66\xb9\x66\x4a\xd0\x2a\x53\xaf\x4d\x68\x9a\x5f\xcf\x6b\x0b\xa8\
-\x82\xe3\x97\x24\x34\x4d\xdf\x69\x41\xeb\x3c\xb2\x2f\xa1\x79\x56\
-\xce\x0b\x28\xbd\xc3\x7b\xfa\x12\x9a\xe7\xfd\x41\x2b\x7d\x38\xa1\
-\x99\x2e\x38\x2d\xa0\xd4\xf6\xed\xde\x9a\xd0\x44\x3f\x1f\x13\xb4\
-\xd2\xd8\x95\x09\x4d\xb5\x6c\x56\x40\x69\x4d\xee\x5a\x9f\xd0\x4c\
-\x5b\x1e\x18\xb4\xd6\x09\xdb\x12\x9a\xaa\xff\xcb\x0f\x08\x28\xa5\
-\x49\x6f\x5f\x9b\xd0\x5c\x6f\x08\x5a\xed\x1f\x13\x9a\xac\x6f\xc9\
-\xcc\x80\xd2\x99\xd0\x79\x73\x42\x93\x7d\xaf\x2d\x68\xb5\xf6\x1f\
-\x26\x34\xdb\xb6\x9e\x03\x02\x4a\x65\xcc\x82\x9b\x12\x9a\xed\x8e\
-\x43\x82\xd6\x3b\x72\x43\x42\xd3\x6d\x7c\xff\xf4\x80\xd2\x18\xfb\
-\xda\x1b\x13\x9a\xef\x39\x41\x11\xbc\x34\xa1\x05\x36\x2c\x9a\x11\
-\x50\x0a\xa3\xe7\xaf\x4e\x68\x81\xcf\x06\xc5\xf0\xa5\x84\x56\xd8\
-\xb8\xe8\xc0\x80\xc2\x6b\x9f\x77\x65\x42\x2b\x5c\x3d\x25\x28\x86\
-\xe9\xd7\x27\xb4\xc4\xa6\x0f\x1f\x10\x50\x68\xa3\x5f\x72\x65\x42\
-\x4b\xf4\x3e\x32\x28\x8a\x47\xf6\x26\xb4\xc6\xb6\x9e\x83\x03\x0a\
-\x6b\xcc\xfc\x2b\x12\x5a\xe4\xfd\x41\x71\x74\x27\xb4\xca\xb6\xc5\
-\x47\x06\x14\xd2\x98\x05\xd7\x25\xb4\xca\xcf\xc7\x04\xc5\x31\xfa\
-\x27\x09\x2d\xb3\x7d\xf1\xfd\x02\x0a\x67\x62\xe7\x8d\x09\x2d\xb3\
-\xe5\x81\x41\x91\x1c\xb5\x3e\xa1\x75\xb6\x2f\xbe\x7f\x40\xa1\x4c\
-\xea\xbc\x39\xa1\x85\x5e\x1f\x14\xcb\x2b\x12\x5a\x69\xc7\xe7\x8e\
-\x0e\x28\x8c\x69\x0b\xef\x48\x68\xa5\xef\xb4\x05\x05\xf3\xbf\x09\
-\x2d\xd5\xf7\x7f\xa7\x06\x14\xc2\x01\xdd\x77\x25\xb4\xd4\x9a\xfd\
-\x83\xa2\x99\x76\x5d\x42\x8b\x2d\x9f\xdb\x16\xd0\x6a\x33\x17\x6d\
-\x4e\x68\xad\xfe\xa7\x04\xc5\xf3\xe8\xbe\x84\x56\xbb\xa2\x73\x5c\
-\x40\x2b\x9d\xb0\xb8\x37\xa1\xd5\x3e\x10\x14\xd1\x07\x13\x5a\xef\
-\xfa\x37\x4f\x0e\x68\x91\xb6\x27\x9d\x9b\xd0\x7a\x17\x8d\x0e\x8a\
-\x68\xf4\x85\x09\x05\x70\xd7\xa2\x83\x02\x5a\xa0\x7d\xee\xc5\x09\
-\x05\xb0\xe1\xfe\x41\x31\xcd\xbc\x2b\xa1\x08\xb6\x2d\x3e\x3a\xa0\
-\xc9\x26\x2e\xb8\x22\xa1\x10\x5e\x14\x14\xd5\x0b\x12\x8a\xa1\xef\
-\xab\x27\x05\x34\xd1\x81\xef\xbf\x3d\xa1\x18\x3e\x1b\x14\xd7\x99\
-\x09\x45\x71\xee\xd3\xda\x03\x9a\xe3\xa1\x9f\xdf\x96\x50\x10\xbf\
-\x99\x14\x14\xd7\xc4\x5f\x27\x14\xc6\xea\xae\xe9\x01\x23\xae\x7d\
-\xce\xd2\x84\xc2\xd8\xfa\xd0\xa0\xc8\x1e\xb8\x39\xa1\x38\x36\xf4\
-\x1c\x1b\x30\xa2\x26\x2d\xf8\x75\x42\x81\xbc\x31\x28\xb6\x37\x24\
-\x14\x49\xff\xb2\xb9\x6d\x01\x23\xe5\x80\x85\x6b\x13\x8a\xe4\x5b\
-\x6d\x41\xb1\xb5\x9d\x9d\x50\x2c\x97\xbd\x6a\x62\xc0\x48\x38\xf5\
-\x4b\x3b\x12\x0a\xe5\xc6\x7d\x83\xa2\x9b\x76\x6d\x42\xc1\xdc\xb5\
-\xe8\xf0\x80\x06\x1b\x3b\xef\x82\x84\x82\xe9\x9b\x13\x14\xdf\xa3\
-\x7a\x13\x8a\xa6\x6f\xe9\x9c\x80\x06\x3a\x68\xe1\x6d\x09\x85\xf3\
-\xbe\xa0\x0c\xde\x9d\x50\x40\x3f\xff\xbb\xf1\x01\x0d\xd1\x7e\xfa\
-\xd2\xbe\x84\xe2\xb9\xb0\x23\x28\x83\xf6\xef\x27\x14\xd1\x9d\x3d\
-\x0f\x0a\x18\xb6\x29\x0b\x56\x25\x14\xd1\x9d\x47\x04\xe5\x70\xe0\
-\x2d\x09\xc5\x74\xde\x0b\xc6\x06\x0c\xc7\x83\x7a\x36\x26\x14\xd3\
-\x73\x83\xb2\x78\x42\x5f\x42\x41\xdd\xf6\xc1\xfb\x05\x0c\xd1\x84\
-\x97\xfc\x38\xa1\xa8\xfe\x33\x28\x8f\x7f\x4e\x28\xae\x15\xf3\x47\
-\x07\x0c\xde\xd1\xdd\xb7\x27\x14\xd6\xca\x09\x41\x79\xb4\x7f\x3f\
-\xa1\xc0\xd6\x74\xcf\x0c\x18\x94\x71\xf3\x96\x25\x14\xd8\x86\xa3\
-\x83\x32\xd9\xff\xe6\x84\x22\xeb\x5b\x36\x6f\x74\xc0\x40\x1d\xd3\
-\x7d\x7b\x42\xa1\xbd\x30\x28\x97\x27\xf4\x25\x14\xdb\x0d\xef\x3e\
-\x22\x60\x00\x26\xbe\xf4\x27\x09\x05\xf7\xf1\xa0\x6c\xfe\x39\xa1\
-\xf0\x56\x2c\x98\x1c\xb0\x7b\xb3\x16\xad\x4d\x28\xba\x8b\xc7\x06\
-\x65\xd3\xfe\xfd\x84\xe2\xdb\xbc\x64\x4e\x5b\xc0\xae\x1c\xd8\xb9\
-\x32\xa1\xf8\xd6\xcd\x0c\xca\x67\xff\x9b\x13\xca\xe0\xba\xee\x23\
-\x03\x76\x62\xec\xdc\x25\x3b\x12\x4a\xa0\xff\x99\x41\x19\x3d\xa6\
-\x37\xa1\x14\xfa\x96\x2f\x98\x14\x70\x4f\xb3\x16\xdd\x96\x50\x0e\
-\x1f\x0c\xca\xe9\x3d\x09\x65\xb1\xfe\xbf\x1e\xd9\x16\xf0\x67\x07\
-\xbc\xe5\xd2\x84\xb2\xb8\x60\x74\x50\x4e\xed\xdf\x49\x28\x8f\xeb\
-\xba\x67\x06\xfc\xce\xf8\x79\x4b\xb7\x27\x94\xc6\xda\xc3\x82\xb2\
-\x9a\xfe\xdb\x84\x12\xe9\x5b\xde\xb9\x7f\x50\x73\xa3\xe6\x2c\xde\
-\x90\x50\x22\x7d\xa7\x07\xe5\x75\xf2\xb6\x84\x52\xe9\x5d\xbe\x60\
-\x4a\x50\x5f\xb3\x16\xad\x49\x28\x97\xf7\x06\x65\xf6\xc6\x84\xb2\
-\xd9\xb2\x74\xfe\xc4\xa0\x8e\x0e\xef\xba\x22\xa1\x6c\x7e\xd8\x11\
-\x94\x59\xdb\x57\x12\xca\xe7\xce\xcf\x3e\xb1\x23\xa8\x97\x43\xde\
-\x74\x71\x42\xf9\xac\x39\x20\x28\xb7\x49\x97\x25\x94\xd1\xda\xc5\
-\x73\xda\x82\xba\x38\xa8\x73\x79\x7f\x42\x09\xf5\x3d\x3e\x28\xbb\
-\xe3\x37\x26\x94\xd3\xf5\x8b\x66\x07\x35\xb0\xcf\xfc\xa5\xbd\x09\
-\xe5\xf4\xce\xa0\xfc\xe6\x27\x94\xd6\xe5\xff\x72\x62\x5b\x50\x65\
-\x33\x5e\x7b\x5e\x5f\x42\x59\x7d\xb7\x3d\xa8\x80\x9e\x84\x12\xbb\
-\xf6\xa3\x8f\x1a\x15\x54\xd3\xfe\xaf\x3e\xb7\x37\xa1\xbc\xae\xdd\
-\x37\xa8\x82\xb1\x17\x27\x94\xda\xed\x8b\xe7\x8e\x0d\xaa\xe6\xb0\
-\xce\x65\x3b\x12\xca\x6c\xeb\xc3\x82\x6a\x38\x62\x6d\x42\xc9\xad\
-\xfb\xc2\xb3\x26\x04\xd5\xf1\xa0\x77\xfd\x22\xa1\xec\x5e\x16\x54\
-\xc5\xe3\x7b\x13\x4a\x6f\xcb\xd2\xf9\x7b\x05\x15\xd0\x3e\x6b\xe1\
-\xe5\x09\xe5\xf7\xc9\xa0\x3a\xde\x99\x50\x05\xdb\xbe\xfd\x8a\x19\
-\x41\xa9\x8d\x39\xbd\xe7\xe6\x84\x2a\xf8\xc9\xd8\xa0\x3a\xda\xbe\
-\x9e\x50\x0d\xfd\x2b\xde\x7d\x52\x7b\x50\x4e\xfb\xbd\xe4\x2b\x77\
-\x25\x54\xc3\x2d\x07\x07\x55\x32\xf9\xb2\x84\xca\xb8\x6d\xc9\xfc\
-\xbd\x82\xb2\x39\xae\x6b\x79\x5f\x42\x55\xec\x38\x2d\xa8\x96\xa3\
-\xef\x4a\xa8\x90\xde\x15\x0b\x67\x05\xa5\x31\x7e\xce\xa2\xeb\x13\
-\xaa\xe4\x4d\x41\xd5\x3c\xb7\x3f\xa1\x5a\x56\x7f\xec\x89\xe3\x82\
-\xe2\x3b\xe2\x75\xdf\xd9\x92\x50\x2d\x5f\x0c\xaa\xe7\x43\x09\x95\
-\xb3\x79\x59\xe7\xa1\x41\x81\x4d\x98\xd3\xbd\x22\xa1\x72\x56\x4e\
-\x0c\xaa\x67\xd4\x77\x13\xaa\x68\x75\xcf\xbc\xbd\x82\x22\x9a\xd9\
-\xb9\x6c\x6b\x42\x05\xad\x3f\x3a\xa8\xa2\xbd\xaf\x49\xa8\xa6\xde\
-\x15\xdd\x73\xc6\x04\x45\xb2\xef\xbc\x9e\x1b\x12\xaa\xa9\xff\x99\
-\x41\x35\x9d\xb4\x35\xa1\xb2\xd6\x9f\xfd\x86\x63\x83\x42\x18\x3f\
-\xe7\x03\xbf\xe8\x4f\xa8\xac\x77\x07\x55\xf5\x8a\x84\x4a\xbb\xf1\
-\x73\x2f\x3e\x20\x68\xa9\xb1\x8f\x7a\xd7\x79\x5b\x13\xaa\xec\x1b\
-\xed\x41\x65\x7d\x22\xa1\xea\x2e\xfd\xe8\x53\xa7\x06\x2d\xd1\x71\
-\xea\x3f\x2e\xdb\x94\x50\x71\x57\x4d\x0b\xaa\x6b\xf4\x0f\x13\xaa\
-\xaf\x77\x55\xcf\xfc\x43\x82\xa6\x6a\x3f\x6e\xc1\x92\x75\x09\xd5\
-\xb7\xf9\x84\xa0\xca\xf6\xbf\x3e\xa1\x1e\x2e\xff\xd4\xfc\xc3\x83\
-\xa6\x18\xfb\x88\x7f\xf8\xc6\xba\x84\x7a\x78\x41\x50\x6d\x27\x6e\
-\x49\xa8\x8d\xeb\xbe\xf0\xca\x63\xdb\x82\x91\x34\xf5\xc9\xef\xfb\
-\xd1\x96\x84\xda\xf8\x48\x50\x75\x2f\x4a\xa8\x95\xbb\x96\x75\xcd\
-\x1e\x13\x8c\x84\x19\x73\xbb\x97\x6f\x4f\xa8\x93\x65\x1d\x41\xe5\
-\x7d\x38\xa1\x6e\xd6\x7f\xff\x7d\x4f\x9b\x11\x34\xd0\xe8\x59\xaf\
-\x5d\xbc\x3a\xa1\x6e\xae\x9c\x1e\x54\xdf\xa8\x6f\x27\xd4\xd1\x4d\
-\x4b\x17\xce\x99\x10\x0c\xdf\x81\x73\x17\x2e\xdb\x94\x50\x43\xeb\
-\x8f\x0f\xea\x60\xfa\x55\x09\x35\xd5\xbb\x6a\x71\xe7\xac\xf6\x60\
-\xa8\x26\xce\xee\x5c\x7c\x4d\x42\x4d\xf5\xcd\x0d\xea\xe1\x41\x1b\
-\x13\x6a\xec\xce\x65\xef\x9d\xbb\x7f\x30\x48\xe3\x4f\x79\xcd\xa7\
-\x57\xf6\x26\xd4\xd8\xdb\x83\xba\x78\x4e\x7f\x42\xcd\xfd\xf6\xac\
-\x85\xcf\x38\x3c\x18\x90\x49\x8f\x78\xc3\x67\x57\xee\x48\xa8\xb9\
-\xff\x69\x0b\x6a\xe3\x7d\x09\x64\xde\xf1\x83\x8f\xfc\xed\x83\x47\
-\x07\xbb\x36\xe5\xd1\x6f\xfa\xfc\x65\xbd\x09\xe4\xc5\xe3\x83\xfa\
-\x68\x3f\x2b\x81\x3f\xda\xbe\x6a\x71\xd7\xdc\x7d\x82\x7b\x3b\x70\
-\x6e\xd7\xe2\x55\x7d\x09\xfc\xc1\xcd\x87\x04\x75\x32\x79\x65\x02\
-\x7f\xd5\xbf\xfa\xab\xff\xf4\xcc\xfb\x77\x04\xbf\xb7\xef\xe3\xde\
-\xf8\x99\x8b\x37\x27\xf0\x57\x5b\x4f\x0d\xea\xe5\xf0\x5b\x13\xb8\
-\x97\x6d\x2b\xbf\xfc\xae\xe7\x1e\x3f\x26\xea\x6b\xda\xa9\x2f\xfd\
-\xe0\xf7\x6e\x4e\xe0\xde\x5e\x12\xd4\xcd\x23\xb6\x26\xb0\x33\x3b\
-\x56\x2f\x5b\xb4\x60\xf6\xa4\xa8\x97\x69\xb3\x17\x74\x2f\x5d\xdd\
-\x9f\xc0\xce\x9c\x11\xd4\xcf\xcb\x13\xd8\xb5\xbe\xd5\xdf\xf8\xd7\
-\xbf\x7b\xe4\x01\x51\x79\xe3\x8e\x7d\xc6\x3f\x7c\xee\xa2\xbb\x12\
-\xd8\xb5\xef\x8e\x0a\x6a\xe8\xa3\x09\xec\xc9\xd6\xd5\xcb\x7a\xba\
-\xe6\xcd\x1a\x1f\xd5\x33\x76\xe6\x9c\xce\x9e\x65\xab\x7b\x13\xd8\
-\x83\xdf\x4c\x0b\xea\x68\xd4\x77\x12\x18\x98\x1d\x57\x7d\xf7\x3f\
-\xfe\xfe\x19\x0f\x9c\x10\x15\xd0\x76\xe0\xa9\xcf\x7f\xe7\x67\x97\
-\xaf\x49\x60\x60\xee\x3c\x26\xa8\xa7\xbd\x2e\x4f\x60\x50\x6e\x3a\
-\xff\xbf\x3f\xf0\xfa\xa7\xcf\x9a\x11\x25\x34\xfa\x88\xd3\xfe\xf6\
-\x5d\x9f\xf9\xfe\x95\x5b\x13\x18\x8c\xde\x27\x07\x75\x75\xff\x3b\
-\x12\x18\x8a\xad\x57\x9d\xb7\xf8\xfd\xaf\x99\xfb\x90\x7d\xa2\xf0\
-\xc6\x1e\xfe\x88\xe7\xbc\xa1\xfb\x0b\xcb\xaf\xef\x4b\x60\x28\xde\
-\x16\xd4\xd7\xe3\x77\x24\x30\x1c\x9b\x7f\x73\xce\xe7\xfe\xf5\xcd\
-\x2f\x3e\xfd\xc1\x07\x8e\x8e\x22\x19\x7b\xf0\x49\x4f\x7b\xcd\x7b\
-\xce\xfc\xd6\xca\x5b\x13\x18\x96\x2f\x04\x75\xf6\xfa\x04\x1a\x64\
-\xed\x65\xe7\x7d\xe5\xe3\xef\x7a\xf5\x33\x67\x3f\x60\x6a\xb4\xc4\
-\x98\x03\x1f\xfc\x84\x17\xbe\xf1\xbd\x9f\xfe\xfa\x05\x57\xac\x4f\
-\xa0\x31\x2e\x18\x17\xd4\xda\xbf\x27\xd0\x70\x5b\x6f\xfe\xf5\x85\
-\xdf\xfe\xd2\x27\xbb\xbb\x5e\xf9\x37\xa7\x9f\x72\xf4\x8c\xf1\x31\
-\x32\xc6\xce\x38\xfa\xd4\x27\xbd\xe0\x35\xef\xf8\xe0\xa7\xbf\x7a\
-\xce\xcf\xae\xbe\x33\x81\x86\xbb\x7a\xbf\xa0\xde\x3a\xbe\x93\xc0\
-\x48\xdb\xba\xe6\xf2\x9f\x2c\x3b\x6b\xc9\xa7\x3e\xd9\xfd\xcf\x5d\
-\x9d\x0b\x5e\x30\xef\xf1\x8f\x9d\xf5\xc0\x99\x33\xa6\x75\xc4\x80\
-\x4c\x99\x36\x63\xe6\xcc\x59\xb3\x1e\x39\xe7\x89\xf3\x5e\xfc\xca\
-\xae\xf7\x7c\xb0\xe7\x7f\xce\x5a\x76\xd1\xa5\x57\xdf\xb1\x35\x81\
-\x11\xb6\xee\xd8\xa0\xee\xa6\x5e\x9a\x40\xeb\xf4\xde\xf1\x7b\xd7\
-\xac\xfe\x9d\x5f\xad\xf8\x8b\xcb\x56\xff\xc1\xcd\x77\xdc\xb1\x3e\
-\x81\x96\xd9\xfe\xf8\x80\xc3\xd7\x24\x00\x70\x5f\xaf\x0e\x88\x78\
-\xd8\xa6\x04\x00\xee\xed\x83\x01\xbf\x37\xaf\x3f\x01\x80\x7b\xfa\
-\xc6\xa8\x80\x3f\x58\x98\x00\xc0\x3d\xfc\x7c\x62\xc0\x1f\xb5\x7d\
-\x3e\x01\x80\xbb\xb9\xf1\xe0\x80\x3f\x1b\x77\x41\x02\x00\x7f\xb1\
-\xe9\x61\x01\x7f\xb5\xcf\x95\x09\x00\xfc\x49\xdf\xd3\x03\xee\xee\
-\xb8\x3b\x13\x00\xf8\xa3\x37\x05\xdc\xd3\xa3\xb7\x26\x00\xf0\x7b\
-\x9f\x0e\xb8\xb7\xe7\xf7\x27\x00\x90\xf9\xdd\x8e\x80\xfb\x78\x77\
-\x02\x00\x79\xd9\x5e\x01\xf7\xd5\xf6\xd9\x04\x80\xda\xbb\xed\xc8\
-\x80\x9d\x19\xf3\x83\x04\x80\x9a\xdb\x7c\x4a\xc0\xce\x4d\x59\x99\
-\x00\x50\x6b\x7d\xcf\x0e\xd8\x95\xc3\x6f\x4e\x00\xa8\xb3\xce\x80\
-\x5d\x9b\xb5\x31\x01\xa0\xbe\xfe\x35\x60\x77\x9e\xd2\x9b\x00\x50\
-\x57\x5f\x6e\x0f\xd8\xad\x57\x26\x00\xd4\xd4\x79\x63\x03\xf6\xe0\
-\x8c\x04\x80\x5a\xba\x74\xaf\x80\x3d\x69\x5b\x9c\x00\x50\x43\x37\
-\x1e\x16\xb0\x67\x63\x96\x25\x00\xd4\xce\xfa\x87\x04\x0c\xc4\x94\
-\x4b\x12\x00\x6a\x66\xfb\x13\x02\x06\xe6\xc0\x6b\x13\x00\x6a\xa5\
-\xff\x6f\x03\x06\xea\xd8\x3b\x12\x00\xea\xe4\x1f\x03\x06\xee\x51\
-\x5b\x12\x00\xea\xe3\x3f\x03\x06\xe3\xb9\x7d\x09\x00\x75\xf1\x8d\
-\x8e\x80\x41\x79\x4d\x02\x40\x4d\x5c\x3c\x31\x60\x90\xce\x48\x00\
-\xa8\x85\xd5\xfb\x07\x0c\x56\xfb\x97\x12\x00\x6a\xe0\xd6\xfb\x05\
-\x0c\xde\xd8\xef\x27\x00\x54\xde\xc6\x93\x03\x86\x62\xf2\x8a\x04\
-\x80\x8a\xdb\xfe\xa4\x80\xa1\xd9\xe7\xf2\x04\x80\x4a\xeb\xff\xdb\
-\x80\xa1\x3a\xe4\xba\x04\x80\x2a\x7b\x63\xc0\xd0\x1d\x7f\x47\x02\
-\x40\x75\x2d\x0c\x18\x8e\x53\x36\x26\x00\x54\xd5\x27\x02\x86\x67\
-\xee\x8e\x04\x80\x6a\xfa\xdf\x51\x01\xc3\xf4\xe2\xfe\x04\x80\x2a\
-\x3a\x67\x6c\xc0\xb0\xbd\x3d\x01\xa0\x82\x2e\x9a\x14\xd0\x00\x67\
-\x24\x00\x54\xce\x15\xfb\x05\x34\x42\xfb\xe7\x13\x00\x2a\xe6\xba\
-\x43\x02\x1a\x63\xd4\x57\x13\x00\x2a\xe5\xb6\x63\x02\x1a\x65\xcc\
-\x77\x13\x00\x2a\x64\xd3\xc3\x03\x1a\x67\xf2\xc5\x09\x00\x95\xb1\
-\xed\x89\x01\x8d\xb4\xcf\xaa\x04\x80\x8a\xe8\x7b\x6e\x40\x63\x1d\
-\x74\x75\x02\x40\x35\xbc\x21\xa0\xd1\x8e\xba\x39\x01\xa0\x0a\xde\
-\x19\xd0\x78\x0f\x5c\x9b\x00\x50\x7e\x1f\x0d\x18\x09\x27\x6f\x48\
-\x00\x28\xbb\xcf\xb4\x05\x8c\x88\xc7\x6d\x4d\x00\x28\xb7\xcf\xb7\
-\x07\x8c\x90\x67\xf7\x26\x00\x94\xd9\xd7\x3a\x02\x46\xcc\x8b\xfb\
-\x12\x00\xca\xeb\x7b\x63\x03\x46\xd0\x4b\xfb\x13\x00\xca\x6a\xf9\
-\xc4\x80\x11\xd5\x99\x00\x50\x52\x3f\x99\x1c\x30\xc2\xde\x95\x00\
-\x50\x4a\x2b\xa7\x07\x8c\xb8\xee\x04\x80\x12\xba\x62\x46\x40\x13\
-\x9c\x91\x00\x50\x3a\xd7\x1e\x16\xd0\x0c\x6d\xff\x99\x00\x50\x32\
-\x37\xcc\x0c\x68\x8e\x51\x5f\x4c\x00\x28\x95\x5b\x8f\x0d\x68\x96\
-\xd1\x67\x27\x00\x94\xc8\x9d\xb3\x02\x9a\x67\xcc\xb7\x12\x00\x4a\
-\x63\xd3\xec\x80\x66\x9a\xf0\xc3\x04\x80\x92\xd8\x7c\x5a\x40\x73\
-\x4d\xf8\x61\x02\x40\x29\x6c\x7f\x4a\x40\xb3\x4d\xf9\x49\x02\x40\
-\x09\x6c\x7f\x46\x40\xf3\x4d\xbd\x28\x01\xa0\xf0\x7a\x9f\x17\xd0\
-\x0a\x7b\x5d\x9c\x00\x50\x70\xbd\xcf\x0f\x68\x8d\x69\x3f\x4b\x00\
-\x28\xb4\xde\x17\x06\xb4\xca\xbe\x97\x26\x00\x14\x58\xef\x8b\x02\
-\x5a\x67\xbf\x55\x09\x00\x85\xd5\xfb\xe2\x80\x56\xda\xff\xd7\x09\
-\x00\x05\xd5\x37\x3f\xa0\xb5\x0e\x5e\x9d\x00\x50\x48\xfd\xaf\x0c\
-\x68\xb5\xc3\xaf\x49\x00\x28\xa0\xbe\x97\x06\xb4\xde\xa1\xab\x13\
-\x00\x0a\xa7\xff\xd5\x01\x45\x70\xe8\x55\x09\x00\x05\xd3\xff\x9a\
-\x80\x62\x38\xe4\xaa\x04\x80\x42\xe9\x7f\x6d\x40\x51\x1c\x72\x55\
-\x02\x40\x81\xf4\xbf\x3e\xa0\x38\x0e\xb9\x2a\x01\xa0\x38\xde\x16\
-\x50\x24\x87\x5c\x95\x00\x50\x14\xff\x10\x50\x2c\x87\xae\x4e\x00\
-\x28\x86\xb7\x04\x14\xcd\x21\x57\x25\x00\x14\x40\xff\x9b\x02\x8a\
-\xe7\x90\x2b\x13\x00\x5a\xae\xff\x0d\x01\x45\x74\xc8\x15\x09\x00\
-\x2d\xd6\xf7\x8a\x80\x62\xda\xff\x57\x09\x00\x2d\xd5\xfb\x92\x80\
-\xa2\xda\xef\x97\x09\x00\x2d\xd4\xfb\xe2\x80\xe2\x9a\x76\x51\x02\
-\x40\xcb\x6c\x7f\x4e\x40\x91\xed\xf5\x93\x04\x80\x16\xd9\xf6\xcc\
-\x80\x62\x9b\x7a\x41\x02\x40\x4b\x6c\x7d\x5a\x40\xd1\x4d\x3c\x27\
-\x01\xa0\x05\x36\x3d\x3e\xa0\xf8\x26\x2c\x4b\x00\x68\xba\x8d\x8f\
-\x0b\x28\x83\xb1\x67\x27\x00\x34\xd9\xc6\xd3\x02\xca\x61\xcc\xff\
-\x25\x00\x34\xd5\x9d\xa7\x04\x94\xc5\x98\xaf\x24\x00\x34\xd1\xda\
-\x59\x01\xe5\x31\xea\x33\x09\x00\x4d\x73\xeb\x83\x03\xca\xa4\xed\
-\x23\x09\x00\x4d\xb2\xe6\x81\x01\x25\xf3\x81\x04\x80\xa6\xb8\xee\
-\x01\x01\xa5\xd3\x95\x00\xd0\x04\x57\x1f\x19\x50\x42\xaf\xe9\x4b\
-\x00\x18\x69\xab\x0e\x0c\x28\xa5\x17\xef\x48\x00\x18\x59\x17\xed\
-\x1d\x50\x52\xcf\xdb\x9e\x00\x30\x92\xce\x9d\x1c\x50\x5a\x4f\xdd\
-\x92\x00\x30\x72\xce\x1e\x17\x50\x62\x8f\xdf\x94\x00\x30\x52\x3e\
-\xd7\x11\x50\x6a\x27\xdd\x9e\x00\x30\x32\xfe\xbd\x3d\xa0\xe4\x8e\
-\xbb\x21\x01\x60\x24\x74\x07\x94\xdf\x11\x57\x26\x00\x34\x5c\xff\
-\x5b\x02\xaa\x60\xc6\x2f\x13\x00\x1a\xac\xf7\x15\x01\xd5\x30\xed\
-\x82\x04\x80\x86\xda\xf6\xdc\x80\xaa\x98\xf8\xdd\x04\x80\x06\xda\
-\xf4\xa4\x80\xea\x18\xb3\x24\x01\xa0\x61\x36\x3c\x36\xa0\x4a\x46\
-\xfd\x67\x02\x40\x83\xac\x3d\x39\xa0\x5a\xda\x3e\x94\x00\xd0\x10\
-\xd7\x1d\x1d\x50\x39\x6f\xef\x4f\x00\x18\xbe\x4b\x0f\x0e\xa8\xa0\
-\xf9\x3b\x12\x00\x86\xeb\x27\xfb\x04\x54\xd2\xdc\xcd\x09\x00\xc3\
-\x73\xf6\x84\x80\x8a\x3a\xf9\xb6\x04\x80\xe1\xf8\x6c\x47\x40\x65\
-\x1d\x7b\x5d\x02\xc0\xd0\x75\xb7\x05\x54\xd8\x81\x2b\x13\x00\x86\
-\xa8\xff\xcd\x01\xd5\x36\x7d\x79\x02\xc0\x90\x6c\xfb\x9b\x80\xaa\
-\x9b\xf0\xcd\x04\x80\x21\xd8\xf0\x84\x80\xea\xeb\xf8\x74\x02\xc0\
-\xa0\xdd\x7c\x42\x40\x1d\xb4\x75\x27\x00\x0c\xd2\xea\xfb\x05\xd4\
-\xc4\x9b\xfb\x12\x00\x06\xe3\xe2\xfd\x02\x6a\xe3\x59\x9b\x13\x00\
-\x06\xee\x9c\x29\x01\x35\x72\xea\x6d\x09\x00\x03\xf5\xdf\x63\x02\
-\x6a\xe5\xd8\xdf\x26\x00\x0c\xcc\xa2\xf6\x80\x9a\x39\xf0\x92\x04\
-\x80\x01\xe8\x7b\x4b\x40\xfd\x4c\xfa\x76\x02\xc0\x1e\x6d\x7d\x7e\
-\x40\x1d\x75\x7c\x2a\x01\x60\x0f\xd6\x3e\x2a\xa0\x9e\xda\x16\x26\
-\x00\xec\xd6\xea\x07\x04\xd4\xd6\xcb\x76\x24\x00\xec\xda\x4f\xf6\
-\x0b\xa8\xb1\xa7\x6f\x4a\x00\xd8\x95\xaf\x8e\x0f\xa8\xb5\x87\xdd\
-\x9c\x00\xb0\x73\x8b\xda\x03\x6a\xee\xa0\x4b\x12\x00\x76\xa2\xf7\
-\x75\x01\x4c\xfe\x76\x02\xc0\x7d\x6c\x7c\x5a\x00\x11\x1d\x9f\x4c\
-\x00\xb8\x97\x9b\x4f\x0c\xe0\x0f\x3a\xfb\x13\x00\xee\x6e\xd5\xe1\
-\x01\xfc\xc9\xbc\x2d\x09\x00\x7f\xb5\x7c\x9f\x00\xfe\xe2\xe1\xb7\
-\x25\x00\xfc\xd9\x92\x71\x01\xdc\xcd\x51\xbf\x49\x00\xf8\xa3\x45\
-\x6d\x01\xdc\xc3\x7e\x17\x26\x00\xfc\xce\xf6\x97\x06\x70\x6f\xe3\
-\xbf\x94\x00\x90\x77\x3c\x2e\x80\xfb\x6a\xeb\xea\x4f\x00\xea\xee\
-\xaa\x63\x02\xd8\xa9\xe7\x6e\x4e\x00\xea\xed\xfc\x7d\x03\xd8\x85\
-\x53\xd6\x24\x00\x75\xf6\xa9\xd1\x01\xec\xd2\xc1\x3f\x4f\x00\x6a\
-\xab\xb7\x2b\x80\xdd\x99\x74\x76\x02\x50\x53\x1b\x9e\x16\xc0\xee\
-\x8d\xea\x4e\x00\x6a\xe9\xfa\x13\x02\xd8\xa3\x57\x6c\x4f\x00\xea\
-\xe7\xc7\xfb\x07\x30\x00\x8f\x5f\x97\x00\xd4\xcd\x17\xc7\x07\x30\
-\x20\xf7\xfb\x75\x02\x50\x2b\xfd\x0b\xdb\x02\x18\xa0\x69\xcb\x12\
-\x80\x1a\xd9\xf8\xcc\x00\x06\x6e\x54\x77\x02\x50\x1b\x37\x9e\x18\
-\xc0\xa0\xbc\x7c\x5b\x02\x50\x0f\xbf\x38\x24\x80\x41\x7a\xc4\x9a\
-\x04\xa0\x0e\xbe\x32\x21\x80\x41\x3b\xfc\x97\x09\x40\xe5\xf5\xbf\
-\xab\x2d\x80\x21\x98\xf8\xb5\x04\xa0\xe2\x36\x3c\x2b\x80\xa1\x69\
-\xeb\xea\x4b\x00\xaa\xec\xca\xe3\x02\x18\xb2\x79\x9b\x12\x80\xea\
-\xfa\xf6\xb4\x00\x86\xe1\x84\xdf\x26\x00\x15\xd5\xdf\x3d\x2a\x80\
-\x61\xd9\xfb\xfb\x09\x40\x25\x6d\x99\x1f\xc0\x70\x75\x74\x27\x00\
-\x15\x74\xdd\x89\x01\x34\xc0\x0b\x36\x27\x00\x55\x73\xde\x7e\x01\
-\x34\xc4\x09\xbf\x4d\x00\xaa\xa5\x67\x74\x00\x0d\xb2\xcf\x0f\x12\
-\x80\x0a\xd9\xfa\xd2\x00\x1a\xa7\xa3\x3b\x01\xa8\x8c\x1b\x4e\x0e\
-\xa0\xa1\x5e\xbc\x39\x01\xa8\x86\x0b\x66\x04\xd0\x60\xa7\xde\x94\
-\x00\x54\xc1\x27\xc7\x04\xd0\x70\xfb\x9e\x93\x00\x94\xde\x8e\x37\
-\x04\x30\x12\x46\x2f\x4a\x00\x4a\xee\xa6\x47\x04\x30\x42\x9e\xbf\
-\x31\x01\x28\xb3\x1f\x1d\x10\xc0\x88\x39\xfa\xb2\x04\xa0\xbc\x7a\
-\x46\x07\x30\x82\xa6\xfc\x6f\x02\x50\x52\xeb\xe7\x05\x30\xb2\xda\
-\xba\x7a\x13\x80\x32\xba\xfc\xb8\x00\x46\xdc\xe9\x6b\x13\x80\xf2\
-\xf9\xe2\xa4\x00\x9a\xe0\x90\x8b\x12\x80\x92\xd9\xd1\x15\x40\x73\
-\x8c\xff\x6c\x02\x50\x2a\x37\x3e\x22\x80\xa6\x99\xbf\x29\x01\x28\
-\x8f\xf3\x0e\x08\xa0\x89\x4e\xb8\x2a\x01\x28\x89\xfe\x45\xa3\x03\
-\x68\xaa\x29\x5f\x49\x00\x4a\x61\xfd\xbc\x00\x9a\xad\xad\x73\x7b\
-\x02\x50\x7c\xbf\x3e\x36\x80\x16\x78\xe4\x8d\x09\x40\xd1\xfd\xcf\
-\xc4\x00\x5a\x62\xdf\xef\x25\x00\x85\xb6\xa3\x2b\x80\x56\x19\xf5\
-\xbe\xfe\x04\xa0\xb8\x7e\x7b\x4a\x00\x2d\xf4\xe4\xb5\x09\x40\x51\
-\x7d\x7d\x7a\x00\x2d\x75\xd8\x4f\x12\x80\x42\xda\xf6\xc6\xb6\x00\
-\x5a\xac\x63\x61\x5f\x02\x50\x3c\xd7\x9e\x1a\x40\x01\xcc\x5d\x9b\
-\x00\x14\xcd\x59\xd3\x02\x28\x84\x43\x96\x27\x00\x85\xb2\xb5\xb3\
-\x2d\x80\x82\xe8\x58\xd8\x97\x00\x14\xc7\x6f\x4f\x09\xa0\x40\xe6\
-\xac\x49\x00\x8a\xe2\x7f\xa7\x05\x50\x28\x07\x9f\x9f\x00\x14\xc2\
-\xd6\xce\x00\x8a\xa6\x63\x61\x5f\x02\xd0\x7a\xd7\x9c\x14\x40\x01\
-\x9d\x7e\x6b\x02\xd0\x6a\x5f\x9c\x1c\x40\x21\xed\xf7\xed\x04\xa0\
-\xa5\xb6\x74\x06\x50\x54\x6d\x9d\xdb\x12\x80\xd6\xf9\xcd\x83\x03\
-\x28\xb0\x53\xae\x49\x00\x5a\xe5\x73\x93\x02\x28\xb4\x29\xff\x9d\
-\x00\xb4\xc4\x5d\x2f\x0a\xa0\xf0\xe6\x6f\x48\x00\x9a\xef\xa7\x47\
-\x06\x50\x02\x0f\xf8\x45\x02\xd0\x64\xbd\xdd\xa3\x03\x28\x85\xb1\
-\x8b\xfa\x13\x80\x66\xba\xf6\x51\x01\x94\xc6\x13\xd6\x24\x00\xcd\
-\xf3\xd5\xe9\x01\x94\xc8\x41\xe7\x24\x00\x4d\xb2\xe1\xa5\x01\x94\
-\x4b\x5b\xe7\xd6\x04\xa0\x19\x56\xdc\x3f\x80\xd2\x39\x7e\x65\x02\
-\x30\xe2\xfa\x17\x8d\x09\xa0\x84\xc6\x2d\xea\x4f\x00\x46\xd6\x9a\
-\x27\x05\x50\x52\x4f\xbc\x29\x01\x18\x49\xdf\x99\x11\x40\x69\xed\
-\xb7\x34\x01\x18\x31\x5b\x3a\xdb\x02\x28\xb1\xb6\x05\x9b\x12\x80\
-\x91\xb1\xea\x41\x01\x94\xdc\xf1\x2b\x13\x80\x11\xd0\xff\x91\x71\
-\x01\x94\xde\xb8\x8f\xf4\x27\x00\x8d\x76\xed\x63\x03\xa8\x84\xc7\
-\x5d\x97\x00\x34\xd6\x92\xe9\x01\x54\xc4\x94\x9e\x04\xa0\x81\xd6\
-\xbd\x20\x80\x0a\x79\xf6\x6d\x09\x40\xa3\x7c\xe7\xc0\x00\x2a\x65\
-\xff\xb3\x13\x80\x86\xd8\xd4\xd9\x16\x40\xd5\xcc\xdf\x90\x00\x0c\
-\xdf\x8f\xef\x17\x40\x05\x1d\xf1\xa3\x04\x60\x98\xb6\x2f\x1c\x15\
-\x40\x25\x75\x74\x6d\x4b\x00\x86\xe3\x57\x27\x04\x50\x59\xb3\x56\
-\x25\x00\x43\xd6\xfb\x2f\x63\x02\xa8\xb0\x71\xdd\xbd\x09\xc0\xd0\
-\x5c\xf3\xa8\x00\x2a\xee\x94\xcb\x13\x80\xa1\x58\x3c\x29\x80\xca\
-\x1b\xdf\xdd\x97\x00\x0c\xd6\x9a\xa7\x05\x50\x0b\xa7\x5d\x9d\x00\
-\x0c\xce\x7f\xef\x1d\x40\x4d\x4c\xe8\xee\x4b\x00\x06\x6e\xcd\xb3\
-\x02\xa8\x91\xc7\x5f\x9b\x00\x0c\xd4\x92\xbd\x03\xa8\x95\x29\x3d\
-\xfd\x09\xc0\x40\xdc\xfc\xcc\x00\x6a\xe7\xa9\x37\x26\x00\x7b\xf6\
-\xd9\x69\x01\xd4\xd0\xd4\x9e\xfe\x04\x60\xf7\x6e\x7e\x7a\x00\x35\
-\xf5\xc4\x6b\x13\x80\xdd\x59\x32\x3d\x80\xda\x9a\xd0\xdd\x97\x00\
-\xec\xca\x4d\x4f\x0b\xa0\xd6\x66\xff\x26\x01\xd8\xb9\x25\xd3\x02\
-\xa8\xb9\xf1\xdd\xbd\x09\xc0\x7d\xdd\x38\x37\x00\xe2\xd4\x5f\x27\
-\x00\xf7\xd2\xdf\x33\x39\x00\x7e\x67\x5c\x77\x6f\x02\x70\x77\xd7\
-\xcc\x09\x80\x3f\x39\x69\x65\x02\xf0\x17\x7d\x1f\x9f\x14\x00\x7f\
-\xd1\xd1\xb5\x25\x01\xf8\xa3\x2b\x4e\x0b\x80\x7b\x38\xea\x9c\x04\
-\xe0\x77\xb6\x77\x8f\x0d\x80\x7b\x69\x9b\xbf\x36\x01\x58\x7e\x4c\
-\x00\xec\xc4\x01\x5f\x4d\x80\x9a\xbb\xb3\xb3\x3d\x00\x76\x6e\xee\
-\xf5\x09\x50\x67\x4b\x0f\x0e\x80\x5d\xda\x6b\x51\x5f\x02\xd4\xd5\
-\x4d\xcf\x0e\x80\xdd\x7a\xe4\xaf\x13\xa0\x96\xfa\x7b\xa6\x04\xc0\
-\x1e\x8c\x7f\xff\xf6\x04\xa8\x9f\x4b\x4f\x0d\x80\x01\xb8\xff\x39\
-\x09\x50\x33\xdb\xbb\xc7\x06\xc0\x80\xb4\xcd\xbf\x2d\x01\xea\xe4\
-\xfc\x63\x02\x60\xc0\xa6\xf7\xf4\x27\x40\x5d\xdc\xd9\xd9\x1e\x00\
-\x83\xf1\xf8\x2b\x13\xa0\x1e\xbe\x74\x40\x00\x0c\xd2\xb8\x85\x5b\
-\x13\xa0\xfa\xae\x3a\x3d\x00\x86\xe0\x7e\xdf\x4f\x80\x8a\xdb\xb2\
-\x70\x5c\x00\x0c\x49\xdb\x4b\x6f\x4f\x80\x2a\xfb\xd6\x91\x01\x30\
-\x64\xd3\x16\xf5\x25\x40\x55\xdd\x38\x3f\x00\x86\x65\xd6\x45\x09\
-\x50\x49\x3b\x16\x4d\x0e\x80\x61\x6a\x5f\x70\x57\x02\x54\xcf\xf9\
-\x0f\x0c\x80\x06\x98\xb1\xb8\x3f\x01\xaa\x65\x6d\x67\x7b\x00\x34\
-\xc6\xa3\x57\x25\x40\x85\xf4\x2f\xde\x27\x00\x1a\x66\x74\xe7\x86\
-\x04\xa8\x8a\x4b\x4e\x0d\x80\x86\x3a\x68\x71\x02\x54\xc2\xc6\xae\
-\x51\x01\xd0\x68\x4f\xbd\x2a\x01\xca\xef\x7f\x0e\x08\x80\x11\x30\
-\xf6\x1d\x1b\x13\xa0\xdc\x7e\xf5\xd8\x00\x18\x21\x07\x2d\xee\x4f\
-\x80\xf2\x5a\xd7\x35\x26\x00\x46\xce\xa3\x57\x26\x40\x49\xf5\x2d\
-\xde\x2f\x00\x46\x54\x47\xe7\x9d\x09\x50\x46\x3f\x3d\x39\x00\x46\
-\xdc\xde\x8b\xfa\x12\xa0\x6c\x6e\x9c\xdf\x16\x00\xcd\x30\xeb\xc2\
-\x04\x28\x95\x6d\x8b\x26\x07\x40\x93\xb4\xbf\xe2\x96\x04\x28\x8f\
-\xff\x9b\x19\x00\x4d\x34\x69\xe1\xd6\x04\x28\x87\xdf\x3c\x39\x00\
-\x9a\xec\xa8\x25\x09\x50\x02\xeb\xba\xc6\x04\x40\xf3\x3d\x76\x65\
-\x02\x14\x5c\xff\xe2\xfd\x03\xa0\x25\x3a\x16\xdc\x9a\x00\x45\x76\
-\xd1\x29\x01\xd0\x32\xd3\x3f\xb6\x23\x01\x8a\xea\xfa\x17\xb5\x05\
-\x40\x2b\x3d\xe0\x9b\x09\x50\x48\x1b\xbb\x27\x05\x40\xab\x3d\xed\
-\x37\x09\x50\x38\xbd\x9f\x3a\x20\x00\x0a\x60\xf4\x82\x5b\x12\xa0\
-\x58\xbe\xff\xe0\x00\x28\x88\x69\xdd\x5b\x12\xa0\x38\x2e\x9f\x17\
-\x00\x05\x72\xe8\xe2\xfe\x04\x28\x86\xdb\x3b\x3b\x02\xa0\x58\x4e\
-\x5a\x9e\x00\x05\xb0\x6d\xd1\xd4\x00\x28\x9c\xb6\x79\xab\x13\xa0\
-\xc5\xfa\x97\x1c\x11\x00\x85\x34\xa6\xf3\xce\x04\x68\xa5\x9f\x3e\
-\x22\x00\x0a\x6b\xbf\xff\xd8\x9e\x00\xad\x72\xd5\x73\xda\x02\xa0\
-\xc8\xee\xbf\xa4\x3f\x01\x5a\x61\x5d\xd7\xb8\x00\x28\xba\x53\xcf\
-\x4f\x80\xa6\xdb\xfa\xd1\xbd\x03\xa0\x0c\xe6\xfc\x32\x01\x9a\xaa\
-\x6f\xc9\x91\x01\x50\x12\xed\xf3\x7e\x9b\x00\xcd\xb3\xec\x21\x01\
-\x50\x22\x13\xba\xee\x4c\x80\xe6\xf8\xc9\x69\x01\x50\x32\x7b\x77\
-\x6f\x4d\x80\x91\xf7\xeb\x79\x6d\x01\x50\x3e\x47\xfe\x4f\x5f\x02\
-\x8c\xac\xeb\xfe\x6e\x54\x00\x94\xd3\x71\x4b\x12\x60\x04\xad\xed\
-\x1a\x1f\x00\xe5\x75\xca\xb9\x09\x30\x42\x36\x75\xef\x15\x00\xe5\
-\x36\xe7\x67\x09\x30\x02\x76\xf4\x1c\x18\x00\xa5\xd7\x36\xef\x8a\
-\x04\x68\xb0\xfe\x25\xf7\x0f\x80\x4a\x18\xbd\xe0\xc6\x04\x68\xa4\
-\x65\x27\x06\x40\x65\x8c\x59\x70\x4b\x02\x34\xca\x85\x73\x03\xa0\
-\x52\xa6\xbe\xfb\xae\x04\x68\x84\x8b\x4e\x0f\x80\xca\x99\xbe\xf0\
-\xae\x04\x18\xae\x5f\xcd\x6b\x0b\x80\x2a\xda\xa7\x7b\x73\x02\x0c\
-\xc7\x65\xf3\xdb\x03\xa0\xaa\xf6\xeb\xde\x92\x00\x43\x75\xf5\x82\
-\x51\x01\x50\x65\x87\xf6\xec\x48\x80\xa1\xf8\xed\x82\x8e\x00\xa8\
-\xba\xc3\x7b\x7a\x13\x60\xb0\xae\xeb\x1c\x1b\x00\x75\x70\xec\x92\
-\xbe\x04\x18\x8c\x9b\x5e\x3f\x36\x00\xea\xe2\xb8\xc5\xbd\x09\x30\
-\x50\xb7\x75\x4d\x08\x80\x3a\x39\x76\x71\x6f\x02\x0c\xc4\xda\x85\
-\x53\x02\xa0\x6e\x8e\xfd\x62\x5f\x02\xec\xc9\xed\xff\x34\x25\x00\
-\xea\xe8\x98\xc5\xbd\x09\xb0\x3b\xb7\x2e\x9c\x1a\x00\x75\x35\xb3\
-\xa7\x37\x01\x76\xe5\x96\xae\x09\x01\x50\x67\x33\x7b\x76\x24\xc0\
-\xce\x5c\xdb\x39\x3e\x00\xea\xee\xfe\x67\x6e\x4f\x80\x7b\xbb\xf2\
-\xa5\xa3\x03\x80\x88\xc3\x16\x6d\x4e\x80\xbb\xbb\x6a\x41\x47\x00\
-\xf0\x47\xfb\x2d\xbc\x2b\x01\xfe\xec\x57\xf3\x47\x05\x00\x7f\xb5\
-\xcf\xc2\x75\x09\xf0\x7b\x97\xcc\x6b\x0b\x00\xee\x69\x72\xe7\xcd\
-\x09\x70\xc1\xdc\xb6\x00\xe0\xbe\x26\x76\xde\x90\x40\xbd\x2d\x9f\
-\x1b\x00\xec\xc2\xf8\xd7\x5e\x93\x40\x6d\xf5\x7f\xfd\x11\x01\xc0\
-\x6e\xb4\xcf\xbd\x38\x81\x5a\xda\xbe\xf8\xb8\x00\x60\x4f\x66\x2f\
-\x4d\xa0\x76\x36\x2c\x3a\x24\x00\x18\x88\x59\x8b\xfb\x12\xa8\x93\
-\x5b\x17\x4e\x0f\x00\x06\xea\xa8\x9e\xed\x09\xd4\xc5\x35\x9d\x13\
-\x02\x80\xc1\x38\x6c\xd1\xc6\x04\xea\xe0\x92\xf9\x1d\x01\xc0\x60\
-\xed\xb3\xf0\xb6\x04\xaa\xee\xfb\x4f\x08\x00\x86\x64\xec\xfc\xcb\
-\x12\xa8\xb0\xbe\xa5\xa7\x04\x00\x43\xd6\x3e\x77\x59\x02\x15\xb5\
-\x6d\xf1\xd1\x01\xc0\xf0\x3c\xfc\x6b\x7d\x09\x54\xcf\xda\xf7\xcf\
-\x08\x00\x86\x6f\xe6\xa2\x4d\x09\x54\xcb\x55\x9d\x13\x03\x80\xc6\
-\x98\xda\x79\x63\x02\xd5\xb1\x7c\xde\xa8\x00\xa0\x71\xc6\x2d\x58\
-\x95\x40\x25\x6c\x3d\xf3\xc1\x01\x40\xa3\xcd\x5e\xda\x9f\x40\xd9\
-\xdd\xda\x7d\x70\x00\x30\x12\xee\xb7\x68\x63\x02\x65\x76\x45\xe7\
-\x84\x00\x60\xa4\x4c\xed\xbc\x2e\x81\xb2\x5a\x3e\xb7\x2d\x00\x18\
-\x49\xa3\xe7\x5d\x90\x40\x09\x6d\x5d\x7c\x7c\x00\x30\xf2\x66\x2d\
-\xde\x91\x40\xb9\xac\x59\xb8\x4f\x00\xd0\x1c\x87\x7d\xe0\xf6\x04\
-\xca\xe3\x67\xf3\xc7\x04\x00\xcd\x33\x76\xfe\x2f\x12\x28\x85\x6d\
-\x4b\xe6\x04\x00\xcd\x36\x6b\xf1\xf6\x04\x8a\xee\xa6\xee\x83\x03\
-\x80\x56\x98\xd1\x75\x43\x02\x45\xb6\x62\xfe\xe8\x00\xa0\x55\xc6\
-\xcc\x5b\x9e\x40\x41\xad\xef\x79\x60\x00\xd0\x5a\x27\x7f\x7e\x6b\
-\x02\xc5\x73\xd9\x6b\xa7\x04\x00\xad\xb7\x57\xe7\xea\x04\x0a\xa5\
-\x6f\xd9\xdc\xb6\x00\xa0\x18\xda\xe7\x2c\xd9\x91\x40\x51\xdc\xd2\
-\x7d\x58\x00\x50\x24\x07\x76\x5d\x9f\x40\x11\xac\x58\x30\x3e\x00\
-\x28\x9a\x31\x7f\x73\x6e\x02\x2d\xb6\xe1\xd3\x0f\x0d\x00\x8a\xe9\
-\xfe\xdd\x6b\x13\x68\x9d\x55\x5d\xd3\x03\x80\xe2\x9a\xf8\xb2\x9f\
-\x26\xd0\x12\x77\x7d\x72\x56\x00\x50\x74\xc7\x74\xdf\x9e\x40\xb3\
-\xad\x58\x30\x29\x00\x28\x83\xb1\xf3\x96\xf5\x27\xd0\x3c\x77\xf5\
-\x9c\x10\x00\x94\xc7\x03\xba\x6f\x4d\xa0\x39\x56\x2c\x98\x18\x00\
-\x94\xcb\xd8\x79\xcb\xfa\x13\x18\x69\x77\xf6\x3c\x38\x00\x28\xa3\
-\xfb\xff\xeb\x9a\x04\x46\xd2\x79\x2f\x1a\x17\x00\x94\xd5\xe8\xa7\
-\x7f\x7d\x47\x02\x23\xe3\xb6\x33\x8e\x0e\x00\xca\x6d\xfa\x82\x4b\
-\x12\x68\xb8\xde\x65\xf3\xc6\x04\x00\x15\x30\x6b\xd1\xda\x04\x1a\
-\x69\x55\xd7\xfe\x01\x40\x55\x8c\x9b\xb7\xac\x3f\x81\xc6\xb8\xa3\
-\x67\x76\x00\x50\x2d\x47\xfe\xf3\x75\x09\x0c\xdb\x8e\xb3\x9f\x35\
-\x26\x00\xa8\x9e\xf6\xd9\x3d\xeb\x13\x18\x8e\x55\x5d\xfb\x07\x00\
-\x55\x35\x7e\xde\xd2\x1d\x09\x0c\xcd\xba\x9e\xd9\x01\x40\xb5\x1d\
-\xd4\x79\x49\x02\x83\xd6\xbb\x6c\xfe\xf8\x00\xa0\x06\x4e\xfe\xf8\
-\xda\x04\x06\x63\xe5\x9b\xf7\x0f\x00\xea\x62\xcc\x33\xcf\xda\x96\
-\xc0\xc0\x5c\xdb\xfd\xa0\x00\xa0\x5e\xf6\x9a\xbf\xac\x3f\x81\x3d\
-\xb9\x63\xf1\x9c\xb6\x00\xa0\x86\x0e\xee\x5c\x91\xc0\x6e\x6c\x59\
-\x3a\x6f\x4c\x00\x50\x5b\xc7\x2d\xbc\x2a\x81\x9d\xea\x5d\xbe\x60\
-\x72\x00\x50\x73\xb3\x16\xdd\x9a\xc0\xbd\xad\xea\x9a\x11\x00\x10\
-\x31\xe6\x69\x5f\xda\x94\xc0\x5f\x5d\xf6\x4f\x33\x03\x00\xfe\x6c\
-\xfc\xdc\xc5\x1b\x13\xf8\xbd\x1b\x16\xcd\x0e\x00\xb8\xa7\xa9\xf3\
-\xbf\xb9\x3d\xa1\xee\x6e\xfd\xe4\x69\xed\x01\x00\x3b\x31\x6d\xfe\
-\xd2\xed\x09\xf5\x75\xfb\xe2\xb9\xa3\x03\x00\x76\x69\xef\xf9\x4b\
-\x7b\x13\xea\xe8\xf6\xc5\x73\x47\x07\x00\xec\xc1\x41\x6f\x3c\xbf\
-\x2f\xa1\x5e\xd6\xfc\xc7\x63\x46\x05\x00\x0c\xc8\x3e\xf3\x97\x6e\
-\x4f\xa8\x8b\xdb\x17\xcf\xed\x08\x00\x18\x84\xbd\xe7\x2f\xdd\x96\
-\x50\x7d\xb7\x2f\x9e\xdb\x11\x00\x30\x68\xd3\xe6\x2f\xdd\x9a\x50\
-\x65\xb7\x2d\x9e\xdb\x11\x00\x30\x44\x7b\xbd\xf8\xeb\x5b\x12\xaa\
-\xe9\xba\x8f\x3d\xba\x3d\x00\x60\x58\xc6\xcf\x5d\xbc\x2e\xa1\x6a\
-\x56\x2f\x9a\xdd\x16\x00\xd0\x00\xa3\x66\x2f\xba\x21\xa1\x32\xfa\
-\x96\x77\x1d\x1d\x00\xd0\x40\xc7\x2d\x5c\x95\x50\x01\x9b\x97\x2e\
-\x98\x11\x00\xd0\x70\x33\x3b\x97\xf7\x27\x94\xd9\xed\x8b\xe7\x4d\
-\x0e\x00\x18\x21\x07\xbf\xfa\x5b\x5b\x12\xca\xe9\xaa\x0f\x3d\x72\
-\x54\x00\xc0\x88\x1a\x3f\x67\xd1\x0d\x09\x65\xb3\x6a\xe1\xac\x00\
-\x80\x66\x68\x3f\xe9\xbd\x97\x24\x94\xc6\xa6\x6f\xbc\xfa\xe0\x00\
-\x80\x26\xda\x7f\xfe\xd2\xad\x09\xc5\x77\x75\xcf\xbc\x49\x01\x00\
-\x4d\x37\xe9\x59\x9f\xbe\x31\xa1\xc0\xb6\x2d\x7b\xf3\x03\x02\x00\
-\x5a\x66\x66\xe7\xb2\x6d\x09\x45\x74\xcb\xe2\x79\x53\x03\x00\x5a\
-\x6c\xe2\xdc\x9e\x1b\x12\x0a\xa5\x77\xc5\xc2\x59\x6d\x01\x00\xc5\
-\x70\x5c\xd7\xb2\xed\x09\xc5\x70\xfb\x92\x05\x33\x02\x00\x0a\x65\
-\xef\xe7\x7f\xf6\xa6\x84\x16\xeb\xbb\xf8\x3d\x27\xb7\x07\x00\x14\
-\xd1\xcc\x05\x4b\xd6\x27\xb4\xca\x4d\x4b\x16\x1c\x10\x00\x50\x60\
-\xe3\xe6\x74\xaf\xe8\x4f\x68\xb6\x0d\xcb\xba\x66\x05\x00\x94\xc0\
-\x7e\xf3\x7a\x6e\x48\x68\x9a\xde\x15\xdd\x73\x46\x07\x00\x94\x46\
-\xdb\x43\xde\xfa\x9d\x8d\x09\x23\x6f\xd5\x47\x9f\x32\x29\x00\xa0\
-\x74\x3a\x66\x75\x2d\xdb\x9a\x30\x72\x6e\x5d\xb2\xe0\xd0\x00\x80\
-\xd2\x9a\xf4\xa4\x0f\xfd\xbc\x2f\xa1\xf1\x36\x7c\xeb\xcd\x0f\x6a\
-\x0b\x00\x28\xbb\x7d\xe6\x76\xaf\x48\x68\xa0\x8d\xcb\x16\xce\x19\
-\x13\x00\x50\x15\x07\xbf\xe8\x53\x57\x24\x34\xc0\xfa\x6f\xbe\xed\
-\xe4\x8e\x00\x80\xaa\x99\x31\x6f\xd1\x8a\xfe\x84\xa1\xdb\xb8\x6c\
-\xe1\x9c\x31\x01\x00\x55\xb5\xff\xdc\xee\x15\xfd\x09\x83\xb7\x61\
-\x59\xd7\xec\x31\x01\x00\x55\xb7\xff\xbc\x8f\xfd\xb2\x2f\x61\xe0\
-\xd6\x9d\xfd\xf7\xb3\x46\x05\x00\xd4\xc5\xd4\x27\xbf\xf7\xbc\xcd\
-\x09\x7b\x76\xfd\x97\x3a\x1f\x3a\x2a\x00\xa0\x6e\x3a\x66\x75\x2e\
-\xb9\x2d\x61\x97\x7a\x57\xf5\xcc\x3f\x2e\x00\xa0\xb6\xda\x8e\x5d\
-\xb0\xf8\xea\x84\xfb\x58\xf7\xad\x77\x3e\x76\x52\x00\x00\x33\xe6\
-\x2e\x5c\xb6\x29\xe1\xcf\x6e\x5a\xd2\x39\xab\x3d\x00\x80\x3f\xeb\
-\x38\x6e\xc1\xe2\x55\xfd\x49\xdd\xed\x58\xb1\x68\xde\x7e\x01\x00\
-\xdc\xd7\xfe\x4f\xef\x3e\x6f\x63\x52\x57\xab\xbf\xf8\xe6\x87\x8f\
-\x0d\x00\x60\xd7\x3a\x4e\x78\xe5\xa7\x57\xf6\x26\xf5\x72\xf3\xd9\
-\xef\x3c\x7d\xef\x00\x00\x06\x62\xe2\xec\xce\xc5\xab\xfa\x93\x3a\
-\x58\xbf\x7c\xd1\xfc\xe3\x02\x00\x18\x9c\xa9\xb3\x3b\x97\xdc\x9c\
-\x54\xd8\xf6\x55\x8b\x17\x1c\xd7\x1e\x00\xc0\x10\x1d\xf6\xcc\x7f\
-\xfe\xe6\xcd\x49\xe5\xf4\xae\xfc\xcc\xab\x1e\x3a\x3a\x00\x80\x61\
-\x3b\xf0\xa9\xff\xef\xac\xeb\x92\x8a\xd8\x7c\xd1\x7f\xbe\xe6\xe1\
-\x13\x03\x00\x68\xa0\xbd\x66\x77\x2e\x5e\xd5\x97\x94\xd9\xba\xe5\
-\x8b\xe6\xcf\x1a\x1b\x00\xc0\x88\x98\x32\x6b\xfe\xa2\xe5\x1b\x93\
-\xf2\xb9\x69\xe9\xc2\xb9\x33\x03\x00\x18\x71\x07\xce\x5d\xb8\x64\
-\x55\x7f\x52\x0e\xdb\x57\x2d\xee\x9c\xb3\x77\x00\x00\x4d\x34\xed\
-\xb4\xce\xcf\x5c\xb4\x21\x29\xb0\xbe\xd5\x67\x77\xbf\xf0\xb8\x8e\
-\x00\x00\x5a\xe3\xc0\x39\x9d\x3d\xcb\x37\x25\x45\x73\xd3\xb2\x45\
-\x0b\x66\x4f\x0a\x00\xa0\xe5\x46\xcd\x9c\xdb\xb5\x78\xc5\x96\xa4\
-\x08\x6e\x5a\xb6\x68\xc1\xec\xc9\x01\x00\x14\xca\x98\xe3\x9f\xf3\
-\x8e\xff\xfe\xd9\xc6\xa4\x55\xae\xff\xee\x19\x2f\x3b\x79\x4a\x00\
-\x00\x85\xd5\x76\xd8\x13\x3a\x3f\x71\xee\x9a\xa4\x89\x36\xff\xf2\
-\xab\xef\xff\xbb\x53\xf7\x0a\x00\xa0\x1c\xa6\x9d\xf2\xd2\xee\xaf\
-\xfd\x72\x73\x32\xa2\x76\x5c\xf1\xcd\x0f\xbf\xfa\x71\x87\xb6\x05\
-\x00\x50\x42\xd3\x66\xcd\xef\x5e\xb2\x62\x63\xd2\x68\x77\x2c\xef\
-\xe9\x9a\x37\x6b\x7c\x00\x00\x65\xd7\x7e\xd8\x9c\x57\x9f\x71\xd6\
-\xca\x8d\xc9\xb0\xf5\x5d\xf7\xa3\x33\xff\xf1\x39\x0f\x9e\x10\x00\
-\x40\xc5\x4c\x9b\x35\xaf\xab\x67\xd9\xea\xde\x64\xf0\xee\x58\xb1\
-\xa4\xbb\x73\xde\xac\x09\x01\x00\x54\xda\x98\xfb\x3f\xf1\xd5\x1f\
-\xfc\xf2\x85\x37\xf5\x27\x7b\xb6\xee\xe7\xff\x7b\xc6\xeb\x9e\x7a\
-\xdc\x84\x00\x00\x6a\x65\xec\x51\x8f\xfb\xbb\x85\x67\x9e\x73\xe5\
-\xd6\xe4\xbe\x6e\xfe\xd9\xd9\x1f\x7b\xf3\xb3\x4e\x98\x16\x00\x40\
-\xad\xb5\x1d\x70\xca\xbc\x37\x9e\xf1\xc5\xf3\xaf\xde\x9a\xb5\xb7\
-\xfd\xba\x0b\x96\x7c\xe4\xcd\xcf\x9b\x7d\xf8\x98\x00\x00\xb8\x87\
-\xfd\x1f\xf2\xd4\x57\xbd\xfb\xcc\xef\x5e\xba\x2e\x6b\x66\xf3\x15\
-\x3f\x5c\xfc\x2f\xaf\x7f\xfa\xc3\x0e\x68\x0f\x00\x80\x3d\x18\x77\
-\xd8\xa9\x4f\x7f\xf5\xc2\x4f\x7c\xfd\xc2\x6b\xb7\x64\x65\x6d\xbd\
-\xfe\xe2\x6f\x9c\xf9\x2f\x6f\x7c\xe1\xe3\x8e\xdf\x3b\x00\x00\x86\
-\x62\xda\x31\xa7\x3d\xff\xf5\xef\xfe\xf7\xaf\x9e\xb7\xea\x96\xbe\
-\x2c\xbf\x0d\x57\x5e\x70\xd6\x27\xde\xfd\xba\xe7\x3c\xf2\xe8\xbd\
-\x02\x00\xa0\x71\xda\xf6\x3d\xe6\x91\xcf\x7c\xd5\x3b\x3f\xfa\xb9\
-\xa5\x17\x5c\xb6\x66\x5b\x96\xc4\xb6\x35\x97\x5d\xb0\x74\xf1\x47\
-\xdf\xf5\xfa\x17\x3d\xf9\x94\xc3\x27\x04\x00\x40\x13\x4c\x3a\xe4\
-\xc1\x8f\x79\xd6\xcb\xdf\xfa\x2f\x3d\x5f\xfc\xe6\xf9\xbf\xbc\xe6\
-\x8e\xfe\x2c\x8a\xcd\xb7\xad\xfe\xd9\xb2\x2f\x7f\xf2\xfd\x6f\x7d\
-\xd9\xb3\x4e\x7b\xf0\x21\x93\x02\x00\xa0\xe5\x26\x1f\x74\xcc\xc9\
-\x8f\x9f\xf7\xf2\x37\xbf\xa3\xfb\xe3\x9f\x5e\xf2\xcd\x73\x56\x5c\
-\x76\xf5\x1d\x5b\x72\xa4\xdd\x79\xe3\x15\x2b\x7e\xb0\xf4\x4b\x3d\
-\x1f\x7a\x77\xd7\x82\x17\x3e\x63\xce\x89\xc7\x1c\x3a\xad\x3d\x00\
-\x00\x4a\x61\xda\x8c\x99\x47\xcf\x3a\x79\xce\x13\xe6\xcd\x5b\xb0\
-\xe0\xad\x5d\xef\xed\xfe\x78\x4f\xcf\x99\x4b\x96\x2c\xf9\xce\xb2\
-\x65\xe7\xae\x58\xb1\xe2\xf2\xd5\x7f\x70\xd3\x1d\xf7\x74\xcb\xea\
-\x3f\xf8\xd5\x8a\x3f\x38\x67\xd9\xef\x7c\x65\xc9\x7f\xf5\x2c\xea\
-\x7e\x5f\x57\xd7\x2b\x17\xbc\x70\xde\xd3\xe6\x3c\x66\xd6\xac\xa3\
-\x66\xee\x3f\x6d\x62\x00\x34\xd0\xff\x07\x9d\x50\xe4\xec\xb3\x76\
-\xbf\x50\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x03\x10\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -2535,6 +60,160 @@ qt_resource_data = b"\
 \x78\x78\xa0\xb4\xb4\x54\x96\x65\xc9\x2e\x29\x29\x29\x5c\xc6\x5f\
 \x46\x28\x14\x62\x68\x68\x88\x40\x20\xc0\x3f\x88\x2f\xf3\xdc\xcb\
 \x1e\x5d\xae\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x09\x7b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x5d\x00\x00\x00\x60\x08\x06\x00\x00\x00\x7f\x95\x7e\xb0\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x02\x55\x30\x00\x02\x55\x30\
+\x01\xc2\xef\xc2\x47\x00\x00\x00\x0f\x74\x45\x58\x74\x41\x75\x74\
+\x68\x6f\x72\x00\x6d\x6c\x61\x6d\x70\x72\x65\x74\x1c\x9c\xb4\x2a\
+\x00\x00\x00\x59\x7a\x54\x58\x74\x43\x6f\x70\x79\x72\x69\x67\x68\
+\x74\x00\x00\x08\x99\x73\x76\x36\x50\x08\x28\x4d\xca\xc9\x4c\x56\
+\x70\xc9\xcf\x4d\xcc\xcc\x53\x70\x49\x4d\xc9\x4c\x4e\x2c\xc9\xcc\
+\xcf\x53\xc8\x28\x29\x29\xb0\xd2\xd7\x4f\x2e\x4a\x05\xf2\xcb\x52\
+\x93\xf3\x73\x73\xf3\xf3\x8a\xf5\xf2\x8b\xd2\xf5\x0b\xc0\x7a\x52\
+\xc0\x5a\xf4\xab\x52\x8b\xf2\xf5\x0d\xf5\x0c\xf4\x01\x48\x3a\x1c\
+\x01\x72\x55\xec\x33\x00\x00\x00\x21\x74\x45\x58\x74\x43\x72\x65\
+\x61\x74\x69\x6f\x6e\x20\x54\x69\x6d\x65\x00\x32\x30\x31\x32\x2d\
+\x30\x37\x2d\x30\x36\x54\x31\x34\x3a\x33\x30\x3a\x31\x35\xdd\xd0\
+\xbf\x11\x00\x00\x00\x28\x74\x45\x58\x74\x44\x65\x73\x63\x72\x69\
+\x70\x74\x69\x6f\x6e\x00\x73\x69\x6d\x70\x6c\x65\x20\x72\x65\x6c\
+\x6f\x61\x64\x20\x2f\x20\x72\x65\x63\x79\x63\x6c\x65\x20\x69\x63\
+\x6f\x6e\x15\xec\xa4\x00\x00\x00\x00\x19\x74\x45\x58\x74\x53\x6f\
+\x66\x74\x77\x61\x72\x65\x00\x77\x77\x77\x2e\x69\x6e\x6b\x73\x63\
+\x61\x70\x65\x2e\x6f\x72\x67\x9b\xee\x3c\x1a\x00\x00\x00\x4e\x7a\
+\x54\x58\x74\x53\x6f\x75\x72\x63\x65\x00\x00\x08\x99\x25\xc9\xc1\
+\x0a\x80\x30\x08\x00\xd0\x2f\x32\x1b\x04\x83\xfd\x8d\x6d\x52\x82\
+\x9b\x62\x5e\xfa\xfb\x0e\xbd\xeb\xbb\x33\xfd\x69\x88\xe6\xbc\xba\
+\x8a\x53\xe4\x66\x71\xe1\xe0\x24\x51\x2c\xb5\xec\xf5\xc0\x60\x35\
+\x1a\x20\xdd\x16\x9c\x2f\x4c\xa5\xe9\xc1\x09\x7f\x7f\x4a\xf2\x17\
+\x5c\x25\xfd\x2e\x63\x00\x00\x00\x11\x74\x45\x58\x74\x54\x69\x74\
+\x6c\x65\x00\x52\x65\x6c\x6f\x61\x64\x20\x69\x63\x6f\x6e\x8b\xad\
+\x6a\x24\x00\x00\x07\xb0\x49\x44\x41\x54\x78\x9c\xed\xdd\x6b\x8c\
+\xdc\x55\x19\xc7\xf1\xcf\x4c\xb7\x17\x29\x4d\x29\x08\xb4\x14\xaa\
+\x05\x94\xb6\x02\x15\x6d\x44\x6c\xd4\x6a\x8b\x28\x2d\xbe\x21\x44\
+\xc3\x0b\x6d\xf0\xfa\x46\xa2\x31\x62\x62\xbc\x25\xc4\x17\x9a\x92\
+\x78\x49\x08\x9a\x68\xd0\xc4\xc4\xbb\x29\x10\x13\x11\x21\x5a\x44\
+\x51\x51\xac\xa0\xa9\x42\x45\xad\xa5\x2a\x5a\x2a\xda\x96\xb6\x3b\
+\xe3\x8b\x67\x36\xdd\xb6\x3b\x3b\x33\xff\xff\xf9\x5f\xa6\xb3\xdf\
+\xe4\xc9\x26\xbb\x9b\x73\xf9\xfd\x67\xce\xff\x9c\xe7\x9c\xe7\x39\
+\xcc\x50\x26\x73\x70\x5b\xa3\xea\x56\xf4\x60\x2e\x2e\xc4\xf9\x38\
+\x0f\x67\x63\x11\x4e\x15\x1d\x68\xe0\x30\xf6\x63\x1f\xfe\x81\xdd\
+\xf8\x13\xfe\x80\xa7\xcb\x6f\x72\x57\x96\xe0\xdb\xb8\xbc\x6e\xa2\
+\xaf\xc0\x3a\x5c\x81\x35\x78\x21\xc6\x32\x96\xd5\x16\x0f\xe0\x57\
+\xf8\x19\x7e\x8c\x07\xc5\x43\x2a\x9b\x2b\xf0\x2d\x9c\x83\x56\x05\
+\xf5\x1f\xc3\x2c\x6c\xc0\xad\xf8\x8b\x10\xaa\x48\xfb\x0f\xbe\x83\
+\xb7\x60\x61\x09\xfd\x83\x77\xe0\xe0\xa4\x36\x8c\x97\x54\xef\x09\
+\x5c\x84\x2d\x78\x52\xf1\x42\x77\xb3\x03\xf8\x3a\x5e\x27\x86\xa9\
+\xd4\xcc\xc1\x6d\xe2\x93\x3d\xb9\xde\xd2\x45\xbf\x12\xdf\x9f\xa2\
+\x21\x55\xdb\x0e\xbc\x1b\xf3\x12\xf5\x73\x31\xee\xef\x52\x57\x69\
+\xa2\x5f\x25\xc6\xd3\xaa\xc5\xed\x65\xbb\x71\xa3\x78\x81\x67\xe5\
+\xe5\xd8\x35\x4d\x1d\x85\x8b\x7e\x09\x7e\x30\x4d\x03\xea\x6a\x3b\
+\x71\x5d\x86\xfe\xbe\xdd\xb1\xe3\x77\xa9\xa2\xcf\xc7\x2d\x62\xa6\
+\x50\xb5\x80\x79\xec\x1e\x31\x65\xed\xc5\x6c\x31\x19\xe8\x67\xd8\
+\x2c\x44\xf4\x57\xe2\xf1\x3e\x2a\x1f\x16\xfb\x1f\xde\xab\xfb\xcb\
+\x76\x31\xb6\x0d\x50\x5e\x52\xd1\x67\xe1\x66\x1c\x49\xd0\xd1\x3a\
+\xda\xdd\x62\x71\x36\x99\x97\x99\x7e\xfc\x2e\x54\xf4\x33\x71\x6f\
+\x45\x62\x94\x69\x7f\xc3\xda\x4e\x9f\x6f\x10\xd3\xce\x41\xcb\x48\
+\x22\xfa\xc5\x62\xd9\x5d\xb5\x20\x65\xd9\x41\xdc\x21\xfb\xb4\x37\
+\xb7\xe8\xeb\x84\x7f\xa3\x6a\x21\x86\xc9\x72\x89\xbe\x49\xb6\xaf\
+\xd7\xa8\x5b\x66\xd1\xaf\xc1\xb3\x35\xe8\xc0\x30\xda\x78\x16\x9f\
+\xc3\x7a\xdc\x25\xdd\x92\x79\xd4\x68\x0d\x2a\xfa\x8b\x85\x8b\x74\
+\x41\x01\x8d\x19\x15\x06\x12\x7d\x09\x7e\x8e\x73\x0b\x6a\x4c\x37\
+\xda\xf8\x2b\xb6\xe3\x31\x31\x6d\xfb\x97\xd8\xb8\x68\x0b\x3f\xc9\
+\x69\x9d\xf6\x2d\xc7\x8b\xb0\x52\x76\x3f\x7c\xd1\xf4\xed\x4f\x9f\
+\x83\x07\x94\x37\xee\xed\xc5\x57\xf0\x66\xb1\xe2\x1b\x94\xf9\xc2\
+\xa3\x79\x8b\xfa\xad\x8e\xfb\x7e\x91\x7e\xba\x84\xc6\xb4\xc4\x02\
+\xeb\x3a\xf9\xbc\x7c\x53\xb1\x56\x3c\xc4\x5e\xce\xa8\xda\x88\xbe\
+\x51\xb1\xfe\xef\x96\x78\x31\xaf\xe9\xa7\x31\x39\x59\x8a\xcf\xaa\
+\x56\xfc\x9e\xa2\x9f\x2e\x7c\xcc\x45\x35\xe0\x51\xbc\xb6\x7f\xcd\
+\x92\x71\x01\xee\xcc\xd0\xde\x52\x44\xbf\xbd\xa0\x8a\x8f\xe0\x13\
+\xe2\x5d\x51\x25\x9f\x57\x33\xd1\x5f\xad\x98\x61\x65\x0f\x5e\x93\
+\x45\xa1\x84\x34\xf0\x11\x21\x40\x6d\x44\x6f\xe2\xe1\x02\x2a\xfc\
+\x2d\x96\x65\xd3\x29\x19\x0b\xc4\x89\x80\xb2\xc5\xee\x29\xfa\xe6\
+\x02\x2a\x7b\x40\xcc\xa7\xab\xe4\x05\x78\x44\x75\x82\x77\x15\x7d\
+\xb6\xf4\xae\xda\x07\x55\xbf\x8a\xbd\x1a\xff\x56\xad\xe0\x5d\x45\
+\x7f\x5b\xe2\x4a\x76\xe0\x8c\xcc\x52\xa5\xe1\x43\xea\xb3\xa3\x75\
+\x82\xe8\x0d\xfc\x3e\x61\x05\x4f\x8b\xa3\x71\x55\x31\x1f\xdf\x9c\
+\xa2\x5d\xb5\x12\xfd\x0d\x09\x0b\x6f\xe1\xda\x1c\x82\xe5\xe5\x02\
+\xe1\xaf\xa9\x5a\xe4\x9e\xa2\x6f\x4d\x58\xf8\x97\x72\x08\x96\x97\
+\xab\x84\x53\xac\x6a\x81\x7b\x8a\x7e\x36\x0e\x25\x2a\xf8\x49\xd5\
+\xcd\x54\x6e\x52\x9f\xf1\xbb\xa7\xe8\x37\x26\x2c\x78\x73\x1e\xd5\
+\x32\x72\x0a\xbe\x96\xa1\xad\x95\x8a\x3e\xc8\x81\x99\xe9\x6c\xbb\
+\x58\x5c\x95\xc9\x72\xc5\x2c\xe6\x0a\x15\xfd\x4c\xe9\xbe\x92\x59\
+\xce\x00\xe6\xe1\x55\x78\x2a\x51\xdb\x4b\x11\x7d\x62\xe7\xe8\x7a\
+\x7c\x35\x81\x00\x3b\xc5\xaa\xaf\xcc\x68\x83\x86\x98\xa9\xac\x16\
+\xdb\x89\x13\xb6\x54\x31\xe7\xce\xf3\xd2\x9a\xd8\xd2\x4a\xe5\x5e\
+\xfd\x82\xf2\xc3\x3b\xda\x62\x1b\xef\x31\x11\xd3\x33\xc1\x19\x42\
+\xfc\xc9\x0f\x63\x85\x58\x71\x57\xca\xc4\x27\x61\x87\xfc\x8b\x98\
+\x71\xe1\xcc\xda\x9d\xb3\x9c\x22\x99\x2b\xf6\x50\x27\x1e\xc2\xea\
+\x8e\x95\x15\x0a\x43\x67\x63\x7a\x91\x18\x13\xf3\xbe\xfc\xb6\x89\
+\xf1\x75\xd8\x68\x88\x17\xf1\xf1\xc3\xd3\x79\x8a\x19\x9e\x5a\x63\
+\x9d\x0a\x52\xcc\x36\xee\x4a\x50\x46\x15\xb4\xc5\xbb\x68\x27\xbe\
+\x3b\xe9\xf7\x8b\x9c\x38\x3c\xad\x94\x60\xe3\x65\x4c\x7c\xdd\x52\
+\x70\x6f\xa2\x72\xea\xc2\x5e\xdc\xd7\xb1\x09\xe6\x60\x95\x63\x1f\
+\xc6\x6a\xf1\x80\xfa\x66\x4c\xcc\x36\xf2\xb2\x5f\xcc\x93\x4f\x76\
+\x0e\x89\x7e\x1e\xdf\xd7\xe7\x39\x76\x68\x5a\x8d\xe7\xeb\x32\x3c\
+\x8d\x75\xfe\x98\x97\x47\xc4\x3c\x7f\x54\xf9\x73\xc7\xb6\x4e\xfa\
+\xdd\x69\x8e\xbe\xa8\x27\x1e\xc6\x2a\x9d\xd9\xd3\x2f\xe4\x9f\xf0\
+\x7f\xb9\xd8\x3e\x9d\x34\xcc\xc6\xa5\x4d\xb1\x1a\xcd\xcb\x13\x09\
+\xca\x18\x05\x0e\x63\x7b\x53\x1a\x6f\xe0\x9e\x04\x65\x8c\x0c\x4d\
+\xe1\x9d\xcb\xcb\xbe\x04\x65\x8c\x0c\x4d\x69\x4e\xb7\x3e\x9b\xa0\
+\x8c\x91\xa1\x6c\x17\xec\x0c\x42\xf4\x14\xf9\x4f\x9e\x93\xa0\x8c\
+\x91\xa1\x29\x22\x82\xf3\x32\xd0\x8a\x6c\xd4\x69\x8a\xe5\x6e\x5e\
+\x96\x24\x28\x63\x64\x68\x8a\xbc\x57\x79\x59\x9e\xa0\x8c\x91\xa1\
+\x29\x62\x78\xf2\xb2\x2a\x41\x19\x23\x43\x53\x9c\x5b\xcc\xcb\x4a\
+\x33\x2f\xd3\xbe\x69\x8a\x5d\xa3\xbc\xcc\x16\x19\x7d\x66\xe8\x83\
+\xa6\xf0\x10\xa6\x60\x43\xa2\x72\x46\x82\x53\xa4\xc9\x40\x94\xea\
+\xe1\x8d\x0c\x0f\xc9\x2f\x7a\x4b\xe4\xec\x9a\xa1\x07\x13\x6e\x80\
+\x6d\x09\xca\x6a\x88\xb3\xed\x27\x2b\x0b\x24\x76\x9b\x6c\x92\xe6\
+\xf4\xd2\x5e\xd5\x47\x5c\x14\xc5\x56\x11\xc9\x71\x07\xde\x2f\xe2\
+\x5e\x67\xe5\x29\x70\xbe\xa3\xb1\xf6\x79\xed\xa6\x3c\x0d\xa9\x29\
+\x17\x9b\x3a\x12\x6f\x1f\xbe\x87\x0f\x8a\x7c\xba\x03\x1f\x64\x4a\
+\x75\x36\xfd\x9f\xca\x3d\xbc\x53\x06\xfd\x46\xe3\xfd\x57\x24\x58\
+\xfb\xb0\xc8\xda\xd7\x33\xdc\xfe\xfa\x3e\x0b\xee\xc7\xb6\x24\xe8\
+\x68\x5d\x58\x27\x7b\x3c\xed\x7e\x71\x84\xe3\xe3\x22\x76\xf6\x84\
+\x05\xe4\x7c\xf1\x75\x49\x21\xfa\x21\xb1\xfb\x3d\xec\xcc\xc5\xef\
+\xa4\xfb\x30\x5e\x33\x55\x25\x29\xc3\xb6\x7f\x23\x7d\x36\x8b\xb2\
+\xd9\x22\x9d\x1e\xbb\x74\xd9\xa5\x5b\x2d\x6d\x68\xfa\xad\xa9\x7a\
+\x5f\x01\x57\x4b\x1b\xc6\xfe\xd1\xe9\x2a\xbb\x27\x61\x45\x2d\xbc\
+\x33\x6f\xef\x2b\x60\x85\xb4\x81\xbe\xfb\x71\xd6\x74\x15\xae\x4f\
+\x58\x59\x5b\x8c\xef\x9b\xf2\x69\x50\x2a\xe7\x88\xc3\xa4\x29\x35\
+\xf8\x5c\x3f\x15\xff\x28\x71\xa5\x07\xf0\xfa\x6c\x1a\x94\xca\x12\
+\x69\x5f\x9c\x13\x9f\xf2\xa5\xfd\x54\xfe\x0a\xe9\xd3\x8e\x1c\xc4\
+\x9b\xb2\x28\x51\x12\x17\x8a\x68\x8e\x94\x7d\x6e\xe3\x53\x83\x34\
+\xa2\x88\xf0\xc0\x71\x7c\x4c\xfd\x62\x81\xd6\x8b\x45\x5d\xea\xfe\
+\xfe\xdd\x80\x0b\xc5\x73\xc5\x6d\x29\xa9\x1b\xd2\x16\xf7\x62\xd4\
+\x61\x33\x7b\x4c\x2c\x5c\x8a\x4a\xae\xbf\x39\x4b\xa3\xde\x53\x50\
+\x63\xda\x22\x8c\xfc\x06\xd5\x7d\xea\x5f\x8a\x5f\xf6\x68\x63\x1e\
+\xfb\xa1\x8c\x7d\x6b\x88\x65\x6c\x51\x0d\x6b\x8b\x5c\x30\x65\x26\
+\x4f\x5b\x86\x2f\x2a\x36\x94\x7d\x9f\x9c\x27\x24\x96\x29\x3e\x39\
+\x4d\x4b\x5c\x51\x73\xad\xe2\x32\x87\x5e\x26\x92\x44\x14\x9d\x98\
+\xb9\x85\xb7\xa6\x68\xf0\x1b\x95\x97\x64\x6c\x0f\x3e\x23\x12\xb7\
+\xe5\x8d\xf9\xbc\x08\x1f\x10\x3b\x63\x65\xdd\xad\x74\x7b\xaf\x46\
+\x0d\x32\xe6\xdc\x2c\x5c\x96\x65\xf2\x0c\x7e\x2a\xa2\x45\x1e\x15\
+\x53\xba\xdd\xe2\x9b\x77\xa0\xf3\x3f\xb3\xc5\x0c\x61\xb1\x08\xe5\
+\x59\x89\x97\x88\x69\x6f\xd9\x49\xda\x1e\x12\x2e\xdd\x03\xbd\xfe\
+\xb1\x5f\x1a\xea\x95\x25\xa8\xa5\x9a\x14\x7f\xdd\x6c\x97\x3e\x17\
+\x41\x83\x32\x4f\xa4\xf2\xae\xba\x83\x75\xb3\xbd\xb8\x34\x87\xae\
+\x3d\x59\xa8\xd8\xa9\xd6\xb0\xd9\x33\x8e\xde\x08\x53\x28\xa7\x9b\
+\x11\xbe\x2d\x16\x8f\xa5\x86\xe6\x2f\x94\xde\x31\x36\x4c\xf6\x14\
+\x2e\xcf\xad\x62\x06\xe6\x89\x3b\x3d\xab\x16\xa0\x6c\x7b\x5c\xf8\
+\xdc\x2b\xa3\x21\x9c\x58\x75\x9a\x49\x14\x69\xf7\xe1\xb9\x49\x94\
+\x4b\xc0\x46\xc5\x78\xea\xea\x62\xe3\xf8\xa4\x1a\xde\xb5\xb1\xd4\
+\x70\xde\x3f\xda\xcb\x76\x89\x6b\x91\x6b\x4b\x03\xef\x12\x73\xd7\
+\xaa\xc5\xca\x6b\x2d\xe1\xaf\x19\x9a\x40\xb6\xc5\x22\x51\xc3\xb0\
+\x8e\xf5\xbf\x16\x4b\xfa\xa1\x64\x8d\x38\x6a\x56\xb7\xcb\xbc\xbb\
+\xd9\x13\x62\xf3\xe1\xa4\x08\x6c\x5e\x2b\x52\x4e\xd5\xf5\x93\xbf\
+\x43\xdc\x11\x5d\xf5\x3d\x1d\x85\xb0\x42\xb8\x6e\xeb\x90\x80\xf8\
+\xb0\xb8\x05\x66\xa3\xfa\xed\xdb\x16\xc2\x5c\xb1\x69\xf1\x0d\xe1\
+\xbf\x28\x4b\xe8\x71\xfc\x04\xef\x53\xd1\x3e\x6d\x5d\x9e\xee\x5c\
+\xe1\xc3\xd8\xd0\xf9\x79\x99\x74\xe7\x20\xdb\xc2\x0f\x7f\xbf\x48\
+\xee\x76\xb7\x34\x01\xcb\x99\xa9\x8b\xe8\xc7\x33\x47\x1c\xc4\xbf\
+\x44\xec\xfe\x9c\x2f\x4e\x27\x9c\x25\xa6\x6f\xa7\x3a\x3a\xf6\x1e\
+\x11\x07\x7a\xf6\x89\xc5\xd9\x6e\x91\x4f\xeb\x8f\x62\xe3\xe3\x61\
+\xb1\xe9\x51\x1b\xfe\x0f\xf3\xae\x79\xb0\x32\x34\x81\xde\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 \x00\x00\x0a\xee\
 \x89\
 \x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
@@ -2712,4904 +391,6 @@ qt_resource_data = b"\
 \x86\xd9\x0b\xd3\x7f\xdc\x31\xcd\xeb\x43\x5a\xab\x4f\xf6\x27\x6f\
 \xfe\x80\x3e\x04\x5e\x91\x9d\xf8\x07\xae\x5f\xc9\x0a\x2a\x16\x77\
 \x06\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x00\xf0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
-\x00\x00\x00\xb7\x49\x44\x41\x54\x78\x5e\x63\x60\x20\x02\xbc\x95\
-\x51\x69\x04\x61\x74\x71\x92\xc1\x7d\x05\x05\x8e\xb7\x32\xca\xcb\
-\x80\x86\xfd\x87\x60\xe5\x65\x20\x31\x74\x75\x44\x81\xcf\x12\x2a\
-\xa2\x40\x43\x8e\x22\x0c\x83\xe3\xa3\x20\x39\x74\xf5\x78\xc1\x1b\
-\x79\x55\x4d\xa0\xc6\xbb\x58\x0c\x83\xe1\xbb\x20\x35\xe8\xfa\xb0\
-\x82\x37\xd2\x4a\xce\x40\x0d\xef\xb1\x18\x82\x8e\xdf\x83\xd4\xa2\
-\xeb\x47\x01\x40\x45\x29\x40\xfc\x0b\x8b\x66\x5c\x18\xa4\x36\x05\
-\xdd\x1c\x86\xff\x0c\x0c\x4c\x6f\x64\x94\x3b\xb1\x68\x20\x0a\x83\
-\xf4\x82\xcc\x00\x1b\xf6\x4c\x4a\x8a\x0b\x18\x7b\x6b\xd1\x15\x91\
-\x8e\x95\xd7\x82\xcc\x42\x71\x29\x50\xe2\x1b\xa6\x42\x82\xf8\x1b\
-\x8a\x21\xc8\x60\xd4\x40\x62\xf1\xa8\x81\x48\x60\x64\x1a\x78\xfd\
-\xad\xb4\xf2\x7d\x92\x30\x50\x0f\xb2\x19\x00\xde\xc0\x1d\x05\x5a\
-\x37\xe2\xef\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x12\xf6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x29\x18\x7d\x06\x81\xd3\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x12\x5a\x49\x44\x41\x54\x78\xda\xed\x9d\x41\
-\x53\x1b\xe9\x99\xc7\x7f\xdd\x7a\x69\x35\x52\x23\xc9\x42\x20\x61\
-\xcb\xa0\x01\x6c\x88\xcd\x18\xc5\x83\x31\xb1\x53\x63\x67\x92\xca\
-\x1e\xf6\x03\xe4\x30\xa7\xe4\xb0\x55\x7b\xde\x2f\x30\xfb\x01\x76\
-\x8f\xd9\x5b\x3e\xc1\x1e\x72\x49\x6d\x5c\x93\x4a\x8d\x3d\xd8\x61\
-\x66\x30\xd3\x10\x8c\x05\x16\x4c\x9b\x91\xb1\x90\x05\xd3\x88\x46\
-\xb4\x9a\x46\xda\x83\x04\x19\x7b\x6c\x8f\xc1\x02\x24\x57\x9e\x0b\
-\x2a\x54\x82\x6e\xfd\xf5\x7b\xff\xcf\xf3\xbc\x4f\xb7\xa4\x4a\xa5\
-\x42\xb3\x87\x61\x18\xdc\xbe\x7d\xbb\x02\x70\xe3\xc6\x0d\x29\x91\
-\x48\x34\xed\xb9\x88\x66\x16\xc2\xb2\x2c\xb2\xd9\x2c\xa9\x54\xea\
-\x0f\xe9\x74\x1a\x59\x16\x74\x75\xf5\xfc\xbb\x2c\xab\xff\x13\x89\
-\x84\xf0\xf9\xd4\x7f\x0a\x72\x9c\x91\xcd\x66\xb9\x75\xeb\x56\x65\
-\x62\x62\x82\x54\x2a\x85\xa2\x68\x98\x26\xbf\x5f\x5b\x2b\xfd\xfe\
-\xfa\xf5\x61\xa9\xbb\x3b\xf6\x4f\x41\x8e\x93\x8c\xc9\xc9\xc9\xca\
-\xf8\xf8\x38\x33\x33\xb3\x58\x96\x8d\xa2\xb8\x4c\x4d\xe9\x94\xcb\
-\xd0\xd6\xe6\xfd\x03\xf0\xbb\x66\x23\x45\x34\x33\x19\xe3\xe3\xe3\
-\xe8\xba\x4e\xb1\xe8\x12\x8f\x0f\x22\xcb\x82\x6c\xd6\x60\x62\xc2\
-\x04\xf8\xed\xe6\x66\xe9\xb7\xcd\x46\x8a\x68\x66\x32\x52\xa9\x14\
-\xaa\xaa\xd2\xdd\x1d\x67\x68\x68\x0c\xd7\x75\x99\x9c\x34\x31\x4d\
-\x93\x99\x19\x1d\x68\x3e\x52\x44\x33\x93\xa1\xaa\x2a\x37\x6f\xde\
-\xe4\xf2\xe5\x11\xfa\xfa\x06\xb0\x2c\x8b\x50\x08\x74\x5d\x27\x9d\
-\x6e\x4e\x52\x44\x33\x93\x31\x38\x38\xc8\xd8\xd8\x18\x23\x23\x23\
-\x44\xa3\x51\x2c\xcb\xa2\x52\x29\x21\xcb\x50\x28\x98\xe4\x72\xcd\
-\x47\x8a\x68\x66\x32\xc6\xc6\xc6\x18\x1e\x1e\x26\x1a\x8d\xa2\xaa\
-\x2a\x42\x08\x86\x87\x87\xf1\x7a\xbd\x00\x4c\x4d\x35\x1f\x29\xe2\
-\x5d\x20\x43\xd3\xb4\xea\xc9\x08\x41\x2c\x56\x7d\xb3\x4b\xa5\x12\
-\xd0\x7c\xa4\x88\x77\x81\x8c\x17\x23\x14\x0a\x35\x2d\x29\xe2\x5d\
-\x20\xe3\xc5\x50\x55\xb5\x69\x49\x11\xef\x12\x19\xef\x02\x29\xe2\
-\x5d\x22\xe3\x5d\x20\x45\xbc\x8b\x64\x34\x33\x29\xe2\x5d\x24\xa3\
-\x99\x49\x11\xef\x32\x19\xcd\x48\x8a\x68\x66\x32\xdc\xb2\x8b\xbd\
-\x63\xe3\xba\x2e\xec\x82\x90\xc5\x7e\x81\xd8\xac\xa4\x88\x66\x26\
-\xc3\xde\xb1\x59\xdd\x5c\xc5\xb2\x2c\x28\x82\xe6\xd5\xde\x68\x69\
-\x6b\x64\x52\x44\x53\x92\xe1\xba\xd8\xb6\x4d\x26\x97\x61\xfa\xd1\
-\x34\xd9\x6c\x16\xb6\x20\xdc\x16\xa1\xaf\x6f\x80\x78\xfc\x0c\x91\
-\xf6\x40\xf5\x13\x2e\xc9\x80\xd4\x34\xa4\x78\x3e\xf9\xe4\x93\x63\
-\x17\x64\x79\x79\x99\x5b\xb7\x6e\x55\x3e\xfd\xf4\x53\x74\x5d\x47\
-\x08\xc1\xcd\x9b\x37\xf9\xd5\xaf\x7e\xc5\xf0\xf0\x30\xa7\x4f\x9f\
-\x46\x55\x55\x64\x59\x7e\xe9\xeb\x8b\xc5\x22\xab\xab\xab\x7c\x3d\
-\xf5\x35\x7f\xfc\xdf\x3f\xf2\x97\xff\xfb\x0b\xfa\x7d\x9d\xc5\xf4\
-\x32\x6b\x6b\x25\x76\x5d\x88\xb4\xfb\x09\x06\x7d\x80\x5c\x13\xe5\
-\x25\x9f\x46\x21\x08\x85\x42\x68\x9a\x86\x24\x49\x94\x4a\x36\x99\
-\x8c\xc1\xea\x6a\x96\x52\x49\xfa\x29\xb4\x7c\x12\x89\x84\xfe\x33\
-\x18\xd4\xde\x4d\x42\x0e\x4f\x46\x05\x2a\x65\x8a\x45\x9b\xfc\x5a\
-\x81\x4c\xe6\x09\x8b\x8b\xf3\xcc\xcc\xe8\x64\xbe\xc9\x60\x7d\x67\
-\xa1\xaa\x2a\x96\x65\x91\x4e\xa7\x11\x1e\x09\xbf\xcf\xa1\x58\x4c\
-\x10\x3a\xd5\x81\xd6\x16\x7c\xa9\xb7\x34\x22\x29\xa2\x29\x3c\xa3\
-\x52\x86\xca\x0e\xf9\x67\xcf\xb8\x7b\x6f\x8e\xc9\xfb\x5f\x33\x3b\
-\x3b\x41\xb1\x68\x12\x8b\xc5\x48\x26\x93\xc4\x62\x31\x1c\xc7\x25\
-\x9d\x36\x48\x2f\xce\x60\x9a\x06\x0f\x53\x09\x92\xc9\xcb\xf4\x9f\
-\x3b\xf7\xda\x25\xb0\x91\x3c\x45\x34\x32\x19\x7b\x5e\x51\xd8\xd8\
-\x20\xff\xec\x19\x0b\x0b\x06\x53\x53\x73\xa4\xd3\x69\x2c\xcb\x22\
-\x1c\x0e\x91\x4c\x26\x19\x1c\x1c\x24\x16\x8b\x61\x6d\x6e\xe2\x6b\
-\x6d\xc1\x30\x0c\xcc\x8d\x02\xa9\xf9\x47\xd8\xa5\x1d\xf2\x6b\x6b\
-\x0c\x0c\x0c\x10\x8f\xc7\x09\x85\x42\x3f\x10\xbd\x91\x48\x39\x16\
-\x0f\x39\xac\x67\xec\x79\xc5\xcc\xf4\x43\xfe\xf4\xa7\x3b\x8c\x8f\
-\x7f\x45\x76\x75\x99\xb6\xb6\x16\x46\x46\x92\xdc\xb8\xf1\x21\x57\
-\xaf\x5e\xdd\x17\xa4\xb3\xa3\x9d\x44\xcf\x19\x62\xd1\x0e\x24\x49\
-\x26\xbf\xb6\x8e\xae\xeb\x2c\x2c\x2c\x50\x2a\x95\xf0\x78\x3c\xfb\
-\x9e\xd1\xa8\x9e\x22\x1a\x91\x0c\xdb\xb6\x31\x4d\x93\x4c\x26\xc3\
-\xfc\xfc\x3c\x73\x73\x69\x52\xf3\x06\xb6\x6d\x13\x8f\x9f\xe2\xfc\
-\xf9\x04\xc9\x64\x92\xfe\xfe\xfe\xe7\x5f\x5f\xd9\x25\x16\x6d\x27\
-\x14\x0a\x21\xc9\x0a\xee\x6e\x85\x7c\x3e\x4f\xa1\x60\x31\x37\x97\
-\xa6\x5c\x16\xec\xee\x56\xe8\xed\x4d\xec\xbf\xf1\xdf\xf7\x96\x46\
-\x20\xe5\x48\x09\x39\x2c\x19\xf9\x7c\x9e\xe9\xe9\x69\x3e\xff\xfc\
-\x73\xfe\xfc\xe7\x3f\xf3\xe8\xd1\x02\x91\x48\x88\xcb\x97\x87\xf8\
-\xe5\x2f\x6f\xf0\xb3\x9f\x8d\x91\x48\x24\x08\x87\xc3\xcf\xbf\x5e\
-\x92\x00\x19\xd1\xe2\x25\x74\x2a\x4c\x67\x67\x27\x5d\x5d\x5d\xb4\
-\xb6\x06\xc8\x64\x4c\x96\x96\x32\x3c\x79\xf2\x98\x7c\x7e\x15\x49\
-\x92\xf0\x7a\xbd\xa8\xaa\x8a\xa2\x28\x0d\x43\x8a\x68\x04\x32\xf6\
-\xbc\xc2\xb2\x2c\x4c\xd3\x64\x69\xc9\xe0\xfe\xfd\x69\x52\xa9\x34\
-\x85\x82\x45\x20\xa0\x71\xe1\x42\x3f\x23\x23\x49\x86\x87\x87\xf7\
-\x3f\xc5\x3f\x0c\x09\x24\x0f\x6a\xab\x9f\x58\xab\x1f\x4d\x6b\xe3\
-\xd4\xa9\x53\x04\xda\xda\x71\x77\x5a\x58\x5a\x32\xc8\xe5\xbe\xc3\
-\xb6\xed\x6a\xc6\x96\xcf\xbf\xd4\x5b\x4e\x92\x94\x23\x21\xe4\xa0\
-\x64\xec\x79\xc5\xc3\x87\x0f\xb9\x7d\xfb\x36\xe3\xe3\x5f\x30\x3b\
-\x6b\x50\x2e\x0b\x46\x46\x92\xfc\xe2\x17\x55\xaf\x38\x7f\xfe\x3c\
-\xa1\x50\xe8\x95\xad\x91\x17\x43\x96\x65\x54\x55\xa5\x3d\x1c\xa4\
-\xbf\xef\x0c\x5d\xb1\x0e\x4a\x25\x99\xa7\xd9\x75\x66\x67\x75\x16\
-\x17\x5f\xef\x2d\x27\x41\x8a\x38\x49\x32\x5e\xf4\x8a\x85\x85\x34\
-\xe9\xb4\x41\xa1\xb0\x4d\xa0\x2d\x40\x6f\x6f\x82\xb1\xab\x97\xb9\
-\x70\xf1\xdc\xa1\xba\xbd\x42\x08\x34\x4d\x43\xf3\xb7\x72\xba\xab\
-\xea\x2d\x3b\xae\x42\xb9\x52\xc1\xb6\x5f\xe2\x2d\xfd\x09\x42\xed\
-\x35\x6f\x69\x51\x4f\x84\x94\xba\x12\x72\x50\x32\x5e\xf4\x8a\x07\
-\x0f\x16\x10\x22\xc4\xc0\xf9\x0b\xfc\xcb\xaf\xaf\xf1\x8b\x9b\x57\
-\xe8\xef\x7f\x8f\xf6\xf6\xf6\xd7\x56\xee\x3f\x1a\x35\x6f\x69\x51\
-\xbc\x44\x3a\xc2\xc4\xe3\x9d\x9c\x3d\xdb\x85\xcf\xf7\x82\xb7\x98\
-\xab\x48\x7e\x09\xaf\xe6\x45\x15\x2a\x8a\x50\x8e\x9d\x14\x71\xbc\
-\x64\xf8\xab\x15\xf7\xd6\x06\xf9\xb5\x1c\x0b\x0b\x8b\x4c\x4e\x4e\
-\x33\x37\x57\xf5\x0a\x4d\xd3\xe8\xef\xef\xe7\xf2\xe5\x24\xa3\xa3\
-\x17\xe8\xee\x8e\x81\xd4\x02\x92\xe7\x2d\x8f\xb0\xea\x2d\x3e\xbf\
-\x9f\x6e\xbf\x9f\x70\xb8\x8d\x68\xf4\x14\xa1\xe0\xf3\xde\xe2\x54\
-\x5c\x5c\xaf\xa0\xb0\x69\xd3\xd7\xb5\xc9\xe9\x48\x6c\xdf\x5b\x8e\
-\x8b\x94\xba\x10\xf2\xc6\x64\x48\x40\x65\x87\xa7\x4f\x0d\xee\xde\
-\xfd\x94\x6a\xc5\x6e\xb0\xb3\x53\xf5\x8a\x8f\x3e\xfa\x90\xeb\xd7\
-\xaf\x32\x34\x74\x9e\x48\x24\x4c\x8b\xe2\x7d\x69\x73\xf0\x6d\xe3\
-\x55\xde\x92\xcf\xdb\x18\xe9\x2c\xdf\x2e\xad\xb0\xb5\xb1\x01\x95\
-\xdd\xe7\xbc\xe5\x38\x48\x11\xc7\x41\x86\xa2\x28\x14\x0a\x9b\x14\
-\x36\x36\x30\xbf\x5b\x27\x95\x9a\xe1\xce\x9d\x71\xe6\x1e\x7e\x43\
-\x3e\xaf\xd2\xd9\x19\x47\x51\x54\x7c\x3e\x95\x72\xd9\x66\x7d\x7d\
-\x95\xf5\xf5\xd5\xa3\x6f\x21\x54\x76\xa1\xb2\x83\xa2\x80\x2c\x83\
-\x55\xb0\x30\x0c\x03\x59\x76\x31\x9f\x65\x28\x98\x79\x76\x76\x76\
-\xe8\x3f\xdf\xbf\xef\x2d\x91\xce\x08\x83\x0c\x1e\x19\x29\x6f\x25\
-\xc8\x9b\xf6\xa6\x0a\x85\x4d\x16\x17\x97\x98\x7b\xf0\x08\x5d\x9f\
-\x27\x95\x7a\x80\xf1\x78\x86\x42\x61\x0b\x21\x62\x28\x8a\x89\xae\
-\xeb\x64\x32\xe9\xd7\x6e\x30\xd5\x5f\x90\x0a\xf0\x8f\xa6\xa5\x69\
-\xae\x62\x9a\x06\xc5\xa2\x85\x69\x1a\xac\xac\x18\x18\x86\xc1\xd0\
-\x4f\x87\x48\x5e\xab\x15\xa2\x6d\xd1\x23\xed\x7d\x89\x23\x21\xe3\
-\x83\x0f\x88\x46\x3b\x90\xa5\x5d\x56\x56\xbe\x61\x69\xc9\x60\x7a\
-\x7a\x0e\x5d\x4f\xa1\xeb\x8f\xc8\x66\x57\x81\x5d\x7c\xbe\x30\x91\
-\x48\x94\x50\x28\x50\xfd\x84\x5a\x5b\x58\xd6\xd6\x81\x8f\xa7\x5c\
-\x2e\xe3\xba\x3b\xb5\x65\xa5\xe5\x50\xe6\xaf\x28\x32\x91\x48\x1b\
-\xae\xdb\x41\x3e\xef\xc1\x34\x37\x59\x5a\xca\x50\x28\x58\xac\x6f\
-\x9a\x14\x25\x17\x6b\xcb\x61\xe0\xac\xc3\xe9\x48\x8c\x70\x38\xcc\
-\xe0\x60\xfd\x49\x11\x47\x43\x46\x07\xaa\xd7\xc3\xca\x8a\xc1\xdd\
-\x7b\x7f\xe5\xcb\xaf\xee\xa3\xeb\x8b\x18\x46\x16\xd3\xdc\x44\x55\
-\x03\x24\x12\x83\x74\x77\xf7\x10\x8f\x77\x10\x0a\xf9\x11\xa2\xba\
-\x6c\x1c\x26\x1c\xa7\x84\x65\x6d\x02\xa0\x69\x6d\x28\x8a\xf7\x50\
-\x7f\x67\x7f\xe3\x2b\xb3\x8a\xae\x3f\x62\x65\xe5\x09\xf9\xbc\x89\
-\x3d\x9d\xc2\x34\x61\xe5\xd1\x26\xe6\x95\x02\x97\x86\x06\xe9\xeb\
-\xeb\x3d\x12\x52\x44\x3d\xc9\x48\x26\x93\x04\x83\x41\x0a\x05\x8b\
-\xa5\x67\xcf\x58\x58\x98\x65\x6a\x4a\x67\xc9\x58\xc2\xa9\x94\x50\
-\xdb\x5a\x50\x1d\x99\x50\xc0\x47\x22\xd1\xc3\x85\x0b\x17\xe8\xef\
-\xef\x22\x1c\x6e\x3b\xd4\x1b\x58\xad\xb6\x4d\xd6\xd7\xd7\x90\xe5\
-\x6d\x84\x90\x09\x87\xdb\x09\x87\xdb\xd1\x34\xff\x0f\x5a\x22\x6f\
-\x1a\xe9\xf4\x63\xf2\xf9\x6d\x8a\xc5\x2d\x5c\x17\x14\x45\xa1\x5c\
-\xaa\x90\x7b\x92\x63\x4a\x9a\xc2\x2a\xe4\xd9\xda\x5a\xa7\xb7\x37\
-\x41\xa4\xbd\x93\xc1\x81\x73\x94\x6c\xbb\x2e\xa4\x88\x7a\x92\x11\
-\x0c\x06\xd9\xd8\xd8\x60\x61\xfe\x1b\xc6\xc7\xa7\x58\x5a\x4a\x63\
-\x97\x72\x04\xda\x63\x24\x3f\x1c\xc4\x71\x5c\xf4\xbb\x3a\xec\x78\
-\x48\x24\x3a\xe8\xef\xef\xe2\xe2\xc5\x01\x3a\x3b\xdb\x0f\x99\xdd\
-\x65\x31\x8c\x75\x0c\xe3\x19\xa6\xf9\x2d\x9a\xe6\x25\x14\x0a\xa3\
-\x69\x7e\xfa\xfa\x7a\x09\x87\x4f\x1d\x2e\xf5\xf4\x78\xd0\xf5\x29\
-\x8a\xc5\x10\x91\x48\x82\x70\xb8\x9d\x50\xa8\x83\x42\xa1\xc0\xec\
-\xec\xd7\xcc\xcd\x7d\x81\x61\xf4\x31\x7a\xe5\x03\xae\x5f\xfb\x88\
-\xce\xce\x38\xc3\xc3\xef\xe3\xad\xb5\x5e\xde\x86\x14\x51\x17\xcf\
-\xa8\x65\x53\xae\xeb\xb2\xba\xba\x4a\x7e\x6d\x8d\xcc\x93\xa7\x14\
-\x36\xb7\x89\xc7\xcf\x72\xfe\x62\x82\xe4\xcf\x92\x14\x36\x2d\x56\
-\x1e\xe5\xb1\xbe\xdb\x22\x10\xa8\xd6\x03\x9d\x9d\xed\xc4\x62\xd1\
-\x03\x2e\x51\x0e\x96\xb5\x45\xb1\x58\x64\x79\xf9\x31\x0b\x0b\xf3\
-\x58\x56\x16\x4d\xf3\x22\xcb\x1e\x7c\x5a\x2b\x3d\xe7\xce\xa2\x9d\
-\xf2\xa3\xb6\xa8\x08\x59\x1c\x70\x49\x7e\x8a\xa6\x29\x04\x02\x2a\
-\xa7\x4f\xc7\x6a\x4b\xeb\x59\xf2\xf9\x3c\xd9\xec\x63\x72\xb9\x27\
-\x64\x32\x39\x62\xd1\xa7\xfc\x74\x78\x0b\xd5\xdb\x52\x3d\x07\xc9\
-\xf3\xd6\x9e\x22\xea\xe3\x19\xd1\xfd\x2d\xd4\xea\x3a\xae\xd2\xdf\
-\x1f\x63\x70\x30\xce\x07\x1f\x0c\xef\xb7\x24\xe6\x1e\xa6\x71\x4b\
-\x2a\x96\x55\x5d\x0a\x0e\x9f\x6e\x6f\xb1\xb8\xb8\xc4\xf4\xf4\x14\
-\xba\x7e\x97\xb9\xb9\x07\xb8\xae\x8d\x10\x32\x86\x61\x90\xdf\x78\
-\x46\xa8\x3b\x80\x3f\xe2\x23\xda\x16\x45\xf3\xbe\x5d\x05\xbd\x47\
-\xdc\xc0\xc0\x79\x42\xa1\x00\x4b\x4b\xcb\x64\xb3\x26\x10\x03\xd4\
-\xba\xee\x3c\x8a\x7a\xf6\xa6\xf6\x7a\x47\xa7\x4f\xc7\x90\x65\xd0\
-\x34\xed\xb9\xee\xac\x21\xb2\x94\x5d\x81\xe3\x40\xb9\x7c\xf8\x37\
-\xc8\xb6\x6d\xb2\xd9\x2c\xcb\xcb\xd5\xd4\x34\x97\xcb\xec\x3f\x97\
-\xcb\xe5\x08\xb4\xb7\x91\xcb\xe5\xb0\x2c\x8b\xf6\xd6\x76\xf0\xbe\
-\x95\x1e\x28\x8a\x42\x38\x7c\x8a\x48\x24\x82\xdf\xef\x23\x16\xeb\
-\x26\x9d\xce\xa2\xf9\x5b\xf1\xf9\x83\xb5\x4e\x82\x54\x97\x8a\x5e\
-\xd4\x73\x0f\x5c\x55\x55\xa2\xd1\x28\xc1\x60\x90\x9e\x9e\x9e\xfd\
-\xca\xb6\xde\xe1\xba\x3b\x58\x56\x01\xcb\xda\xdc\x4f\x77\x9f\x8b\
-\x5d\x60\x0b\x28\xd6\x1e\xd7\x29\xf6\xce\xaf\xad\x6d\xef\xfc\x3c\
-\x44\xda\x03\xb5\xf6\x8e\x5c\x17\x52\x44\x3d\x77\xfa\xf6\xbb\xab\
-\xda\xd1\x8e\xcd\xc8\xb2\x8c\xa2\x28\x28\xca\xf3\x35\x87\x10\xd5\
-\xc9\xc5\x50\x20\x48\xc8\xd7\x86\xa6\xb4\x22\x64\x4f\xdd\xfe\xef\
-\xf7\xcf\xaf\xb3\xf3\xf5\xc2\x1d\x96\x14\x51\x0f\x32\x8e\x3b\xf6\
-\x4e\x38\x16\x8b\xfd\x80\xd0\x58\x2c\x46\xa2\xa7\x9b\x9e\xee\xd3\
-\x44\x3b\xc3\xa8\x5e\xe5\xc4\x8e\xf3\x30\xa4\x88\x7a\x90\x71\x52\
-\x82\xf4\xf6\xf6\x72\xfe\xfc\x00\x85\xc2\x26\xf9\xfc\x33\xb4\x80\
-\x46\xff\x4f\xfa\x19\x7c\x7f\x90\xd8\xe9\x58\xf5\x38\x25\x71\xe2\
-\xc7\x79\x10\x52\x44\x33\x91\xf1\xe2\x5a\x7e\xf1\xe2\x10\xa6\x59\
-\x40\x55\x5b\x19\x1f\xff\x1c\x5f\xb0\x95\xe4\xf5\x24\xc9\xeb\x97\
-\x09\x75\x74\xfc\x60\x6d\x6f\x06\x52\x44\x33\x90\xf1\xe2\x94\x3b\
-\xb5\x0c\xcd\xe7\xf3\xd1\xdd\xdd\x43\x77\xf7\xb7\xf8\x7c\xf7\x51\
-\x55\x2f\xb1\x58\x8c\x48\x47\x07\xee\x6e\x05\x73\x63\xb3\x66\x3a\
-\x80\xa7\xe6\x31\x87\xa8\x4b\x8e\x8b\x94\x62\xd1\xfe\x9d\x68\x06\
-\x32\x5e\x9c\x72\x67\xe7\x1f\xf5\x88\x5d\x6b\x59\x7c\x3f\xbb\xb2\
-\xd7\x6c\x56\x0b\xab\xac\xc9\x6b\xd5\xdf\xb7\x00\xbe\x6a\x1a\x5e\
-\x8f\xba\xe4\xa8\x48\x79\xf0\xe0\xf1\x6f\x85\x61\x18\xa4\x52\xa9\
-\x3f\x4c\x4c\x4c\x30\x33\xa3\x53\x2c\x9a\x74\x77\x0f\x72\xf9\x72\
-\xb2\x61\x3c\xa3\x58\xb4\x58\x5e\x4e\xb3\xf2\x34\x8b\xbd\x06\xe5\
-\x12\x08\x01\x8e\xb3\x83\x69\x6e\x91\xcd\xae\x61\xdb\x0e\xe5\x72\
-\x85\xe5\xc5\x2c\xaa\x27\xfd\x7c\x1d\xe1\x17\x68\x51\x95\xd3\x5d\
-\x31\x82\x2d\xc1\x13\x13\xe4\x45\x52\x1c\xc7\xc5\x30\x32\x64\x32\
-\x19\x26\x27\x27\x49\xa7\x0d\xc4\xed\xdb\xb7\x2b\xe9\x74\x9a\x54\
-\x2a\x85\x65\x99\xc4\xe3\x21\x86\x86\x12\xf4\xf5\xf5\x34\x8c\x67\
-\x58\x1b\x26\xe9\x19\x9d\x99\x99\x14\xd9\x27\xe0\xd8\xa0\x69\xd5\
-\xb6\xbb\x69\xee\x92\xcd\x56\xbb\xc8\xb2\x2c\x33\x3e\xae\x33\x37\
-\x97\x7d\xee\xf5\xe1\x88\x46\xff\x40\x0c\xf9\x12\xf4\x84\x7b\x20\
-\xd8\x18\x9e\xb2\xb5\xb5\x83\xae\x1b\xe4\x72\x3a\x86\x91\x02\xdc\
-\xaa\x87\xec\xe5\xd7\xc5\xa2\x86\x10\x02\xd7\x75\xb1\x2c\x0b\xcb\
-\xb2\x10\x42\x1c\xdf\x86\xd1\xab\xf2\x7f\xd9\x83\xa6\xb4\x12\xf2\
-\x69\xd8\x6d\xe0\x78\xab\x82\x38\xce\x0e\x96\xb5\x8d\x2c\x0b\x14\
-\x45\x43\x16\x32\xb2\x57\x20\x5a\x3d\xa8\x42\xd9\xaf\x41\x42\x6d\
-\x1a\x21\x9f\x56\xf7\xba\xe4\xb0\x51\x2e\xbb\x38\x8e\x85\xe3\x58\
-\x94\xcb\x2e\x3e\x9f\x4a\x35\xcb\x12\x88\x1b\x37\x6e\x48\x3d\x3d\
-\x3d\x23\xc0\x57\x53\x53\x93\xa4\xd3\x29\x26\x27\x53\x84\x42\x5f\
-\x50\xa9\xb4\xfc\xc8\x60\xda\xf1\x44\xa4\xbd\x93\xeb\xd7\x3e\xe2\
-\xfd\x8b\x1f\x60\xdb\xd5\xb6\x8b\x10\xb0\xfe\x5d\x81\xf9\x85\x6f\
-\x99\xf9\xfb\xa3\xda\xd2\xd4\xc2\xcd\x7f\x1d\x63\xe8\xe2\x39\xa2\
-\xfe\x30\x9a\xd2\x5a\x6b\x7d\x08\x34\x4d\x25\x10\x0c\x12\x0a\x06\
-\x4e\x5c\x90\x7c\x3e\xcb\xdd\xbb\xb7\xb8\x73\x67\x1c\xc3\xd0\x89\
-\x44\x22\x7c\xfc\xf1\x6f\xb8\x74\x69\xe8\x8a\x48\x24\x12\xa8\xaa\
-\x3a\x59\x2a\x95\xfe\x03\xf8\xaf\x42\xc1\xaa\xdd\x6f\x6a\x16\x59\
-\x16\xfb\x06\xf4\xb2\xa9\xf1\xe3\x0a\x9f\x4f\xa3\xbb\xbb\xbf\xba\
-\x07\xfe\xbd\xc8\x3d\x5b\xc7\x23\xbc\x14\x36\xb7\x49\xa7\x9f\xe2\
-\x0b\xaa\x0c\x5d\x3c\xc7\xd8\xd5\xf7\x89\x6a\x11\x34\xc5\xf7\xfc\
-\x1f\x92\x3c\xd5\x54\xf8\x04\xbd\x30\x9f\xcf\x32\x33\x33\xc9\xbd\
-\x7b\xe3\xa4\x52\x73\xa8\xaa\x87\xc1\xc1\x3e\xc6\xc6\x46\xa5\xd1\
-\xd1\xd1\xea\x92\x55\x5b\xd3\xfe\xdb\xeb\xf5\xde\x01\xbe\xd2\x75\
-\xbd\x3a\xd2\x6f\x9a\xfb\x06\x74\xa2\xa4\x48\x72\x35\x55\x7a\xa1\
-\xc8\x13\x2d\xad\x68\x5a\x1b\x9a\xe6\x47\x88\xea\x32\x15\xf5\x87\
-\x89\x6a\x11\xd4\x16\x3f\xc8\x2f\x56\xe9\xd2\x89\xd6\x25\x7b\x64\
-\xdc\xbb\x37\xce\xc4\x84\x8e\xeb\x7a\x48\x26\xaf\x70\xed\xda\xcf\
-\x89\x44\x3a\xfe\x51\xa9\x7f\xcf\xfd\xf7\x49\x31\xcd\xea\x9d\xd9\
-\x74\xbd\x9a\x27\x9f\x2c\x29\xd2\x4b\x67\xb3\x64\x8f\x40\xf1\x2a\
-\x08\x21\xe1\xba\x45\xca\xae\x8c\x4f\xb4\x54\xc9\x90\x95\x13\xad\
-\xd2\x5f\x47\xc6\xec\xec\x1c\xae\xeb\x21\x1e\xef\x65\x64\x64\x94\
-\x64\x32\x29\xed\x35\x61\xc5\x4b\xdc\xbf\x71\x49\x79\x65\xf7\xd7\
-\xc6\xb2\xb2\x08\x8f\x86\xeb\xda\x34\x5a\xbc\x8a\x8c\x91\x91\x51\
-\xae\x5e\xbd\x2a\xf5\xf6\xbe\x57\x1d\x22\x7c\x51\x90\xc6\x27\x65\
-\x4f\x00\x77\x7f\x2e\xd8\x34\x4d\x5c\xd7\x21\x12\x09\xa2\xf9\x5b\
-\x31\x37\x36\xc8\xae\xe6\x08\x9d\x6a\x47\x55\xfd\x47\x32\x68\x57\
-\x2f\x32\x46\x47\x47\xa5\xde\xde\xf7\x9e\xdb\x6a\x16\xaf\xc9\x93\
-\x1b\x96\x14\xdb\xb6\x59\x5d\x5d\x25\x93\xc9\x60\x18\x06\xae\xbb\
-\xcb\xc8\xc8\x15\x84\xf0\xf0\x64\xe5\x19\xd3\xd3\xb3\x0c\x0f\x0f\
-\x11\x8b\x29\x35\xef\xf1\x34\x3c\x19\xaf\x15\xa4\xd1\x49\x71\x1c\
-\x87\xf5\xf5\x75\x56\x56\x9e\xb2\xbc\xbc\x0c\xc0\xe0\xc0\x39\xca\
-\x65\x48\xcd\x2f\x62\xdb\x2e\xef\x25\xba\x89\x45\x3b\x4f\xc4\x47\
-\x0e\x43\xc6\x6b\x05\x69\x74\x52\x5c\x77\x17\xcb\x2a\x92\xcf\xaf\
-\x91\xc9\x3c\x21\x14\xd4\x38\x73\xba\x03\xc7\x81\xcf\x3e\x9b\x62\
-\x7d\xad\x88\x65\x9d\x9c\x97\x1c\x86\x8c\x37\x12\xa4\x51\x49\x29\
-\x97\xcb\x38\xce\x0e\xb6\xbd\x8d\x6d\x17\x70\xdb\x64\x44\xab\x84\
-\x2b\x41\xd1\x2e\xe2\x38\x9e\x6a\x67\xb8\x89\xc8\x78\x23\x41\x1a\
-\x9d\x14\x21\xaa\x2d\x14\xa1\x3a\xac\x95\xd6\xb1\x4b\xd5\xc7\x9a\
-\xd2\xca\x49\x74\x7b\xde\x86\x8c\x03\x09\xd2\xa8\xa4\xc8\x32\xd5\
-\xc9\x75\xb1\x4b\xd1\xdd\xc6\x76\xab\x8f\xf7\xa6\xd9\x9b\x89\x8c\
-\x03\x09\xd2\xec\x75\x4a\x33\x90\x71\x28\x41\x1a\x8d\x94\x72\x19\
-\x1c\x07\x14\xd7\x83\x4f\xb4\x22\x14\x8e\xb5\x9b\x5b\x4f\x32\x0e\
-\x25\x48\xa3\x91\xe2\xba\x60\x59\xa0\xb6\x2a\xb4\x7b\xc3\x94\x5b\
-\x40\x15\x4a\x53\x92\xf1\x56\x82\xd4\x8d\x94\x4a\xa5\x76\x15\xd3\
-\xc1\x32\x22\x59\xaa\xa0\xb4\x08\x54\xb5\x15\x55\x0d\x54\xf7\x42\
-\x64\xb1\x3f\x2d\x29\x64\x4f\x6d\x0f\xa7\xf2\x83\x0e\xf1\x1b\x45\
-\x65\xb7\x76\x31\xcf\xf1\x91\xf1\x56\x82\xd4\x8f\x94\xea\x5d\x7e\
-\x28\x97\x0e\x76\xd0\x9e\x32\x9a\xd6\x4a\x24\xd2\x4e\x3c\x7e\x06\
-\xc5\xdf\xc2\xc6\x6e\xb1\x7a\x4c\x91\xea\x3e\x88\xaa\xaa\xd5\xbb\
-\x08\xb1\x73\x60\xc1\xa9\xec\xb0\x3f\x49\x71\x4c\x64\xd4\x45\x90\
-\x83\x92\xb2\x97\x15\x95\xcb\x0e\xb9\xdc\x1a\xe9\xf4\x63\x3c\x72\
-\x99\xec\xd3\x83\x6d\x1a\x59\x5b\xdb\xac\xe6\xd6\x59\x5f\x5f\xc3\
-\x71\x1c\x9c\x8a\x43\x7a\xf1\x9b\xea\x73\xd6\x16\x28\x65\xd2\x8b\
-\xdf\xec\x0f\x7f\x1f\x34\x52\xf3\x8f\xc8\x66\xb3\x14\x8b\x45\x64\
-\xd9\x83\xa2\x28\xc8\xb2\x7c\xa4\x64\xd4\x45\x90\x83\x92\xb2\x57\
-\x37\xb8\xee\x26\xb3\xb3\x8f\x58\x5e\x5e\x41\xd7\x5b\xd1\xb4\x96\
-\x03\x7a\xc7\x2e\x76\xc9\xc1\xb6\x4b\xd5\xa9\x13\xb9\xfa\x4d\x6d\
-\x00\xf6\x96\x8d\x90\x3d\x18\x86\x81\xaa\x1e\x6e\xca\x3a\x9b\x5d\
-\x45\x9f\x9e\xc1\xe7\xd3\x10\xa2\x05\x4d\x0b\x20\x44\xcb\x91\x92\
-\x51\x57\x41\xde\x94\x14\x21\x3c\xf4\xbe\xd7\x85\xbb\x53\x22\xbf\
-\xe6\xe0\xba\xbb\x14\xb7\x4b\xb8\xbb\xa5\xc3\x1d\x7c\x6d\x16\xa0\
-\xba\xcc\x54\x7f\x68\xbe\xda\x5d\x22\x4a\x3b\xd8\xa5\x9d\xc3\x25\
-\x0b\x95\x0a\x91\xae\x0e\x3a\x3b\x3b\x49\xbc\x77\x96\x40\x5b\x2b\
-\xb9\xdc\xb7\x64\x32\x4b\x47\x46\x46\x5d\x05\x79\x53\x52\x86\x2e\
-\xfe\x84\xab\xa3\x97\xb9\x32\x72\x99\x27\x2b\xeb\x58\x5b\xdb\x6f\
-\x75\x6d\xe1\x91\x65\x6f\x92\x8b\xed\xb1\x09\x9f\x0a\x72\xb1\x67\
-\x80\x72\xc9\x66\x5a\xbf\xc3\xe4\xfd\xfb\x47\x46\xc6\x91\x08\xf2\
-\x63\xa4\xc8\x52\x85\xae\xd8\x0d\xba\xbb\xe3\x74\x74\xc6\x70\x76\
-\x76\x69\xc8\xa8\x0d\xd6\xc9\xf2\x2e\x9e\x6d\x87\xa5\xc5\x45\x26\
-\x27\xbf\x64\xf6\xc1\xfc\x91\x91\x71\x24\x82\xfc\x18\x29\xc5\x62\
-\x91\x50\x28\x8c\x24\x7b\x39\x13\x8f\xd3\x15\x08\x34\xa6\x20\xb5\
-\xd1\xd3\x95\x95\x6f\xb8\xff\xd5\x3d\xbe\x9c\x98\x60\xe2\x8b\x19\
-\x5c\x57\x1c\x19\x19\x47\x2a\xc8\xab\x49\xd9\x40\x9f\xfe\x3b\x48\
-\x1e\x2a\x48\xf4\xf6\x2a\x27\xba\xf3\xf8\x63\x75\xc6\xd2\xfc\x3c\
-\x5f\x7e\xf1\x55\x8d\x0c\x71\xa4\x64\xec\xc5\x91\xde\x51\xae\x76\
-\x05\xd5\xdf\x34\x4d\xfb\x93\x24\x49\xff\xb6\xbd\xbd\x4d\x3a\x9d\
-\x66\x79\x79\x99\xdd\x5d\xf7\xb9\x7b\x87\x34\x52\x3c\x7d\xba\xcc\
-\xdd\xbb\xb7\xf8\xec\xb3\x4f\x99\x98\xd0\x29\x16\x21\x99\xbc\xc2\
-\x87\x1f\xde\xe4\xea\xd5\xab\x52\x5f\x5f\x2f\x9a\xe6\xc7\xe3\xa9\
-\x7f\x9b\xe6\x48\x9b\xd4\x2f\x23\x65\x7d\x7d\x9d\x5c\x6e\x95\xa9\
-\xa9\x29\xca\xe5\x72\x43\xec\xd1\x1f\x47\x05\xde\x10\x82\x34\x5b\
-\x97\xf8\x38\xea\x8c\x86\x10\xa4\xd1\xf7\xe8\x1b\x81\x8c\x63\x15\
-\xa4\xd1\x49\x69\x04\x32\x4e\x44\x90\x46\x23\xa5\x91\xc8\x38\x11\
-\x41\x1a\x8d\x94\x46\x22\xe3\x44\x05\x39\x69\x52\x1a\x91\x8c\x13\
-\x15\xe4\xa4\x49\x69\x44\x32\x1a\x42\x90\xe3\x26\xa5\x91\xc9\x68\
-\x08\x41\x8e\x9b\x94\x46\x26\xa3\xa1\x04\x39\x6a\x52\x9a\x81\x8c\
-\x86\x12\xe4\xa8\x49\x69\x06\x32\x1a\x52\x90\x7a\x93\xd2\x4c\x64\
-\x34\xa4\x20\xf5\x26\xa5\x99\xc8\x68\x68\x41\xde\x96\x94\x66\x24\
-\xa3\xa1\x05\x79\x5b\x52\x9a\x91\x8c\xa6\x10\xe4\xcd\x49\xa9\x10\
-\x0a\x06\x28\x97\x5d\xf2\x6b\x39\x66\x66\xee\x37\x1d\x19\x4d\x21\
-\xc8\x1b\x93\x62\x17\x19\xbe\x74\x01\xc7\xb1\xb8\x7b\xef\xaf\xdc\
-\xfb\xdb\xdf\x9a\x8e\x8c\xa6\x12\xe4\xc7\x48\x71\x4a\x25\xb6\xac\
-\x22\x8e\x63\x71\xe7\xce\x38\xa9\xf9\xf9\xa6\x23\x63\x2f\xa4\xca\
-\x6b\x86\x8a\x1b\x2d\xf6\x2e\x85\x4e\xa5\x52\x23\xb7\x6f\xdf\xde\
-\x27\xa5\x5c\xf6\x10\x3f\x73\x9e\x72\xd9\xc5\x78\x3c\x83\xaa\xbe\
-\x7c\x3a\xe4\xb0\xb7\x1e\xff\x27\x21\x07\x24\x65\x69\x29\x43\x3e\
-\xff\x77\x54\x55\x25\x12\xe9\x60\x70\xb0\x8f\x6b\xd7\x7e\x4e\x32\
-\x99\x6c\x1a\x32\x9a\x52\x90\x57\x79\x8a\xcf\x37\xc9\xec\x6c\x8a\
-\x48\x24\xc4\xc7\x1f\xff\x86\xb1\xb1\x51\x29\x12\xe9\xa8\x4d\xb4\
-\xf8\x9b\xea\xdc\x9a\x52\x90\x3d\x52\x6c\xdb\x9e\x7c\xfc\xf8\xf1\
-\xfe\xb7\xe2\xf8\x7c\x82\x4b\x97\x86\xae\x8c\x8e\x8e\xd2\xac\xf1\
-\xff\x20\xf3\x24\xb2\x5c\xea\x16\x23\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x02\xb8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe4\x03\x15\x03\x2d\x1d\x20\x0c\xa6\x26\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x02\x1c\x49\x44\x41\x54\x48\xc7\xb5\x56\x3d\
-\x8b\x53\x41\x14\x3d\x77\x66\xde\x30\xe3\x66\xc7\x8f\x80\x0a\x1a\
-\xd8\xda\x6a\xf1\x27\x58\xf9\x0f\x02\x2a\x24\x58\xa9\x10\xb0\xb2\
-\xb3\xda\xce\x74\x16\xa6\x10\x16\x52\xe6\x1f\x08\x42\xfe\x81\xc4\
-\x62\xd1\x56\x50\xcb\x04\x5c\x37\xbc\xd9\x79\xf3\x61\xb1\x2c\xc9\
-\x9a\x97\xf8\xe2\x26\x17\xa6\x99\xb9\x73\xcf\xbd\x67\x0e\xf7\x0e\
-\x30\x67\xc6\x98\x8e\xd6\x7a\x24\xa5\x2c\x00\xa4\x75\x96\x94\xb2\
-\xd0\x5a\x8f\x8c\x31\x9d\xf9\x98\x04\x00\xad\x56\x6b\x77\x30\x18\
-\x7c\xb1\xd6\xde\xe5\x35\x0e\xf1\x40\x20\xd6\x23\x42\x0a\xa8\x62\
-\x9c\x38\xd8\x98\xc1\x0f\x3d\xc2\x49\x80\x52\xea\x47\xb3\xd9\xbc\
-\xd7\xef\xf7\x7f\x13\x00\x28\xa5\xbe\x5b\x6b\xef\xe8\x03\x4d\xc5\
-\xf3\x02\xc9\x26\x50\x24\xac\x63\x89\x25\x90\x22\x64\xbd\x0c\xf9\
-\xeb\x3c\x29\xa5\x7e\x5a\x6b\x1b\xdc\x18\xd3\x99\x4e\xa7\x4d\x7d\
-\xa0\xc9\xb5\x1d\xe8\x94\x40\x91\x90\x4e\x13\x10\x50\x69\x11\x3b\
-\xbb\x03\x07\x84\xfb\x01\xea\x86\x22\xfb\xd1\x1a\x63\xcc\x84\xb4\
-\xd6\x23\xc7\xdd\x3e\x7d\x23\xe0\x64\x96\x51\x68\x07\xe0\x4a\x95\
-\xd4\x01\xf6\x86\x81\x76\xe7\x2a\xae\x01\x69\x2f\x41\x06\xf9\x99\
-\xa4\x94\x05\x3d\x24\xe1\xdf\x79\x90\x9f\x39\xf9\x3d\x5f\x99\x1e\
-\xfe\x89\x83\xea\xb3\xbb\x49\x24\x88\x17\x02\xe9\x43\xf2\xc2\x39\
-\x27\xb2\x7a\xf6\x6f\xce\xe5\xb9\x24\x16\x2b\xf8\x7b\x9f\x22\x21\
-\xd6\x23\x0a\x57\x08\x01\x00\x21\x05\x30\xb0\x95\xf1\xe9\x19\x81\
-\xae\x51\x39\x40\x09\x95\xe7\x0a\x14\x55\x69\x60\x8f\x19\xe8\xd6\
-\x7a\xca\x5a\x0b\x00\x13\x20\xe9\x54\x5e\x9d\xa1\xcb\x03\xc4\x6e\
-\x04\x76\x4a\x0e\x14\xc0\xbb\xfc\xf2\x00\x69\x98\x96\x47\xe8\x6e\
-\x82\xa2\x1a\x50\xaa\x83\x9d\x0d\xbd\x01\x3d\x25\xd0\xf5\x12\xae\
-\xb3\x0d\x01\xb0\x27\x0c\x74\x73\x7d\x15\xb1\xca\x9e\x01\xff\x65\
-\xd5\x1f\xf9\x6b\x02\x26\x4b\x0e\xeb\x00\xdd\xa6\xe5\x00\x9c\x38\
-\x12\xd2\x6a\x99\xbe\x8c\x00\x2f\x6f\x15\xf4\x88\xc0\x5f\xf1\x85\
-\x19\x11\x11\x21\xa4\x94\x9e\xc6\x24\x3c\xf3\xab\xfb\xd1\xf1\x0a\
-\xf4\x5f\x8b\xb3\x81\x8f\x39\xa4\x94\x5e\x70\xce\x8f\xdc\xd0\xed\
-\x93\xba\xd8\xae\xd1\x00\x60\xaa\xb5\x6b\x6a\x5c\x4c\x8c\x14\xc1\
-\x0f\x3d\x24\x97\x47\x22\xcb\xb2\xc3\xfc\x38\x7f\xab\x7b\x1a\xae\
-\xed\x40\xe1\xcc\x99\xbf\xe7\xe5\x94\x94\xd9\xd5\x39\x3c\x9e\x20\
-\x7b\x12\xf9\x49\x8e\xcc\x64\x87\x5b\x1f\x99\x5b\x1f\xfa\xd8\xf6\
-\xb7\xe5\x0f\x42\xe8\x03\x74\x35\x38\x74\x9f\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0f\xb7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x28\x3a\xb1\x7d\xf1\x76\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x0f\x1b\x49\x44\x41\x54\x78\xda\xed\x9d\x4b\
-\x53\x1b\xd7\xbe\xc5\xd7\x56\x6f\xa9\xf5\x40\x6f\x10\xc2\x14\xaf\
-\x44\x96\x30\x82\x24\x54\xc0\x0c\x0c\x99\x18\x92\x41\xaa\x32\x71\
-\xbe\xc4\xf9\x0c\x39\xc3\xfb\x19\xee\x37\xb1\x33\x71\x32\xb8\x78\
-\x00\x92\x8d\xcb\x70\x90\x03\x42\x0f\xb0\x0b\x1c\x07\x10\x12\x0f\
-\x3d\x40\xbd\xcf\x20\xe9\xbe\x4d\xd3\x92\x5a\x52\xeb\xe5\x64\x57\
-\x51\x4e\x05\x5b\xc1\x5a\xfd\xeb\xb5\xd7\xfa\xef\x56\x08\x63\x0c\
-\xbd\xbe\x3e\x7e\xfc\x88\xed\xed\xed\x25\x00\x08\x87\xc3\xab\x3e\
-\x9f\xaf\x67\xff\x2e\xb4\x97\x85\xb8\xb8\xb8\xc0\xd1\xd1\x11\x52\
-\xa9\xd4\xbf\x76\x76\x76\xfe\xd7\x64\x32\xc1\x6e\xb7\x13\x83\xc1\
-\x00\xbb\xdd\x0e\x9e\xe7\xff\x11\xa4\x9d\xeb\xe8\xe8\x08\x4f\x9f\
-\x3e\x65\xd1\x68\x14\xe9\x74\x1a\x1e\x8f\x07\x57\x57\x57\xac\x50\
-\x28\x78\x26\x27\x27\x33\xff\x08\xd2\x66\x32\xa2\xd1\x28\x7b\xf1\
-\xe2\x05\x36\x36\x36\x70\x7a\x7a\x0a\xb7\xdb\x0d\x8b\xc5\x02\xc6\
-\xd8\xa9\xd1\x68\x24\x00\xe0\x70\x38\x60\x32\x99\xfe\x11\xa4\xd5\
-\x64\x3c\x7b\xf6\x8c\xbd\x78\xf1\x02\x9b\x9b\x9b\x38\x39\x39\x01\
-\x21\x04\x97\x97\x97\x88\x46\xa3\x38\x3f\x3f\x07\x21\x84\xdd\xdc\
-\xdc\x58\x42\xa1\x50\xa1\xbf\xbf\xff\x1f\x41\xda\x41\xc6\xf6\xf6\
-\x36\x00\x60\x64\x64\x04\x6e\xb7\x1b\xa5\x52\x09\xef\xde\xbd\x43\
-\x22\x91\x40\x24\x12\x01\x80\x3c\xa5\xb4\xa7\x48\xa1\xbd\x4c\x06\
-\x63\x0c\x33\x33\x33\x08\x06\x83\x18\x1d\x1d\xc5\xe9\xe9\x29\x7e\
-\xfd\xf5\x57\xa4\xd3\x69\xbc\x7a\xf5\x0a\xd9\x6c\x16\x00\x7a\x8a\
-\x14\xda\xab\x64\x08\x82\x80\xf1\xf1\x71\xcc\xcf\xcf\xe3\xab\xaf\
-\xbe\xc2\xf0\xf0\x30\x8e\x8f\x8f\x71\x75\x75\x05\x8e\xe3\xb0\xb3\
-\xb3\x83\xbd\xbd\x3d\x38\x9d\xce\x9e\x22\x85\xf6\x1a\x19\x6f\xde\
-\xbc\x01\x63\x0c\xd3\xd3\xd3\x98\x9f\x9f\xc7\xe2\xe2\x22\x02\x81\
-\x00\x2c\x16\x0b\xdc\x6e\x37\x38\x8e\x83\xc7\xe3\x01\x00\x24\x12\
-\x89\x9e\x23\x85\xf6\x0a\x19\xab\xab\xab\xd8\xde\xde\x06\x63\x0c\
-\x63\x63\x63\x98\x9f\x9f\xc7\xc2\xc2\x02\x82\xc1\x20\xc4\x20\x68\
-\x36\x9b\x61\x36\x9b\x01\x00\x99\x4c\x06\x00\x7a\x8e\x14\xda\xed\
-\x64\x3c\x7d\xfa\xf4\x96\x67\x84\xc3\x61\xcc\xcf\xcf\x63\x69\x69\
-\x09\xa1\x50\x48\x7c\xa3\x01\x00\x46\xa3\x11\x76\xbb\x1d\x9f\x7f\
-\xfe\x39\xbe\xfd\xf6\x5b\xb8\xdd\x6e\x00\x40\x32\x99\xec\x19\x52\
-\x68\xb7\x92\x71\x78\x78\x78\xcb\x33\xaa\x91\x21\x2e\x83\xc1\x00\
-\x9e\xe7\xd1\xdf\xdf\x2f\xa5\x74\x91\x94\xdd\xdd\xdd\x9e\x20\xa5\
-\x2b\x05\x39\x3c\x3c\xc4\xb3\x67\xcf\xd8\xea\xea\x2a\xb6\xb6\xb6\
-\x6e\x91\xf1\xcd\x37\xdf\x20\x18\x0c\xde\x22\x43\xb9\x7a\x99\x14\
-\xda\x6d\x64\x68\xf1\x8c\xc1\xc1\xc1\xaa\xaf\x53\x8d\x94\x6e\xf7\
-\x94\xae\x12\x44\xee\x19\x8d\x90\xa1\x95\x94\x6e\xde\x7d\xd1\x6e\
-\x23\xa3\x9a\x67\xd4\x22\x43\x2b\x29\x8c\x31\xec\xee\xee\x22\x1e\
-\x8f\x77\x1d\x29\xb4\x5b\xc8\x10\x3d\x43\xdc\x4d\x89\x39\x63\x69\
-\x69\xa9\x6e\x32\xaa\x91\xb2\xb2\xb2\x02\x97\xcb\x25\x79\xca\xcb\
-\x97\x2f\xbb\x8a\x14\xda\x4d\x64\xc4\x62\xb1\x3b\x64\x84\x42\x21\
-\x34\x3b\x70\x92\x93\x22\x5e\xfd\xf2\xdd\x57\x37\x91\x42\xbb\x81\
-\x0c\xb5\x04\xae\x96\x33\x00\x40\x39\xe1\x24\x84\xd4\x45\x8a\xc3\
-\xe1\x40\x20\x10\x00\x21\x04\x6e\xb7\x1b\x8c\xb1\xae\x22\x85\x76\
-\x03\x19\x6a\x9e\xa1\x07\x19\x5a\x3d\x85\x10\x52\x31\xa7\xb4\x7b\
-\xf2\x48\x7b\x85\x8c\x46\x88\xd0\xe2\x29\xdf\x7d\xf7\x1d\x3c\x1e\
-\x0f\x0c\x06\x83\xb4\xfb\x3a\x3b\x3b\xbb\x45\xca\x27\x2b\x88\x32\
-\x67\xb4\xca\x33\x1a\x21\xe5\x2f\x11\xb0\xb3\xb3\x83\x44\x22\x81\
-\xf5\xf5\xf5\x8e\x78\x0a\x6d\x37\x19\xca\x6e\x4a\x2b\x19\xad\x58\
-\x72\x52\x00\xc0\xe5\x72\x49\x9e\xb2\xb1\xb1\x81\x5c\x2e\xd7\x76\
-\x4f\xa1\xed\x24\x23\x12\x89\xb4\xd5\x33\x1a\xf5\x94\x4a\xdd\x17\
-\x21\x04\x76\xbb\xbd\xa5\xa4\xd0\x4e\x92\x31\x37\x37\x57\x37\x19\
-\xe2\x2e\xab\x96\x97\xd4\xfa\x7d\xf2\xef\x6b\xe9\xbe\x08\x21\xac\
-\x5c\x2e\x93\x50\x28\x04\xaf\xd7\xdb\x9b\x82\xa8\xb5\xb6\x00\x30\
-\x36\x36\x86\xb9\xb9\xb9\x8a\xad\x6d\xbb\x57\x1d\xa4\x30\x8e\xe3\
-\x08\x63\xac\x65\x9e\xd2\x52\x41\xd4\x5a\x5b\x3d\x13\x78\xb5\xa5\
-\x24\x43\x49\x8c\x1a\x39\x5a\x48\x61\x8c\xb5\xd4\x53\x68\xab\xc8\
-\xa8\xd5\xda\x6a\xf1\x8c\x72\xb9\x8c\x52\xa9\x84\x42\xa1\x80\x7c\
-\x3e\x8f\x52\xa9\xd4\xf0\xcf\xc4\x18\x03\xc7\x71\xe0\x79\x1e\x66\
-\xb3\x19\x56\xab\x15\x46\xa3\x51\x33\x29\xed\x6a\x89\x5b\x22\x88\
-\xbc\x9b\x52\xb6\xb6\xf5\x78\x46\xa9\x54\x42\x26\x93\xc1\x87\x0f\
-\x1f\xf0\xee\xdd\x3b\xf1\x0a\x95\xae\x76\xc6\x98\xa6\x5c\x22\xfe\
-\x19\x8b\xc5\x02\xaf\xd7\x8b\xa1\xa1\x21\x8c\x8c\x8c\xc0\xe9\x74\
-\xd6\x45\x4a\x3b\x5a\x62\xda\x2a\x32\x2a\x75\x53\xf5\x78\xc6\xe5\
-\xe5\x25\x12\x89\x04\x76\x76\x76\xb0\xbb\xbb\x8b\xe3\xe3\xe3\x5b\
-\x62\xd4\x4b\x88\xcd\x66\xc3\xe0\xe0\x20\x26\x27\x27\x61\xb7\xdb\
-\x61\xb7\xdb\x61\x30\x18\xee\x88\x52\x8b\x94\x56\x76\x5f\xb4\x15\
-\x64\x54\x4a\xe0\xf5\x7a\x46\x26\x93\xc1\xab\x57\xaf\xb0\xb6\xb6\
-\x86\xbd\xbd\x3d\x9c\x9c\x9c\x34\x75\xcb\xb2\x5a\xad\xf0\x7a\xbd\
-\xc8\x66\xb3\x98\x98\x98\x80\xdf\xef\x87\xd1\x68\x04\xc7\x71\x35\
-\x73\x8a\x48\x0a\x63\x0c\x89\x44\xa2\x65\xdd\x17\x6d\x05\x19\x7a\
-\xe5\x8c\xab\xab\x2b\x1c\x1c\x1c\x20\x1e\x8f\x23\x95\x4a\x49\xbd\
-\x13\xc7\x71\xa0\x94\x82\xe3\x38\xcd\x55\x8a\x28\x08\x63\x0c\xd9\
-\x6c\x16\xa5\x52\xa9\x26\x65\x6a\xa4\x9c\x9e\x9e\x82\x31\x86\x78\
-\x3c\xde\x92\x9c\x42\xf5\x22\xe3\xe7\x9f\x7f\x96\x72\x86\x20\x08\
-\x4d\x27\x70\xc6\x18\xca\xe5\x32\x8a\xc5\x22\x8a\xc5\x22\xca\xe5\
-\x32\x08\x21\xd2\x9b\xe4\x70\x38\x60\x36\x9b\x35\x89\xc2\x18\x83\
-\x20\x08\xe8\xeb\xeb\x83\xdf\xef\xc7\xd0\xd0\x10\xac\x56\xab\x66\
-\x41\x95\xdd\x97\xdb\xed\x06\x21\xe4\x4e\x4e\x11\x04\x81\x04\x83\
-\xc1\xa6\x72\x0a\xed\x46\x32\x94\xa2\x94\xcb\x65\xc9\xc0\x29\xa5\
-\x70\xbb\xdd\xd2\x04\x91\xe7\x79\x70\x1c\x57\xf5\x6a\x97\x9b\xfa\
-\xc0\xc0\x00\x42\xa1\x10\x5c\x2e\x97\xaa\x7f\xd4\xd3\x7d\x11\x42\
-\xa4\xdd\xd7\x5f\x43\x2f\x66\x30\x18\x9a\xca\x29\x54\x2f\xcf\xd0\
-\x72\x6e\xaa\x9e\xa4\x2d\x7f\x33\x08\x21\xd2\xad\x8a\xe7\x79\x8c\
-\x8c\x8c\x60\x79\x79\x19\x33\x33\x33\xe8\xeb\xeb\x83\xc9\x64\xba\
-\xf3\xba\x4a\x81\x18\x63\x30\x1a\x8d\xb0\x58\x2c\x70\x38\x1c\xe8\
-\xef\xef\xaf\xeb\x96\x57\x2b\xa7\xbc\x7c\xf9\x12\x67\x67\x67\x4d\
-\xe7\x14\xda\x2c\x19\x62\xce\x10\x04\x41\xf7\x6e\x4a\x14\x42\x1e\
-\xe6\x28\xa5\x70\x3a\x9d\x08\x04\x02\xf8\xf2\xcb\x2f\xe1\x74\x3a\
-\x2b\xce\x2b\x94\xa2\x18\x0c\x06\xe9\x4b\xfe\xba\x7a\xb4\xc4\x7a\
-\x9d\xfb\xa2\x8d\x92\x51\xcf\x89\x42\xbd\x53\xb7\xc1\x60\x00\xa5\
-\x14\x46\xa3\x11\x94\x52\x50\x4a\xab\xa6\x73\xa5\xc0\xf5\x10\x5a\
-\x8d\x14\xf9\xe4\x51\x99\xe8\x1b\xdd\x7d\xd5\x25\xc8\xf9\xf9\xb9\
-\xaa\x67\x8c\x8e\x8e\x36\x94\x33\x9a\xa1\x46\x7e\xb5\x6b\xf5\x02\
-\xbd\xbb\x2f\xaf\xd7\xab\x3a\xa3\x6f\x86\x14\xda\x28\x19\x8d\x9e\
-\x9b\x6a\xe4\x8d\x93\x5f\xe9\xa2\x41\xcb\x13\x7b\x3b\xc5\xa8\xe4\
-\x29\xca\xd3\x2c\x8d\x92\xa2\x49\x90\x56\x9d\x9b\x6a\x66\x75\xc3\
-\xe3\xdc\xd5\x48\x69\xb4\xfb\xa2\x5a\xc9\xa8\xb7\xb5\xd5\x6b\x6e\
-\x51\xe9\x7b\x72\x42\x3a\xbd\xf4\xec\xbe\x68\x3d\xbb\xa9\x76\xcf\
-\xc0\x7b\xe5\x43\x0d\xf4\x3c\x21\x49\xb5\x92\x51\xef\x0c\x5c\xeb\
-\x7d\x5d\x0b\x41\xbd\x20\x0c\x63\x0c\x94\xd2\xa6\x4f\x48\xd2\x46\
-\x5b\xdb\x4e\xcc\xc0\xe5\x22\x72\x1c\xd7\xf6\xdd\x55\x3d\xa4\x68\
-\xdd\x7d\x29\xcf\x7d\xd1\x46\x5a\xdb\x76\x9c\x0e\x51\x86\x42\xf9\
-\xbf\x97\xe7\x90\x46\x05\xd1\x7b\x87\x26\x7f\x1d\xb5\x13\x92\xf2\
-\xdd\x57\xb5\x73\x5f\xb4\x9d\xdd\x54\xb3\x3e\x22\x76\x5b\xf9\x7c\
-\x1e\x7f\xfc\xf1\x07\xde\xbf\x7f\x0f\xab\xd5\x2a\x05\xc3\x5a\x6f\
-\x96\xd1\x68\x84\xcd\x66\x03\xcf\xf3\xa0\x94\xc2\x60\x30\xb4\xcd\
-\x53\x94\xdd\x57\x25\x4f\xa1\xd5\xba\x29\x3d\x5a\xdb\x46\xaf\x58\
-\xe5\x64\x50\xfc\xf5\xe6\xe6\x06\xc7\xc7\xc7\xd8\xdc\xdc\x44\x3e\
-\x9f\x87\xc5\x62\xd1\x24\x08\x21\x04\x2e\x97\x0b\xe3\xe3\xe3\xf0\
-\xf9\x7c\x6d\x39\x22\xda\xc8\xee\x8b\xaa\x25\xf0\x58\x2c\x06\x00\
-\xd2\x73\xe0\x9d\xf6\x0c\x71\x09\x82\x80\xeb\xeb\x6b\x9c\x9c\x9c\
-\x60\x73\x73\x13\xbf\xff\xfe\xfb\x9f\x57\x15\xa5\x15\x8d\x5f\x5e\
-\x95\xf8\xfd\x7e\x14\x0a\x05\x30\xc6\x60\x32\x99\x5a\x2e\x48\xb5\
-\xb3\xc4\xe2\x8c\x27\x1a\x8d\x82\x10\x92\xe7\x38\x8e\x14\x8b\xc5\
-\x3f\x05\x51\x26\x70\x42\x08\xbe\xf8\xe2\x0b\xcc\xcd\xcd\x61\x71\
-\x71\x11\xf7\xef\xdf\x6f\x8b\x67\xd4\xfa\x1e\x63\x4c\x12\x64\x6b\
-\x6b\x0b\xf1\x78\x5c\xb3\xb1\x13\x42\x30\x32\x32\x02\x41\x10\x60\
-\x34\x1a\xe1\x76\xbb\xe1\x70\x38\xda\x9a\x53\x44\x4f\x11\x4d\x3f\
-\x91\x48\xe0\xf5\xeb\xd7\xc8\x66\xb3\x28\x97\xcb\xec\xb3\xcf\x3e\
-\x7b\x49\x3f\x7c\xf8\x80\x64\x32\xf9\x53\x24\x12\xc1\xc6\xc6\x06\
-\xce\xce\xce\x30\x3a\x3a\x8a\x07\x0f\x1e\xe0\xeb\xaf\xbf\x46\x20\
-\x10\x40\xb7\x7c\x20\x98\x48\x41\xb1\x58\x84\x20\x08\xb8\xb8\xb8\
-\xa8\xcb\x94\x2d\x16\x0b\xb2\xd9\x2c\xf2\xf9\x3c\xca\xe5\x72\xc7\
-\x72\xca\xcd\xcd\x0d\xf6\xf7\xf7\x71\x7c\x7c\x8c\xbd\xbd\x3d\x14\
-\x8b\x45\x0c\x0c\x0c\x20\x97\xcb\xcd\xd1\xd7\xaf\x5f\xff\x4f\x2c\
-\x16\xfb\x29\x9d\x4e\x23\x93\xc9\x80\xe3\x38\x0c\x0c\x0c\x20\x10\
-\x08\x60\x62\x62\x02\x36\x9b\xad\xa5\xbb\x93\x7a\xfd\x85\x10\x02\
-\x9e\xe7\x61\xb7\xdb\x61\x36\x9b\x35\x13\xc2\x18\x83\xcf\xe7\x43\
-\x7f\x7f\x3f\x1c\x0e\xc7\x9d\x23\x40\xed\x58\x62\x4e\xf1\xf9\x7c\
-\x18\x1d\x1d\xc5\xfe\xfe\x3e\xde\xbf\x7f\x8f\xcb\xcb\x4b\xa4\xd3\
-\x69\x5c\x5e\x5e\xfe\x79\xcb\x32\x99\x4c\x70\xb9\x5c\x70\xb9\x5c\
-\x28\x14\x0a\x28\x95\x4a\x38\x3b\x3b\x43\x26\x93\x91\xcc\x4f\xdc\
-\xf7\x77\x72\x89\xc7\x3e\xdd\x6e\x37\xee\xdf\xbf\x0f\x9f\xcf\xa7\
-\x69\x62\x28\xae\xc1\xc1\x41\x04\x83\x41\xf8\xfd\x7e\xe9\x13\x1f\
-\xda\xb9\xae\xaf\xaf\x91\xcb\xe5\x70\x7a\x7a\x8a\x6c\x36\x8b\x62\
-\xb1\x08\x93\xc9\x04\xab\xd5\x0a\xbf\xdf\x0f\xbf\xdf\x0f\x3a\x3b\
-\x3b\xfb\x6f\x8f\xc7\xf3\xef\x42\xa1\xc0\x2c\x16\x0b\x36\x36\x36\
-\xb0\xbf\xbf\x8f\xe7\xcf\x9f\xe3\xf2\xf2\x12\x8f\x1f\x3f\x86\xc9\
-\x64\x82\xcd\x66\x53\xbd\x1a\xdb\x41\x8c\xf8\xda\xf2\x89\xe1\xca\
-\xca\x0a\xa6\xa7\xa7\x2b\x1e\x2a\x50\xfb\xb9\xc4\x73\x59\x4e\xa7\
-\xf3\x0e\xf9\xed\x58\xb9\x5c\x0e\x6f\xdf\xbe\xc5\xda\xda\x1a\x56\
-\x57\x57\x91\x4a\xa5\x40\x29\x45\x38\x1c\xc6\x0f\x3f\xfc\x80\xa9\
-\xa9\x29\x42\xfd\x7e\x3f\x38\x8e\x43\x3e\x9f\x9f\x17\x04\x21\x7a\
-\x71\x71\x81\x74\x3a\x8d\xbd\xbd\x3d\x10\x42\xe0\x74\x3a\xc1\x18\
-\xc3\xf8\xf8\x38\x3c\x1e\x4f\x47\x49\x11\x27\x86\x2e\x97\x0b\x81\
-\x40\x00\xb3\xb3\xb3\x70\x3a\x9d\x30\x9b\xcd\x9a\x08\x31\x18\x0c\
-\x1d\xf9\xf9\x8b\xc5\x22\x72\xb9\x1c\xf6\xf6\xf6\xb0\xbe\xbe\x8e\
-\x68\x34\x8a\x83\x83\x03\x10\x42\x30\x35\x35\x85\x47\x8f\x1e\x61\
-\x6e\x6e\x8e\x04\x83\xc1\x3f\x6f\x59\x0e\x87\x03\xe1\x70\xf8\xa5\
-\xd1\x68\xb4\x00\xc8\x47\xa3\x51\x6c\x6e\x6e\x4a\xc1\x30\x93\xc9\
-\x60\x79\x79\x19\x3c\xcf\x4b\xa4\xd4\xdb\x59\xe9\x49\x94\xc1\x60\
-\x80\xd1\x68\x94\xbe\x6a\xe5\x90\x46\x3a\x36\x3d\x93\xbf\x48\xc6\
-\xfa\xfa\x3a\x9e\x3f\x7f\x8e\x64\x32\x29\xcd\x92\x9e\x3c\x79\x82\
-\x85\x85\x05\x32\x34\x34\xf4\xff\x49\x9d\xe7\x79\x0c\x0c\x0c\x00\
-\x40\xe1\xfa\xfa\x7a\x1e\x40\x34\x97\xcb\x21\x9d\x4e\x23\x1e\x8f\
-\x03\x80\x14\x6a\xba\x85\x14\xe5\xd4\xb0\x1b\x97\x1a\x19\xc9\x64\
-\x12\x82\x20\x20\x1c\x0e\x63\x69\x69\x09\x0f\x1f\x3e\x24\xc1\x60\
-\x50\xbd\x3a\x11\x49\x31\x99\x4c\x84\x10\xc2\x44\x52\xde\xbe\x7d\
-\x0b\x42\x08\xce\xce\xce\xb0\xbc\xbc\x2c\x1d\x56\xae\xe7\x8d\xd0\
-\xd3\x6b\xd4\xa6\x86\x9d\x5e\x5a\xc9\x00\x80\xe9\xe9\x69\x89\x8c\
-\x7b\xf7\xee\x55\x6e\x7b\x65\xa4\xe0\xfa\xfa\x7a\x06\xc0\x96\x92\
-\x14\xf1\xb1\xaf\x4e\x92\xd2\x6d\x62\x68\x21\x23\x95\x4a\x49\x55\
-\xd4\xd2\xd2\x12\x16\x16\x16\x48\x28\x14\xd2\x56\xbf\x3b\x1c\x0e\
-\x4c\x4d\x4d\xfd\xe7\xaf\x8f\x5a\x65\xd1\x68\x14\x6f\xde\xbc\xd1\
-\xe4\x29\x95\x48\x68\x96\x0c\x79\xfb\xdb\x4d\x95\xbb\xda\xdf\x5b\
-\x49\x46\x2a\x95\x02\x00\xcc\xcc\xcc\xe0\xc9\x93\x27\x78\xf8\xf0\
-\xe1\x1d\x32\xaa\x0a\x22\x27\xa5\x54\x2a\xcd\x03\x88\x66\xb3\x59\
-\xa4\xd3\x69\xec\xee\xee\x82\x31\x26\x0d\x5f\x3a\x41\x4a\xb7\x8a\
-\x52\x2a\x95\x2a\x7a\xc6\xcc\xcc\x8c\x44\x86\xdc\x33\x34\x09\xa2\
-\xe6\x29\x72\x52\x94\x9e\x22\x27\xa5\x9d\x6f\x54\xb5\xff\x56\xbb\
-\x1b\x05\x35\x32\x92\xc9\x24\x08\x21\x12\x19\xf2\xdd\x54\x43\x82\
-\xa8\x79\x8a\x48\x8a\xd2\x53\x26\x26\x26\x5a\x4a\x8a\x72\x2e\xd2\
-\x2b\x9e\x31\x33\x33\x83\xc5\xc5\xc5\x3b\xbb\xa9\x86\x04\x51\xf3\
-\x14\xc6\x18\x93\xe7\x14\x41\x10\x70\x7a\x7a\x8a\x95\x95\x15\x55\
-\x4f\x69\x85\x99\x2b\xff\xb9\x9d\x79\xa3\x5a\x02\x6f\xc4\x33\x1a\
-\x12\xa4\x9a\xa7\x88\xa4\x78\x3c\x1e\x10\x42\xba\x22\xa7\x74\xdb\
-\x6e\x4a\x0b\x19\x75\x09\xa2\xf4\x14\xa3\xd1\x68\x61\x8c\xe5\x23\
-\x91\x08\xb6\xb6\xb6\x24\x4f\xc9\x64\x32\x12\x29\xe2\x43\x95\x7a\
-\xe5\x8e\x4e\xee\x9a\x2a\x7d\xbf\x12\x19\xf2\x9c\x51\xcb\x33\x9a\
-\x12\x44\x24\x85\x31\x56\x28\x95\x4a\xdf\x00\xf8\x3f\xb1\xfb\x52\
-\x4b\xf4\x6e\xb7\xbb\xe9\xd9\xb5\x20\x08\x10\x04\x41\xba\x45\xc9\
-\x9f\x17\xe9\x34\x19\xf1\x78\xbc\xe1\xdd\x94\x2e\x82\x88\xcb\xe9\
-\x74\x22\x1c\x0e\xaf\x9a\x4c\x26\x0b\x21\x24\xaf\x47\xa2\x57\xbb\
-\x22\x05\x41\xc0\xcd\xcd\x8d\x24\x80\x38\xc2\x2d\x95\x4a\x2d\x13\
-\x45\xcb\x6b\xea\xb1\x9b\xd2\x55\x10\x9e\xe7\xe1\xf3\xf9\x40\x08\
-\xa9\xda\x7d\x11\x42\x30\x36\x36\xd6\xb0\xa7\x88\x73\x9a\xfe\xfe\
-\x7e\x14\x8b\x45\x98\xcd\x66\x58\x2c\x16\xb8\x5c\x2e\xcd\x8f\xb3\
-\xb5\xca\x33\x22\x91\xc8\x2d\x32\xa6\xa7\xa7\xeb\xda\x4d\xe9\x2a\
-\x88\x9a\xa7\xc8\x5b\xe2\x58\x2c\x26\x91\xf2\xf8\xf1\xe3\xaa\xbb\
-\xaf\x6a\xf7\xea\xbe\xbe\x3e\x04\x02\x01\x64\xb3\x59\x58\xad\x56\
-\x5c\x5d\x5d\x49\x0f\xeb\x78\xbd\x5e\xf0\x3c\xaf\xfb\xc6\xa1\xda\
-\xbc\x47\x4e\xc6\x2f\xbf\xfc\x72\xab\x9b\xfa\xf1\xc7\x1f\xeb\xda\
-\x4d\xb5\x44\x90\x6a\x2d\xb1\x98\xe8\xc5\xc3\x11\x8d\xec\xbe\xec\
-\x76\x3b\x26\x27\x27\x41\x29\xc5\xf0\xf0\x30\x0a\x85\x02\x1c\x0e\
-\x07\x26\x26\x26\xa4\x69\x61\x3b\x76\x72\xca\x04\x1e\x89\x44\x54\
-\x5b\x5b\xb5\x6e\xaa\xad\x82\x68\x21\x05\x80\x6a\xa2\xaf\x95\x17\
-\xc4\xe1\x58\x38\x1c\xc6\xd8\xd8\x18\xae\xae\xae\x20\x08\x02\x28\
-\xa5\xb0\xd9\x6c\xf0\x78\x3c\x30\x1a\x8d\xba\x0b\xa2\xf6\x99\x28\
-\x95\x3c\x43\xdc\x4d\xe9\x41\x86\xae\x82\x28\x49\x21\x84\x44\xd5\
-\x5a\xe2\x7a\x49\x11\x5f\x57\xcc\x40\xdd\x9a\xc0\xf5\x20\x43\x57\
-\x41\x2a\x75\x5f\x91\x48\x44\x33\x29\xdd\xb2\xe4\xc4\xea\x99\xc0\
-\x3b\x22\x88\x5a\xa2\xd7\x83\x94\x4e\x92\xa1\xdc\x4d\x35\x9b\x33\
-\xda\x2a\x48\xad\x96\x58\x7c\xac\xa1\x99\xc9\x63\x3b\xbb\xa9\x48\
-\x24\xa2\x7b\xce\xe8\x88\x20\xb5\x5a\x62\xf1\xe0\x73\xb7\x91\x52\
-\x6d\x06\xae\x57\xce\xe8\x88\x20\x6a\x2d\xb1\xd2\x53\xc4\xc9\xe3\
-\xca\xca\x4a\x55\x52\x2a\xe5\x14\xbd\xe6\x1d\x5a\x26\x7d\xad\xd8\
-\x4d\x75\x44\x10\x35\x4f\x39\x3f\x3f\x47\x2a\x95\xea\xaa\xd3\x2c\
-\x7a\x4c\xfa\x7a\x42\x10\x35\x4f\x11\xe7\x29\xa2\xa7\x34\x93\x53\
-\xf4\xda\x55\xb5\xb2\x9b\xea\x4a\x41\x6a\xcd\x53\x3a\xe5\x29\xca\
-\xd6\x56\x9e\xc0\xdb\xe5\x19\x1d\x11\x44\x2d\xd1\x33\xc6\xf2\xd1\
-\x68\x14\x5b\x5b\x5b\x52\xf7\x95\xcd\x66\x6b\x76\x5f\x7a\xef\xa6\
-\x62\xb1\xd8\xad\x6e\x4a\x79\xa2\xb0\xd5\x9e\xd1\x51\x41\xd4\xe6\
-\x29\xe7\xe7\xe7\xd8\xdf\xdf\x6f\x6b\x4e\xa9\x46\x86\xd8\x4d\x55\
-\x3a\x37\xf5\x49\x09\x22\x2e\xf9\x3c\xc5\x60\x30\xe4\xe5\xe7\xbe\
-\xe4\x9e\xd2\x8a\x9c\x22\x4e\xfa\x62\xb1\x18\x22\x91\xc8\x9d\xd6\
-\xb6\x53\x64\x74\x54\x10\xb5\x79\x8a\xfc\xdc\x97\x9c\x94\x66\xe6\
-\x29\xd5\xc8\x88\x44\x22\x77\x3c\xa3\x93\x64\x74\x54\x90\x5a\xdd\
-\x57\x33\x27\x24\xb5\x24\x70\xb5\xd6\x56\xaf\x79\x46\x4f\x0b\xd2\
-\xae\xee\xab\x13\xad\x6d\x4f\x0a\x52\x8b\x14\x65\xa2\x6f\x74\xf7\
-\xd5\x89\xd6\xb6\xa7\x05\xd1\x42\x8a\x5a\xa2\xaf\x75\xbb\x6a\xc5\
-\xb9\xa9\xbf\x85\x20\x5a\x48\x01\x70\x87\x94\x5a\x4f\xd2\xb6\xe2\
-\xdc\xd4\xdf\x4a\x10\x25\x29\x8c\xb1\x68\x2e\x97\xab\xbb\xfb\xaa\
-\xd6\xda\xb6\xbb\x9b\xea\x69\x41\xaa\x25\xfa\x4a\xa4\x28\xff\xb7\
-\x13\xdd\xd6\x4d\x7d\x12\x82\x54\x4a\xf4\xb5\x4e\x48\x8a\xcf\x81\
-\xb7\xf2\xdc\xd4\xdf\x52\x10\xb5\x44\xaf\x76\x42\x32\x9b\xcd\xde\
-\x4a\xf4\xb9\x5c\x0e\xbf\xfd\xf6\x9b\xea\x33\x7d\xdd\x92\x33\x7a\
-\x5a\x90\x5a\x27\x24\xc5\x0f\x07\x2b\x95\x4a\xf0\x7a\xbd\x38\x39\
-\x39\xc1\xda\xda\x9a\x44\x46\xb9\x5c\x96\x76\x53\xdd\x92\x33\x7a\
-\x5a\x10\xb5\xdd\x97\xf8\x74\xb0\x38\x4f\x31\x18\x0c\x48\x26\x93\
-\x18\x19\x19\x41\x26\x93\xc1\xea\xea\x2a\xf6\xf7\xf7\xbb\xa6\x9b\
-\xfa\x24\x05\xa9\x36\xa3\xdf\xdd\xdd\xc5\xc7\x8f\x1f\x31\x34\x34\
-\x84\x7c\x3e\x7f\xab\x0e\xe9\x86\x6e\xea\x93\x14\x44\x4e\xca\xd4\
-\xd4\xd4\x7f\x28\xa5\x16\x41\x10\xa4\x79\xca\xce\xce\x0e\x0e\x0e\
-\x0e\xa4\x93\x8c\xe1\x70\xb8\x67\x3c\xa3\xa7\x05\xa9\xb4\xfb\xba\
-\xbe\xbe\x46\x3e\x9f\x87\xcd\x66\xc3\x83\x07\x0f\xf0\xe8\xd1\xa3\
-\x9e\xf1\x8c\x9e\x16\x44\xb9\xfb\xe2\x79\x9e\x70\x1c\xc7\xee\xdd\
-\xbb\x87\xc3\xc3\x43\x0c\x0e\x0e\xe2\xfb\xef\xbf\xc7\xec\xec\x6c\
-\xcf\x91\xd1\xd3\x82\x88\xbb\xaf\x52\xa9\x84\xa3\xa3\xa3\xc4\xe5\
-\xe5\xe5\xe7\xe5\x72\x19\xc3\xc3\xc3\x08\x87\xc3\x3d\x49\x86\xb8\
-\xfe\x0b\x0e\x8f\xf3\xeb\xa7\x4f\x01\x3a\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x36\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x16\x27\x3a\x26\x96\xa1\x28\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x07\x9a\x49\x44\x41\x54\x78\xda\xed\x9d\xf9\
-\x6f\x13\x47\x14\xc7\x3f\x5e\x1f\xb9\x48\xd8\x1c\x20\x52\x85\x2a\
-\x3d\x82\x20\xa0\xaa\x6a\x69\xa5\x56\x15\xff\x7b\xa5\x4a\x95\x28\
-\x48\x50\x89\x00\x05\x54\x9a\x00\x09\xe4\x32\xe4\x76\x62\x6f\x7f\
-\x98\xef\x68\x27\x8e\x39\x82\x76\xed\xf1\x66\x9e\xb4\x8a\xb3\x91\
-\x92\x7d\xf3\x99\x77\xcc\xec\xbc\x97\x52\x92\x24\x04\xf1\x47\xa2\
-\x30\x04\x01\x48\x90\x00\x24\x00\x09\x12\x80\x04\x20\x41\x02\x90\
-\x00\x24\x48\x00\x12\x80\x04\x09\x40\x82\x04\x20\x01\x48\x90\x00\
-\x24\x00\x09\x12\x80\x14\x5c\x2a\x7d\xf7\xc4\x71\x5c\xea\x70\xd7\
-\xde\x3b\xf9\xb6\xad\x5e\xef\xab\x37\x70\x25\xef\xdf\x18\x1a\x00\
-\xf6\x2a\x3b\x57\xa4\xab\xd4\x06\x24\x01\x5a\xba\x9a\xce\x65\x7e\
-\xe6\x39\x20\x7f\x81\xc4\x71\xa4\x81\xaf\x00\x35\x60\x08\x18\x01\
-\xce\x01\xc3\xc0\xa0\xee\x57\x1c\xd7\xdb\x02\x8e\x80\x06\xb0\x0f\
-\xec\x02\xdb\xc0\x0e\xb0\xa7\xfb\x47\x40\x93\x7a\xbd\x15\x80\x7c\
-\x9a\x35\x44\x1a\xe4\x21\x0d\xfe\x38\x30\x09\x4c\x01\x17\xf4\x39\
-\x06\x46\x05\xa6\x26\x70\x25\x07\xc6\x2e\xb0\x05\xd4\x81\x75\x60\
-\x4d\xd7\x3a\xb0\xa9\x9f\xed\x03\x87\x40\xcb\x27\xab\xf1\x03\x48\
-\x0a\xa2\x26\x2b\x98\x00\x2e\x01\x97\x81\x2f\x81\x19\x7d\x3f\x0e\
-\x8c\xb5\x59\x48\xb5\x83\x85\x1c\x38\x16\xb2\x05\x6c\x00\x2b\xc0\
-\x0b\x60\x49\xd7\xb2\xee\xef\x08\xa2\x17\x60\x7a\x0f\xc4\xb8\xa6\
-\xaa\xac\x61\x4a\x00\xe6\x74\xcd\x02\xd3\x02\x34\x26\x08\x95\x53\
-\xc6\x90\x23\xc1\xb1\x60\x96\x81\x7f\x81\x27\xc0\x53\x60\x11\x58\
-\x95\x6b\x3b\xec\xb5\x2b\xeb\x1d\x10\x63\x15\x65\xcd\xf6\x49\x0d\
-\xfe\x35\x60\x5e\x30\x66\x74\x7f\xd8\x89\x15\xee\xe0\xd3\xf6\xd9\
-\x95\xa4\xed\x73\x22\x30\x87\xb2\x88\x75\xe0\xa5\xa0\x3c\x00\x1e\
-\x02\xcf\x75\x7f\x57\x31\x26\x39\x3b\x40\x0c\x8c\x9a\x66\xfd\x65\
-\x81\xf8\x1e\xb8\x21\x30\x53\x0e\x88\xa8\x03\x88\xcf\x11\xd7\x7a\
-\x2c\x98\x35\x81\x78\x00\xdc\x03\x16\xe4\xce\xde\x01\x8d\x5e\x40\
-\xe9\x3e\x10\x03\x63\x40\xb3\x7f\x0e\xb8\x09\xfc\x08\x5c\x95\x7b\
-\x1a\x93\x0b\x2b\x67\x00\xe1\x43\x70\x5a\x8a\x1d\x5b\x72\x63\x8f\
-\x80\x3b\xc0\x5d\xe0\x1f\x59\x4b\xa3\xdb\x2e\xac\xd2\x65\x18\x91\
-\xe2\xc0\x45\xe0\x3a\xf0\x0b\xf0\x13\x70\x45\x80\x86\x72\x06\xe1\
-\xba\xba\xb2\x9e\xa5\x2a\x6b\x3c\xaf\x58\x15\xeb\xfb\x05\xe0\x0d\
-\x71\xbc\x4f\xbd\xde\x2c\x1e\x10\x03\x63\x48\x56\xf0\x1d\xf0\x1b\
-\xf0\x33\xf0\x8d\x06\xa1\xd6\x83\xad\x9c\x92\xc6\x60\x58\x59\xdc\
-\xa0\x3e\x8f\xe8\xf3\xdf\xc0\x32\x71\xbc\xdb\x2d\x4b\xa9\x74\xd9\
-\x32\xa6\x81\x1f\x80\x5b\x82\xf1\x95\x66\x66\xa5\x0b\x56\xf1\x21\
-\x89\x1c\x37\x5a\xd5\xe7\x01\x59\x51\x02\xbc\x92\xa5\xb4\xfa\x1f\
-\x48\x1a\xc0\x2f\xca\x32\x6e\xc9\x55\xcd\x6a\x71\xd7\x6b\x18\xed\
-\xd6\x32\x26\xab\x2d\xeb\xbe\xdd\x7a\x59\x26\x8e\x0f\xf2\x0e\xf4\
-\x95\x2e\xc0\xa8\x6a\xe6\xcd\x3b\x6e\x6a\x56\x8a\x97\x3d\x81\xd1\
-\x0e\x65\x54\xcf\xd8\xd4\x22\xf3\x40\x99\xd9\x2a\x71\x9c\x6b\xf6\
-\x55\xc9\x19\x46\x59\x2e\x69\x0e\xf8\xd5\x71\x53\xa3\x1e\xc2\x68\
-\x0f\xf8\xa3\x7a\xd6\x86\x52\x64\xbb\xa2\xdf\x24\x8e\x8f\xf2\x82\
-\x52\xc9\x59\xb1\x61\xad\x33\x6e\x3a\x01\x7c\xcc\x23\x37\xf5\x31\
-\x28\x63\xc0\xd7\x82\x51\x07\xde\x6a\xd5\xbf\x4d\xa7\xad\x7e\x6f\
-\x81\x1c\x77\x55\xd7\xb4\xce\x98\x53\x36\x55\xf5\x1c\x46\xbb\xfb\
-\x1a\xd7\xb3\xdb\xfd\xb0\x3a\xd0\xc8\x2b\x9e\xe4\x65\x21\x91\xf6\
-\xa6\x66\xb5\x02\xbf\xaa\xd5\x77\xad\x4f\x60\xb8\x50\xaa\x7a\xf6\
-\xab\x98\xcd\xc9\x97\xb2\x94\x43\xc5\x98\xcc\x07\x2e\xaf\xac\xea\
-\x82\xac\xe3\x86\xd2\xdd\x81\x3e\x83\xe1\x8e\xd1\x20\xf0\x85\x74\
-\x99\x97\x6e\xb5\xf7\xbc\xbd\xf4\x0c\x88\xf9\x9d\x23\x8a\x1d\xf3\
-\x4e\x46\x55\xe9\x53\x20\x28\x9e\x58\x8b\x9f\xc7\xec\x48\x8f\xe4\
-\x31\x7e\x51\x0e\xd6\x51\xd1\x16\xc4\xb7\xf2\xbd\xfd\xe8\xaa\x3a\
-\xb9\xae\x9a\x74\xb1\xaf\x06\xcc\x22\x32\x63\x2b\x89\x72\x78\x70\
-\xbb\x3d\x72\x05\xb3\x85\x3e\x42\x31\x4e\xb7\x44\xca\x1a\x67\x04\
-\xc4\x6e\xb5\x78\x0d\xc4\xe6\xef\x33\x32\xef\xc9\x3e\xca\xaa\x3e\
-\xd5\x4a\x26\xa4\xdb\x65\x67\x3d\xe5\x21\x90\xd4\x5d\x8d\xcb\xc7\
-\x4e\x6b\x46\x15\xe9\xec\x97\x8d\x8f\xd3\xd2\x71\x3c\x6b\xb7\x15\
-\xe5\x34\x83\xec\xdb\xbe\x5a\x41\xac\xa3\x5d\xc7\xc9\xbc\x74\xcc\
-\x1a\xc8\x90\x52\xc2\x4b\xf8\xb5\x71\x98\x87\x5b\xbe\x24\x5d\x87\
-\xb2\x1c\xc7\x28\xe3\x07\x1d\x51\x26\x32\x91\x47\xc0\xf3\xc8\x6d\
-\x0d\xc8\x5d\x4d\x49\xe7\x72\x56\x6e\x2b\x1b\x20\xe9\x46\xe2\x39\
-\x99\x71\x51\xad\xc3\x4a\x55\x6b\xab\x49\xe9\x5c\xf6\xd5\x42\x86\
-\x49\x5f\x81\x96\x29\xae\xb8\xba\x7a\xeb\xb2\xec\x16\xc3\xa8\xbe\
-\x16\xf5\x64\x7d\xa9\x4d\xd7\x4c\xcf\x01\x64\x0d\xa4\xc6\xc9\xe3\
-\x3b\x45\x85\xd2\xae\xab\x97\x59\x96\x3d\x18\x5d\x2d\x30\x8c\x76\
-\x5d\x33\x8d\x95\x51\x86\x0f\x68\x7f\x5f\x85\xe2\x17\x02\x59\xb7\
-\x55\x26\xe3\x37\x9f\xa1\x82\xca\xc3\x9c\x3a\x0b\xb1\x6f\xce\xec\
-\xe9\xf3\x56\xc1\xc7\xcd\x9e\x7c\x74\x8b\x81\xbc\xb3\x10\x7b\xa0\
-\xd9\x16\xc5\x24\x05\x07\x62\x75\xf5\x16\x88\x3d\x2b\xbb\x8b\xad\
-\xb7\x28\x2e\x94\xc4\xd1\xf5\x20\x4b\x8f\x90\x35\x10\x5b\x87\xb1\
-\x57\x60\xb7\x95\x38\xba\x6e\xeb\x6b\x66\x93\x2f\x4b\x20\x4d\xcd\
-\x98\xb7\xd8\x1a\x8b\xe2\x8a\xd5\x75\x33\x6b\x5d\xb3\x01\x62\x8e\
-\xc3\x34\x35\x63\xd6\x65\x25\x45\x8e\x23\x47\xa4\x15\x59\xdb\xfe\
-\x01\x49\x67\xcd\x0e\xa6\x3c\x6c\x53\xbe\xb5\x88\x40\xac\xbb\xda\
-\x94\xae\x3b\x64\x58\x71\x95\x75\x96\xb5\x87\xa9\x4a\x5a\xc1\x54\
-\x21\x15\xd1\x4a\x9a\xb2\x8e\x15\xe9\x9a\x69\xbc\xcc\x1a\x48\x43\
-\x2e\xeb\x85\xcc\xb9\x51\x30\x20\x56\xc7\x0d\x4c\xe9\xdb\x7a\xd6\
-\x3a\x66\x07\xc4\x98\xec\x91\x4c\x79\x11\x53\x26\xb6\x5b\xb0\x6c\
-\xab\x25\x17\xf5\x4a\x3a\x6e\x60\x2a\x77\xbd\x5c\x87\xb8\xe6\xbc\
-\x84\x29\x3d\x5e\xc7\x1c\xb9\x4c\x0a\x66\x1d\xcf\xe5\x05\x32\x0d\
-\xe8\x79\x00\x49\x14\xf0\x56\x30\x35\xe0\x2f\x0b\x64\x25\x2d\xe9\
-\x62\xcb\xa9\x97\x15\x3f\x12\x7f\x81\x18\xd3\x3d\x94\x65\x3c\xd1\
-\xb5\x56\x80\x58\x62\xf5\x5a\x23\x6d\x38\xb0\x01\x64\x5e\x27\x12\
-\xe5\x34\x93\x76\xe4\x63\x17\xe4\xba\xb6\xfa\x7c\xa1\x68\x5d\xf1\
-\x73\xe9\xb4\x98\x87\xbb\xca\x07\x88\x99\x31\x0d\xe5\xe8\x0b\x98\
-\xa2\xfc\x57\xce\x16\x43\xbf\xae\x3b\x96\x49\xbb\x3e\xac\x92\x53\
-\x63\x81\x28\x47\x25\xb6\x35\xa3\xee\x01\x8f\xfb\xd4\x75\xb9\x2e\
-\xf8\x11\x70\x5f\x16\xbf\x9d\xd7\xe4\xca\x07\xc8\xf1\x58\xf2\x10\
-\xd3\x1d\xe1\x29\x66\x9f\xab\x5f\x16\x8b\x36\x8d\xaf\x2b\x6e\xdc\
-\x95\x85\xac\x91\x63\xdb\x8d\x4a\xce\x0a\xed\xca\xdf\xde\xc1\x14\
-\x7f\x0e\xeb\x6f\x9e\xc7\xdf\xa2\x4f\xfb\xec\x4d\xed\x36\x3c\x03\
-\x6e\x4b\x87\xa5\x3c\x32\xab\xee\x00\xa9\xd7\x13\xe2\xd8\x2a\xf5\
-\x84\xb4\x43\x42\x0d\x53\x48\x39\xe6\x29\x94\xa4\x2d\x88\xff\x05\
-\xfc\x89\xe9\x7f\xf2\x36\x8f\xcc\xaa\x5b\x16\x62\xa1\x34\x64\xe6\
-\x0f\x48\x9b\x8e\x45\xf8\x59\xab\xee\xee\x5a\xff\x27\x18\x7f\x28\
-\x39\x59\xcf\x7a\x55\xde\x7d\x20\xc7\xa1\xac\x62\x7a\x87\x54\x9c\
-\xc0\x3f\x8b\x1f\xad\x35\xdc\x98\xf1\x4e\x96\x71\x1b\xf8\x5d\x81\
-\xfc\x35\x70\x50\x8c\xd6\x1a\x06\x4a\x8b\x38\xde\x53\xfa\xeb\xbe\
-\x8f\x6e\xc8\x7d\xf5\xaa\xf9\x8c\x9b\x15\x1e\x2a\x80\x3f\x73\x2c\
-\xe3\xbe\xd2\xdd\xfd\x62\x35\x9f\x39\x09\xa5\xa9\xdc\xde\x76\x48\
-\xb0\xed\x99\x06\xbb\xec\xc2\x12\xe7\x59\xec\xee\xc2\x6d\xc5\x8c\
-\x07\xc0\x1b\xc1\x28\x60\x7b\xa6\x14\x8a\x5d\x64\x1d\x92\xbe\xf2\
-\xdd\x20\x6d\x60\x36\x4a\xfe\x47\x51\xdd\x06\x66\xdb\x9a\x24\x8f\
-\x95\x49\xdd\x11\x98\xf5\x6e\xb9\xa9\xde\x01\x49\xa1\x1c\x28\xa6\
-\x1c\xc8\x67\x2f\x63\x76\x4f\xaf\x63\xfa\x8b\x74\x6a\xf1\x97\x25\
-\x88\x4e\x2d\xfe\xee\xeb\xeb\x92\x26\xc9\x19\x69\xf1\x67\xa5\x73\
-\x13\xcc\x79\x8e\x37\xc1\x9c\x50\xaa\x5c\xe5\xe4\x11\xd5\xd2\x27\
-\x0c\xbe\x1b\x23\x9a\xa4\x47\x77\x36\x34\x01\xda\x9b\x60\xae\x71\
-\x26\x9b\x60\x1e\x07\xe3\xb6\x89\xbd\x40\xe7\x36\xb1\xb6\x08\xe8\
-\x7d\x6d\x62\x3b\x59\xc1\x69\xda\xc4\xbe\xc1\x76\xfb\x39\xb3\x6d\
-\x62\x4f\x5a\x8b\xdb\x48\x79\x52\x20\x66\x38\xd9\x48\x79\x94\xb4\
-\x05\x5f\xcd\x01\xe4\x66\x4b\x6e\xab\x71\x0b\xe2\xb5\xac\x62\x91\
-\xe3\x8d\x94\xb7\x09\x8d\x94\x3f\x0a\xa6\xca\xe9\x5a\x8d\xdb\x58\
-\x68\x1b\x8e\xb9\xad\xc6\x37\x14\xaf\x6c\xbb\xf1\x4d\x41\xd8\x23\
-\xb4\x1a\x3f\x35\x98\x4e\xcd\xf8\x47\x04\x62\x88\x8f\x37\xe3\xdf\
-\x71\xae\xe3\xcd\xf8\x3d\x03\xe1\x37\x90\x93\x70\xda\xeb\x31\x3e\
-\xe7\xdf\x55\x98\xe3\x9e\xe1\xdf\x55\x64\x0e\xe7\xf4\x59\x56\x1f\
-\xfd\x53\x97\xfe\x02\x72\x06\x24\x54\x50\x05\x20\x41\x02\x90\x00\
-\x24\x48\x00\x12\x80\x04\x09\x40\x02\x90\x20\x01\x48\x00\x12\x24\
-\x00\x09\x12\x80\x04\x20\x41\x02\x90\x00\x24\x48\x00\x52\x74\xf9\
-\x1f\x52\xc4\xf0\x23\xe3\xd4\x09\x3d\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x0d\xe7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x21\x36\x69\x09\x06\x14\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x0d\x4b\x49\x44\x41\x54\x78\xda\xed\x9d\xcb\
-\x73\x53\xe7\x19\xc6\x7f\xc7\xfa\x6c\xeb\x62\x20\xb6\x05\x29\x10\
-\x62\x53\xee\x69\x70\x12\xc3\x18\x1b\xc2\x74\xd1\xcb\xa4\x69\x67\
-\xd2\x55\xf7\xc9\xb2\xdb\xfe\x0b\xdd\xf6\x5f\x68\x96\xdd\x26\x8b\
-\xb6\x9b\x4e\xa7\x57\x0b\x5f\xb0\x09\xc2\x40\x6c\xcb\x38\x05\xe3\
-\x44\xb1\x4c\x84\x2f\x92\x6c\x99\xd3\x85\x9e\x13\x9f\x68\x2c\x21\
-\x09\x49\x3e\x87\xe8\x9b\xd1\x48\x80\x64\x8e\xbe\xe7\xfb\xbd\xef\
-\xf3\xbd\xef\x39\xc7\x96\x6d\xdb\xf8\x7d\x3c\x7e\xfc\x98\xa9\xa9\
-\xa9\x3f\x02\x0c\x0e\x0e\x7e\x74\xec\xd8\x31\xdf\x7e\x17\xe3\x67\
-\x21\x36\x37\x37\x49\xa5\x52\x24\x12\x89\xcb\xb3\xb3\xb3\x1f\x06\
-\x02\x01\xa2\xd1\xe8\x47\xed\xed\xed\x1c\x3c\x78\x90\xce\xce\xce\
-\x96\x20\xcd\x1c\xa9\x54\x8a\xd1\xd1\x51\x7b\x62\x62\x82\xe9\xe9\
-\x69\x82\xc1\x20\xdb\xdb\xdb\xf6\xd6\xd6\xd6\xe9\x0b\x17\x2e\x24\
-\x0e\x1f\x3e\xdc\x12\xa4\x99\x64\xc4\xe3\xf1\x3f\xc4\x62\x31\x26\
-\x26\x26\x48\xcc\xcd\x11\x0c\x06\x09\x06\x83\xd8\xb6\x3d\x6f\x8c\
-\xb1\x00\xdf\x91\x62\xfc\x4a\x46\x2c\x16\xcb\xc4\x62\xb1\x60\x2c\
-\x16\xe3\x41\x22\x41\x66\x7d\x9d\xcc\xc6\x06\x13\x63\x63\xac\xaf\
-\xaf\x03\xd8\xf9\x7c\xde\x77\xa4\x18\x3f\x92\x71\xe7\xce\x9d\xdf\
-\xc7\x62\xb1\xe0\xf4\xd8\x18\xab\x89\x04\xe1\x54\x8a\x13\xc0\x0e\
-\xf0\xe5\xe6\x26\x0b\xc0\x78\x24\x02\xe0\x3b\x52\x8c\x5f\xc9\x18\
-\x1d\x1d\x65\x35\x91\x20\xba\xb6\xc6\x0f\x81\xb7\x81\x2c\xf0\x0f\
-\xe0\x8b\xd5\x55\x6e\x8d\x8f\xf3\x74\x63\xc3\x77\xa4\x18\xbf\x92\
-\x91\x4a\x24\x38\x90\x4a\x31\x00\x5c\x02\xde\x02\x32\xc0\x36\xd0\
-\x91\xc9\x70\x7f\x69\x89\x04\x70\x50\xa4\xb4\xb7\xb7\xfb\x82\x14\
-\xe3\x47\x32\x52\x89\x04\x3d\x6b\x6b\x0c\x00\xef\x01\x17\x81\x6e\
-\x60\x0b\x08\x01\xaf\xea\x73\xb3\xab\xab\x4c\xbb\x48\xd9\xde\xde\
-\xf6\x3c\x29\xc6\x57\x64\x8c\x8f\x93\x4a\x24\x88\xa4\x52\x5c\x04\
-\xae\x8a\x8c\x7e\xc0\x52\x0e\xe9\xd2\xeb\x15\x00\x91\xb2\x00\x8c\
-\x77\x75\xf9\x82\x14\xe3\x17\x32\x62\xb1\x18\x2b\xf3\xf3\xf4\xac\
-\xad\x71\x11\x78\x1f\x78\x07\x38\x22\x01\x2c\x20\x20\x42\xfa\x81\
-\x5f\x00\x51\xfd\x9c\xb9\xd5\x55\x6e\x8d\x8d\xf1\x54\xee\xcb\xcb\
-\xa4\x18\xbf\x90\xb1\x32\x3f\x4f\x44\x39\xe3\xaa\xc4\xe8\x77\x89\
-\x81\x9e\x0d\xd0\x23\x61\x00\x52\xc5\xa4\x78\xdc\x7d\x19\xaf\x93\
-\xe1\xe4\x8c\x6e\xe5\x8c\xf7\xe5\xa8\x8e\x14\x89\xe1\x1e\xc5\xa4\
-\xf4\xba\x49\xf1\xb8\xfb\x32\x9e\x26\x43\x6e\xca\x4d\xc6\xdb\xc0\
-\xc9\x12\x42\xb0\x07\x29\xe1\x3d\x48\x71\xbb\x2f\xaf\x91\x62\xbc\
-\x4e\x46\x4f\x09\x32\x2a\x19\x01\x20\x08\xf4\xc9\x8d\xf5\x96\x70\
-\x5f\x5e\x22\xc5\x78\x92\x8c\x3d\xdc\xd4\x5e\x64\xd8\x7a\xec\xe8\
-\x61\x01\xed\x40\x5b\x99\x9c\xb2\xe2\xf1\x9c\x62\xbc\x46\xc6\xf3\
-\xdc\x14\x45\x82\xe4\xb5\x43\xdf\x94\x10\x87\x80\xce\xe7\xe4\x94\
-\xa8\x87\x73\x8a\xf1\x1a\x19\xe5\xdc\x94\x33\x76\x80\x1c\x90\x06\
-\x96\xb5\xea\xd3\x0a\x4f\xfd\xda\x18\xba\x85\xf1\x93\xfb\x32\x5e\
-\x21\xa3\x1a\x37\x95\x93\x08\xf7\x80\x7f\xeb\x39\xa5\x1c\x31\xac\
-\x52\xca\x9b\xfa\xac\xdf\xdc\x97\xf1\x04\x19\x15\xba\x29\x87\x8a\
-\xc7\xc0\x1c\x30\x0d\xfc\x07\x98\x07\x36\x44\xc0\x8e\x6a\x5a\x59\
-\xe0\xb4\x26\xbd\xcb\x95\x5b\xbc\xee\xbe\x8c\x57\xc8\xa8\xc4\x4d\
-\xa5\x81\x3b\xc0\x4d\x60\x14\xb8\x2f\x52\xb6\x14\xae\xf2\xc0\x67\
-\x0a\x63\xf3\x0a\x77\x23\x12\xe6\x80\x2b\x84\x79\xd9\x7d\x99\xfd\
-\x24\x63\x6a\x6c\x8c\x95\x44\x82\xae\x12\x6e\xea\x99\x26\x79\x5d\
-\x2b\x39\x01\x4c\x00\x53\xc0\x6d\xe0\x29\x70\x58\x13\xda\x2b\x61\
-\xfe\x27\x91\x36\xf5\xef\xdb\xc0\x13\xfd\xcc\x23\xa2\xa5\xa3\x8c\
-\xfb\xba\xb7\xcf\x55\x62\xb3\x9f\x64\xac\x14\x91\x51\xec\xa6\x1c\
-\x31\x12\x40\x4c\x21\xea\x1e\xf0\xb5\xc4\xba\x00\x5c\x07\xde\x90\
-\x30\x4f\x80\x1b\xa2\x68\x01\x98\x94\x40\xb7\xf5\xbe\xb7\x81\x33\
-\x12\xa2\x5c\x4e\xd9\xcf\x2a\xb1\xd9\x97\x9c\xa1\x7d\x46\x57\x51\
-\xce\x70\xdc\xd4\x96\x72\xc2\xd7\xc0\x17\x40\x1c\xf8\xaf\x84\x59\
-\xd3\x24\x9e\x54\xa5\xf7\xc7\xc0\x39\x0a\xe5\xf7\x27\x5a\xfd\x11\
-\x4d\xf6\x02\xf0\x48\xb4\x58\x7a\xde\xd0\x67\x7b\x5c\xef\x2b\xeb\
-\xbe\x9a\x5c\x25\x36\xfb\x99\x33\x2e\xba\x72\xc6\xab\x2e\x37\xb5\
-\xa1\xc9\xfc\x0c\xf8\x17\x70\x17\xf8\x52\x89\xb9\x4f\x0e\x6a\x04\
-\x38\x0f\xfc\x40\x16\xb7\x43\x93\x3b\x04\x1c\x05\x4e\x89\xa8\x51\
-\x7d\x36\x26\x5a\xe6\x81\x41\xe0\x8a\x16\x40\xb0\x88\x94\xf7\xf7\
-\xb9\x4a\x6c\x9a\x4a\x86\xdc\x54\x57\xd1\x3e\xa3\x4f\xef\x5f\x07\
-\x56\x45\xc5\x6d\x25\xef\x71\xc5\xf7\x43\x5a\xd9\x83\xb2\xb5\x97\
-\x81\xe3\xfa\x02\x6d\xae\x2f\x13\x56\x02\x3f\xa4\x67\x4b\x21\xec\
-\xa1\x1e\x59\x51\xe6\xe4\x96\xe3\x0a\x55\xe1\x32\xee\xab\x99\xfb\
-\x14\xb3\x1f\x64\x14\xbb\x29\x14\xa6\x96\x25\xc0\x14\x70\x4b\x2b\
-\x7a\x43\x2b\x7e\x44\x62\xfc\x48\x02\x76\xeb\xe0\xf7\xaa\x6b\x85\
-\x34\xd1\x61\x3d\xdf\x15\x29\xf7\x44\x4b\x0a\x58\x14\x69\xef\x02\
-\x03\xc0\x09\xe0\x60\x09\xf7\xd5\xcc\x7d\x8a\xd9\x2f\x32\xde\xd6\
-\x24\xe4\xb4\xaf\x58\xd6\xc4\xc5\xf4\xbc\xa4\x9f\x75\x4a\x13\x77\
-\x5d\x13\xf7\xba\x56\x7f\xb9\xd1\xae\x47\x44\xc9\xfe\x15\x7d\xd1\
-\x2e\x91\xf7\x48\xa1\xeb\xa9\xca\x2f\xeb\x45\x42\xbf\xa2\x70\x58\
-\x6e\x9f\xd2\xa8\x9c\x62\x9a\x4d\xc6\x2f\x5d\x64\xe4\xb4\x62\x67\
-\xb4\xe3\x8e\x2b\x5c\x6d\x29\x7c\x9c\x05\xae\x49\x90\x13\xae\xd0\
-\x52\xe9\x68\xd3\xde\xe3\xb8\x92\x7f\x9f\xf6\x24\x53\xc0\x98\x16\
-\xc2\xdf\x64\x16\x16\x14\x0a\x2f\x01\xc7\x5c\x65\x98\x66\xbb\x2f\
-\xd3\x50\x32\x8a\xdc\xd4\x35\xe5\x8c\x1f\x00\xdf\x68\xa5\xde\x57\
-\x78\x8a\x89\x92\x0e\x51\x70\x5e\xef\x1d\x56\xee\x08\x69\xd5\x57\
-\x33\x9c\xb6\xee\x41\x3d\x9c\xbc\x12\x91\x58\xf7\x81\xaf\x14\xbe\
-\x76\xe4\xc2\xf2\x72\x6d\xaf\x8a\xa8\x33\x4d\x76\x5f\xa6\x99\x64\
-\xbc\xa3\x10\xf2\x8d\x1c\xd0\xa4\x56\xea\x03\x85\x8d\x28\xbb\xa7\
-\xf4\xbc\xa1\x15\xed\x58\xd2\x40\x1d\x8e\x2f\x02\xfc\xd0\x15\x92\
-\xee\x69\x21\xdc\x57\xc2\x4f\x4a\x1c\x27\xac\x9e\xd3\x31\xf5\xeb\
-\xf8\x0f\x4b\xe4\xd9\x06\xba\x2f\xd3\x8c\x9c\x31\xac\x4d\xdc\x01\
-\x51\x31\xab\x0d\xdc\xa4\x62\xfa\x9a\x42\xd8\x51\xad\xc8\x33\x7a\
-\x1d\x56\x5d\x2a\x53\xe7\x90\x1a\x02\x5e\xd3\xe6\x72\x55\xff\x7f\
-\x52\x21\xec\x1b\x3d\xb6\x55\xaa\x39\x2b\xa2\xfb\xf5\xd9\x55\xc0\
-\xca\x64\xb8\xdb\x20\xf7\x65\x1a\x49\xc6\x5b\x72\x53\x17\x14\x93\
-\x3f\x97\xdb\x99\xd6\xeb\x25\x7d\xe9\x83\x5a\xb9\xa7\x24\xda\x86\
-\x92\x6e\x40\x49\xb7\xde\xc3\x52\xc8\xda\x14\x2d\xfd\xda\x84\x6e\
-\x2b\xd1\xdf\xd7\x9f\xef\x69\xbf\x32\x28\x6a\xfa\x81\x5f\xb9\x9c\
-\xe1\xe7\x0d\x70\x5f\xa6\x91\x64\x5c\x56\x3e\xb0\x95\xb8\x6f\x6b\
-\xc7\x7d\x4f\xb1\x7b\x43\x93\x73\x40\xb1\x3b\xad\xf0\xb5\xac\xc9\
-\xd9\x69\x90\x20\x6d\x12\xdb\x72\x51\xb2\xa5\xff\xcf\x69\x76\x39\
-\x3d\x96\x6d\x11\x9a\xd7\x82\x39\xac\x90\xba\x0c\xd8\xaa\x7d\xd5\
-\x93\x14\x53\x6f\x32\x7a\x5d\xfb\x8c\x13\xfa\x52\xe3\xc0\x3f\x65\
-\x67\x57\xb4\x0a\x73\xfa\x19\xb6\xde\x73\x57\x0e\xab\x53\x93\xf5\
-\xac\x41\x62\x50\xd4\x5f\xb1\x75\x2c\x6b\x12\xc2\x7d\x5c\x4f\x64\
-\x38\x92\xae\xea\xf1\x35\x89\xf2\x53\xd7\x8e\x7e\xb6\x8e\xa4\x98\
-\xba\x90\x51\xe4\xa6\x1c\xeb\xb8\x25\x2b\x3b\xa1\x30\xf5\xd8\xb5\
-\xab\xa6\xa8\xcf\xf1\xb5\x1e\x5e\x1a\x79\x09\xf5\x48\x8b\xe6\xa9\
-\x16\xca\x5b\x0a\xb1\xef\x38\xc7\x5c\x47\x52\xcc\x8b\x92\xe1\xee\
-\x81\x3b\x6e\xea\x98\x42\xd2\x1d\x91\xf1\x40\x5f\xee\x55\xd9\xda\
-\xac\x56\x5d\x1e\xef\x0e\x4b\x79\xef\x88\x26\xc9\x71\x86\xce\xa6\
-\xf2\x37\x12\xe5\xe7\xae\x9c\x52\x0f\x52\xcc\x8b\x92\x51\xdc\x03\
-\x7f\x4b\x5f\x24\x29\x2b\xbb\x2e\x11\xce\xc9\x76\x6e\x48\xac\xb4\
-\x5e\x7b\x79\x44\x94\x37\xba\x44\xc2\x13\x11\xb3\xa2\xc5\x74\x48\
-\x61\xab\x43\x7f\x67\xd7\xa1\xf6\x65\x6a\x25\xa3\x5c\x0f\x7c\x4b\
-\xb6\xf5\xac\x26\x3e\xa0\x5a\x94\x51\x4c\x9e\x96\xef\xf7\xf2\xb0\
-\x35\xe1\x17\x65\xc3\x77\x94\xfc\x1f\xc8\x06\x1f\x91\x60\x46\xc6\
-\xe5\x3d\x57\x9f\xe5\x45\x6a\x5f\xa6\x26\x32\x9e\xd3\x03\xb7\x74\
-\xc0\x67\xd9\x6d\x97\x5e\x92\x5b\x79\xa4\xc4\xdd\x86\xf7\x47\x87\
-\xca\x26\xa7\x64\x8f\xb3\xda\xac\x86\x94\xd8\x1d\x03\xd2\x5d\xa2\
-\x9f\x52\x4b\x8f\xde\xd4\x4a\x46\xb9\x1e\x78\xa7\xab\xee\x74\xcc\
-\x75\xd0\x0f\x85\xfa\xb6\x92\xa3\xd7\xc7\x33\x97\xeb\x8a\xca\x9e\
-\xbf\xee\xfa\x3e\x01\x57\x79\xa6\x5e\x3d\x7a\x53\x0d\x19\xcf\xeb\
-\x81\x3b\x23\x20\x31\xc2\xae\x83\xc3\xe5\xfb\xfd\x20\x86\x13\xb6\
-\x9c\x33\x22\xc3\x12\x25\x5a\xc2\x00\xd4\xab\x47\x6f\xaa\x21\xe3\
-\x79\x3d\xf0\x4a\xdd\xcb\xcb\x3a\xea\xd1\xa3\x37\xb5\xec\x33\x8a\
-\x7b\xe0\xad\x51\x9a\x94\x6a\xab\xc4\xa6\x9a\x9c\x51\xaa\x07\xde\
-\x1a\xa5\x49\xa9\xb6\x47\x6f\xaa\xa9\x4d\x95\xba\x72\xa9\x35\x4a\
-\x93\x52\x6d\x8f\xde\xd4\xea\xa6\x5a\x62\x54\x46\x4a\xb5\x3d\x7a\
-\x93\xcf\xe7\xc9\x66\xb3\xac\xae\xae\x32\x33\x33\xf3\x9d\x3b\x24\
-\x74\x55\x79\xe5\x52\x6b\x54\x96\x53\x2c\x91\xf2\xa0\x88\x94\x5c\
-\x2e\x87\xc9\xe5\x72\x2c\x2f\x2f\x33\x39\x39\x69\x8f\x8f\x8f\x13\
-\x13\x19\x51\xe5\x8c\x5f\xa8\x1c\x72\xa4\x25\x46\x5d\x72\xca\x7b\
-\xca\x29\x46\xee\xeb\x33\x17\x29\xcb\xcb\xcb\x09\xb3\xb8\xb8\xc8\
-\xc2\xc2\xc2\x9f\x6e\xdc\xb8\xc1\xcd\x89\x09\x16\x75\x87\x84\xf3\
-\x2a\x77\xb4\xdc\x54\x63\x48\x49\x02\x99\x4c\x86\xf8\xd2\x12\x77\
-\x81\xae\x48\x84\x87\x0f\x1f\x9e\x32\xb1\x58\xcc\x5e\x5c\x5c\x64\
-\x72\x72\x92\xc4\xec\x2c\xdb\x6b\x6b\x1c\xa3\x70\xda\xcd\x35\xa9\
-\xd9\x12\xa3\xbe\xa4\x1c\x57\x1a\xc8\x53\x68\x74\x7d\xb1\xba\xca\
-\xc4\xc4\x04\x77\x66\x66\x68\x6b\x6b\x6b\x23\x10\x08\x60\x8c\x21\
-\x10\x08\x60\x59\xd6\xb7\x3b\xd4\xbc\x9e\x1b\xd9\x2c\xfa\x3e\x0d\
-\x5b\x73\xb9\x53\x34\xaf\x96\x65\x7d\xab\x81\xb9\x7e\xfd\xba\x75\
-\xe2\xc4\x89\x0f\xf3\xf9\xfc\x1f\x3b\xda\xdb\xb9\x1b\x8f\xf3\x30\
-\x99\xe4\x6f\xaa\xe3\xfc\x84\xdd\x93\x92\x5b\xa4\xbc\xd8\x70\x1a\
-\x5e\x8b\x14\xee\x5a\x34\x4a\xa1\xac\xdf\x13\x8d\x72\xed\xda\x35\
-\x5e\xef\xeb\xc3\xf4\xf7\xf7\x13\x0c\x06\x3f\xce\x64\x32\x1f\x00\
-\x1f\xe4\xb6\xb6\x78\x0c\x7c\x9e\x4e\x63\x72\x39\xba\xf5\xc3\x8e\
-\xb1\x7b\xae\x6c\x4b\x98\xea\x86\x73\x9d\xcb\x0a\x85\xe6\xd6\x38\
-\x85\x33\x6e\x96\xc2\x61\xba\xa3\x51\xce\x0e\x0c\x30\x72\xf5\x2a\
-\xa7\x4f\x9f\xfe\x9d\x09\x04\x02\xf4\xf6\xf6\x72\xf9\xf2\xe5\x5f\
-\x47\x22\x91\x0f\x80\x4f\x6e\x76\x74\x30\x1f\x8f\x33\x9d\x4c\xf2\
-\x4c\x56\xed\xa7\x14\xce\xfa\x33\x2d\x41\x6a\x26\x63\x0e\xf8\x0b\
-\x85\x73\xd1\x12\x40\x38\x1a\xe5\xca\xf5\xeb\x5c\x19\x19\x61\x78\
-\x78\xd8\x3a\x7e\xfc\x38\xa6\xad\xad\x8d\x70\x38\x4c\x38\x1c\x06\
-\xf8\x34\x93\xc9\x7c\x0c\x7c\xb8\x29\x52\x66\xd2\x69\xec\x5c\x8e\
-\x1e\x09\xd1\x22\xa5\x36\x32\xe6\x24\xc4\x0d\xe0\x41\x38\x4c\x50\
-\x64\x5c\x19\x19\x61\x68\x68\xc8\x3a\x79\xf2\x24\x3d\x3d\x3d\xdf\
-\xdd\xa9\x77\x77\x77\x33\x38\x38\xf8\x51\x28\x14\xfa\xd4\x4d\xca\
-\x67\xc9\x24\x16\x85\x16\xa6\x43\x4a\x2b\xa7\x54\x4e\xc6\xbc\xc8\
-\xb8\xa1\xd7\xe1\x68\x94\xe1\x77\xdf\x65\xf8\xea\x55\x86\x87\x87\
-\xad\x93\x27\x4f\xd2\x55\x28\x3a\x7e\x57\x90\x50\x28\x44\x28\x14\
-\x2a\x49\x0a\xad\x9c\x52\x53\xce\xb8\xe1\x22\x23\x1c\x8d\x72\x7e\
-\x60\x80\xe1\xab\x57\xbf\x43\x86\x33\xf6\xac\xf6\x96\x22\xe5\x56\
-\x32\x89\x4d\xa1\xb7\xfc\xb3\x16\x29\x15\x91\xf1\xe7\x22\x32\x46\
-\x5c\x39\xc3\x4d\x46\x59\x41\xca\x91\x72\x57\xa4\xf4\xb4\x48\xa9\
-\x89\x8c\xe2\x9c\x51\x3c\xca\x76\x0c\xcb\xe5\x14\x44\x4a\xcb\x7d\
-\xd5\x87\x8c\x8a\x04\xa9\x86\x94\xe3\xdf\x63\x52\xea\x41\x46\x45\
-\x82\x54\x43\xca\xf7\x39\xa7\xd4\x83\x8c\xaa\x04\x69\xe5\x94\xc6\
-\x93\x51\x95\x20\xad\x7d\x4a\xe5\x3b\xf0\x5a\xc9\xa8\x49\x90\xd6\
-\x3e\xa5\xf4\x0e\x7c\x0c\x58\x08\x87\x89\x44\xa3\x9c\xab\x81\x8c\
-\x9a\x04\xa9\x66\x9f\xf2\x32\xbb\xaf\x52\x3b\xf0\x48\x34\xca\x70\
-\x8d\x64\xbc\x90\x20\xb5\xba\xaf\x97\x3d\x67\xbc\x08\x19\x2f\x24\
-\x48\xad\xee\x0b\xfc\xd7\xe8\xb2\x5d\xc7\x5c\x4f\x37\xd5\x10\x41\
-\x2a\x25\xc5\xa9\x12\xe3\x33\x52\x2c\x97\x39\x71\x2e\x47\x98\xad\
-\x93\x9b\x6a\x88\x20\x95\xba\xaf\x6f\x28\x9c\x6d\x81\xcf\x92\xbc\
-\x73\xdb\xd9\x00\x85\xee\xe9\x57\xc0\x5f\x29\x74\xfa\xea\x4d\x46\
-\x5d\x05\x29\x49\x8a\x65\x31\x93\x4e\xd3\x96\xcd\x7e\x7b\x1b\xa5\
-\x1d\xe5\x94\x6e\x76\x4f\xf5\xf7\xaa\x18\x87\x24\xc8\x1a\x85\xcb\
-\xb8\x1d\x47\xd5\x08\x32\xea\x2a\xc8\x5e\xa4\x58\x96\xf5\xc9\xcd\
-\xce\x4e\xe6\xe2\x71\x6e\x67\xb3\x74\x52\xb8\x2a\xd7\x50\xb8\xba\
-\x6a\x4d\xc2\xd8\x1e\xcc\x2b\xce\x65\xd3\x27\x24\xc8\x43\x11\x71\
-\x9f\x42\xa7\xaf\xb3\x01\x64\x34\x44\x10\x87\x14\xcb\xb2\xbe\x25\
-\x65\x23\x97\xe3\x2b\xdb\xe6\x4e\x3a\xcd\x4a\x2e\x47\xbf\x56\xde\
-\x00\xbb\x67\x5d\xd8\x1e\x25\xc4\x50\xb8\x46\xf2\x01\xba\x3c\x3a\
-\x1c\x26\x14\x8d\x72\xa6\x01\x64\x34\x44\x10\x37\x29\x97\x2e\x5d\
-\xfa\x28\x14\x0a\x7d\x6a\xdb\xf6\x27\x53\x1d\x1d\x2c\xc4\xe3\xa4\
-\x93\x49\xf2\x14\xce\x84\x7c\x97\xdd\x9b\x0a\x78\x6d\x38\x37\x6a\
-\x4e\x50\x38\x3b\xc4\xb9\xa5\xd3\x01\xf5\xc0\x87\x1a\x40\x46\x43\
-\x05\x09\x06\x83\x1c\x3d\x7a\x14\xdb\xb6\x77\x49\xd9\xda\x62\x19\
-\xf8\x32\x9d\x26\x9a\xcb\xb1\xc9\xee\xaf\x27\x8a\x78\x24\xd9\x3b\
-\xfb\x0c\xe7\xae\x76\x29\xd1\xf1\x95\x76\xe0\x67\x06\x06\x18\x6a\
-\x10\x19\x0d\x15\xa4\x94\xfb\x9a\x92\xfb\xba\xa9\xb3\x59\x92\x14\
-\xce\xfb\x3a\xe5\x91\xda\x97\x73\x17\xd4\x39\xb9\xa9\x1b\x7a\x1d\
-\x8a\x46\xb9\x52\xa2\x07\xee\x2b\x41\xf6\x72\x5f\x1b\xda\xa7\xc4\
-\xd3\x69\x9e\xe5\x72\xbc\xa2\xb0\xb5\x9f\xb5\xaf\xe2\x1d\xf8\x98\
-\xac\xed\x82\x72\xc6\xb9\x32\x3d\x70\x5f\x09\x52\x69\xed\x2b\xc5\
-\xfe\xf6\x53\x4a\xed\xc0\xeb\x51\x9b\xf2\xa4\x20\xcf\xab\x12\xdb\
-\xfb\xd4\x4f\x69\x46\x6d\xca\x93\x82\x54\x53\xfb\x6a\x66\x95\xb8\
-\x19\xb5\x29\x4f\x0b\xe2\x95\x1e\x7d\x23\x3a\x7d\xbe\x14\xa4\x1a\
-\x52\x1a\x99\x53\xbc\x48\xc6\xbe\x0a\xb2\x5f\x3d\x7a\x2f\x93\xb1\
-\xaf\x82\x54\x42\x4a\x23\x7a\xf4\x8d\xe8\x81\xbf\x54\x82\x34\xab\
-\x47\xdf\xc8\x1e\xf8\x4b\x25\x48\xa5\xfb\x94\x17\x75\x5f\x8d\xec\
-\x81\xbf\x94\x82\x34\xca\x7d\x79\x71\x9f\xe1\x0b\x41\x1a\xe5\xbe\
-\xbc\xec\xa6\x7c\x21\x48\xbd\xdc\x97\x1f\xdc\x94\x2f\x04\xa9\x97\
-\xfb\x2a\x76\x53\x7e\x20\xc3\xd3\x82\x3c\xaf\x47\x4f\x36\xbb\xa7\
-\xfb\x72\x7e\x15\xeb\xd7\xec\x56\x6d\xfd\x42\x86\xa7\x05\xd9\x8b\
-\x14\x77\x8f\xfe\x56\x36\xbb\xa7\xfb\x2a\xce\x19\x63\x3e\x22\xc3\
-\x17\x82\x94\xea\xd1\x3f\xb6\x6d\xee\xa6\xd3\x58\xb9\x1c\xbd\x22\
-\xa3\x97\x42\xdb\xf5\x01\x85\xeb\xc0\xc7\x7c\x46\x86\x2f\x04\x71\
-\x93\xe2\xee\xd1\xbb\x73\x4a\x80\xc2\x6f\xe9\x79\x87\xc2\x6d\x68\
-\xff\x4e\xe1\x97\x89\xf9\x8d\x0c\x5f\x09\xb2\x57\x8f\x7e\x53\x3d\
-\xfa\x99\x74\x9a\xb5\x5c\x8e\xb4\x08\x19\xa5\x70\x87\x04\xbf\x91\
-\xe1\x2b\x41\xca\xb9\xaf\x44\x3c\xce\x64\x32\xc9\x3c\x85\xb3\x45\
-\x56\x80\xee\x32\xd7\x81\xb7\x04\x69\x82\xfb\x9a\x6b\x6b\xe3\x8b\
-\xb5\x35\x02\x81\x00\x3d\x3d\x3d\x9c\x7f\xf3\xcd\xa6\xf5\xc0\xbf\
-\xd7\x82\x94\x72\x5f\xe1\x70\x98\xd9\xd9\x59\x82\xc1\x20\x43\x43\
-\x43\x0c\x0d\x0d\x71\xe5\xca\x15\x5f\x91\xe1\x6b\x41\x1c\x52\xb2\
-\xd9\xec\xa7\x0b\x0b\x0b\x3c\x7a\xf4\x88\xa5\xa5\x25\x22\x91\x08\
-\x7d\x7d\x7d\x9c\x3e\x7d\xfa\xb7\xaf\xbd\xf6\x9a\xaf\xc8\x70\xc6\
-\xff\x01\x8d\x90\x8c\x67\xb3\x4a\x6f\xf8\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x14\xf7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x26\x2b\x45\x4e\xfc\x0a\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x14\x5b\x49\x44\x41\x54\x78\xda\xed\x9c\x49\
-\x73\x5a\xd7\xba\x86\xdf\xbd\x59\x88\x1e\x84\x40\x2d\x8d\x64\x09\
-\x4b\x96\x2d\x27\x71\x6c\xc7\xc7\x15\xc9\x95\x4a\x2a\x1e\x24\xc3\
-\x54\xaa\x4e\xe2\xba\x83\x3b\x3c\x77\x98\xfb\x07\xf2\x0b\x32\xbd\
-\x3f\xe1\x4c\xef\xc0\x4e\x95\x53\x29\x27\x95\x63\xc7\x8d\xac\x06\
-\x59\xb1\xec\xa8\x31\x88\x5e\xf4\xb0\x37\x6c\xda\x7d\x07\x39\x7b\
-\x5d\xc0\x80\x04\xda\x92\x20\x95\x35\xb4\x25\x40\xfb\x5b\xcf\x7a\
-\xdf\xaf\x59\x30\xa2\x28\xa2\xdf\xd7\xc1\xc1\x01\x36\x37\x37\x6f\
-\x03\xc0\xc2\xc2\xc2\x0f\x23\x23\x23\x7d\xfb\xb7\x90\x7e\x0e\x04\
-\xc7\x71\x08\x87\xc3\xf0\x78\x3c\x7f\xdf\xda\xda\xfa\xa7\x52\xa9\
-\x84\xc1\x60\x60\x18\x86\x81\xd1\x68\x84\x4a\xa5\xfa\x2b\x20\xa7\
-\xb9\xc2\xe1\x30\xee\xdf\xbf\x2f\x2e\x2f\x2f\x63\x77\x77\x17\x26\
-\x93\x09\x1c\xc7\x89\xb9\x5c\xee\xf2\xc5\x8b\x17\x37\x87\x87\x87\
-\xff\x0a\xc8\x69\x91\x11\x89\x44\xb0\xb2\xb2\x22\x3e\x7c\xf8\x10\
-\xab\xab\xab\x88\x46\xa3\x30\x99\x4c\x50\xa9\x54\xa8\x56\xab\x2f\
-\x94\x4a\x25\x03\xa0\xef\x48\xe9\xcb\x80\x44\x22\x11\xdc\xbf\x7f\
-\x5f\x7c\xf8\xf0\x21\xd6\xd7\xd7\x71\x70\x70\x00\x86\x61\x90\xcb\
-\xe5\xb0\xba\xba\x0a\x8e\xe3\xc0\xb2\xac\x58\x2e\x97\x5d\xf3\xf3\
-\xf3\xbb\xfd\x44\x0a\xe9\x47\x32\x9e\x3f\x7f\x2e\x3e\x7c\xf8\x10\
-\x9b\x9b\x9b\xa8\x54\x2a\x98\x98\x98\x80\xd5\x6a\x45\xa9\x54\x82\
-\xcf\xe7\xc3\x9b\x37\x6f\xf0\xec\xd9\x33\x88\xa2\xb8\xd3\x6f\xa4\
-\x90\x7e\x26\xa3\x5c\x2e\xe3\xc2\x85\x0b\x98\x9b\x9b\xc3\xf9\xf3\
-\xe7\x91\x4e\xa7\xf1\xe0\xc1\x03\xec\xed\xed\x61\x7d\x7d\x1d\xe9\
-\x74\x1a\x00\xc4\x52\xa9\xd4\x37\xa4\x90\x7e\x21\x23\x1c\x0e\x53\
-\xcd\xd8\xdc\xdc\x44\xa9\x54\x82\xdd\x6e\xc7\xb5\x6b\xd7\x70\xe5\
-\xca\x15\x4c\x4f\x4f\x23\x95\x4a\x21\x9f\xcf\x43\xa1\x50\x60\x6b\
-\x6b\x8b\x92\x02\x60\x87\x10\xd2\x17\xa4\xf4\x45\x40\x24\x37\x55\
-\x4b\xc6\xec\xec\x2c\xae\x5d\xbb\x86\x5b\xb7\x6e\x61\x76\x76\x16\
-\x7a\xbd\x1e\x16\x8b\x05\x0a\x85\x02\x16\x8b\x05\x00\xb0\xbd\xbd\
-\x0d\xb7\xdb\x8d\x4c\x26\x03\x51\x14\xc5\x52\xa9\xd4\xf3\xee\x8b\
-\xf4\x3a\x19\xb5\x6e\x6a\x73\x73\x13\xe5\x72\x19\x36\x9b\x0d\xd7\
-\xae\x5d\xc3\xdf\xfe\xf6\x37\x5c\xb8\x70\x01\x63\x63\x63\x00\x00\
-\x8d\x46\x03\x8d\x46\x03\x86\x61\x90\x48\x24\x00\x00\x2f\x5f\xbe\
-\xc4\xde\xde\x1e\x8c\x46\x23\x00\xf4\xbc\xfb\xea\xe9\x80\x34\xd3\
-\x8c\xb9\xb9\x39\x5c\xbd\x7a\x15\x1f\x7d\xf4\x11\x2e\x5c\xb8\x80\
-\xc1\xc1\x41\xfa\xf3\x0a\x85\x02\x5a\xad\x16\x53\x53\x53\xf8\xf4\
-\xd3\x4f\x61\x36\x9b\x21\x8a\x22\x76\x76\x76\xb0\xbe\xbe\x8e\x4c\
-\x26\x03\x86\x61\x7a\xda\x7d\x91\x5e\x25\xa3\x51\x33\x6a\xc9\xb8\
-\x71\xe3\x06\x25\x83\x61\x18\xfa\x7b\x2c\xcb\x82\x65\x59\x0c\x0d\
-\x0d\xd1\xdd\x9f\x4c\x26\x01\xa0\x6f\x34\xa5\x27\x03\xd2\x4c\x33\
-\xe6\xe6\xe6\x70\xed\xda\x35\x4a\x86\xc9\x64\x6a\xf9\xfb\x0a\x85\
-\x02\x3a\x9d\x0e\xe7\xce\x9d\xa3\xa4\x00\xc0\xce\xce\x0e\xd5\x14\
-\x00\x3d\x49\x0a\xe9\x57\x32\xda\x15\x45\xfb\x99\x14\xd2\x8f\x64\
-\x88\xa2\x58\x77\x54\x01\xa0\x01\xaa\xfd\xf7\xa3\x90\xd2\x6b\xee\
-\x8b\xf4\x0a\x19\x47\x75\x53\x9d\xb4\x0b\x5a\x91\xc2\x30\x4c\xcf\
-\xba\xaf\x9e\x08\x48\x33\x37\x25\xe5\x19\x8d\x6e\xaa\x91\x0c\x69\
-\xb5\xfa\xf7\x46\x52\x6e\xdf\xbe\x4d\x49\xa9\xcd\x53\x7a\xc5\x7d\
-\x91\x5e\x20\xa3\xb6\x36\xd5\x2e\xcf\xe8\x76\xd5\x92\xa2\x56\xab\
-\x7b\x5a\x53\x48\x2f\x91\x51\x2a\x95\xea\xf2\x8c\xf9\xf9\xf9\xba\
-\x3c\xe3\xb8\xab\x59\x9e\xd2\x48\xca\x59\xbb\x2f\xd2\x2b\x64\x94\
-\x4a\xa5\x3a\x37\x35\x3f\x3f\x7f\x6c\x32\xfa\xd1\x7d\x91\x5e\x22\
-\xa3\x99\x66\x9c\xc4\x6a\xd4\x94\xa1\xa1\xa1\x9e\x21\x85\xf4\x1a\
-\x19\x72\x68\x46\x3f\x6b\x0a\xe9\x75\x32\x9a\xe5\x17\x7f\x66\x4d\
-\x21\xfd\x4a\x86\x28\x8a\xa8\x56\xab\x28\x97\xcb\xa8\x56\xab\x34\
-\x68\xd2\xee\x57\x28\x14\x87\x06\xb1\x19\x29\x52\x95\xf8\xac\x48\
-\x21\xbd\x4a\x46\xbb\xfc\x42\x0a\x46\xa1\x50\x00\xcf\xf3\x28\x16\
-\x8b\x74\xc7\xab\x54\x2a\x0c\x0c\x0c\x40\xa5\x52\x81\x10\xd2\x77\
-\xa4\x90\x7e\x23\x03\x00\xf2\xf9\x3c\xa2\xd1\x28\xa2\xd1\x28\x22\
-\x91\x08\x78\x9e\x07\x00\x28\x95\x4a\xe8\x74\x3a\x0c\x0f\x0f\xc3\
-\xe9\x74\x62\x70\x70\x10\x2c\xcb\x76\x44\xca\x59\xbb\x2f\xd2\xab\
-\x64\xb4\x5b\x89\x44\x02\xcb\xcb\xcb\x70\xbb\xdd\xd8\xde\xde\x46\
-\x3c\x1e\x07\x00\xa8\xd5\x6a\x0c\x0e\x0e\x62\x61\x61\x01\xb7\x6f\
-\xdf\x86\x46\xa3\x81\x4a\xa5\x82\x42\xa1\xe8\x1b\xf7\x45\xfa\x89\
-\x0c\x49\x33\xa2\xd1\x28\xdc\x6e\x37\x7e\xfd\xf5\x57\xec\xee\xee\
-\xd2\x73\x5f\xa5\x52\xc1\x68\x34\xa2\x58\x2c\x62\x6e\x6e\x0e\xa3\
-\xa3\xa3\x30\x9b\xcd\xd0\x68\x34\x7d\xe3\xbe\xc8\x69\x91\x71\xe1\
-\xc2\x85\xba\x4e\x5f\xab\xaa\x6d\xbb\x55\x2e\x97\xc1\xf3\x3c\x22\
-\x91\x08\x5e\xbf\x7e\x8d\xdf\x7f\xff\x1d\xa9\x54\x0a\x82\x20\x00\
-\x00\x8a\xc5\x22\xf2\xf9\x3c\x1d\x05\xb2\xdb\xed\xb4\xad\xdb\xad\
-\xfb\x6a\x55\xfb\x3a\x29\x52\x88\xdc\x64\x34\x9b\x0e\xb1\xd9\x6c\
-\xb8\x7a\xf5\x6a\xd7\x55\x5b\x69\x15\x8b\x45\xc4\xe3\x71\x84\x42\
-\x21\x04\x83\x41\x44\xa3\x51\x94\x4a\x25\xea\xb2\xca\xe5\x32\x0a\
-\x85\x02\x62\xb1\x18\x3c\x1e\x0f\x26\x27\x27\x31\x3e\x3e\x4e\x1f\
-\x68\xb7\x79\x8a\x28\x8a\x48\x24\x12\x10\x45\xf1\xc4\x49\x91\x35\
-\x20\x9d\xf4\x33\xba\x59\xf9\x7c\x1e\xc1\x60\x10\x7e\xbf\x1f\x99\
-\x4c\x06\xa5\x52\xa9\xe9\x6b\xf1\x3c\x8f\x37\x6f\xde\x60\x72\x72\
-\x12\x0b\x0b\x0b\xb2\xe7\x29\x27\xd9\x79\x24\x72\x6a\xc6\xca\xca\
-\x8a\xf8\xe8\xd1\xa3\xae\x3b\x7d\x87\xad\x5c\x2e\x87\xfd\xfd\x7d\
-\x78\xbd\x5e\x70\x1c\x07\x86\x61\xa0\x56\xab\x69\xce\x21\x11\x92\
-\xcb\xe5\xe0\xf7\xfb\xe1\xf5\x7a\x91\x4a\xa5\x50\x2c\x16\x41\x08\
-\x01\xcb\xb2\x3d\x5f\xfb\x22\x72\x6a\xc6\xa3\x47\x8f\x0e\x75\x53\
-\xdd\x66\xdc\xa2\x28\x82\xe3\x38\xec\xed\xed\xe1\xcd\x9b\x37\xe0\
-\x79\x1e\x2a\x95\x0a\x56\xab\x15\x5a\xad\x96\xce\xf6\x46\xa3\x51\
-\x08\x82\x80\x50\x28\x04\xbf\xdf\x8f\x68\x34\x8a\x6c\x36\x0b\x83\
-\xc1\x80\x81\x81\x81\x63\xd7\xbe\x4e\x9a\x14\x22\x07\x19\xcf\x9f\
-\x3f\x17\x1f\x3d\x7a\x84\x17\x2f\x5e\xd4\x69\x86\x5c\xb5\xa9\x4a\
-\xa5\x82\x62\xb1\x88\x64\x32\x09\x9f\xcf\x87\x40\x20\x80\x7c\x3e\
-\x0f\x8d\x46\x03\xbb\xdd\x0e\xab\xd5\x0a\x96\x65\x11\x8b\xc5\xc0\
-\xf3\x3c\x92\xc9\x24\xd2\xe9\x34\x0e\x0e\x0e\x10\x0a\x85\x10\x8b\
-\xc5\x30\x30\x30\xd0\x75\x40\x0e\xeb\x3c\xca\x49\x0a\x91\x83\x8c\
-\x5a\x37\xd5\xaa\xd3\x77\x9c\x55\x2a\x95\x90\x4a\xa5\x70\x70\x70\
-\x40\xc5\xbc\x50\x28\x60\x68\x68\x08\x2e\x97\x0b\x53\x53\x53\x60\
-\x59\x16\x5e\xaf\x17\x7e\xbf\x1f\xf1\x78\x1c\xc5\x62\x11\xe9\x74\
-\x1a\x3e\x9f\x0f\x7e\xbf\x1f\x66\xb3\x19\x06\x83\x41\xd6\x2a\x71\
-\x33\xf7\x75\xdc\x1e\x3d\x39\x2e\x19\xcd\xf2\x8c\x5a\x37\x25\x47\
-\x51\x50\x10\x04\x44\x22\x11\x7a\x04\x71\x1c\x87\x6a\xb5\x0a\x83\
-\xc1\x80\xa9\xa9\x29\x5c\xba\x74\x89\xee\xe2\x95\x95\x15\xb0\x2c\
-\x8b\x6a\xb5\x8a\x6c\x36\x0b\xaf\xd7\x8b\xfd\xfd\x7d\x4c\x4f\x4f\
-\x9f\x68\x95\x58\xae\x1e\x3d\x91\x8b\x8c\x76\x13\x85\xc7\x5d\x92\
-\x98\x7b\x3c\x1e\x64\x32\x19\x54\xab\x55\x10\x42\x60\x34\x1a\xe1\
-\x74\x3a\x71\xfe\xfc\x79\xb0\x2c\x0b\x9e\xe7\x61\x32\x99\x30\x30\
-\x30\x80\x62\xb1\x48\xdd\x96\xd3\xe9\xc4\xf5\xeb\xd7\x3b\xce\x7b\
-\xba\xc9\x53\x8e\x3b\x21\x49\xe4\x24\xa3\xb6\xd3\x27\xc7\x65\x52\
-\x51\x14\xa9\x98\x7b\x3c\x1e\xea\xae\x58\x96\x85\x4e\xa7\x83\xc5\
-\x62\xc1\xd8\xd8\x18\x26\x26\x26\xc0\x30\x0c\x42\xa1\x10\xac\x56\
-\x2b\x0c\x06\x03\xd2\xe9\x74\x9d\x4d\x4e\x26\x93\xc8\xe7\xf3\x1d\
-\x95\x52\x3a\x25\x45\x8e\x3c\x85\xc8\x41\xc6\x51\xe6\xa6\xba\xe9\
-\x6f\x88\xa2\x88\x4a\xa5\x42\x8f\x1e\xaf\xd7\x8b\x5c\x2e\x47\xdd\
-\xd5\xd8\xd8\x18\x86\x86\x86\x60\x32\x99\xc0\x30\x0c\xcc\x66\x33\
-\xc6\xc6\xc6\x30\x3c\x3c\x0c\x41\x10\x20\x08\x02\x12\x89\x04\xc2\
-\xe1\x30\x22\x91\x08\x52\xa9\x54\x47\xa5\x94\xc3\x3e\x5b\xb3\x3c\
-\x85\x61\x98\x63\x65\xf4\x44\x2e\x32\xe4\xc8\x33\x9a\xb9\x2b\x9e\
-\xe7\x11\x8f\xc7\xe1\xf7\xfb\x11\x0e\x87\x21\x08\x02\xf4\x7a\x3d\
-\xc6\xc7\xc7\x61\xb3\xd9\xe8\xce\x63\x18\x06\x26\x93\x09\x0e\x87\
-\x03\x36\x9b\x0d\xb1\x58\x0c\x1c\xc7\x81\xe3\x38\xc4\x62\x31\x04\
-\x02\x01\x84\xc3\xe1\xae\x4a\x29\xad\x16\xc3\x30\x50\x2a\x95\xd4\
-\x7d\x31\x0c\x83\x54\x2a\xd5\x34\x4f\x39\xaa\xa6\x10\xb9\xc8\x38\
-\x6a\x9e\xd1\xc9\x19\x5e\x28\x14\x10\x8f\xc7\x11\x0c\x06\x11\x0e\
-\x87\x91\x4c\x26\x51\x2c\x16\xa1\xd3\xe9\x30\x35\x35\x85\xa9\xa9\
-\x29\xe8\x74\x3a\xfa\x9a\x3a\x9d\x0e\x33\x33\x33\xf0\xf9\x7c\xd8\
-\xdd\xdd\xc5\xc1\xc1\x01\xca\xe5\x32\x32\x99\x0c\xd5\x12\xa9\xe0\
-\xd8\x29\xb9\x8d\xff\xdf\x6c\x42\xf2\xb0\xda\xd7\x51\x6e\x72\x91\
-\xb3\xa8\xda\x76\xe2\xae\xa4\x04\x2f\x99\x4c\x42\x10\x04\x30\x0c\
-\x03\x83\xc1\x00\xa7\xd3\x09\x87\xc3\x01\xad\x56\x4b\x7f\x5e\xab\
-\xd5\xc2\xe9\x74\x62\x72\x72\x12\x46\xa3\x11\x0a\x85\x02\x95\x4a\
-\x05\x1c\xc7\xd1\x23\xef\xe2\xc5\x8b\xa8\x56\xab\x60\x18\x46\xb6\
-\xb6\x70\xb3\xda\x57\x63\x46\xbf\xbc\xbc\x0c\x86\x61\x0e\xd5\x14\
-\x72\xda\xfd\x8c\x4e\x34\x24\x97\xcb\xd1\x07\xc9\xf3\x3c\x58\x96\
-\x85\x52\xa9\xac\x3b\x9a\x6a\x8f\x1f\x8d\x46\x83\xf1\xf1\x71\x38\
-\x1c\x0e\xaa\x15\xf9\x7c\xbe\xae\xe4\x92\xcd\x66\x51\xa9\x54\xde\
-\x6a\xf1\xca\x41\x76\xbb\xce\xa3\x74\xe7\xb1\x5a\xad\xb6\xcd\x53\
-\x48\x2f\x92\x21\xb5\x68\x33\x99\x0c\x3c\x1e\x0f\xf6\xf7\xf7\x91\
-\xcb\xe5\x40\x08\x81\xc9\x64\xc2\xf0\xf0\x30\xc6\xc7\xc7\x61\xb5\
-\x5a\xeb\xb2\x6f\xa5\x52\x09\xb3\xd9\x8c\x91\x91\x11\x8c\x8c\x8c\
-\x60\x70\x70\x10\x95\x4a\x85\xe6\x31\x81\x40\x00\xf1\x78\x1c\x3c\
-\xcf\x43\xa7\xd3\x75\x5c\xdb\x3a\x0a\x29\x92\xb9\x68\xd5\xa3\x5f\
-\x5e\x5e\x6e\x9b\xa7\x90\xd3\xec\xf4\x1d\x75\xa7\x55\xab\x55\x14\
-\x8b\x45\xa4\x52\x29\x1a\x10\x9e\xe7\xa1\x56\xab\x31\x3a\x3a\x0a\
-\xbb\xdd\x8e\xe1\xe1\x61\xe8\xf5\x7a\x10\x42\x28\x75\x0a\x85\x02\
-\x1a\x8d\x06\x66\xb3\x19\x13\x13\x13\x18\x1d\x1d\x05\xc7\x71\xc8\
-\x64\x32\x48\x26\x93\x88\x44\x22\x08\x85\x42\x88\xc7\xe3\x20\x84\
-\x40\xa9\x54\xca\xb2\x79\x1a\xb5\x85\x10\x72\xa4\x1e\x7d\x33\x52\
-\x48\x2f\x91\x51\x5b\x2a\xc9\x64\x32\x88\x46\xa3\x08\x85\x42\xb4\
-\x54\x62\xb1\x58\x60\xb7\xdb\xe1\x70\x38\xe8\xb7\x36\xd4\xba\x3a\
-\xc9\xf5\x18\x8d\x46\x7a\xa4\x05\x83\x41\x9a\x83\x24\x12\x09\xec\
-\xef\xef\x23\x10\x08\xc0\x68\x34\x42\xaf\xd7\x9f\xc8\xe7\x3f\xac\
-\x4a\xdc\x2e\xa3\x27\x87\x55\x6d\x1b\x3b\x7d\x27\x39\x51\x58\xeb\
-\xae\x22\x91\x08\x82\xc1\x20\x62\xb1\x18\xb2\xd9\x2c\xca\xe5\x72\
-\x9d\x68\x4b\x62\xde\x8c\x38\x69\x77\x4e\x4d\x4d\xe1\xe5\xcb\x97\
-\x6f\x55\x8b\x1d\x0e\x07\x9c\x4e\x27\xe4\xe8\x5f\xb4\xbb\xa7\xd2\
-\xae\x47\x2f\x65\xf4\x8d\xa4\x90\x86\x7e\x46\xbe\xb6\x9f\x21\xdd\
-\x03\x3f\x2d\x32\x6a\xc5\xbc\xb6\x9f\x51\x2e\x97\xa1\x50\x28\x60\
-\x32\x99\x30\x35\x35\x05\xa7\xd3\x59\xe7\xae\x1a\x97\x64\x41\x67\
-\x66\x66\xe8\x2e\x95\xda\xbf\x5e\xaf\x97\x96\x60\x2a\x95\xca\x91\
-\xa6\x52\xe4\xcc\xe8\x25\x4d\x79\xf5\xea\x15\x3c\x1e\x4f\x9d\xa6\
-\x14\x0a\x85\x3f\x02\x52\x4b\xc6\xda\xda\x1a\xca\xe5\x32\xe6\xe7\
-\xe7\xe9\x3d\xf0\xb9\xb9\xb9\x53\x21\xa3\xb6\xe3\xb7\xb7\xb7\x87\
-\xbd\xbd\x3d\xf0\x3c\x4f\xdd\x8b\xd5\x6a\xc5\xf4\xf4\x74\xd3\x80\
-\xd4\xee\x4c\xad\x56\x8b\xc9\xc9\x49\x84\x42\x21\x8c\x8f\x8f\xe3\
-\xcd\x9b\x37\xc8\x64\x32\x10\x04\x01\x81\x40\x00\x3e\x9f\x0f\xe9\
-\x74\x1a\x85\x42\xe1\xad\x52\xca\x71\x27\x25\x9b\xfd\x5e\x63\xed\
-\xcb\x62\xb1\x60\x60\x60\x00\xdb\xdb\xdb\xd8\xd8\xd8\xa0\xa4\x4c\
-\x4f\x4f\x07\x49\x20\x10\xc0\xce\xce\xce\x37\xcf\x9e\x3d\xa3\xdf\
-\xaa\x63\xb3\xd9\xb0\xb0\xb0\x80\x0f\x3e\xf8\x00\x73\x73\x73\xa7\
-\x46\x46\xb5\x5a\x45\xa5\x52\x41\x3a\x9d\x86\xd7\xeb\x85\xcf\xe7\
-\x43\x2e\x97\xa3\x62\xad\xd1\x68\x40\x08\x41\xb9\x5c\x46\x2a\x95\
-\x42\x36\x9b\xad\x7b\x88\x8d\x0f\x45\x7a\x10\x5a\xad\x16\x3c\xcf\
-\xd3\x44\x33\x1c\x0e\x23\x1a\x8d\x22\x93\xc9\x60\x70\x70\xf0\xd8\
-\xb5\xad\x4e\x49\xa9\x56\xab\x08\x85\x42\x48\xa7\xd3\xd8\xdc\xdc\
-\xc4\xd6\xd6\x16\xcc\x66\x33\xa2\xd1\xe8\x04\x59\x5e\x5e\xfe\xe5\
-\xf5\xeb\xd7\x4b\xaf\x5f\xbf\x46\x34\x1a\x85\x42\xa1\xc0\xc4\xc4\
-\x04\x2e\x5f\xbe\x8c\xf9\xf9\x79\x49\x7c\x8e\xec\x36\xba\xc9\xc8\
-\x6b\x4b\x25\xb9\x5c\x0e\x89\x44\x02\x7e\xbf\x1f\xa1\x50\x08\x82\
-\x20\x80\x65\x59\x0c\x0c\x0c\xd0\x3f\xe4\xf7\xdf\x7f\x7f\xeb\x3d\
-\x1a\xc5\x9d\x65\x59\xf8\x7c\x3e\x94\x4a\x25\x28\x95\x4a\xb0\x2c\
-\x8b\x72\xb9\x0c\x8e\xe3\x10\x8f\xc7\x11\x08\x04\x10\x89\x44\xa0\
-\x56\xab\xe9\x71\xd2\xcd\xe7\x6e\x45\x54\xab\x3b\x8f\x5a\xad\x16\
-\xa3\xa3\xa3\xb8\x78\xf1\x22\x62\xb1\x18\xbc\x5e\x2f\xe2\xf1\x38\
-\x5e\xbd\x7a\x85\x70\x38\xfc\xc7\x91\x25\x89\x8f\x56\xab\x45\xa5\
-\x52\xa1\xe7\x2d\xc7\x71\x30\x18\x0c\x50\xa9\x54\x27\x7a\xd6\x4a\
-\xab\x58\x2c\xd6\x15\x03\xa5\x52\x09\x21\x04\xa5\x52\x09\xb1\x58\
-\x0c\x6e\xb7\x1b\xa1\x50\xa8\x6d\xcd\x4c\x0a\x88\x34\xd9\x58\x28\
-\x14\x50\xa9\x54\xa8\x9d\x4e\xa7\xd3\xd8\xdf\xdf\x87\xcf\xe7\xa3\
-\xf9\xca\x69\x9d\x00\x82\x20\xd0\x67\x2b\x8d\x2f\x69\xb5\x5a\x9a\
-\x3b\x91\xeb\xd7\xaf\xdf\xb2\x58\x2c\x13\xd9\x6c\x36\x40\x08\xa1\
-\x2d\xc9\x1f\x7f\xfc\x11\xf9\x7c\x1e\x1f\x7d\xf4\x11\x34\x1a\x0d\
-\x94\x4a\x65\x5b\xb4\xe5\x08\x56\x3e\x9f\xa7\x67\xbc\x54\x2a\xa9\
-\x54\x2a\xb4\x14\x51\x2c\x16\xe9\xae\x3e\x2c\x20\x92\x5b\xcb\x64\
-\x32\xf4\xb8\xaa\xb5\xf7\x92\xdb\x9a\x9b\x9b\x93\x25\xff\x68\xf5\
-\x19\x6a\x7f\x4e\x6a\x07\xbc\x78\xf1\x02\x3f\xfd\xf4\x13\xdc\x6e\
-\x37\x78\x9e\xc7\xf9\xf3\xe7\xf1\xe5\x97\x5f\xe2\x9d\x77\xde\x61\
-\x88\xcd\x66\x03\xcb\xb2\xc1\x6c\x36\xfb\x9d\x28\x8a\xdf\xe4\xf3\
-\x79\x84\x42\x21\xbc\x7a\xf5\x0a\x2c\xcb\xd2\x23\x4b\xaa\xac\x9e\
-\x24\x29\xb9\x5c\x0e\x3e\x9f\x0f\xfb\xfb\xfb\xc8\x64\x32\x28\x97\
-\xcb\xb4\xe6\xc4\x30\x0c\x04\x41\xa8\x7b\xb0\xad\x82\xd2\xec\xf8\
-\x90\x5e\x43\x14\xc5\xba\x52\x4a\x3a\x9d\xee\x7a\x2a\xe5\xa8\xab\
-\x5c\x2e\x43\x10\x04\xf8\x7c\x3e\xac\xaf\xaf\xe3\xc9\x93\x27\xd8\
-\xdc\xdc\x04\xc7\x71\x98\x9d\x9d\xc5\xd2\xd2\x12\x6e\xde\xbc\xc9\
-\x2c\x2c\x2c\xfc\x71\x64\x99\xcd\x66\x5c\xb9\x72\xe5\xbf\x35\x1a\
-\xcd\xff\x02\xf8\x65\x65\x65\x05\xdb\xdb\xdb\x58\x5b\x5b\x43\xb5\
-\x5a\x45\x2a\x95\xc2\xc7\x1f\x7f\x4c\x49\x39\x89\xa0\x88\xa2\x58\
-\x67\x4b\x73\xb9\x1c\x3d\x7a\x54\x2a\x15\x4c\x26\x13\xd4\x6a\x75\
-\x4b\xdd\x68\x17\x90\x42\xa1\x40\x1b\x56\x52\x29\x25\x14\x0a\xc1\
-\xe7\xf3\xd1\xc1\x08\x9d\x4e\xd7\xd1\x10\xc4\x51\xff\x7e\x69\x23\
-\x05\x83\x41\xac\xaf\xaf\xe3\xee\xdd\xbb\x70\xbb\xdd\x48\x24\x12\
-\x70\xb9\x5c\xf8\xea\xab\xaf\xb0\xb8\xb8\xc8\x38\x1c\x8e\xff\xcf\
-\xd4\xd5\x6a\x35\xc6\xc7\xc7\x01\xe0\x5f\xf9\x7c\xfe\x3b\x00\xdf\
-\x70\x1c\x87\x60\x30\x48\x13\x2b\x29\xfd\x9f\x98\x98\x80\xc9\x64\
-\x92\x35\x28\x95\x4a\x85\x0e\x32\x48\x99\x74\x3e\x9f\xa7\xd3\xec\
-\x63\x63\x63\x70\xb9\x5c\xb0\x58\x2c\x5d\xbd\x67\x32\x99\xc4\xde\
-\xde\x1e\xc2\xe1\x30\xd2\xe9\x74\xdd\xd0\x44\x38\x1c\x46\x22\x91\
-\x80\x52\xa9\xec\x7a\x2a\xa5\x5d\xc5\xa1\x96\x8c\xc7\x8f\x1f\xc3\
-\xed\x76\x23\x95\x4a\x61\x66\x66\x06\x8b\x8b\x8b\xf8\xf0\xc3\x0f\
-\x99\xda\x61\xbe\xba\x4c\x5d\x22\x45\xad\x56\xdf\x17\x45\xf1\xbe\
-\x44\x8a\xdb\xed\x06\xc3\x30\x48\x26\x93\x94\x94\x81\x81\x01\xd9\
-\xec\xa2\xd4\xb3\x88\x46\xa3\xd4\xfd\x08\x82\x00\x8d\x46\x03\x9b\
-\xcd\x86\x2b\x57\xae\xe0\xd3\x4f\x3f\xc5\xcc\xcc\x4c\x57\x01\xf1\
-\x7a\xbd\xf8\xf9\xe7\x9f\xb1\xb6\xb6\x86\x9d\x9d\x1d\x24\x93\x49\
-\x14\x0a\x05\xa4\x52\x29\xf8\xfd\x7e\x04\x83\x41\x98\x4c\x26\x59\
-\x4b\x29\xa2\x28\x52\xcd\x58\x5b\x5b\xc3\xf7\xdf\x7f\x5f\x47\xc6\
-\xd7\x5f\x7f\x8d\xc5\xc5\x45\xc6\xe9\x74\xb6\xae\xf6\xd6\x90\xf2\
-\x43\x3e\x9f\xff\x1f\x00\xff\xe0\x79\xbe\x8e\x14\xc9\x91\xc8\xa9\
-\x29\x82\x20\xe0\xe0\xe0\x00\x81\x40\x80\xe6\x07\xa5\x52\x09\x66\
-\xb3\x19\x0e\x87\x03\x97\x2e\x5d\xc2\x95\x2b\x57\x30\x3b\x3b\xdb\
-\xd5\x7b\x59\x2c\x16\x3a\xab\x25\x11\x21\x6d\x02\x69\x2a\xc5\xe9\
-\x74\xc2\x6a\xb5\xca\x46\x46\x3e\x9f\x87\xdf\xef\xc7\xda\xda\x1a\
-\x9e\x3c\x79\x42\xc9\x70\xb9\x5c\xb8\x75\xeb\x16\x96\x96\x96\x98\
-\x66\x63\xae\x4d\xab\xbd\x66\xb3\x19\xef\xbf\xff\xfe\x7f\xfd\x5b\
-\x53\xee\xaf\xac\xac\xd0\x29\x3d\x51\x14\xdf\xd2\x94\x4e\x48\x69\
-\xe6\x4e\x1a\x45\x56\x9a\xd9\x95\xea\x40\xe7\xce\x9d\x83\xd1\x68\
-\x3c\xf2\x8d\xa8\xc6\x65\x34\x1a\x71\xfe\xfc\x79\x04\x83\x41\x6c\
-\x6c\x6c\x50\x71\xaf\x9d\x4a\x79\xef\xbd\xf7\x64\x9b\x4a\x91\x34\
-\x6a\x7d\x7d\x9d\x92\x11\x8f\xc7\xe1\x72\xb9\x70\xe7\xce\x9d\x3a\
-\xcd\x38\x52\x40\xda\x91\xb2\xb5\xb5\x25\x2b\x29\x8d\x62\x9e\xcd\
-\x66\xe9\x00\x81\xc1\x60\x80\xc3\xe1\x80\xc3\xe1\xa0\xfd\x8b\x6e\
-\x4a\x1b\x3a\x9d\x0e\x76\xbb\x1d\x4e\xa7\x13\x66\xb3\x19\x2a\x95\
-\x8a\xee\x62\xc9\x66\xa7\x52\x29\x14\x0a\x85\x8e\x37\x58\xe3\xd1\
-\x2b\x5d\x87\x90\xdc\xd4\xc6\xc6\x06\xd2\xe9\x34\x5c\x2e\x17\x96\
-\x96\x96\xde\xd2\x8c\x8e\x3a\x86\xcd\x48\x91\x34\x05\x40\x57\xa4\
-\x34\xba\xa4\xda\x31\x1f\x8f\xc7\x43\x6b\x57\x2a\x95\x0a\x83\x83\
-\x83\xb0\xd9\x6c\x18\x1b\x1b\xa3\xd9\x74\x33\x7f\x7f\xd8\x52\xa9\
-\x54\xb4\xa9\x35\x3c\x3c\x0c\xa3\xd1\x48\x6b\x59\xd1\x68\x94\x56\
-\x95\x33\x99\x0c\x4c\x26\x53\xdb\xbf\xa3\xdd\xfb\x4a\x01\x6e\xa5\
-\x19\x1f\x7e\xf8\xe1\x5b\x9a\xd1\x51\x40\x4e\x5a\x53\xa4\x1d\x25\
-\x4d\x95\x48\xa5\x12\xa9\x4d\x6b\xb5\x5a\x31\x32\x32\x02\xb3\xd9\
-\x7c\x2c\x07\x44\x08\x81\x5e\xaf\xa7\xa3\x43\x56\xab\x15\x82\x20\
-\x80\xe3\x38\x64\xb3\x59\xc4\x62\x31\xf8\xfd\x7e\x44\x22\x11\xa8\
-\x54\xaa\x8e\x67\x72\x6b\xc9\x68\xa6\x19\x4b\x4b\x4b\x58\x5c\x5c\
-\x64\x8e\x72\x35\xe2\x48\x87\x72\x2d\x29\x0c\xc3\xdc\x7f\xfe\xfc\
-\x79\x1d\x29\xc9\x64\x12\x9f\x7c\xf2\x49\xc7\x9a\x22\xed\xd0\x40\
-\x20\x80\x60\x30\x88\x44\x22\x81\x62\xb1\x08\xbd\x5e\x8f\x91\x91\
-\x11\x4c\x4c\x4c\x60\x68\x68\x08\x3a\x9d\xee\xad\xd7\xec\xe4\xc8\
-\x92\x1a\x57\x06\x83\x01\x76\xbb\x1d\x36\x9b\x0d\xf1\x78\x9c\xf6\
-\x59\xd2\xe9\x34\x76\x77\x77\x61\xb7\xdb\x61\xb1\x58\xda\x7e\x5b\
-\xdd\x61\x64\xdc\xbb\x77\x0f\x1b\x1b\x1b\x6f\xb9\xa9\x56\x9a\xd1\
-\x55\x40\x6a\x49\x11\x04\xe1\x3b\x00\xdf\xf0\x3c\x8f\x40\x20\xf0\
-\x56\x9e\xd2\x09\x29\x85\x42\x81\xba\xab\x44\x22\x81\x5c\x2e\x07\
-\x51\x14\xa9\xdd\x75\x38\x1c\x30\x1a\x8d\xc7\x6e\xb5\x4a\x59\xba\
-\x5e\xaf\xc7\xe4\xe4\x24\x9c\x4e\x27\x76\x76\x76\xe8\x91\x59\x3b\
-\x03\x7c\xf1\xe2\xc5\x63\x91\xb1\xb1\xb1\x41\xf3\x8c\x4e\xc8\xe8\
-\x28\x20\xad\xf2\x94\xe7\xcf\x9f\x53\xf7\xd5\x8d\xa6\x48\x6e\x24\
-\x14\x0a\x21\x9f\xcf\xd3\x07\xa4\xd3\xe9\x30\x3d\x3d\x8d\x73\xe7\
-\xce\x41\xa7\xd3\xc9\x56\x63\xd2\xeb\xf5\x98\x9e\x9e\x86\xcf\xe7\
-\xc3\xb3\x67\xcf\xa8\xdb\x92\x76\xb8\xdf\xef\xa7\x9b\xe2\x28\x24\
-\x4a\x79\x46\x37\x6e\x4a\x96\x80\x34\xd3\x94\x5c\x2e\xd7\xb5\xfb\
-\x92\x8e\x12\xb3\xd9\x0c\x97\xcb\x45\x2f\xde\xb8\x5c\x2e\x2c\x2c\
-\x2c\x74\x15\x90\x76\x4b\x22\x6f\x6e\x6e\x0e\xef\xbc\xf3\x0e\x08\
-\x21\xa8\x56\xab\xd0\xe9\x74\x18\x1d\x1d\x85\xc9\x64\x3a\x12\x8d\
-\x8d\x6e\xaa\x36\x03\x3f\xaa\x9b\x92\x25\x20\x72\xbb\x2f\xbd\x5e\
-\x0f\x97\xcb\x05\x95\x4a\x05\xbb\xdd\x8e\x4c\x26\x03\x42\x08\xed\
-\x17\xd8\x6c\xb6\x8e\x03\xd2\x6e\x47\x0f\x0c\x0c\xc0\x6a\xb5\xe2\
-\xf2\xe5\xcb\x10\x45\x11\x37\x6e\xdc\xa0\xfd\x92\xc1\xc1\x41\x38\
-\x1c\x0e\x58\xad\xd6\x96\xdf\x1e\xd1\x58\xb5\x6d\x56\x9b\xba\x73\
-\xe7\xce\x91\xdc\x94\xac\x01\x91\xcb\x7d\xa9\xd5\x6a\x8c\x8d\x8d\
-\xd1\x7a\x55\xa9\x54\xa2\x8e\x48\x1a\xf3\x91\xb3\x88\x49\x08\xa1\
-\x0d\x38\xa5\x52\x89\xd9\xd9\x59\x14\x8b\x45\xb0\x2c\x0b\x8d\x46\
-\x03\xa3\xd1\xd8\xf6\x52\x8f\x44\x46\x63\x06\x2e\xe5\x19\xb7\x6e\
-\xdd\xea\x58\x33\x64\x09\x88\x5c\xee\x8b\x10\x02\x9d\x4e\x47\xab\
-\xb9\xd2\x88\x27\x21\x84\x0e\x2f\x9f\x44\xa9\x5f\xca\x4b\xcc\x66\
-\x33\x7d\x4f\x85\x42\x01\x42\x48\x4b\x7b\x5d\x4b\xc6\xda\xda\x1a\
-\xee\xde\xbd\x5b\xe7\xa6\xba\xd5\x0c\x59\x03\xd2\xca\x7d\x35\xab\
-\x12\x37\x23\x45\x6a\xcd\xca\x5d\x65\x3d\x6c\x49\x1d\xd2\x4e\xdd\
-\x94\x44\xc6\xe3\xc7\x8f\xa9\x9b\x92\x8b\x0c\xfa\xd9\xbe\xfd\xf6\
-\xdb\x63\xbf\xc8\xbf\xcf\xe0\x1f\xf4\x7a\xfd\x63\x51\x14\xff\x43\
-\x9a\xab\x92\x6e\xc0\x96\xcb\x65\x58\xad\x56\xfa\x65\x30\x27\xd5\
-\x08\xea\xc4\x02\x77\x92\xe9\x4b\x16\x7f\x75\x75\x15\xf7\xee\xdd\
-\xc3\xd3\xa7\x4f\x91\x48\x24\x30\x33\x33\x83\xaf\xbf\xfe\x1a\x9f\
-\x7f\xfe\x39\xe3\x70\x38\xea\x7a\xf3\x67\x42\xc8\x59\x57\x89\x4f\
-\x7a\xb5\xcb\x33\x3a\xcd\xc0\x4f\x95\x90\x5a\x52\xcc\x66\xf3\xbd\
-\x7e\x22\xe5\x30\x32\x6a\xfb\x19\x4f\x9e\x3c\x41\x22\x91\xc0\xf4\
-\xf4\x34\xee\xdc\xb9\x83\xcf\x3e\xfb\x8c\x71\x3a\x9d\xb2\x90\x21\
-\x2b\x21\x7f\x36\x52\x8e\x92\x67\xc8\x4d\xc6\x89\x10\xd2\x0b\xa4\
-\x34\x6a\x43\x37\xe5\xfa\x46\xcd\x90\xc8\x90\x6a\x53\x72\x6a\xc6\
-\x89\x12\xd2\xef\xa4\x34\x6a\xc6\x69\x92\x71\xa2\x84\x34\x23\x05\
-\xc0\xa9\x90\xd2\xa8\x0d\x9d\xe4\x32\xa7\xe9\xa6\x4e\x95\x90\x4e\
-\xf2\x94\x5e\x20\xa5\x19\x19\x27\xed\xa6\xce\x84\x90\xc6\x3c\xc5\
-\x60\x30\x3c\x10\x45\xf1\x3f\x7b\xcd\x7d\xd5\xba\xa9\x5a\xcd\xa8\
-\x25\x43\x6e\x37\x75\x26\x84\x34\x21\x85\xce\x7d\xf5\x02\x29\xcd\
-\xdc\x54\x63\x0f\x7c\x71\x71\x91\xb9\x7c\xf9\xf2\xe9\x55\x11\x4e\
-\x83\x90\x56\x19\xbd\x74\x19\xf3\xac\x48\x69\xa7\x19\x27\x95\x67\
-\xf4\x04\x21\xed\xdc\x97\xd4\x4f\x39\x4d\x52\x5a\xb9\xa9\x46\x32\
-\x4e\x43\x33\xce\x94\x90\xb3\x74\x5f\x9d\x90\x71\x1a\x6e\xaa\x27\
-\x08\x39\x6b\xf7\x75\x94\xda\x54\xb7\x9d\xbe\xbe\x26\xa4\x95\xa6\
-\x34\x92\x52\x2a\x95\x64\x25\xa5\x59\x6d\x2a\x1e\x8f\x9f\x89\x9b\
-\xea\x29\x42\x3a\xc9\xe8\xbb\x99\x66\x69\x5c\xed\xa6\xd0\xcf\xca\
-\x4d\xf5\x24\x21\xa7\x51\xfb\x92\x46\x55\x83\xc1\x20\x56\x57\x57\
-\x4f\xad\x6a\xdb\x97\x84\x9c\x74\xed\x4b\x9a\xdf\xad\x9d\xb5\xad\
-\xbd\x9f\x21\x67\xa7\xef\x4f\x45\xc8\x49\xb9\x2f\xc9\x52\x4b\x19\
-\xf8\xd3\xa7\x4f\xa9\x66\x9c\xb5\x9b\xea\x69\x42\xe4\x76\x5f\xfd\
-\xe0\xa6\xfa\x82\x90\xa3\xba\xaf\x46\x52\x1a\x2b\xba\xfd\xe0\xa6\
-\xfa\x82\x90\x6e\x34\xa5\xf6\xce\x63\xa5\x52\x69\xa9\x19\xbd\xe6\
-\xa6\xfa\x8a\x90\x4e\xdd\x97\x14\x90\xc6\xb9\xa9\x5e\x76\x53\x7d\
-\x45\x48\xa7\x79\x4a\xb9\x5c\x86\xd9\x6c\x46\x26\x93\xc1\xc6\xc6\
-\x46\x5f\xb8\xa9\xbe\x0c\x88\xb4\x5a\xcd\x12\x6f\x6c\x6c\xd0\xef\
-\x34\x71\xb9\x5c\x48\xa7\xd3\xf8\xf1\xc7\x1f\xf1\xdb\x6f\xbf\xd5\
-\xf5\xc0\x97\x96\x96\x8e\x3d\x51\xf8\x57\x40\x0e\x21\x85\xe3\x38\
-\x84\x42\x21\x6c\x6d\x6d\x21\x91\x48\x20\x10\x08\x80\xe7\x79\xb8\
-\xdd\x6e\x70\x1c\x77\xe6\x55\xdb\x6e\x17\x23\xe7\x17\x1f\x9f\xf4\
-\x12\x04\x01\xc9\x64\x12\x5b\x5b\x5b\xb7\x1f\x3c\x78\x70\x7f\x75\
-\x75\x15\xdb\xdb\xdb\xe0\x38\x8e\x8e\x86\x66\xb3\x59\xcc\xce\xce\
-\xd6\x4d\xa1\xb7\xbb\x11\xf5\x17\x21\x32\x92\xc2\x30\xcc\x3f\x78\
-\x9e\xc7\xce\xce\x0e\x62\xb1\x18\xf4\x7a\x3d\x66\x67\x67\xfb\x4a\
-\x33\xfa\x3a\x20\x8d\x9a\xa2\xd5\x6a\xff\xc9\xb2\xec\x2f\x83\x83\
-\x83\xf0\x78\x3c\x18\x1f\x1f\xc7\x17\x5f\x7c\x81\x9b\x37\x6f\xf6\
-\x8d\x66\xfc\x29\x02\x22\x91\x52\x28\x14\xfe\xe5\xf1\x78\x70\x70\
-\x70\x80\x64\x32\x89\xd1\xd1\x51\xbc\xfb\xee\xbb\x7d\x49\x86\xb4\
-\xfe\x0f\x36\x90\xad\x8b\x49\x04\xc5\xdd\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x57\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe4\x03\x15\x03\x37\x38\xdb\x25\x88\xba\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x03\xbb\x49\x44\x41\x54\x48\xc7\xb5\x96\xcf\
-\x6b\x5c\x55\x14\xc7\x3f\xf7\xbe\xf7\xee\xbc\x37\x93\xbc\x99\xa6\
-\x99\x36\xa6\xa9\x96\x26\x04\x9a\x40\x12\x29\x2d\x88\x52\x0a\x22\
-\xa2\x1b\xb1\x20\xa1\xdd\x64\x21\xb8\xa9\x59\x74\x21\xda\xb5\x7f\
-\x81\x35\x05\x17\x25\x18\x5c\x94\xa2\x14\xaa\xc5\x1f\x5b\x57\x22\
-\xb5\xa9\x95\xaa\x05\x29\x89\x49\xcc\x2f\x9b\xce\x8f\x4c\xe7\xe5\
-\xfd\xb8\xd7\xc5\x4c\x26\x33\x6d\x22\xc9\xa2\x07\xee\xe2\xdd\xfb\
-\xce\x39\xdf\xf3\x3d\x5f\xce\xbd\xd0\x64\xbe\xef\x8f\x7b\x9e\x37\
-\xad\x94\x8a\x00\xb3\x97\xa5\x94\x8a\x3c\xcf\x9b\xf6\x7d\x7f\xbc\
-\x39\xa6\x00\x18\x1b\x1b\x6b\xbf\x76\xed\xda\xef\x41\x10\xf4\xf8\
-\xca\xe1\xcd\xae\x2c\x79\x47\x22\x12\xcd\x6e\xcc\x58\x92\xd5\x48\
-\xf3\xed\x52\x91\x52\x18\xe1\xba\xee\xfc\xe8\xe8\xe8\xc0\xd4\xd4\
-\x54\x59\x00\xb8\xae\x3b\x17\x04\xc1\xa1\x89\x91\x23\xe2\xfc\x0b\
-\x39\x48\x92\x1a\x2e\xc1\xee\x6c\xf3\x5f\xcb\xe2\xf2\x6c\x81\xf7\
-\xef\xcc\x18\xd7\x75\x17\x82\x20\x38\x6c\xf9\xbe\x3f\x5e\xa9\x54\
-\x46\x27\x46\x8e\x88\xf3\x3d\xed\xa0\x4d\x8b\x6f\x62\x0c\x5a\x43\
-\x62\x6a\x47\x9b\xcb\x98\x7a\x5c\x03\x42\xd4\x91\x68\xc3\xc9\x6c\
-\x8a\x7c\x3a\x2d\xbe\x9e\xff\xd7\xf7\x7d\x7f\x4d\x78\x9e\x37\xed\
-\x24\xf1\x48\xf1\x8d\x41\x88\x93\x2d\x50\xc6\xb0\x12\xc6\x7c\x36\
-\xbb\xc6\xf7\xab\x65\xfe\xaa\x84\x54\xb5\xc6\x93\x92\x03\x29\x9b\
-\xbe\xb4\x62\x24\xeb\x71\xaa\x23\xc3\xab\x9d\x6d\xad\x15\xd9\x16\
-\xd9\xef\xee\x11\x59\xf6\x1d\xa1\x94\x8a\xce\x74\xf9\xf6\xd5\xa1\
-\xe7\x6a\x90\xea\x76\xab\xf0\x98\xd7\x7f\x9e\x61\x2d\x4a\xfe\x97\
-\x9d\x03\xca\x62\xf9\xb5\x81\xd6\x4d\x01\x67\xef\x2e\x72\x7d\xa9\
-\x14\xdb\x61\x18\xda\x79\x47\xb6\x04\x0f\x12\xcd\x3b\xb7\xff\x6e\
-\x04\x97\x80\x92\x02\xd9\x44\xb9\x06\x42\x6d\xb0\x85\xd8\xb6\x27\
-\x79\x47\x12\x86\xa1\x6d\x03\x35\xb5\x08\x1a\x49\x7e\x5c\xab\x30\
-\x53\x8d\x1a\x32\x3b\x99\xf3\xb8\x34\xd8\xcd\xb1\xb6\x14\x02\xc1\
-\x42\x10\x71\xab\x58\xe5\x9b\xe5\x12\xbf\x95\x03\x8c\x31\x5b\x7d\
-\xa8\x3b\x6d\x2a\xd0\xde\xae\xec\xfb\xeb\x1b\x5b\x74\x0a\xf8\xb0\
-\x37\xcf\x89\x5c\xba\xb1\xd7\xdf\x96\xa2\xbf\x2d\xc5\xb9\x43\x39\
-\x42\xad\xd1\x80\xb5\x03\x85\x72\xbb\x4d\x47\x6e\xa1\xd1\x06\x6e\
-\x2c\x97\x28\x44\x09\x95\x58\xb3\x91\x68\x12\xb3\xc5\xa7\x92\x12\
-\x4b\xec\xac\xe7\x6d\x2b\x38\x9e\xf5\x1a\x8c\x25\xc0\xe7\xf3\x05\
-\xbe\x5a\x2c\x71\x7a\x7f\x86\xe3\x59\x8f\xe3\x59\x8f\x13\x59\x0f\
-\xdf\xb1\xf0\xa4\x68\xa5\x67\x37\x09\x4e\xe4\xd2\xbc\x75\xd0\xe7\
-\xe6\x4a\x89\xb8\x0e\x76\x3d\xd1\xdc\x5c\x29\x73\x73\xa5\xdc\xa0\
-\xee\x6c\x77\x8e\x8f\x7a\xf3\x0c\xb4\xbb\x3b\x26\x90\x3b\x1d\x5c\
-\x7d\xf1\x30\x63\x3d\xfb\xe8\x70\x2c\x32\x96\xc0\x7e\x02\x64\x6c\
-\xe0\x8b\x85\x02\xa7\x7f\x7a\xc0\xed\x62\x75\xef\x09\x5c\x4b\x72\
-\x65\xa8\x87\x5f\x5e\xe9\xe3\xe3\xfe\x2e\xde\xee\xca\xd2\x97\x56\
-\xec\x77\x2c\x52\x4d\x3d\x7a\x18\x26\x5c\xfc\x73\x69\x6f\x14\x35\
-\xdb\x91\xb4\xe2\xc2\xd1\x4e\x2e\xd4\xbf\x7f\x2d\x55\x99\x98\x79\
-\xc8\x95\xb9\x47\x35\x11\x00\xf7\xca\xc1\xde\x2a\x78\x9c\x68\xd6\
-\xc2\xb8\x45\x2d\x9b\x36\xec\x7b\x7c\x3a\xd8\x4d\xce\x6e\x75\xad\
-\xc4\x7a\xf7\x15\xfc\xb0\x5a\x66\x6a\xfe\x11\xef\x3d\xdf\xc1\x50\
-\xbb\x87\x67\x09\x94\x14\x88\x3a\xf7\x7f\xac\x07\xac\x37\x8d\x72\
-\xcf\x92\x64\x6c\xb9\x73\x02\x63\xb5\x8e\x8a\x9a\xf6\xcb\xdc\x58\
-\x2e\xd3\x9d\xb2\x79\xb9\x23\xc3\xd1\xb4\x22\x25\x05\xf3\xd5\x88\
-\xeb\x4b\xc5\x86\xba\x6c\x01\xa7\x3a\x32\x4f\x8d\x0a\x63\xd5\x12\
-\xda\x4a\xa9\x78\x35\xd2\x76\xf3\xa8\x50\xb2\xa6\x9a\xd8\xc0\x3f\
-\x1b\x31\x5f\x2e\x16\x77\xe4\xf8\x58\x5b\x8a\x0f\x7a\x3b\x9f\x1a\
-\x76\xab\x91\x46\x29\x15\x5b\x4a\xa9\x33\x0f\xca\xd5\xae\x8b\xfd\
-\x07\x1b\x77\x81\x2d\xa0\x18\x6b\x42\x6d\xf0\xa4\x44\x49\x81\x12\
-\x35\x9a\x5c\x29\x68\xb7\x24\xf9\x94\xcd\x4b\xfb\xd2\x7c\x32\xd0\
-\xcd\x90\xef\x3d\x35\xae\xdf\xbd\x33\x87\xb1\xec\xbb\xb6\xe3\x38\
-\x93\xa5\x6a\xf5\xd2\xe5\xd9\x02\xe7\x7b\xda\xc1\x40\x6f\x26\xc5\
-\xe4\x70\x0f\x00\xd3\xc5\x2a\xf7\x2b\x1b\x2c\x06\x31\x55\xad\x71\
-\x84\xe0\x60\xca\x66\xd8\x77\x19\x7e\x32\x70\x1d\xfd\xe5\xd9\x02\
-\xa5\x30\xc2\xf7\xbd\xc9\x67\x7e\x65\x3e\xf3\x4b\x9f\x67\xfd\x6c\
-\xf9\x0f\xe1\x2c\xb0\x7a\xc3\x2a\xd6\xfc\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0f\xf0\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x27\x1e\x0a\xe6\x09\x68\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x0f\x54\x49\x44\x41\x54\x78\xda\xed\x9d\x59\
-\x53\x1b\xd7\x16\x85\x57\x4b\xa7\x5b\xb3\xb0\x06\x08\x02\x62\x17\
-\x92\x8c\x11\x60\x3b\x61\xcc\x54\x79\x49\x20\xa9\x4a\x1e\x92\x9f\
-\x71\xf3\x5f\xee\xeb\xfd\x1d\xf1\x6b\x2a\x0f\x4e\x41\x1c\x20\x80\
-\x88\x53\x66\x2a\x09\x08\x32\x60\x46\x4d\x80\x66\x9d\xfb\x90\x9c\
-\xbe\x8d\x68\x49\x2d\xa9\xd5\x92\x7c\xdd\x55\x7e\xf1\x00\xa8\x97\
-\xbe\xb3\xf7\x5a\x7b\xb7\xcc\x51\x4a\xd1\xe9\xd7\xf1\xf1\x31\xd6\
-\xd6\xd6\xfe\x03\x00\xe3\xe3\xe3\x3f\x78\x3c\x9e\x8e\x7d\x2d\xa4\
-\x93\x85\x48\x26\x93\x38\x3c\x3c\xc4\xee\xee\xee\xbf\x37\x36\x36\
-\xfe\x25\x08\x02\xdc\x6e\xf7\x0f\x3c\xcf\xc3\x66\xb3\xc1\x60\x30\
-\xbc\x13\x44\xcb\xeb\xf0\xf0\x10\xcf\x9e\x3d\xa3\xcb\xcb\xcb\x88\
-\x44\x22\x70\xbb\xdd\xc8\xe7\xf3\x34\x9b\xcd\xf6\x07\x02\x81\xa3\
-\x77\x82\x68\x48\xc6\xd1\xd1\x11\x96\x96\x96\xe8\xfc\xfc\x3c\x82\
-\xc1\x20\x92\xc9\x24\x5c\x2e\x17\x2c\x16\x0b\x00\x1c\xf2\x3c\xcf\
-\x01\xe8\x38\x52\x3a\x52\x90\xa3\xa3\x23\x3c\x7b\xf6\x8c\xce\xcf\
-\xcf\x63\x63\x63\x03\xc9\x64\x12\x84\x10\xa4\xd3\x69\xac\xac\xac\
-\x20\x99\x4c\x02\x00\xcd\xe5\x72\x1d\x47\x0a\xe9\x44\x32\x16\x17\
-\x17\xe9\xfc\xfc\x3c\x36\x37\x37\x41\x08\x81\xd7\xeb\x85\xd3\xe9\
-\x44\x36\x9b\xc5\xfe\xfe\x3e\xc2\xe1\x30\xba\xba\xba\x3a\x92\x14\
-\xd2\xa9\x64\xbc\x7a\xf5\x0a\x84\x10\x4c\x4e\x4e\x62\x78\x78\x18\
-\x03\x03\x03\x38\x3f\x3f\xc7\xcf\x3f\xff\x8c\xbd\xbd\x3d\xac\xad\
-\xad\x21\x1e\x8f\x77\x1c\x29\xa4\x93\xc9\xf0\xfb\xfd\x98\x99\x99\
-\xc1\x07\x1f\x7c\x80\xde\xde\x5e\x9c\x9e\x9e\xe2\xea\xea\x0a\x3a\
-\x9d\x0e\xdb\xdb\xdb\xd8\xdd\xdd\xc5\xf2\xf2\x72\x47\x91\x42\x3a\
-\x95\x8c\x89\x89\x09\xcc\xcc\xcc\xe0\xe3\x8f\x3f\xc6\xe0\xe0\x20\
-\x8c\x46\x23\x6c\x36\x1b\x74\x3a\x1d\x9c\x4e\x27\x38\x8e\x43\x28\
-\x14\x42\x30\x18\x14\x49\xc9\xe7\xf3\xce\xe1\xe1\xe1\xe8\x3b\x41\
-\x1a\xf4\x19\xac\x9b\x2a\x25\x63\x7a\x7a\x1a\x3e\x9f\x0f\x2e\x97\
-\x0b\x00\x60\x30\x18\x60\x34\x1a\x01\x00\xd1\x68\x14\x00\xb0\xb5\
-\xb5\x25\x25\xe5\x92\x10\xd2\xd6\xa4\xb4\xb5\x20\xcc\x67\x30\x32\
-\x78\x9e\xc7\xf8\xf8\xb8\x48\x86\xdf\xef\x87\xcd\x66\xfb\xdf\x8b\
-\x21\x04\x56\xab\x15\x5e\xaf\x17\x73\x73\x73\x70\x38\x1c\xb2\xa4\
-\xb4\x73\x4d\x21\xed\x4c\x46\x69\xcd\xf0\xf9\x7c\xb2\x64\xb0\x4b\
-\xa7\xd3\x41\x10\x04\xb8\x5c\x2e\x08\x82\x00\x00\x88\xc5\x62\x00\
-\x80\xcd\xcd\xcd\x8e\xa8\x29\xa4\x5d\xc9\xf8\xf1\xc7\x1f\x45\x9f\
-\xc1\xba\xa9\xe9\xe9\x69\x7c\xf2\xc9\x27\xf0\xf9\x7c\xb7\xc8\xb8\
-\xf3\xa2\x08\x81\xcd\x66\x83\xd7\xeb\xc5\xec\xec\x2c\xee\xdd\xbb\
-\x07\x4a\x29\xc2\xe1\x70\xdb\x93\x42\xda\x91\x8c\xd2\x9a\xf1\xf0\
-\xe1\x43\x4c\x4f\x4f\x8b\x64\xb8\xdd\xee\x8a\x5f\xa7\x12\x29\x25\
-\x35\xe5\x90\x10\xc2\x51\x4a\x61\xb7\xdb\xdb\x82\x14\xd2\x6e\x64\
-\x48\x1d\x38\x23\x83\xd5\x8c\x6a\x64\x54\x22\xe5\xcb\x2f\xbf\x44\
-\x57\x57\xd7\x1d\x52\x28\xa5\x34\x97\xcb\xf9\x03\x81\x40\xb8\xbb\
-\xbb\xfb\x9d\x20\xe5\xc8\xe0\x79\xfe\x56\x37\xe5\xf7\xfb\xef\xd4\
-\x8c\x6a\x57\x35\x52\xc2\xe1\x30\x13\x38\xc4\xf3\x3c\xc7\x71\x5c\
-\xcb\x6b\x0a\x69\x37\x32\x58\x37\x35\x31\x31\x81\xe9\xe9\x69\xd9\
-\x6e\xaa\xe6\x17\x59\xa6\xa6\x84\x42\x21\xac\xaf\xaf\x23\x91\x48\
-\x30\x9f\xd2\xf2\x9a\x42\xda\x95\x0c\x69\xcd\xa8\x95\x8c\x72\xa4\
-\xb8\xdd\x6e\xf1\xdd\x7f\x79\x79\x09\x00\x77\x1c\x7d\xab\x7d\x0a\
-\x69\x57\x32\x94\x74\x53\x8d\x90\xf2\xd5\x57\x5f\xc1\xe9\x74\x02\
-\x80\x58\x53\x12\x89\x04\x38\x8e\x6b\x29\x29\xa4\x55\x64\x48\xe7\
-\x19\xe5\xc8\xa8\xd6\x4d\xa9\x41\x0a\x73\xf4\xdb\xdb\xdb\x6d\x91\
-\x12\xb7\x44\x90\xd2\x79\x06\xcb\xa6\x9a\x45\x86\x1c\x29\x72\x8e\
-\x3e\x1c\x0e\xb7\x3c\x25\x26\x5a\x93\x51\x2e\x9b\x6a\x26\x19\x95\
-\xba\x2f\x76\xb3\x59\xf7\xd5\xea\x94\x58\x53\x41\xe4\x7c\x46\x39\
-\x32\xd8\x36\x0c\xc7\x71\x4d\xf9\x59\x38\x8e\x03\x5b\x86\xf0\xf9\
-\x7c\x00\x50\x36\xfb\xd2\x32\x25\x26\xad\x22\x43\xaf\xd7\xc3\xe7\
-\xf3\x69\x4a\x46\x35\x9f\xc2\x71\x5c\xcb\x53\x62\xa2\x35\x19\xd2\
-\x79\x46\x25\x9f\xd1\x2c\x32\xaa\x75\x5f\xac\xa6\x00\x68\x49\x4a\
-\x4c\xb4\x26\x43\xae\x66\xb8\x5c\x2e\x4d\x05\xa8\x46\x0a\xa5\x14\
-\xd1\x68\x14\x94\x52\xcd\x6b\x0a\xd1\x9a\x0c\x96\xda\x96\xcb\xa6\
-\x9a\x5d\x3b\x6a\x75\xf4\x52\x9f\xa2\x05\x29\xa4\x59\x64\x94\xfa\
-\x8c\xd2\xd4\x56\x69\x36\x45\x29\x45\xb1\x58\x44\xa1\x50\x40\xb1\
-\x58\x6c\xb8\x90\x73\x1c\x07\x9d\x4e\x07\xbd\x5e\x7f\x47\x74\x39\
-\x9f\x22\xed\xbe\xb4\xf0\x29\x4d\x11\xa4\xdc\x76\x48\x69\x37\x25\
-\x47\x81\xf4\xf7\x98\x18\xd9\x6c\x16\xa9\x54\x0a\xb9\x5c\xae\xee\
-\x9f\x89\x52\x2a\x0a\x21\x08\x02\x4c\x26\x13\x08\x21\x35\x93\xd2\
-\x6c\x9f\x42\x9a\x41\x86\x74\xd2\x57\xaf\x03\xa7\x94\xe2\xe6\xe6\
-\x06\x67\x67\x67\x38\x3b\x3b\xc3\xc5\xc5\x05\x52\xa9\x94\xec\xf1\
-\x56\x6b\xad\x70\x3a\x9d\x78\xf0\xe0\x01\x1c\x0e\x07\x78\x9e\x87\
-\x5e\xaf\x57\xec\xe8\x59\x4a\xcc\x48\x51\x7b\x9e\x42\x9a\x4d\x46\
-\x3d\x0e\x9c\x52\x0a\x4a\x29\xce\xcf\xcf\xf1\xe2\xc5\x0b\xfc\xf9\
-\xe7\x9f\xd8\xdf\xdf\x67\xef\xcc\xba\x05\xd1\xeb\xf5\x30\x1a\x8d\
-\x18\x1a\x1a\xc2\xec\xec\x2c\x46\x46\x46\xd0\xd5\xd5\x75\x47\x90\
-\x4a\xdd\x17\x9b\xa7\x30\x52\xd4\x9e\xa7\x90\x66\x91\xd1\x88\x03\
-\xa7\x94\x22\x9f\xcf\xe3\xe2\xe2\x02\xaf\x5e\xbd\xc2\xe2\xe2\xa2\
-\x6a\x82\x08\x82\x80\x54\x2a\x85\xd1\xd1\x51\x3c\x78\xf0\x00\x56\
-\xab\xb5\xa1\xec\xcb\x6e\xb7\x03\x2a\xce\x53\x88\x9a\x64\x2c\x2c\
-\x2c\x34\x44\x06\xbb\x8a\xc5\x22\x32\x99\x0c\x62\xb1\x18\x0e\x0e\
-\x0e\x70\x70\x70\x80\x68\x34\xda\xf0\x91\xc5\x0a\x7a\x34\x1a\x45\
-\x32\x99\x44\x2a\x95\x42\xa1\x50\xa8\xdb\xa7\x34\x23\x25\x26\x8d\
-\x92\xd1\x8c\x6c\xaa\x58\x2c\x22\x9f\xcf\x23\x9d\x4e\x23\x91\x48\
-\x20\x91\x48\x20\x9d\x4e\x23\x9f\xcf\x83\x10\x02\xb3\xd9\x8c\x7b\
-\xf7\xee\xc1\x68\x34\x8a\x9d\x53\x2d\xa2\xf4\xf7\xf7\xc3\x6e\xb7\
-\x83\xe7\x79\x45\xff\xb6\x12\x29\x3b\x3b\x3b\xaa\xfa\x94\x86\x04\
-\xa9\x25\x9b\x92\x3b\x96\x2a\xf9\x0d\xf6\xe7\x7a\xbd\x5e\x6c\x51\
-\x59\x4a\x7b\xff\xfe\x7d\x3c\x7d\xfa\x14\x7d\x7d\x7d\xd0\xeb\xf5\
-\xd0\xe9\x74\x8a\x68\x61\x5d\x56\x5f\x5f\x1f\x02\x81\xc0\xad\x1b\
-\x5c\xaf\xa3\x67\x29\xb1\x5a\xd9\x17\x51\x8b\x8c\x66\x65\x53\x52\
-\x02\xf4\x7a\x3d\xcc\x66\x33\x3c\x1e\x0f\x26\x26\x26\xf0\xe8\xd1\
-\xa3\x9a\x04\xe1\x38\x0e\x7a\xbd\x1e\x5d\x5d\x5d\xe8\xeb\xeb\x83\
-\xd5\x6a\x2d\xdb\xfa\x2a\x25\x25\x16\x8b\x81\xe3\x38\xd5\xb2\x2f\
-\xd2\x28\x19\xa5\xbb\xb6\xe5\x52\xdb\x52\x9f\x51\xed\xa8\x90\x0a\
-\x21\x15\xc4\x60\x30\xc0\xe5\x72\xe1\xd1\xa3\x47\x78\xfa\xf4\x69\
-\xcd\x8e\x9e\xa5\xbc\xcc\x87\xd4\x93\x08\x94\xfa\x14\x35\xb3\x2f\
-\xa2\x56\xcd\x90\x6e\x14\xaa\x99\xda\x4a\x6f\x18\x7b\x87\x9b\x4c\
-\x26\x38\x1c\x0e\x74\x77\x77\xd7\x5c\x43\xd4\xcc\xbe\x18\x29\x15\
-\x52\xe2\x9a\x6b\x0a\x69\x16\x19\xcd\x48\x6d\x99\x3f\x29\x14\x0a\
-\xc8\xe5\x72\xc8\xe5\x72\x8a\x0b\xb3\x92\xaf\x5d\xeb\xcf\x5b\xad\
-\xfb\xaa\x87\x14\xd2\xae\x64\x28\x11\xa5\x58\x2c\xa2\x95\x8f\x75\
-\x2b\xd9\xfb\xaa\x35\xfb\x22\xcd\x22\xa3\xd1\xf4\xb6\xda\x8d\x56\
-\x7a\x54\x29\xfd\xfe\x8d\x50\x56\x69\x43\xb2\xd6\xec\x8b\xd4\x9a\
-\xda\xf2\x3c\x7f\x67\x0b\x5d\xeb\x49\x5f\xbb\x5d\x72\xa4\x94\xcb\
-\xbe\xaa\x91\x42\x94\x66\x53\x5a\x6f\x87\x54\xf2\x27\xd2\x5f\xf5\
-\x7e\x9d\x66\x5c\x4a\xb2\xaf\x6a\xa4\x10\x2d\xb2\x29\xb5\x85\x62\
-\x11\x88\x4e\xa7\x6b\xe9\xa4\xb1\x9e\xec\x4b\x9a\x12\xcb\x91\x42\
-\xd4\x4a\x6d\xcb\x9d\xd5\x6a\xdf\x30\xd6\xfa\xf2\x3c\xaf\x4a\x87\
-\x55\x6b\x8d\x53\xf2\xf7\x2b\x75\x5f\xd2\x94\x58\x2e\xfb\x22\x4a\
-\xc8\x68\xf5\x76\x48\x69\x0a\x7c\x7d\x7d\x8d\x93\x93\x13\x1c\x1c\
-\x1c\x28\xba\x91\x8c\x28\x83\xc1\x00\xab\xd5\x2a\x7a\x87\x66\xd1\
-\x55\x43\x4a\x7c\x67\x9e\x42\xaa\x91\xc1\x9e\xe9\xab\x56\x33\xaa\
-\x65\x52\x6a\xbc\xf8\x42\xa1\x80\x54\x2a\x85\xa3\xa3\x23\xac\xae\
-\xae\xe2\xe2\xe2\x42\x76\x14\x2b\x97\x87\x19\x0c\x06\x74\x77\x77\
-\x8b\x6f\x28\x46\x17\xfb\xb7\xcd\xe8\xc6\x94\x66\x5f\xd2\x79\x0a\
-\x29\xf5\x19\x0b\x0b\x0b\xd8\xda\xda\x6a\xcb\x6e\xaa\x50\x28\xe0\
-\xe6\xe6\x06\xc7\xc7\xc7\x58\x5d\x5d\xc5\x5f\x7f\xfd\x55\xb5\x8e\
-\x50\x4a\x45\x41\xbc\x5e\x2f\xcc\x66\x33\x2c\x16\x8b\x58\x83\xb4\
-\xae\x29\x2c\xfb\xda\xd9\xd9\xc1\xfe\xfe\x3e\x73\xf4\x21\x42\x08\
-\x97\xc9\x64\xfe\x16\x84\xf9\x8c\x85\x85\x05\x6c\x6e\x6e\x42\x10\
-\x04\x4c\x4c\x4c\x60\x6a\x6a\x0a\x1f\x7d\xf4\x11\xbc\x5e\x6f\xdd\
-\xdd\x54\xe9\xcd\x6a\x84\x18\x46\xc8\xf1\xf1\x31\x92\xc9\xa4\x78\
-\xf4\x28\x3d\xb2\x9e\x3c\x79\x82\x81\x81\x01\xf4\xf4\xf4\x40\x10\
-\x04\xf0\x3c\xaf\x49\x37\xc6\x48\xf1\xf9\x7c\xd0\xe9\x74\x70\xbb\
-\xdd\x10\x04\x01\xa1\x50\x08\x2f\x5f\xbe\x44\x3c\x1e\x47\xb1\x58\
-\xa4\x5e\xaf\xf7\x88\x1c\x1f\x1f\x63\x77\x77\xf7\xdf\xcb\xcb\xcb\
-\x08\x06\x83\xb8\xbe\xbe\x86\xcf\xe7\xc3\xc8\xc8\x08\xc6\xc7\xc7\
-\xe1\xf5\x7a\xdb\xc6\x67\x48\x97\x1e\x6e\x6e\x6e\x90\xcd\x66\x2b\
-\xbe\x09\xa4\xe2\xeb\xf5\x7a\x5c\x5f\x5f\x23\x97\xcb\x69\xee\xf0\
-\xa5\x3e\xc5\x68\x34\x22\x9f\xcf\x63\x6f\x6f\x0f\x27\x27\x27\x08\
-\x85\x42\xc8\x64\x32\xf0\x78\x3c\xb8\xbe\xbe\xee\x23\x6b\x6b\x6b\
-\xff\xd9\xd8\xd8\xf8\x57\x24\x12\x41\x22\x91\x00\xcf\xf3\x70\x38\
-\x1c\x78\xff\xfd\xf7\xd1\xdf\xdf\x0f\x93\xc9\xa4\x89\xbf\x50\xfa\
-\xc2\x78\x9e\x87\xdd\x6e\x47\x4f\x4f\x0f\xac\x56\xab\xec\xb1\x23\
-\x15\x84\x1d\x59\x26\x93\x09\xc3\xc3\xc3\x78\xef\xbd\xf7\x60\x36\
-\x9b\x6b\x8a\xdd\xd5\xea\xe2\x08\x21\xb0\x58\x2c\x70\x3a\x9d\xf0\
-\x78\x3c\xe8\xee\xee\xc6\xc1\xc1\x81\x58\x17\x0b\x85\xc2\xdf\x47\
-\x16\x53\xcf\xe5\x72\x21\x95\x4a\x21\x9d\x4e\xe3\xfc\xfc\x1c\xa7\
-\xa7\xa7\x30\x99\x4c\xe0\x79\x1e\x84\x90\xa6\x9f\xb9\xd5\x2e\xe9\
-\x3c\xe4\xc9\x93\x27\xf0\x78\x3c\x65\x8b\x3a\xc7\x71\xb7\x04\x31\
-\x1a\x8d\xb8\x7f\xff\x3e\x3c\x1e\x0f\x4c\x26\x53\xd9\xc5\x86\x66\
-\x5e\xd9\x6c\x16\xb1\x58\x0c\xa7\xa7\xa7\x88\x46\xa3\xc8\x64\x32\
-\x30\x1a\x8d\x30\x99\x4c\xf0\x78\x3c\xe8\xeb\xeb\x03\x19\x1f\x1f\
-\xff\xc1\xed\x76\xff\x90\xcf\xe7\xa9\xd5\x6a\xc5\xca\xca\x0a\xf6\
-\xf7\xf7\xf1\xd3\x4f\x3f\x21\x91\x48\xe0\x8b\x2f\xbe\x10\xb7\xc4\
-\xd9\x9a\xa5\x56\x0e\xb8\xf4\x7b\x48\x9f\xeb\x60\x5b\x23\x3c\xcf\
-\x8b\x6f\x14\xe9\x31\x24\xa5\x84\x1d\x59\xd2\xd1\xaf\x56\x6f\x2e\
-\xe9\x6b\x88\xc5\x62\xf8\xe3\x8f\x3f\xb0\xb8\xb8\x88\x5f\x7f\xfd\
-\x15\x91\x48\x04\x26\x93\x09\x8f\x1f\x3f\xc6\x37\xdf\x7c\x93\x0e\
-\x04\x02\x26\xe2\xf1\x78\xc0\xf3\x3c\xb2\xd9\x6c\x3f\xa5\xf4\x30\
-\x99\x4c\x62\x77\x77\x17\xa1\x50\x08\x00\x58\xbf\x0c\xaf\xd7\x0b\
-\x97\xcb\x25\x4e\xe8\x5a\xe5\x84\x0d\x06\x03\x1c\x0e\x07\xbc\x5e\
-\x2f\xc6\xc6\xc6\x6e\x09\xa2\xa4\x69\x68\xc5\xaa\x6a\x3a\x9d\x46\
-\x3c\x1e\xc7\xf6\xf6\x36\x16\x17\x17\xb1\xb2\xb2\x82\xc3\xc3\x43\
-\x08\x82\x80\xb1\xb1\x31\x7c\xfa\xe9\xa7\x18\x1f\x1f\x37\xf9\xfd\
-\xfe\xbf\x8f\x2c\x9b\xcd\x86\x40\x20\x70\xf4\x8f\x9d\xa7\xcb\xcb\
-\xcb\x58\x5f\x5f\xc7\xe6\xe6\x26\x28\xa5\x88\xc5\x62\x98\x9d\x9d\
-\x85\x20\x08\xb0\xd9\x6c\x75\xe1\x5e\xcf\x8d\xa8\x54\x78\xeb\xed\
-\xde\x5a\x11\xb5\xc4\xe3\x71\x91\x8c\xe7\xcf\x9f\x23\x12\x89\xc0\
-\x60\x30\x60\x74\x74\x14\xdf\x7d\xf7\x1d\xa6\xa6\xa6\xb8\xde\xde\
-\xde\xff\x39\x75\x83\xc1\x20\xf6\xc9\xf9\x7c\xbe\x1f\xc0\x61\x22\
-\x91\xc0\xee\xee\x2e\xc2\xe1\x30\x00\x88\xeb\x94\x8c\x94\x56\xd7\
-\x94\x4e\xf8\x78\xdb\x74\x3a\x8d\x58\x2c\x76\x8b\x8c\xd7\xaf\x5f\
-\x43\xaf\xd7\x63\x74\x74\x14\x9f\x7d\xf6\x19\x26\x27\x27\x39\xbf\
-\xdf\x2f\x1f\x9d\x94\x23\x65\x6b\x6b\x4b\x3c\x03\x67\x67\x67\xc5\
-\x08\x82\x45\xcd\x5a\x66\x5a\xa5\x69\x6f\x2b\xb7\xe5\xab\x5d\xd2\
-\x9a\xf1\xfc\xf9\x73\xbc\x7e\xfd\x1a\x82\x20\x60\x74\x74\x14\xdf\
-\x7f\xff\x3d\x26\x27\x27\xb9\xd2\xcf\x18\xbe\x25\x88\x12\x52\x58\
-\x50\xd6\x6a\x52\x94\xc6\xef\xed\x4c\xc6\xc3\x87\x0f\x95\xc5\xef\
-\xd5\x48\x89\x46\xa3\x65\x49\xa9\x77\x32\x58\xcf\xf6\x48\x3b\x52\
-\x51\x8e\x0c\x69\xcd\x90\x23\xa3\xa2\x20\x72\xa4\xc4\xe3\xf1\xb6\
-\x24\xa5\x53\xc8\x60\xdd\xd4\xd4\xd4\xd4\xad\x9a\xa1\x48\x90\x4a\
-\xa4\x04\x83\xc1\x5b\xa4\xcc\xcd\xcd\xc1\x68\x34\xc2\x62\xb1\xc8\
-\xd6\x94\x7a\x9d\x7b\xb5\xe3\xa8\x1d\x8f\xac\x72\x64\x8c\x8d\x8d\
-\x89\x64\xb0\x6e\xaa\x2e\x41\x18\x29\x94\x52\xe4\x72\x39\x3f\xa5\
-\x34\x24\x25\x85\xe3\x38\x91\x94\xc1\xc1\x41\xcd\x48\x61\x46\xaf\
-\x5d\x26\x86\x4a\xc8\x28\xed\xa6\xea\x12\x84\x5d\x76\xbb\x1d\x81\
-\x40\x20\xfc\xcf\x80\x9e\xfe\xfe\xfb\xef\x08\x06\x83\xa2\x4f\xa9\
-\x54\x53\xd4\xce\xbc\x58\x72\x4b\x08\x51\x6d\x27\xab\x1d\xc8\xa8\
-\x49\x10\x36\xdc\x01\x80\x5c\x2e\xe7\x07\x20\x92\xc2\x1c\xbd\x56\
-\x3e\xa5\x58\x2c\x22\x97\xcb\x21\x95\x4a\xe1\xea\xea\xaa\x2e\x41\
-\xd8\x08\x98\xe5\x60\xf5\x8a\x5a\x8d\x0c\x39\x9f\xa1\x8a\x20\xd5\
-\x48\x29\xad\x29\xcc\xd1\xab\x41\x4a\xa9\x18\xf9\x7c\x1e\x57\x57\
-\x57\x78\xf3\xe6\x0d\x22\x91\x48\x5d\xfb\xb9\x46\xa3\x11\x76\xbb\
-\x1d\x66\xb3\xb9\xa1\xa3\x4f\x4d\x32\xea\x12\x44\x09\x29\x6a\x77\
-\x5f\xc5\x62\x51\x7c\xfa\x56\x3a\xa0\x5a\x5d\x5d\xc5\xf9\xf9\xb9\
-\xe2\xaf\x2f\x6d\xaf\x5d\x2e\x17\x86\x86\x86\xe0\xf1\x78\xea\x3a\
-\x62\xe5\xb2\x29\xa9\xcf\xa8\xa5\x66\x34\x24\x88\x52\x52\x4a\xb3\
-\xaf\x7a\x49\x61\x2b\xa3\x85\x42\x41\x5c\x70\x48\x24\x12\xd8\xd9\
-\xd9\xc1\xc5\xc5\x05\xcc\x66\xb3\x28\x46\xe9\x50\xaa\xd2\x35\x34\
-\x34\x84\x6f\xbf\xfd\x16\x3c\xcf\x43\x10\x84\x9a\x1f\xac\x29\xcd\
-\xa6\x98\x03\x1f\x1b\x1b\x13\x1d\x78\xad\x64\x34\x24\x48\x25\x52\
-\xd4\xc8\xbe\xa4\xab\x3e\x26\x93\x09\x26\x93\x09\xe9\x74\x5a\x14\
-\x27\x16\x8b\x21\x16\x8b\x95\x8d\xdb\x95\x08\x3d\x33\x33\xa3\xf8\
-\x91\xb6\x52\x32\xb6\xb6\xb6\x54\xab\x19\xaa\x08\xa2\x84\x14\x8e\
-\xe3\x10\x8f\xc7\x31\x3b\x3b\x5b\xb3\x4f\x61\x93\x41\xab\xd5\x8a\
-\x9e\x9e\x1e\xf4\xf4\xf4\x20\x9f\xcf\xdf\x39\xca\xea\xbd\x04\x41\
-\xb8\x35\xd8\x62\x33\x93\x7a\x52\x5b\x46\x46\x69\x6a\xdb\x12\x41\
-\x4a\x49\xe1\x38\x2e\x14\x8f\xc7\xb1\xb7\xb7\x77\xa7\xa6\xd4\xe2\
-\x53\xd8\xb8\xd3\xe9\x74\x62\x64\x64\x04\xf9\x7c\x1e\x47\x47\x47\
-\xec\x3f\x6a\x69\xc8\x18\x72\x1c\x07\x9f\xcf\x87\xde\xde\x5e\x58\
-\x2c\x16\x45\xa3\x04\xb9\x6e\x2a\x12\x89\xdc\x22\xa3\x9a\x03\xd7\
-\x44\x90\x72\xa4\x94\x66\x5f\x97\x97\x97\x35\xd5\x14\x76\x64\xf5\
-\xf6\xf6\xe2\xf3\xcf\x3f\x47\x20\x10\x40\x34\x1a\x45\x3a\x9d\x56\
-\xa5\x5b\x73\x38\x1c\x18\x1c\x1c\x84\xdb\xed\x16\x1f\x1c\xad\x37\
-\x9b\x6a\xb4\x66\x34\x45\x10\x46\x0a\xc7\x71\x77\x52\xe2\x50\x28\
-\x04\x4a\x69\x4d\x35\x85\x79\x03\x36\xae\xed\xef\xef\x47\x2a\x95\
-\xba\x73\x6c\xd5\x5a\x3b\xa4\x47\x96\xc5\x62\x81\xc1\x60\xa8\x48\
-\x48\xa5\x6e\xaa\x56\x07\xae\xa9\x20\x4a\x53\x62\x25\xf3\x14\xb9\
-\x5a\xc2\x16\xdd\xd4\xca\xae\xd8\xd3\xb8\x95\xb6\x1e\xcb\x75\x53\
-\x8d\xfa\x0c\x4d\x05\x51\x3b\x25\x66\x47\x17\xeb\xb8\x3a\x31\x9b\
-\x6a\xa9\x20\x4a\x53\xe2\xcb\xcb\x4b\xd1\xd1\x33\x52\x5a\x9d\x49\
-\x49\xe9\x93\xab\x19\x46\xa3\xf1\xd6\x3c\x43\x6d\x32\x9a\x2a\x48\
-\xa5\x94\x58\xda\x7d\x51\x4a\x45\x52\x4a\xb7\x47\x5a\x95\xda\xca\
-\xd5\x0c\x42\x48\xd9\x19\x78\x47\x08\xa2\xc4\xa7\x94\xa6\xc4\xcd\
-\xc8\xbe\x6a\xbd\xe2\xf1\x38\x5e\xbe\x7c\x89\xc5\xc5\x45\xfc\xf2\
-\xcb\x2f\xe2\x76\x48\x33\x6b\x86\xa6\x82\xc8\xf9\x94\x44\x22\x81\
-\x70\x38\x7c\xab\xa6\x70\x1c\xd7\xd2\xc9\xa3\x12\x9f\xd1\x6c\x32\
-\x34\x11\x44\x8e\x14\x8e\xe3\x68\x57\x57\x17\xd6\xd6\xd6\xb0\xbd\
-\xbd\x2d\x3e\x74\x3f\x37\x37\xa7\xea\x3c\xa5\x9e\xd4\x76\x69\x69\
-\x49\xd6\x81\x6b\x41\x86\xa6\x82\xc8\xf9\x94\x78\x3c\x8e\x70\x38\
-\x2c\xd6\x14\xf6\xc1\xf8\x5a\x92\x22\xad\x19\x4b\x4b\x4b\x2d\x25\
-\x43\x53\x41\xe4\xba\x2f\x4a\x29\xb5\xdb\xed\x77\xe6\x29\x6a\x4f\
-\x1e\xe5\xe2\xf7\x6a\xd9\x94\xdc\x46\xe1\x5b\x29\x48\x69\xf7\xc5\
-\x52\xe2\xbd\xbd\x3d\x4d\xb7\x59\xe4\x52\x5b\x46\x86\x56\xdd\x54\
-\x5b\x08\xa2\x34\xfb\x62\xa4\x34\x6b\xf2\x58\x2d\xb5\xad\xb4\x37\
-\xf5\x56\x0a\x52\xae\xa6\x34\x7b\x97\x98\x7d\x6c\xa0\x16\xa9\x6d\
-\x47\x09\xa2\xd4\xd1\x2b\x99\x3c\xd6\xb2\xf5\x1e\x8b\xc5\x44\x9f\
-\xd1\xac\x79\x46\x47\x0b\x52\x6d\xef\x4b\x2d\x52\xb4\x9c\x67\x74\
-\xb4\x20\x4a\x1c\x3d\x23\x45\xea\x53\xa4\xfb\x58\x4a\x32\xb0\x56\
-\x66\x53\x1d\x29\x88\xd2\x6d\x16\x4a\xa9\x38\x79\x54\x92\x7d\xb5\
-\x43\x36\xd5\x91\x82\x28\x25\x85\x4d\x1e\x95\x66\x5f\xad\x98\x67\
-\xbc\x55\x82\x28\x25\xa5\x5a\xf6\xa5\xc5\x76\xc8\xff\x85\x20\x4a\
-\x49\xa9\xb6\x21\x59\xee\x99\xbe\x76\x26\xa3\xad\x05\xa9\x77\x43\
-\x32\x9b\xcd\x56\x74\xe0\xcd\x9c\xf4\xbd\xd5\x82\xd4\xda\x7d\xb1\
-\xbd\xaf\x76\xcc\xa6\xde\x2a\x41\xca\xed\x7d\x49\x49\x71\x3a\x9d\
-\xc8\x66\xb3\x70\xb9\x5c\x38\x3b\x3b\xc3\x6f\xbf\xfd\x86\xd5\xd5\
-\x55\x44\x22\x11\xe8\x74\xba\xb6\xed\xa6\x3a\x52\x90\x4a\xd9\x57\
-\x30\x18\xc4\xf6\xf6\x36\xf4\x7a\x3d\x42\xa1\x10\xfa\xfa\xfa\x10\
-\x8b\xc5\xf0\xe2\xc5\x0b\x1c\x1f\x1f\x57\x7d\xda\xf5\x9d\x20\x4d\
-\xc8\xbe\xd8\x86\xe4\x9b\x37\x6f\xd0\xd3\xd3\x83\x6c\x36\x7b\xeb\
-\xa1\xfc\x4a\x4f\xbb\xbe\x13\xa4\x49\xd9\xd7\xfa\xfa\x3a\x76\x77\
-\x77\x71\x78\x78\x28\x7e\x90\xcb\xe3\xc7\x8f\x5b\x9e\xda\xfe\x5f\
-\x08\x52\x2e\xfb\xca\xe5\x72\xc8\x64\x32\xb0\x58\x2c\x8a\x9f\x76\
-\x7d\x27\x48\x13\x6b\x4a\x7f\x7f\x3f\x4e\x4e\x4e\xd0\xdb\xdb\x8b\
-\xaf\xbf\xfe\x3a\xfa\xe1\x87\x1f\x3a\xdb\xbd\x9b\x7a\xab\x04\x61\
-\x35\x25\x93\xc9\xc0\xeb\xf5\x86\x53\xa9\x94\x8f\xe3\x38\x0c\x0c\
-\x0c\x60\x64\x64\xc4\xd9\x89\x64\xb0\xeb\xbf\xc0\xfe\x62\x24\x59\
-\x8d\x7e\x20\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x27\xf8\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x20\x14\xa5\x72\x76\xb1\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x20\x00\x49\x44\x41\x54\x78\xda\xed\x9d\x49\
-\x90\x55\xd7\x99\xe7\x7f\xe7\xdc\x73\xa7\x37\x67\x92\x99\x24\x20\
-\x95\x35\x30\xc9\xc8\x56\xcb\xb6\x24\x6b\xc2\xbb\xae\xe8\xa8\x85\
-\x2d\xb7\xa3\x8d\xec\xe8\x85\x7b\x67\x2f\x5d\xcb\xea\x45\x6d\x6a\
-\x59\x5e\x56\xed\xec\xa5\xbd\xb4\x4a\xe5\x41\x72\x45\x74\x87\xa1\
-\xa3\x04\x48\x20\x09\x84\xb0\x04\x92\xa5\x84\x1c\xdf\x3c\xdd\xf9\
-\x9c\x5e\xdc\xfb\x32\x5f\x32\x48\x20\x01\x02\x87\x2f\xf1\x22\x33\
-\x21\xc9\xf7\xde\xf9\x9f\xff\xf7\xff\xbe\xff\xf7\x9d\x9b\xc2\x18\
-\xc3\xbd\x7e\xad\xac\xae\x70\xea\xad\xd3\xff\x02\xf0\xb5\xc7\x1e\
-\xff\xc9\xae\xc5\x5d\xf7\xec\x7b\x51\xf7\x32\x10\xc3\xe1\x90\x95\
-\xb5\x55\x2e\x7e\x78\xf1\x1f\xde\x7d\xf7\xdc\x8f\x95\x6d\x33\xd3\
-\x98\xf9\x89\x94\x92\x7a\xbd\x8e\xe7\x7a\x7f\x05\xe4\x8e\x32\x63\
-\x6d\x95\xdf\xbe\xfa\x3b\x73\xe2\xf5\x13\x7c\x70\xf1\x22\xb5\x6a\
-\x95\xe1\x70\x68\x86\xa3\xe1\x4f\x1e\x7b\xf4\xab\xff\xea\x2d\xfc\
-\x15\x90\x3b\xc8\x8c\x15\x4e\x9e\x7e\xdd\x1c\x3b\x7e\x8c\x37\x4e\
-\xbd\xc1\xfa\xfa\x1a\xb5\x4a\x0d\xe5\xd8\x18\xcc\xbf\xb8\xae\x7b\
-\xd4\xc0\xd9\xc6\x3d\xc6\x14\x75\x6f\x32\x63\x85\xdf\xfe\xe1\x77\
-\xe6\xd8\x6b\xff\x8f\xb7\xce\xbd\xc5\x7a\x77\x9d\x88\x98\x4e\xd0\
-\xe3\xf4\x99\xd3\x04\xe1\x18\x23\xcc\x99\x30\x0e\xff\xfe\xb1\x43\
-\x8f\xfd\x6c\x71\xe1\xaf\x80\xdc\x1e\x66\x8c\x86\x2c\xaf\xad\x72\
-\xf2\xcd\xd7\xcd\xd1\xe3\xc7\x38\xf5\xce\x9b\xb4\x86\x1d\x52\x5f\
-\xe2\xcd\xd4\x31\xa9\x66\xa3\xd7\xc1\xfc\xf9\x3d\xbc\x4a\x09\x23\
-\xf8\x67\xd7\x75\xff\x68\xe0\xf5\x99\x7b\x84\x29\xf7\x14\x20\xcb\
-\x6b\xab\xfc\xf6\x3f\x7e\x67\x8e\xbe\x76\x8c\x33\xef\xbe\x4d\x6b\
-\xd4\x41\xcc\xf8\xd4\x1b\xf3\xd4\x67\x67\xc8\xc2\x98\xb5\x8f\x2e\
-\xd3\x1d\x8c\x39\xfd\xee\x9b\x8c\xc3\x31\x5a\x98\x93\xe3\x28\xfa\
-\xd9\xe3\x87\x1e\xfb\xfb\x5d\x0b\x7f\x05\xe4\x96\x5c\x83\x51\xae\
-\x19\x27\x4e\xe7\xcc\x78\xe3\xdc\x69\x5a\xc3\x36\x69\xd9\xa2\xb2\
-\xbb\x41\x65\x71\x8e\xca\x4c\x83\x34\x8c\x29\x8b\x84\xfe\xf2\x3a\
-\x1b\xcd\x2e\xe6\xe3\xf7\x70\x4f\xf9\x18\xf8\xa9\xef\xba\xbf\x16\
-\x98\xa3\x8d\x7a\xe3\xae\x66\xca\x3d\x01\xc8\xca\xda\x0a\xff\xfe\
-\x87\xdf\x99\xa3\x27\x8e\x71\xf6\xfc\xdb\xb4\x82\x36\xe9\xac\x87\
-\xbb\xd8\xa0\xfc\xd0\x22\xde\x5c\x83\xcc\x73\x20\x76\xa9\xbb\x7b\
-\xb0\x6a\x2e\x9d\x0f\x2e\xd1\xeb\x8e\x79\xeb\xfc\x5b\x44\xe3\x31\
-\xc2\x98\x3f\x86\x61\xf8\x4f\x8f\x3f\xfa\xd8\xff\x5e\x5c\x58\xfc\
-\x2b\x20\x9f\x89\x19\xc3\x21\x2b\xeb\x5b\xcc\x38\xf5\xee\x69\x5a\
-\xe3\x0e\x49\x59\xe2\xed\x6e\xe0\xdf\x37\x8f\x5a\xac\xa1\x6b\x1e\
-\x91\x14\x90\x09\x94\x5b\xc3\xb3\x0d\xa5\x2c\x64\x24\x36\xd8\x58\
-\xe9\x22\x3e\x7a\x1f\xcf\xf7\x01\xfe\xc1\xf3\xdc\x57\x0c\x1c\x9d\
-\xb9\x4b\x99\x72\x57\x03\xb2\xb2\xbe\xc2\xcb\xaf\xfe\xce\x1c\x3b\
-\x71\x8c\x33\xe7\xdf\xa2\x35\xea\xe4\xcc\xd8\xd5\xa0\xf6\xe0\x2e\
-\xdc\x85\x3a\x59\xc5\x26\xb1\x33\x32\x0c\x42\x1a\x6c\x29\x10\x73\
-\x65\xaa\x62\x37\xca\x71\xe8\x69\x43\xb7\x33\xe2\xad\xf3\x6f\x13\
-\x06\x01\x06\xfe\x18\x6c\x6a\xca\xe2\x5f\x01\xb9\x59\xcd\x38\x76\
-\x32\xd7\x8c\xf6\xb8\x43\x5c\x96\xb8\xbb\x1a\xf8\xf7\xcf\xe3\xec\
-\xac\x43\xdd\x23\x51\x9a\x58\x66\x64\x68\x24\x02\x6d\x49\x6c\xa9\
-\x50\x56\x0d\x0f\x43\x1c\x86\x04\xa2\xc9\xfa\x6a\x07\xf3\xf1\xfb\
-\x38\x25\x1f\xe0\xa7\xbe\xe3\xfe\x5a\xc0\x5d\xa7\x29\x77\x25\x20\
-\x2b\x6b\x2b\xbc\xfc\x1f\x05\x33\xfe\xf4\x16\xed\xb0\x43\x36\xeb\
-\xe1\xed\x9a\xa1\xfa\xd0\x22\xce\xce\x3a\x69\xc5\x26\xb5\x35\x91\
-\xcc\x48\x85\xc1\x08\x83\x30\xa0\x4d\x46\xa6\x24\x8e\x2f\x91\x73\
-\x15\xaa\xec\xc6\xf6\x5d\xfa\x12\x7a\xed\x11\x6f\x9f\x7f\x9b\x68\
-\x14\xe4\x9a\x12\x85\xff\xf4\xf8\xa3\xff\xe5\xae\xd2\x94\xbb\x0a\
-\x90\xc1\x70\xc8\x72\xa1\x19\xc7\x8e\x1f\xe3\x8d\x77\x73\x66\x24\
-\x65\x0b\x6f\xf7\x0c\x5e\xc1\x0c\x59\xf7\x88\x2d\x4d\x2c\x35\x5a\
-\x80\x11\x80\x10\x18\x20\xc3\x80\xd4\x08\xdb\xc2\x2e\x2b\x6c\x59\
-\x43\x08\x48\xe3\x88\x31\x4d\x36\x56\xba\xf0\xf1\xfb\x78\x25\x2f\
-\xd7\x14\xd7\xbb\xab\x34\xe5\xae\x02\x64\x79\x7d\x85\x97\x5f\xfd\
-\xad\x39\x76\xe2\x18\x67\xff\xf4\x36\xed\xd1\x16\x33\xea\x0f\xee\
-\xc2\x59\xa8\x93\x95\x15\x91\xd4\x24\x22\xc3\x00\x16\x02\x0b\x89\
-\x29\xfe\x68\x40\x63\x48\xc8\x40\x82\xf4\x24\xd6\x6c\x99\x1a\xbb\
-\xb1\x1d\x97\x9e\x59\xa6\xd7\x1e\xf3\xd6\xf9\x33\x84\xe3\x00\x0d\
-\x7f\x1c\x47\xc1\xbf\x7e\xed\xd1\xc7\x7f\x72\x37\x68\x8a\xba\x6b\
-\x98\xb1\xb6\xc2\x89\x37\x4f\x9a\xa3\x27\x8e\x71\xea\xdc\x69\xda\
-\x41\xc1\x8c\x5d\x0d\xfc\xfb\xe7\x70\x16\x6a\xc8\xba\x47\x62\x69\
-\xb4\xd4\x08\x21\x90\x99\x41\x64\x1a\xb4\xce\xe1\x90\x20\x95\x05\
-\x52\xe4\xe0\x48\x41\x2a\x05\x76\xd9\xc1\xb6\x2c\x30\x90\x84\x31\
-\x63\x5a\x6c\xac\xf6\x60\xe9\x02\xce\x69\x1f\xe0\xc7\xbe\xeb\xff\
-\x1a\x78\xf5\x8b\x66\xca\x5d\x01\xc8\xf2\xda\x0a\x2f\xff\xe1\xb7\
-\x79\x9d\x31\xd1\x8c\x99\x22\x9b\x7a\x68\x31\x67\x46\xc9\x22\x96\
-\x29\x99\x00\x10\x38\x58\x90\x66\x64\x83\x80\x34\x8a\xc8\xb2\x0c\
-\xe9\x28\xbc\x46\x19\xe1\x2a\x52\x0c\x5a\x18\x32\xa3\xc1\x12\xe0\
-\x59\x58\x3b\x2a\x39\x53\x3c\x8f\x9e\x14\xf4\xda\x01\x67\xfe\x74\
-\x86\x78\x1c\x20\x0c\xaf\x84\x61\xf0\xb3\xc7\xbf\xf2\xf8\x17\x9a\
-\x7d\xa9\xbb\x43\x33\x4e\xe6\x15\xf8\xbb\xa7\xe9\x84\x5d\xd2\x29\
-\x66\x78\x0b\x75\x64\xcd\x23\x92\x19\x5a\x18\x40\x20\x52\x83\x8e\
-\x63\xf4\x20\x20\x69\x76\xc9\x46\x01\x59\x9a\x22\x7d\x07\x15\xa7\
-\xa8\x7a\x09\xe9\xda\x08\x5b\x62\x84\xc0\x48\xc8\x04\x88\x92\x8d\
-\x23\xeb\x08\x04\x49\x1c\x13\x98\x26\xcd\x95\x2e\x7c\xf4\x3e\xae\
-\xef\x63\x30\x3f\xf5\x3c\xff\x95\x2f\x92\x29\xea\x6e\xd0\x8c\xbc\
-\x02\x7f\x8b\xce\xb8\x9b\x6b\xc6\xee\x06\x8d\x07\x16\xf1\x16\xea\
-\x68\x5f\x91\x4a\x0d\x52\x60\x21\x90\x5a\x90\x04\x31\xa3\x76\x8f\
-\x68\xbd\x8d\x5e\xde\x40\xf7\x87\x18\xad\x11\xbe\x4b\xd4\xeb\xe3\
-\x2e\xcc\x52\x5e\x98\xc5\xae\x96\x30\xb6\xc4\x48\x81\x31\x86\x4c\
-\x82\x74\x25\x6a\xb6\x4c\x9d\x5d\x38\xb6\x43\x4f\x6b\x7a\xed\x31\
-\x6f\x6f\xd5\x29\xaf\x8c\xc3\xe0\x17\x5f\xff\xca\xe3\xff\xeb\x8b\
-\x60\x8a\xfa\x22\x35\xe3\xf8\xe9\x93\xe6\xe8\xc9\x5c\x33\x3a\xe3\
-\x09\x33\x66\x28\xdd\x37\x87\xb7\xd0\x40\xd5\x3c\x12\xa9\x11\x46\
-\x23\x53\xd0\x49\x4a\x3a\x8a\x89\xbb\x43\xc2\xf5\x36\xf1\x46\x1b\
-\xd3\xec\x60\x46\x41\xfe\x83\xc7\x11\x49\x92\xa1\xc3\x14\x15\x6b\
-\xc4\x6c\x1d\xab\xe6\x23\x3d\x07\x2c\x81\x90\x12\xa3\x24\xb2\xe4\
-\xe0\x4a\x0b\x61\x20\x09\x43\xc6\x34\x69\xae\xf5\x30\x4b\xef\xe3\
-\x9c\xf6\x00\x7e\x54\x72\xbd\x5f\x61\x0a\xa6\x78\x77\x8e\x29\xd6\
-\x3f\xfe\xe3\x3f\xde\x71\x40\xfe\xbc\xf4\x11\xff\xf6\xea\x6f\xcc\
-\xef\xff\xef\x2b\xbc\xf3\xa7\xb7\x69\x06\x1d\xf4\x8c\x8f\x77\xff\
-\x1c\xf5\x87\x76\x51\xde\x35\x0b\x65\x1b\xa3\x44\x21\xde\x20\xa2\
-\x94\xa4\x33\x64\xf0\xf1\x3a\xa3\x8f\x56\x49\x2f\x6f\x60\xda\x7d\
-\x4c\x92\x82\x94\xa0\xec\x3c\xff\x1d\xc5\x98\x41\x40\xda\x1f\x93\
-\x8d\x23\x24\x12\x65\x59\x38\xca\x46\x59\x6a\x33\x4d\x16\x96\x44\
-\xd8\x16\x8e\xe7\xa1\x1c\x9b\x24\x8d\x09\x83\x80\x5e\xb3\xcd\xa8\
-\x37\x40\x1b\xfe\xa7\x52\x6a\xe7\x4c\x7d\xe6\x37\xd5\x4a\xe5\x2f\
-\x93\x21\xdb\x98\x51\x64\x53\xdd\xa8\x4b\x5a\x56\xf8\xbb\x66\x28\
-\xdf\x3f\x4f\x69\xbe\x81\xaa\x7a\xa4\x52\x93\x99\x0c\xa2\x8c\x2c\
-\x88\x48\xfb\x43\xc2\x66\x97\xf0\x72\x93\xa8\xdd\x87\x71\x8c\x25\
-\x05\x76\xb5\x8a\xf2\x5c\x84\x52\xe8\x38\x25\xe9\x8d\xc8\xc2\x88\
-\x24\xee\x61\xa2\x18\xa9\x0d\xc4\x29\xec\x48\xb1\x6a\x25\x8c\x6b\
-\x23\x94\x05\x96\xc0\x2a\xb9\xd8\x52\x21\x04\x24\x71\xc4\xc8\x6c\
-\xd0\x5a\xee\xf1\xde\x47\x17\x70\x73\x56\xfc\xd8\xf3\xbc\x57\x0c\
-\xe6\xa5\x99\xfa\x0c\xfe\x1d\x60\xca\x1d\x05\x64\x33\x9b\x3a\x7e\
-\x94\x77\xce\xbf\x4d\x37\xe8\xa2\x67\x7c\xfc\x5d\x33\xcc\x3e\xb0\
-\x88\x37\xdf\x40\xf8\x0e\x08\xb0\x84\x40\xc7\x9a\xa0\x37\x24\x6c\
-\x76\x88\xd6\x36\x88\x5b\x3d\x92\x5e\x00\xa9\x01\xcf\xc1\x6e\xd4\
-\x98\xd9\xbd\x40\xa9\x5e\x45\x29\x45\x32\x0e\xe9\xae\xb6\x18\xb7\
-\x3a\x24\xdd\x1e\x59\x6f\xc8\x38\x49\x88\x06\x03\x86\xfd\x1d\x78\
-\x0b\xb3\x54\xe6\x67\x70\x2b\x25\x84\x05\x52\x0a\x84\x63\xe1\x34\
-\xca\x34\xbe\xb4\x0b\x5b\x39\x74\xb3\x49\xf6\x75\x96\x28\x08\xd1\
-\x98\x5f\x8f\xc2\xe0\xa5\x6f\x7c\xe5\xf1\xef\xf8\xde\xae\xbf\x0c\
-\x40\xb6\x33\xe3\x28\xa7\xde\x7d\xb3\xd0\x8c\x9c\x19\x95\xfb\x72\
-\x66\x38\x55\x9f\x14\x43\x12\x25\x24\x71\x4c\x34\x18\x12\xac\x77\
-\x08\x9a\x2d\xa2\x8d\x26\x59\x10\x22\x50\x58\x55\x1f\x35\x53\xc7\
-\x9f\x9f\xc5\xdd\x35\x8f\x5b\xab\xa0\x2c\x89\x0c\x22\x7c\xc7\x42\
-\x7b\x0a\x61\x4b\x92\x41\x9f\x34\x8e\x48\xda\x19\x22\xd3\xe8\x24\
-\x45\xa5\x1a\x39\x93\x60\x97\x3c\x70\x6d\x84\x65\xa1\x7c\x17\x35\
-\xa7\x10\x46\x92\x84\x09\x23\x9a\x34\xd7\xfa\x98\xa5\x0b\xd8\xb9\
-\xa6\x7c\xbb\xec\xf9\xdf\x16\xf0\xd2\x4c\x7d\xe6\xb6\x6a\xca\x1d\
-\xd1\x90\x3f\x2f\x7d\xc4\xcb\x7f\xf8\xad\xf9\xfd\xff\x7d\x85\xb3\
-\x53\x9a\xe1\xdf\x37\xc7\xcc\x83\xbb\xa8\x2d\xce\xa2\x4a\x2e\x42\
-\x0a\x48\x35\xc9\x60\x4c\x6f\x79\x83\xfe\xd2\x2a\xe1\xc7\x6b\x24\
-\xeb\x1d\x74\x18\x21\x6c\x1b\xb1\x30\x8b\x73\xdf\x4e\x6a\x0f\x2c\
-\xe2\xef\xde\x81\x68\xf8\x64\xbe\x45\xe2\x40\xea\x58\xc8\xb2\x87\
-\xaa\x96\x90\x95\x7c\xc1\x75\x96\xa2\xa3\x04\xc6\x31\x66\x18\x92\
-\x0c\xc7\x64\x41\x8c\x8d\x85\x6d\x29\x2c\x95\x3f\x72\x4d\x51\xb8\
-\x9e\x87\xe5\xd8\xc4\x69\x42\x18\x86\xf4\x9b\x6d\x46\xbd\x3e\xc6\
-\x98\x23\x96\xa5\xbe\x34\xd3\x68\xbc\x54\xad\x54\xef\x4d\x86\xe4\
-\xcc\x58\xce\x99\x71\x3c\x67\x46\x37\xec\xa2\xcb\x8a\xd2\xe2\x2c\
-\x95\xfb\xe6\xa9\xce\xcf\x60\x57\x3c\x52\x9d\x11\x8d\xc6\xa4\x83\
-\x80\x51\xbb\xcb\x68\x75\x9d\xa0\xd5\xc1\xf4\x47\x08\xad\xb1\x2b\
-\x3e\xd6\x6c\x0d\xb9\x7b\x01\x67\xe7\x0c\xce\x5c\x1d\x59\x76\x49\
-\x64\x5e\x00\x1a\x03\xd2\x96\xd8\xbe\x8d\xf4\x6d\x1c\x5f\x81\x67\
-\x23\x2d\x41\xbc\xd1\x25\xe9\x8e\xc8\xc6\x11\x59\x94\x60\x82\x04\
-\x95\x68\x4c\x94\xe0\xcc\xd5\x51\xd5\x12\xca\xb1\xb1\x7d\x17\x7b\
-\x4e\x21\x85\x24\x4d\x12\x86\x66\x83\xd6\x72\x97\xf7\x3e\xbe\x80\
-\xeb\xe7\xd9\x97\xef\xf9\x2f\x19\x78\x69\xf6\x36\x31\xe5\xb6\x32\
-\xe4\xcf\x4b\x7f\xe6\xa5\x57\x7f\x6b\x7e\xff\x7f\x5e\xe1\x9d\xf3\
-\x67\x68\x8d\x3a\x30\x53\xa2\xbc\x7b\x9e\xb9\x07\xf6\xd0\xd8\xb9\
-\x03\xa7\xe4\xa1\x8d\x26\x18\x8d\x19\x34\x3b\xf4\x96\x96\xe9\x5f\
-\x5e\x23\x6e\x76\xd0\x41\x88\xb1\x24\xf6\x4c\x95\xea\xfd\xbb\xa8\
-\xfc\xcd\x6e\x4a\xbb\xe7\x70\x66\xab\x64\xbe\x45\xac\x20\x96\x86\
-\x44\x1a\x52\x69\x48\x45\xfe\x30\x12\x2c\x5b\xe1\x78\x2e\xa5\x52\
-\x19\xc7\xf3\x49\x80\x2c\xd3\x10\xc4\x98\x71\x40\x3a\x1a\x11\x05\
-\x01\x91\xce\xd0\x52\x60\x2b\x07\xdb\x76\x50\x96\x85\x52\x0a\xc7\
-\x75\xb1\x94\x22\x8e\x62\xc2\x71\x40\xaf\xdd\x66\xd4\x1f\xa0\x8d\
-\x39\xa2\x2c\xf5\xa5\xc6\x6d\x62\x8a\xba\xdd\xcc\x38\x76\xfc\x18\
-\xa7\xce\xbd\x49\x6f\xdc\x43\x97\x15\xd5\x9d\xb3\xd4\xf6\x2c\x50\
-\xdd\xd1\xc0\xf6\x5c\xa2\x28\x62\x3c\x1a\x32\x6c\x77\x18\x35\xdb\
-\x8c\xd6\x9a\x24\xc3\x11\x42\x1b\x2c\xcf\x45\xd5\x2b\x78\xf3\x33\
-\xf8\xbb\xe6\x71\xe6\x6a\x98\xaa\x47\xea\x4a\x52\x91\x91\x48\x4d\
-\x26\x72\x53\x11\x40\x08\x41\xa6\x33\x8c\x25\x11\xd2\x42\x29\x0b\
-\xc7\x71\x90\xb6\x4d\x49\x82\xb4\x6d\x32\xab\x4b\xda\x1f\x11\x8f\
-\x43\x12\x9d\xa1\x30\xe8\x24\x43\x46\x1a\xea\x35\xbc\x92\x8f\x52\
-\x8a\xea\x6c\x1d\x4b\x43\x1a\x44\xf4\xd9\xa0\xb5\xde\xe5\x4f\x4b\
-\x17\xf3\x3a\xc5\xe4\x4c\xb9\x1d\x9a\x72\x5b\x18\xb2\xc5\x8c\x57\
-\x39\xfb\xde\x19\xda\xe3\x2e\x34\x4a\x54\xf6\xcc\x33\xff\xd0\x7d\
-\x34\x76\xce\x62\xbb\x36\x71\x18\xd2\x5f\x6b\xd1\xbb\xb4\xca\xe0\
-\xa3\x65\x82\xd5\x0d\xb2\xd1\x08\xa4\x40\x36\xaa\x78\xbb\xe6\x69\
-\x3c\xb0\x87\xca\x7d\x0b\xa8\x1d\x55\x74\xd9\x29\x58\xa1\x49\x84\
-\x21\x13\x1a\x23\xc0\x08\x03\x62\xf2\xec\x93\x4f\x0a\x98\x24\x48\
-\xdb\xc2\x2d\xfb\xb8\xe5\x12\xca\x77\x41\x29\xb2\x2c\x43\x47\x09\
-\x66\x1c\x92\x0d\x02\xa2\x61\x40\x1a\x25\x58\xd2\xc2\xb1\x6d\x1c\
-\xdb\xc1\x76\x1c\x5c\xcf\xc5\x72\x14\x51\x12\x13\x84\x01\xbd\x66\
-\x87\x51\x3f\xd7\x14\x65\xa9\x9d\x33\x8d\xc6\x6f\x6e\x25\x53\xd4\
-\x6d\x61\xc6\xa9\x93\xe6\xd8\xf1\xa3\x9c\x3a\xf7\x26\xfd\xb0\x0f\
-\x25\x9b\xea\xe2\x0e\x6a\xbb\xe7\xa9\x34\xaa\x58\x96\xc5\x78\x38\
-\x62\xd8\xee\xd2\x5b\xde\x60\xb4\xd1\x22\xea\x76\x21\x4b\xf1\x4b\
-\x1e\x76\xa3\x8a\xbd\x73\x47\x6e\x81\xec\x9c\x41\xd5\x7c\x12\x47\
-\x90\x48\x83\x20\x43\x00\x16\x20\x8c\x04\x01\x93\x81\x71\x51\xfc\
-\x91\x80\x24\x2f\x2a\x8d\x25\x90\x9e\x85\xe3\xb8\x08\xdb\xc3\xb3\
-\x5d\x3c\xc7\xc3\x53\x36\x51\xb3\x4b\xdc\x1d\x91\xf6\x02\x82\x71\
-\x8a\x1e\x27\xa8\xd4\x20\xa2\x04\xd3\xa8\xe3\xb8\x2e\xe5\x99\x1a\
-\x02\x48\xe3\x98\x1e\x1b\xb4\x97\xbb\xdb\xeb\x14\xdf\x7b\xc5\x14\
-\x4c\xb9\x15\x75\xca\x2d\x05\x64\x79\x6d\x99\x7f\x7b\x25\xaf\x33\
-\xce\x9e\x3f\x43\x7f\xdc\x43\xce\x54\xa8\x2e\xee\x60\xe1\x81\x3d\
-\x94\x1a\x55\x32\xa3\x19\xb4\x3b\x6c\xac\xad\x33\x58\x6b\x91\xac\
-\x77\xc9\x46\x21\x19\x50\xaa\xd5\x99\xdf\xbd\x48\x6d\x71\x07\xee\
-\x5c\x03\x59\x2f\x32\x28\x4b\xa0\x8b\x1d\x2f\xb0\x50\x80\x2e\x38\
-\x60\xb4\xc9\x1b\x54\x40\x4e\x14\x81\x30\x02\x61\x40\x16\xfd\x12\
-\x65\xc0\x32\x12\xdb\x76\xa8\xd4\x6d\x84\x5d\x26\x2b\x35\x18\x57\
-\x3a\x74\x2e\xad\x31\x68\x76\x09\x87\x23\x92\x71\x9b\xce\x28\x24\
-\xec\xf4\xa9\x2e\xce\x53\x9b\x9b\xa5\x56\xaf\x51\x6d\xd4\x50\x42\
-\xe2\xdb\x1e\xab\x89\xa1\xd7\x1e\x73\xe6\x7c\x5e\xa7\x18\xcc\xaf\
-\xc7\x41\xf0\xab\xaf\x3f\xf6\xb5\x17\x6f\x45\x9d\xa2\x6e\x0d\x33\
-\x06\x79\x9d\x71\x2a\xcf\xa6\x4e\x9f\x7b\x93\xfe\xb8\x8f\x28\x3b\
-\xd4\x16\x76\x50\xdf\x39\x8f\x5f\x2a\x41\x9a\x31\xea\x76\xe9\xb4\
-\x5a\xf4\x56\xd7\x19\x37\xbb\xd0\x0d\x90\x1a\x54\xd9\xc7\x51\x3e\
-\x9e\x53\xc2\x55\x1e\xb6\x96\xe8\x20\x25\x89\x23\x42\x99\xe5\xc2\
-\x2d\xf2\xc5\x37\x50\x84\xaa\x49\x60\x32\x45\x90\xca\xc1\x98\x04\
-\x2e\x6d\x26\x0f\x41\xde\x36\x91\x48\x14\x76\x0a\x36\x0a\xd7\xf6\
-\x70\x9d\x12\x91\x15\x10\x27\x23\xe2\x28\x24\x0b\x63\xb2\x20\x46\
-\x87\x19\x26\x48\x10\x71\x46\xb9\x5a\xc9\x5f\xff\xc2\x0e\xa2\x51\
-\x44\xd7\xac\x6f\x6a\x8a\x7d\xca\x03\x38\x52\xf2\xfc\x5f\x61\x78\
-\x69\xa6\xf1\xf9\x98\xa2\x6e\x0d\x33\x56\x78\xe9\x95\xdf\x98\x63\
-\xc7\x8f\x71\xf6\x4f\x67\xe8\x07\x7d\xd4\x4c\x85\xea\xce\x1d\xec\
-\xfc\xd2\x1e\x9c\x92\x4f\x38\x0a\x18\xb4\x3b\x74\x96\xd7\x18\xb6\
-\x3a\x44\x83\x31\x8c\x63\x88\x33\x2c\xdb\xc6\xb7\x5c\x5c\x63\x11\
-\xf5\xc7\x64\x69\x4a\xb6\x2e\x48\x54\x9e\x41\xe5\xe2\xcd\xa6\x0f\
-\xb5\x09\x81\x30\x9b\x50\x6c\x7d\xd8\x02\x64\xc2\x18\x69\xc0\xd2\
-\x60\x19\x81\x83\x44\x69\x89\xca\x80\x28\x83\x28\x45\x09\x0b\x21\
-\xac\xdc\xa3\x1f\x69\xb2\x68\xcc\x78\x98\x92\x76\x46\x84\xed\x3e\
-\xb5\x85\x1d\xcc\xed\x5c\xa0\x54\x2a\xb1\xfb\xc1\xfb\x29\x95\x4b\
-\x2c\xab\x8f\xe9\x75\x46\x9c\x7d\xef\x1d\xe2\x20\x00\x33\xc5\x94\
-\xcf\x71\x3e\x45\xdd\x0a\x66\xbc\x76\x6a\x92\x4d\x9d\xa6\x17\xf6\
-\xa1\x6c\xe3\x2f\x34\x28\xcd\xd7\xc1\x96\x84\xe1\x98\xee\x7a\x93\
-\xde\xda\x06\xfd\xe5\x26\x51\x77\x08\x71\x06\x59\xb1\x90\xca\x80\
-\xd6\xa4\x51\xc4\xb8\x9b\xa2\x87\x82\x84\x7c\x78\x21\x2b\xea\x8c\
-\x69\x30\xae\x58\xfb\x2d\x11\x37\x13\x25\xd9\x92\xf7\x4d\x60\x0c\
-\x39\x30\x48\x2c\x23\x50\x26\xff\x28\xb5\x20\x8b\x63\x8c\xd1\xf9\
-\x0f\x4d\x34\x3a\xca\xd0\x41\x42\x16\xe6\x8e\x81\x8e\x13\x14\x50\
-\x9d\x6d\x60\x97\x4a\xf8\x73\x75\x2a\xc1\x1c\x3d\x0c\xad\xd5\x0e\
-\xef\x2d\x5d\xc4\x39\xe5\x61\xe0\x88\xef\xfb\x2f\x21\xf8\xd5\x67\
-\xd5\x14\x75\x2b\x98\x71\xf4\xf8\x31\xde\x39\xff\x36\xbd\xa0\x8f\
-\x9c\x2d\xe3\x2f\x34\xa8\xed\x9a\x43\x3a\x16\xab\xed\x35\xc6\xed\
-\x1e\x51\xb3\x4d\xdc\x1e\x92\xf4\xa3\x7c\x67\x66\x45\x66\xa4\x20\
-\x13\x29\x41\x38\x20\xca\xc6\x08\x4b\x60\x2c\xf2\x62\x6f\x02\x42\
-\x91\x45\x5d\x75\xd6\x4b\x6c\xff\xd2\x4c\x91\x65\xfa\xd3\x4d\x80\
-\x0c\xa4\x88\x2d\xad\xd1\x02\xa1\x41\xa7\x9a\x34\x4d\x41\xe8\xad\
-\x6f\xd6\x60\xa2\x94\xb4\x37\x62\xa0\x53\xe2\x68\x4c\xa9\xd7\xa0\
-\xb2\xb8\x80\x53\x2a\xd1\xd8\x33\x87\xe3\x39\x6c\x18\x43\xaf\x33\
-\xe6\xec\xfb\xef\x10\x87\x21\x46\x88\x5f\x8e\xa3\xe0\xc8\x37\xbe\
-\xfa\xb5\xcf\xe4\x7d\xa9\xcf\xca\x8c\xcb\x6b\x2b\x1c\x3f\x75\x22\
-\x77\x6d\xdf\x3d\x4d\x2f\xe8\x63\xaa\x8a\xd2\xee\x59\xfc\xf9\x06\
-\xba\x6c\x11\x86\x21\x9d\x4e\x93\x71\xab\x83\x1e\x06\x10\xc7\x79\
-\x46\x24\x25\xa0\x91\xae\xc2\xae\x79\x08\xdf\x06\x45\x0e\x84\x04\
-\x23\x8b\x55\x94\x20\x30\x88\xe9\x85\x9f\x56\xf0\x6b\x80\xb2\xf9\
-\xef\x5c\xeb\xa8\x5e\x8e\xea\x04\x38\x63\x00\x2d\x90\x46\xe0\x66\
-\x02\x22\x8d\x1e\x25\xe8\x20\x26\x8b\x12\x74\xf1\x4d\x49\x1c\x13\
-\x77\x63\x22\x62\x12\x65\xa8\xce\xcf\x51\x9b\x9d\xa5\x62\xcf\x10\
-\x46\x21\x03\xd1\xa4\xb5\xd6\xe5\xbd\xcb\x17\xb1\xdf\xf4\x41\xf0\
-\xed\x92\xe7\x1f\x81\x9b\x67\xca\x67\x02\xe4\xf2\xda\x0a\x2f\xbd\
-\xf2\xef\xe6\xe8\x89\x63\x9c\x7b\xef\x0c\xbd\xb8\x0f\x73\x25\x4a\
-\x8b\xb3\x34\x1e\x5c\x44\xf8\x8a\x6e\xb7\xc3\xb0\xd3\x22\xea\x77\
-\xd0\x71\x88\xf0\x6c\x90\x36\x58\x29\x44\x29\x26\x4b\xb1\xeb\x3e\
-\xd5\x07\x76\x61\xcf\xd5\xd0\xae\x44\x2b\xc8\xc4\x15\x21\x4a\x98\
-\x2b\xd6\x78\xfa\x0b\xc3\x76\xb4\xae\x01\xd8\x54\xe8\xda\xfc\x37\
-\xb3\x15\xc6\x44\x11\xbe\x5c\x6d\x21\x86\x31\xf1\xc6\x80\xb0\xd9\
-\x23\xd8\xe8\x60\x74\x86\xac\x97\xc0\x15\xe8\x2c\x24\x0d\xc7\x0c\
-\x37\xd6\x40\x64\xb8\xd5\x12\x6e\xb5\xc2\xec\x43\xbb\x70\xca\x1e\
-\x2d\x95\x33\xe5\x9d\xf7\xcf\x92\x04\x01\xc2\x98\x5f\x8e\x83\xe0\
-\xc8\x37\x1e\xbb\x39\xa6\xa8\x9b\x66\xc6\xea\x0a\xc7\x4f\x9f\x28\
-\x66\x6d\xdf\xa4\x17\xf7\xd0\x15\x9b\xd2\xee\xbc\xd3\xe7\xec\xac\
-\x91\x92\x11\x8d\x0d\xa1\x95\x61\x5c\x89\x2d\x7d\x3c\xbf\x86\x48\
-\x04\x41\x73\x40\x32\x1c\x43\xaa\x91\x15\x07\x77\x71\x06\x6f\xcf\
-\x0e\x32\xdf\x22\xb5\x21\x45\x17\xa0\xe4\xeb\xa7\x85\xd9\x1e\x7e\
-\x8a\x45\x9d\x64\x57\xe2\x06\x00\x29\xea\x43\x40\x60\xcc\x76\x5d\
-\x11\x46\xe0\x18\x49\x49\x2b\x44\x2f\x42\x5a\x0a\x9d\xa6\x44\x83\
-\x41\xce\x9c\x99\x2a\xb2\xec\xa0\xd3\x80\x4c\xc7\xa4\x52\x13\x8b\
-\x8c\x44\x69\x9c\xb2\xc2\x29\x3b\xf8\xb6\xc0\xcf\x42\x86\x72\x83\
-\xe6\x72\x0f\x96\x2e\xe2\xe4\xac\xf8\x76\xc9\xf3\x8f\x18\xf8\xd5\
-\xec\x0d\x32\xe5\xa6\x00\xb9\xbc\x5a\x30\xe3\xf8\x51\xde\x79\xef\
-\x2c\xbd\xa8\x87\xd9\x51\xc6\xdb\x3d\x43\xed\x4b\x3b\xf1\x16\xea\
-\xa4\x25\x8b\x48\x6b\xac\x99\x12\xae\x98\x25\x73\x5d\x7c\xa3\xd8\
-\x59\x9f\x87\x51\xc2\x5a\xb6\xc4\x20\xcd\x85\x12\x4f\x21\xaa\x2e\
-\xa2\xee\x23\x4a\x16\xc2\xa6\x88\xe3\x79\x98\x32\x82\x62\xe2\xaa\
-\xd8\xe2\x66\x4b\xb2\x05\xd7\x3b\x3d\x7c\x75\xc8\xca\x07\x55\x44\
-\xf1\xff\xb7\x13\x0c\x03\x68\x89\xd0\x0a\x89\x40\x76\x5d\xa4\xa7\
-\xc0\x11\xd8\xd2\xa1\x3a\x3f\x83\xbb\xa3\x46\x66\x69\x22\x13\x33\
-\x4a\x02\x44\xd9\x43\x57\x1c\x52\x4f\x90\x09\x01\xd2\xa7\x66\xed\
-\xc2\x72\x1d\x7a\x1a\x7a\xad\x80\xb3\xef\xbf\x43\x14\x86\x68\xf8\
-\xe5\x30\x1c\xff\xe4\x89\xc7\xbe\x7e\x78\xcf\x0d\x30\x45\xdd\x0c\
-\x33\x5e\x3b\x75\x62\xd3\xb5\xed\xc5\x7d\xd2\x8a\x5d\x4c\x14\xce\
-\xa1\x76\xd6\x30\x55\x87\xd8\x32\x44\x1a\xa8\x7b\xd8\xb6\xc0\x2a\
-\x79\xf8\x38\x94\xca\xb3\xe8\xee\x18\xb9\x62\x83\x4d\x9e\x62\x2a\
-\x30\x8e\x44\x7b\x92\xcc\x93\x64\x76\xfe\x06\xb3\x4d\x41\x9f\xaa\
-\x32\xa6\xd6\x59\xdc\x74\x90\x15\x9b\x91\xcd\x98\x49\xc5\x92\xb3\
-\x43\x14\xf5\x89\xd6\x16\x38\x32\x1f\x8a\x50\x12\x94\x40\x28\x89\
-\x55\x76\xb1\x67\x2b\xd8\x25\x1b\x29\x33\xb2\x24\xc0\xd8\x92\xb4\
-\x62\x13\xb9\x45\x3b\xd8\x56\x58\x4e\x15\x4f\x14\x73\x5f\x62\x83\
-\xe6\x6a\x0f\x73\xe9\xe2\xa4\x9f\xf2\x7c\xd9\xf3\x7f\x24\x8c\xf9\
-\x45\x5e\xa7\xf8\x9f\x0f\x90\xcb\xab\x2b\xfc\xfa\x95\x97\xcd\xd1\
-\xe3\xc7\x38\xf7\xde\x59\x7a\xf1\x00\xbd\xa3\x8c\xbb\x7b\x86\xca\
-\x43\x8b\x38\x0b\x35\xe2\x92\x24\x53\x85\xe1\x67\x81\x56\x0e\x96\
-\x67\xe3\xd6\xc0\xd1\x16\x89\x51\x24\x43\x4d\x2a\x33\xb4\xd0\x18\
-\xa9\x31\x42\x93\x91\x92\x98\x94\xc4\x18\x52\x04\x29\x86\xac\x98\
-\x40\x34\x98\x6d\xa9\xee\x35\x45\xfc\x13\x61\x98\x62\x95\x99\x8e\
-\x68\x66\xab\x46\x11\x39\x58\x8e\xc9\x90\x64\xa4\x64\xa4\x42\x63\
-\xa4\x21\xb3\x0c\xa1\x4c\x91\xb6\xc1\xa9\xb9\xd8\xbe\x85\x6f\x7c\
-\x52\x69\x48\x94\x24\xb1\x0c\x46\x64\x48\x23\x70\x2c\x81\x9c\xf5\
-\xa9\xee\xdd\x85\xed\x3b\xf4\x24\xf4\x5b\x01\xef\x5c\x78\x87\x24\
-\x0c\x11\xc6\xfc\x3c\x08\xc6\xdf\xfe\xc6\x63\x5f\xff\x8e\xbf\xf8\
-\x19\x01\xd9\xce\x8c\x5c\x33\xfa\xf1\x80\xb4\x5a\x30\xe3\x6f\xe6\
-\xb0\x17\x6a\x98\xba\x4b\x24\x53\xe2\xcd\xc1\x67\x10\x42\xa2\x0a\
-\x57\xc9\xa4\x92\x24\x81\xc8\xd2\x64\xd2\x60\x64\x1e\x96\x4c\x61\
-\x10\x0a\xa1\x49\x85\xc8\x01\x29\x2c\x74\x7d\xa5\xa0\x7f\xc6\xeb\
-\x9a\x49\x58\x91\x0b\x48\x04\x12\x81\x25\x20\x15\x02\x0b\x4d\x86\
-\xce\x9f\x57\x82\xb1\xf2\xa2\x34\x52\x06\xcb\x93\x88\x92\x03\x52\
-\x61\xc8\x48\xd0\xe8\x3c\x0f\x43\x22\x30\x96\xc4\x11\x0a\xc7\xaa\
-\xe0\x09\x88\xe3\x98\x80\xbc\x9f\xf2\xfe\xd2\x05\x1c\xd7\x01\xcc\
-\xb7\x7d\xdf\xff\x91\x81\x5f\xcc\x5e\x87\x29\xea\x46\x35\xe3\xdc\
-\x7b\x67\xe8\x47\x7d\xf4\x5c\x25\xd7\x8c\x07\x17\x51\x0b\x55\x92\
-\xb2\x45\x62\xa5\x44\x56\x6e\x6f\x64\xc5\xae\x16\x40\x86\x26\xd3\
-\xf9\xc2\x4b\x29\x48\x2d\x8d\x96\x85\xc9\x24\x0d\x46\xe6\x0b\xaf\
-\x27\x99\x95\xcc\xb3\xac\x4c\x4e\xea\x90\x5b\x70\x97\x09\x71\xed\
-\xbf\x2b\x66\xee\x40\x6f\x3d\xbf\x98\xaa\x7d\x10\x79\xfa\x9d\x4a\
-\x43\x62\x19\x22\xa1\x11\x32\x23\x42\x93\x08\x4d\x26\x74\xfe\x1a\
-\x8b\x84\xc1\x68\x8d\x56\x02\x7c\x89\x35\xeb\x53\x63\x17\x4e\x71\
-\x3e\xa5\xd7\x1a\xf3\xce\x85\x73\xc4\x61\x84\x86\x9f\x8f\x82\xf1\
-\x8f\x9e\x78\xec\x1b\x87\xf7\x2c\xde\x20\x20\xdb\x98\x71\xe2\x28\
-\xa7\xce\xbf\x49\x2f\xea\x93\xd6\x6c\xdc\x89\x66\x2c\x54\xa1\xee\
-\x92\xa8\x94\xd0\x2a\x42\x95\x2c\x42\x8d\x00\x61\x0c\xc6\x08\x8c\
-\xc8\x77\x60\x26\x64\x9e\x31\xc9\xe9\x3c\xb4\xc8\xa4\x26\x1f\x37\
-\xed\x11\x73\x4b\xd8\xf1\x69\x97\x31\xa6\x78\xfe\x1c\x10\x39\x1d\
-\x1e\x27\x59\x5e\xb1\x49\x52\x61\x10\x18\x52\xa1\x49\x45\xf1\x5e\
-\xc5\xa4\x86\x34\x9b\xd6\xa7\x10\x22\xcf\xbe\x64\x05\xcf\x14\xe7\
-\x53\x68\xe6\x9a\x72\xf9\x22\xea\xb4\x0b\x86\xe7\xcb\x5e\xe9\x47\
-\x02\xae\xd2\x14\x75\x5d\xcd\xf8\xfd\xcb\xe6\xe8\x89\xa3\x9c\x7b\
-\xff\x2c\xbd\xa4\x8f\x99\xcf\xb3\xa9\xca\x03\x5b\xcc\x88\xd5\x84\
-\x19\x7a\x9b\xc5\xb1\x6d\x63\x9a\xa9\xd0\xb3\xad\xc0\x33\xdb\x4a\
-\x0b\xbd\xe9\xe0\x6e\x7f\xdc\x8e\x4b\xdc\xe4\x37\x99\x89\x9e\x4d\
-\xa6\xeb\xc5\x76\x73\x53\x14\x79\x75\x8c\xc1\x18\x83\xb6\x24\xf8\
-\x16\x6a\x47\x29\x67\x8a\xe7\xd0\x93\x86\x7e\x2b\xe0\xdc\x85\x73\
-\x24\x41\x84\x30\xfc\x7c\x3c\x1e\x1f\x79\xe2\xf1\x6f\xfc\xed\xb4\
-\xa6\xa8\xab\xbc\xa9\xd5\x15\x8e\xbf\x71\xdc\x1c\x7d\x2d\x67\x46\
-\x3f\x19\x90\xd5\xb6\xb2\x29\x7b\x67\x15\x53\x73\x73\x30\x64\x0e\
-\x46\x2a\x0d\x5a\x9a\x4d\x17\x76\xf3\x4d\x18\xb3\x29\xa2\x66\xb3\
-\x72\xb8\x7a\x99\xcd\x36\xe3\xe9\x4e\x0e\x26\x89\xcd\x2e\xca\xa7\
-\x3d\xf1\x66\x18\x13\x57\x80\x74\x65\x26\x28\xf3\x22\x47\x4a\x83\
-\x28\x2b\x1c\xab\xc8\xbe\xe2\x88\xc0\x34\x69\x5f\xee\xf3\xfe\xd2\
-\x45\x1c\xc7\x05\xc3\x7f\x2d\xf9\xa5\x1f\x19\xc3\x2f\x66\x67\x72\
-\xa6\x6c\x03\x64\x79\x75\x85\x97\x7e\xf7\xb2\x39\xfa\x5a\x9e\x4d\
-\xf5\xc3\x01\x66\xbe\x84\xbf\x67\x96\xea\x97\x76\xa2\x76\xd6\x48\
-\x4a\x92\xc8\xca\xc1\x88\xa7\x99\xb1\xe5\x4c\x4c\x4a\x86\xcd\x4f\
-\x4c\x41\x08\x63\xa6\xbe\xd8\xb6\x26\x53\x8b\x21\xc4\x74\x69\xfd\
-\x79\xe2\xd1\xd6\xcf\xbb\xce\x06\xd8\xf4\xbe\xc4\x75\xcc\x16\x41\
-\x3e\xac\x2d\xd8\xe6\x2a\x5f\x8b\xc1\x06\x93\xd7\x24\x16\x08\x6d\
-\x88\xc8\xf2\xf4\xd9\x93\x58\xb3\x25\x6a\xec\xc6\xb1\x3d\x7a\xd9\
-\x65\xfa\xcd\x60\x53\x53\x0c\xfc\x7c\x34\x0e\x7e\xf4\xc4\xe3\x5f\
-\x3f\xbc\x67\x57\x01\xc8\x60\x38\x60\x79\x65\x85\xd7\xde\x38\x6e\
-\x8e\xfe\xe7\x31\x4e\x17\xd9\x14\x35\x07\x6f\xd7\x2c\xde\x7d\x79\
-\x36\x45\xcd\x25\x51\x19\xf1\x55\x61\xca\x60\xc4\xa7\x6f\x6d\x73\
-\xc3\x7b\xf6\x0e\x93\xe4\xc6\x10\xfe\xc4\x22\x74\xd2\x0e\xd0\x40\
-\x26\xd9\x74\x28\x85\x10\xb8\x65\x1b\xd7\xaa\xe1\x6b\x41\x1a\xc4\
-\x8c\x4d\x93\xf6\x6a\x8f\xf7\x2f\x7d\x80\x73\xca\x43\x68\xf1\x7c\
-\xc5\x2f\x1d\x89\xc2\xf0\x57\x0a\x60\x79\x25\x67\xc6\xb1\xff\x3c\
-\xca\x3b\x7f\x3a\x4b\x3f\x1c\x62\xcd\x57\x29\xdd\x37\x43\xe9\xc1\
-\x05\xe4\xce\x2a\x69\xd9\x22\x56\x19\xb1\x95\x87\xa8\x6d\x60\x5c\
-\xe3\x25\x5e\xe1\x38\xe5\x99\xcd\xe6\xee\xbf\x32\x40\x9b\xab\x84\
-\x56\xdc\x04\x88\xd7\x5e\x68\x71\xc3\xeb\xbc\xfd\x96\x61\xdb\xf7\
-\xbe\xb9\x66\x90\xdd\xfe\x7e\xa7\x5b\x02\x7a\x9b\xf7\x6f\x40\x66\
-\xa0\x24\xd2\x95\xd8\xb3\x25\x66\x1e\xda\x8d\xe7\x7a\x74\xa4\x64\
-\xd0\x1c\xf3\xce\x7b\xe7\x48\x47\x11\x96\x11\xbf\xfc\xf0\xfe\x0f\
-\x7f\xa9\x56\x56\x57\xb8\xf8\xe1\xc5\x7f\x3e\x71\xf2\x04\x6f\xbc\
-\x79\x8a\xce\xa0\x8d\xa9\xda\x54\x66\xaa\x94\x17\xe7\x70\xe7\xea\
-\x64\x35\x97\x48\x25\xc4\x62\xba\x47\xc1\x75\xb3\x20\x71\x25\xa7\
-\xc5\xf5\xb6\xe4\x75\xa4\xdb\x98\xcf\x5a\x92\xdf\x5c\x54\xc3\x5c\
-\x11\x84\xae\x41\x0a\x73\x13\x1b\x60\x33\x51\x29\x92\x1b\x21\x10\
-\x18\xa4\xd4\xd8\x4a\x60\x97\x6c\x4a\xf3\x0e\x2a\x15\x84\xdd\x31\
-\xc3\x41\x4c\x6b\xa3\xcd\xc5\xc8\x50\x2b\xd7\x58\x5b\x59\x43\x9d\
-\x7a\xeb\xf4\xbf\x9c\x7b\xf7\xdc\x8f\x97\x3e\xfa\x88\x4e\xbb\x45\
-\x2c\x52\x4a\x6e\x99\x6a\xa3\x46\xa5\x5e\x25\x73\xed\xbc\x50\x63\
-\xeb\x31\xdd\x42\x9d\xb8\x4b\xe6\x13\x88\xbe\x6d\x07\x9a\xab\xb6\
-\xe4\x35\x43\xd6\xbd\x72\x9f\x3b\x73\x05\x28\x66\x3a\x88\x09\xf2\
-\xd4\x1f\xc8\x4c\x1e\xd6\x2d\xdb\xc6\x2b\xfb\xd4\xea\x35\xa8\x8e\
-\x19\xd8\x43\x46\xe3\x31\x1f\x7d\xf4\x11\xdd\x56\x37\xd7\x10\xc7\
-\xb1\x99\x99\x99\x61\xa6\x31\x4b\x67\xdc\xcd\x1b\x36\x41\x44\x32\
-\x0e\x31\x91\x85\xf1\x6c\x84\x9c\x54\xb6\x66\xcb\x29\x15\xd7\x5e\
-\xb8\xad\x90\x33\x69\x06\xdd\xe4\xbb\x13\xdc\x43\x70\x98\xeb\xb9\
-\x67\x53\x1d\xcb\xbc\xe7\x22\x52\x93\x4f\x4e\x8e\xe3\xbc\x5f\x9f\
-\x68\x94\x65\x51\xa9\x56\xd9\xb3\x7b\x0f\x0b\x3b\xe6\x51\x5f\x7b\
-\xec\xf1\x9f\xec\x98\x9d\xfd\x49\x18\xc7\xc6\x2d\xfb\xbc\x7e\xfa\
-\x24\xeb\xbd\x16\x6b\x1f\x5e\xa2\xac\x43\xaa\x6a\x0f\xca\xa9\xe1\
-\x48\x89\xb1\x24\xda\x18\x32\x63\x90\x26\xb7\xb2\xb9\x42\x43\xcc\
-\x36\xc6\x4c\x6b\xc6\xbd\xb2\xca\x9f\xef\xb5\x8a\xe9\x71\x24\x23\
-\x50\x46\x60\x1b\x89\x6b\x14\x32\x4a\x09\x37\x46\x44\x4b\x2d\x7a\
-\x1f\x5e\x26\x5e\x1f\x60\x19\x8b\x87\x1f\xde\xcb\xf7\xbe\xf7\x3d\
-\x1e\x3b\xf4\x55\xa1\x76\x2d\xee\xc2\x52\x8a\x20\x8a\x0e\x1b\xcc\
-\x1f\xc7\xa3\x21\x7c\x70\x9e\xce\x60\x40\xff\xf2\x06\xa2\xea\xe0\
-\x2b\x8d\x9c\xaf\xa0\xaa\x36\x76\x9e\x3b\xe4\x21\x4b\x17\x1d\xbe\
-\xab\xe2\xbd\x98\xda\xf0\xe2\xde\xd9\xf0\xb7\x20\x59\xdb\xec\xdd\
-\x6b\x81\xd2\x02\x47\x4b\xec\x44\x20\x82\x94\xb4\x3d\x22\xba\xd4\
-\x24\xbc\xd4\x24\x6a\x0d\xa9\xda\x25\xf6\xed\xdb\xcf\xf3\x4f\x1f\
-\xe6\xe9\x6f\x3e\x2d\x1e\x7d\xe4\x50\x1e\xb2\xea\xd5\x1a\x87\x0e\
-\x7e\xf9\xa8\x63\xdb\x3e\x98\xa0\x54\x2b\xf3\xfa\x99\x37\x58\x6b\
-\xb5\xe8\x7d\x70\x99\x38\x0b\xa9\x8a\xdd\x58\x56\x0d\xa7\x64\x61\
-\x84\xcc\xd5\x44\x6e\xbd\x1a\xcd\x74\x76\x64\xae\x48\x09\xc5\x5f\
-\xdc\xe2\x5f\xa9\x75\x93\xd0\x2c\x8d\x28\xc0\x00\x27\x93\x78\x5a\
-\x61\x05\x29\xf1\xc6\x80\x78\xa9\x45\xf0\xc1\x32\xd9\xda\x10\x99\
-\x0a\xf6\xee\xdf\xcf\x0f\xbf\xf7\x03\x9e\xff\xe6\xb3\xe2\xfe\x3d\
-\xf7\x6f\x55\xea\xae\xeb\xb2\xe0\xce\x03\x84\x71\x12\x1f\x46\xf0\
-\xc7\xf1\x78\x04\x7f\x7e\x97\x4e\x6f\xc0\xf8\xe3\x26\xca\x76\xf0\
-\x8c\x41\xce\x57\x71\xaa\x0e\xc6\xce\x5f\x52\x82\x26\x95\x53\x15\
-\xb8\xc8\x83\x96\x10\xe6\x8a\xfe\xb6\xb9\x1b\xaa\x8e\xdb\x53\xc2\
-\x4c\xc0\xd0\x22\x9f\x68\xd1\x02\x37\x93\x38\x31\x58\x41\x82\x6e\
-\x8d\x88\x2e\xb5\x08\x97\x9a\x24\x1b\x43\xea\x96\xcf\xde\x83\xfb\
-\xf9\xd6\x37\x0f\xf3\xdc\x37\x9f\x15\x8f\x3e\x72\xe8\xda\xd6\x49\
-\xce\x94\x43\x47\x6d\xc7\x9e\x35\xc2\xb4\xfd\x6a\x89\x37\xce\xbc\
-\xc1\xea\x4a\x8b\xbe\x5e\x26\x09\x23\xaa\xec\xc1\xb1\xea\x79\x87\
-\x4f\x8a\x22\x69\xd2\x18\xb1\x35\x5d\xc8\xa6\xd1\x66\xa6\x46\xa6\
-\xae\xc8\xe8\x85\xe0\x2f\x81\x38\x13\x43\x7a\x02\x86\xa5\x45\xce\
-\x8c\x4c\xa1\x82\x94\x6c\x63\x40\xb4\xd4\x62\x7c\x71\x99\x6c\x63\
-\x84\x15\x4b\xf6\x1e\x38\xc0\x0f\xbf\xfb\x22\xcf\x3f\xf5\xac\xf8\
-\x9b\x82\x19\xd7\x04\x64\x8b\x29\xa6\x13\x27\xf1\xdf\x1a\x78\x25\
-\x18\x8c\xe0\xc3\xf3\x74\x3a\x03\x02\x5a\xd8\x9e\x87\x27\x04\xd6\
-\x7c\x05\x57\xd8\x9b\x4c\x41\xe4\xcd\xa5\xab\xb9\x60\x6e\x9c\x05\
-\xf7\x1c\x61\xc4\x66\xc6\x99\x33\x43\xe2\x68\x89\x93\x80\x0c\x52\
-\xb2\x56\x2e\xe0\xd1\x52\x0b\xbd\x3e\xa2\x2e\x4b\xec\x3d\x90\x33\
-\xe3\xf9\xa7\x9e\x15\x5f\x99\x62\xc6\x27\xba\xbd\xf5\x6a\x9d\x47\
-\x0f\x1c\x7a\xd5\xb1\x9d\x59\x01\xed\x52\x25\xd7\x94\xd5\xb5\x16\
-\x7d\xb9\x4c\x12\xc7\xf9\x5d\x76\x64\x1d\xca\x12\x21\x64\xbe\xf0\
-\x72\xab\xfd\x7a\x25\x2c\x37\x4a\x88\xdb\xe9\xf2\xde\x4a\x97\x65\
-\x73\x0a\xc9\x08\x2c\x03\x2a\x13\xb8\x5a\xe2\x6b\x85\x0c\x53\x92\
-\xe6\x90\xe8\xe3\x26\xe1\x85\x65\xf4\xc6\x08\x15\x4b\xf6\x1d\xd8\
-\xcf\x0f\xbf\xfb\x22\xcf\x5d\x83\x19\x9f\x08\x48\xce\x94\x05\x80\
-\x4e\x9c\xc4\x7f\x0b\xbc\x32\x1e\x8e\xe1\xcf\x05\x53\x4c\x13\xdb\
-\x71\xf1\x0c\x39\x53\xaa\x36\xc6\x91\x08\xc8\x3d\xae\xe9\xe0\x64\
-\x3e\xc5\xfc\xbb\x97\xca\x0d\xb3\x95\xc5\x6f\x3a\x23\x3a\x4f\x6d\
-\xdd\x82\x19\x2a\x48\xd1\xad\x11\xf1\x52\x93\x68\xa9\x45\xda\x1c\
-\xd2\x90\x25\xf6\x1d\x38\xb0\xc9\x8c\x47\xaf\xc1\x8c\x1b\xea\x18\
-\x4e\x33\x05\x44\xbb\x54\x2d\xf3\xfa\xdb\x85\xa6\x64\x97\x49\x82\
-\x88\xaa\xd9\x5d\xdc\x02\x49\x61\x49\x09\x3a\x9f\x00\x9c\x18\x6c\
-\x93\xc2\x88\x49\xdd\x32\x6d\x1e\xdd\x86\x86\xa0\xb9\x43\xba\x21\
-\x8b\x0a\xd8\x2a\x52\x5b\xdf\x28\xac\x30\x25\x5d\x1f\x10\x2d\x35\
-\x09\x2e\x2c\x93\x36\x87\xa8\x58\xb2\xb7\x60\xc6\xf3\x4f\x6e\x65\
-\x53\x9f\x09\x90\x2d\xa6\x88\x4e\x9c\x24\x39\x53\x06\xa3\xbc\x4e\
-\xe9\x0e\x08\x68\x62\xbb\x0e\x9e\x00\xcb\x54\x71\x84\x8d\x56\x32\
-\xbf\x6b\x82\xce\x6d\x16\x69\xb6\xbc\x2d\xf1\x69\xc6\x9f\xd9\xda\
-\x7d\xe6\x1a\x26\xe5\x8d\x98\xb4\x37\x62\x4a\x8a\x9b\x94\xac\xe9\
-\x34\x57\x92\xdb\x21\x98\x3c\xc5\xb5\xb5\xc4\x49\x04\x32\x4c\x8b\
-\x6c\x2a\x67\x86\xde\xc8\x99\x31\xd1\x8c\xe7\x9e\x7a\x56\x3c\x7a\
-\xf0\xd0\xa7\x3e\xd7\x0d\x4d\x9d\xd4\x6b\x35\x1e\x3d\x70\xe8\x55\
-\xd7\x76\x7c\x89\x08\xca\x95\x0a\x27\xdf\x7e\x9d\xd5\xf5\x16\x7d\
-\x79\x99\x24\x89\xa8\x8a\x3d\x28\x59\xc3\x2d\x5b\x48\x21\x89\x84\
-\x26\x45\x17\x53\x82\xf9\x21\x1a\x23\xc4\x54\xd5\x2e\xb7\x2f\x8d\
-\x29\xea\x5b\x33\x35\x3e\x6a\xae\x8f\xc0\xa7\xb6\xdb\x3f\x65\xa5\
-\x27\x1b\x45\x5c\xc3\xa1\xbe\xbe\x80\xe7\x66\xa1\x55\x4c\xac\xd8\
-\xe6\x0a\xcd\x28\x98\xa1\x37\x86\xa8\xc4\x2a\x34\xe3\x07\x9f\xa8\
-\x19\x9f\x09\x10\xd7\x71\x59\x98\x9b\x47\x40\x98\x24\xc9\x13\xc0\
-\xc9\xd1\x70\x88\xf9\xf0\x3c\x9d\xde\x80\x60\xa9\x89\x72\x5c\x3c\
-\x63\xb0\x16\xaa\x88\x8a\x03\x4a\x60\x49\x49\x86\xc1\x2a\xe6\x67\
-\xf5\xc4\xe1\x11\x5b\x7b\x6e\x52\xd9\x4e\x1e\xc5\x3c\x62\xd1\xd8\
-\x32\x5b\xdd\x3a\x73\x8d\xf5\x36\x37\xe0\x89\x5f\x6f\xc7\x17\x3b\
-\x5c\x98\x2d\x9b\xe3\x5a\xff\x67\xba\x02\xcf\x05\x3c\xff\x3e\x65\
-\x24\x2a\x05\x2b\x48\xd1\xed\x11\xd1\xc7\x4d\xa2\xa5\x26\x59\x73\
-\x44\x43\x96\xd9\x77\x60\x3f\x87\x27\x9a\x71\x03\xcc\xb8\x29\x40\
-\x26\x57\xad\x56\xe3\xd0\x81\x2f\xbf\xae\x6c\x7b\x36\xc3\xb4\xbd\
-\x6a\x99\x37\xce\xbc\xc1\xda\x6a\x93\x81\xbe\x5c\xd4\x29\xbb\x71\
-\x44\x03\xe9\x5b\xa4\x8e\x24\x41\x6f\xbe\x19\x61\xc4\xb4\x4d\xbc\
-\x39\x63\x7b\x35\x20\x79\x63\x61\xeb\x40\xce\xf4\xee\xbd\xa2\x97\
-\x72\x5d\x73\xef\x53\x52\xd5\x89\xe9\x87\x44\x1a\xb9\x09\x8c\xb8\
-\x46\xc0\x93\x05\x78\x56\xf1\xda\x2d\x23\x71\x8d\x44\x06\x13\xcd\
-\x28\x2a\xf0\xe6\x10\x15\x5b\xec\x3d\x70\x80\x1f\xbc\x70\x84\xe7\
-\x9f\xfa\x74\xcd\xf8\x5c\x80\xb8\x8e\xcb\xfc\xdc\x3c\x06\x3a\x61\
-\x12\xbf\x88\xe0\x97\xe1\x70\x84\xf8\x20\xcf\xbe\x42\xd3\xc4\xf6\
-\xdc\x9c\xce\x3b\xaa\x58\x15\x07\xa9\xf2\x73\x80\xca\x48\xb4\x9e\
-\x80\x52\x64\xc9\xc5\x4e\xb3\x8d\x44\x18\x89\xa5\xf3\xb9\x2c\x5d\
-\x4c\xaf\xe8\x62\x40\x62\x2b\x23\x13\xd7\x91\x71\x73\x83\xca\x3e\
-\x69\x8c\x6f\xd9\x1c\x92\x7c\xb6\xd7\x29\x5e\x83\x2e\xfe\x6e\xeb\
-\x4c\xc9\x96\x49\xa8\xb4\x40\x19\x0b\x99\x6a\x64\x94\xa2\x9b\x93\
-\x3a\xa3\x89\x5e\x1f\x50\xb7\x4a\xec\x3d\x70\x90\xc3\x37\xa1\x19\
-\x9f\x0b\x90\x69\xa6\x7c\xf5\xc0\xa1\x5f\x79\xb6\xf3\x8a\x85\x68\
-\x6f\x6a\xca\x46\x93\x81\x75\x99\x34\x8e\xa8\x9b\x3d\xb8\xb2\x81\
-\x55\xb2\xf3\x91\x4c\x0d\x99\xce\x47\x77\xf3\xd6\x5a\xfe\x66\x5d\
-\x63\xe1\x19\x45\xa6\x2d\x32\x9d\xd7\x31\x13\x5f\x4c\x0b\x30\xfa\
-\xd3\xe4\xfc\x66\xf3\x2a\x71\x95\xf7\xe4\x68\x81\xaf\x15\x68\x0b\
-\x90\x24\xc5\x88\x29\x9b\x60\xe4\xa7\xae\x5c\x6d\x61\x19\x41\x16\
-\xc6\x84\x1b\x43\xc2\x4b\x4d\x82\x8b\xcb\x64\x1b\x03\x54\x22\xd9\
-\xf7\xd0\x7e\x7e\xf8\xc2\x91\x9b\xd2\x8c\x5b\x02\x88\xe7\xb8\x78\
-\xb9\xa6\x74\xd2\x42\x53\xc6\xc3\x11\x7c\xf8\x6e\x9e\x7d\x99\x26\
-\x8e\xed\x22\x35\x38\xf3\x75\xec\x92\x87\x42\x90\x6a\x89\xd0\x02\
-\x32\x20\x03\x91\x18\x64\xa4\x51\xe3\x0c\xcb\x08\xb4\x12\xc5\x00\
-\xda\xd6\xe8\xd0\xf6\x5f\xc9\x24\x6e\xa4\x4d\x74\xc3\xca\x2e\xa7\
-\x59\x9a\x81\x09\x32\xac\x50\x23\x63\x83\x48\x41\x28\xb0\x32\x81\
-\xad\x8b\x3a\x23\x06\xa2\x94\xb4\xa8\xc0\xc3\x4b\xcd\xbc\xce\xb0\
-\xca\xec\x7d\x68\x1f\xdf\x7a\xea\xe6\x35\xe3\x96\x00\x72\xa5\xa6\
-\xd8\x8e\xed\x1b\x21\x82\x52\xb5\xc2\xc9\xb7\x4f\xb2\xba\xda\xa4\
-\x97\x5d\x26\x1d\x47\xcc\x68\x81\x37\x6f\xe1\x7a\x2e\xa9\xc9\x77\
-\x18\x19\x90\x18\x4c\x90\x61\x7a\x21\xf8\x63\x84\xab\x90\xaa\xd8\
-\xbd\x93\x41\xb9\x4f\xec\x67\x5f\xaf\x15\x2c\x3e\xc5\x8b\x31\xdb\
-\x85\x9d\xdc\x2a\x17\xc6\xc2\xf4\x23\x4c\x3f\xc6\x8c\x33\x4c\x6c\
-\x90\x16\xa8\x0c\xdc\x4c\x52\xca\x14\x32\x35\x8c\x37\x06\x04\x97\
-\x36\x08\x3e\xb8\x4c\xd2\x1a\x62\xa7\x8a\x7d\x07\x0e\xf2\xc3\x17\
-\xbe\xcf\x73\x4f\x3d\x2b\xee\xdf\x7d\xff\xe7\x59\xd2\xcf\x07\xc8\
-\xa6\xa6\x08\xc2\x38\x4d\x0f\x0b\xf8\xe3\x78\x38\x44\x5c\x7c\x97\
-\x76\xb7\xcf\x58\x37\x71\x1d\x2f\x2f\x9c\x66\x1b\xa8\xd8\x20\xb3\
-\x5c\x47\x8c\x06\x1d\xc4\x84\xcd\x0e\x64\x19\xc2\xb6\x30\x96\x28\
-\xda\xc3\x66\xf3\xe3\xd5\x66\xfe\xf5\xf6\xfe\xf5\x00\xb9\x56\x75\
-\x62\xa6\x06\xb1\x73\x1f\x2a\xd6\x12\x3d\x4a\x08\xdb\x23\xe2\xc1\
-\x08\x1d\x67\x48\xd7\xc6\xce\x24\x76\x0c\x62\x94\x90\x05\x09\xe1\
-\x52\xde\xcf\xc8\x9a\x23\x66\xac\x32\x7b\x8b\x0a\xfc\xb9\xa7\x9e\
-\x13\x8f\x1e\xfc\xf2\xe7\x2e\x3a\x6f\xc9\x29\xdc\x7a\xb5\xc6\xa1\
-\xfd\x8f\x1c\x75\x95\x2d\x24\xc2\x54\x2a\x55\x4e\xbc\x79\x82\xd5\
-\x8d\x16\x1d\xb9\x8c\x89\x12\x3c\x6d\x61\x32\x8d\xc8\x40\x22\xd1\
-\x06\x92\x20\xa0\x77\x79\x85\x41\xab\x99\x9f\x2d\x94\xdb\xca\x92\
-\xcf\xe0\x6f\xdc\x64\xff\x77\x92\x6d\x69\x10\x5a\x60\x22\x8d\x0e\
-\x52\xd2\x28\x25\x4b\x63\x14\x3e\x8e\x91\x58\x61\x46\x14\xf7\x89\
-\xda\x03\xfa\x17\x2f\x13\xb5\x06\xd8\x99\xc5\xbe\x87\x0f\xf0\x83\
-\xef\x1e\xe1\xb9\x27\x9f\x15\xf7\xef\xb9\xef\x96\xb8\x00\xb7\x04\
-\x10\xd7\x71\x59\xd8\x31\x8f\x40\x90\xa6\xe9\x5e\xe0\xc2\xa8\x3f\
-\x80\x0f\xce\xd3\xee\x0d\x18\xe8\x26\x25\xcb\xc3\x72\x1c\xa4\x16\
-\x38\x9e\x4f\x66\x0c\x3a\x8b\xf3\xf1\xcb\x24\xc2\x64\x4c\x8e\x39\
-\x5d\x11\x69\xcc\xa7\x17\x7f\x37\x7b\x5e\xe1\xca\x1f\x39\x49\x36\
-\xb2\xc2\x29\x70\x24\x96\x5b\xc2\xf6\x3d\x64\x06\x59\x2f\x20\x1a\
-\x05\x84\xad\x3e\x71\x2b\xcf\xa6\xf6\xed\x3d\xc0\xe1\xa7\x0f\xf3\
-\xdc\x93\xcf\xde\x12\x66\xdc\x52\x40\x36\x35\xa5\x5a\xe5\x91\xfd\
-\x8f\x5c\x54\x4a\x09\x03\xa6\x54\xad\x70\xf2\xad\xd7\x59\x5b\x6b\
-\xb2\x16\x1b\x9c\x5a\x09\xe5\x7b\x54\x66\x1a\x24\xf5\x32\x89\x48\
-\x8b\xf3\x24\xa6\x38\xec\x39\x75\xde\xec\xca\xd5\xfb\xa4\x98\xf5\
-\x39\x01\x99\x1c\xdc\x91\x99\x40\xa6\xe4\xe7\xd8\xb1\x70\x94\x83\
-\x4e\x34\xe3\x41\x97\xd1\x6a\x8b\x64\x10\xa0\xb4\xc5\xbe\xbd\x05\
-\x33\x9e\xba\x75\xcc\xb8\x2d\x80\xb8\x8e\xcb\xfc\x0e\x17\x30\xc4\
-\x69\xf2\x04\x86\x93\xe3\xc1\x10\xde\x3f\x4f\xbb\xdf\x67\x18\xc6\
-\x94\xe7\x67\xf0\x66\x2a\x38\x8d\x32\xf8\x16\x89\x0d\x89\x05\xa9\
-\xcc\x8f\x2a\x98\xa2\x00\x30\xe2\x6a\x40\xcc\xb4\x4b\xbc\xfd\x48\
-\xd4\x0d\xb9\x53\xe2\x9a\x60\x14\x05\x62\xd1\x03\xb7\x33\x89\x95\
-\x80\x88\x34\x8c\x13\x92\x41\x40\xd2\x19\x92\x1a\x8b\x79\x62\x00\
-\x00\x07\x50\x49\x44\x41\x54\x74\x46\xd4\xdd\x0a\x7b\xf7\x15\xcc\
-\x78\xea\xd6\x32\xe3\xb6\x00\xb2\xc5\x94\x1a\x87\xf6\x3f\xf2\xba\
-\xa3\x6c\x21\xc1\x54\x2a\x55\x8e\x9f\x3a\xc9\x4a\x77\x83\x91\x25\
-\x91\xae\x62\x61\xe7\x2c\xa5\x85\x06\xa6\x6c\x93\x3a\x82\xa8\x60\
-\x8b\x2e\x0a\xc3\xcd\xf3\xe9\x9b\xfd\xc6\x1b\xa9\x38\xc4\x27\xd4\
-\x29\xa6\x20\x9e\xb8\x62\x20\x61\x0a\x0c\x9d\xf7\xc0\x19\x25\x84\
-\xcd\x01\xa3\x61\x8b\xd1\x46\x97\xa4\x3b\xc6\x11\x36\xfb\x1f\x3a\
-\xc8\x8b\xff\xfd\x08\xcf\x3e\xf5\xcc\x2d\x67\xc6\x6d\x05\x24\x67\
-\x4a\xae\x29\x59\x9a\xee\x01\x2e\x0f\x07\x43\xb8\x20\x68\xc7\x43\
-\xe2\xee\x90\x64\x30\xc6\xd4\xcb\x38\xb5\x12\x4e\xc9\x41\xd9\x9a\
-\xb8\x38\xb1\x94\x4e\x81\x82\xd8\x3e\x39\x3f\x3d\xc3\x62\xae\xe7\
-\xe1\x6e\x3b\x89\x7b\x0d\x40\x26\xc7\x54\xcc\x56\x0f\xdc\xc9\xf2\
-\xe9\x10\x3b\x30\xa4\x59\x4a\x36\x0c\xf3\x3b\x9c\x8e\x22\xea\x5e\
-\x85\xfd\x0f\x1d\xe4\x5b\xcf\x3c\xcf\x73\x4f\x3d\x23\x0e\xdd\x06\
-\x66\xdc\x56\x40\x26\x57\x35\xd7\x94\x65\xa5\x6c\x61\x84\x34\xe5\
-\x5a\x8d\x13\xa7\x4f\xb0\xb6\xde\x64\x4d\xa7\x8c\xc6\x23\x66\xcc\
-\x1e\x3c\xab\x81\xae\xd8\x18\x05\x89\xc9\x88\x85\xce\xef\xdd\xce\
-\xd6\xc8\xbf\xce\xe7\xeb\x8b\xee\x64\x3e\xb6\x69\x3e\x8d\x21\x62\
-\x7b\x8d\x22\x04\x53\x66\x62\x0e\x8a\x32\x02\xd7\xc8\xbc\x70\x8d\
-\x12\xc2\x8d\x21\xe3\xa5\x16\xbd\x8b\x97\x88\x5b\x43\x94\xb6\xd8\
-\xbf\xff\x20\x3f\xf8\xee\xed\x65\xc6\x1d\x01\xc4\x75\x5c\xdc\x1d\
-\x6e\x7e\x0b\x91\xac\xc8\xbe\x06\x7d\x78\xff\x1c\xed\x5e\x9f\x2e\
-\x6b\x88\x92\xa2\x6c\x69\x6c\x51\xc3\x48\x07\x63\xe5\x61\x2b\x2b\
-\x4e\x2b\x6d\x1e\x77\x9b\x6e\xa8\x4c\xb9\xb9\x57\x9c\x62\xcf\xbd\
-\xb2\x69\xff\x51\x6c\xfa\xc7\x5b\x60\x50\xb4\x5d\x11\x58\x80\xce\
-\x32\x92\x20\x25\x6a\x8f\x09\x2e\x37\x09\x2f\xb7\x88\x5a\x03\x6a\
-\xaa\xc4\xfe\x87\x0e\x72\xf8\xe9\xe7\x79\xf6\x36\x33\xe3\x8e\x00\
-\xb2\x2d\xfb\xda\x77\xf0\xa2\x6d\x29\x01\xc6\x54\xaa\x15\x8e\x9f\
-\x3e\xc1\x6a\xbb\x49\xe7\xc3\xcb\x44\x59\x44\x5d\xee\xc1\x96\x75\
-\x64\x59\xa1\x94\x24\xcd\x7f\x35\x4b\xee\x6d\x4d\x86\xbb\xa7\x90\
-\x30\xf2\x1a\x23\x46\xe6\x5a\x0a\x92\x27\x09\x5b\xc3\x08\x45\x8a\
-\x5b\x00\xe3\x60\x21\xe3\x84\x71\x6b\x40\x74\xa9\x45\xf0\xe1\x0a\
-\x7a\x63\x8c\x6d\x14\xfb\x1f\x2e\x98\xf1\xe4\xed\x67\xc6\x1d\x05\
-\x64\x2b\xfb\x82\x24\x4b\xf6\x22\xb8\x30\x1c\x0e\xe1\x83\x77\x69\
-\xf7\x7b\x8c\x96\x9a\x58\x8e\x83\x8f\x41\x2d\xd4\xb0\xa4\x83\x9a\
-\x9c\x59\x47\x6c\xbf\x3f\x96\x31\xdb\x0f\xdc\x4c\xdf\x20\x40\x98\
-\x6b\xa4\xc6\x5b\x56\x89\x2c\x92\x32\x81\x40\x21\x51\xa9\x80\x20\
-\xf7\xa6\x82\x4b\x2d\xc2\x4b\x2d\xd2\xd6\x88\x19\xbb\xc2\xfe\xfd\
-\x79\x05\xfe\xec\x93\x77\x86\x19\x77\x14\x90\xed\x4c\x79\xe4\xa2\
-\xad\x6c\x81\xc0\x94\x6b\x79\x45\xbf\xb2\xb6\x4e\x5f\x5f\x26\x09\
-\x43\xaa\xdc\x87\x6d\xd5\x71\xca\x0a\xa4\x2c\xee\x18\x97\xdf\x7a\
-\x69\xfa\x06\x02\x93\x33\xec\x9f\x56\x64\x88\x2b\x52\x5b\xa9\x41\
-\x69\x81\x67\x6c\x54\x98\xe4\xfd\x8c\x8f\x9b\x8c\x2f\x2e\xa3\x5b\
-\x63\x9c\xcc\x66\xdf\xde\x03\xbc\xf8\xc2\x11\x9e\xbb\x83\xcc\xf8\
-\x42\x00\xd9\x64\x8a\x98\xd6\x94\x01\xe2\x82\xa1\xd5\xeb\x11\x88\
-\x16\xca\xf7\x40\x82\x35\x5f\xc5\x16\x36\x99\x2d\x30\xc5\x98\x51\
-\x2a\x4d\x3e\x57\x7c\x9d\xb3\x23\xe6\x8a\x84\x6b\xfb\xa8\x4e\x31\
-\xf8\x3c\x99\xb5\x0d\x13\xb2\xe6\x90\x70\xa9\x49\x74\xa9\x85\x69\
-\x8d\x99\xb1\xca\xec\x7b\x38\xef\x67\xdc\x69\x66\x7c\x21\x80\x6c\
-\x32\xa5\xb2\xa5\x29\x02\x4c\xb5\x5a\xe5\xf8\xe9\xe3\x2c\x6f\x6c\
-\x30\x90\xcb\x79\x8f\x9e\x5c\x53\xdc\x8a\x85\x2c\x6e\xe7\x64\x4c\
-\x21\x00\x52\x14\x47\xf6\xb7\x1f\xc2\xbc\xaa\xe5\xca\xd4\x78\x67\
-\x26\x70\xb5\x85\x6f\x14\x22\x4c\x88\xd7\xfb\x44\x1f\xb7\x88\x2e\
-\x2e\x63\x5a\x63\x9c\x4c\xb1\x7f\xef\x41\x5e\x7c\xe1\x08\xcf\x3e\
-\x71\xe7\x99\xf1\x85\x02\xe2\x3a\x2e\xf3\xb3\x6e\x7e\xb7\xcf\x2c\
-\xdd\x23\xe0\xf2\x70\x38\xc0\x5c\x7c\x97\x76\xaf\x47\xf8\x71\x0b\
-\xdb\x76\xc1\x18\xac\x9d\x35\x1c\x1c\x8c\x2d\xc1\x32\x24\x22\xbf\
-\x63\x90\x91\xc5\xe9\x7f\xb3\x75\x1e\xc5\x5c\x07\x0c\x7b\x6a\xa2\
-\xd0\x0a\x12\xb2\xe6\x28\x07\xe3\x52\x93\xac\x35\x66\xd6\x2a\xb3\
-\xff\xe1\x83\x1c\xfe\xe6\xf3\x3c\xf7\xe4\x33\xe2\xd0\x81\x2f\xf3\
-\x45\x5d\x5f\xe8\x6f\xd8\xa9\xe6\x4c\x59\x56\x4a\x09\x23\x30\xe5\
-\x6a\x95\xe3\x85\xa6\x0c\xf4\x65\x92\x28\xa4\x26\x04\xb6\x6c\x20\
-\xca\x0a\x99\xdf\x0f\x63\x73\x9e\x38\xd3\x82\xc9\xd0\xa4\xe1\x1a\
-\x47\x02\xa6\xc6\x3b\x4b\x5a\x21\x83\x84\x74\xad\x4f\xb8\xd4\x22\
-\xdc\xd4\x0c\xc5\xbe\xbd\x07\x79\xf1\x3b\x85\x66\xec\xbe\xef\x8b\
-\x5c\x92\x2f\x16\x10\xd7\x71\x71\x67\x8b\x3a\x65\xe2\x12\x0f\x86\
-\x9b\x9a\x12\x7e\xdc\x9a\xdc\x77\x0a\xb5\x90\x4f\xdd\x6b\x7b\x6a\
-\x8c\x48\x6e\x89\xbd\x9e\x06\xa3\x68\x3a\xd9\x46\x14\xcc\x10\x88\
-\x71\xce\x8c\xf0\xe3\x16\xf1\xa5\x26\xa6\x39\x66\x56\x95\xd9\xb7\
-\xf7\x20\x87\x9f\x7a\x3e\xd7\x8c\x2f\x90\x19\x77\x05\x20\x57\x69\
-\x8a\x52\x42\x20\xf2\x3a\xe5\xd4\x71\x96\xd7\x37\x8a\x59\xe2\x42\
-\x53\x44\x1d\xb7\xac\x10\xae\x95\x7b\xe5\x05\x10\x7a\x2a\xdd\xcd\
-\x8b\xbe\xbc\xed\xea\x14\xb3\xb6\x62\x1c\xe7\x9a\x51\x30\xc3\xb4\
-\xc6\xb8\xda\x66\xff\x83\x39\x33\x9e\xbd\x0b\x98\x71\x57\x01\x32\
-\xad\x29\x59\x9a\xce\x02\xed\xdc\xfb\x3a\x97\x67\x5f\xc5\xf9\x14\
-\x8a\xb9\x2f\x07\x07\xe3\xe4\x55\x77\x22\x0c\x19\xc5\x0d\xcd\x26\
-\xd3\x84\x66\xab\x07\xbe\xa9\x19\x93\xe9\x90\xf6\x98\x59\x55\x61\
-\xff\x83\x07\xf8\xd6\x53\x87\xbf\x70\xcd\xb8\x2b\x01\x99\xd6\x94\
-\x83\xfb\x0e\x76\x94\x52\x02\x81\xa9\xd4\x8a\xec\xab\xd0\x94\x34\
-\x0c\x8b\xec\xab\x81\x10\x76\xfe\x1b\x72\xb4\x26\x11\x90\x15\xb6\
-\xa3\xa5\xd9\x9a\xb5\x0d\x12\x92\xd5\x7e\xde\x76\xfd\x60\x19\xdd\
-\x1e\xe3\x6a\x87\xfd\xfb\x1e\xe1\x07\xdf\xf9\x3e\xcf\x3e\xf1\xf4\
-\x5d\xc3\x8c\xbb\x12\x90\x89\xa6\x00\x24\x3a\xcb\x5d\xe2\xfe\x00\
-\x2e\x18\x5a\xbd\x2e\x01\x4d\x94\xe7\x16\x73\x5e\x75\x1c\x5c\xb0\
-\x25\xd2\xca\xbd\x2f\x51\x38\xb7\x76\x0a\x72\xba\xce\x58\x6a\x41\
-\x33\x60\xd6\xae\xb2\x7f\x5f\x51\x67\x3c\xf1\x8c\x38\x74\xe0\x11\
-\xee\xb6\xeb\xae\xfc\x6d\xd1\xd5\x4a\x95\x47\x1e\x3e\xb0\x6c\x4b\
-\x4b\x60\x28\xbc\xaf\xe3\x2c\x6f\xac\x33\x90\xcb\xa4\x49\x4c\x15\
-\x81\x23\x66\x90\x15\x1b\x1b\x49\x6a\x34\xc2\x08\x5c\xa3\x20\x48\
-\x08\xd7\x73\x66\x04\x1f\x2c\x43\x33\xc0\xd5\x0e\x07\x1e\x3c\xc8\
-\x8b\xdf\xf9\x7e\x5e\x67\xec\xde\x73\x37\xbe\xf5\xbb\x13\x90\x69\
-\xa6\xa4\x13\x4d\x19\x0e\x31\x17\x05\xed\x7e\x37\xd7\x14\xe5\x22\
-\xb4\xc0\x59\xa8\x63\x97\x5d\x8c\xb4\xf2\x01\x8a\x28\x25\x6a\x8f\
-\x88\x96\x9a\x44\x97\x9a\x79\x05\x6e\x57\x39\xf0\xe0\x41\x0e\x3f\
-\x75\xf7\x32\xe3\xae\x06\xe4\x4a\x4d\xb1\x94\x12\x46\xe6\xde\xd7\
-\xf1\x53\xc7\x59\x59\x5d\x67\x90\x5c\x26\x1b\x47\xcc\x64\x82\xd2\
-\xc2\x0e\x6c\xcf\x45\xc7\x29\xe3\x8d\x01\xd1\xf2\x06\xe1\x87\x2b\
-\x64\xed\x51\xae\x19\x0f\x1e\xe4\xc5\x17\xee\x6e\x66\xdc\x13\x80\
-\x6c\xab\x53\x74\xb6\x17\xc4\x85\x51\x7f\x88\x78\x0f\x5a\xbd\x0e\
-\x81\x69\xe1\x39\x25\xec\x44\x60\x55\x2a\x64\x51\x42\x70\x69\x83\
-\x68\xa5\x05\xcd\x31\xb3\x4e\x95\xfd\x0f\xde\xdd\x9a\x71\x4f\x01\
-\xb2\xad\x4e\x79\xf8\xc0\x45\xc7\x52\xc2\x42\x98\x5a\xb5\xca\x7f\
-\xbe\xfe\x1a\x2b\x1b\x1b\x74\xb8\x4c\xd8\x19\x52\x6d\x34\x30\x71\
-\x4a\x7f\x69\x8d\x74\x10\xe0\x0a\x87\x83\x0f\x3e\xc2\x91\x17\xfe\
-\x07\xcf\xdc\x03\xcc\xb8\xa7\x00\xd9\xaa\x53\x04\x59\xa6\x7d\x0c\
-\xc1\xb0\x3f\x80\xf7\xce\xd1\xea\xf7\x18\x0e\x37\xd0\x9d\x10\xa9\
-\x21\x6d\x8f\x69\xf8\x55\x0e\xec\x7b\x84\xc3\xdf\x7c\x9e\x67\x9f\
-\x78\x46\x7c\xf9\x1e\x60\xc6\x3d\x05\xc8\x34\x53\x0e\x3c\xbc\x3f\
-\x54\x96\x25\x00\x53\xa9\xd6\xf8\xcf\xd7\x5f\x63\x79\x75\x99\x71\
-\x2f\xc6\xb1\x1d\x7c\xdb\xe5\x91\xbd\x8f\xf0\xfd\x17\xbe\xcf\x33\
-\x4f\x3e\x2d\xee\xbb\x47\x98\x71\x4f\x02\xe2\x38\x0e\x73\xb3\x3b\
-\xf2\xec\x2b\xcb\x7c\x81\x08\x46\xbd\x01\xb6\x96\x8c\x86\x23\x2a\
-\x95\x2a\x7b\xf7\xee\xe3\xb9\xa7\x9f\xe3\x99\x27\x9f\xbe\xa7\x98\
-\x71\x4f\x02\x72\x25\x53\x6c\x4b\x09\x89\x34\xbb\x17\x77\xf3\xc1\
-\x07\x1f\x30\x3f\x37\xcf\xdf\xfd\xb7\xbf\xe3\xeb\x5f\xfb\xc6\x3d\
-\xc7\x8c\x7b\x1a\x90\x09\x53\x92\x38\xa1\xf9\xe0\xc6\xcf\x86\x83\
-\xe1\x4f\x87\xfd\x21\xbb\x16\x17\xf9\xea\xa1\xaf\xdc\x93\xcc\x98\
-\x5c\xff\x1f\x09\x27\xd5\xcd\x73\xd2\x92\x3d\x00\x00\x00\x00\x49\
-\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\x8a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe4\x03\x15\x03\x35\x37\x79\xac\xf7\xa9\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x02\xee\x49\x44\x41\x54\x48\xc7\xb5\x96\x4f\
-\x68\x54\x57\x14\xc6\x7f\xef\xdd\x79\x77\xde\x4b\xe2\x4d\x34\x8e\
-\xd6\x3a\x16\x2c\x91\x82\x44\x14\xc4\x01\xdd\xb8\xb0\xab\xd1\xa8\
-\xc4\xe2\xac\x6c\xa4\x9b\x50\xd2\x89\x15\x04\x41\x41\x10\xc4\x85\
-\xae\xfc\x13\x41\x17\x81\x41\xb1\x46\x8b\x88\xd5\x20\x42\xbb\xf0\
-\x0f\x96\xd0\x1a\x05\x95\x2e\x14\x69\x35\x14\x49\x10\x1c\x4d\xf2\
-\xf2\x66\xee\x5c\x17\x97\x90\x8c\x8e\x92\x09\xc9\x07\x0f\xde\x3b\
-\xdc\x7b\x3e\xce\x77\xcf\xf7\xce\x85\x49\x50\x4a\x65\x83\x20\xe8\
-\x97\x52\x16\x00\x53\xcd\x23\xa5\x2c\x04\x41\xd0\xaf\x94\xca\x4e\
-\xce\xe9\x00\xb4\xb5\xb5\xcd\xe9\xe9\xe9\x79\x12\x86\x61\x52\xd5\
-\x08\xd2\x29\x41\x42\x69\x1c\x34\x53\x81\x41\x30\x98\x17\xf4\xf6\
-\x69\xf2\x23\x1a\xdf\xf7\x5f\x66\x32\x99\xe5\xb9\x5c\xee\xad\x03\
-\xe0\xfb\xfe\x8b\x30\x0c\x17\x9f\xec\x88\x3b\x1d\xad\x63\x10\x01\
-\x25\xaa\x83\x0b\x48\xe8\xba\x1c\xe7\xa7\xae\x31\xe3\xfb\xfe\x40\
-\x18\x86\x4b\x84\x52\x2a\x3b\x3c\x3c\x9c\x39\xd9\x11\x77\x3a\x36\
-\x8e\xc1\xb8\x38\xd5\xc2\x00\x45\x48\x7d\xa3\x49\x34\xc4\x9d\xab\
-\xf7\xc6\x94\x52\xea\xb5\x13\x04\x41\xbf\xe7\x44\xab\xde\xfc\xa6\
-\x61\x94\x99\x41\x00\xf5\x2d\x82\x82\x91\x0f\x5c\xad\x75\x73\x3a\
-\x25\xac\x2c\x33\x85\x08\xd2\x29\x81\xd6\xba\x39\x16\x45\x51\x2c\
-\xa1\x44\xf5\x9a\x7f\x0e\x25\x48\x28\x4d\x14\xe9\x58\xcc\xb6\x92\
-\xed\x96\xee\x9b\xf0\x2e\x84\x86\x5a\xf8\x7e\x83\x5d\x1b\x46\x70\
-\xe6\x06\xf8\x12\x5a\x52\xb0\x68\xde\x44\x9e\x67\xff\xc3\x95\x7b\
-\xf0\xfc\x95\xdd\xb3\x7e\x05\xac\x6f\x06\x29\x29\xeb\x40\xd3\xb9\
-\x19\x53\xba\x86\x49\x36\xda\x9e\xf6\x04\xe6\xee\x51\x8c\xb9\x86\
-\x19\x3a\x6f\x63\xf3\xea\x30\x77\x8e\xd8\xd8\xbb\x5f\x31\xfb\xb6\
-\x57\xf6\x43\x76\x13\xc6\x5c\xb7\x39\x01\xe3\x56\xaa\xb0\xa8\x61\
-\x5f\xee\xe3\xb8\xe3\x80\x31\x70\xe1\x16\x1c\xbe\x08\xb5\x71\xe8\
-\x6c\x81\xd7\x17\x60\x20\x07\x47\x7f\x80\xe4\xfc\xf2\x3d\xb1\x4a\
-\x04\xf5\xb5\xf0\xe7\x3f\xf0\xfb\x03\x58\xdd\x54\xee\xca\xa1\x3c\
-\x9c\xba\x6e\xbf\xd3\x6b\xe0\x58\xbb\x7d\x9f\x5b\x07\x7b\x5a\x2b\
-\xdb\xa3\x0c\xc2\x85\xbd\xdf\x41\x41\xc3\x81\x73\x20\x63\xe5\x15\
-\x84\x11\x3c\x7c\x6e\x13\x6e\x58\x39\x35\xff\x95\x79\xc5\x01\x16\
-\x37\xc2\x8f\x69\xf8\xeb\x29\x5c\xba\x03\xb1\x49\xab\x8c\x01\x5d\
-\x02\xd7\x01\xdf\xab\x92\x60\x9c\xc4\x13\xb0\x3f\x03\x85\x22\x1c\
-\xfc\x05\xbc\x49\x55\x48\x0f\x92\x8d\xf0\x76\x14\x1e\xff\x37\x0d\
-\x82\x71\x29\x16\xd4\xc3\xae\x2d\xb6\x05\x47\x23\x1b\x2b\x19\x50\
-\x01\xb4\xae\x83\xa8\x08\x17\x6f\xc3\xfd\xa7\x13\xfb\x06\x86\xa0\
-\xff\xd9\x14\x08\x8c\x01\x21\xec\x59\x7c\x18\xaf\xf1\xed\x61\x36\
-\x2d\x82\x7f\x07\x61\xf5\xcf\x50\xb7\x0d\x1a\xb6\x43\x72\x27\x9c\
-\xfd\xe3\x33\x04\x4b\x17\xc2\xb2\x2f\x61\x4e\xcd\x44\x67\x1c\xda\
-\x01\x5f\x25\xe0\xeb\x2f\xac\xd9\x00\x96\x24\xe0\xef\x63\xb0\x7b\
-\x0b\x2c\x6c\xb0\x12\xc6\x04\x7c\xbb\x0a\xb6\xae\xfd\x40\x0d\xc0\
-\x64\x37\x0b\x8e\xb7\xeb\xe9\xfd\x45\x2b\x6a\x0c\x9d\xa7\x05\x27\
-\xae\x6a\x5c\x29\x65\x71\x30\x2f\x3e\x21\xd6\x34\xe1\xc2\x60\x5e\
-\x20\xa5\x2c\xba\x42\x88\x47\xbd\x7d\x1a\xe4\x0c\x12\x48\xe8\xed\
-\xd3\x08\x21\x1e\xb9\x9e\xe7\x75\xe7\x47\x34\x5d\x97\xe3\x33\x53\
-\x85\x6b\xa7\x5a\x7e\x44\xe3\x79\x5e\xf7\xac\x8f\xcc\x59\x1f\xfa\
-\xcc\xf6\xb5\xe5\x3d\xef\x74\x43\x9f\x15\x04\x0e\xcb\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x2d\x9e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x20\x37\x07\x15\x07\xc3\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x20\x00\x49\x44\x41\x54\x78\xda\xed\xbd\x4b\
-\x70\x1c\x57\x96\xa6\xf9\x5d\x7f\x85\xc7\x3b\x02\xef\x17\x49\x10\
-\x20\x41\x8a\x04\x09\x92\x60\x59\x4a\x02\x29\xe5\x2a\xcb\xac\x7b\
-\x51\x65\xdd\x36\x5d\xaa\x45\x59\x8f\x7a\xa7\x5a\x56\x2d\xb3\x17\
-\xb5\x98\x5a\xf6\x2c\x66\xa1\xdc\x55\x6e\xc6\xac\x72\xd7\x95\xd6\
-\xd3\xd3\x25\x55\x52\x63\x23\xa9\x44\xa5\x44\x00\x24\x9e\xc4\x8b\
-\x0f\x3c\x89\x77\xbc\xdc\xc3\x23\x3c\xdc\xef\x2c\xdc\x23\x10\xa0\
-\x28\x4a\x4a\x49\x14\x39\x9d\x41\x0b\x82\x20\x18\x80\xc7\x3d\xf7\
-\xbf\xff\x39\xff\xf9\x8f\x53\x48\x29\x79\xd5\x1f\x4f\x9e\x6c\x71\
-\xef\xde\xe4\x7f\x01\x18\x19\xb9\xfa\xb7\x5d\x5d\xdd\xaf\xec\x7b\
-\xd1\x5e\xe5\x40\x94\x4a\x45\xb6\xb7\xb7\x78\xf0\xf0\xc1\x2f\xe7\
-\xe6\xe7\xfe\x46\xd7\x34\xd2\xe9\xf4\x2f\x15\x45\x38\xe9\x74\x86\
-\x48\xc4\xfc\x63\x40\x5e\xe4\x63\x7b\x7b\x8b\x0f\x3e\xfc\xef\xf2\
-\xcb\x2f\xbf\x60\x79\xf9\x21\xc9\x64\x8a\x52\xa9\x50\xb6\xed\xe2\
-\x7f\x1e\x1e\xbe\xf2\xf7\x1d\x1d\x5d\x7f\x0c\xc8\x8b\x44\xc6\xf8\
-\xf8\x17\xf2\xb3\xcf\x3e\x61\x72\x62\x9c\x9d\xdd\x3d\x92\x89\x14\
-\x11\x43\x41\x4a\xff\x7f\x33\x0c\xf3\x03\xe0\xce\xab\x86\x14\xed\
-\xd5\x45\xc6\x7f\x93\x9f\x7d\xf6\x09\xd3\x53\x33\xec\x1f\xec\xa1\
-\x2a\x15\x2a\xd5\x1c\x53\x53\xf7\xb0\x6d\x07\x84\xfc\xb2\x52\x2d\
-\xff\xfd\xa5\xe1\xab\xff\xf9\x55\x42\x8a\xf6\xea\x21\x63\x83\x89\
-\x89\x2f\xe4\xed\xcf\x3e\x61\x6e\xee\x2e\xae\x5b\xa0\xab\x53\xa7\
-\xa5\x25\x8d\xeb\x7a\xac\xaf\x1f\xb2\xba\x7a\x9f\xf1\xf1\x08\x08\
-\x7e\x19\x89\x44\x3e\x06\xf9\x61\x3a\x9d\x7d\x25\x90\xa2\xbd\x5a\
-\xc8\xd8\xe0\xc3\x0f\x7f\x2b\x6f\xdf\xfe\x84\x99\x99\x39\xaa\xd5\
-\x02\x67\xce\x98\x0c\x0e\xb4\x32\x30\x78\x8a\x52\xc9\xe1\xd3\x4f\
-\xa7\x59\x5d\xcd\x33\x37\x77\x0f\xcb\x72\x10\x78\x1f\x54\x2b\xf6\
-\xaf\x87\x87\x47\xff\x53\x47\x47\xf7\x1f\x03\xf2\xc3\x22\xe3\x73\
-\xf9\xf9\xe7\x9f\x30\x37\x37\x41\xd5\x2d\xd0\xdd\xad\x33\x32\x92\
-\xe6\xd2\xa5\x4e\xfa\xfb\xdb\x29\x14\x2a\x54\xab\x1d\xe8\x46\x95\
-\xc5\xc5\x03\xd6\xd6\xee\x33\x3e\xae\x03\xbc\x6b\x18\xb1\xdf\x00\
-\x2f\x3d\x52\xb4\x57\x07\x19\xff\xb5\x81\x0c\xd7\x2d\x30\x30\x08\
-\x23\x97\x13\x8c\xdd\xe8\xe0\xcc\x60\x9a\x78\xbc\x42\xb9\xec\x61\
-\x44\x4e\xd0\xda\xa6\xa3\x69\x0f\x59\x59\xc9\x33\x3f\x3f\x4d\xa9\
-\xe8\x22\xa5\xf2\x41\xa5\xe2\xfc\xef\x97\x2e\x5d\xfd\xdb\x97\x19\
-\x29\xda\xab\x82\x8c\xdb\xb7\x03\x64\xb8\x6e\x91\xae\x6e\xc1\xc8\
-\x48\x9a\xd1\xd1\x16\x86\xce\x99\x74\x75\xfa\x20\x8b\xc4\xe3\x10\
-\x8b\x47\x50\xd4\x16\x8a\xa5\x02\xb0\xc7\xfc\xfc\x21\xab\x6b\x0b\
-\x8c\x8f\x9b\x00\x7f\x13\x89\x98\x1f\xbc\xcc\x48\xd1\x5e\x7e\x64\
-\xfc\x93\xbc\x7d\xfb\xe3\x10\x19\x45\x06\x06\x24\x97\x47\x52\x8c\
-\x8d\x9d\x60\xe8\x5c\x92\x6c\xb6\x8a\xa2\x58\x08\x6a\x08\xa1\x12\
-\x17\x26\x27\x4f\x28\xbc\x75\xb3\x97\x54\x2a\x8a\x2f\xd7\x58\x59\
-\xce\x33\x3f\x7f\x0f\xab\xe4\x20\x84\xff\x41\xb5\xfa\xf2\x72\x8a\
-\xf6\xb2\x23\xe3\xf3\xcf\x3f\x66\x6e\x6e\x32\xc8\xa6\xba\x60\x64\
-\x24\xc5\xe8\x68\x0b\xe7\xce\xc5\xe9\xea\x52\x50\x14\x1b\x21\x6c\
-\x04\x1e\x8a\x50\x50\x14\x97\x6c\xd6\x24\x12\x89\x22\xc9\x90\xcb\
-\x59\x20\xf7\x59\x58\x38\x60\x6d\xfd\x3e\x13\xe3\x3a\xc8\x3a\xa7\
-\x88\x0f\x5f\xb6\x3a\x45\xfd\xbb\xbf\xfb\xbb\x97\x2e\x20\x6b\x6b\
-\x0f\xf9\xf0\xc3\x7f\x92\x1f\x7d\xf4\x7f\x87\xd9\xd4\x21\x03\x03\
-\x92\xeb\xd7\x53\xdc\x18\xeb\x63\xf8\x62\x96\x6c\xd6\xc5\x30\x4a\
-\x28\xa2\x84\x10\x15\x84\xa8\x82\xa8\x85\x48\xf1\x50\x55\x88\x18\
-\x2a\xd9\x74\x9c\x58\xcc\xc0\x2a\x95\x29\xe4\x2d\xb6\xb7\xf3\xe4\
-\x0e\x6d\x84\x22\xfe\x4a\xd7\x35\x3d\x9d\xce\x7e\x14\x8f\x27\xfe\
-\x88\x90\x6f\xe6\x8c\x00\x19\xd5\x6a\x81\xae\x6e\xb8\x3c\x92\x61\
-\x74\x34\xcb\xd0\x50\x92\xae\x4e\x15\xa1\x58\x21\x32\x6a\x80\x04\
-\x01\x42\x4a\xa4\xa8\xa2\x2a\x20\x0c\x95\x96\x6c\x94\x88\x11\x43\
-\x08\x41\xb1\x58\x46\x70\xc0\xfc\xfc\x21\x6b\xab\x0b\x4c\x8c\x9b\
-\x80\xfc\xa5\x61\x44\x3e\x06\xff\xc3\x54\x3a\x8b\x19\x89\xfe\x31\
-\x20\xdf\x94\x4d\x9d\x1e\x80\xcb\x23\x69\xc6\xc6\x4e\x71\x6e\x28\
-\x41\x26\xe3\x42\x1d\x15\x48\x24\x1a\x48\x3d\xfc\x0e\x3e\x82\x1a\
-\x52\x48\x14\x2a\x68\x9a\x20\x1e\x57\x39\x79\xd2\xe0\xad\xb7\xfa\
-\x48\xa7\xe2\x01\xa7\xac\xe4\x99\xbf\x7f\x8f\x92\x55\x46\xe2\x7d\
-\xe0\x54\xac\xdf\x5c\xbe\x34\xfa\x97\x66\xc7\x1f\x03\xf2\x14\x32\
-\x6e\x1f\xcf\xa6\x1a\x9c\xd1\xca\xd0\xb9\x14\x9d\x9d\x3a\x42\x94\
-\x41\xb8\x48\x04\x5e\x4d\xa3\x5a\x55\xa8\x79\x50\xf3\x7d\x54\x55\
-\x21\x1a\x51\xd1\x35\x40\x08\x14\xc5\xc3\x30\x2a\x21\xa7\xc4\x40\
-\x0a\x72\x39\x1b\xc9\x3e\x0b\x8b\x07\xac\xad\x2f\xd4\xeb\x94\x77\
-\xcc\x48\xfc\xd7\xa0\xfc\xe4\x9c\xf2\x52\x70\x48\xc0\x19\xff\x55\
-\xde\xba\xf5\x3f\x8e\x38\xe3\x34\x5c\xbf\x9e\xe2\xe6\xcd\x13\x5c\
-\xb8\xd8\x4a\x36\x23\xd1\xf5\x32\x42\x54\xc2\x57\x19\x54\x2a\x06\
-\x87\x87\x2a\x7b\x7b\xb0\xbb\x57\xc5\xb6\x05\x51\x33\x8e\x61\x98\
-\x48\x40\x20\x03\xd4\x08\x1f\x55\x15\x18\x11\x8d\x74\x36\x49\x2c\
-\x16\xc1\xb2\x6c\xf2\x79\x8b\xed\xed\x02\x87\x87\x16\x42\xe5\xa5\
-\xe0\x14\xed\xe5\x40\xc6\xf1\x3a\xa3\xbb\x5b\x09\xeb\x8c\x56\x86\
-\x86\xb2\x74\x76\x19\x08\x51\x02\x5c\x40\xc5\x75\x05\xb6\xe5\xb3\
-\xbb\xeb\xf1\xf0\x61\x8d\x9d\xdd\x0a\x25\xcb\x21\x95\x54\xb0\x86\
-\x04\xbd\xbd\x11\x52\x69\x0d\xd3\x94\x28\xc2\x43\x11\x3e\xba\x5e\
-\x23\x93\xd5\xd0\x8d\x24\xa0\x50\x2c\xda\x48\x19\xd4\x29\x6b\x6b\
-\x8b\x8c\x8f\x47\x01\x11\x6a\x5f\xfe\x87\xe9\x74\xcb\x4f\x82\x94\
-\x9f\x14\x21\xf5\x6c\xea\xd6\xad\xe6\x6c\x4a\x70\xfd\x7a\x96\xb1\
-\x1b\x03\x5c\xb8\xd8\x49\x26\x23\xd0\xf4\x2a\x42\xd4\x00\x05\xa4\
-\x49\xb1\xe8\xf3\xf8\x71\x8e\xa9\x7b\xfb\x7c\xf2\xc9\x21\xbf\xff\
-\x3c\xcf\xcc\xac\xc5\xc6\xa6\x8d\x53\x2e\x21\xa9\x11\x8f\x27\x89\
-\x46\xe3\x28\x42\x41\x08\x15\x89\x40\x08\x81\xaa\x2a\x44\x0c\x9d\
-\x74\x26\x81\x69\x1a\x14\x8b\x01\x52\x76\xb6\x73\x1c\xe6\x4a\x08\
-\xe1\xff\x95\xae\xab\xa7\xd2\xe9\xcc\x6f\xe3\xf1\xe4\xff\x1c\x08\
-\xf9\x4a\x9d\x31\x3f\x19\x72\x86\xc2\xc8\xe5\x34\xa3\xd7\xda\x19\
-\x3a\x9b\xa1\xb3\x33\x0a\xc2\xc6\x97\xe0\x7b\x1a\x4e\xd9\x23\x9f\
-\x73\x58\x5b\x2f\x31\x3f\x97\x67\x76\xb6\xc0\xec\x6c\x85\xed\x6d\
-\x8f\x9a\x07\xb9\x1c\xf8\x1e\xd8\x65\x49\xa5\x92\x60\xe0\xb4\x42\
-\x5b\x9b\x46\x32\xa9\x62\x44\x14\x54\x55\x41\xd7\x7c\x32\x19\x0d\
-\xc3\x48\x20\x25\xe4\xf3\x16\xb0\xc7\xc2\xc2\x01\xeb\xab\x61\x9d\
-\x82\x7c\x37\xd2\xa8\x53\x5e\x6c\x45\xff\x93\x20\xe4\x2b\x9c\xe1\
-\xe6\x38\x3d\x28\xb8\x7e\x3d\xcd\x8d\x1b\xa7\xb8\x70\xa1\x9d\x4c\
-\x46\x41\xd3\x3c\x00\x3c\x4f\xa5\x52\xd1\xd9\xdc\xac\x30\x3e\xbe\
-\xc1\x67\xb7\x9f\xf0\xf9\xe7\x16\x8b\x0b\x55\x2c\xcb\x47\xd3\x20\
-\x11\x07\x45\x81\xbd\x3d\x78\xf2\xc4\x67\x67\xbb\x4c\x3e\x5f\x45\
-\xd7\x23\x44\x22\x31\x74\x23\x8a\xae\xe9\x08\xe1\xa3\x28\x1e\xaa\
-\x2a\x83\x3a\x25\xe4\x94\x52\xc9\x26\x9f\x2f\xb1\xbd\x9d\x0f\x38\
-\x45\xe1\xaf\x74\x4d\x4b\xa5\xd3\x99\x0f\x5f\x24\x52\xb4\x9f\x04\
-\x19\xe3\x9f\x07\xfd\x8c\x3a\x32\xba\x15\x46\x2e\x67\x19\x1d\xed\
-\xe0\xec\xd9\xd6\x10\x19\x15\x6a\x9e\x8b\xe3\xf8\xe4\xf2\x1e\x3b\
-\xdb\x2e\x4b\xcb\x39\x26\xc6\x0f\x58\x5a\xca\xb3\xbd\x0d\x8a\x30\
-\xe8\xeb\x4b\xd1\xd2\x62\x12\x8b\xab\xd8\x96\xcb\xa3\xc7\x16\xc5\
-\x42\x85\xf9\xf9\x12\x85\x82\x8f\xeb\x1a\x14\x0a\xd0\x7f\xda\xa5\
-\xab\xd3\x20\x95\x52\x30\x0c\x05\x4d\x83\x4c\x46\x0b\xb2\x2f\xa1\
-\x52\x28\xd8\xc0\x2e\xf3\xf3\x39\xd6\x56\x17\x19\xbf\x13\x05\xf9\
-\xe2\xb5\xaf\x17\x8a\x90\xb5\xb5\x87\x7c\xf8\xc1\x3f\x35\x90\x51\
-\xa9\xe6\x18\x18\x50\x19\xbd\xd6\xca\xd8\xd8\x19\x2e\x5c\xe8\x21\
-\x93\xd6\xd1\xb4\xc0\x09\x53\xb6\x3d\xb6\x77\x2c\x16\xee\x1f\xf0\
-\xe9\xbf\x6e\xf2\xf9\xed\x1d\xee\xdf\xb7\x29\xe4\x7d\xd2\x29\x38\
-\x7f\x3e\xc5\x5b\x6f\x0d\xf2\xe6\x9b\x67\xb8\x32\xd2\xcf\xc9\x93\
-\x59\xcc\x48\x0d\xcf\x73\x39\xd8\xaf\xb1\xb3\x53\x63\x6b\xab\xc2\
-\xee\x6e\x89\xaa\x5b\x40\x51\x6a\xc4\xe3\x09\xa2\xd1\x18\x34\x38\
-\x45\x6b\x70\x4a\xd4\x34\x28\x14\x2d\x72\xf9\x12\x3b\x3b\x39\x72\
-\xb9\x12\x8a\x52\xe7\x94\xec\x0b\xe1\x14\xed\x85\x73\xc6\xed\x4f\
-\x98\x9f\x0b\x90\xd1\xdd\xa5\x72\xf9\x72\x0b\xd7\x46\xbb\x38\x7b\
-\xb6\x9d\x8e\x8e\x04\xc8\x0a\xe5\x72\x99\x62\xb1\xcc\xd6\x56\x91\
-\xa5\xe5\x1c\xf3\xf3\x87\x4c\x4d\x1d\xb0\xb3\xe3\x20\x84\xa0\xa3\
-\x33\xc2\xd9\x33\x26\x17\x2f\xb6\x70\xe5\x4a\x86\xbe\xbe\x14\xa6\
-\x19\xe5\xf0\x50\x21\x12\xc9\x12\x8b\xba\x68\xaa\x60\x75\xd5\xe6\
-\xf0\xd0\xc6\x5d\xb0\xf1\xa5\x4e\xb9\xec\x51\xa9\x98\xf4\x9f\x82\
-\x6c\xd6\x24\x1e\xd7\xd0\x74\x41\x3a\xa3\x33\x68\x64\x91\x52\x90\
-\xcb\xdb\xc0\x0e\x0b\xf7\x0f\x83\x7e\xca\x44\x73\x3f\xe5\xc7\xd7\
-\xbe\x5e\x08\x42\x02\xce\xf8\xad\xfc\xe8\xd6\x3f\x33\x33\x3b\x47\
-\xb5\x9a\x63\x60\x40\xe3\xda\x68\x4b\x90\x4d\x5d\xe8\x26\x93\x36\
-\xd0\x54\x81\xe7\x69\xec\xef\x57\x98\x9b\xdb\xe4\x8b\x2f\x37\xf8\
-\xe4\xe3\x03\xee\xde\x2b\xb2\xbb\x53\x25\x16\x85\x8b\x17\x35\x7e\
-\xf6\x7a\x8a\x9b\x37\x7a\x19\x19\x69\xa3\xbb\x5b\x10\x4f\x38\x18\
-\x46\x09\x33\x52\x26\x93\x51\x68\x6b\x37\x68\xef\x50\x48\x26\xa1\
-\x5a\x75\x29\x95\x3c\x76\xf7\x7c\xb6\xb7\x6b\xec\xed\x97\xb0\x2c\
-\x17\x23\x92\xc0\x8c\xc6\xd0\x75\x05\x4d\x17\xa8\x1a\x44\x22\x1a\
-\x2d\x99\x54\xc8\x29\x16\x85\x7c\x31\xe4\x14\x1b\xe5\x05\x69\x5f\
-\x3f\x6a\x40\x4a\xa5\x22\x6b\x6b\x8f\x98\x98\xf8\xbd\xbc\x75\xeb\
-\x7f\x04\xaa\x6d\x25\x47\x57\x97\xce\xe8\x68\x07\xa3\xa3\xbd\xbc\
-\x76\xa1\x9b\xb6\xb6\x04\xbe\xef\x52\x28\x94\xd9\xdc\xb4\x58\x5c\
-\xdc\x67\x72\x72\x93\x99\xe9\x7d\x56\x56\x6c\x2c\x5b\xd2\xda\x1a\
-\x63\x68\x28\xc1\xe8\xf5\x18\x57\xaf\xa4\x78\xed\x7c\x96\x9e\x1e\
-\x9d\x68\xb4\x8c\xa6\x97\xd0\x54\x0b\x43\xaf\x92\x48\x28\x24\x53\
-\x0a\xa9\x94\x42\x2c\xa6\xa1\x28\x3a\xbe\x54\xb1\x6c\x9f\x42\xa1\
-\x4a\x2e\x57\xa6\x54\xf4\xf1\x7d\x03\xcf\x03\x44\x15\x55\xf5\xd1\
-\x75\x8d\x68\x34\x42\x32\x99\xc0\x30\x0c\xdc\xaa\x8b\x53\x71\xd9\
-\xdd\x2d\x50\x28\x58\xd4\x6a\x35\xa4\xe4\xad\x78\x3c\xf1\x91\x69\
-\x9a\xab\x9a\xa6\xa3\x69\xda\xab\x15\x90\xb5\xb5\x47\x7c\xf8\xe1\
-\x6f\xe5\xad\x5b\xff\xcc\xcc\xcc\x2c\x95\x4a\x8e\xd3\xa7\x0d\xae\
-\x8d\x76\x32\x36\x76\x8e\xd7\x5e\x3b\x41\x3a\x6d\xe2\xfb\x35\xf2\
-\x79\x8b\x87\x0f\x76\xf9\xfd\xe7\x0f\xb9\x7d\x7b\x8d\x7b\x53\x39\
-\x9e\x3c\xa9\xa2\xe9\x1e\xa7\x4f\xc7\x19\xbb\xd1\xc7\xd8\x58\x37\
-\x97\x2f\x65\x38\x75\xca\x24\x99\xaa\xa1\xeb\x56\xd0\x0b\x51\x6c\
-\x14\xe1\x34\x54\x5f\x45\xf5\x89\x44\x74\xd2\xe9\x24\x5d\x5d\x1d\
-\xb4\xb6\xc5\x51\xd4\x32\x6e\xb5\xc2\xc1\x3e\xec\xec\x78\x6c\x6d\
-\xd9\xec\xed\xe7\xf1\xfd\x12\x9a\xee\x07\xdc\x62\xc6\x51\x14\x0d\
-\xc3\x30\xc8\x64\xd2\x44\xa3\x26\xc5\x62\x91\x5c\xae\xd8\xcc\x29\
-\xef\xea\xba\xda\x99\x4e\x67\xff\xfb\x8f\xc1\x29\xda\x8f\xc7\x19\
-\x9b\x41\x05\xfe\xf9\x27\xa1\x6a\x5b\xa2\xab\x2b\xc2\xa5\xcb\x1d\
-\x5c\xbb\xd6\xc7\x99\x33\xbd\x64\x32\x51\x4a\x56\x9e\xbd\xbd\x3c\
-\xab\x6b\x7b\x2c\x2e\x6c\x73\xf7\xee\x16\x1b\xeb\x25\x1c\x47\x90\
-\x4c\x18\x9c\xea\x4f\x71\xfe\xb5\x2c\x57\xaf\xb6\x32\x30\x10\xa3\
-\xb5\xd5\x25\x16\x2b\xa3\x88\x72\xa0\xf6\x8a\x2a\x42\x78\x81\x4c\
-\x22\x14\xa4\xac\x61\xe8\x3e\x9a\xaa\x62\x9a\x1a\x99\x4c\x82\x64\
-\x4a\x43\xd3\x4a\xc4\xa2\x0a\xba\x56\x61\x63\xa3\xca\x93\x27\x45\
-\x1c\xc7\xc2\xf7\xa3\xd8\xb6\x87\x6d\x1b\x9c\xe8\x83\x74\x3a\x4d\
-\x3c\x6e\x72\x7a\x20\x8e\x44\x23\x97\x2f\x21\xd9\x60\x71\x21\xc7\
-\xda\xda\x02\xe3\x13\x11\x10\xbc\x67\x44\x62\xff\x08\xe2\x93\x1f\
-\x9a\x53\x7e\x14\x84\x34\x90\xf1\x51\x80\x8c\x6a\x35\xcf\xc0\x40\
-\x84\xd1\xd1\x2e\xc6\xde\x3c\xcf\x6b\xaf\x9d\x22\x9d\x8e\x63\x59\
-\x15\x56\x56\xb6\x99\x9c\xdc\xe4\xe3\xff\x77\x9d\x2f\xbf\xdc\x63\
-\x75\xb5\x0c\x12\x4e\xf5\xeb\x5c\xbb\x9a\xe5\xe6\x5b\xfd\x5c\x1f\
-\xed\xe2\xe4\x29\x9d\x4c\xc6\x25\x12\x29\xa3\xaa\x36\x42\x94\x11\
-\x54\x11\xc2\x47\x20\x11\x22\xf8\xd9\xa2\xfe\xbb\x90\x08\x21\x51\
-\x55\x30\x4d\x95\x96\xd6\x24\x1d\xed\x29\x32\x19\x83\x68\x54\x60\
-\x59\x2e\xb9\x9c\xcb\xce\x8e\xc7\x93\x27\x0e\xb9\xc3\x02\x95\x4a\
-\x95\x68\x34\x41\x2c\x16\xc7\xd0\x0d\xcc\x68\x84\x6c\x4b\x9a\x78\
-\xcc\xa4\x54\x2a\x90\x2f\x14\xd8\xd9\xce\x73\x98\xb3\x50\x04\xef\
-\xfe\x18\x9c\xf2\x83\x06\xe4\x88\x33\x3e\x97\xb7\x6e\xfd\x33\x73\
-\x73\x77\xa9\x54\x8b\x74\x75\x99\x8c\x8e\xf6\x70\xe5\xca\x49\x86\
-\xce\xf6\x91\x48\x98\x1c\x1c\xe4\x58\x59\xd9\x62\x72\x72\x93\x7b\
-\xf7\xb6\x99\x9f\xdf\x27\x77\x58\x23\x99\xc8\x70\xaa\xbf\x9d\xcb\
-\x97\xdb\xb8\x72\xa5\x8b\x4b\xc3\x3d\x9c\x3c\x99\x24\x91\xf0\x31\
-\x0c\x17\x45\x75\x11\x04\x88\x10\x08\x40\x05\x74\x24\x3a\xa0\x83\
-\xd4\x82\x3f\x4b\x0d\x84\x86\x10\x1a\xba\x6e\x90\x4c\x24\x89\x27\
-\x12\xc4\xe3\x51\x22\x91\x28\x42\x44\xf1\xfd\x08\xa5\x12\x14\x0a\
-\x2e\x85\x82\x85\x6d\xd7\x82\xef\x25\x15\x04\x82\x48\xc4\x20\x9d\
-\x49\x11\x8d\x46\xa8\xd5\x5c\x1c\xa7\xc2\xde\x6e\x9e\x7c\xbe\xd4\
-\xe0\x94\xc4\x0f\xcc\x29\x3f\x68\x40\x9a\x39\x63\x7a\x6a\x96\x4a\
-\xa5\xc8\xc0\xe9\x38\xa3\xd7\xfa\x78\xf3\x8d\x4b\x9c\x3d\x73\x8a\
-\x48\x44\x63\x7b\x7b\x8f\xf1\xf1\x59\x6e\xdf\x5e\xe4\xf7\xbf\xdf\
-\xe1\xc1\x83\x02\xb5\x5a\x85\x9e\xde\x0c\xaf\xbf\xfe\x1a\x6f\xbe\
-\x79\x81\x2b\x57\xce\x30\x38\xd0\x43\x36\x1b\xc5\x30\x24\x42\xf1\
-\x40\xf8\x20\x15\x40\x45\x62\x00\x11\xa4\x8c\x35\x3d\xa3\xe1\xb3\
-\xf9\xcf\x06\x48\x03\x29\x23\x28\x22\x86\x19\xc9\x92\xcd\x74\xd3\
-\xd7\xd7\x4f\x7b\x7b\x3b\x8a\x22\x71\x2a\x2e\x3b\x3b\x2e\x4f\x9e\
-\x04\x35\x4b\x2e\x57\x42\x4a\x89\xae\x6b\xc4\x13\x09\x52\xc9\x24\
-\x2d\x2d\x59\x62\x51\x93\x7c\x3e\x47\x2e\x97\x67\x67\x27\x47\x3e\
-\xe4\x14\x43\x57\x3b\x53\x3f\x10\xa7\x68\x3f\x38\x67\xdc\xae\x3b\
-\x0a\x6d\xba\xba\x62\x5c\xba\xd4\xc7\xf0\xa5\x93\x74\x74\xb6\xe1\
-\x79\x0a\x0f\x1e\x6e\xb3\xbc\xf4\x98\x89\x89\xc7\xcc\xdf\xdf\x65\
-\x75\x55\xe2\xf9\x2a\xdd\xdd\x51\xda\xda\xb2\x74\x77\xb7\xd1\xde\
-\xde\x42\x24\x62\x50\xa9\xd4\xd8\xdd\xcd\x23\x14\x0b\x84\x15\x92\
-\x76\x0d\xf0\x10\xf8\xcf\xbc\x16\x01\x20\x7d\x64\xd0\x47\x04\x7c\
-\xa4\xf4\x41\x4a\x7c\x29\x91\xbe\x46\xcd\xd3\x49\x24\x62\xb4\xb7\
-\x0b\xba\xba\xdb\xd9\xdd\x2b\xb3\xb1\x51\x66\x6f\xaf\x40\xb1\x74\
-\x40\x2e\x5f\xc5\xb6\x21\x5f\xf0\x19\xb2\x05\x5d\x5d\x6d\x74\x77\
-\x75\x20\x3d\x95\xc3\xc3\x22\x42\x3c\x62\x61\xa1\xee\x66\x89\x00\
-\xbc\x67\x18\x3f\x0c\xa7\xfc\x20\x01\xd9\xde\xde\xe4\x5f\xfe\xe5\
-\xb7\xf2\xf6\xed\x4f\x43\xce\xb0\x19\x3c\x93\xe0\xd2\xa5\x13\xbc\
-\xfe\xfa\x30\x9d\x9d\x59\x2c\xcb\x66\x7e\x7e\x8b\xc9\x89\x45\x16\
-\x17\x36\x59\x5f\x2f\xb2\x7f\x20\x29\x3b\x92\x54\xca\xa4\xa5\xa5\
-\x9b\x44\xa2\x83\x52\xd1\xe7\xe1\x83\x3d\x56\x57\xab\x28\x4a\x19\
-\x21\xac\xa0\x29\xa5\x54\x40\xb8\x08\xe9\x03\x3e\x88\xa3\x25\x6f\
-\x0e\x86\x90\xc1\xdf\x4a\x29\x40\x28\x81\x42\x8c\x86\x94\x3a\x52\
-\x46\x1a\x08\x12\xc4\x28\x3b\x82\x5a\xcd\x20\x91\xc8\x90\x4a\xe5\
-\xb0\xec\x32\xc5\xa2\xcb\xf2\x72\x99\xfd\xfd\x2d\x1e\x3e\xb2\x58\
-\x5d\xcb\x73\x69\xf8\x24\xc3\x17\xcf\xd1\xd5\xd5\xc9\xcf\xdf\xbe\
-\x4e\x6b\x4b\x16\x21\x26\x59\x5e\x3e\x64\x6e\x6e\x8a\x62\xa9\x82\
-\x44\xf9\xb8\x52\x75\xfe\x7e\xf8\x7b\x7a\x89\xb5\xef\x8f\x8c\x0d\
-\x26\x26\x7e\x2f\x6f\xdf\xfe\x84\xd9\xd9\xbb\x54\x43\xce\xb8\x78\
-\xb1\x93\xf3\xe7\x3b\x48\x26\x35\x0a\x85\x12\x8b\x8b\x1b\xcc\xce\
-\xae\x72\xf7\xee\x2a\xab\x8f\x0f\x29\x15\xa1\xea\x82\xa2\x82\xef\
-\x43\xa5\x0a\x87\x87\x15\x3c\x77\x0f\x5d\xf7\xa9\x79\x36\xbe\xef\
-\x84\xe6\x05\x17\x8e\x21\xe3\xeb\x87\x8c\x42\x6e\x47\x86\x81\x11\
-\x61\x50\xa4\x54\x91\x52\x03\x69\x80\x30\x50\x84\x89\xc4\xc0\xf7\
-\x75\x0e\x73\x0e\xd5\xaa\x87\x57\x83\xb2\x0d\xd5\x6a\x8d\xc3\xc3\
-\x22\x85\x42\x15\xc7\xa9\xe0\x38\x3e\x52\x9a\x9c\xee\xef\x20\x9d\
-\x32\x38\x3b\xd4\xc1\xde\x5e\x0f\x52\x7a\xdc\xbf\x9f\x63\x75\xb5\
-\xe1\xfb\xfa\xa5\xf1\x3d\xbd\xc4\xda\xf7\x43\x46\xdd\x37\x55\xf7\
-\xda\x16\x19\x18\x88\x30\x3c\xdc\xc1\xf5\xeb\xfd\x24\x93\x11\x1e\
-\x3d\x5a\x60\x79\x65\x8f\xa9\xa9\x43\x1e\x3d\x2c\x70\xb0\x6f\x61\
-\x95\x82\x60\xc8\x70\x93\xdb\xb6\xc3\xe3\x47\x5b\x6c\x3f\xd9\x27\
-\xa2\x2b\xa8\xaa\xc4\x97\x1e\xc8\x90\x37\x90\x47\x1f\x83\xe5\xfe\
-\xe6\x80\x1c\xc7\x4d\xd0\x3f\x94\x02\xa4\x82\x6c\x04\x48\xc1\x97\
-\x82\x6a\xd5\xc3\x2a\x95\x29\x97\x5d\xaa\x15\x89\xe7\x83\x2f\x21\
-\x9f\x77\x59\x5e\x2e\x52\x2a\x3e\x66\x6b\xeb\x80\xd7\xce\xb7\x71\
-\xf5\x4a\x1f\x6d\xad\x49\x7e\xf6\xb3\xb3\x64\x5b\x52\x48\x66\x59\
-\x59\xc9\x33\x37\x7f\x8f\x92\xe5\x80\xf8\x7e\x5e\x62\xed\xfb\x21\
-\xa3\xce\x19\x93\x21\x32\x0c\x46\x46\x5a\x39\x7f\xbe\x85\x54\xda\
-\xa3\x90\x3f\xe0\xfe\xc2\x63\xe6\xe6\xb6\x59\x7d\x5c\x26\x97\xab\
-\x51\xab\x81\xaa\x0a\x74\x24\x66\x54\xa3\xbd\x3d\x4a\x22\xa1\xa2\
-\xa8\x12\x55\x71\x51\x84\x8f\xd2\x38\x8e\x64\x9d\x14\x8e\x56\xfa\
-\xd8\xb2\x7f\x53\x58\x68\x34\x72\x69\x0a\x06\x52\x45\xa2\xe3\xba\
-\x02\xc7\x91\xd4\x6a\x35\x6a\x35\x8f\x6a\xd5\xc7\xf3\x41\x86\xf4\
-\xe4\x7b\x92\x9a\x1b\xa0\xc5\xa9\xe4\x29\x97\xf3\x08\xaa\x5c\xbc\
-\xd0\xc7\xe0\x60\x2f\xc3\x46\x37\x87\xb9\x43\x84\xf0\x59\x58\xc8\
-\x1d\x79\x89\xbf\x87\xef\x4b\xfb\x21\x90\x11\x38\x0a\x35\x2e\x5f\
-\x6e\xe1\xcd\x37\xfb\x49\xa5\x54\x1e\x3f\x5e\x66\x7e\x7e\x97\x7b\
-\x77\x8b\xec\xec\x56\x88\xc5\x7d\xa2\x31\x81\x6d\x41\xb9\x0c\x4e\
-\x19\x3a\xbb\xa2\xbc\xfe\x46\x0f\xa7\xfa\x63\x98\x66\x0d\x5d\x73\
-\x83\xda\x02\x17\x21\x42\xae\xa8\x1f\x51\x4f\x6f\x7d\xf1\x3c\xb0\
-\x34\xa1\x42\x88\xc6\x91\x85\xd4\x90\xd2\x40\x88\x18\x8a\x92\xc2\
-\xb6\x74\x9e\x6c\xbb\x2c\xaf\x1c\x70\xf7\xee\x63\xca\x4e\x0e\xe1\
-\x05\xb1\x53\x04\xc4\xa2\x0a\x3d\x3d\x11\x22\x11\xc8\xe5\x2b\xac\
-\x3e\x2e\x53\xb6\xd6\x28\x16\x3c\x32\xd9\x38\x3d\x3d\x69\x6e\xde\
-\x3c\x4b\x4b\x4b\x1c\x55\x59\x08\xdc\x2c\x73\x81\x97\x18\xd4\x0f\
-\xaa\xd5\xca\x77\xe6\x14\xed\xfb\x21\x63\x22\x74\x14\xaa\x5c\xbe\
-\x9c\x65\x74\xb4\x9d\xa1\xa1\x24\xbe\x5f\x66\x7d\x3d\x8f\xe7\xed\
-\xa3\x69\x3e\xad\xad\x06\xa7\x4e\x65\x51\x84\x60\x7d\xbd\xc0\xee\
-\x4e\x99\x82\xe2\xd1\xd6\xa6\x73\xf1\x62\x86\xe1\x4b\x29\xa2\x51\
-\x07\x43\x77\x00\x27\x0c\x8a\x87\x10\xde\x11\x52\x90\x5f\x73\x50\
-\x3d\x03\x2d\xb2\x1e\x10\x05\x29\x94\x30\x10\x3a\x32\x4c\x93\x7d\
-\x2f\x46\xad\x96\x60\x7b\x5b\xe2\x54\x0b\x18\x06\x68\x1a\x18\x86\
-\x8a\x69\xea\xf8\x7e\x20\x4a\x26\x12\x06\xa7\xfb\x5b\x48\x67\x34\
-\x76\xf7\x6c\x6c\xab\x8c\xf4\xcb\x54\xdd\x1c\x8a\x62\x91\xc9\x24\
-\xc9\x64\x12\xe8\x7a\x1b\xc5\xc2\x3e\xe0\x32\x37\x17\xf8\xbe\x1a\
-\x9c\x62\x7c\x37\x4e\xd1\xfe\x70\x64\xcc\x06\x2e\xf4\xd3\x1c\x79\
-\x6d\x87\x5a\xc8\x64\x5c\x1c\xc7\xe6\xe4\x49\x03\xdf\x4f\x12\x4f\
-\x38\x68\x5a\x2b\xe7\xcf\x5f\xc1\xb6\x15\x3e\xfd\x78\x86\xb2\xbd\
-\x49\xa5\xe2\x13\x8b\x29\x74\xb4\xeb\xf4\xf6\xe8\x98\x66\x05\x4d\
-\x0b\x76\xa6\xa8\x57\xda\x04\x76\x9e\x60\x71\x25\xdf\x3c\x30\x1c\
-\x06\x47\x2a\xc8\xb0\x68\x94\xa8\x61\x1d\x62\x06\xc1\x90\x49\x6c\
-\xdb\xe0\x60\xdf\xe7\xf0\x30\xc7\xfd\x85\xc7\x2c\x2d\xef\x61\xd9\
-\x16\xf1\x84\x4e\x4b\x36\x83\xe7\xc1\xce\x4e\x8e\x64\x2a\xc6\xb9\
-\x73\x7d\x0c\x9e\x49\xe2\xba\x45\xec\xf2\x01\xc5\xc2\x36\x1d\xed\
-\xd0\xde\x5e\x25\x16\xb3\x11\x02\xfa\xfa\xe0\xc6\xcd\x5e\x92\x49\
-\x03\xdf\x7f\xcc\xca\x72\x9e\xfb\x73\x81\x97\x18\xbc\xef\xe4\x25\
-\xd6\xbe\x2b\x32\x3e\xff\xfc\x63\xe6\xe7\x03\xaf\x6d\x77\x17\x8c\
-\x8c\x24\x19\xbd\x9e\xe5\xfc\xb9\x18\x9d\x5d\x20\x44\x11\x45\x29\
-\xd1\xdd\xad\x60\x18\x31\x32\x59\x0d\xc3\xc8\x70\xfa\x74\x1b\x3b\
-\xdb\x92\xe9\x29\xbd\xb1\x23\x75\x4d\x12\x8b\xf9\x24\x13\x1e\xa6\
-\x59\x43\xd3\x5d\x14\x51\x43\x08\x17\x81\x1b\x12\xf9\xf1\xb3\xe9\
-\x2b\x41\x11\xcf\x40\x86\x94\x48\xd4\x30\xfd\x55\x90\x52\x43\xca\
-\x08\xd5\x6a\x04\xcb\x52\x39\x3c\x70\x59\x5e\x2e\x30\x7f\x7f\x87\
-\x47\x8f\x77\xb1\xac\x32\x9d\x9d\x49\x52\xc9\x14\x99\x4c\x96\x52\
-\xa9\x8a\x65\xd9\x98\xa6\x42\x4b\x9b\x41\x7f\x7f\x8c\x58\x4c\xc1\
-\xf3\x7d\x0a\x79\x9b\x58\x54\xd0\xd2\x52\x26\x12\xc9\x23\x14\x49\
-\x56\x13\x44\x22\x11\x20\x43\x21\x5f\x42\xb0\xcf\xc2\xfd\x60\x3e\
-\x65\x62\x42\x07\xc1\xbb\x46\xe4\xdb\x71\x8a\xf6\x5d\x90\xf1\xf9\
-\xe7\x1f\x37\x1c\x85\x83\x83\x30\x72\x39\xc9\x8d\x1b\xbd\x0c\x0d\
-\x25\xc9\x66\x2d\x34\x35\x07\xc2\x21\x1a\xad\xa0\xaa\x3e\x89\x84\
-\x49\x67\x67\x02\x48\x10\x8b\xd9\xec\xed\x96\x81\x12\x92\x4a\x50\
-\xb0\xe1\xe1\x79\x65\x3c\x4f\x01\xec\x50\x30\x74\x50\x44\xdd\x65\
-\xe2\x7f\x95\x34\x44\x78\x78\xc9\xf0\xa3\x68\x8a\x88\x10\x20\x55\
-\x10\x01\x5f\x04\xaf\x55\x91\x52\x20\xa5\x86\x65\x09\xd6\xd6\x6c\
-\xa6\xa7\x0b\x7c\xfa\xe9\x26\x8b\x4b\x87\xe4\xf2\x36\x2d\x2d\x49\
-\xae\x5f\x3b\x43\x77\x77\x07\xd2\x8f\xf0\x78\xf5\x80\x8d\xf5\x5d\
-\x14\xa5\x82\x94\x87\xe8\x3a\xb4\xb5\xe9\xc4\x62\x11\x5c\x37\x8b\
-\xa6\xb9\x24\x13\x36\x9a\xe6\x84\x9a\x99\x46\x3c\x1e\xe5\xd4\x49\
-\x15\xe5\xed\x1e\x32\xe9\x18\x8a\x58\x63\x79\x25\xcf\xdc\xfc\x34\
-\xc5\x92\x0b\x52\xfd\xa0\x5a\xf9\x66\x4e\xd1\xbe\x3d\x67\x1c\x79\
-\x6d\xbb\xbb\xeb\x8e\xc2\x2c\x43\x43\x71\xba\xbb\x41\x51\x8a\x08\
-\x61\x81\xa8\xa2\x28\x3e\x9a\x26\x88\xc6\x34\x7c\xdf\xc0\xf7\x25\
-\xbe\x67\xa1\x28\xa5\xd0\xe8\xe6\x85\xeb\xeb\xe3\xcb\x6a\x40\xb8\
-\x54\x10\xc2\x09\x9f\x47\x01\x69\xdc\xd8\x40\x88\x06\x18\x44\x33\
-\xa3\x88\xe6\xbf\x55\xc2\xd7\x10\x06\x25\x40\x47\xb5\x2a\x28\x14\
-\x2a\xac\xad\x39\x4c\x4d\x39\xdc\xbd\x9b\x63\x6e\x6e\x8f\x7c\xc1\
-\xa1\xbd\x23\xca\x6b\xaf\xb5\x73\xed\x5a\x1f\xed\x6d\xad\xec\xef\
-\xbb\xe4\x72\x25\x22\x11\x05\x45\xa9\x21\x28\xa2\xaa\x2a\xb1\x58\
-\x8c\x6c\x26\xa8\x6b\x84\x90\x08\x51\x6a\x70\x9c\xa2\xe8\xa8\x6a\
-\x95\x6c\x36\x8e\x69\x24\x50\xc8\x50\x28\x58\x48\xf6\x99\xbf\x7f\
-\x78\xbc\x4e\x31\x9e\xef\xfb\xd2\xbe\x1d\x67\x1c\x21\x63\x60\x40\
-\x32\x32\x92\x66\x6c\xec\x04\xe7\x86\xe2\x64\xb3\x0e\x8a\xb0\x10\
-\xa2\x80\x10\x4e\x50\xc4\x85\xbe\x41\xd0\x50\x14\x37\x3c\x6a\x22\
-\x28\x8a\x13\x48\xe5\x8d\x4d\x2d\x43\xf2\x0e\x8e\x29\xea\x47\x15\
-\x2e\x50\x6b\x04\xae\xfe\xdd\xa4\x10\x41\x81\xce\x71\x60\x34\x90\
-\x51\x4f\x71\x51\x40\xea\x48\x3f\x82\xf4\x63\x14\x8b\xf0\xe0\xc1\
-\x3e\xf7\xee\x95\xf8\xf4\xd3\x32\x2b\x0f\x1c\x6c\xdb\xa1\xa7\x27\
-\xca\xeb\xaf\xf7\x30\x32\x72\x82\xa1\xb3\xad\x40\x84\x42\xc1\xc2\
-\xf7\x6d\x84\xa8\xa1\x2a\x1e\x8a\xe2\xa0\x28\x16\x8a\xe2\x21\x14\
-\x10\xa2\xde\x7b\xa9\x82\xf0\x82\xeb\x92\x1a\x12\x17\x5d\xaf\xa1\
-\xc4\xe1\xc4\x09\x83\xb7\xdf\xea\x21\x95\x8a\x21\x65\x1d\x29\xf7\
-\x28\x95\x1c\x24\xde\x07\x95\xaa\xfd\xeb\x4b\xc3\xd7\xfe\x53\x47\
-\x47\xcf\xb7\x0b\xc8\xb3\x7d\x53\x05\xba\xba\x24\x23\x23\x49\xae\
-\x8f\x66\x38\x37\x14\xa3\xab\x5b\xa0\x0a\x3b\x0c\x46\xa0\x35\x11\
-\xee\x1a\x89\x12\x2c\x28\x12\x21\x8c\xf0\x6b\x41\x3a\x2b\x04\x4d\
-\x4f\x3f\x78\x8d\xf0\x83\x2a\x5c\xf8\xe1\xeb\xea\xcf\x10\x4c\xcf\
-\xa8\x43\x44\xa3\xc6\x50\xc2\xa0\x07\x81\x40\x06\xd9\x94\xe3\x98\
-\xe4\x72\x92\x47\x8f\xcb\x4c\xde\xcd\x71\xef\x5e\x81\x07\x0f\x2a\
-\x94\x6d\xe8\xed\x35\xb9\x78\x31\xc3\xf5\xd1\x16\xce\x9f\x4f\xd1\
-\xda\xaa\x52\x2c\xd4\x50\xb5\x32\x50\x0e\x37\x8e\x1f\xf2\x59\x05\
-\x21\x04\x42\x91\xc7\x1a\x61\x50\x43\x48\x10\x42\xc5\x27\xb0\x16\
-\xa9\x42\x21\xdb\x92\x20\x12\x89\x07\xf3\x29\x79\x0b\xc9\x01\xf7\
-\xeb\xf3\x29\x13\xcf\xf7\x7d\x69\xdf\x86\x33\xaa\x6e\x81\x81\x01\
-\x9f\x91\x91\x24\x37\x6e\xf4\x1c\x21\x43\x29\x87\xc1\xb0\x1b\x0b\
-\x2e\xc3\x45\x0c\x8e\x0c\x11\x2e\xaa\x1f\xbe\x39\x79\x7c\x4d\x15\
-\xc2\x5d\x47\xf0\xb5\x7a\x41\xd8\xf4\x51\x7c\x6d\x29\x7e\xf4\x15\
-\x29\x03\xbd\xaa\x91\x4d\xf9\x09\xa4\xcc\x90\xcf\x4b\xe6\xe7\x0f\
-\x99\xbc\x9b\xe7\x8b\x2f\x8b\xac\xaf\x55\xf0\x7d\x8f\xc1\x81\x38\
-\xaf\xbf\xd1\xc9\xe5\xcb\xad\x9c\x19\x8c\xd1\xd6\xe6\xa1\x1b\x45\
-\x4a\x25\x2f\x3c\x76\x2b\xc1\xc6\x08\x8f\xd5\x60\x93\xd5\x25\x7f\
-\x1f\x41\xfd\x73\x2f\x14\xcf\x7c\x14\x11\xe0\x5d\x2a\xa0\xeb\x3e\
-\xd1\xb8\xe4\xc4\x49\x83\xb7\xdf\xee\x21\x9d\x8e\xa3\x28\x6b\xac\
-\x3c\x08\x66\x1e\x8b\xc5\x2a\xa0\x3e\x73\xe6\x51\x7b\xb6\x6a\xfb\
-\xfb\xa3\x0a\xbc\x91\x4d\xa5\x19\x1d\xcd\x70\x6e\x28\x4e\x77\xb7\
-\x82\x50\x2c\x14\x51\x08\x1a\x45\x8d\xa3\xaa\x4e\xc4\x22\xdc\xbf\
-\x01\x29\x4b\xd1\x54\xe0\x35\xce\xfe\x63\x85\x43\x53\x65\x5e\xff\
-\xba\xfc\xc6\x14\x37\x90\x40\x94\xb0\x87\x11\x01\x19\xc3\xf7\x13\
-\x94\xcb\x26\x87\x87\x35\x56\x56\x1c\x26\x26\xf2\x4c\x4d\x15\x58\
-\x7d\xec\xe0\xfb\xd0\xdf\x9f\xe0\xf2\xa5\x70\xd6\xe4\x6c\x8c\x6c\
-\x56\x62\x9a\x0e\xbe\x24\x44\x45\x39\x7c\x2f\x7e\xd3\xf5\xf8\x61\
-\x20\x64\xa3\x58\x15\xf5\x8d\x16\xfe\x1b\x19\xe6\x17\x02\x09\xaa\
-\xc4\x10\x82\x6c\x36\x89\x61\xc4\x41\x40\xa1\x64\x21\xc5\x21\xf3\
-\x73\x87\x4f\xf9\xbe\xa2\xff\x04\x7c\x12\xcc\xa7\x98\xc7\x03\xb2\
-\xbd\xbd\xc9\xbf\x7c\xf8\xdf\xc2\x3a\x63\x9e\x6a\xb5\xc0\xc0\xa0\
-\x60\x24\xac\x33\xce\x9d\x8b\x91\xc9\x96\xc3\x60\xe4\x11\x8a\x1d\
-\xc2\x39\x38\xef\xa5\xf0\x1b\xa7\x78\x90\x45\xc9\x70\x57\x85\x6f\
-\x44\xfa\xc7\x63\x80\x44\xca\xa3\xe7\xb3\xcb\xee\xa7\xb2\x2c\x19\
-\x16\x7c\xa8\x61\x73\x4a\x0b\x55\xdc\x38\xd2\x4f\xe2\xfb\x69\x0e\
-\x0f\x6b\xdc\x9b\xda\x62\x72\x32\xcf\x9d\x3b\x15\xb6\xb6\x5c\x14\
-\xd5\x63\x60\x20\xc1\x5b\x37\x7b\xb8\x74\x29\xc3\x89\x13\x06\xd9\
-\xac\x47\xc4\xb0\x11\x42\x41\xa1\x86\xa2\x10\x24\x14\x78\x4d\x3f\
-\x37\x38\x46\x65\xf8\x4b\x09\x83\x43\x88\x96\x00\x21\x22\x40\xb8\
-\x0c\x34\x37\x05\x09\x8a\x40\xd7\x21\x16\x17\x9c\x38\xa1\x73\xf3\
-\x66\x2f\x89\x64\x02\xcf\x3b\x9a\x79\x2c\x95\x1c\x40\x7e\xec\x54\
-\xec\x5f\x5d\xbe\x74\xed\xaf\xcd\x8e\xee\x20\x20\xf5\x7b\x87\x4c\
-\x4c\x7c\x21\x3f\xbb\xfd\x69\xd8\xcf\x28\xd2\xdd\x6d\x70\xf9\x72\
-\xe2\x68\x72\xa9\x0b\x54\xc5\x41\x11\xc5\x30\x18\x4e\x23\x18\xf5\
-\xdd\x22\x9b\x04\xc0\xfa\xe7\xa2\xb1\x9c\x47\x15\xb7\x6c\x52\x64\
-\x1b\x0b\x2f\x9b\xf4\x2b\xf9\xac\x22\xbc\x1e\x0c\xa5\xd1\x19\x94\
-\x32\x20\x6e\xcf\x4f\x60\x5b\x26\xfb\x07\x35\x96\x16\x8b\x8c\xdf\
-\x39\x64\x66\xb6\xc0\x93\x27\xa0\xaa\x1a\x83\x83\x09\x46\x46\x32\
-\x5c\xb9\x92\xe2\xcc\x99\x08\xf1\x78\x8d\x88\x51\x45\x08\x27\xe4\
-\x3b\x35\xc8\xa0\xa8\x85\x68\x78\x0a\xb9\x4f\x3d\xc5\xd3\xa8\x96\
-\x22\xbc\xee\xa0\x9d\xac\xa0\x80\xaa\x60\x08\x85\x4c\x36\x89\x1e\
-\x89\xe3\x4b\x85\xdc\xa1\x83\x90\xfb\x2c\x2c\x1e\xb2\xbe\x1e\xf4\
-\x53\x24\xe2\x3d\x33\x12\xff\x07\xc7\xa9\xde\xd1\x02\x64\x6c\xf1\
-\xc1\x87\xff\x97\xbc\xfd\xd9\x27\x4c\x4f\xcf\xe0\xd6\x8a\x9c\x1d\
-\x8c\x32\x32\x92\xe6\xcd\xb1\x76\x86\xce\x46\x68\xc9\x56\x50\x85\
-\x15\xa6\x7b\xf5\x7e\x76\x0d\x29\xbd\xa3\xfe\x84\x3c\xea\x6d\x3f\
-\x6b\xaf\x1f\xcb\x8c\xe4\xf1\x13\xec\xe9\x9e\xc6\xf1\xa0\x88\x26\
-\x64\xd4\xa5\x10\x2d\xe0\x0b\xe2\x78\x7e\x92\x5a\x2d\xc5\xce\x6e\
-\x95\x3b\x77\x9e\x30\x39\x79\xc0\xd4\x54\x99\xc3\x43\x88\xc7\x61\
-\x70\x30\xca\xd8\x58\x0f\x17\x2f\xa6\xe8\xed\x55\x48\x24\x2c\x74\
-\xdd\x41\x28\x6e\xb0\xa1\xa4\x8e\xc4\x0c\x11\xe7\x3f\xf3\xc2\x44\
-\x5d\x41\xf8\x5a\x00\x07\x5c\x12\x5c\x77\x0d\x44\x15\x81\x82\xa2\
-\x80\xae\x43\x3c\xa6\x70\xea\x84\xc9\xcf\xdf\x3e\x4d\x36\x93\x41\
-\xd3\x56\xc2\x39\xfa\x29\x8a\x45\x17\x21\xf4\x2f\xfb\xfb\xd7\xd1\
-\x36\xb7\x36\x58\x59\x59\xfe\x2f\x5f\x7c\xf1\x7b\x26\x26\xc7\x39\
-\x38\xd8\xa7\xab\xcb\xe0\xcc\xd9\x0e\x46\x46\x3a\x38\x3b\x98\xa0\
-\xab\xb3\x86\xaa\x96\xc2\x4c\xca\x09\xc4\x3f\x6a\x4f\x5d\xfc\xf3\
-\xce\x7c\xf9\xd5\x4f\xbf\xe9\x25\xcd\x55\x87\x6c\x12\x08\x51\x91\
-\x21\x79\x7b\x7e\x1c\xcf\x4f\x50\x2a\x45\xd8\xdd\x75\x99\x9f\x2f\
-\x72\xe7\xce\x01\xf3\xf3\x05\xf6\xf7\x21\x1e\xd7\x39\x77\x2e\xca\
-\x95\x2b\x01\x32\xfa\xfb\x0d\x4c\xd3\x0e\x07\x7f\xca\x41\xaa\x5d\
-\xc7\xac\xac\x35\xf2\xb6\xfa\xb1\x2b\x9a\x9e\xdf\x4a\xec\x6f\x04\
-\x45\x80\x74\xc3\xda\x49\xa0\x2a\x1a\x42\x37\xc9\x66\xe2\x18\x7a\
-\x0b\x5e\xcd\x64\xfb\x49\x91\x7c\xee\x09\xb3\x73\x07\xd8\xf6\x22\
-\xa9\x74\x9a\x27\x4f\x9e\xa0\x4d\x8c\x7f\xf9\xf1\xfc\xfd\xfb\x37\
-\x97\x96\x1e\xb1\xb3\xb3\x8f\xa6\x55\x68\x6b\xcb\x72\xee\xdc\x69\
-\xce\x9c\x69\x27\x91\x2c\x21\x44\x2e\x20\x6c\x51\x6b\x90\xd9\xb7\
-\x58\xd1\xaf\xc0\xfc\x99\x5a\x54\x83\x3f\x9e\xf1\x66\x85\x12\x1e\
-\x63\xf5\xfe\x85\x1e\x64\x52\x98\xf8\x32\x81\xe7\xc5\xa9\x54\xe2\
-\x6c\x6d\x56\xf9\xe2\xcb\x4d\x26\x27\x0f\x99\x9d\x29\x53\x2c\x42\
-\x6b\x2b\x9c\x3b\x17\xe5\xc6\x8d\x13\x5c\xb8\x90\xa4\xb3\x43\x12\
-\x33\x6d\x54\xad\x14\x8c\x52\x53\x0d\xb3\x27\x81\x40\x0d\x8d\x13\
-\xea\x57\x91\xf1\x4d\x6f\x53\x7c\x1d\x52\x7c\x84\xf4\x82\xd4\x58\
-\x04\x4f\x55\xf5\x89\x9a\x1a\x6d\x2d\x69\xce\x0c\x9e\x62\x67\x47\
-\xe7\xf1\xe3\x35\xf6\x0e\x8a\x2c\xdc\x5f\x60\x63\x63\x33\xe0\x10\
-\x4d\xd3\x48\xc4\x13\xc4\xe3\x09\x6a\xae\x47\xad\xe6\x63\x59\x15\
-\x4a\x56\x85\x4a\xc5\xa7\x16\x03\x5d\x28\x41\xbe\x2f\x94\xe3\xfb\
-\x46\x7c\xa3\x16\x1e\x70\xc5\x77\xb9\x93\xa0\x78\x8a\x33\xa4\x12\
-\xa2\x22\x02\x32\x8a\xe7\xc7\x70\x6b\x71\xf2\x79\x9d\xad\xad\x2a\
-\x73\xf3\x05\xee\xdc\x39\x60\x69\xa9\x88\x65\x41\x36\xab\x73\xe1\
-\x42\x94\xab\x57\xb3\x5c\xba\x94\xe0\xc4\x09\x1d\x43\x2f\xa1\xa9\
-\xa5\xa0\x3f\xdf\xe0\xbe\x80\xa6\x8f\x93\xf8\xb3\x5b\xc3\x7f\xd8\
-\xa3\x19\x63\x0a\x9e\x2f\x70\x1c\x1f\xcb\x92\x94\x4a\x12\xc7\x09\
-\x7e\x52\x2c\x66\xd2\xd9\xd9\x49\x6b\x5b\x3b\xda\xb5\xd1\x3f\x79\
-\x2b\x9b\x6d\x19\x2c\x15\x73\xcb\x86\x0e\x73\x73\x33\xac\xaf\xe6\
-\xf8\xf4\x93\xbb\x54\xab\x1d\xbc\xf5\x56\x2f\xd1\x98\x81\x50\x4c\
-\x84\x1a\x45\xc8\x6a\x08\xf5\x23\x32\x6f\x4e\x51\xe5\x1f\x70\xcd\
-\xcd\xdc\x72\x2c\xa7\x92\x22\x24\xdc\x50\x3a\x27\x86\x94\x29\x5c\
-\x37\x86\x6d\x47\x58\x5d\x75\xf8\xec\xf6\x13\xee\xdd\xcb\xb1\xb4\
-\x54\xc6\xad\x42\x6f\x2f\x5c\xb8\x10\xe5\x8d\x37\xfa\x38\x37\x94\
-\xa4\xad\xcd\xc3\xd0\x73\xc1\x91\xab\x94\x01\x27\x6c\x07\xd7\x8f\
-\x96\x3f\x7c\xb9\xeb\x59\xe2\x31\x7e\x0c\x8f\xd7\x40\x71\x56\xc3\
-\xc4\xc3\x44\xca\x28\xe5\xb2\xc6\xd6\x56\x99\xf9\xf9\x12\x9f\x7d\
-\xf6\x90\xe9\xd9\x5d\x4a\x25\x9b\xc1\x33\x03\xfc\x2f\xff\xe1\x3f\
-\x70\xf9\xd2\x55\xa1\xf5\x74\xf7\xa2\x08\xb1\x52\x2a\xe5\x7f\x23\
-\xa5\xff\x8e\xe3\x54\xd9\xdc\x58\xe4\xe1\x83\x03\x34\xcd\x21\x93\
-\x55\x11\x4a\x86\xbe\x3e\x85\x4c\x3a\x86\xd0\xdc\x50\xc3\xa9\x07\
-\xa3\x76\x94\x1e\x7e\xc7\x90\x08\xf1\xf4\xee\x13\x4d\x9a\x54\x90\
-\xcb\x20\x35\xfc\x30\x18\x35\x2f\x81\x5b\x8d\x71\x78\xa0\xb1\xbe\
-\x5e\x61\x7a\xa6\xc0\xc4\x44\x8e\x07\x0f\x4a\x54\x2b\x82\x8e\x8e\
-\x08\xc3\xc3\x26\xd7\xae\x65\xb8\x78\x31\x41\x4f\xb7\x86\xa2\x06\
-\x1a\x9a\x22\x6c\x10\x4e\x70\x84\x34\xb4\xb4\xba\x09\x42\x7e\xcb\
-\x23\xf8\x9b\xe2\x53\xef\xdf\x6b\x80\x01\xd2\x44\xfa\x31\xdc\xaa\
-\x89\x6d\x2b\x6c\x6e\x54\x98\x9a\x2e\x31\x3e\x71\xc8\xfd\x85\x5d\
-\x6c\x4b\x70\x76\xe8\x22\x63\x63\x6f\xf3\xe6\x1b\x6f\x8a\xe1\xe1\
-\x2b\xc1\x91\x95\xc9\x64\x19\x19\x19\xfd\x4b\xd3\x8c\xfe\x56\x20\
-\xff\x71\x72\x42\x67\x71\x71\x96\xf9\xf9\x1c\x8a\xfa\x80\x62\xb1\
-\x95\x9b\x37\x7a\x30\x23\x71\x14\xd3\x43\x08\x89\xa2\xd4\x2f\xbe\
-\x02\xb8\xe1\x0e\xf1\xbf\x3b\xc8\x45\x30\xa7\x71\x2c\x18\xf5\x56\
-\x2b\x1a\xbe\x34\xc2\x3e\x46\x82\x6a\x35\x4a\x21\xaf\xf3\xe0\x41\
-\x99\xcf\x3e\xdb\x61\x6a\x2a\xcf\xca\x83\x32\x52\x0a\x4e\x0f\x68\
-\x5c\x1a\x4e\xf2\xc6\xeb\xdd\x9c\x3d\x1b\x23\xdb\x52\xfb\x4a\x30\
-\x44\x73\xc1\xd7\xb8\x52\xbf\x29\x11\xff\xee\xf0\x16\x1c\x47\x46\
-\x3d\x18\x52\x46\xf1\x65\x02\xdf\x4f\x61\xdb\x11\x36\xb7\x5c\xa6\
-\x67\x0a\xdc\xba\x75\xc0\xcc\x4c\x81\xdd\x3d\x9b\x81\x81\x8b\xfc\
-\xe5\x3b\xff\x91\xb1\xb1\x9f\x8b\x13\x27\xfa\x8f\x2a\x75\xd3\x8c\
-\xd2\xd5\x15\x45\xc0\x6f\x2a\x8e\xfd\x8e\x80\x3f\xb3\xec\x0a\x9b\
-\x9b\x8b\x2c\x2d\x15\x01\x9f\x54\x32\x0a\xa4\x39\xd1\x6b\x90\xc9\
-\x24\xd0\x34\x89\xa2\x36\x2f\xbd\x7b\x24\x35\x1c\xdb\xed\xcf\x39\
-\x5a\x9f\xd6\x51\x38\xb2\xed\x34\xb2\x29\x3f\x86\x5b\x8b\xe2\x54\
-\xa2\xec\xed\x29\x3c\x7c\x68\x33\x3d\x15\x20\x63\x6d\xcd\x42\x08\
-\x41\x6f\xaf\xc1\xc8\xe5\x04\x57\xae\x66\x38\x77\x3e\x4e\x67\xa7\
-\x12\xaa\xcf\x25\x94\xf0\x98\xaa\x1f\xb3\xf5\x0c\x4a\x8a\x66\xf9\
-\xe5\xfb\x20\xa3\x69\x33\x49\x2d\x54\x0d\x4c\xa4\x4c\x50\xad\x26\
-\xb0\xac\x28\x1b\xeb\x92\x99\x99\x22\xe3\x77\x72\xcc\xce\xee\x93\
-\xcf\x47\x18\x18\xb8\xc8\xd8\xd8\xcf\x19\x1b\xfb\xb9\x18\x1e\xbe\
-\xf2\x6c\xe9\x24\x9d\xc9\x32\x32\x72\xfd\xcf\x23\x66\xf4\x5d\x29\
-\x6a\xff\x30\x31\xa9\xb2\xb4\x38\xcf\xcc\x6c\x1e\x29\x57\x29\x14\
-\x5a\xb8\x79\xb3\x07\xc3\x4c\x12\x35\x41\x57\x40\x15\x4d\x45\x92\
-\xac\x35\x0a\x2a\x79\x8c\xd0\xc4\x73\x83\x22\x25\x47\xb6\x50\xa9\
-\x85\xcb\xa3\xe3\xcb\x28\xbe\x9f\xc6\x71\x22\xec\xed\x4b\xee\xdf\
-\xb7\xf8\xf4\x93\x3d\x66\x66\x0a\xac\xaf\x3b\x44\x22\x82\x0b\x17\
-\x34\x2e\x5f\x8e\x73\xed\x5a\x27\xa7\x07\x62\x64\x32\x95\x50\x55\
-\xae\x07\x23\x94\xf2\xa5\xd7\xa4\x91\xd5\xf9\xa9\xc9\x0b\xfc\x9d\
-\xa9\xbb\xde\xb3\xaf\x07\x56\x0b\xad\xac\x26\xc8\x78\x80\x0c\x2b\
-\xc6\xe6\x86\x60\x7a\xda\xe2\xd6\xad\x7d\x66\x66\x73\xec\xed\x55\
-\x19\x18\x38\xc7\x5f\x3c\x85\x8c\x67\x06\xc4\x34\xa3\x98\x5d\x51\
-\xa4\x90\xbf\x76\x2a\xc5\xbf\x91\x82\xe1\x52\xc9\x63\x73\x73\x89\
-\xa5\xa5\x02\x42\x1c\x90\x4e\xc7\x81\x34\x7d\x7d\x11\x32\x19\x40\
-\x0b\x0c\xcd\x0d\x15\x3c\x14\xe1\x9e\x17\x0c\xd1\xb4\x10\x92\x26\
-\x29\x44\xea\xe1\x51\xa5\x20\x89\xe0\xba\x51\x6c\xcb\xe0\xc9\xb6\
-\x64\x71\xc9\xe6\xde\xbd\x3c\x93\x77\x73\x6c\x6d\x56\x30\x4d\x9d\
-\xfe\x7e\x83\x2b\x57\x23\x5c\x19\x49\x72\x76\x28\x4a\x5b\xab\x08\
-\xef\x0e\x64\xa1\x28\x76\x58\x9c\x35\x25\x1f\xf8\x0d\x39\x5f\x3e\
-\x33\xa3\x12\xdf\xa2\x8a\x12\x8d\xeb\x16\x8d\x1a\x49\x0d\x2d\xab\
-\x26\x52\xc6\x71\xab\x71\x2c\x3b\xc2\xfa\x86\xcf\xf4\x94\xc3\x9d\
-\x3b\x39\x66\x66\x0a\x21\x32\xce\xf1\xe6\x33\x90\xf1\x5c\xb5\x37\
-\x93\x6e\x61\x64\xe4\x67\x97\xcc\x48\xe2\x3d\xa4\xfa\xfe\xc4\x84\
-\xc1\xf2\xd2\x2c\xb3\x73\x39\x84\x58\xa3\x50\xb0\xb8\x79\xb3\x07\
-\x33\x92\x84\x68\xb0\xe3\xea\x9c\x22\x70\x91\x8d\xcc\x4b\x7c\x33\
-\xd2\x1b\x2d\x56\x23\x14\x0a\x09\x0d\x09\x51\x6c\x5b\x65\xeb\x89\
-\xcb\xec\x9c\xc5\x27\x9f\x1e\x30\x37\x5b\x64\x6b\xb3\x42\x22\xa1\
-\x73\xf5\x6a\x96\x2b\x57\x93\x5c\xb9\x12\xe3\xd4\x29\x95\x54\x2a\
-\x44\x86\x62\xa1\x88\x72\x18\x8c\x90\x33\xe4\xd3\xbe\xae\x6f\x8f\
-\x06\xf9\xd4\x9e\x92\x0d\xee\x10\xa1\x9e\xa6\x84\xae\xc8\x28\xd2\
-\x8f\xe3\xfb\x69\x2c\x3b\xc2\xe6\xa6\xcf\x4c\x1d\x19\x33\x05\xf6\
-\xf6\x2a\x0c\x0c\x9c\xfd\x5a\x64\x3c\x37\x20\xa6\x19\xa5\xcb\xec\
-\x05\x29\x7e\x55\x76\xca\x7f\x0e\xfc\xc2\xb6\x2b\x21\x52\x8a\xc0\
-\x01\xa9\x54\x1c\x29\x8f\x90\xa2\x69\x12\x55\x11\x47\xe4\x29\xfd\
-\xa7\x50\x22\xbe\xb2\xed\xa4\x0c\xde\x54\x10\x10\x89\x2f\x0d\x90\
-\x2a\xae\xab\x62\x59\x0a\x1b\x9b\x2e\x73\x73\x25\xee\xde\xcb\x33\
-\x33\x93\x67\x6f\xb7\x4a\x3a\xad\x73\xe6\x4c\x9c\x6b\xa3\x29\x46\
-\x46\x92\x9c\x3e\xad\x93\xcd\xba\x0d\xdb\xa9\x22\x1c\x10\x95\x26\
-\x64\xc8\x6f\x51\xdd\x7d\x53\x59\x2b\x8e\x2b\x07\xa1\xf6\x15\xb4\
-\x91\x43\x71\xd3\x8f\x53\xad\x26\xb0\xed\x28\xeb\x1b\x92\x99\x69\
-\x2b\x40\xc6\x6c\x2e\x44\xc6\xd9\xe7\x22\xe3\x5b\x75\x0c\x33\x99\
-\x2c\x57\x46\xfe\xe4\x4f\xa3\x66\xf4\x3d\xa8\xbd\x3f\x39\xa9\xb2\
-\xbc\x74\x9f\xd9\xd9\x3c\xd2\x5f\x23\x9f\x0f\x90\x12\x89\x24\x89\
-\x46\x05\x42\x57\xc2\x84\x95\x86\x2c\xf1\xac\x3c\xbf\x2e\x2c\x06\
-\xe6\x35\x35\xc8\x4a\x7c\x35\x78\xca\x28\xa5\x92\xc7\xda\x5a\x81\
-\xa9\xe9\x1c\x1f\x7f\x9c\x63\x61\xb1\x44\xbe\xe0\xd2\xda\xa2\x73\
-\xfd\x7a\x92\x2b\x57\xd2\x5c\x1c\x4e\xd2\xd7\xab\x91\x48\x94\x83\
-\x29\xaa\x7a\x30\xa8\x1e\x53\x13\x9e\x6e\x6e\xfd\xc1\xb7\xba\x97\
-\xe2\xf8\x91\x25\xeb\xe8\x30\x1a\xc8\xb0\xed\x28\x1b\x1b\x0a\xd3\
-\x53\x16\xbf\xbb\xb5\xcf\xec\x4c\x8e\xbd\xfd\x90\x33\xfe\xe2\xf9\
-\xc8\xf8\x56\x01\xa9\x67\x5f\xe0\xff\xaa\xec\x14\xff\x16\x18\xb4\
-\x2d\x8f\xcd\x8d\x65\x16\x97\x0a\xc8\x10\x29\xcd\x9c\xa2\x69\x7e\
-\x80\x94\xb0\x63\x28\xc3\x34\xf6\x2b\xb8\x97\xf5\xc6\x92\x11\x1a\
-\xa0\xc1\xa9\x40\xa9\x48\x50\x63\x4c\x17\x99\xbc\x9b\x67\xfe\x7e\
-\x91\x7c\xde\xa3\xbd\x23\xc6\x85\x0b\x71\x46\xaf\x27\xb9\x34\x1c\
-\xa3\xb7\x57\x21\x95\x74\xc3\xfb\x66\x05\x1a\x5b\x83\xc0\x1b\xc7\
-\xd4\x53\x67\xa4\xfc\xba\xac\xee\x38\x02\x24\xe2\xab\x86\xbb\x06\
-\x6f\xa8\xc1\x2d\xa1\x90\x61\x9b\x38\x46\xd5\x41\x53\x7c\xf3\x00\
-\x00\x0c\xf6\x49\x44\x41\x54\x8d\x63\xdb\x11\xd6\x37\x24\xd3\x53\
-\x16\x5f\x7e\x99\x63\x66\xba\x40\xbe\x10\x72\xc6\x9b\xdf\x8c\x8c\
-\xef\xe4\x3a\xc9\x64\x5a\xb9\x32\xf2\xb3\x33\x51\x33\xf9\x1e\x68\
-\xef\x4f\x4e\x44\x58\x5a\x9a\x65\x2e\xe4\x94\x62\xd1\xe2\xc6\x8d\
-\x1e\x22\x91\x04\xd1\xa8\x44\xe8\x4a\xa8\x0b\xb9\x8d\x2e\x02\x28\
-\x4d\xf5\x46\x3d\x28\x2a\xc8\x28\xc8\x14\xbe\x2f\x28\x95\x6c\x1e\
-\xac\xec\x32\x35\x75\xc0\x67\x9f\x1d\xf2\xe0\x81\x85\x65\xbb\xf4\
-\xf4\xc4\x79\xfd\xf5\x1e\xae\x5c\x49\x73\xfe\xbc\x4a\x77\xb7\x4f\
-\x2c\x5a\x0e\x09\xbc\x7e\x87\x20\xf7\xa8\x65\xfc\xb4\x1b\x45\x3e\
-\xcd\xd0\xc1\xfd\x4f\x40\x6b\xea\xab\x84\x9e\x5f\x11\x64\x4e\xb2\
-\x59\xbe\x69\x28\xcd\x22\xbc\x3f\x57\xf8\xb9\x1f\x45\xfa\x29\x6c\
-\xdb\x60\x6b\xd3\x3b\xce\x19\xfb\x21\x67\x7c\x4b\x64\x7c\xa7\x80\
-\x04\x48\xe9\x03\x94\x80\x53\x24\xbf\xb0\xad\x6a\x53\x9d\x72\x40\
-\x32\x79\x84\x94\x74\x46\xa0\xa9\x6a\x60\xa3\xa1\x16\xde\x60\xac\
-\x5e\xec\x35\xf7\xa7\x34\x24\x09\x9c\x4a\x8c\x52\xc9\x66\x73\xd3\
-\x66\x72\xf2\x90\xe9\xa9\x03\x56\x56\x2c\xca\x65\x9f\xde\x9e\x18\
-\x17\x2e\x66\x19\x1d\xcd\x72\xe1\xb5\x38\x1d\x9d\x6e\x70\x4c\x09\
-\x27\x0c\x46\x90\x49\xc9\xc6\xbe\x3e\xaa\xf4\xbf\x9e\x37\x94\xf0\
-\xa8\xac\xab\xc7\xea\x11\x41\xf3\x0c\x34\x87\xdd\xc9\xc0\x13\xec\
-\x87\xb5\x86\x81\x5b\x8d\x86\xc7\x94\xcf\xcc\x8c\xcd\x9d\xf1\x23\
-\xce\x18\xfc\x96\x9c\xf1\xbd\x9c\x8b\xcd\x9c\x22\xf0\xde\x9f\x9c\
-\x54\x59\x5a\x9a\x0f\x38\x45\x1e\x65\x5f\x91\x48\x8a\x88\xa9\x86\
-\xf7\x16\xa9\x84\x3b\x51\x03\x59\x3d\x86\x90\x40\xe7\x49\x53\x28\
-\x44\x78\xfc\x78\x9d\xd9\xd9\x4d\xbe\xfc\xe2\x80\xb5\x35\x0b\xdf\
-\xab\xd1\x7f\x3a\xc6\x1b\x6f\x76\x73\xf9\x72\x0b\x03\x03\x51\x3a\
-\xda\x3d\xa2\xa6\x8d\x12\xf2\x85\xa0\x16\xcc\x8b\x08\x81\xa8\x07\
-\x41\x86\x2d\xb2\xba\xbe\x26\x9f\x95\x55\xd5\x6b\x1e\x35\xec\xc5\
-\xab\x4d\xcf\x50\x29\x90\xcd\x22\x7c\x1d\xf1\xc1\xb8\x9b\x44\x45\
-\xfa\x31\x6c\xdb\x60\x73\x43\x61\x6a\xca\xe6\xd6\x47\x7b\x01\x67\
-\xec\x55\x19\x38\x7d\xee\x1b\xb3\xa9\x1f\x24\x20\xcd\x9c\xe2\x84\
-\x9c\x62\x59\x1e\x1b\xf5\x3a\x85\xa0\x4e\x11\x42\xa1\xa7\x37\x42\
-\x3a\xad\xa3\x69\x3a\x42\xd4\xd5\xda\x6a\x48\x88\x81\xdd\xdf\xb6\
-\x83\xf1\x64\xa7\x52\x63\x76\x66\x8f\xfb\xf7\xf7\x79\xfc\xd8\xc2\
-\xf7\x55\xfa\xfb\x5b\xb8\x74\xb9\x95\x6b\x57\xdb\x39\x3b\x14\x23\
-\x9b\xf1\x89\x46\x9d\xd0\x19\x4f\xa3\x6e\x09\x16\xf6\x19\xe3\x0a\
-\x52\x1e\x77\xbf\x1f\x0b\x8b\x08\x77\x7b\xdd\x80\x5d\x1f\x81\xd3\
-\xc3\x7f\x1d\x22\xba\x2e\x14\x52\x97\x43\x4c\x24\x92\x9a\xab\x52\
-\xb6\x0d\x36\x36\x7c\xa6\xa6\x4a\x7c\x79\x27\xc7\xcc\x74\x31\xe0\
-\x8c\xd3\xe7\xfe\x20\x64\x7c\x2f\xf7\x7b\x26\xd3\xca\xc8\xc8\xcf\
-\xce\x98\x66\xf2\x3d\x89\xfa\xfe\xe4\x64\x50\xa7\xcc\xcd\xe7\x10\
-\xca\x1a\x85\xa2\xcd\x8d\x1b\x27\x88\x44\x92\x98\xa6\x8e\xa6\x89\
-\xf0\x0d\x57\x43\x29\x1d\x3c\x0f\xf6\xf7\x4b\x4c\x4e\xae\xa0\xaa\
-\x0a\xf3\xf3\x5b\x1c\xec\x97\xd0\x75\x8f\xc1\xc1\x56\x6e\xde\x1c\
-\xe1\xd2\xa5\x4e\xfa\xfa\x7c\xd2\xa9\x2a\xba\x6e\x81\x74\x83\xce\
-\x9e\x2f\x90\xc2\x68\x0c\x7f\x3e\x5b\x3a\x97\x21\x8f\x1f\x0f\x88\
-\x90\x34\x91\x74\x10\x54\x5f\x06\x59\x92\x94\x2a\x42\xa8\x28\xc2\
-\x0e\xaf\x53\x34\xd5\x48\xf5\xd9\x45\x0d\xdb\xf6\x79\xb2\x55\x09\
-\xb5\xa9\x5d\xa6\x67\x0a\xec\xed\x39\x0c\x0e\x0c\xff\xc1\xc8\xf8\
-\x5e\x01\xf9\x0a\xa7\x08\x7e\x61\xdb\x55\xb6\x42\x4e\x91\x1c\x90\
-\x48\x26\xf1\xa5\x4a\x5f\xaf\x41\x2a\x15\x41\x08\x13\x29\x83\xe3\
-\xcb\xf7\x05\x6e\x55\x72\xe0\x38\xcc\xcd\x3e\x01\x60\x6b\xcb\xc2\
-\x30\x34\xfa\xfb\xdb\xb9\x70\xe1\x34\xe7\xcf\x0f\x72\xf2\x64\x96\
-\x68\xb4\x08\xb2\x48\xb5\xea\xe3\x0a\x19\x1e\x1d\x91\xd0\xa4\x76\
-\x54\x25\x7c\xb5\x7a\x38\x3a\xad\x8e\x4b\xfa\xc7\x7b\xf3\xc1\x82\
-\x47\x91\x32\x85\xe3\x08\xaa\x15\x9f\x9a\xab\xe3\x7b\xcd\x7d\x98\
-\x28\xbe\x1f\xa7\x5a\x8d\x51\xb6\x15\x36\x36\xcb\xcc\xce\x58\xdc\
-\x19\x3f\x0c\x39\xc3\x60\x60\x60\xf8\x3b\x65\x53\x3f\xca\x04\x55\
-\x33\xa7\x28\xcd\x9c\x32\x93\xc7\xf3\x1e\x93\x3b\x2c\x73\xf3\xe6\
-\x69\x06\x06\x92\x18\x46\x14\x5f\x56\xf1\xa5\x81\xe7\xa9\x38\x15\
-\x8f\x62\xb1\x46\xc9\x2a\x62\x18\x0a\xba\x21\xe9\xeb\x6b\xe3\xda\
-\xb5\x2b\x0c\x0f\x9f\x26\x9d\x6e\xc1\x75\x15\x6a\xb5\x0a\x8a\x62\
-\xa2\x08\x49\x30\xe6\x13\x8e\xb6\x09\xff\x19\x83\x3c\xcf\x48\xab\
-\x9e\x69\xce\xae\xd7\x12\xe1\x44\xaf\x8c\x20\x65\x82\x7c\xce\xa3\
-\x58\x70\xb0\x6d\x95\x9a\x2b\x90\x9e\x1a\xba\x1f\xe3\x48\x2f\x85\
-\x6d\x45\xd8\xda\x74\x98\x9e\x2a\x73\xeb\xa3\x5d\x66\x67\xf7\xc3\
-\x6c\x6a\x88\x77\xfe\xe2\xfb\x21\xe3\x07\x09\xc8\x91\x4a\x2c\x7f\
-\x55\x71\x4a\x7f\x0d\x0c\x97\x2c\x8f\x8d\x8d\x25\x96\x97\x82\x7b\
-\xaf\xa7\xd3\x69\x20\x4e\x77\x77\x8a\x5a\x2d\x8a\xf4\x75\xa4\xaf\
-\xe0\xd5\x7c\x9c\xb2\x8f\x6d\x57\x31\x4d\x85\x4c\x46\xc5\x97\x50\
-\xad\x4a\x0e\x0e\xca\x94\xcb\x5b\xa8\x6a\x0d\x29\x6d\x90\x4e\xe8\
-\x20\xac\x85\x46\xbc\xd0\x15\x22\xe4\xd7\x1b\x2a\x9e\xe3\x24\x3a\
-\x66\x39\xad\x4b\xe6\xb2\xcc\xe1\x61\x8d\x47\x8f\x72\x6c\x6e\x16\
-\x28\xdb\x2e\x89\xb8\x8a\x20\x86\x57\x8b\x53\x2a\x19\x58\x25\x9f\
-\xa9\xe9\x02\x77\xee\xec\x33\x33\x93\xa7\x50\x30\x18\x18\x18\x62\
-\xec\x07\x40\xc6\x0f\x12\x90\x23\x95\x38\xd0\xbe\x22\x66\xe2\x3d\
-\x1f\xf5\xfd\xc9\x09\x83\xa5\xe5\x59\xe6\xe7\xf3\x08\x65\x85\x42\
-\xb1\xc6\x8d\xb1\x56\xaa\xd5\x08\xbe\xaf\x85\x3d\x90\xa0\x54\x50\
-\x04\x78\x9e\xc4\xb2\x3d\x56\x1f\xef\xe2\x94\xef\x30\x31\x61\xa2\
-\x28\x81\xd7\x49\xca\x5a\xc3\xa8\x56\x27\x6b\x81\x0c\x3a\xc9\x4d\
-\x62\xff\x77\x0b\x08\x4d\x19\x54\xdd\x82\xaa\xe0\x38\x92\x7c\xde\
-\x25\x9f\x77\x28\x14\xca\x74\x74\xa4\x50\x94\x24\xae\x1b\x67\x77\
-\xc7\xe3\xd1\xa3\x02\x1f\x7d\xb4\xca\xf4\xf4\x0e\xfb\xfb\x65\x06\
-\x06\x2f\xfe\x60\xc8\xf8\x41\x03\x12\xa8\xc4\xbd\x48\x8e\xb4\x2f\
-\xcb\xae\xb2\xb9\x59\x47\xca\x13\x52\xc9\x2d\x62\x31\x1d\xdf\x57\
-\x48\xa7\x63\xb4\xb7\x3b\x18\x46\x20\x44\x06\xb7\xc0\xf0\xd1\x34\
-\x9b\x52\xc9\xc6\xb6\xbf\x5e\xe2\x38\x66\xb6\x16\x4d\x32\xcc\xb3\
-\xfd\x2a\xcf\x55\x6f\xe5\x53\x7d\x7f\xcf\x03\xb7\x0a\x8a\x50\xc8\
-\x66\x55\xd2\x69\x03\xdf\xd7\xd8\xd9\xa9\x91\x3b\x2c\xb0\xb0\xb0\
-\xc7\xec\xec\x2e\x85\x82\xc2\xc0\xe0\xb3\xfb\x19\x2f\x45\x40\x9e\
-\xad\x7d\xf9\xef\x4f\x4c\x68\x2c\x2d\x87\x75\x8a\x3f\x45\x67\x67\
-\x1c\x5d\x17\x9c\x3c\xd9\x4a\x32\x99\xc3\x29\x97\x91\xb2\x86\xa4\
-\xd6\xf0\xfe\x2a\xa2\x69\x68\x4a\x7c\x7d\x40\x10\xcf\xa1\x88\xef\
-\x28\x20\xd6\xb3\x64\xdf\x07\xe9\x0b\x04\x1a\x9a\x16\x23\x9b\x35\
-\xa9\x54\x6b\x2c\x2c\x1c\x30\x3b\xb3\xc5\xc3\x87\x07\xec\xef\xd9\
-\x9c\x3e\x7d\xf1\x7b\x67\x53\x2f\x24\x20\x47\x75\x8a\xfc\x55\x39\
-\xe4\x14\xcb\xae\xb1\xb1\xb1\xc2\xe2\xe2\x21\xfb\xfb\x05\xfa\x4f\
-\x65\x69\xef\x88\xd1\xd5\xd9\x83\x11\xf1\xc3\x16\x70\xb5\x61\x9a\
-\x68\xd8\x33\x45\xdd\x74\x27\x9f\x73\x1c\xc9\xaf\xf4\x2a\xc4\x33\
-\x8f\xa8\x67\x47\x51\x36\xeb\x54\x61\x1b\x00\x5f\x43\xfa\x3a\x9e\
-\x17\xc1\xa9\xa8\xec\xee\x96\xd9\x58\x2f\x31\x37\xbf\x4b\xc5\xd1\
-\x38\x3d\x70\xf1\x07\xc9\xa6\x5e\x48\x40\x8e\x90\xd2\xc2\x95\x91\
-\x9f\x5d\x32\xcd\xc4\x7b\x12\xe5\xfd\x89\xf1\x08\x8b\x8b\x73\xac\
-\xae\x1e\xa2\x08\x9f\x74\xda\xe4\xdc\xe8\x45\x4e\x9d\xcc\xa2\xa8\
-\x76\xd8\xe1\x73\x1a\x16\x7f\x44\xed\x68\x0a\x57\xc8\x63\x85\x9e\
-\x78\x9e\x01\xaf\x69\xc1\xc5\xb1\x94\x57\x3e\x15\x30\xd1\x34\x83\
-\x18\x04\x22\x90\xfe\xa3\x40\x1c\xdb\x56\xd9\xdf\xab\xb0\xb0\xb0\
-\xc7\xbd\x7b\x2b\x2c\x2d\xed\x50\xc8\x3b\x9c\x39\x3b\xfc\xa3\x21\
-\xe3\x47\x0d\x48\x80\x94\x5e\xa8\x73\x8a\xe4\x17\x96\x55\x61\x73\
-\x73\x99\xfd\xfd\x12\x9b\x9b\x25\xf2\xb9\x0a\xf2\xa4\x4a\x5b\x6b\
-\x0b\xc9\x54\xc0\x1f\x41\x4f\xa3\x49\xb5\x15\xf5\x1b\x07\xf8\x0d\
-\xdf\xaf\x78\xae\x07\xec\x79\x01\x09\x95\x2e\x59\x47\x85\x1a\xf6\
-\x62\x02\x7f\xb0\x2f\xe3\xb8\x6e\x0c\xa7\x1c\xe3\xc9\x13\x97\x62\
-\x71\x8f\xad\xad\x32\xeb\xeb\x05\x9c\x8a\xc6\xe0\xd9\xe1\xef\x55\
-\x81\xff\xa4\x01\x69\xe6\x94\xab\x23\x7f\xf2\xa7\x51\x33\xf6\xae\
-\x10\xf2\x1f\x26\xc6\x0d\x16\x17\xe7\x98\x9e\xde\xc7\xf7\xbe\x64\
-\x7f\x7f\x93\x1b\x37\xce\x30\x10\x49\xa1\x28\x55\x54\xb5\x7c\xe4\
-\x1d\xae\xdf\x68\x46\x1c\x77\x4a\x7e\x33\x47\x3c\xb3\x12\x6c\x52\
-\x6d\x8f\x6c\xa9\x75\xb3\xb6\x2f\xe3\x08\x5f\xa7\xe2\x28\x3c\x79\
-\x52\x61\x7a\xea\x90\x8f\xfe\x9f\x65\x66\x67\xb6\xd8\xdd\x2b\x32\
-\x30\xf0\x1a\xef\xfc\xc8\xc8\x78\x21\x01\x69\xe2\x94\x5f\x57\x1c\
-\xeb\x5d\xa4\xb8\x59\x2a\xb9\x6c\xac\x2f\xb1\xb8\xb8\x8f\xa4\x4a\
-\x3a\x6d\x20\x94\x76\x7a\x7b\x55\xd2\x19\x0f\x5d\x73\xc3\x23\xac\
-\x1c\x76\xfe\xbc\xb0\x2a\xf7\x9e\xd2\xa8\xbe\x8e\xc1\x9b\xb3\x81\
-\xa7\xfa\xe5\x61\x5f\x46\x4a\x0d\x44\x68\x48\x40\xc5\x73\x6b\xd8\
-\x76\x99\xcd\xcd\x32\x33\x33\x65\xee\x8c\xef\x30\x3d\xbd\x46\x3e\
-\x0f\x03\x03\xaf\xfd\x28\xd9\xd4\x4f\x12\x90\x66\x4e\x19\x19\xf9\
-\x93\xb7\x4c\x33\xfe\xae\x94\xe2\x1f\x26\x26\x0c\x96\x97\x67\xb9\
-\x7f\x3f\x8f\xa6\x2e\x50\x2c\x1d\x70\xe3\xc6\x49\xcc\xa8\x89\xaa\
-\x28\xa8\xaa\x08\x09\xde\x0d\x0a\x42\x11\x9a\xf3\xa4\xd7\x3c\xcc\
-\xf0\x35\xe3\x0a\xe2\x6b\x82\xa4\x1c\xb5\x5e\x31\x9a\x66\xd9\x75\
-\x1c\x47\xb0\xb5\x55\x64\x76\xb6\xc4\xad\x5b\x3b\xcc\xce\x1e\xb2\
-\xb7\x67\x31\x30\x70\xf1\x85\x21\xe3\x85\x06\xa4\x89\x53\x7e\x5d\
-\x2e\xdb\xef\x08\x21\x7f\x51\x76\x02\xdf\xd7\xf2\x72\x11\x21\x6a\
-\xa4\x52\x11\x20\xcb\x89\x3e\xc8\x64\x74\x54\x4d\x0d\x7b\xf4\xf5\
-\xa9\xa5\xba\x63\xb2\x79\x1a\x8b\x6f\x19\x94\xb0\xff\x21\xb4\x06\
-\x4a\x7c\x74\x5c\x57\xa7\x6c\xab\x6c\xac\x57\x99\x9a\xce\x73\xe7\
-\xce\x01\xb3\xb3\xbb\xe4\xf3\x06\x83\x83\x3f\x6e\x36\xf5\x75\x8f\
-\x17\x7a\x67\x6b\x4d\xd3\xc8\x64\x5a\xfe\xcf\x44\x22\xbe\x23\xa5\
-\xfb\x6f\xab\xd5\x0a\x3b\xdb\x05\xf6\x76\x8b\x94\x4a\x36\xae\xeb\
-\x92\xc9\xc6\x49\x26\x4d\x14\x45\xa2\x28\x7e\x30\xb1\x24\xbc\x86\
-\x7d\x55\x84\xe9\x70\xe3\x63\x3d\x71\x0d\xef\xb1\x78\xbc\xe1\x5a\
-\xaf\x1a\x9b\x65\xf4\x60\xda\xca\xf7\x53\x58\xa5\x28\x1b\x1b\x82\
-\xa9\x29\x8b\xdf\xfd\xee\x09\x77\xc6\xf7\xd9\xdf\xaf\x70\xba\xff\
-\x1c\xef\xbc\xf3\x1f\xf9\x37\xff\xe6\xcf\xc5\x89\x13\xfd\x98\xe6\
-\x8b\xbb\x19\xff\x0b\xbd\xf7\xfb\xf3\x7a\xf4\x4b\x4b\xf9\x40\xfb\
-\xca\x04\x0e\xc9\xde\x5e\x8d\x6c\x26\x0e\xba\x44\x15\x3e\xc8\x40\
-\x50\x0c\x96\xd7\x7b\x46\xcd\x2d\xbf\x06\x21\xf5\xa3\x2a\x9c\x43\
-\xf4\xe3\xb8\x6e\x14\xcb\xd2\x59\x5f\xf7\x98\x9e\xaa\xbb\x43\xf2\
-\xa1\x6a\x3b\xf4\x42\xb2\xa9\x97\x02\x21\x47\x48\xd1\xc9\x64\x5a\
-\xfe\x8f\x44\x32\xb5\x23\x91\xff\xb6\x5a\xad\xb2\xb3\x53\x60\x7f\
-\xbf\x88\x6d\x95\xa9\x79\x2e\xd9\x6c\x82\x54\x32\x86\xaa\x06\x37\
-\x39\xab\xab\xbb\x0d\x59\xa4\x79\x62\x57\x7c\x5d\x0a\x5c\x6f\xd3\
-\xd6\xef\x24\x17\x78\x6d\x4b\x25\x93\x8d\x2d\x9f\xa9\xe9\x22\xb7\
-\x6e\xed\x30\x3e\x7e\xc0\xde\xbe\x43\x7f\xff\xd0\x4f\x86\x8c\x9f\
-\x04\x21\x5f\xe9\xa7\x08\xe5\x57\x8e\xe3\xfc\xa9\x80\x3f\xb3\xad\
-\xd0\x4b\xbc\x5c\x04\x51\x77\xb3\xa4\xe8\xeb\xab\x7b\x89\x7d\x54\
-\x85\x50\x98\x94\x81\x06\xf6\x95\xe6\x54\x33\x42\xea\x13\x57\x47\
-\xa9\x6d\xb5\x1a\xc7\xb6\xa2\xac\xaf\xfb\x4c\xcf\x3c\xed\x9b\x1a\
-\x7e\xa1\xd9\xd4\x4b\x85\x90\xa7\x38\xe5\x37\x89\x44\x62\x55\xca\
-\xea\x9f\x35\x38\x65\xaf\x44\xb1\x68\x53\xab\x79\x64\xb3\x29\x92\
-\xc9\x38\xaa\x2a\x82\x29\xd9\x70\x2a\xf6\x69\xc4\x34\x3b\x0a\xa1\
-\xc9\x0d\x49\x24\xf4\x4d\x65\x28\x95\xe2\x6c\x6c\x86\x3d\xf0\x5b\
-\x3b\xdc\x19\x3f\x64\x6f\xaf\xca\xa9\x9f\x90\x33\x5e\x0a\x84\x1c\
-\x43\x8a\x19\x45\x48\xf9\x6b\xa7\x5c\xfc\x9b\x7a\x3f\x65\x73\x23\
-\xe8\xd1\xc3\x21\xe9\x74\x02\x21\xd2\xf4\xf6\x36\xf9\xbe\xc4\xd1\
-\xf2\x4b\x51\x6b\x9a\x98\xa5\x29\x18\x81\x0b\xdd\x0f\xbd\xb6\x76\
-\xc3\x6b\x6b\x73\xe7\xcb\xe3\x5e\xdb\xb1\x37\x7f\x7a\x64\xbc\x14\
-\x08\x39\xce\x29\xad\xbf\x8a\x27\x92\x3b\xbe\xf4\x8f\x38\xe5\x20\
-\xe4\x94\x5a\x8d\x6c\x36\x49\xb2\xce\x29\x0a\xc7\x06\x33\x8f\xc6\
-\xb0\x94\x70\x24\x20\x82\xa4\x3e\x9f\x91\xc6\x2a\xc5\xd8\xdc\x92\
-\x4c\x4f\x95\xf8\xdd\xad\x1d\xc6\xef\x1c\xb0\xb7\x5f\x79\x29\x38\
-\xe3\xa5\x42\xc8\x37\xf7\x53\x8e\xfb\xbe\x8e\xbc\xc4\x02\x4d\x0d\
-\xfe\x83\xaf\xfa\x70\x68\x30\x60\x29\x42\xaf\xad\x89\xf4\x43\x17\
-\xba\x15\x63\x63\x43\x32\x3d\x53\xe0\xce\x9d\x1c\xb3\x33\xb9\xd0\
-\x51\x78\xf6\xa5\xe0\x8c\x97\x12\x21\xcf\xac\x53\x68\xaa\x53\xf6\
-\x4a\x94\x8a\x65\xdc\x5a\xad\xc1\x29\x8a\x22\x10\x8d\xc2\x91\x46\
-\x9d\x21\x31\x1b\x5e\xdb\x52\x29\xc6\xe6\xa6\xc2\xd4\x54\x99\x5b\
-\xbf\xdb\x61\x3c\xe4\x8c\xfe\x97\x88\x33\x5e\x4a\x84\x7c\xa5\x4e\
-\x11\xf2\x57\x4e\xa5\xf4\xd7\x02\x86\xed\x90\x53\x16\x97\x0a\xc0\
-\x01\xe9\x74\x32\xe0\x94\x9e\xd0\x21\xa9\x09\x14\x55\x0b\xdd\xee\
-\x0a\x52\x86\x73\x25\x76\x84\xf5\x0d\x8e\xea\x8c\x99\x26\xaf\xed\
-\x4b\x88\x8c\x97\x12\x21\x4f\x73\x4a\x22\x7e\xc4\x29\xbb\x21\xa7\
-\x58\x96\x4d\xcd\xad\x23\x25\x81\xa2\x2a\x08\xe5\xe8\x96\x4c\x52\
-\xa6\x29\x59\x51\xb6\x36\x03\x13\xdb\xad\x5b\xdb\x61\x9d\xf1\x72\
-\x72\xc6\x4b\x8d\x90\xe3\xd9\xd7\xd3\xf3\x29\x47\xbe\x2f\xe4\x3e\
-\xc9\x64\x02\x29\x15\x7a\xfb\xa2\xa4\xd3\x71\x54\xd5\xa7\xe6\x09\
-\xca\xb6\xc6\xc6\x46\x95\x99\x99\x02\x77\xee\x1c\x36\x2a\xf0\x3f\
-\xd4\x6b\xfb\x47\x84\x3c\x4f\xfb\xaa\x1c\xaf\x53\x5c\xd7\x27\x93\
-\x6d\x21\x91\x6c\x45\x90\xc2\xb6\xa3\x6c\x6e\xc2\xd4\x54\x91\xdf\
-\xfd\x6e\x8b\xf1\xf1\x7d\xf6\xf7\x2a\xf4\xf7\x07\x5e\xdb\x97\x19\
-\x19\x2f\x35\x42\x9e\xa5\x7d\x39\x4e\xf1\x6f\x91\x81\x97\x78\x73\
-\x63\x99\xc5\xc5\x3c\x52\xee\x93\x4a\x67\x70\x5d\x93\x6c\x36\x49\
-\xb1\x08\xf3\x73\x45\x26\x26\x0e\x8f\xf9\xa6\x5e\x05\x64\xbc\x12\
-\x01\xa9\x3f\x9a\xbd\xc4\xa0\xbd\x3f\x31\x11\x61\xb1\xe1\x25\x5e\
-\x61\x63\x33\xcf\xe9\xd3\x27\x28\x16\x24\xff\xfa\xaf\x8f\x59\x58\
-\xd8\x65\x7f\xbf\xcc\xe0\xe0\xc5\x1f\xbd\x07\xfe\x3f\x65\x40\x9a\
-\xbd\xc4\x8e\xe3\xfc\xa9\x84\x3f\x2b\x35\xe6\x53\x0a\x1c\x1c\xd6\
-\xd8\xda\xd2\x28\xdb\x30\x33\xbd\x4b\xb9\xac\x30\x38\x70\xf1\xa5\
-\xac\x33\xfe\x7f\x11\x90\x23\xa4\x04\x73\xf4\xa6\x19\x7b\x07\xe4\
-\x3f\x4e\x4c\xe8\xc1\x24\xd7\x6c\x8e\x47\x8f\xd6\x91\x3e\x94\x4a\
-\x65\xce\x0d\x5d\xe4\x9d\xbf\xfc\x5f\x19\x1b\x7b\xfb\x95\x41\xc6\
-\x2b\x19\x90\x23\x4e\xe1\x37\x65\xc7\x7a\x17\xc4\x2f\x2c\xcb\xc3\
-\xb6\x57\x38\x3c\xb0\x88\xc5\x4c\x86\xce\x9e\x65\x6c\xec\x26\x63\
-\x63\x6f\xbf\x52\xc8\x78\x25\x03\xd2\x8c\x94\xc0\x21\x99\xfc\x85\
-\xa2\x98\x1f\xa4\xd3\x2d\xac\xac\xac\xd0\xd5\xd5\xc5\xbf\xff\xf7\
-\xff\x8e\xd7\x5f\x7f\xe3\x95\x43\xc6\x2b\x1d\x90\x3a\x52\x2a\x95\
-\xea\x87\xab\xab\x6b\x6c\x6f\xef\xb0\xb3\xb3\x47\x5b\x5b\x27\x97\
-\x2f\x5f\x7b\x25\x91\x51\x7f\xfc\x7f\x05\x29\x93\x32\x6b\x7a\x13\
-\x4e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x13\x47\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x16\x11\x23\xcb\xe1\x98\x9d\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x12\xab\x49\x44\x41\x54\x78\xda\xed\x9d\xd9\
-\x53\x1b\xd9\xf5\xc7\x3f\xbd\x48\xdd\xea\xd6\x82\x10\x02\x83\x24\
-\x03\xc6\xd8\xf1\xd8\x78\xcc\x78\x99\xca\x6f\xe6\x67\x57\x9e\x92\
-\x54\xe5\x25\x35\x55\xf9\x2f\xf3\x96\xca\xcb\x4c\x6a\x2a\x95\x64\
-\xbc\x8c\x33\xf1\x8a\x6d\xf8\x19\x83\x31\xab\x10\xda\x5b\x4b\x6f\
-\xbf\x07\xa9\x15\x19\xb3\x0b\x30\xd8\xfa\x56\xa9\x44\xd9\xd0\x7d\
-\xfb\x7c\xfb\x9c\x7b\xce\xb9\xe7\x9e\x2b\x00\x2e\xa7\x08\x82\x20\
-\x00\xe0\xba\xee\x91\x5c\xe7\xb0\xae\x7f\x50\xc8\xde\x20\x04\x41\
-\x40\x92\x24\x24\x49\x42\x14\xc5\x2e\x21\x47\x4c\x88\x20\x08\xb8\
-\xae\x8b\xeb\xba\x38\x8e\x83\x65\x59\x38\x8e\xf3\x5f\x42\x64\x59\
-\x46\x55\x55\x74\x5d\xc7\xef\xf7\xb7\x06\xe4\x0d\xf0\xa8\xb1\x9d\
-\x60\xf6\xfb\xf7\xc7\x35\xde\x83\x3e\x9f\x37\x3e\x8f\x10\xcb\xb2\
-\xa8\xd5\x6a\x94\x4a\x25\xea\xf5\x7a\x83\x10\x59\x96\x09\x06\x83\
-\x0c\x0c\x0c\x70\xee\xdc\x39\x7a\x7a\x7a\x4e\xcc\xa0\xb7\xfa\xee\
-\xe4\xfa\xde\x3d\x3e\x96\x49\x6a\xb7\x48\x96\x65\x51\xad\x56\x59\
-\x5b\x5b\xe3\xf5\xeb\xd7\x6c\x6c\x6c\x34\x08\x51\x14\x85\xbe\xbe\
-\x3e\x26\x26\x26\xf8\xdd\xef\x7e\xc7\xd8\xd8\xd8\x47\x19\xf0\x56\
-\x84\x88\xa2\xd8\xfa\xf6\x7e\x3e\x08\x1c\xc7\xc1\x71\x1c\x6c\xdb\
-\x7e\x8f\x98\xc3\x1a\xeb\x41\x08\xa9\xd5\x6a\xe4\x72\x39\x9e\x3c\
-\x79\x42\xa5\x52\xa1\x54\x2a\x35\x08\x91\x24\x09\x5d\xd7\x39\x73\
-\xe6\x0c\x97\x2f\x5f\x66\x62\x62\xe2\xd0\xde\xa2\x4e\x6c\xb2\x47\
-\x44\xbb\x40\x3d\xa1\xda\xb6\x8d\xe3\x38\x1f\x08\xd7\x7b\x58\x6f\
-\x4e\x94\x65\xb9\x45\xa4\xf7\xf9\x98\x5a\xd2\xfe\xb2\x55\x2a\x15\
-\x32\x99\x0c\x86\x61\x10\x0e\x87\x1b\xe3\xdd\x3c\xa9\xfb\x7c\x3e\
-\xfc\x7e\xff\x89\xb1\xb9\x00\xa6\x69\x62\x18\x06\x86\x61\x50\xa9\
-\x54\xa8\x54\x2a\x18\x86\x41\xbd\x5e\x6f\x11\xe4\x38\x0e\xde\xcb\
-\x25\xcb\xf2\x7b\x73\xa2\xa6\x69\x04\x02\x01\x54\x55\x45\x51\x14\
-\x24\x49\x3a\x11\xf3\x8a\x6d\xdb\xa8\xaa\x8a\xdf\xef\x6f\xbd\x34\
-\xf2\xe6\xb7\x51\x14\xc5\x63\x1f\xb0\xeb\xba\xd8\xb6\x8d\x69\x9a\
-\x54\xab\xd5\x96\xd0\x7d\xe5\x32\xb1\x62\x11\xb9\x54\x42\x28\x97\
-\xc1\x30\x1a\x9f\x4a\xa5\xf1\x5d\xaf\x83\xe3\x80\x6d\x37\xbe\x1b\
-\x8c\x80\x2c\x37\x3e\xaa\x0a\xba\x0e\x9a\x86\xa0\x69\x08\xaa\x8a\
-\xa8\xaa\x98\xc1\x20\xd9\x48\x04\x3b\x14\x22\x10\x08\xa0\x28\x0a\
-\x8a\xa2\x20\xcb\xf2\xb1\x3a\x05\xed\xf2\xf6\xee\x2b\x6f\x35\xe1\
-\x7d\x8c\x37\xc5\xb3\xa7\xcb\xcb\xcb\x2c\x2d\x2d\xb1\xb4\xb4\x44\
-\xcf\xfc\x3c\xff\x33\x3d\x4d\x32\x9d\x26\x68\xdb\xa8\x96\xd5\x32\
-\x57\x1f\x98\xac\x36\x9b\x2e\x34\xdf\x36\x49\x92\x90\x25\x09\x49\
-\x96\x5b\x2e\xbd\x24\x8a\xa4\x07\x07\xf9\xcf\xd5\xab\x94\xc7\xc7\
-\x49\x24\x12\x0c\x0c\x0c\x10\x8f\xc7\x09\x06\x83\xc7\xe6\xa9\xb5\
-\xbb\xbc\x9e\x76\xbf\x47\xc8\x71\x13\xe0\x69\x43\xb1\x58\xc4\xcd\
-\x66\xd1\xd6\xd6\x60\x75\x15\x96\x97\x11\x96\x97\x11\x96\x96\x10\
-\xe6\xe6\x10\x66\x66\x10\x33\x19\xfc\xc0\xa1\x19\xd2\x81\x01\xc8\
-\x66\x61\x71\x11\x12\x09\x38\x73\x06\xe2\x71\x6a\x7d\x7d\x94\xe3\
-\x71\xdc\x48\x04\x5d\xd7\x51\x14\xa5\x23\x47\x62\x3f\xc4\x78\xca\
-\xf0\x51\x08\x31\x4d\x93\x7c\x3e\xcf\xd2\xd2\x12\xd3\xd3\xd3\xf8\
-\x5f\xbc\xe0\xfa\x93\x27\xc4\x97\x96\xd0\x2a\x15\x86\xaa\x55\x2e\
-\x57\x2a\xf8\x0c\x83\x58\xb1\x78\xe8\xf7\x8f\xe6\xf3\x4c\x3e\x7e\
-\x8c\xfd\xfa\x75\xc3\x64\x35\xe7\x96\xfc\xc8\x08\xaf\x7e\xfd\x6b\
-\xec\x89\x09\x46\x47\x47\xe9\xeb\xeb\xc3\xef\xf7\x1f\x89\x09\xdf\
-\x8e\x64\xf9\x38\xe7\x88\x4a\xa5\x42\x3e\x9f\xa7\xbe\xb6\x86\xb4\
-\xb0\x00\xb3\xb3\x30\x3d\x8d\xf8\xf2\x25\xf2\xf3\xe7\x04\xd2\x69\
-\x02\x40\xf4\x88\xc7\xa3\x56\xab\x0c\x56\xab\x0d\x8d\x6c\xc7\xfc\
-\x3c\xd4\x6a\x90\xc9\xc0\xdb\xb7\xd4\x53\x29\xca\x89\x04\x52\x2c\
-\xd6\x0a\x98\x8f\x25\x75\x72\xd4\x11\xb0\x6d\xdb\x54\xab\x55\x96\
-\x97\x97\x79\xfa\xf4\x29\xe2\x93\x27\x7c\xf9\xe8\x11\xa3\xf3\xf3\
-\xf4\x95\x4a\x48\x85\x02\xd1\x42\xe1\xa3\x7b\x3d\xa1\x4c\x86\x8b\
-\xf7\xee\xe1\xbe\x78\x81\xae\xeb\x18\xe3\xe3\xbc\xb9\x73\x07\x61\
-\x72\x92\xb1\xb1\xb1\x93\x41\x48\xa7\xa6\xc9\x30\x0c\xac\xf5\x75\
-\xc4\xb7\x6f\x61\x66\x06\x9e\x3d\x43\x7c\xf6\x0c\xf5\xf9\x73\x7a\
-\xd6\xd6\xe8\xe1\xe4\x40\xa9\x54\x50\xde\xbd\x83\x77\xef\x00\xa8\
-\xad\xac\x20\x00\x65\xc3\xe0\x4d\xa1\x40\x76\x64\x84\x68\x34\x8a\
-\xae\xeb\xad\xf8\xe6\xd8\x09\xe9\x24\xa7\x64\x18\x06\x0b\x0b\x0b\
-\x38\xbf\xfc\x42\xe2\x87\x1f\x18\x9c\x9a\x42\xcb\xe7\x11\x0b\x05\
-\xa2\xf9\x3c\x27\x1d\xfa\xfa\x3a\x63\xff\xf8\x07\x6f\x16\x16\xf8\
-\xf9\xe5\x4b\xb8\x76\x8d\x9b\x37\x6f\x32\x3a\x3a\x7a\x64\x26\xec\
-\x48\x34\xa4\x5a\xad\x92\xcf\xe7\xc9\xcf\xcf\x53\x7d\xfa\x14\xf5\
-\xde\x3d\xe4\x7f\xfe\x93\xd0\x9b\x37\x84\x38\x3d\xf0\x1b\x06\xfe\
-\xb7\x6f\xc9\xe7\xf3\xf8\x73\x39\xea\xb9\x1c\x94\xcb\x98\xeb\xeb\
-\x14\xc7\xc6\xf0\xf7\xf7\x13\x08\x04\x90\x65\xf9\xf8\x08\x39\xc8\
-\x1c\x92\xcb\xe5\x78\xfc\xf8\x31\xd6\xc3\x87\x8c\xff\xf4\x13\x67\
-\x5e\xbe\x6c\xb8\xb5\xa7\x14\x71\xc3\xe0\x37\xf3\xf3\x38\xd9\x2c\
-\xd1\x17\x2f\x70\x26\x26\x58\xfd\xfd\xef\x11\xbf\xfa\x8a\x44\x22\
-\x41\x28\x14\x3a\x79\x1a\xe2\xba\x2e\x86\x61\x90\xc9\x64\x58\x7d\
-\xf5\x8a\xca\xdd\xbb\x68\x0f\x1e\x10\x79\xf4\x88\xc8\xca\x0a\xa7\
-\x19\xba\x69\xa2\xe7\xf3\x90\xcf\xc3\xc2\x02\xc5\x62\x11\x51\xd7\
-\x31\x6d\x9b\x9c\x69\x62\xa7\x52\xe8\xba\x8e\xcf\xe7\x3b\x19\x73\
-\x88\x17\xd8\xac\xaf\xaf\x73\xef\xde\x3d\x6a\xf7\xef\x73\xe9\xc1\
-\x03\x52\xaf\x5f\xd3\x93\xcb\xf1\xa9\x21\xb0\xba\x4a\xe2\xfb\xef\
-\xc9\xa5\xd3\xac\x54\xab\x64\x6c\x9b\x91\x91\x91\x1d\x97\x2d\xf6\
-\x6a\x69\x0e\x45\x43\x0c\xc3\x20\x9d\x4e\xf3\xee\xd9\x33\x8c\xbb\
-\x77\xd1\x1f\x3c\xe0\xcc\xf4\x34\x67\x32\x19\x3e\x45\xc8\xe5\x32\
-\xa1\xd9\x59\x6c\xc7\x21\x13\x0a\x51\x07\x72\xcd\x04\xad\xa6\x69\
-\x1d\x69\x8a\x7c\x18\xa6\x2a\x93\xc9\x70\xf7\xee\x5d\x2a\x77\xef\
-\xf2\xab\x7b\xf7\x48\xcd\xce\x1e\x49\x84\x7d\xe2\x4c\x59\x3a\xcd\
-\xc8\xdf\xff\x4e\x2e\x9f\x67\x5d\x14\x29\x08\x02\xc3\xc3\xc3\x44\
-\x22\x91\x03\x7b\xab\x1d\x11\x52\xa9\x54\xc8\x66\xb3\x2c\xbf\x78\
-\x41\xed\xfe\x7d\xb4\x9f\x7f\x26\x35\x3b\x4b\xea\x13\xd5\x8c\xcd\
-\xf0\x95\xcb\xf4\x94\xcb\x08\x40\x21\x1a\xc5\x12\x04\xca\xcd\xd4\
-\xbf\x97\x3d\x3e\x56\x0d\xc9\x66\xb3\xfc\xfb\xdf\xff\xa6\x72\xf7\
-\x2e\x97\x1e\x3c\x60\x68\x66\xe6\xb3\xd0\x8c\xcd\xd0\xd2\x69\x86\
-\x7f\xfc\x91\x72\xa9\x44\x39\x14\xa2\xae\x69\xc4\xe3\xf1\xe3\x23\
-\xc4\x34\x4d\xca\xe5\x32\xf9\xf9\x79\xcc\x9f\x7f\x26\xd0\x9c\xc0\
-\x87\x3e\x13\xcd\xd8\x4a\x53\x22\xe5\x32\xb2\xcf\x47\x7d\x68\x08\
-\x47\x96\xb1\xbe\xfa\x0a\xb3\x99\x98\xdc\x4f\x44\x7f\x20\x42\xca\
-\xe5\x32\xf3\xf3\xf3\x54\x1e\x3f\xe6\xd2\xfd\xfb\x44\x9e\x3e\x3d\
-\x15\x91\xf7\x91\xa7\x5e\x96\x97\x89\xff\xf5\xaf\x58\xf9\x3c\x4e\
-\x4f\x0f\x95\x68\x94\x40\x20\x70\x74\x84\x78\xcb\xa5\x66\x3a\x8d\
-\xf3\xcb\x2f\x04\xee\xdf\x67\x70\x7a\x9a\x9e\x53\x1c\xf4\x1d\xaa\
-\xf7\x55\x2a\x21\xcf\xcc\x90\x0f\x06\x59\x9c\x9a\x82\x78\x9c\x54\
-\x2a\xb5\xe5\x24\x7f\x28\x84\xd8\xb6\x4d\xb9\x5c\xc6\x9d\x9b\x23\
-\xf9\xc3\x0f\xf8\x7e\xfa\x09\x3d\x9d\xee\x32\xb1\xcd\xdc\x4a\x30\
-\x48\x30\x18\x3c\x3a\x42\x0c\xc3\xe0\xed\xdb\xb7\xf0\xf2\x25\xc3\
-\x2f\x5e\x10\x99\x9b\xeb\x4a\x7f\x0b\x88\x85\x02\xbe\x67\xcf\xb0\
-\x7a\x7a\x28\x9f\x3f\x4f\x31\x16\xdb\x73\xce\x6b\x5f\x84\x78\x39\
-\x2a\x1e\x3d\x22\x92\xcb\x11\xe9\xca\x7e\x4b\xf4\x95\x4a\x7c\xfb\
-\xfa\x35\xc5\x48\x84\xda\x95\x2b\x2c\xc6\x62\xad\x9c\xd7\x6e\x11\
-\xfb\x9e\x08\xf1\x8a\x10\xaa\x2b\x2b\x88\x4f\x9e\x20\x4d\x4d\x21\
-\x9e\x80\x05\xa5\x13\xeb\x06\xd7\xeb\x9c\xdd\xd8\xa0\x38\x3b\xcb\
-\xe2\x83\x07\xa0\x69\xb8\x9a\x86\xdb\x2c\xa2\xe8\x58\x43\x6a\xb5\
-\x1a\xeb\xeb\xeb\xb8\x6f\xde\x70\xe3\xd9\x33\xb4\xcf\x34\xde\xd8\
-\x2f\xbc\x9c\x97\x6b\x9a\xa8\xe7\xce\xe1\x26\x93\xad\x1a\xb8\x8e\
-\x08\x31\x0c\x83\xf9\xf9\x79\x98\x99\xe1\xd2\xc2\x02\x7d\x9f\x69\
-\xbc\xb1\x6f\xaf\xab\x99\xf3\x32\xcf\x9c\xa1\xbc\xb4\x04\x85\xc2\
-\xae\x59\x61\x71\x2f\x39\x96\x42\xa1\xc0\xd4\xd4\x14\x53\x53\x53\
-\x14\xba\xa6\xea\x40\x29\xa6\xc5\xc5\x45\x16\x17\x17\xa9\x54\x2a\
-\x3b\x3b\x04\xbb\xc5\x1d\xb5\x5a\x0d\x2b\x93\x41\x7d\xf9\x12\x6d\
-\x66\x06\xa9\x54\xea\x4a\x78\xbf\x81\xb4\x61\x30\x37\x37\xc7\xdc\
-\xdc\x1c\xe5\x72\x79\x67\x42\xb6\xab\x56\x74\x5d\x17\xd3\x34\x29\
-\x16\x8b\xa8\xcb\xcb\xfc\x7a\x7a\x9a\xdb\xb3\xb3\xc4\x77\xb9\x60\
-\x17\x1f\xa2\x58\x2c\x32\x3d\x33\xc3\xf4\xf4\x34\xc5\x5d\xe6\x5e\
-\x79\x2f\x93\x39\x4b\x4b\x24\x56\x56\x08\x65\xb3\x5d\xe9\x1e\x00\
-\xbe\x72\x99\xc8\xec\x2c\x76\x32\x89\x9b\xcd\x36\x36\xe6\x6c\x13\
-\x93\x6c\x4b\x88\x57\x2e\xff\xae\x59\x16\x13\xad\x54\x4e\x55\x81\
-\xc2\x49\x42\xbf\x61\xf0\x9b\xb7\x6f\xa9\xbf\x7e\x4d\x60\x75\x95\
-\x62\xb1\xb8\xed\x3a\xfc\x8e\x1a\x22\x15\x8b\x28\x2f\x5e\xc0\x8b\
-\x17\x48\xdd\xc9\xfc\xc0\xd0\x4d\x93\xd1\x7c\x9e\xd2\xfa\x3a\x2b\
-\x6b\x6b\xd4\xb3\xd9\x56\xdd\xf0\xbe\x08\x09\x65\x32\x5c\xba\x7f\
-\x1f\xee\xdf\x27\xb4\xb1\xd1\x95\x6c\x87\xa8\xd5\x6a\xac\xa5\xd3\
-\xb0\xb6\x46\xb4\x99\x09\xde\x93\x97\xe5\x6d\x46\x94\x8a\x45\x62\
-\x0b\x0b\xf4\x2d\x2e\xa2\xec\xe2\xae\x75\xb1\x3b\xaa\xd5\x2a\xab\
-\xab\xab\xac\xae\xae\x52\xad\x56\xf7\x6e\xb2\xbc\x5a\x5c\xaa\x55\
-\x54\x6f\xab\x6e\x17\x87\x42\xc8\xca\xf2\x32\xac\xac\xec\x8f\x10\
-\xcb\xb2\x1a\xfe\xb2\x61\x20\x5b\x56\x97\x90\x43\x82\xbf\x5c\x26\
-\x3a\x3f\x0f\xf3\xf3\xf8\x0d\x63\xcb\x34\xca\xb6\x84\x94\x4a\x25\
-\x28\x16\xd1\x2d\xab\x2b\xc9\x43\x42\xac\x54\xe2\x9b\x99\x19\x48\
-\x24\x5a\xb9\xc0\xf6\xcd\xa8\xbb\x13\x52\x2a\x11\xeb\x80\x10\x27\
-\x1c\xc6\x4c\x24\x70\x23\x11\x24\x51\x44\xf0\xbc\x0a\xf7\x84\x75\
-\xf3\xd8\x9c\x3e\xda\x3c\xbe\xb6\x9d\xc4\x8e\xe3\x20\xe4\xf3\xc8\
-\xef\xde\xed\x3b\xe3\xad\xd5\xeb\x68\x1b\x1b\xb8\x99\x0c\x6e\xb5\
-\x4a\xc5\x71\xde\xdb\x69\xbc\x27\x42\xac\x0e\x08\x31\x13\x09\x0a\
-\x7f\xfc\x23\xf6\xc4\x04\xaa\xaa\x22\xcb\x72\xa3\xb1\xca\x09\x24\
-\xc4\xa3\x64\xab\xf1\x09\x82\x00\x82\x80\x6d\xdb\xd4\x6b\x35\xc4\
-\xa7\x4f\x09\xfd\xf9\xcf\xf8\xa7\xa6\x0e\x74\x3b\xd7\x71\x30\x4d\
-\xb3\x25\xdb\xf6\x6d\x73\x3b\x13\x52\x2e\x77\x44\x88\x1b\x0e\x63\
-\x5d\xb9\x82\xfd\xed\xb7\xb8\xba\x0e\x3e\xdf\xc9\x23\x63\xb3\x96\
-\x6c\x35\x3e\x4f\x43\x2c\x0b\xbb\x5a\x05\x41\xc0\xfd\xe1\x87\x83\
-\x5b\x8e\x66\x5a\xca\x34\xcd\xff\x12\xbe\x9b\x97\x55\x2e\x97\xa1\
-\x5c\xc6\xb6\xed\x03\xdf\x58\x94\x24\x54\x55\xc5\xd5\x34\x54\x55\
-\x3d\x94\x62\xe4\x8f\x09\xcb\xb2\x1a\x5b\x99\x55\xb5\xa3\x7d\x87\
-\x4e\x73\xc1\xaf\x5e\xaf\xe3\xba\xee\xee\x73\x48\xbb\xdb\xdb\x09\
-\x21\x82\x20\x20\x4a\x12\xb4\x6d\xe6\x3f\xad\xf0\x92\xb0\x8e\xe3\
-\x20\xb4\xed\x2b\x3f\x10\x21\x8e\x43\xbd\x5e\xc7\x34\xcd\xf7\xf6\
-\xa8\x6f\x4b\x88\xd3\xb4\x71\x34\x3b\x25\x74\xf2\x10\x4e\x73\x53\
-\xbf\xeb\xba\xa7\x5a\x3b\x3c\xa1\x39\x8e\xd3\xf1\xf3\x38\xcd\xc0\
-\xdb\x34\xcd\x0f\xb6\x5d\xcb\xdb\x09\xd2\xb6\x6d\x68\x36\x6a\xe9\
-\xf8\xcd\x3a\xe5\x64\x7c\xf0\x3c\x8e\xd3\xd1\x33\xb9\xae\x8b\xdd\
-\x6c\x18\xb0\x59\xbe\xf2\x6e\x2a\xda\xc5\x91\x31\xbb\xf7\x48\x7d\
-\xf3\xcc\xdf\xc5\x21\x9b\xbf\x2d\x02\xc2\x1d\x09\x69\x05\x2b\x47\
-\xdc\x56\xe2\xf3\x65\x64\xfb\xfe\x5f\x5b\x12\x22\x8a\x62\xc3\x45\
-\xf5\xf9\x10\x3b\x20\x44\x68\x5e\xeb\x53\x22\x56\x14\xc5\x46\xc7\
-\xa1\x0e\x9e\x47\x6c\xb6\x54\xb4\xb7\x70\x9d\xb7\x25\x44\x55\x55\
-\x50\xd5\x86\xdb\x7a\x50\x42\xda\x88\xfd\x14\x08\x69\xbd\xa8\x1d\
-\x36\x0d\xf0\xe4\xe2\x34\xe3\xb2\xf6\xf9\x7a\x4b\x42\x64\x59\x46\
-\xd3\x34\xd0\x34\xe4\x0e\x08\xf1\xfa\x9b\xd8\xa5\x12\xa6\x69\xb6\
-\xe2\x90\xd3\xe6\x30\xb4\xbb\xbc\x96\x65\x21\x55\x2a\x68\xb6\x8d\
-\xd8\x01\xb1\x7e\x45\xc1\xf5\xfb\x31\x4d\xf3\x3d\x6f\x6b\x5b\x42\
-\x82\xc1\x20\x04\x83\x1d\x05\x73\xde\x0a\x59\xe5\xdd\x3b\x34\x4d\
-\x3b\xf5\x84\xd8\xb6\x4d\xbd\x5e\x27\xb0\xb6\xc6\x60\xb5\xca\x41\
-\xf3\x0e\x92\x24\xa1\x28\x0a\x28\x0a\x96\x65\xed\x4d\x43\x0e\x83\
-\x10\x21\x9f\x47\x7a\xf2\x04\xb1\x56\x6b\x74\x77\x6b\xd7\x36\x6f\
-\x10\x27\xcd\x94\xed\x34\x2e\xc7\x41\xa8\xd7\x11\x5e\xbd\x6a\xec\
-\x59\xef\x80\x60\x9f\x2c\x63\x6f\xf1\x82\xca\xdb\x31\xa8\xeb\x3a\
-\xe8\x3a\x52\x07\x84\x04\x56\x57\x19\xfa\xfe\x7b\xec\x7b\xf7\x1a\
-\x5e\x85\x97\xa4\x3b\x85\x6e\xaa\x37\x6e\xc7\x71\x90\x8a\x45\xd4\
-\x0e\x9a\x21\x08\x4d\xc2\xdb\x9b\x29\xef\x6a\xb2\x3c\x42\x3a\xd1\
-\x10\xb9\x54\x22\xd4\xad\x74\x6c\xa1\xaa\xaa\x64\x23\x11\x38\x73\
-\x86\x68\xb3\xc0\x61\x73\x6b\xc5\x6d\x09\x09\x85\x42\x10\x0a\x9d\
-\xea\x84\xe0\x49\x43\x36\x12\xe1\x3f\x5f\x7e\x09\x57\xaf\x32\x19\
-\x89\xb4\x5a\x53\xb5\x13\x22\x6e\x67\xb2\x54\x55\xc5\x09\x87\x59\
-\x8c\xc7\x79\xdb\xdb\x8b\x71\x02\x5a\xc7\x9e\x76\x58\xc1\x20\xa5\
-\xb1\x31\x4a\xe7\xcf\x63\x35\xf7\x8a\x6c\x36\x59\x5b\x56\xbf\x7b\
-\xbd\xe0\x73\x3d\x3d\xfc\x74\xe1\x02\xff\x1a\x1f\x67\x7d\x0f\x9b\
-\x4d\xba\xd8\x19\xaa\xaa\x32\x30\x30\xc0\xc0\xc0\x40\x23\xce\xdb\
-\xca\x25\xde\x29\x75\xe2\x84\xc3\x14\xcf\x9d\xa3\x30\x3a\x8a\xa5\
-\xeb\x5d\x89\x76\x08\x45\x51\xe8\xef\xef\xa7\xbf\xbf\x1f\x45\x51\
-\xb6\x6c\xcd\x2b\xee\x14\x13\x68\x9a\xc6\xf0\xf0\x30\xc3\xc3\xc3\
-\x68\x5d\x42\x3a\x27\xc4\xef\x27\x16\x8b\x11\x8b\xc5\x1a\x71\xc8\
-\x56\xf3\xf7\x8e\x6e\x6b\x20\x40\x22\x91\x80\x44\x62\xcb\xb2\xc7\
-\x2e\xf6\x86\x8a\xa2\x90\x0d\x87\xb1\x87\x86\xd0\xfb\xfa\x08\x34\
-\x9d\xa5\xad\x56\x63\xe5\xbd\xd8\x3c\x06\x06\x50\xb7\x61\xb4\x8b\
-\x3d\x78\x57\xe1\x30\x3f\x5f\xbe\x8c\x3b\x31\xc1\xf5\x78\x9c\x48\
-\xb3\xd7\xfb\x9e\xe7\x90\x76\xf7\x37\x1c\x0e\xa3\x0c\x0c\xb0\x31\
-\x3c\xcc\xda\xd0\x10\xb5\xae\xa6\xec\x1b\x76\x38\x4c\xf5\x57\xbf\
-\xa2\x76\xe9\x12\xf4\xf4\x7c\xb0\x8e\xbe\xa5\x86\x6c\x5e\x2c\x71\
-\x5d\xb7\x95\xdd\xcc\xf6\xf7\x33\x75\xf3\x26\x42\xa5\xc2\x95\x87\
-\x0f\xe9\xef\x16\x5e\xef\x0b\xa1\x60\x90\x0b\x17\x2e\xc0\x85\x0b\
-\xbb\xf6\x67\xdc\x35\xea\x93\x24\x09\xb1\xb7\x17\x7b\x62\x02\x32\
-\x19\xdc\xe9\x69\x58\x5a\xea\x4a\x79\x2f\x73\x87\xdf\x4f\x26\x14\
-\xa2\x9a\x4a\x11\x1d\x1d\x25\x30\x34\xb4\xad\xbb\xfb\x01\x21\x5b\
-\x1d\x8c\xe2\x21\x18\x0c\x72\xfe\xfc\x79\x78\xf7\xae\x75\x82\x40\
-\x17\xbb\x23\x13\x0a\x71\xf7\xe2\x45\x9c\x2b\x57\xb8\x9e\x4c\x12\
-\x89\x44\x76\xad\x4d\xdb\x53\x4a\xdf\xf3\x9f\x7b\x46\x46\x28\x9d\
-\x3f\x4f\x26\x95\xa2\xae\x69\x5d\x89\xef\x02\x27\x1c\xa6\xfe\xc5\
-\x17\x58\x57\xae\xe0\xef\xef\x47\xdd\x43\x81\xdd\x9e\x12\x55\x5e\
-\x2a\xa5\x9c\x48\xf0\x7f\xdf\x7e\x8b\xe8\x38\x5c\xb8\x7b\x97\x98\
-\x61\x74\xa5\xbe\x03\x22\x91\x48\xe3\xf8\xa8\x89\x09\xc2\xe1\x70\
-\xab\x4a\xb1\x63\x42\xbc\x54\x8a\xdc\xd7\x87\x30\x39\x89\x9b\xcf\
-\xc3\xd4\x14\x2c\x2c\x74\xa5\xbe\x05\xea\x9a\x46\x31\x16\xc3\xbc\
-\x78\x91\xfe\x8b\x17\xf1\x27\x93\x8d\x15\xd8\x3d\x60\x5f\xa9\xdc\
-\x60\x30\xc8\xf8\xf8\x38\x2c\x2e\x12\x0c\x75\xf7\xe4\x6e\x87\x62\
-\x2c\xc6\xcc\x37\xdf\xe0\xdc\xbe\xcd\xb9\xe1\x61\x82\xcd\x85\xbe\
-\xbd\xd4\x15\xec\x8b\x10\x7f\x33\xf4\x77\x46\x47\xb1\xaf\x5d\xa3\
-\x7e\xc0\x7d\x12\x9f\x2a\x0c\xbf\x9f\xf5\x60\x90\x8d\x73\xe7\x30\
-\x6e\xdd\x42\x9b\x9c\xc4\x17\x8f\xef\xab\x69\xff\xbe\xd6\xe9\xbd\
-\x58\xc5\x4e\xa5\x28\x7d\xf7\x1d\xc5\xef\xbe\xc3\x4a\x26\xbb\x4c\
-\x34\xb1\x1e\x0c\xf2\xaf\xf3\xe7\x79\x34\x39\x49\xef\xe4\x24\xe3\
-\xe3\xe3\xfb\xee\x0b\xbf\xef\xd5\x27\x41\x10\x10\xa2\x51\xb8\x76\
-\x0d\xcb\xb6\x29\xcd\xcd\xe1\xaf\xd7\x51\x57\x56\x90\x3f\xf3\xd5\
-\x41\x37\x12\xc1\x9e\x98\x40\xbe\x7e\x9d\xe8\xe8\x28\xb1\x58\x6c\
-\xdf\xd7\x38\x50\x25\x8b\xb7\xa2\xe8\x3b\x7f\x9e\xf4\x1f\xfe\xc0\
-\xf2\x6f\x7f\x4b\xf5\xcc\x99\xcf\x5e\x43\x7a\x7b\x7b\xb9\xf5\xf5\
-\xd7\xdc\xba\x75\x8b\xde\xde\xde\x03\x5d\xe3\x40\xeb\xb3\xa2\x28\
-\xe2\xf7\xfb\xf1\xf7\xf7\x23\x4e\x4e\x62\x5a\x16\xb9\xd5\x55\x2c\
-\xcb\x42\x4f\xa7\xf1\x7d\x66\x0d\x6a\x9c\x70\x18\x3b\x95\xc2\x77\
-\xf3\x26\xc9\x2b\x57\x10\xcf\x9e\x3d\xf0\xe6\xa4\x8e\x16\xcc\x55\
-\x55\x65\x70\x70\x90\xdc\xd5\xab\xac\x56\x2a\x64\x42\x21\x86\x7f\
-\xfc\x91\x9e\xcf\x8c\x10\x3b\x95\xc2\xf8\xd3\x9f\x70\xef\xdc\x41\
-\x3d\x77\x0e\x9f\xcf\x87\x28\x8a\x7b\x8a\x3b\x0e\x95\x10\xaf\x7e\
-\xcb\x4a\x26\xc9\xd8\x36\x16\x50\xc8\xe7\x11\x45\x91\xc0\xea\xea\
-\x27\xaf\x29\x9e\x66\x98\xdf\x7c\x83\x7b\xfb\x36\xc2\xb5\x6b\x48\
-\x9a\x86\x24\x49\x07\x2e\x06\x3c\x94\x92\x12\x5d\xd7\x19\x1e\x1e\
-\xa6\x20\x08\x64\x65\x99\x52\x2c\x46\xf2\x6f\x7f\xc3\x37\x3b\xfb\
-\x79\x68\xc6\xed\xdb\xf8\x2f\x5c\xc0\xd7\x24\xc3\x73\x7e\x3e\x1a\
-\x21\x3e\x9f\x8f\x9e\x9e\x1e\x44\x51\xa4\x24\xcb\xd8\xa2\x88\x51\
-\x2c\x36\x4e\x09\x58\x5e\x46\xfa\x44\x1a\x66\x56\x14\x85\x4c\x28\
-\x84\x1b\x89\x10\x8d\x46\xf1\xdd\xb8\x01\x77\xee\x20\x5c\xbb\x86\
-\xaf\xc3\x73\x43\x0e\x95\x10\x0f\x81\x40\x80\x64\x32\x89\x21\x8a\
-\x18\xba\x8e\x39\x34\x44\xec\x2f\x7f\x41\xfb\x44\x08\xc9\x84\x42\
-\xdc\xbb\x78\x11\xfb\xea\x55\x6e\x5c\xbf\x4e\xe2\xf2\x65\xd4\xd1\
-\x51\xc4\x36\xcd\xe8\xc8\x6d\x76\xdd\xc3\x25\xc4\xe7\xf3\xe1\xf3\
-\xf9\x90\x65\x19\x53\xd7\x71\x65\x19\x3b\x9f\xa7\x14\x0e\x93\xcf\
-\xe7\x11\xf2\x79\xa2\xf9\x3c\x81\x5a\xed\xd4\xe5\xa6\xca\xf1\x38\
-\xd9\xb1\x31\xea\xd7\xaf\x23\x5d\xbf\x0e\x37\x6e\x20\x24\x93\xad\
-\x09\xfc\xb0\x70\x24\x65\x89\x8a\xa2\x10\x8b\xc5\xb0\x27\x27\x11\
-\x7a\x7b\x59\x9d\x9e\xe6\xc9\xe3\xc7\x48\x4f\x9f\x72\xe3\xf9\x73\
-\x02\xa7\xac\x79\x7f\x39\x1e\x67\xf6\x7f\xff\x17\xe3\xeb\xaf\x99\
-\xf8\xf2\x4b\x7a\x9a\x07\x4c\xfa\x9a\xfb\x5e\xb6\x5b\x47\x3a\x48\
-\xd0\x7d\x24\x84\x48\x92\x84\xa6\x69\xd8\x8a\x82\x19\x8f\xc3\xe0\
-\x20\x44\xa3\x58\x91\x08\x65\x4d\x23\x3d\x37\x47\xa1\x50\x40\x2a\
-\x16\x89\x97\xcb\xe8\xcd\x8e\x06\x27\x05\x5e\x0d\xae\x1b\x89\x10\
-\x0e\x85\xb0\x2e\x5e\xc4\xb9\x73\x07\x6d\x72\x92\xe4\xb9\x73\x44\
-\xa3\xd1\xf7\xcc\xcc\x61\xe2\x48\x0b\x77\xbd\x35\xf9\x81\x81\x01\
-\x6e\xdd\xba\x85\x91\x4c\x62\x7f\xf1\x05\x53\xaf\x5e\xf1\x7c\x6a\
-\x0a\x7d\x7a\x9a\x3b\x73\x73\xe8\x27\xec\x24\x37\xaf\x06\xd7\xba\
-\x7c\x99\x4b\x97\x2e\x11\x1b\x1b\x63\x24\x95\x42\xee\xeb\x6b\x14\
-\xa1\x6f\x7a\xab\x77\x9b\x17\xf6\xa3\x39\x47\x4a\x88\x77\xc8\x7c\
-\xb0\x79\x6c\x43\xb9\xa7\x87\xb4\xa7\x31\xf1\x38\xf6\xc0\x00\x46\
-\x7f\x3f\x99\xe5\x65\xca\xe5\x32\x52\xb1\x48\x6f\xa1\x70\xec\x73\
-\x4c\x2d\x10\xa0\xd0\xdb\x8b\x13\x0e\xa3\xeb\x3a\xe6\xd9\xb3\xb8\
-\x5f\x7d\x05\x13\x13\x70\xe9\x12\xfe\xc1\xc1\x56\xf3\x9c\xa3\x86\
-\xbc\x15\x9b\x47\x05\x45\x51\x88\xc7\xe3\xe8\xba\x4e\x32\x99\xa4\
-\x76\xed\x1a\xe2\xdb\xb7\xcc\xcc\xcd\x31\x3b\x3b\x8b\x36\x33\xc3\
-\xcd\xe7\xcf\x49\x1c\xf3\x99\x24\x85\xde\x5e\x9e\xdf\xbc\x89\x79\
-\xf9\x32\xa3\x23\x23\x84\x52\x29\x26\x06\x07\x91\xfb\xfa\x08\x87\
-\xc3\x7b\x5a\x7a\xdd\xe9\xa5\x3c\x31\x26\x6b\xab\xc8\xde\xdb\x7b\
-\x12\x8f\xc7\x31\x06\x07\x59\x4f\x26\xc9\x8d\x8c\xc0\xd9\xb3\xb8\
-\x83\x83\xd8\xbd\xbd\xd4\x96\x97\xa9\xd7\xeb\xd4\x6a\xb5\x56\x93\
-\x96\x7a\xbd\x8e\x52\xa9\x1c\x68\xce\x31\x9a\xd5\x1f\xf5\x40\x00\
-\x45\x51\x50\x14\x05\xbf\xa2\xa0\xf8\xfd\xf8\xfc\x7e\x48\xa5\xe0\
-\xd6\x2d\xf8\xe2\x0b\x18\x1d\x45\x8d\xc7\xe9\x3d\xa4\xb8\xa2\x23\
-\x0d\x39\xee\x9d\xb2\x8a\xa2\xd0\xd7\xb4\xcb\x43\x43\x43\x70\xe5\
-\x0a\xc1\x3b\x77\x28\x64\x32\x6c\x6c\x6c\xb0\x9e\xc9\x90\x4e\xa7\
-\xc9\xac\xaf\x93\xd9\xd8\x60\x60\x69\xe9\x40\x73\x4e\x26\x14\xe2\
-\x5f\xe3\xe3\x6c\xa4\x52\xc4\xe3\x71\xe2\xf1\x38\x7d\x7d\x7d\xc4\
-\x62\x31\xa2\xd1\x28\xe1\x68\x94\xcb\x6d\x26\x4b\x51\x94\x43\x89\
-\x2b\x3a\x22\x64\xb7\x63\x14\x8e\xd2\x1b\xd3\x34\xad\xe1\x26\x27\
-\x12\xd4\xeb\xf5\x46\xaf\xae\x8d\x0d\x58\x5f\x87\x74\x1a\x32\x99\
-\xc6\x67\x79\x19\xe6\xe6\xa0\x49\x88\xeb\xba\xb8\xcd\x1d\xac\xee\
-\xa6\xe7\x78\xef\x79\x7a\x7b\x61\x7c\x1c\xce\x9e\x85\x78\xbc\xf1\
-\xe9\xeb\x83\x58\x0c\xa2\x51\x14\x55\x25\xfe\x11\x84\xef\xcd\xb1\
-\x1f\x34\x30\x13\x76\xe8\x2c\x70\x58\xde\xc3\x5e\xbd\x32\xbf\xdf\
-\xdf\xb2\xdb\xb1\x58\x8c\x91\x91\x91\xf7\x4d\x96\x61\x40\xbd\xde\
-\x18\x43\xb3\x6b\x91\xed\x35\xc9\x11\x04\x24\x51\x44\x92\x24\xa4\
-\xb6\x35\xec\x98\xdf\xcf\x37\xcd\xf3\x05\x5b\x26\xcb\xef\x47\x51\
-\x94\x8f\xda\xc3\x4b\x14\x45\x64\x59\x6e\x05\x97\xad\x38\xc4\xeb\
-\xfe\x53\xad\x56\x29\x16\x8b\xe4\x72\xb9\x13\xb1\x75\xb9\x5d\x83\
-\x3c\xf2\x4d\x20\xd7\xfc\xd9\xb6\x6d\x2c\xcb\x6a\x11\xe2\xbd\x58\
-\x92\x24\x7d\x50\x3f\x1b\xdc\xf4\x3c\x8e\xe3\x50\xa9\x54\x76\x3d\
-\x3e\xe2\xa8\x34\x03\xa0\x5e\xaf\x53\x28\x14\x28\x35\xf7\xf1\x3b\
-\x5e\x4b\x5e\x6f\x83\x7f\x2e\x97\x63\x71\x71\x11\x5d\xd7\x3b\xea\
-\x93\x75\x98\x68\xd7\xc4\xad\xcc\x51\x7b\xc5\xa5\xf7\x6f\x9b\xff\
-\xaf\xfd\x77\x8e\x42\xb3\x0f\x42\x88\x28\x8a\xd4\x6a\xb5\x96\xcc\
-\xcb\xcd\xee\x7d\x32\xd0\x3a\x96\x62\x61\x61\x81\x87\x0f\x1f\xb2\
-\xb4\xb4\xb4\x63\x69\xe9\x71\xb8\xc8\xed\xf7\x69\x17\xf4\x76\xc4\
-\xb4\x93\xd0\x4e\x86\xd7\x25\xe1\x63\x11\xb2\x79\x5c\xed\x84\x78\
-\x72\x7f\xfd\xfa\x35\xd9\x6c\x16\xcb\xb2\x10\x00\x57\x92\x24\xfc\
-\x7e\x3f\xc1\x60\x90\xde\xde\x5e\x02\x81\xc0\x89\xed\xb6\xd0\x2e\
-\xc8\xbd\x46\xc9\xc7\xf9\x2c\x5b\x11\xb0\xdd\xef\x79\xad\x3a\x4a\
-\xa5\x12\x1b\x1b\x1b\x54\x2a\x95\x06\x21\x74\x71\xec\x84\x6c\x87\
-\xff\x07\x6a\xcf\x23\xa3\xf5\x16\x8a\x4b\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x30\x92\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x21\x17\x25\x60\x16\x4a\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x20\x00\x49\x44\x41\x54\x78\xda\xed\xbd\x49\
-\x70\x5d\x67\x76\xe7\xf9\xfb\xbe\x3b\xbe\xf9\x3d\xcc\x00\x09\x82\
-\x23\x48\x82\x93\x48\xa6\x94\x43\x5b\xae\x5c\x65\x75\x44\x2f\x54\
-\x51\xed\x72\x67\xb9\xa2\xa2\x42\x5e\x54\x44\xe5\xd2\x5e\xda\x0b\
-\x2f\xaa\x96\xae\xa5\xbd\xcb\xdc\x74\x44\xe6\xb2\xd2\x15\xe5\xb0\
-\xec\x74\x74\x87\x98\xca\x90\x92\xa4\x38\x82\x98\x01\x12\x20\xe6\
-\xe9\x4d\x77\x7e\xf7\x7e\xbd\xb8\x17\x13\x45\x65\x4a\x4a\x51\xa2\
-\xda\xf9\x18\x2f\x48\x10\x20\xf1\xee\x3b\xf7\x7f\xfe\xe7\xfc\xcf\
-\xff\x7c\x10\x4a\x29\xbe\xe9\x8f\xb5\xb5\x55\x1e\x3c\xb8\xf7\xd7\
-\x00\xd7\xae\x5d\xff\xf3\x81\x81\xc1\x6f\xec\xb5\xe8\xdf\xe4\x40\
-\xb4\xdb\x6d\xd6\xd7\x57\x58\x98\x9f\xff\x8b\xc9\x27\x4f\xfe\x4c\
-\xd7\x0d\xaa\x95\xea\x9f\x4b\x29\xa9\x94\x2b\x58\xb6\xfd\xfb\x80\
-\x7c\x95\x8f\xf5\xf5\x15\xfe\xe9\xbd\xbf\x57\x77\x7e\xfd\x11\xb3\
-\x33\x0b\x94\x4a\x15\xdc\x76\x4b\xb9\xed\xf6\x8f\x2e\x5d\xbd\xf6\
-\xb7\x7d\xbf\x0f\xc8\x57\xf3\x70\x32\x64\xdc\xbb\x73\x5b\x7d\xf8\
-\xc1\x2d\x3e\xbe\x7b\x97\xcd\xf5\x4d\x4a\xa5\x0a\xb6\xa9\x43\xa2\
-\xfe\xc6\xb2\xac\x5b\x02\x1e\x97\x2b\x15\x2c\xcb\xfe\x7d\x40\x5e\
-\x35\x32\x7e\xf1\xde\xdf\xab\x0f\x3f\xb8\xc5\xe3\xfb\x8f\xd8\xdd\
-\xd8\x44\xaa\x80\xc0\xdd\xe5\xd1\xfd\x7b\xf8\xae\x87\x10\xea\x51\
-\x14\x06\x3f\x1a\xbb\x72\xed\x6f\x7b\xfb\x7e\x1f\x90\x57\x84\x8c\
-\x16\xeb\xeb\x2b\xdc\xbf\x73\x5b\x7d\xf4\xc1\x2d\x9e\x3c\xbc\x47\
-\xe4\xd6\xe9\xad\x6a\x54\x2a\xdd\x74\x3a\x31\xeb\x1b\xdb\x2c\xce\
-\x4f\x70\xaf\x68\x23\xe0\x6f\x4c\xd3\xbc\x0d\xc9\x9d\x72\xb9\xf6\
-\x8d\xe0\x14\xfd\x9b\x86\x8c\x7f\x7e\xef\x7f\xaa\x0f\x3f\xf8\x25\
-\xe3\xf7\x1f\x13\xb8\x75\x46\x86\x4c\x4e\x1c\xef\x63\xe4\xc4\x10\
-\x8e\x1b\x70\xf7\xe3\x29\x56\xd6\xea\x4c\x3c\xba\x87\xe3\xb8\x40\
-\xe7\x76\x18\x38\x7f\x3b\x76\xf5\xc6\x8f\x7a\xed\xc1\xdf\x07\xe4\
-\x4b\x45\xc6\xdd\x8f\xd4\x47\x1f\xdc\x62\xf2\xd1\xc7\x84\x6e\x9d\
-\xbe\x9a\xe4\xf2\x68\x91\x0b\xe7\xba\x19\x3e\xde\x4d\xdb\x09\x50\
-\x61\x37\xa6\x16\x31\xff\x6c\x9b\xe7\x0b\x93\xdc\x2b\x98\xa0\xd4\
-\x7f\x31\xad\xfc\x4f\x51\xe2\x56\xb9\x52\x7d\xad\x91\xa2\x7f\x53\
-\x90\xf1\x8b\xf7\xfe\x4e\xfd\xfa\x83\x5b\x3c\x79\x38\x4e\xe8\xd4\
-\x19\x19\x52\x8c\x9d\x2b\xf0\xd6\xf5\x6e\x4e\x9d\x28\x53\xcc\x47\
-\xf8\x81\xc2\xd6\x06\xe9\x2a\x1b\x18\x72\x89\x67\xcb\x0d\x26\x1e\
-\x3f\xa4\xe5\x04\x28\xe4\xfb\x41\xe0\xff\xb7\x4b\x57\xae\xff\x65\
-\xaf\x3d\xf0\xfb\x80\xfc\x6e\x9c\x71\x08\x19\xce\x2e\x7d\x35\xc5\
-\xa5\xd1\x12\xd7\x2e\x56\x38\x37\x62\xd2\xd7\x1d\x23\x45\x9b\x8e\
-\x05\x79\xc3\x42\xa7\x82\xdb\x6e\x01\x3b\x4c\x2d\x6c\xb3\x34\x3f\
-\xcd\xc7\x85\x1c\xc0\x5f\x58\x96\xfd\x1e\x42\xdd\x7a\x5d\x39\x45\
-\x7f\xfd\x91\xf1\xf3\x94\xc0\x1f\x8c\x13\xba\xbb\x8c\x0c\x26\x5c\
-\x1a\x2d\xf2\xd6\x1b\x03\x9c\x19\x29\x52\x2b\x86\xe8\xca\x05\xd5\
-\xc1\x10\x1a\x45\x3b\xc7\xf0\xa0\x80\x9b\xfd\x14\x8a\x16\x89\x5a\
-\x65\x61\xb9\xce\xe4\xe3\x07\x38\x8e\x87\x10\xc9\xfb\x61\xe0\xbe\
-\xb6\x9c\xa2\xbf\xd6\xc8\xb8\xfb\xa1\xfa\xf5\x11\xce\x48\xb8\x74\
-\x2e\xcf\xb5\x8b\x65\xce\x8e\xe4\xe8\xef\x16\x68\xb8\x48\xe5\xa1\
-\x88\x11\x68\xe8\x5a\x87\x5a\xc9\xc6\x30\x4c\x14\x65\x5a\x6d\x0f\
-\x45\x9d\xd9\x67\x5b\x3c\x5f\x50\xdc\x2b\x5a\x00\x29\xa7\x20\x6e\
-\x95\xcb\xaf\x17\xa7\xe8\xaf\x2b\x32\xfe\xf9\xbd\x9f\xab\x8f\x7e\
-\xf5\xcb\x03\xce\x18\x4c\x83\xf1\xed\xeb\x03\x9c\x1d\xc9\x53\x2b\
-\x85\xe8\xb4\x91\xca\x41\x10\x02\x09\x20\x53\xa4\xc8\x90\x52\xae\
-\xc0\xc8\x90\x0e\xa2\x8f\x52\xd1\x46\x8a\x35\x9e\x2d\x37\x98\x7c\
-\xf4\x90\x76\x3b\x04\xb4\xf7\x83\x20\xf8\xcb\x4b\x57\xdf\xf8\x6f\
-\xaf\x13\xa7\xe8\xaf\x1d\x32\xd6\xf6\xaa\xa9\x5f\x32\xf1\xf8\x2e\
-\xd1\x1e\x32\x46\x8b\x5c\xbb\x58\xe1\xec\x48\x81\xfe\x6e\x0d\x0d\
-\x0f\x0d\x0f\x21\xe2\xec\x5f\x0b\x40\x81\x8a\xd0\x84\x40\x4a\x8d\
-\x5a\x29\x87\x6e\xd8\x08\x04\x4e\xdb\x47\xa8\x3a\xd3\x4f\xb7\x59\
-\x5a\x98\xe2\xe3\x82\x0d\x8a\xff\x6a\x59\xd6\xfb\x28\x75\xab\x5c\
-\x79\x3d\x38\xe5\xb5\x0a\xc8\xfa\x5a\xc6\x19\xbf\xfa\x25\x4f\x1e\
-\x3c\x26\x72\xeb\x9c\x18\x4a\xb8\x74\xae\xc4\x5b\xd7\x87\x38\x3b\
-\x52\xa0\x5a\x8c\x90\xb8\x19\x2a\x00\x4c\x84\x10\x20\x14\xa8\x04\
-\x45\x0c\x4a\x81\x0a\xd0\x84\xa0\x68\x4b\x86\x07\x0d\xb8\x39\x40\
-\xa1\x98\x23\x61\x95\xa7\x7b\x9c\xd2\xf6\x50\xaa\xf3\x7e\xe0\x3b\
-\x3f\xb9\x74\xf5\xe6\x9f\xbe\x0e\x9c\xa2\xbf\x36\xc8\x58\x5f\xe1\
-\xde\x1e\x32\x32\xce\xe8\xaf\x29\x2e\x9d\x2b\x72\x6d\xac\xca\xd9\
-\x91\x22\xfd\x5d\x3a\x12\x0f\x41\x84\x10\x92\x38\x11\x44\x91\x46\
-\xa7\xa3\x48\x92\x18\x29\x05\xb6\xa5\xa1\x6b\x69\x4c\x24\x1d\x0c\
-\x2d\xa4\x5a\xb2\xd0\x4f\xd8\x28\xa0\xd5\xf2\x61\x8f\x53\x9e\x26\
-\xdc\xbb\x6d\x00\xbc\x6b\xd9\x85\x9f\x20\xbe\x7e\x4e\xd1\xfe\xea\
-\xaf\xfe\xea\x6b\x0f\xc8\xf3\xa5\xa7\xfc\xe2\xbd\xbf\x53\xff\xef\
-\x2f\xfe\x81\x27\x0f\x1f\x13\xb9\xdb\x9c\x1c\x54\x5c\x1b\x2b\xf1\
-\xed\xeb\x03\x9c\x3f\x53\xa5\x5a\x8c\x31\x35\x1f\x54\x80\x10\x20\
-\x34\x8b\x20\x32\xd9\xad\x0b\xb6\x76\x13\x36\xb6\x03\x3c\x1f\xec\
-\x5c\x11\xd3\xb4\x01\x81\x12\x0a\x45\x82\x40\xa1\x6b\x02\xcb\xd4\
-\x28\x97\x0b\xe4\x72\x06\x9e\xeb\xd3\x6a\xb9\x6c\x6c\x36\xa8\xd7\
-\x5d\xa4\x14\xef\xea\x86\xde\xa9\x54\xab\xb7\x0a\x85\xe2\xbf\x4c\
-\x84\xbc\xac\x03\x4f\x39\x43\x31\x36\x5a\xe6\xda\x58\x95\x33\x23\
-\x65\xfa\xbb\x75\xa4\x72\x11\x74\x50\x42\x12\x76\x20\x70\x13\xb6\
-\x77\x12\x9e\x2e\x86\x6c\x6e\x05\x38\xae\x47\xb9\xa8\xe1\x07\x06\
-\x83\xfd\x16\x85\x82\x86\x69\x48\x84\x88\x11\x22\xc1\xd0\x3b\x54\
-\x4a\x16\x86\x59\x40\x08\x89\xd3\xf6\x51\x6a\x97\xa9\xa7\x3b\x2c\
-\x3e\x9d\xe6\xe3\xdb\x39\x10\x19\xa7\xf0\xf5\xf5\x29\x5f\x6b\x40\
-\xf6\xb4\xa9\x8f\x7e\x75\xa8\x03\x1f\x84\xb1\xd1\x0a\x6f\x5e\x3f\
-\xce\x99\x91\x22\xe5\x62\x0c\x2a\x4c\x39\x02\x1d\x30\x70\xfd\x90\
-\xe5\x95\x5d\x66\xe6\xda\x3c\x7c\x1c\xf2\x7c\x25\x22\xf0\x63\x6a\
-\x55\xc1\xe6\xb6\xc3\xf9\x73\x45\xce\x9c\xee\xa5\xa7\x3b\x87\xa9\
-\xc7\x48\x91\x90\x28\x85\x26\x3b\x14\x6c\x83\xe3\x83\x36\xea\xe6\
-\x20\xb9\x42\x8e\x8e\x5a\xe1\xd9\x72\x9d\x89\xc7\x0f\x68\x3b\x3e\
-\x10\x7f\xad\x7d\x8a\xfe\xb5\x23\xe3\x57\xb7\x52\xce\x70\x52\x64\
-\x5c\x3c\x57\xe2\xea\xc5\x1a\xa7\x47\xca\xf4\x76\x5b\x68\x78\x28\
-\xd5\xa1\x13\xeb\xf8\x7e\x4c\xb3\x1d\xb2\xba\xe6\x30\x33\xd7\x62\
-\x66\xb6\xcd\xf4\x6c\xc4\xe6\x56\x4c\x12\x43\xb3\x0d\x1d\xe5\xe3\
-\xfa\x09\x5e\x98\xe3\xc4\xb0\xa0\xa7\xa6\x53\x2c\xe8\x18\x86\x40\
-\x93\x1a\x9a\xa6\xa8\x94\x24\x9a\x5e\x20\x51\xd0\x68\x79\xc0\xee\
-\xa1\x3e\xc5\xfc\x5a\xfb\x94\xaf\x85\x43\xf6\x39\xe3\x9f\xfe\x21\
-\x43\xc6\x36\x23\x43\x8a\xab\x17\x4b\xbc\x75\x7d\x90\xd1\x33\x35\
-\xaa\x25\x89\xa1\x27\x48\x21\x48\x12\x1d\x2f\xd0\x58\xdd\x08\x79\
-\x38\xbe\xce\xdd\xfb\x5b\x7c\xfc\xc0\x63\xfe\x69\x07\xc7\x4f\xd0\
-\x34\xc8\xe5\xd3\xca\x77\xb7\x01\x1b\xdb\x8a\xed\x1d\x9f\x56\x3b\
-\x42\xea\x26\xa6\x9d\xc3\xb2\xf2\x18\xa6\x09\x2a\x46\x10\xa3\x4b\
-\x81\x69\x6a\x54\xca\x79\x6c\xdb\xc4\xf3\x3c\x5a\x6d\x97\x8d\xf5\
-\x43\x9c\xa2\x7f\xf5\x9c\xa2\x7f\xe5\xc8\x58\xdb\xab\xa6\xf6\xb4\
-\xa9\x06\xbd\x35\xc5\xc5\x73\x95\x0c\x19\x35\xfa\xba\x6d\x24\x11\
-\x49\xdc\xc1\x0f\x15\xcd\x56\xcc\xc6\x66\xc8\xc2\xb3\x26\x8f\x9f\
-\x34\x78\xfa\xac\xc5\xd6\x36\x08\x69\x30\xd0\x5f\xa4\x52\x31\xb1\
-\x6d\x89\xe7\x77\x58\x59\xf1\x68\x3b\x21\xb3\x0b\x2e\x2d\x47\x11\
-\x76\x0c\xda\xae\xe0\xe4\x70\x42\x6f\xb7\x41\xde\x56\x98\x86\xc0\
-\xd0\xa1\x56\xd6\x31\x4d\x1b\x21\x34\x5c\xd7\x07\x76\x98\x5e\xd8\
-\x49\xfb\x94\xa2\x0d\x7c\xf5\x9c\xf2\x95\x22\xe4\xf9\xe2\x53\x7e\
-\xf1\xde\xcf\x33\x64\x3c\x26\x70\x76\x38\x31\x08\x57\xc6\xaa\xbc\
-\xf9\xc6\x09\x46\xcf\xf4\x51\x2d\x19\x98\x3a\x08\x21\xf1\x83\x98\
-\xcd\xad\x36\xb3\xf3\xbb\xdc\xf9\x78\x83\xfb\x0f\x77\x98\x9f\xf7\
-\x68\xb7\x13\x8a\x25\x38\x7d\xaa\xc4\x9b\xdf\x1a\xe6\xc6\xf5\x13\
-\x5c\xbc\x70\x8c\xa1\xc1\x32\x96\x19\x93\x24\x1d\xea\x8d\x98\xed\
-\x9d\x0e\x9b\x9b\x21\xbb\x3b\x0e\x51\xd4\x46\x10\x91\xcb\xe5\xb1\
-\xed\x1c\x42\x48\x84\xd4\xd0\x75\x0d\xd3\x34\x28\x95\xf2\x58\xa6\
-\x81\xe3\x78\x34\x5a\x0e\x9b\x1b\x0d\xea\xf5\x36\x52\x26\xef\x1a\
-\xba\xd6\x5f\xae\xd6\xfe\x57\xa1\x50\xfa\xff\x07\x42\xf6\xfb\x8c\
-\x8f\x3f\x52\x1f\xfd\x6a\xaf\xcf\x68\xd0\x5b\x83\x8b\xa3\x65\xae\
-\x8e\xf5\x70\xfa\x64\x17\xbd\x5d\x05\x84\x0a\xf1\xfd\x00\xc7\xf1\
-\xd8\xd8\x6c\xb3\xf0\xac\xc1\xec\x5c\x83\xa9\xe9\x26\xdb\xdb\x01\
-\x42\x08\x7a\xba\x0c\x46\x46\x6c\xce\x9d\xad\x30\x76\xb1\xcc\x40\
-\x7f\x09\xd3\x34\x69\x34\x25\x39\xb3\x42\x21\xd7\x41\xd7\x04\x2b\
-\x2b\x3e\xcd\x86\xcf\x7c\xe4\x93\x24\x1a\x9e\x17\xe1\x87\x26\xc7\
-\x87\xa0\x5a\xb5\xc9\xe7\x75\x0c\x43\x52\x29\xeb\xe8\x86\x81\x52\
-\xd0\x6c\x7b\x28\xb1\xc3\xdc\xd3\x6d\x96\x9e\x4e\x72\xef\xf6\x57\
-\xcb\x29\x5f\x09\x42\x52\xce\xf8\x9f\x59\x9f\x31\x4e\xe8\xec\x70\
-\x62\x50\x72\x75\xac\xc2\x5b\xd7\x8f\x33\x7a\xa6\x8f\x5a\xd9\x46\
-\xd7\x04\x9d\x8e\xc6\xf6\x8e\xcf\xf4\xcc\x1a\xf7\x1f\x6d\x70\xfb\
-\x4e\x9d\x89\x29\x97\xed\x9d\x08\xdb\x86\x73\x67\x24\x6f\x5c\x2d\
-\xf2\xe6\x8d\x01\x2e\x5d\xa8\x31\xd0\x2b\x29\xe5\x42\x4c\xdd\xc1\
-\x36\x7c\x6a\x15\x9d\xee\x2e\x83\xee\xaa\xa0\x58\x50\x84\x61\x8c\
-\xeb\xc6\xec\xd4\x15\x9b\xdb\x1d\x76\xeb\x2e\x8e\xd7\x41\x37\xf3\
-\x58\x56\x0e\xc3\xd0\x30\x74\x81\xae\x81\x69\x68\x94\x4b\x05\x6c\
-\xcb\xc0\xf5\x3c\x5a\x4d\x87\x8d\x8d\x06\xbb\x5f\x21\xa7\xe8\x5f\
-\x09\x32\xee\xfe\x3a\xab\xa6\xee\x65\xc8\xd0\xb8\x38\x5a\xe3\xea\
-\x58\x2f\xa7\x47\xfa\xe8\xe9\xca\x11\x77\x02\xea\xf5\x80\x9d\x9d\
-\x88\xc5\xa5\x5d\x26\x26\x77\x98\x9f\xdf\x65\x71\x39\x22\x0c\x25\
-\xb5\x4a\x9e\x91\x61\x83\x2b\x97\x34\xce\x9f\xcd\x73\xea\x44\x9e\
-\x5a\x55\x43\x13\x1e\x82\x0e\x89\x8a\xb1\x34\x8d\x52\xce\xa6\x54\
-\xd0\x29\x17\x0a\x94\x8a\x12\xc3\x30\x99\x5d\xf0\x58\x5e\xf3\xd8\
-\xad\x47\x04\x61\x48\xcb\x81\x30\xca\xd3\x6e\x2b\x8e\x0f\x19\x74\
-\x77\x99\xe4\x72\x26\x95\xb2\x85\x6e\xe6\x40\xe8\x38\x4e\x80\x52\
-\x9b\xcc\x3c\xdd\x61\x71\x61\x8a\xbb\x05\x1b\x05\xff\xd5\xb2\xec\
-\xf7\x40\xdd\x29\x57\x6a\xaf\xc4\xcd\xf2\x4a\x11\x72\x18\x19\x8f\
-\x1f\x3c\x26\x68\xef\x32\x3c\xa4\x71\x65\xac\x9b\x37\xaf\x9f\xe6\
-\xdc\x99\x21\xaa\xe5\x1c\x2a\x89\x69\x36\xda\x2c\x2e\x6e\x73\xef\
-\xfe\x12\xf7\x1e\xac\x32\x39\xd5\x66\x73\x3b\x42\xd7\x15\xc7\x8f\
-\xe5\xb9\x79\x63\x80\x9b\x37\xfa\xb9\x74\xa1\xca\x89\x21\x9b\x52\
-\x3e\xc2\xd4\xdc\x4c\xd7\xf2\x90\xca\x47\x12\x22\x88\xd0\x64\x82\
-\x9d\x33\x28\x96\x8a\x74\xf7\x76\x51\xa9\xe6\x90\x9a\x4f\x14\x85\
-\xec\xd6\x61\x6b\x2b\x61\x63\xd3\x63\xb7\xde\x22\x49\x1c\xa4\x16\
-\x63\xe7\x72\x58\x76\x0e\x5d\x37\x30\x2d\x8b\x52\xa9\x80\x69\x99\
-\xb4\x1d\x87\x66\xb3\x9d\x75\xf4\x6d\xa4\x4c\xfe\xb3\x61\xe8\xe5\
-\x4a\xa5\xfa\x8f\xaf\x82\x53\xf4\x57\x86\x8c\xb5\x15\xee\x7d\x9c\
-\x22\xe3\xc9\xa3\x7b\x04\x4e\x8a\x8c\x0b\xe7\xba\xb9\x32\x36\xc8\
-\xc9\x91\x7e\x2a\x95\x1c\xae\xe7\xb0\xb3\xd3\x62\xf9\xf9\x0e\xf3\
-\xf3\x9b\x4c\x4c\x6e\xb2\xb6\xee\x11\x04\x82\x42\xc1\xe0\xd8\x31\
-\x9b\xb3\xa7\x2b\x5c\xbe\x58\xe5\xe4\x70\x9e\x9e\x6a\x42\xc1\xf2\
-\x10\xca\x05\xe5\x22\x54\x04\xc4\x08\x54\x2a\x97\xd0\xc1\xd0\x12\
-\x74\x43\xc7\x30\x35\x0a\xa5\x1c\xb9\xbc\x44\x37\x5c\x72\xb6\x44\
-\xd7\x22\xd6\x37\x42\x36\xb7\xda\x04\x81\x8b\x4a\x2c\x5c\xbf\x83\
-\xeb\xeb\x0c\x0e\x42\xb9\x52\x26\x97\xb3\x38\x31\x9c\x23\x41\xa7\
-\xd9\xf6\x51\xac\x33\xf7\x6c\x87\xa5\x85\x49\x3e\x4e\xe7\x29\x7f\
-\x66\x99\xf9\x9f\x82\xb8\xf3\x65\x73\xca\x2b\x41\x48\x5a\x4d\xa5\
-\xc8\x18\x7f\xf8\x98\xc0\xd9\x65\x78\xc8\xe0\xca\x58\x0f\x6f\xdd\
-\x3c\xc3\xe8\xd9\x63\x94\x8b\x79\x5c\x37\xe0\xe9\xe2\x16\x8f\x9e\
-\xac\xf1\xe1\x9d\x35\x1e\x8d\xef\xb0\xb2\x1a\x00\x70\xec\x98\xce\
-\xa5\xb1\x32\x6f\x7d\xeb\x18\x57\x2f\xf7\x32\x3c\x64\x52\x2b\xc7\
-\x58\x9a\x8b\x86\x8b\xc0\x47\xd0\x01\x3a\x08\x92\x23\xdf\x5f\x01\
-\x4a\xa5\x3a\x96\x14\x09\x96\x25\xa9\xd5\x4a\x74\x77\x95\x28\x97\
-\x0c\x2c\x4b\xe0\x79\x11\xcd\x56\x87\xed\xdd\x84\xcd\xad\x90\x66\
-\xcb\xc1\x0f\x23\x0c\x23\x8f\x6d\xe7\xb1\x6d\x9b\x5c\x2e\x47\xb9\
-\x5c\xc0\xb6\x0d\x5c\xd7\xa1\xd9\x6a\xb3\xb1\x51\xa7\x5e\x77\x90\
-\x92\xff\x6c\xbc\x02\x4e\xd1\x5f\x09\x32\xee\x7e\xa4\x3e\xfc\x20\
-\xe5\x8c\xc0\x69\xd1\xdb\x65\x72\x71\xb4\x8f\xcb\x17\x07\x18\x3e\
-\xd6\x8b\x6d\x5b\x6c\xef\x36\x58\x5e\xde\x61\x72\x7a\x83\x99\xd9\
-\x2d\xe6\x17\xea\x38\x4e\x4c\xa9\x50\xe1\xd8\x60\x8e\x0b\xa3\x36\
-\xe7\xcf\x96\x39\x77\xa6\x87\xbe\x1e\x13\x4b\x0f\xd0\x85\x87\x48\
-\x40\x29\x81\x10\xc6\xde\x3d\x85\xda\x0f\x88\x00\x24\x2a\x7b\x0a\
-\x01\x9a\x96\x50\xc8\x6b\xe4\x0b\x45\x0a\x05\x41\x2e\x57\x24\x5f\
-\x28\xa3\x99\x65\x16\x9e\xb5\xd9\xd8\x74\x59\xdf\x0a\xf0\xa3\x26\
-\x4d\x57\x11\x44\x39\xda\xae\x60\x60\xa0\x8b\x42\x21\xc7\xf1\x63\
-\xbd\x80\x86\xe3\xf8\xc0\x2a\xd3\x0b\x75\x16\xe7\xb3\x79\xca\x2b\
-\xe0\x94\x2f\x15\x21\x7b\xc8\xf8\x7f\xfe\xe9\x1f\x18\x7f\xf0\x18\
-\xdf\x69\x30\x3c\x64\x71\xe5\xd2\x20\x6f\xde\xbc\xc0\xe9\x93\xc7\
-\x30\x75\x8d\xcd\xcd\x6d\x1e\x8d\xcf\x70\xf7\xfe\x02\xf7\x1e\x6e\
-\xf3\xec\x79\x9b\x4e\x27\xa4\xb7\xaf\xcc\x1b\x6f\x9c\xe5\xe6\xcd\
-\x73\x5c\xb9\x72\x9a\x53\x23\x83\x54\x2b\x36\xa6\x01\x52\xc4\x80\
-\x42\x20\x41\x18\x08\x69\x82\xb0\x40\xd8\x20\x72\x20\xf2\x20\xf2\
-\x28\x91\x4b\x9f\x32\x97\x7d\xce\x42\x09\x0b\x84\x85\xd4\xf2\xe4\
-\xf2\xdd\x94\xab\x7d\xf4\xf4\x0e\x50\xa9\x55\x50\x52\xe1\x87\x1d\
-\xb6\x76\x23\x36\xb7\x42\x76\x76\x5d\x9a\x2d\x0f\x85\xc2\x30\x74\
-\x0a\x85\x22\xa5\x52\x89\x4a\xa5\x84\x6d\x9b\xb4\x5a\x2d\x1a\xcd\
-\x66\xda\xa7\x34\xbe\x7c\x4e\xd1\xbf\xcc\x6a\xea\xfe\xdd\x5f\x67\
-\x1d\xf8\x7d\x42\xb7\x45\x4f\xcd\xe2\xc2\xe8\x20\x17\x46\x87\xe8\
-\xed\xa9\x11\xc7\x92\x67\x2b\x5b\x2c\x3c\x5d\xe6\xc9\xc4\x32\x73\
-\x0b\xbb\x2c\xaf\x2a\xe2\x44\xa3\xb7\xc7\xa6\xda\x55\xa1\xbb\xaf\
-\x4a\xa5\xab\x8a\x6e\xe6\xf0\xa3\x98\x68\xc7\x45\x64\xc4\x2d\x08\
-\x90\x99\xf4\x21\x84\x42\xa0\x10\x88\x34\x47\xb1\xff\x1b\x4a\xa4\
-\x1f\x29\x62\x12\xd4\xc1\x2f\x01\x48\x83\x4e\x6c\x93\x2b\x58\xd4\
-\xba\x13\xba\x7b\x6b\x6c\xd5\x7d\x56\x37\x03\xb6\xeb\x0e\x6d\xb7\
-\x41\xb3\x1d\xe1\x85\xd0\x72\x12\xce\x9c\x16\xf4\x74\x57\xe9\xeb\
-\xe9\x26\x3e\x27\x69\x34\x1d\x84\x78\xce\xdc\xd3\xdd\x23\x9c\x62\
-\x5a\xb9\xff\xa1\x10\xb7\x2a\x95\xea\xef\x84\x94\x2f\x25\x20\xfb\
-\xaa\xed\x07\xb7\x98\x78\xf8\x98\xc0\x6d\x31\x72\x2c\xc7\xf9\xd1\
-\x01\x6e\x5e\x3f\x4f\x4f\x4f\x85\x76\xdb\x65\x79\x65\x93\xc7\xe3\
-\x0b\xcc\x2f\x6c\xb0\xb6\xd1\xa6\xde\x54\xf8\x81\xa2\x50\x34\x29\
-\xd5\x7a\xb0\xf3\x35\xda\x4e\xc2\xb3\xc5\x1d\x56\x57\x22\x74\x11\
-\x20\x94\x8b\xc4\x47\x10\x22\x44\x07\x54\x82\x20\xd9\x0f\xc8\x91\
-\x48\x1c\x7e\x08\xc9\x5e\xc8\xd2\x14\x66\xa0\x84\x89\x22\x47\x82\
-\x4d\x9c\x98\xb8\x81\xa0\x93\x98\xe4\x8a\x15\x0a\xa5\x16\xae\xef\
-\xd3\x74\x63\xdc\xe7\x01\x3b\xcd\x75\x16\x57\x5c\x9e\xaf\x36\x18\
-\x3d\x3b\xc4\xe8\xd9\x93\xf4\xf5\x76\xf3\x9d\x37\x2f\x51\xab\x94\
-\xd1\xc4\x13\x9e\x3d\x6f\x30\xf1\xe8\x01\xed\x76\x80\x42\xec\xfb\
-\xbe\xfa\xfa\x06\xbe\x9e\x80\x1c\xf6\x4d\x7d\xf8\xc1\x2d\x26\xb3\
-\x3e\xa3\xa7\x6a\x30\x7a\xa6\xc6\xd9\x93\x5d\x14\xf3\x1a\x4e\xcb\
-\x61\x6e\x61\x8d\xa9\x99\x15\x9e\x4c\xac\xf0\x7c\xb5\x89\xe3\x41\
-\xd8\x01\x21\xc1\x8c\x21\x08\xa1\xde\x0c\xe9\x44\x3b\x98\xba\x42\
-\x75\x7c\x48\x82\xfd\x52\x36\x9d\x9d\x27\xfb\x6f\x71\x9a\xbe\x5e\
-\x12\x07\x05\x08\x91\x0d\xa8\xb2\x69\x2e\x02\x25\x34\x14\xda\x41\
-\x60\x84\x49\x82\x41\xac\x74\x1a\xad\x80\x20\x4a\x88\x12\x70\x43\
-\xe8\x38\x1d\x1a\xad\x0e\x2d\x27\x22\xf0\x03\x7c\x2f\x86\xc4\x60\
-\xf8\x58\x37\x95\xa2\xc9\xe9\x91\x6e\xea\x3b\x7d\xa8\x24\x66\xe6\
-\xe9\x2e\x8b\x07\x48\xf9\x0b\xcb\xb2\xdf\x13\xbf\x83\xf6\xa5\xff\
-\xae\xc8\xf8\xc5\x7b\x7f\xa7\x3e\xfa\xe0\x16\xe3\x0f\xc6\x09\xdd\
-\x06\x23\x83\x3a\xa3\x67\x6a\x5c\x1e\x1b\xa2\x58\xb0\x58\x5e\x9c\
-\xe3\xd9\xd2\x2e\x93\xd3\x4d\x16\x97\xdb\x6c\xd7\x3d\xda\x2e\x84\
-\x31\xc4\x09\x90\x40\xab\x1d\xb0\xb4\xb4\xc9\xd6\x46\x1d\x4b\x93\
-\xe8\x42\x21\x48\x90\x2a\x9d\x65\x08\x14\x1c\x42\x84\xe0\xe5\x5b\
-\x5f\x42\x71\x28\x48\x59\xd8\xf6\x33\x5a\x1a\xca\x04\x99\x3e\x95\
-\x24\x56\x82\x0e\x92\x20\x8a\x71\x7d\x1f\x3f\x88\x09\x3a\x8a\x44\
-\x91\xc9\xf9\x1d\x9e\x2d\x3a\x78\xce\x32\x3b\x1b\x0d\xce\x9c\xaa\
-\x31\x76\x71\x90\x4a\x35\xcf\xb5\x2b\x27\x28\x95\xf3\x24\xcc\xb1\
-\xb8\xd2\x60\xe2\xf1\x03\x1c\xc7\x47\x92\xbc\x1f\xf9\x5f\x7c\x9e\
-\xa2\xff\xae\xd5\xd4\x47\x1f\xec\x75\xe0\x75\x7a\x6b\x1a\x63\xa3\
-\x55\xce\x9e\xac\x52\x29\x24\xb4\x5b\x75\x16\xe6\x9e\x33\x3b\xbf\
-\xc3\xea\x6a\x40\xab\x19\x13\xc7\x02\x21\x25\xc4\x2a\x2b\x4d\xa1\
-\xd3\x89\x09\x7c\x0f\x53\xeb\x60\xe7\xf2\xe4\x6d\x0d\x5d\x08\x34\
-\x21\x52\xbe\x20\xd9\x2f\x6d\xc5\xa1\x7a\xea\xa5\x41\x79\xe1\x4f\
-\x6a\xff\x29\xf6\x9f\x09\x92\x18\x9d\x30\x16\xb8\xa1\x22\x8a\x15\
-\x71\x9c\x10\x75\x12\x92\x24\x45\x55\x02\x24\xb1\xa2\xd3\x89\x69\
-\x36\x5c\xe6\xbd\x36\x81\xd7\x46\xd2\xe1\xec\x99\x7e\x8e\x1d\xef\
-\xc5\x38\xd3\x4b\xb3\xd9\x44\x88\xb4\x4f\x59\x7e\x3a\xc5\xbd\xdb\
-\x2f\xf8\xbe\x3e\x27\xa7\x7c\xa1\x80\x1c\x71\x87\x3c\x7c\x9c\x4d\
-\xfa\x24\x17\x47\xab\xbc\x75\xe3\x04\xa5\xbc\xc6\xf2\xd2\x73\x66\
-\x67\xb7\x99\x9e\x70\xd9\xda\x0d\xc9\xe5\x12\x06\x72\x02\x27\xd4\
-\x68\x3a\xb0\x53\x8f\x89\x13\x05\x0a\x4c\x5d\x50\x29\x69\x9c\x1c\
-\x2e\x71\xf9\xe2\x71\x86\xfa\x0a\x58\x5a\x88\x26\x7c\x48\x7c\x04\
-\x01\x82\x0e\x82\x17\xd3\xd6\x27\x09\x44\x90\xa6\xab\x34\x6d\x65\
-\x5f\xad\xf6\x78\x64\x2f\x65\xe5\x50\x5a\x91\x76\x60\xb0\xb9\x13\
-\xf3\x74\xa9\xc1\xf8\xe4\x32\x41\xd0\x22\x11\x90\x28\x90\x02\x6c\
-\x5b\xd2\xd7\x6b\x90\x33\xc0\x69\x46\xac\xae\x78\x84\xee\x2a\x6e\
-\xb3\x43\xb9\x68\xd1\xdb\x57\xe4\xdb\x37\x4e\x52\xab\xe6\xd1\xe5\
-\x02\x8b\x2b\x0d\x26\x1f\x1f\xf8\xbe\xc2\x30\xfc\xf3\xb1\x2b\xd7\
-\xfe\x7b\xef\xe7\xe0\x14\xfd\x8b\x55\x53\x99\x6a\xfb\xf0\x6e\x36\
-\xe9\x4b\xc7\xae\x57\xc7\xba\x38\x33\x52\x84\x38\x60\xe3\x79\x1b\
-\xe2\x06\x86\x4c\xa8\x55\x0d\x06\x8e\x95\x51\xba\xc6\xea\x86\x07\
-\x9b\x01\x9e\x9f\xa0\x94\xc0\xd0\x05\xb6\x25\x31\x74\x81\xa9\x43\
-\xa5\x08\x43\xfd\x26\xbd\x5d\x05\x8a\xb9\x38\x93\x46\x5c\x24\x41\
-\xca\x25\xfb\x41\x49\x5e\x12\x94\x43\xf8\x11\x12\xd4\xde\x57\x49\
-\x14\x3a\x09\x16\x0a\x9b\x8e\xca\x11\xc4\x79\x36\x76\x14\x51\xe4\
-\x60\x19\x60\x68\x60\x19\x12\xdb\x36\x48\x12\x88\x82\x88\x42\xce\
-\xe0\xf8\xb1\x0a\xd5\x82\x46\x63\xc7\x27\x70\x03\x44\xe2\xd1\x09\
-\x9b\xe8\x78\x54\x8b\x45\xaa\xe5\x22\x96\xd1\xc1\x73\x1a\x08\x36\
-\x99\x9e\x4f\x7d\x5f\xf7\x8a\x39\x80\xbf\x4e\xf7\x53\x3e\x3b\xa7\
-\xe8\x9f\xbf\x9a\xfa\xb9\xfa\xe8\x83\xd4\x37\x15\xba\x75\x4e\x0c\
-\x26\x8c\x8d\x96\x79\xeb\xfa\x20\x67\x46\xaa\xd4\x0a\x11\xa1\xef\
-\x70\x6c\x40\x47\x75\xf2\xe4\x73\x01\xc2\xa8\x71\xf2\xdc\x05\x9c\
-\x40\xe3\xf6\xbd\x79\xda\xce\x06\x6d\x5b\x60\x68\x82\x72\xc9\x40\
-\x0a\x70\xdb\x31\x9b\xeb\x2d\x16\xe6\x9f\x51\xb4\x5d\x06\x7a\x4e\
-\xd2\xdd\x55\xc1\xd4\x0d\x74\x61\x20\x94\x9b\x22\x45\x44\x59\x1a\
-\x8b\xb3\x34\xf6\x02\xb9\x2b\x91\xfd\x4d\x56\x65\x29\x49\x82\x41\
-\x22\x2c\x94\xc8\xa3\x64\x09\xc7\xd3\xd9\xd8\x89\x68\x35\x9a\x3c\
-\x5d\x58\x65\xf1\xe9\x0e\x81\xe7\x51\xc8\x19\x94\x2b\x25\xe2\x18\
-\x76\xb6\x5b\x94\x0a\x36\xa7\x47\x06\x39\x75\x3c\x8f\x8a\x5c\x42\
-\xaf\x81\xdb\xda\xa2\xbb\x0b\x7a\x6a\x11\x45\x3b\x40\xea\x92\xe1\
-\x01\x0d\x71\xa3\x9f\x42\x5e\x27\x89\x57\xd3\x19\xfd\xa3\xfb\xb4\
-\xdb\xde\xe7\x9e\xd1\xeb\x9f\x0f\x19\x1f\xa6\xc8\x38\xe2\x28\x2c\
-\x70\x6d\xac\xcc\xb9\x11\x9b\xbe\x2e\xd0\x68\xa1\x27\x0e\x03\xdd\
-\x12\x4b\xcb\x51\xad\xe8\x68\x56\x99\xc1\x13\xdd\x6c\xec\x2a\xa6\
-\x66\x34\x2c\x43\x61\x99\x50\x2c\x98\x9c\x1a\xa9\xa1\x4b\x58\x7e\
-\x5e\x27\x0a\x7c\xd6\xd7\xea\x14\x6d\x41\x4f\xb5\x82\x6d\x0a\xfa\
-\x7b\x24\xf9\x82\x85\x21\x63\xb4\x8c\x01\x44\xa6\x5d\x89\x4f\xa4\
-\x2f\xb1\x4f\xde\x29\x6f\x68\x59\x40\x74\x62\x61\x13\xc6\x16\x6e\
-\xa8\xd1\x68\x76\x58\x5c\x6c\x32\x3f\xb7\xcd\xca\xf3\x6d\x7c\x37\
-\xa0\xb7\xab\x40\xbe\x58\xa4\x54\x2e\xe3\xba\x11\x81\xe3\x93\x33\
-\x04\x5d\x15\x9d\xe1\x63\x79\x4a\xb6\x81\x48\x04\xed\x46\x40\xce\
-\x52\x74\x97\x43\x72\x46\x0b\xa9\x0b\x8c\x92\xc0\x34\x4c\x50\x65\
-\xda\x2d\x17\x41\xe3\x0b\xcf\xe8\xf5\xcf\x5e\x4d\xfd\x7c\x7f\x3f\
-\xe3\xc0\x51\x58\xe0\xdb\xd7\xfb\x39\x3b\x52\xa0\x56\xf4\x31\x69\
-\x21\x12\x1f\x4d\x0f\x31\x2a\x09\xe5\x82\x4d\x7f\x7f\x09\x25\x4b\
-\xe8\xf9\x80\xdd\x86\x97\x7a\x71\x55\x80\x21\x63\x7a\x6b\x15\x6e\
-\x5c\x1b\xa1\x94\x17\x4c\x57\x67\x59\x5a\x0c\xd8\xda\x84\x27\x13\
-\x0e\xae\x3b\xc7\xe6\xe6\x0e\x37\xdf\xe8\x67\xe4\x78\x8e\x82\xad\
-\x61\xe9\x12\x91\x24\x08\x42\x24\x21\xd0\x49\xcb\xb4\x4f\x04\x44\
-\x92\xec\xf1\x05\x82\x44\x80\x42\xc7\xf1\x60\x69\xa5\xc5\xc4\x74\
-\x8b\xdb\x1f\x6f\xb0\xf0\xb4\x41\xb3\xe5\x53\xae\x16\xb8\x74\x79\
-\x84\x9e\xbe\x2e\x12\x65\xb2\xb2\x52\x67\x6b\x75\x07\x5d\x84\xc8\
-\xa4\x81\xad\x4b\xfa\xba\x2d\x8a\xb6\x4d\xdc\x5f\x45\x13\x21\x79\
-\xdb\x43\x17\x01\x28\x90\x42\xa3\x6c\xdb\x9c\x1c\x94\xc8\x6f\x0d\
-\x50\x29\xe5\xd1\xe5\x2a\x4f\x57\x3e\xbf\x97\x58\xff\x2c\xd5\xd4\
-\xfd\xbb\x1f\x1e\xf8\xa6\x9c\x3d\x17\x7a\x81\x37\xc6\x2a\x9c\x1b\
-\xc9\x33\xd0\x25\xd0\x68\x65\xde\xa9\x10\x21\x53\x41\x8f\x9c\x49\
-\x22\x04\x1d\x14\x11\x2e\x3a\x2e\x42\x05\x08\xd5\x41\x13\x50\xcc\
-\xe9\x1c\x1f\x28\x32\xd0\x67\x92\xd3\x7b\x28\x58\x8a\x27\x91\xc3\
-\xf6\x4e\xc8\xc2\x42\x9d\x38\xea\x90\x33\x75\x92\x4e\x99\xa1\x01\
-\x83\x5a\x49\x60\x6a\x12\x4d\x68\x59\x08\x92\xfd\xa0\x88\xfd\xd2\
-\x36\x25\xef\xbd\x94\x95\xa0\x11\x74\x04\x6d\xcf\xe7\xf9\x9a\xc7\
-\xf8\x94\xc7\xf8\x44\x93\xd9\xd9\x5d\x5a\xad\x90\xae\x2e\x8b\x33\
-\xa7\xbb\xb8\x32\x36\x40\xad\xab\xca\x76\xbd\x43\xbb\xe9\x60\x19\
-\x12\x4d\xc4\x48\x1c\x74\xa9\x53\xb0\xa1\x56\x16\x88\x44\x22\x12\
-\x05\xca\x05\x15\xa7\x95\xa2\xd0\xd1\xb5\x88\xae\x52\x1e\xd3\xc8\
-\x23\x29\x67\xeb\x74\x0d\x26\x17\x0e\xbc\xc4\x4a\xfd\xf6\x19\xbd\
-\xfe\xdb\xaa\xa9\x7f\xce\x90\x31\xf1\x70\x9c\xd0\xad\x73\x72\x30\
-\x66\x6c\xb4\xc0\x5b\xd7\x07\x53\x17\x7a\x31\x48\x8d\xcf\xaa\x8d\
-\x54\x7e\x56\x0d\xa9\x34\x97\x27\x21\x88\x28\x7b\x9b\x74\x24\x01\
-\x92\x18\x29\x40\x2a\xd0\x44\x8c\x21\x02\x7a\x2a\x39\xaa\x97\x86\
-\xe9\xa9\x16\x31\xf5\x65\xa6\x67\x76\x59\x5e\x0e\x79\xba\xe0\xa1\
-\x3a\xab\x34\x1a\x6d\x6e\xbe\xd1\x8d\x76\xc2\xa6\x5a\xb2\xd1\x0d\
-\x41\x5a\x9f\x26\x20\x92\x43\xc5\xed\xde\x6f\x32\xbd\x34\x61\x81\
-\x28\xe0\x78\x8a\xa7\x4b\x3b\x3c\x99\x74\xb8\xfd\xb1\xcf\xb3\xa5\
-\x10\xcf\x0f\xe8\xef\xb3\x79\xe3\x5a\x2f\x17\x2f\x0e\x72\xfa\x4c\
-\x37\x0a\x93\x76\x7b\x07\x15\xfb\x48\x62\x34\x11\xa3\x11\xa0\xe1\
-\xa4\xdf\x26\x26\xe5\x32\xe5\x23\x54\xca\x65\xa9\x3b\x52\x43\xa9\
-\x0e\x86\x88\x29\x5a\x30\x3c\x60\xc0\x8d\x01\x0a\x85\x3c\x71\xb6\
-\x9f\x92\x76\xf4\x3e\xe2\xb7\x70\x8a\xfe\x69\xc8\xd8\x58\x5f\xe1\
-\xc1\xa1\xfd\x8c\xc8\xad\xd3\x5f\x8b\x19\x1b\xcd\xf3\xc6\x58\x99\
-\x73\x23\x39\xfa\xbb\x04\x3a\x1e\x9a\x6a\xa5\x4e\x74\x42\x64\x96\
-\x42\x14\x22\x93\x39\x14\x02\x1d\x21\x42\xa4\xea\x64\x3a\x6c\x5a\
-\x95\x4a\x12\x74\xe1\x53\xb0\x3b\xe4\x6d\x9b\xbc\x59\xa6\x13\x39\
-\xe8\x32\x26\x89\x9a\x6c\x6e\xfa\x3c\x5f\x6e\x11\xc7\x31\x96\xa9\
-\xd1\xe9\x94\x39\x39\x6c\xd1\x5d\x35\xb1\xf4\x3c\x7a\xd6\x91\x43\
-\x98\x45\x42\xa0\xd0\x51\x98\x24\xe4\xf1\x43\x8b\x86\xab\x58\x5a\
-\xf1\x19\x9f\x68\xf0\x64\xaa\xc5\xd2\x52\x44\xe8\x0b\x06\xfa\x2c\
-\xce\x9d\x2d\x73\xf5\x52\x95\xb3\x67\x8a\x74\x75\x6b\xb4\x9c\x18\
-\x5d\x06\x88\x24\xc8\xda\x47\x85\x24\x42\xa8\x10\xa1\x74\x84\x52\
-\xa0\x7c\x84\xf2\x91\xfb\x65\x78\x1a\x90\x44\x29\x74\x40\x6a\x92\
-\x5a\xa9\x80\x61\xe4\x50\x94\x68\xb6\x5c\x94\xaa\x33\xf3\x74\x8b\
-\xe7\x4f\xd5\xd1\x19\xfd\x4b\x76\x1e\x5f\x1a\x90\x8d\xf5\x3d\x64\
-\xfc\x72\x1f\x19\x23\x83\x09\x63\xfb\x9c\x91\xa3\x56\x0c\xd0\xf1\
-\xd1\x54\x1b\x2d\xd3\x9a\xa4\xe8\xa4\x5d\xd5\x7e\x3f\x10\x23\x90\
-\xfb\x8d\x9d\x38\x74\x27\x4b\x48\xc9\x59\xf9\x88\xa4\x8d\x86\xa4\
-\x56\x54\x5c\x1e\xad\x51\xce\x6b\x14\xec\x0e\x13\x53\x11\x73\x0b\
-\x31\x4f\x17\x03\xfc\x60\x9b\xad\x9d\x80\x30\xea\xe6\xdc\xe9\x3c\
-\x3d\xd5\x22\x9a\x65\xa2\x12\x81\x50\x32\x7b\x73\xe4\xbe\x5e\x15\
-\x53\xa4\xde\x4e\x98\x9a\x6f\x30\x3e\xd9\xe2\xe1\x63\x87\xd5\xb5\
-\x88\x24\x56\x9c\x38\x6e\x73\xfd\x8d\x5e\x2e\x9c\xaf\x32\x72\x22\
-\x4f\x57\x4d\xa1\xeb\x2d\xda\x49\x8c\x54\x6e\x16\x84\x04\xa1\xd4\
-\x3e\x23\xed\x17\x12\xea\x50\xd9\x2d\xb2\x2e\x12\x85\xcc\x4a\x3d\
-\x95\xa8\x14\x29\xb6\xe2\xc4\x80\x81\xba\xd9\x4f\xb1\x98\x43\x8a\
-\x55\x9e\xed\xf5\x29\x4e\xd6\xa7\x04\xc1\x5f\x8e\x5d\x39\xca\x29\
-\xfa\x51\x64\xb4\xd9\xd8\x57\x6d\x7f\x79\xb0\xb9\x54\x4d\x83\x71\
-\x6d\xac\xc2\xd9\x91\x3c\x03\xdd\x02\x4d\x79\x07\xc1\x50\x01\x52\
-\x74\xf6\xcb\xd0\x34\x73\xc8\xb4\x24\x55\xe9\x0b\x3f\x5c\xa2\xee\
-\x49\x1c\x82\x04\xa1\x42\x24\x1e\x9a\x52\x98\xa6\x46\xae\xcb\x44\
-\x97\x36\x24\x25\xa4\x84\x20\x08\x58\x5a\x8e\x58\x59\xf3\xe9\xc4\
-\x8a\x9c\x6d\x92\xc4\x82\xce\xc9\x3c\xbd\xdd\x26\xb6\x5e\x40\xd7\
-\x8c\x8c\x4b\x24\x0a\x1b\x3f\xd0\xa8\xb7\x63\x9e\x2e\x7a\x3c\x7a\
-\xd2\x64\x72\xba\xcd\xf2\x4a\x84\x4a\x24\xc7\x8f\x59\x5c\x18\x2d\
-\x73\x65\xac\xc2\xe9\x93\x79\x2a\x65\xb0\x4c\x9f\x44\x65\x52\x0d\
-\x07\x69\x57\x1c\x12\x5c\xc4\x3e\x4f\x1d\x04\x43\x1c\x29\x28\x0e\
-\x82\x07\x6a\x1f\x29\xba\x91\x07\x51\xc6\x75\x3c\x04\x0d\xa6\x9e\
-\x6e\xb3\x34\x3f\xc5\xbd\x6c\x9e\x62\x5a\xd6\xfb\x0a\x75\xab\x92\
-\xed\xa7\xe8\x9f\x44\xc6\xdf\x67\xda\xd4\x93\x43\xdb\xae\x25\xde\
-\xbc\x3e\xc0\xb9\x91\x5c\xba\xd3\x87\x8b\xa4\x9d\x4d\xee\xa2\x14\
-\x19\xc4\xfb\x2f\x2a\x6d\xcc\x52\x69\x24\x5d\xa2\x51\x59\x14\x8e\
-\x76\xd5\x69\x4a\xe8\x20\x55\x98\x72\x8b\x02\xa5\x3c\x4a\x39\xc9\
-\xd9\x93\x35\x6c\xab\x84\x61\xb6\x28\x4e\xb4\x99\x98\x6c\xb1\xb6\
-\x16\x72\xfb\xce\x36\xf5\x7a\x40\x10\xd6\x18\x3d\x5b\x60\xa0\xb7\
-\x40\xc1\x2c\xa2\x92\x4e\x56\xe2\x9a\xec\xb4\x7c\x26\xa7\xd7\x18\
-\x9f\x68\xf0\x70\x3c\x64\x63\xab\x83\xd4\x12\x8e\x0f\xe7\x79\xf3\
-\x46\x2f\x17\x46\xcb\x0c\x0f\xd9\x54\xcb\x31\x86\xe6\x23\x94\x40\
-\x92\xcf\x4a\x81\xac\xf9\xdc\x7b\xed\x7b\x37\x52\x96\x1d\xa5\x20\
-\x4d\x5d\x24\x07\x9f\xdb\xbf\x05\x0f\x46\x02\x89\x92\x18\x52\x51\
-\xca\x09\x4e\xec\xed\xa7\x64\x9c\x72\xd8\x4b\xac\x48\xde\xf7\x7d\
-\xef\xbf\x5f\xba\x7a\xfd\xcf\xfb\xec\xc1\x34\x20\xed\x76\x8b\xf5\
-\xf5\x55\xee\xdf\xbd\xbd\x3f\xe9\x0b\xdd\x5d\x7a\xbb\x24\x17\xcf\
-\xe5\xb9\x3a\x56\xe1\xcc\x48\x81\xfe\x6e\x81\x41\x80\xa6\x1c\xa4\
-\xf2\x32\x25\xf6\x70\x83\x96\x3e\xd5\x61\x39\x49\x1d\x74\xd2\x87\
-\x55\xda\xc3\x1d\x43\x9a\x8f\x3b\xfb\x69\xc1\x36\x0c\x6c\xab\x88\
-\xa6\xd9\x28\x01\x52\x0a\x02\x3f\x15\xfa\xb6\xb6\x03\x12\xa5\x30\
-\x2c\x49\x14\xa7\xf2\x79\x5f\x6f\x0e\xd3\xd0\x88\xa2\x84\x7a\x23\
-\xe0\xe9\xa2\xc3\xc3\xf1\x26\x33\x73\xa9\xc3\x51\xd7\x74\x86\x87\
-\xf3\x5c\x3c\x5f\xe6\xd2\xc5\x12\x27\x87\x6d\x4a\xf9\x18\x4b\x0f\
-\x51\xca\x03\x25\x51\x42\x43\x22\x0f\x69\x67\xea\x05\x09\xf9\xe0\
-\x8d\x17\x87\x14\xb2\x74\x51\x68\xef\x72\xd3\xaa\x4f\x66\x57\xa7\
-\x23\x90\x9a\x96\x22\x45\xcf\xa1\x54\x85\x66\xdb\x07\x51\x67\xf6\
-\x59\xea\xfb\xba\x7b\xdb\x24\x51\xfc\x99\x69\xe7\x7f\x1a\x04\xe1\
-\x1d\x3d\xed\x33\x56\xf9\xa7\xf7\xfe\x97\xfa\xf0\x83\x5f\xf2\xe4\
-\xc1\x43\x22\x77\x97\x93\xc7\xcc\x74\xdb\xf5\x5a\x17\x67\x47\x4c\
-\x6a\xc5\x30\x5b\xb0\x6c\x23\xf0\xf7\xef\x24\x41\x9a\x47\xc5\xa7\
-\x08\x7e\x62\xff\x57\xf6\xfa\xe1\xc8\xd7\x1e\x04\x25\x46\x12\x65\
-\x48\x8b\x40\xc5\x94\x72\x36\xa7\x8e\x9b\x98\x46\x09\xdb\x8c\xa9\
-\xd5\xe0\xf1\xb8\xc3\xe6\x76\xc4\x9d\x7b\x0d\xb6\x77\x13\xfc\x48\
-\xe7\xec\xd9\x1c\xbd\xbd\x15\x9c\xb6\xc7\xe3\xf1\x65\x26\x27\xd7\
-\x99\x99\xf1\x68\x35\x53\xcf\xef\xc8\xb0\xc5\xcd\x37\xfa\x18\x3d\
-\x5b\x62\xa8\x5f\xa3\x5c\x08\x30\x84\x97\xa6\x4b\x15\xa1\x84\x41\
-\x42\x07\xd0\xf7\x53\x15\xe2\xe8\xf5\x28\x54\x0a\xf4\x17\x66\xf7\
-\x07\x37\x9e\xda\x2f\x2b\x20\x46\xaa\x08\xf0\x51\x89\xc0\x10\x8a\
-\x52\x4e\x72\x62\xc8\x44\x89\xe3\x14\xcb\x25\xa4\xbe\xc4\xc2\x72\
-\x83\x27\xe3\x0f\x69\xb6\x23\x10\xc6\xed\xe7\xa7\x9e\xa3\xaf\xae\
-\x2c\x33\x3f\x37\xfb\xd7\xb7\x7f\xfd\x6b\xee\xdd\xbd\x43\x7d\x73\
-\x8b\xde\x9a\xc6\xc8\x89\x1a\x17\xcf\x77\x73\x6a\xa4\x44\x5f\x77\
-\x07\x1d\x27\xeb\x33\xb2\x61\xd1\x9e\xd3\x43\xa9\x17\xba\xe5\xdf\
-\x28\xc1\x7e\xe2\xaf\x0f\x90\x12\x23\xe9\x00\x51\x76\x7d\x1d\x2c\
-\x3d\x46\x2f\xa5\xfb\x82\x52\x16\xd1\x34\x0d\xcf\x37\x99\x99\xf7\
-\xd8\xa9\x7b\xcc\x2c\xb4\x31\xf3\x16\x2d\x5f\x67\x70\x20\x9d\x7b\
-\xdf\x7b\xb4\xcb\xb3\xa7\x2d\x1a\x75\x45\x21\x67\x70\xea\x64\x8e\
-\xb1\x0b\x65\xc6\x2e\x94\x19\x1e\x32\xc9\x5b\x01\xa6\xe6\x21\x12\
-\x17\x54\x84\x20\x21\xd9\x2b\x30\x90\x47\x0a\x8f\x83\x77\x5e\xed\
-\x17\x2b\x2f\x53\xce\x8e\x4a\x9c\x6a\x1f\x29\x02\x81\x54\x02\x4d\
-\x68\xa0\x59\x54\x4a\x36\xa7\x8c\x0a\x1d\x65\xb3\xbe\xed\xb0\xdb\
-\xda\x62\x6a\x61\x1b\x37\x98\xa6\x54\xa9\xb0\xb6\xbe\x86\x7e\xf7\
-\xe3\xdb\xef\x4f\x4d\x4c\xbe\x3d\x3b\x33\xcf\xe6\xe6\x16\xba\x0a\
-\xa8\xd5\x7a\x38\x75\x72\x98\x91\x13\xdd\x14\x0b\x1e\x52\x04\x88\
-\x24\xca\x2e\x60\x2f\x45\x25\x87\xca\xda\x4f\x0f\xc6\xc1\x3c\xe2\
-\xe8\x2b\x17\x47\x04\xf2\x64\xbf\xc9\x4b\xef\xac\x04\x21\x22\x12\
-\x95\xa6\xb1\x9c\x95\x67\x68\xa0\x88\xd0\xcb\x48\x33\xa6\x54\x6b\
-\x70\xff\xe1\x2a\x5b\x3b\x2e\x0f\xc7\xb7\x79\xba\xd4\xa6\xab\x6b\
-\x95\x28\x4a\x58\x5a\x6a\x11\x05\x8a\xae\x9a\xe0\xdc\xa9\x02\x6f\
-\xdd\x1c\xe2\xfc\xe9\x22\x7d\xdd\x09\x79\x33\x40\x17\x6d\x44\xe2\
-\x65\x13\xc8\x74\x61\x54\x0a\x83\x84\xdf\xed\x64\x3d\x91\xa1\x24\
-\x2b\xb5\x40\x88\x7d\x99\x07\xd5\x41\x25\x11\x52\x24\xe4\x73\x26\
-\xdd\x5d\x26\x23\x27\x86\x58\xdf\xd1\x58\x5a\x5b\x67\xb7\xd5\x62\
-\x6a\x6a\x8a\xe5\x95\x95\x94\x43\x74\x5d\xa7\x58\x2c\x52\x28\x14\
-\x89\xbc\x98\x4e\x27\xc1\xf5\x42\x1c\x37\x20\x08\x13\x3a\x26\x08\
-\x24\xda\x21\xda\xe2\xcb\x38\x19\x70\xff\xce\x53\xfb\xb2\x3a\x7b\
-\x17\x41\x9c\x56\x68\x80\xae\x69\x14\x0b\x45\x06\x64\x0e\x34\x0b\
-\xa5\xd9\xb4\xdc\x90\x68\x1a\xd6\x36\x3d\xd6\x36\x3d\x0a\x6b\x69\
-\x80\x3d\x17\xba\x6a\x36\x27\x4f\x56\xb9\x74\xa9\x8b\xf3\xe7\x7a\
-\x18\x1e\xd0\xb0\xb4\x26\x86\xf0\xb3\xe6\x35\x40\x8a\x28\xfb\xbe\
-\x32\xeb\x9a\xd4\xd1\x06\xf3\x08\x84\x0f\xe4\xfc\xdf\x18\x94\x23\
-\xf7\xdc\xc1\xed\x86\xc8\x92\x72\x22\xf1\x3b\x0a\xc7\x53\xb4\x5d\
-\x85\x1f\xa4\x5f\x97\xcf\xe7\xe8\xef\xef\xa7\xab\xa7\x17\xfd\xe6\
-\x8d\x37\xff\xb0\xab\xd6\x3d\xd4\x6e\x35\x97\x0d\x4d\xf0\xe4\xd1\
-\x23\x56\xd6\x1b\xdc\xbe\x3b\x41\x1c\x76\x61\xdc\xec\x27\x67\x18\
-\x48\x33\x87\x2e\x23\x94\x8a\xd3\x67\x96\xb2\xd4\xfe\xe0\xe8\xe8\
-\xc5\xec\x0d\x9f\xf6\x5e\xa5\xe2\x05\xf2\xf8\x0d\x77\x9a\xc8\x4c\
-\x09\x42\x88\x94\xec\x55\x88\x8a\x5d\x4c\xc3\xa6\xaf\xb7\x42\x87\
-\x1c\x61\x47\x20\x74\x9b\xd6\xed\x65\x1a\xcd\x16\x41\x04\x96\x01\
-\x85\x1c\x0c\x0f\x97\xf9\xd6\xcd\x31\xae\x5c\xac\xd1\x5b\xf3\x30\
-\xf4\x26\x52\xf9\xa0\xf6\x9a\xd7\x83\x12\x3d\xbd\xb9\x5e\x20\x87\
-\x43\xd7\x72\x74\xe0\xa5\x5e\x3e\x32\x7e\x31\x82\x42\x66\x81\xd6\
-\x51\xc2\x48\x5d\x2f\xb2\x80\x1f\x18\xac\x6c\xb8\x4c\xcc\xb4\xb9\
-\xf3\xf1\x32\x93\xf3\xbb\xb8\x7e\xc8\xd9\x0b\xe7\xf9\xa3\xff\xeb\
-\x8f\xb9\x72\xf5\xba\xd0\x07\x87\x8e\x21\xa5\x5c\x69\xb7\x1a\x3f\
-\x51\x49\xf2\xae\xef\x05\xac\x2c\x4e\xb3\xb4\xd2\xc0\xd4\x02\x6a\
-\x25\x0d\x8d\x12\xc7\xfb\x24\xb5\x62\x0e\x21\x3a\xd9\x8a\xd8\x5e\
-\x65\x25\x0e\x95\xbc\x9f\x80\x00\x5f\x04\x4a\x07\x77\x15\x47\x06\
-\xb2\x52\x24\xe8\x5a\x82\xa1\x4b\x0c\x03\x74\x2d\xfd\x5c\x92\x55\
-\xa9\x71\xf6\xb1\x26\xc0\xd0\xd3\x59\x8b\x26\x0f\x97\xaa\xea\x93\
-\xb9\x53\xf1\x92\x60\x7c\x92\xe5\x3e\x9d\x0c\xc5\xa1\xff\xe4\xf0\
-\xec\x25\x95\xfc\x13\x91\x23\x4a\x6c\x9c\x40\xb2\xba\x11\xf0\x64\
-\xaa\xc9\xa3\xf1\x06\x73\x4f\x77\x08\x22\x83\xd1\x8b\xa3\x7c\xf7\
-\xed\x3f\xe4\xbb\xdf\xfb\xdf\xc4\xa5\xcb\xd7\xd2\x94\x55\xa9\xd6\
-\xb8\xf6\xc6\xcd\x3f\xb5\xed\xdc\xcf\x25\xc9\xff\xb8\x77\xc7\x60\
-\x76\x72\x9c\x99\x85\x5d\x74\xf9\x1c\xaf\x5d\x41\x5e\xef\xc3\x32\
-\x72\x08\x4b\x21\x65\x56\x77\x28\x81\x14\x21\xf2\xf0\x1d\xf5\x29\
-\xa7\x9c\xee\x55\x29\xbf\x3d\x18\x02\x81\xcc\xcc\x09\x3a\x0a\x03\
-\x84\x89\x90\x16\x71\x24\x68\xb6\x1d\x56\x57\x3d\xa6\xa7\x96\x59\
-\x98\xdf\xc1\x75\x3d\x74\x1d\x2c\x0b\x34\x99\xa6\xac\xb5\xd5\x16\
-\x4f\x9e\x4c\x61\x69\x5d\x98\xe7\x6b\xe4\xbb\x75\x24\x26\x60\xa5\
-\x15\x1c\x12\x94\x3c\x28\xfb\x7e\xc3\x9d\xa1\xd4\xcb\xee\x2b\x91\
-\x79\x8d\xd2\x4d\xdf\xf4\x63\xb9\xdf\x59\x25\xd9\x30\x2c\x26\x4f\
-\x22\xcb\xb8\xbe\xc9\xca\x66\xc8\x93\x69\x8f\x5f\x7e\x58\x67\x72\
-\xae\xcd\x6e\xcb\xe7\xd4\xe8\x59\xfe\xf8\xdf\xff\x47\xbe\xfb\xf6\
-\xf7\xc5\xf0\xf0\xc8\x41\xa7\x6e\xdb\x36\xf6\xc0\x20\xa0\x7e\x1e\
-\x78\xce\xcf\x05\xea\x9d\x14\x29\x33\x3c\x7d\xde\x44\xa8\x5d\x8a\
-\x05\x1b\x28\x71\xbc\xdf\xa0\x5a\x2c\x60\x08\x95\xcd\xbc\xf7\x0e\
-\xb5\xd8\x23\x67\x5e\x0a\x72\xf1\x1b\xca\xac\xc3\x3d\xb1\x40\x64\
-\xa3\x56\x99\xc2\x9d\x7c\x3a\xe1\x0b\x74\xb6\xea\x11\x0b\xcf\x3d\
-\x26\xa6\x1b\xcc\xcd\x6d\x53\xdf\x71\xa9\x14\x35\x7a\xba\xf2\x54\
-\x2a\x16\x71\xac\xd8\x5c\x77\xf0\xfd\x80\x85\xf9\x4d\x2c\xcd\xc7\
-\xd6\x63\x54\xa7\x40\x57\xc5\xa0\x60\xe7\xb3\x7e\x27\xd9\xe7\xad\
-\xcf\x50\x23\xfe\x76\xd6\xc8\x46\xc4\xa0\xa5\xc1\x10\x16\x09\x05\
-\xc2\xa4\x80\x13\x58\x2c\x6f\x28\xc6\xa7\x1d\xee\x8f\x37\x99\x9a\
-\xaf\xd3\x0e\x6c\x4e\x8f\x5e\xe6\x3b\x6f\x7f\x9f\xef\xfe\xc1\xbf\
-\x12\x97\x2e\x5f\x7b\xb9\x74\x52\xa9\xd6\xb8\x7a\xfd\x5b\xff\x26\
-\x97\xcb\xbd\x2b\x44\xfc\xe3\xfb\x77\x74\x66\x27\x27\x98\x9a\xdf\
-\x25\x51\xab\xb4\x5a\x1e\xdf\xb9\xd9\x8f\x69\x16\xc8\x9b\x69\xc3\
-\x16\x2b\x90\x4a\x65\x52\x82\xda\x37\xa9\xed\xe5\x56\xa1\xf6\x78\
-\x41\xbc\x34\x28\x07\xce\x90\x3d\x31\x45\xcb\xae\x51\x47\x89\x1c\
-\xc8\x0a\xa1\x6f\xb1\x55\x4f\x98\x59\x70\xf8\xf5\xdd\x1d\x26\x67\
-\x5a\xac\xad\xfb\x98\xa6\xc6\xe8\x99\x1c\x27\x4e\x54\x19\x1a\xec\
-\xc3\x71\x23\x1e\x3c\x78\xc6\xf2\xf3\x06\x6b\x6b\x11\xa1\xd7\x22\
-\xf4\x43\x5a\xad\x1a\x57\xc7\x06\x31\xfb\x2b\x08\xa9\xb2\xd7\x43\
-\x26\xb7\xa8\x83\x56\xf5\x85\x3a\x56\x7d\x4a\x1d\x22\x0e\x73\x4e\
-\x36\xa1\x54\x59\x73\x99\x60\x92\x88\x0c\x19\x81\xcd\xf3\x0d\x78\
-\x3c\xe5\xf2\xcb\x8f\x76\x99\x9c\x6b\xb1\xdd\x8c\x38\x35\x7a\x81\
-\x7f\xf7\x1f\xfe\x13\xdf\xfd\x83\xef\x8b\xe1\x13\x27\x3f\x5d\xed\
-\xb5\xed\x1c\xf6\x40\x0e\x50\x3f\xf1\xfd\xf6\x8f\x80\x6f\x39\x4e\
-\x87\x95\xc5\x59\x16\x9e\x37\x80\x06\xa5\x52\x1e\x21\x4a\x1c\xef\
-\x33\xa9\x16\x05\xfa\x27\x2c\x3a\xf1\x27\xef\x37\xf5\xe9\xe9\x49\
-\x1d\x19\x2a\xe9\x69\xba\x12\x12\x84\x45\x14\xdb\x78\xbe\xce\xc6\
-\x76\xcc\xec\x33\x8f\xf1\xc9\x26\x4f\x26\xeb\x6c\x6c\x86\x98\xa6\
-\xc1\xf1\xa1\x1c\x97\x2f\x96\x38\x77\xb6\x8b\x81\xbe\x1a\x6d\xa7\
-\x03\x71\x1b\x4b\x57\x3c\x7b\xea\x52\xaf\x07\xcc\xcc\x06\x24\x09\
-\x58\x66\x91\x24\x29\xd2\x5b\x33\x28\xe6\xf3\x68\x82\xec\x78\x8e\
-\x38\x55\x6b\x0f\x57\x90\x9f\x29\xad\x1e\xd5\x1a\xd2\xe6\xd2\x22\
-\x91\x79\xc2\x24\x8f\x1b\x18\x2c\x6f\x26\x3c\x9e\xf6\xb8\x3f\xde\
-\x64\x62\xae\x4d\xdb\xb7\x39\x75\xfe\x02\xdf\x7d\xfb\xfb\x7c\xf7\
-\x0f\xbe\x2f\x2e\x5d\x79\xe3\xb3\xc9\xef\x95\x6a\x17\x57\xde\x78\
-\xeb\x4d\xdb\x2e\xbe\xab\x94\xfc\xf1\xfd\x3b\x16\xb3\x93\xe3\x4c\
-\x2f\xec\xa0\x89\x55\x5c\xc7\x45\xdc\xe8\xc7\x30\xf3\xe4\x0d\x95\
-\x16\x15\x2a\x41\x29\xd0\x44\xe7\xd0\x9c\x60\x2f\xd7\xf2\x1b\xe8\
-\x5e\x1c\xb8\x41\x90\x59\x3f\x60\x80\xcc\xe3\xf9\x92\xd5\x8d\x90\
-\xa9\x39\x97\x5f\xdf\x6d\x30\x33\xe7\xb0\xb9\x15\x92\xcf\x1b\x5c\
-\xbc\x58\x61\xec\x42\x85\x4b\x17\x2b\x0c\x0d\xe4\xc9\xd9\x8a\xa0\
-\xa4\x61\xe9\xc7\xe9\xae\x16\xc8\x9b\xcf\x78\xfa\xac\xc1\xce\x2e\
-\x04\x13\x1e\x51\xb8\x44\xb3\x51\xe6\xfa\xd5\x6e\x8c\xc1\x02\xa6\
-\xa1\xa3\xcb\x00\xa5\x82\xec\xfb\xeb\xd9\x94\x31\x4d\x97\x08\xf1\
-\x29\x69\xf6\x20\x10\xa9\xba\x9c\xa6\x29\x85\x45\x22\x0a\x19\x32\
-\x0c\x96\x37\x62\xc6\xa7\xbc\x14\x19\xb3\x6d\xae\x84\xe1\xd9\x00\
-\x00\x0f\xea\x49\x44\x41\x54\x76\x9a\x21\xa7\x46\xcf\xf3\xef\xfe\
-\xe4\xe5\xc8\xf8\x8d\x01\x49\x91\x72\x0c\x10\x3f\xf1\x3c\xf7\x87\
-\x28\x7e\xe0\x3a\x01\xab\x4b\xd3\xcc\x3f\x6f\x01\x0d\x0a\xc5\x3c\
-\x4a\x95\x38\xd6\x67\x52\x2d\x16\xd1\x45\x82\x2e\x04\x92\x00\x45\
-\xf4\x09\x3e\xf9\x74\x84\x64\xe5\xe1\xfe\xa8\x55\x23\x8a\x35\x7c\
-\x4f\x63\x6d\x23\x62\x62\xc6\x61\x7c\xb2\xc9\xd4\x4c\x8b\xdd\xdd\
-\x88\x52\x51\xe7\xe4\x48\x8e\xab\x63\x25\x2e\x9e\x2f\x72\xe2\x98\
-\x41\xa5\x9c\x20\x94\x4b\xde\x90\xe4\x2d\x1b\x53\x2b\x12\x07\x15\
-\x0c\x2d\x66\x7a\x36\x5d\x8f\x9e\x5f\x88\x48\x92\x18\xdb\x36\xe9\
-\xc4\x65\xfa\x7a\x6c\x8a\x05\x13\x5d\x1a\x20\x05\x89\x30\xb3\xd7\
-\xd3\xd9\x1f\x0e\xbc\x48\x76\x7b\xe2\x88\xd8\xe7\x0b\x0e\xdc\x2c\
-\x22\x9f\x71\x86\xcd\xca\x86\xe2\xf1\x54\x9b\xfb\xe3\x0d\xa6\xe6\
-\x5a\xb4\x02\x9b\x53\xa3\xe7\x33\xce\x78\x39\x32\x3e\xd3\xc4\x30\
-\xe5\x94\x37\xff\xb5\x9d\xcb\xfd\x17\x88\xff\xe6\xfe\x5d\x8d\xb9\
-\xc9\x09\x26\xe6\xeb\x24\x6a\x95\x66\xd3\xe5\x3b\x37\xfa\x31\xcc\
-\x02\x05\x33\x5d\xcc\x8f\x13\x91\xb5\x5b\x9d\x17\x6a\xca\x17\xfa\
-\x94\xc3\xe8\x50\x06\x89\xd0\x49\x84\x8e\x12\x36\x8e\x9b\xb0\xbc\
-\xda\x62\x72\xba\xc1\x47\x77\x1b\xcc\x2d\xb8\xb4\x5a\x11\xb5\xaa\
-\xce\xd5\xcb\x05\xc6\x2e\x94\xb9\x30\x5a\x60\xb0\x4f\x92\xb7\x5a\
-\x68\x49\xea\xf9\x95\x68\x48\xdd\x66\xb0\x47\x62\xbd\xd1\x4d\xad\
-\x62\x62\x5b\x6b\xcc\xce\xb7\xd9\xdc\x82\xe9\x99\x80\x20\x5c\x67\
-\x6b\x37\xe4\xfa\xb5\x21\x4e\x1c\x2f\x91\xcf\x99\x18\x52\x91\x28\
-\x93\x84\x04\x45\x94\xdd\x24\x2f\xed\x3a\xf6\x6f\x24\x32\x24\x25\
-\x99\xcf\x2b\x96\x65\x1c\xdf\x66\x79\x53\xf0\x78\xca\xe5\xd6\x21\
-\xce\x38\x39\x7a\xe1\xb7\x22\xe3\x33\x05\xe4\x10\xa7\xfc\xad\xef\
-\xb5\x7f\x84\xe0\xb2\xeb\xc6\xac\x2c\xce\x32\xff\xbc\x81\xa2\x41\
-\xb1\x98\x07\xca\x1c\xef\x4f\x91\x62\x08\x85\x8e\x00\x82\xac\x3f\
-\xd9\x9f\x11\x1e\xed\x5e\xf7\x05\x6b\x93\x44\xd8\x24\x48\xfc\x8e\
-\xc0\x71\x05\x2b\xab\x21\x93\xd3\x2d\xc6\x27\x5a\xcc\xce\x3b\x34\
-\xdb\x09\xdd\xb5\x1c\x67\xcf\xe4\xb8\x72\xa9\xc8\x85\x73\x39\x06\
-\xfb\x05\xa5\x7c\x80\x4c\xda\xa0\x42\x84\x4a\x40\x68\x68\x22\x40\
-\xcf\xdb\xe4\xec\x3c\x9a\x56\x24\x8a\xaa\x48\x4d\xd2\x49\x7c\x76\
-\x76\x23\x16\x16\x1d\xa2\x58\xc3\xb0\x4a\x44\x89\x64\x68\x40\xa3\
-\x52\x36\x90\xba\x8d\x12\x09\x09\x9d\x2c\x6d\x89\x23\x96\xd4\x83\
-\x1b\x4b\xee\x7f\x3e\x45\x47\x8e\x30\xce\xe3\xfa\x06\xcb\x1b\x09\
-\x8f\xa7\x7d\xee\x8d\x37\x99\x98\x73\x68\xf9\x36\xa7\x46\x2f\x7c\
-\x26\x64\x7c\x2e\xd7\x49\xa5\xda\xc5\xd5\xeb\xdf\xbe\x62\xe7\x4a\
-\xef\x82\xfe\xe3\xfb\x77\x2c\xe6\x32\x4e\x11\xac\xe2\xb4\x3d\xd8\
-\x47\x4a\x3a\xc6\x4c\x27\x79\x51\x56\xd6\x6a\xfb\x41\xd9\xa3\xff\
-\x44\x41\xa2\x24\x09\x36\x8a\x22\x4a\xe8\x38\xae\xcf\xc2\xe2\x16\
-\x13\x93\xbb\x7c\x7c\xbf\xc9\xe2\x92\x8b\xeb\x75\xe8\xeb\xcd\xf1\
-\xc6\xb5\x3e\x2e\x5d\x28\x31\x7a\x46\x67\xa0\x27\x21\x6f\x78\xc8\
-\xc4\xdb\x9f\xe3\xa7\x85\x85\x48\xd3\xa5\x8a\xd0\x45\x4c\x57\xc5\
-\xe6\xf2\xa5\x41\x0a\xa5\x0a\x86\xbd\xc2\xf4\x4c\x93\xa5\xe5\x84\
-\xf9\x05\x8f\x20\x5a\x66\xa7\xde\xe2\xc6\xf5\x5e\x46\x46\xba\x28\
-\x97\x4b\x28\xa9\x48\x44\x44\xa2\xf4\x8c\xa8\x41\x89\xb4\xf3\x56\
-\x62\xef\xb5\x6b\x69\xd3\xaa\x34\x94\xb0\x51\xb2\x94\x06\x63\x33\
-\xe6\xf1\x94\xcb\xfb\x1f\xed\x32\x39\xe7\xb0\xdd\x0a\x38\x3d\x3a\
-\xca\x1f\x7d\x46\x64\x7c\xae\x80\x1c\xe6\x14\xdf\xf3\xde\x11\xf0\
-\x8e\xeb\x06\xac\x2e\xce\xb0\xf0\xbc\x09\xd4\x29\x14\x73\x20\x0e\
-\xfa\x14\x1d\x52\x51\x92\x38\xe3\x08\x0d\x45\x7c\x44\x31\x4a\x1b\
-\xa8\x3c\x5e\x64\xe3\xed\x86\xac\x6f\xb8\x3c\x7e\xd2\x60\x62\xaa\
-\xce\xb3\x25\x0f\xdf\x4f\xe8\xeb\xb3\x39\x77\xb6\xcc\x95\x4b\x15\
-\x46\xcf\xe4\xe9\xef\x8a\x29\xe6\x3c\x64\x12\xa4\xe3\x5f\xa2\x03\
-\x63\x45\x36\xc7\x97\xd9\x9f\xf3\x96\x86\x69\x17\x10\x9a\x46\x14\
-\x57\x91\x52\x10\x46\x1e\xeb\x1b\x11\xcf\x97\x5b\x74\xe2\x18\xd3\
-\x36\x88\x92\x1c\xc3\x27\x34\xa2\xd8\x20\x56\x39\x94\xb4\x8f\x8c\
-\x9b\xf6\x36\xb2\x12\x21\xd3\x82\x43\x01\xd2\x24\x8c\x73\xb8\x7e\
-\x8e\x95\xcd\x84\xc7\x53\x2d\xee\x8f\x37\x98\x9c\x6b\x65\xc8\x18\
-\xfd\x5c\xc8\xf8\x42\xce\xc5\xc3\x7d\x0a\x1c\xea\x53\x16\x76\x81\
-\x55\xda\x8e\xcb\x77\x6f\xf6\x63\x9a\x45\xf2\x86\x86\x21\x7d\x94\
-\xf2\x0f\x1a\xbd\x7d\x72\xcc\xf4\x5d\xa1\x13\x8b\x22\x75\xc7\x64\
-\x6d\x65\x83\xd9\xb9\x75\x1e\x3c\xdc\x65\x6d\xcd\x23\x8e\x63\x86\
-\x8e\xd9\xdc\x78\xa3\x97\x8b\xe7\xab\x9c\x3a\x91\xa3\xa7\xa6\xb0\
-\x0c\x1f\x12\x37\x4d\x53\x99\x64\xf3\x49\x71\x29\x3d\x41\x48\x08\
-\x17\x29\x24\x95\xb2\xc9\x85\xd1\x1e\xf2\x85\x02\xa6\xb5\xc5\xe4\
-\x54\x8b\xd9\x85\x80\xc5\xe7\x01\x41\x67\x83\xed\x86\xce\xcd\xb8\
-\x9f\x62\x39\x47\x94\x14\x10\x7a\x01\xa4\x9e\x69\x9f\x32\x9d\x44\
-\xaa\xb4\x12\x4b\xc7\x86\x3a\x4a\x64\x69\x6a\x4b\xf0\x78\xda\xe7\
-\xd6\x47\x75\x26\xe7\x9a\x07\x7d\xc6\xe7\x44\xc6\x17\x0a\xc8\xe1\
-\x3e\xc5\xf3\x5a\x7f\xa6\xe0\xb2\xe3\x76\x58\xcd\x38\x05\x1a\x94\
-\x4b\x79\x04\x92\xa1\x3e\x93\x72\x41\x43\x13\x12\x21\x24\x89\x30\
-\xb3\xfc\x7c\x10\x10\x37\x88\x59\xdf\xf6\xf0\xc3\x98\xd9\xd9\x6d\
-\x16\xe6\x77\x59\x5e\xf5\x48\x12\x8d\x63\x43\x55\x2e\x8c\x56\xb9\
-\x7c\xa9\x8b\x33\x27\x73\x54\xcb\x90\x33\x43\x64\xb2\xd7\x71\xea\
-\x47\x46\xac\x2a\xeb\xe4\xf6\x08\x17\xa1\x65\x15\x51\x07\xdb\x34\
-\x31\xbb\x0b\x48\xbd\x40\x9c\x18\x08\xad\x88\x1f\xb5\x78\xbe\xe2\
-\xb2\xba\xee\x11\x25\x3b\xe8\xf6\x3a\x3d\xbd\x1d\xfc\x00\x1c\x2f\
-\x21\xec\x28\x2c\x5d\x64\x3d\xca\x9e\x93\xc5\x04\x01\x9d\x58\xe2\
-\x45\x46\x8a\x8c\x69\x3f\x43\x46\xfb\x0b\x71\xc6\x97\xe2\x7e\x3f\
-\xca\x29\x47\xfb\x14\x29\x56\x69\xb7\x3d\xde\xba\x3e\xc8\xc8\xf1\
-\x3c\x39\x53\x47\x93\x82\x04\x3b\xcd\xcf\x22\x2d\x6f\x3b\x0a\x76\
-\x1b\x2e\xe3\x13\x8b\x68\x52\x32\x3f\xbf\x45\xa3\xe1\x60\x18\x8a\
-\x91\x63\x15\xbe\x75\xe3\x3c\x17\x47\x7b\x38\x3e\x28\xa8\x54\x22\
-\x74\xcd\x45\xa9\x0e\x08\x33\x43\x99\x45\x42\x9c\x89\xe7\xea\x88\
-\x48\xa3\xc4\x0b\x6e\x77\x0c\x40\xa3\x50\xc8\x73\xfa\x4c\x2f\x56\
-\x3e\xc4\xcc\x6d\x53\x9c\xd8\x60\x7c\x72\x95\xe7\xab\x2d\xdc\x70\
-\x8a\x6a\xad\x42\xb1\x5c\xc5\x69\x85\xb8\x41\x87\xbc\x25\x89\xd5\
-\x9e\x2e\x65\x13\x93\x43\x08\x1d\x37\x4c\x58\xdd\xf4\x78\x3c\xd5\
-\xe2\xd6\x87\xbb\x4c\xce\xb5\xd9\x6e\x06\x9c\x3a\x3f\xfa\x85\x91\
-\xf1\x3b\x05\xe4\x28\xa7\xb8\x3f\x04\x7e\x70\x98\x53\x94\xaa\x93\
-\xcf\xe7\x49\x94\x64\xa8\xdf\xa2\x54\xb2\x10\xd2\x42\x89\x08\x25\
-\x74\x62\x25\x88\x3a\x0a\xbf\x11\x30\x33\xbf\x05\x0a\xb6\x36\x3d\
-\x0c\x43\x63\xe8\x78\x85\xd3\x67\x8f\x73\xfa\xcc\x09\x06\x87\x2a\
-\xe4\x72\x1e\x89\x72\x08\xc2\x0e\x11\x09\xe9\xe4\x3b\xde\xdf\x4d\
-\xdf\x93\xfd\xf7\x10\x22\xb2\x80\x70\x78\x39\x07\x13\x85\x89\x12\
-\x36\xb6\x5d\xa3\xa7\x57\x70\x3a\xcc\xe3\x47\x26\x5b\x8d\x18\x77\
-\x71\x8b\x95\xf5\x26\xeb\x5b\x2e\xd5\xae\x90\x24\x06\xd7\x0b\x89\
-\x4b\x22\x55\x6d\xb1\x49\x44\x81\x30\xc9\xe1\x07\x82\xd5\x0d\x97\
-\x27\xd3\x0e\x0f\xc6\x1b\x4c\xce\x35\xd3\x3e\xe3\xfc\xe8\x6f\xec\
-\xc0\xbf\x92\x0d\xaa\x83\x3e\x25\xff\xae\x10\x49\xca\x29\x13\x13\
-\x4c\xce\xef\x12\xab\x15\x9a\xed\x80\xb7\x6e\x0e\x33\x62\x15\xb0\
-\xac\x3c\x4a\x74\x50\xc2\x22\x4e\x34\xbc\x20\xc6\x71\x62\x5c\xd7\
-\xc5\x34\x05\x86\x9e\xd0\x3f\xd8\xc5\xd8\xd8\x45\x46\xcf\x0e\x53\
-\x28\x56\x09\x23\x49\xb3\x13\x20\xd1\x00\x3b\x1b\x91\x25\x07\x13\
-\xcb\x6c\xa8\xa5\x0e\x89\x4f\xfb\xfb\x21\x52\x1c\x72\xbf\xef\xed\
-\x85\xe8\x28\x12\xa2\xd8\xa2\x50\xea\xe5\xf8\x70\x8e\xa6\x67\x81\
-\x9e\x67\x72\x7a\x91\x9d\x9d\x36\x4d\x77\x1b\x14\x74\x82\x30\x43\
-\x85\x49\x2c\x0a\x24\xb2\x82\x13\x1a\x69\x30\xa6\x3c\x3e\xf8\x70\
-\x97\xa9\xf9\x7a\xca\x19\xe7\x2f\xfc\xce\xc8\xf8\x52\x02\x72\x98\
-\x53\x02\xbf\xfd\x23\x10\xdf\x72\x9c\x98\x95\x67\x33\x2c\x3c\x6f\
-\xa0\xd8\xa5\x50\x2a\xa3\x44\x81\x81\x81\x12\x61\x62\xa7\x29\x40\
-\x49\xe2\x38\xc1\x0f\xd2\xa7\x65\x0a\x2a\xe5\x54\x72\x8f\x42\x45\
-\xa3\xee\x13\x7a\x9b\xe8\x5a\x0c\x49\x66\xdd\xcc\x54\xda\x03\x67\
-\xcb\x51\x4f\xd4\xc1\x68\x58\x7c\x42\xe2\x50\xfb\xf2\x8c\x8e\xa2\
-\x99\x5a\x4c\x35\x9b\x96\xdb\x21\x8c\x3a\x00\xc4\x31\xf8\x41\x4c\
-\xec\x79\xe9\x94\x52\x90\x06\x52\xd8\x44\x89\x4d\xcb\x33\x70\xbc\
-\x84\x27\xd3\x2d\x1e\x8c\xd7\x99\x9c\xcf\xb4\xa9\xdf\x91\x33\x5e\
-\xc9\x16\xee\x9e\xf6\x65\xd9\xc5\x77\x95\xd2\x7e\x7c\xef\xb6\xc5\
-\xec\xe4\x63\xa6\x17\x76\x11\xf2\x19\x6d\x37\xe6\xe6\xcd\x0a\x61\
-\xa4\x13\x27\xda\xc1\x9e\x53\x26\xb0\xaa\x44\xe1\xbb\x09\xab\xcb\
-\x75\x22\x6f\x9c\x89\xdc\x1c\xba\x14\x48\xa1\x10\xaa\x93\x36\x7d\
-\xfb\x46\x35\xf5\x9b\x15\xcb\x43\xf1\x11\x42\x20\xc4\xde\xc9\x0e\
-\x07\xe5\xab\x12\xa9\xf4\x11\x26\x0a\x2f\x08\x69\xb4\x7d\xdc\xb6\
-\x8b\xfc\x44\x4f\xae\x81\xcc\x13\x44\x16\xab\x5b\x21\xcb\x2b\x2d\
-\x7e\xf9\xd1\x32\x53\xb3\xdb\xec\x34\x7d\x4e\x8f\x5e\xfe\x54\xd5\
-\xf6\x6b\x0d\xc8\x8b\x7d\x0a\xf0\x8e\xeb\x05\xac\x2e\x4e\xf3\x74\
-\xa9\x89\x62\x03\xbb\xb8\x8e\x6d\x1b\xc4\x89\xa0\x54\xb4\xe9\xee\
-\x12\x58\x66\xaa\x79\x49\x01\x9a\x50\x18\xd2\xc7\x6b\xfb\x84\xce\
-\xc1\xec\x48\xbe\x64\x96\xf2\x79\x7e\xd2\xdf\x9e\xc1\x4d\xa9\xa3\
-\xe2\x4d\xa2\x32\xd9\x5f\xa6\x7e\xed\x6a\x11\x0a\xb9\x74\xfd\x0d\
-\x24\x42\x4a\xca\x65\x93\x04\x8d\xcd\x9d\x0e\x8d\x56\x8b\xf9\x67\
-\x3b\x4c\xce\xed\xd0\x0e\x74\x4e\x9f\xbf\xfc\xa5\x70\xc6\x2b\x09\
-\xc8\x8b\x7d\x8a\x9d\xcb\xff\x50\x90\xfc\xf4\xde\x1d\x83\x99\x89\
-\x71\x26\xe7\x5a\x44\x6a\x92\xde\xee\x1c\xa6\x21\x19\x1a\xac\x50\
-\xcc\xb7\x08\x03\x01\x99\xcb\x44\xaa\x03\x91\x45\x1e\xf6\x16\x7c\
-\x09\x01\xd9\x6f\x46\x5f\x3c\x60\x20\x9b\xc5\x24\x7b\xca\x41\x26\
-\x87\x20\x0c\x84\x66\x52\xae\xd8\x84\x71\xc2\xfc\x62\x83\xa9\x99\
-\x75\x96\x56\xea\x6c\x37\xbd\x14\x19\x7f\xf2\xe5\x22\xe3\x95\x04\
-\xe4\x10\xa7\xfc\x2c\xf0\xda\x3f\x52\xf0\xb6\xe3\x44\x3c\x5f\x9c\
-\xe5\xe9\x52\x8b\x7a\xa3\xcd\xf0\x50\x85\x9e\xae\x1c\x7d\xdd\x7d\
-\x58\xa6\x42\x8a\x30\xb5\xf6\xab\x4e\xba\x8c\xb3\x67\x70\x16\x87\
-\xdb\xc8\x2f\x66\x68\xe1\x45\x93\xc5\xfe\xe7\x0e\x79\x10\x33\x79\
-\x44\x09\x89\x12\x3a\x08\x9b\x4e\x62\x10\x74\x24\x7e\x20\xd9\xd9\
-\xf5\x58\xdd\x70\x99\x59\xd8\x21\x4a\x0c\x4e\x8f\xbe\x1a\x64\xbc\
-\x92\x80\x1c\xe1\x94\xeb\x6f\xfe\xa1\x95\x2b\xfe\x50\x29\xf9\xd3\
-\x7b\x77\x2c\xa6\x27\xc7\x59\x5d\xdb\x41\x97\x4d\x2a\x45\x9b\xd3\
-\x97\x4e\x73\x7c\xa8\x8a\x65\x44\x68\x22\x40\x28\x0f\xa9\x42\x84\
-\x8a\xb3\x1d\x12\xb5\xef\x8a\xfc\x24\x5f\x08\x78\x29\x9f\x88\x97\
-\xd9\x25\x0e\x8d\x64\xb2\xc1\x92\x12\x87\xac\xd1\x69\xbf\x12\x67\
-\x13\x4a\x25\x8b\x38\xbe\x60\x63\xcb\x63\x66\x7e\x9b\x27\xd3\x4b\
-\x2c\x2c\x6d\xd3\x72\x03\xce\x5e\x38\xc7\x1f\xff\xc9\x7f\xe2\x7b\
-\xaf\x00\x19\xaf\x34\x20\x87\x38\xe5\x67\x59\x9f\xf2\x8e\xe3\x06\
-\xac\x2c\xce\xb2\xdb\x6c\xb3\xbe\xe9\xd1\x6c\x45\x80\x46\xb5\x9a\
-\xa7\x5c\x48\xd0\x85\x8b\x26\x7c\xa4\x0a\x90\x44\x68\x47\x0c\x79\
-\x87\x15\xb0\x97\xbf\xe9\x9f\x1a\x2c\xf1\x49\x63\xab\x22\x95\x43\
-\xd2\x2e\x5c\x23\x11\x26\xb1\x48\x55\x5b\x2f\xca\x11\x6e\x86\xb4\
-\x1d\x97\x8d\x2d\x9f\xd5\x8d\x16\x51\x62\x70\xf6\xc2\x39\xbe\xf7\
-\x0a\x91\xf1\x4a\x03\xf2\x09\x4e\xb1\xf3\x3f\x04\xf5\xd3\x7b\x77\
-\x4c\x66\x26\x9f\x30\x31\xbb\x4b\x92\x3c\xa2\x5e\xdf\xe0\xdb\x37\
-\x46\x30\x87\x8b\xe4\xad\x10\x5d\xa6\xbb\x22\x42\xa5\xc7\xf6\x49\
-\x71\x28\x28\x7b\x01\xf9\x82\x06\x3d\x21\xc4\xd1\xa5\x01\xa5\x01\
-\x06\x02\x03\x21\xf3\x48\x74\x02\xdf\x67\x75\xd3\x63\x7c\x6a\x97\
-\x0f\x3e\x5a\x64\x6a\x6e\x93\x9d\xa6\xc3\xe9\xd1\x31\xfe\x38\xe3\
-\x8c\x13\xaf\x08\x19\x5f\x49\x40\x0e\x38\x85\x9f\xf9\xbe\xf3\x2e\
-\xf0\x03\xc7\x09\x59\x5e\x9c\x61\x61\xb1\x01\x2a\xa4\x54\xd0\x91\
-\x74\x71\xac\x5f\xa7\x5a\xec\x64\xea\x6d\x98\x6e\x29\xa9\xec\x8c\
-\x13\x11\xa7\xf6\xcc\x43\xe6\x89\xcf\x4f\x2a\x22\xf3\x7a\xa5\xd2\
-\x39\x98\x24\x58\x08\x21\x88\x3b\x1d\xdc\xd0\x67\x6d\xc3\x63\x62\
-\xda\xe1\xe1\xf8\x36\x93\x33\xab\x38\x81\xc6\xe9\x73\x63\x7c\xef\
-\xed\xef\xf3\xbd\x57\x8c\x8c\xaf\x24\x20\x9f\xe8\xe8\xed\xc2\x0f\
-\x41\xfc\xf4\xde\x9d\xb4\x4f\x99\x5d\xa8\xa3\x89\x05\x3c\xa7\x81\
-\xbc\x31\x88\x6d\x58\x14\x4c\x0d\x21\x65\xc6\x1f\x51\x6a\xbe\x56\
-\x9d\x43\x9e\xe2\x17\x88\x7e\x3f\x8b\x89\x7d\x17\xfa\xcb\x46\xc5\
-\x64\x5d\xbb\xc8\xa4\x14\x81\x96\xf6\x29\xd2\x24\x08\x04\x6b\x9b\
-\x2d\x26\xa6\xdb\xfc\xea\xc3\x6d\x26\xe7\x9a\xd4\x9b\x1e\xa7\xcf\
-\x5f\xe6\x8f\xff\xc3\xab\xa9\xa6\xbe\xd6\x80\x1c\x45\x8a\xfb\x43\
-\x01\xef\x78\x6e\xda\xa7\x3c\x5b\x6e\x22\x45\x87\x52\xd1\x40\x50\
-\x61\xb8\x4f\xa3\x5a\x34\x11\xc2\xc8\x0e\x09\xc8\xcc\xd7\x87\xf6\
-\x47\x0e\xe7\x2d\xf1\x1b\x9c\x5f\xea\xc8\x3c\x3c\x6d\x06\x0f\xec\
-\x9e\x3a\x9d\xc4\xc0\x0d\x24\x2b\x1b\x11\xe3\xd3\x4d\x1e\x8c\xd7\
-\x99\x9a\xdb\xc5\x09\x2c\xce\x9c\xbf\xfc\xa5\x76\xe0\xaf\x55\x40\
-\x3e\xc9\x29\xd9\x3c\xe5\xae\xce\xdc\xe4\x93\xcc\xf7\xb5\x4c\xbb\
-\xe5\x22\x6f\x0c\x62\x99\x79\x84\xa9\x90\x1a\xa8\x24\x41\xa8\xce\
-\x21\xb3\x73\x56\x7d\x65\x68\x10\x87\xcb\xda\x7d\xbb\x94\xd8\xb7\
-\x23\x28\x71\xd8\x12\x9a\xcd\xc0\xb1\x49\x64\x11\xd7\xcf\xb1\xbc\
-\xa9\x18\x9f\x76\xb9\xf5\xe1\x36\x13\xb3\x4d\xb6\x9b\x21\xa7\xcf\
-\x9f\xff\xd2\x3b\xf0\xd7\x32\x20\x47\x7d\x5f\xce\xbb\x42\xf0\xb6\
-\xe7\x76\x58\x59\x4c\xb5\x2f\xc1\x2e\xe5\x62\x1e\x41\x39\xe3\x94\
-\x3c\x86\xe8\xc0\x21\x72\x3f\x72\xbe\x89\x38\x4c\xf2\x9f\x3c\xef\
-\xe4\x00\x21\x07\x67\x9d\x24\x22\x47\x18\xdb\xb8\xbe\x9e\x8e\x5d\
-\xa7\x7d\xee\x65\x93\xbe\x76\x60\x71\xfa\xfc\xf9\xaf\x05\x19\x7b\
-\x8f\xaf\xe5\xa7\x23\xe8\xba\x41\xb5\xd6\xf5\x93\x62\xb1\xb4\xa8\
-\x50\xef\x84\x51\xc4\xe6\x66\x93\x9d\xed\x16\x9e\xeb\x11\x47\x1d\
-\xca\xe5\x3c\x85\x82\x8d\xa6\xa5\x86\x69\xb5\x57\x6d\x09\x75\xe4\
-\x34\xb9\x7d\x6b\xdb\xde\x76\x96\x38\xe4\x40\x17\x7b\xe5\xad\x91\
-\x1a\x29\x44\x9e\x44\x94\x69\xfb\x36\x2b\x9b\x31\xe3\xd3\x6d\xde\
-\xff\x70\x9b\x87\x13\x75\xb6\x9b\x01\x27\xce\xa4\xc8\xf8\xdf\xff\
-\x8f\x7f\x23\x86\x4f\x9c\xfc\x97\xf3\x03\x5d\x8e\x68\x5f\xbe\xf7\
-\x0e\xa8\x77\x1c\xc7\x67\xf5\xd9\x34\x0b\x4b\x2d\x50\xe9\x8c\x5e\
-\x1d\xf1\x12\x1f\xb8\xed\x0f\xb0\x10\x67\xd8\x50\xfb\xc4\x7e\x38\
-\x4c\xfb\x4e\xf4\xec\xe0\x99\x30\x2e\xe0\x84\x36\xcb\x1b\x09\xe3\
-\x33\x2e\xf7\xc7\x9b\x5f\xfa\x3c\xe3\x1b\x89\x90\x03\xa4\xe8\x54\
-\xaa\x5d\x3f\x2b\x14\x8b\x8b\x4a\x85\xef\x84\x61\xc0\xe6\x66\x93\
-\xed\x9d\x36\x8e\xeb\xd3\xe9\x74\x28\x97\x0b\x14\x8b\xb9\x0c\x29\
-\x22\xfd\x99\x52\x6a\x4f\x5a\x51\x2f\x2c\xd5\xa4\x3f\x55\x41\x09\
-\x79\xe0\x46\x14\x7b\x5e\xdb\x0a\xed\x20\xcf\xf2\x06\x3c\x9a\xf6\
-\xb8\xf5\xd1\x0e\x0f\x26\xd2\x19\xf8\x89\xb3\xa9\xa3\xf0\x5f\x7f\
-\x8d\xc8\xf8\x5a\x11\xf2\x52\x4e\xf1\x5a\x7f\x06\x5c\x76\xbd\xd4\
-\xf7\xb5\xb0\xdc\x00\x71\xd4\x4b\x5c\x29\x92\x1e\x27\x23\x0e\x94\
-\xe0\xc3\x07\xd0\x88\x43\x67\x9d\xec\x7b\x6d\xc9\x1d\x78\x6d\x37\
-\x5e\xf0\xda\x06\xa9\xd7\xf6\x3b\xaf\x01\x32\x5e\x8b\x80\x1c\xd6\
-\xbe\x5e\xf4\x7d\xbd\xe8\x25\xe6\x46\x3f\x86\x91\xba\xee\x85\x14\
-\xfb\xbb\x1b\x72\x6f\x61\x48\x24\xfb\x06\x87\x04\x83\x44\x59\xfb\
-\x2e\x74\x27\x30\x58\xd9\x88\x79\x3c\xed\x71\xeb\xa3\x5d\x26\xe6\
-\x32\xaf\xed\xf9\xf3\xaf\x4c\xb5\xfd\x46\x07\xe4\xa5\xf3\x94\x23\
-\xbe\xaf\x06\xf9\x42\xea\x25\x3e\xde\x77\x74\x3f\x45\x29\x99\xad\
-\x53\xa7\x4d\xe3\x81\xf1\x39\xf3\xda\xfa\x36\xcb\x9b\x09\xe3\xd3\
-\xde\xbe\x6f\x2a\x45\xc6\xf9\xd7\x82\x33\x5e\x2b\x0e\x79\x19\xa7\
-\x54\x6b\x5d\x3f\x2b\x16\x8b\x8b\x10\xbd\x13\x46\x01\x1b\x1b\x2d\
-\xb6\x76\x5a\x29\xa7\x44\x29\xa7\x14\x8a\x36\x9a\x2e\x91\x32\x5d\
-\x09\x52\x82\x4c\xc1\xd5\x49\x84\x41\x22\xf2\x28\x59\xa1\xe5\xe7\
-\x78\xbe\x21\x78\x9c\xf5\x19\xaf\x23\x67\xbc\x96\x08\x79\x79\x9f\
-\x72\x68\x3f\xe5\xd9\x2c\x0b\x4b\x0d\x50\x75\x4a\xc5\x1c\x88\x32\
-\xc7\xfa\xd3\xfd\x14\x43\x80\x44\xcf\xec\xa4\xe9\xe1\x33\x61\x6c\
-\xe3\xf9\x26\xcb\x1b\x8a\xc7\x53\x2e\xf7\x9f\x1c\xe5\x8c\xd7\x11\
-\x19\xaf\x65\x40\x8e\xcc\x53\xf6\x67\xf4\xf2\xc7\xf7\x6f\xbf\xe0\
-\xfb\x72\x7c\xbe\x7d\x63\x00\xc3\x28\x52\xb0\x34\x0c\x19\xec\xaf\
-\x11\x08\x99\xc7\xf3\x35\x56\x36\x42\x9e\x4c\x3b\xe9\x7e\xc6\x7c\
-\x9b\x9d\xd6\x67\xdb\xcf\xf8\x7d\x40\x7e\x2b\xa7\x64\xfb\x29\x6e\
-\xc0\xea\xd2\x0c\x0b\xcb\x4d\x10\x75\xf2\xc5\x3c\x09\x55\x8e\xf7\
-\xdb\x54\x8a\x39\xa4\x48\xd2\x3d\x70\x5f\x67\x75\x33\xcc\x38\xa3\
-\xc9\xd4\x7c\xea\xb5\x3d\x3d\x7a\xfe\xb5\xaa\xa6\xbe\x11\x1c\xf2\
-\x29\x9c\xf2\x7f\x17\x4a\xc5\x45\xa5\x3a\xef\x84\x51\xc8\xc6\x66\
-\x93\xad\x9d\x16\x6d\xd7\x27\x8a\x12\xca\xe5\x0a\xf9\x62\x0d\x69\
-\x54\x70\x43\x9b\x95\x8d\x84\xc7\x53\x6d\x6e\x7d\xb4\xc9\xc3\xc9\
-\xd4\x37\x35\x72\xe6\x3c\x7f\xf4\x9a\x72\xc6\x37\x02\x21\x2f\xef\
-\x53\x9c\x77\x11\xbc\xed\xba\x1d\x96\x17\x67\x98\x5f\x6a\x90\xa8\
-\xd4\xf7\x15\x26\x36\x5d\x35\x03\xc7\x81\x89\x69\x87\x47\x4f\xd2\
-\xd5\xe3\x76\xf0\xe5\xfb\xa6\xfe\x45\x07\xe4\x68\x9f\xf2\xe6\x1f\
-\xe6\x72\xc5\x1f\x0a\xa1\xff\xf4\xe3\xdb\x36\xd3\x13\x8f\x98\xca\
-\x7c\x5f\x6b\x9b\x2d\x4e\x0c\x0f\xd2\x76\x14\x77\x3e\x5e\x66\xee\
-\xe9\x0e\xbb\x2d\x9f\xd3\xe7\x2f\xbf\xf6\x9c\xf1\x8d\x0c\xc8\x91\
-\x19\xbd\xef\xff\x40\x29\xde\x6d\x3b\x01\xcb\x8b\xd3\x2c\x3c\x6f\
-\x50\x6f\x6d\xb2\xb6\x2d\xf1\x03\x98\x98\xdb\x21\xec\xe8\xaf\xdc\
-\x1d\xf2\x2f\x3a\x20\x47\xab\xaf\x1b\x7f\x6a\xd9\xf6\x3f\x2a\x95\
-\xfc\xf4\xe3\x3b\x06\xd3\x53\xe3\xac\xcf\xef\xb0\xb8\xba\x8e\x22\
-\x35\x49\x8f\x5e\x38\x97\xcd\x33\xfe\xd5\x37\x06\x19\xdf\xc8\x80\
-\xa4\x27\x4e\x0c\x01\xfc\xcc\xf7\x9c\x77\x95\x10\x3f\x70\xbc\x18\
-\x2f\x9c\xa5\xd1\x76\xc8\xe7\x6d\xce\x5e\xbc\xc0\x77\xdf\x7e\x3b\
-\x43\xc6\x35\xbe\x69\x0f\x9d\x6f\xe0\xe3\xc0\x75\x5f\xfa\x81\x90\
-\xd6\x7b\xe5\x6a\x8d\xf9\xb9\x79\xfa\x07\x07\xf8\xb7\xff\xe7\xbf\
-\xe5\xdb\xdf\xf9\xae\x18\x3e\x31\xf2\x4d\xbc\xb4\x6f\x66\x40\xf6\
-\xaa\xaf\x20\x08\xff\x71\x71\x71\x89\x8d\x8d\x0d\x36\xb7\xb6\xe9\
-\xe9\xed\xe7\xca\xb5\x1b\xdf\x48\x64\xec\x3d\xfe\x3f\x4c\xf7\xde\
-\x8c\xf1\xf7\x7a\x34\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x02\x12\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0\x77\x3d\xf8\
-\x00\x00\x01\xd9\x49\x44\x41\x54\x78\x5e\xb5\x94\x3b\x4b\xc3\x50\
-\x18\x86\x4f\xd2\x58\xd3\xb4\x4d\xab\x62\x2a\xb5\x8e\x15\x7f\x80\
-\x22\x2e\x3a\x28\x6e\x22\x28\x88\x9b\x8e\x52\xb0\x45\x70\x72\xd4\
-\x3a\x48\x1d\x14\x05\x17\x41\xfd\x13\xd5\xfe\x06\x41\xdd\x15\x07\
-\x27\x71\xf0\xda\x7a\x01\x31\x9e\x37\x4d\x7a\xf9\x62\xb0\xe9\xe5\
-\x85\x07\x4e\xbf\xcb\xdb\x72\xbe\x9e\x8f\x31\x77\x92\x4c\x5a\xa3\
-\x36\x91\x25\x00\x8d\x37\x4b\x81\x80\x57\x78\x02\x38\xd3\x64\xc3\
-\x52\xbc\x62\x7a\x7e\x48\x29\x00\x9c\x69\xbe\x51\x45\xfc\x5e\x21\
-\x7f\x93\x8e\xea\x00\x67\xc4\x68\x51\xdd\x52\x65\xf1\x68\x65\x22\
-\xf8\xf9\xb1\xdf\xa7\x03\x9c\x11\xa3\x75\xf5\xaa\x3f\x24\x8b\x85\
-\xfb\x4c\xaf\x61\x0e\x70\x46\x0c\x39\x5a\xec\x5a\x1d\x8a\x90\xcb\
-\xcc\x86\xbf\x2d\x73\x0b\xc4\x90\xa3\xf5\x6e\x35\x12\x51\x3d\xf9\
-\x97\xdd\x58\x95\x39\x40\x0c\x39\xd4\xd0\xa6\x9a\x15\xf6\x09\x57\
-\x27\x8b\x5d\x3f\xd4\xdc\x02\x39\xd4\xd0\xbe\x5a\x35\x3d\x10\x91\
-\x5e\xdf\xf7\x8a\x66\xb7\x9b\x51\x9d\xc7\x0c\x70\x46\x0c\x39\xd4\
-\xa0\x96\xf4\xfe\x2b\x49\x95\x85\xbb\xd3\x64\x77\xd5\x60\x99\xf9\
-\x05\x95\x03\x47\x0d\x6a\xd1\x43\x3c\x9c\xc5\xd7\xc1\xd2\x68\xbc\
-\xfd\x8d\xde\x39\x33\xbf\x80\xce\x04\xb5\xe8\xa1\x3e\x4e\xf2\xf3\
-\x87\xf4\x78\xbe\xd6\x63\xbb\x73\x49\x64\x06\x34\x8e\x5a\xf4\xa0\
-\x97\x9a\xd9\xc4\xd7\xc0\xfa\xdc\xa0\x52\xa0\x26\x80\x3f\x2e\x03\
-\x1a\x07\xe8\x41\x2f\xf5\xa3\xd2\xb0\x06\xae\x37\x8a\x43\xa4\x24\
-\xc6\x02\x06\x34\x0e\xd0\x63\xae\x10\x8d\x9a\x96\x14\x94\xc5\xc3\
-\xd4\x78\x79\x25\x50\x72\x29\x4d\xcf\x2e\x97\x07\x4f\x41\x2f\x3c\
-\xa8\xaf\xa5\x38\x5d\x09\x95\x3c\x6c\xc7\x74\x0f\xbf\x7f\x51\x60\
-\xfa\xf3\x8e\xfd\xe1\x81\x8a\x15\x12\xa7\xe6\x2c\x24\x0b\xd9\xad\
-\x19\xfb\x4a\xb0\xc0\x7f\x7e\x75\x52\x35\xb0\xde\xc6\x5f\xc0\x03\
-\x5e\xd4\x7f\x58\xe3\xcf\xde\xe9\x97\xb9\x01\x1e\xf0\x82\x67\xc9\
-\x3d\xe4\x13\x2e\x8e\x17\x9c\x57\x82\x5b\xe0\x05\x4f\xcb\x7f\xaa\
-\xd3\x2f\x7e\x9d\x25\x35\x63\x88\xcd\x00\x5e\xf0\x84\x37\xe3\x83\
-\x3b\xe0\x1f\x2e\x5b\x01\xbc\x4b\xd7\xd4\x2a\xfd\x02\x5f\x12\x37\
-\x29\x0f\x13\xae\x48\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
-\x82\
-\x00\x00\x13\xbd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x62\x08\x06\x00\x00\x00\xa6\xbb\x76\x49\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x28\x0b\xe0\xa3\xf1\x4c\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x13\x21\x49\x44\x41\x54\x78\xda\xed\x9c\xd9\
-\x53\x1b\x57\xb7\xc5\x57\xb7\xba\x35\x8f\x08\x90\x98\xb1\x24\x0c\
-\x02\x62\x27\x50\x38\xc6\x19\xea\xf3\x94\x3c\xa5\x6e\x55\x1e\xe2\
-\xfc\x89\xf7\xf1\xbe\xc5\x5f\xec\x4a\x52\x37\x76\x15\x06\x83\x2b\
-\x36\x60\x46\x21\x21\x06\x21\x50\xa3\x09\x49\x2d\xb5\xd4\xf7\x21\
-\x3e\xe7\x13\xb2\x86\x16\x48\x20\x39\xb7\xab\x28\x57\x81\xac\x82\
-\x5e\xfd\x3b\x6b\xef\xb5\xcf\x11\x23\xcb\x32\xda\xf5\xf2\xf9\x7c\
-\x78\xf6\xec\x99\xfc\xd7\x5f\x7f\xe1\xf0\xf0\x10\x16\x8b\x05\x77\
-\xef\xde\xc5\xed\xdb\xb7\x99\x9b\x37\x6f\xc2\x6e\xb7\xb7\xdd\xdf\
-\xc4\xb5\xa3\x10\x67\x67\x67\x38\x3a\x3a\xc2\xd2\xd2\xd2\xfe\xcb\
-\x97\x2f\xb1\xb8\xb8\x88\x50\x28\x04\xab\xd5\x0a\x51\x14\x21\x8a\
-\xa2\xac\x52\xa9\x18\x00\x30\x99\x4c\x50\xab\xd5\xff\x2f\x48\x33\
-\xaf\xa3\xa3\x23\x3c\x7f\xfe\x5c\x7e\xf9\xf2\x25\x96\x96\x96\x70\
-\x70\x70\x80\x7c\x3e\x8f\x68\x34\x8a\xb9\xb9\x39\xc4\xe3\x71\x30\
-\x0c\x23\x17\x0a\x05\x66\x64\x64\xa4\xad\x48\xe1\xda\x99\x8c\x77\
-\xef\xde\x41\x14\x45\x74\x77\x77\xc3\x6a\xb5\x22\x97\xcb\xe1\xe0\
-\xe0\x00\x9b\x9b\x9b\xb0\x5a\xad\x00\x20\xb3\x2c\xdb\x56\xa4\x70\
-\xed\x4c\x46\x26\x93\x81\xc7\xe3\x81\xdb\xed\x86\xdb\xed\x46\x2c\
-\x16\xc3\x1f\x7f\xfc\x81\xdd\xdd\x5d\x2c\x2c\x2c\x20\x1a\x8d\x42\
-\x96\x65\x39\x9f\xcf\xb7\x8d\xa7\x70\xed\x4a\x46\x3a\x9d\x46\x4f\
-\x4f\x0f\xa6\xa6\xa6\xf0\xf9\xe7\x9f\xe3\xc6\x8d\x1b\x38\x3d\x3d\
-\x45\x26\x93\x81\x4a\xa5\xc2\xe6\xe6\x26\x36\x37\x37\x61\xb1\x58\
-\x00\xa0\x6d\x3c\x85\x6b\x47\x32\xd2\xe9\x34\x5c\x2e\x17\xa6\xa7\
-\xa7\x71\xff\xfe\x7d\x8c\x8d\x8d\xc1\x60\x30\x20\x99\x4c\x82\xe7\
-\x79\xd8\xed\x76\x30\x0c\x83\x9d\x9d\x1d\xbc\x7e\xfd\x1a\xb1\x58\
-\x0c\x00\xda\x82\x14\xae\xdd\xc8\xc8\x64\x32\x70\x3a\x9d\x98\x9e\
-\x9e\xc6\xdd\xbb\x77\x31\x3e\x3e\x8e\xde\xde\x5e\x00\x80\x5e\xaf\
-\x87\x56\xab\x05\x00\x9c\x9e\x9e\x02\x00\x36\x36\x36\xda\x8a\x14\
-\xae\x5d\xc8\x58\x5c\x5c\x84\x28\x8a\x70\xb9\x5c\x98\x9a\x9a\xc2\
-\xc3\x87\x0f\x31\x3e\x3e\x0e\x9b\xcd\x46\x5f\xcf\xf3\x3c\xcc\x66\
-\x33\x3c\x1e\x0f\x00\xc0\x66\xb3\x41\x96\xe5\x73\xa4\xb4\x7a\xf5\
-\xd5\x92\x82\x24\x93\x49\x84\xc3\x61\x2c\x2e\x2e\x0a\x2f\x5e\xbc\
-\x38\x47\xc6\xd4\xd4\x14\x66\x67\x67\xcf\x91\x41\x2e\x96\x65\xa1\
-\xd1\x68\xd0\xd5\xd5\x05\x8d\x46\x03\x00\x10\x04\x01\x00\xa8\xa7\
-\x90\xea\xab\x55\x49\x69\x49\x41\xc2\xe1\x30\x7e\xfd\xf5\x57\xf9\
-\xe5\xcb\x97\x78\xf3\xe6\x0d\x32\x99\x0c\xdc\x6e\x37\xa6\xa6\xa6\
-\xf0\xe0\xc1\x83\x8f\xc8\x28\xbd\x4a\x49\xe9\xe8\xe8\x00\xc3\x30\
-\xf0\xf9\x7c\xb4\xfa\x22\x9e\xd2\x6a\xa4\x70\xad\x4a\x46\xa9\x67\
-\x4c\x4d\x4d\x9d\xf3\x0c\x86\x61\x2a\xbe\x4f\x39\x52\x4a\x3d\xa5\
-\x55\x49\xe1\x3e\x25\x32\x00\x80\x64\x73\x0c\xc3\x7c\x44\xca\x07\
-\x11\x5a\x9a\x94\x96\x10\xa4\x5a\x35\x55\xcd\x33\x6a\x5d\xc5\xa4\
-\x90\xa7\xff\x83\x08\x1f\x91\xd2\x2a\x1d\x7d\x4b\x08\x52\x5c\x4d\
-\x95\x92\x51\x5c\x4d\x55\x5b\xa6\xc8\x55\xee\x35\x3c\xcf\xc3\x62\
-\xb1\x9c\x23\x45\x96\xe5\x73\xa4\xb4\x4a\x47\xcf\xb5\x1a\x19\xa2\
-\x28\x5e\x9a\x8c\x5a\xa4\xc8\xb2\xfc\x51\xf5\xd5\x2a\x7d\x0a\xd7\
-\x2a\x64\x90\x6c\xaa\x5a\x9f\x71\xd9\x8b\x90\x32\x32\x32\x42\xab\
-\x2f\x00\x2d\xd5\xd1\x73\xad\x42\x46\x26\x93\x81\xc3\xe1\x68\x28\
-\x19\xb5\x48\x61\x18\x86\x56\x5f\xad\x42\x0a\xd7\xea\x64\x14\x57\
-\x4d\x8d\x26\xc5\xe3\xf1\x80\x61\x98\xb2\xa4\x5c\x57\x47\xcf\xb5\
-\x02\x19\x8d\xf6\x8c\x7a\x48\x69\xb5\x8e\x9e\xbb\x2e\x32\x94\x64\
-\x53\xcd\xbc\x64\x59\x06\xc7\x71\x30\x9b\xcd\x70\xbb\xdd\xf8\xfe\
-\xfb\xef\x69\x25\x77\x9d\x7d\x0a\x77\xd5\x64\xd4\x93\x4d\x35\xfb\
-\xaa\xa7\x4f\xb9\x2a\x52\xb8\xab\x22\xe3\xd9\xb3\x67\xe7\x3c\xa3\
-\x5c\x9f\x51\xa9\xe3\x6e\xc6\x55\xfc\xbe\xa5\x9e\x42\x7e\x97\xeb\
-\x20\x85\xbb\x2a\x32\x2e\xe3\x19\x85\x42\x01\xf9\x7c\x1e\xb5\xb6\
-\x2c\x31\x0c\x43\xbf\x58\x96\x55\x2c\x66\x3d\xd9\x57\xb3\x3b\x7a\
-\xee\x2a\xc9\x10\x45\x51\x71\x36\x45\x6e\xa6\x2c\xcb\xc8\xe7\xf3\
-\x48\xa7\xd3\x90\x24\xa9\xe2\x4d\x96\x65\x19\x2c\xcb\x42\xa5\x52\
-\x81\xe7\x79\xf0\x3c\x0f\x95\x4a\x55\x77\xf5\x45\x3c\xe5\xbb\xef\
-\xbe\xa3\xd9\xd7\xce\xce\xce\x95\x75\xf4\xdc\x55\x91\x51\xa9\x03\
-\xaf\x76\x83\xd3\xe9\x34\x22\x91\x08\x04\x41\x80\x20\x08\x48\xa7\
-\xd3\xe7\x5e\x5f\x4a\x0c\xcb\xb2\xe0\x38\x0e\x1a\x8d\x06\x5a\xad\
-\x16\x1a\x8d\x06\x6a\xb5\x1a\x5a\xad\x16\x7a\xbd\x9e\x4e\x14\x39\
-\x8e\xab\x4a\x4a\x67\x67\x67\x45\x4f\x69\x76\x9f\xc2\x35\x8b\x8c\
-\xe7\xcf\x9f\xcb\x2f\x5e\xbc\xa8\xea\x19\xd5\xc4\x90\x65\x19\x27\
-\x27\x27\x78\xf5\xea\x15\x56\x56\x56\x10\x08\x04\x48\x27\xad\x48\
-\x10\xbd\x5e\x0f\xb3\xd9\x0c\x9b\xcd\x86\x9e\x9e\x1e\x0c\x0d\x0d\
-\xa1\xbf\xbf\x1f\x3d\x3d\x3d\x30\x1a\x8d\x15\x3d\x4a\x96\xe5\xb2\
-\x29\x71\xe9\xe4\xb1\x59\x1d\x3d\xd7\x8a\x9e\x21\xcb\x32\x24\x49\
-\x82\x20\x08\x58\x5e\x5e\xc6\xdc\xdc\x1c\xfc\x7e\x7f\x4d\x41\x18\
-\x86\x01\xc7\x71\xe0\x79\x1e\x5a\xad\x16\x26\x93\x09\x1d\x1d\x1d\
-\x70\x3a\x9d\x18\x1e\x1e\x86\xcb\xe5\xc2\xc8\xc8\x08\xfa\xfa\xfa\
-\xd0\xd1\xd1\x01\x9d\x4e\x57\xd6\x6b\x58\x96\x85\x56\xab\x3d\x97\
-\x7d\x15\x77\xf4\x1b\x1b\x1b\x4d\x23\x85\x6b\x06\x19\xa4\xcf\x50\
-\x52\x4d\x95\x13\x23\x9f\xcf\x23\x9b\xcd\x22\x1a\x8d\xc2\xef\xf7\
-\xc3\xe7\xf3\x21\x12\x89\x20\x9d\x4e\xd7\x14\x84\x18\x3a\xcb\xb2\
-\xe0\x79\x1e\xc1\x60\x10\xeb\xeb\xeb\x58\x5c\x5c\x44\x7f\x7f\x3f\
-\x26\x27\x27\x31\x35\x35\x85\x3b\x77\xee\x60\x60\x60\x80\xfe\x9f\
-\x6a\xd5\x17\xc9\xbe\xca\x55\x5f\xb2\x2c\xcb\x92\x24\x31\xa3\xa3\
-\xa3\x0d\x21\x85\xbb\x6a\xcf\x50\xda\xb4\x49\x92\x84\x74\x3a\x8d\
-\x58\x2c\x86\x68\x34\x8a\x54\x2a\x85\x5c\x2e\x07\x95\x4a\x45\x97\
-\x23\xad\x56\x0b\x96\x65\xcf\xfd\xbf\x42\xa1\x00\x49\x92\x90\xc9\
-\x64\x90\xc9\x64\x20\x08\x02\x24\x49\x02\x00\x84\x42\x21\xc4\x62\
-\x31\x88\xa2\x08\xa3\xd1\x08\x96\x65\xd1\xdd\xdd\x0d\x83\xc1\xa0\
-\xb8\x4f\xa9\x94\x7d\x71\x1c\xd7\x10\x52\xb8\x46\x93\xd1\x88\xd4\
-\x96\xdc\x58\x72\x53\x54\x2a\x15\x18\x86\x81\x4a\xa5\x82\xc1\x60\
-\xa0\x4f\xba\xd3\xe9\x04\xc7\x71\x60\x59\x96\x92\x95\xcb\xe5\x10\
-\x8f\xc7\x71\x74\x74\x84\xc3\xc3\x43\xec\xed\xed\x21\x16\x8b\xa1\
-\x50\x28\x20\x91\x48\x60\x63\x63\x03\xb2\x2c\x43\xab\xd5\x42\x92\
-\x24\xcc\xcc\xcc\x40\xaf\xd7\x57\x2d\x91\x8b\x49\x29\xed\x53\x16\
-\x17\x17\xe9\x5e\xe2\x46\x78\x0a\xd7\x0c\xcf\x68\x54\x6a\x2b\xcb\
-\xf2\xb9\x25\x85\xe3\x38\xe8\xf5\x7a\xf4\xf4\xf4\x60\x7a\x7a\x1a\
-\x23\x23\x23\xe0\x38\x8e\xfe\xbc\x54\x90\x40\x20\x80\xf5\xf5\x75\
-\xec\xee\xee\xe2\xe8\xe8\x08\x67\x67\x67\x10\x04\x01\x3e\x9f\x0f\
-\x06\x83\x01\x06\x83\x01\xc3\xc3\xc3\xe8\xea\xea\x02\xcf\xf3\xe7\
-\x68\x53\xda\xa7\x34\x3a\x25\xe6\x1a\xe9\x19\x8d\xc8\xa6\x8a\x05\
-\xa8\x64\xb6\xdd\xdd\xdd\x98\x98\x98\xc0\xed\xdb\xb7\x3f\x2a\x83\
-\x0b\x85\x02\x72\xb9\x1c\x44\x51\x44\x28\x14\xc2\xea\xea\x2a\x16\
-\x17\x17\xf1\xe7\x9f\x7f\xc2\xef\xf7\x23\x9f\xcf\x23\x99\x4c\x62\
-\x63\x63\x03\x76\xbb\x1d\x33\x33\x33\x18\x18\x18\x80\xc9\x64\xa2\
-\x37\xbb\x56\x9f\x52\xbc\xef\x8b\x64\x5f\x8d\x4a\x89\xb9\xcb\x92\
-\xd1\xac\x6c\xaa\xdc\x12\x42\xca\x5a\xbd\x5e\x8f\xce\xce\x4e\x38\
-\x9d\xce\x8f\x4c\xb9\xb8\x9c\x75\x3a\x9d\xb4\xb9\xf3\xfb\xfd\x88\
-\x44\x22\x48\x26\x93\x10\x45\x11\xe1\x70\x18\xfb\xfb\xfb\x08\x87\
-\xc3\x88\xc5\x62\xb4\x6f\xa9\xb7\xa3\x6f\xf4\x8c\x9e\xbb\x28\x19\
-\xa5\xd9\x14\xd9\x6b\xdb\xe8\xd4\xb6\x38\x0e\x29\xae\xc2\x72\xb9\
-\x1c\x72\xb9\x1c\x78\x9e\xaf\x58\x25\x91\x25\x49\x10\x04\xdc\xb8\
-\x71\x03\x87\x87\x87\x90\x24\x09\x89\x44\x02\x92\x24\x21\x95\x4a\
-\x21\x12\x89\xe0\xf4\xf4\x94\xce\x44\xaa\x2d\x9f\xf4\xa6\x7d\x48\
-\x89\x8b\x49\x29\x57\x7d\x5d\xc4\x53\xb8\x8b\x90\x51\x6e\xdf\x54\
-\xb9\xbd\xb6\xcd\x8a\xcd\x89\x28\x85\x42\xa1\x6a\xbe\xc5\xf3\x3c\
-\xac\x56\x2b\xba\xbb\xbb\xe1\x70\x38\x60\xb3\xd9\x70\x7c\x7c\x4c\
-\xfd\x46\x14\x45\x24\x12\x09\x24\x93\x49\x5a\x89\x35\x2a\xfb\xba\
-\xa8\xa7\x70\x97\x25\xc3\xed\x76\xd3\x5d\xe8\x97\x21\xa3\x56\xba\
-\x4b\x84\xb8\xc8\xfb\x90\xea\xcc\x60\x30\x40\xa5\x52\xd1\xd7\x14\
-\x0a\x05\x72\x04\x0e\xf9\x7c\x5e\xd1\x12\x5a\xfc\x3b\x94\xf3\x14\
-\x42\xca\x45\x3d\x85\xab\xd7\x33\x8a\xc9\x20\xd5\x8e\xd2\x1d\x85\
-\xd7\x75\x91\x66\x91\x94\xcf\xa5\xdf\xaf\x27\x19\x56\xda\xa7\x5c\
-\xd4\x53\x38\xa5\x64\x94\xcb\xa6\xa6\xa7\xa7\xf1\xe0\xc1\x03\x78\
-\xbd\x5e\xba\x7f\xf6\xaa\xe6\x19\xf5\x14\x03\xa4\xf2\xca\x66\xb3\
-\xb4\xbf\x21\xe4\xe8\xf5\x7a\xe8\x74\x3a\xc5\xc9\x70\xb9\xf7\x2f\
-\xf5\x94\xe2\xec\xab\x5e\x4f\xe1\x1a\x41\x46\x4f\x4f\xcf\x95\xdf\
-\x78\x25\x4f\x35\x89\x60\xe2\xf1\x38\x04\x41\x40\x3c\x1e\x47\x2e\
-\x97\xa3\xb4\xe8\x74\x3a\x58\x2c\x16\x98\xcd\x66\xf0\x3c\x7f\xe1\
-\xdf\x45\xa5\x52\x81\x65\x59\x9a\x12\x5f\x26\xfb\xe2\x2e\x9a\x4d\
-\x15\xcf\x33\xaa\xdd\x18\xa5\xa4\x28\x15\xb4\x78\x99\x29\x5d\x82\
-\x4a\xaf\x6c\x36\x0b\x41\x10\x70\x70\x70\x80\xdd\xdd\x5d\x84\x42\
-\x21\x7a\xe4\x4d\xaf\xd7\x53\xc3\xb7\xdb\xed\x8a\x4b\xd3\x4a\x7f\
-\x0f\xd9\x4b\x5c\x2d\xfb\x52\x92\x12\x73\xf5\x64\x53\xe4\x4c\xdf\
-\x75\xcd\xc0\x8b\xcb\x5e\x49\x92\x90\xcb\xe5\x50\x28\x14\x68\x74\
-\x52\xfc\xb3\x4c\x26\x83\x93\x93\x13\xf8\xfd\x7e\xbc\x7d\xfb\x16\
-\xc1\x60\x10\xd1\x68\x14\xb9\x5c\x0e\x06\x83\x01\x03\x03\x03\x70\
-\xb9\x5c\x70\x38\x1c\x30\x99\x4c\x15\x67\x24\xf5\x92\xa2\x52\xa9\
-\xce\x79\x8a\x20\x08\x90\x65\x59\x31\x29\x9c\xd2\x6c\xaa\x1c\x19\
-\xc5\x15\x47\xb9\x27\xa6\x59\x62\xe4\x72\x39\x9c\x9d\x9d\x21\x91\
-\x48\xd0\xc8\x83\x04\x92\x99\x4c\x06\xf1\x78\x1c\xe1\x70\x18\x5b\
-\x5b\x5b\x58\x5a\x5a\xc2\xf2\xf2\x32\x82\xc1\x20\x32\x99\x0c\x0a\
-\x85\x02\x6c\x36\x1b\xa6\xa6\xa6\x30\x33\x33\x83\xde\xde\xde\x4b\
-\x7b\x48\xb5\xec\xab\x98\x14\xe2\x29\xd5\x48\xe1\xea\x99\x67\x14\
-\x57\x53\xd7\xf1\x91\x1c\xf9\x7c\x1e\x99\x4c\x06\xe1\x70\x18\xcb\
-\xcb\xcb\xc8\x66\xb3\x54\x10\x62\xdc\xa9\x54\x0a\xa7\xa7\xa7\x38\
-\x3a\x3a\x82\xcf\xe7\xc3\xf2\xf2\x32\x0e\x0e\x0e\x90\x4e\xa7\x61\
-\x32\x99\x60\xb5\x5a\x31\x31\x31\x81\x99\x99\x19\x4c\x4e\x4e\xc2\
-\x6e\xb7\x5f\xca\x3f\x94\x56\x5f\xd1\x68\x14\x0c\xc3\xd4\xcc\xbe\
-\x38\x25\xa9\x2d\xa9\xa6\x8a\xfb\x8c\x7a\x09\x68\x44\xd5\x25\x49\
-\x12\xe2\xf1\x38\x36\x36\x36\x20\x8a\x22\x6c\x36\xdb\x39\x73\xcf\
-\x66\xb3\x48\xa5\x52\x48\xa5\x52\x48\x26\x93\x48\x24\x12\x34\xe9\
-\xd5\xeb\xf5\xe8\xeb\xeb\xc3\xad\x5b\xb7\xe8\xc3\xe5\x72\xb9\x60\
-\x34\x1a\x9b\xf6\x00\x95\x4b\x89\x6b\x65\x5f\x1c\xf0\x9f\x93\x4b\
-\xe5\x3c\xe3\xaa\x3a\xf0\x7a\x09\x89\xc7\xe3\x34\x36\x61\x18\x86\
-\x2e\x59\xa2\x28\x22\x9b\xcd\x42\x92\x24\xc8\xb2\x0c\x95\x4a\x05\
-\xbb\xdd\x0e\xb7\xdb\x8d\xc9\xc9\x49\xcc\xcc\xcc\xe0\xb3\xcf\x3e\
-\x83\xcb\xe5\xaa\x19\x97\x34\x92\x94\xe2\xec\x8b\x90\xb2\xbd\xbd\
-\x8d\xf9\xf9\x79\xda\xa7\x88\xa2\xf8\xb7\x20\xa5\x27\x97\xb2\xd9\
-\x2c\x3c\x1e\x0f\xa6\xa7\xa7\xf1\xaf\x7f\xfd\x0b\x5e\xaf\x97\x7a\
-\x46\x69\xc7\x5a\x4f\x75\xd4\x08\x0f\x29\x14\x0a\xc8\x66\xb3\xc8\
-\xe7\xf3\x1f\x05\x8b\x85\x42\x81\x7e\x11\x31\x34\x1a\x0d\x7a\x7b\
-\x7b\xf1\xf5\xd7\x5f\xe3\xce\x9d\x3b\x18\x1d\x1d\xa5\x73\xf5\x4a\
-\x53\xc7\x66\x90\x62\x36\x9b\x29\x29\x64\x99\xdc\xd9\xd9\xc1\xd2\
-\xd2\x12\x62\xb1\x18\x64\x59\x96\x5d\x2e\xd7\x7f\x73\xe1\x70\x18\
-\x3b\x3b\x3b\xff\xb5\xb0\xb0\x40\x3f\x55\xc7\xe9\x74\x62\x74\x74\
-\x14\xd3\xd3\xd3\x18\x1b\x1b\xbb\x36\xcf\x28\xf7\xc4\xf1\x3c\x0f\
-\x83\xc1\x80\x8e\x8e\x0e\x3a\x58\x22\xfb\xb6\xb2\xd9\x2c\xce\xce\
-\xce\xe8\xb2\x55\xfc\xd0\x10\x71\x4c\x26\x13\x8c\x46\x63\x43\xaa\
-\xaa\x7a\x49\x21\x7d\x4a\x3e\x9f\xc7\xde\xde\x1e\x4e\x4f\x4f\xb1\
-\xbd\xbd\x0d\x51\x14\x61\xb7\xdb\x21\x08\xc2\xcf\xdc\xf2\xf2\xf2\
-\x77\xab\xab\xab\xff\xb3\xb9\xb9\x89\x50\x28\x04\x59\x96\xd1\xd9\
-\xd9\x89\xf1\xf1\x71\x8c\x8e\x8e\xc2\x64\x32\x5d\x49\x15\x55\x6d\
-\x17\x08\xf9\x19\xcf\xf3\x30\x99\x4c\x70\xb9\x5c\x74\x26\xae\x52\
-\xa9\x68\x75\x75\x7c\x7c\x0c\xbf\xdf\x8f\x40\x20\x80\x60\x30\x88\
-\x78\x3c\x4e\xe7\x22\xaf\x5e\xbd\x02\xcb\xb2\xb0\x58\x2c\x30\x1a\
-\x8d\x30\x1a\x8d\xf4\x48\x42\x23\xbc\x4f\xc9\xeb\x08\x29\x3d\x3d\
-\x3d\x18\x19\x19\x41\x28\x14\xc2\xc1\xc1\x01\x62\xb1\x18\xd6\xd7\
-\xd7\x71\x7c\x7c\xfc\xf7\x92\xc5\x71\x1c\x8c\x46\x23\x4c\x26\x13\
-\x52\xa9\x14\x24\x49\x42\x32\x99\x44\x3c\x1e\xa7\xbb\x33\x48\x37\
-\x7a\x9d\x17\xe9\xae\x89\xb7\x8d\x8f\x8f\x83\x65\x59\xba\x91\xee\
-\xf8\xf8\x18\x43\x43\x43\x58\x5b\x5b\x83\x46\xa3\xc1\xee\xee\x2e\
-\xe2\xf1\x38\xa2\xd1\x28\x36\x37\x37\x61\x30\x18\x30\x38\x38\x08\
-\x93\xc9\x84\xa1\xa1\xa1\x2b\x3f\x21\x45\x22\xff\x78\x3c\x8e\x64\
-\x32\x89\x6c\x36\x0b\x95\x4a\x05\x93\xc9\x84\xae\xae\x2e\x38\x1c\
-\x0e\x70\x93\x93\x93\xbf\x1a\x8d\x46\x26\x1e\x8f\xcb\x6a\xb5\x1a\
-\x6f\xde\xbc\xc1\xde\xde\x1e\x7e\xfb\xed\x37\xa4\xd3\x69\x3c\x7c\
-\xf8\x10\x1a\x8d\x06\x06\x83\xa1\xac\x20\x8d\xca\xac\x2a\xfd\xff\
-\x62\x9f\x60\x59\x16\x6a\xb5\x1a\x16\x8b\x05\x83\x83\x83\x74\x2f\
-\x2e\xe9\x4f\x32\x99\x0c\x26\x27\x27\x31\x3a\x3a\x0a\x9b\xcd\x86\
-\xd7\xaf\x5f\x63\x75\x75\x15\x82\x20\xe0\xe4\xe4\x04\xdb\xdb\xdb\
-\x78\xfd\xfa\x35\x74\x3a\x1d\xac\x56\x2b\x1d\x5e\x35\x2b\x43\x2b\
-\xd7\x70\x6f\x6f\x6f\xd3\x09\xe6\xfa\xfa\x3a\xf2\xf9\x3c\xbc\x5e\
-\x2f\x7e\xfc\xf1\x47\x4c\x4e\x4e\x32\x5c\x77\x77\x37\x00\x60\x66\
-\x66\xe6\xfb\x42\xa1\xf0\xef\xb3\xb3\x33\x04\x02\x01\x6c\x6f\x6f\
-\x83\x65\x59\xfa\x4b\x0f\x0f\x0f\xa3\xa3\xa3\xe3\x5a\x49\x29\xf5\
-\x02\xab\xd5\xfa\xd1\xf0\x4a\x96\x65\x18\x8d\x46\x5a\x69\x45\x22\
-\x11\x24\x12\x09\x88\xa2\x88\xa3\xa3\x23\xac\xae\xae\xc2\x6e\xb7\
-\x63\x6c\x6c\x0c\x0e\x87\xe3\x42\x5b\x4e\xeb\xbd\x88\xb7\x91\xc6\
-\x70\x7e\x7e\x1e\x5b\x5b\x5b\x90\x24\x09\x5e\xaf\x17\xdf\x7c\xf3\
-\x0d\xbe\xfc\xf2\x4b\xc6\xeb\xf5\xfe\xbd\x64\x59\x2c\x16\x4c\x4e\
-\x4e\xfe\xaa\x56\xab\x3b\x00\x08\x0b\x0b\x0b\x58\x5e\x5e\xc6\xca\
-\xca\x0a\x8d\x94\x1f\x3d\x7a\x54\x96\x94\x46\x79\x89\x12\xd2\x8a\
-\xe3\x91\x72\x13\x43\xf2\xaf\xcd\x66\xc3\x17\x5f\x7c\x01\x51\x14\
-\xb1\xbd\xbd\x8d\x93\x93\x13\x44\xa3\x51\x9c\x9d\x9d\xc1\xe7\xf3\
-\xa1\xbb\xbb\x1b\x7b\x7b\x7b\xe8\xeb\xeb\x83\xcd\x66\xab\x2a\x48\
-\x23\xfe\x3e\x42\xc6\xc2\xc2\x02\x7e\xf9\xe5\x17\xac\xad\xad\x21\
-\x93\xc9\x60\x6c\x6c\x0c\x3f\xfd\xf4\x13\x66\x67\x67\x99\xbe\xbe\
-\xbe\xff\x74\xea\x1a\x8d\x06\x1f\x48\x39\xcd\x66\xb3\xdf\x03\xf8\
-\x77\x22\x91\x80\xdf\xef\xa7\xdb\x66\x5a\x85\x94\x5a\x13\x43\x86\
-\x61\xa0\xd3\xe9\xd0\xd7\xd7\x07\x8f\xc7\x03\x8f\xc7\x83\x83\x83\
-\x03\x88\xa2\x88\x58\x2c\x86\x48\x24\x82\xbd\xbd\x3d\xf8\xfd\x7e\
-\x0c\x0e\x0e\x42\xab\xd5\xd2\x4f\x10\x6a\x36\x19\x73\x73\x73\x58\
-\x5b\x5b\x43\x3a\x9d\xc6\xd8\xd8\x18\xbe\xf9\xe6\x1b\xdc\xbd\x7b\
-\x97\xf1\x7a\xbd\xe5\xa3\x93\x72\xa4\xbc\x7b\xf7\x0e\xab\xab\xab\
-\x00\x80\x58\x2c\x86\x47\x8f\x1e\xd1\xcd\xcb\xf5\x08\x52\x8b\x80\
-\x46\x56\x6d\xa4\x3c\xee\xe8\xe8\xc0\xe8\xe8\x28\x42\xa1\x10\x8e\
-\x8f\x8f\x69\xb8\x18\x8d\x46\xb1\xb5\xb5\x85\xbe\xbe\x3e\x74\x77\
-\x77\x37\xed\xd4\x56\x35\x32\x7e\xfe\xf9\x67\xcc\xce\xce\x32\xfd\
-\xfd\xfd\x95\xd3\xde\x6a\xa4\x6c\x6e\x6e\x82\x61\x18\x4a\xca\xd0\
-\xd0\xd0\xb5\x7b\x4a\x2d\xaf\x21\x43\xa3\xfd\xfd\x7d\xac\xac\xac\
-\xe0\xf0\xf0\x10\xf9\x7c\x1e\xf1\x78\x1c\x3e\x9f\x0f\xfd\xfd\xfd\
-\x18\x1f\x1f\x87\xd3\xe9\xac\x19\xe5\x37\x8a\x0c\xe2\x19\xb3\xb3\
-\xb3\xcc\xf8\xf8\xb8\xb2\xf8\xbd\x12\x29\x2b\x2b\x2b\x74\xf8\x52\
-\xc9\x53\xaa\xcd\x0b\xae\xfa\x32\x18\x0c\x18\x1a\x1a\xa2\x31\x89\
-\x46\xa3\x81\x28\x8a\x48\xa5\x52\xf0\xfb\xfd\xe8\xef\xef\x87\x20\
-\x08\x10\x45\x11\x1a\x8d\xa6\x61\xcd\x22\xf1\xaa\xf9\xf9\xf9\x73\
-\x64\x78\xbd\x5e\x3c\x79\xf2\xa4\x2c\x19\x55\x05\xa9\x45\x0a\x19\
-\x53\xb6\x4a\xf5\x55\xe9\x52\xab\xd5\xe8\xec\xec\x44\x6f\x6f\x2f\
-\x9c\x4e\x27\x3a\x3a\x3a\x10\x89\x44\x68\x1e\xb6\xb7\xb7\x87\xc3\
-\xc3\x43\x08\x82\xf0\x77\xb0\x77\x49\x41\x8a\xc9\x98\x9f\x9f\xa7\
-\x64\x90\x65\xea\xdb\x6f\xbf\xc5\xbd\x7b\xf7\xce\x79\x46\x5d\x13\
-\xc3\x6a\x9e\x42\x48\x79\xfc\xf8\xf1\x39\x52\x5a\x69\x93\x03\xc7\
-\x71\x30\x18\x0c\xe8\xec\xec\xc4\xd0\xd0\x10\x02\x81\x00\x8d\xe7\
-\x13\x89\x04\x3e\xc4\x46\x18\x18\x18\xa0\x07\x7a\x9a\x41\xc6\xd8\
-\xd8\x18\x9e\x3c\x79\x82\x7b\xf7\xee\xd1\x6a\xea\x42\x82\x28\x21\
-\x85\x18\x62\x2b\x92\x42\xcc\xdd\x6a\xb5\x62\x78\x78\x18\x81\x40\
-\x00\xfb\xfb\xfb\x10\x04\x01\xd9\x6c\x16\xa7\xa7\xa7\xf0\xf9\x7c\
-\x18\x1c\x1c\xa4\x67\x46\x2e\xf2\x40\x35\x82\x0c\x45\x82\x54\x23\
-\x65\x79\x79\x19\xef\xdf\xbf\xa7\x7d\x4a\x29\x29\x57\x5d\x06\x57\
-\xab\xde\x0c\x06\x03\xdc\x6e\x37\x82\xc1\x20\xde\xbd\x7b\x47\x5f\
-\x9b\x4c\x26\x69\xb5\x75\xeb\xd6\xad\x0b\xa7\x0e\xd5\xaa\x29\xa5\
-\x64\xd4\x25\xc8\x75\x92\x52\xba\x41\x4e\xe9\x86\xb9\xe2\x4b\xaf\
-\xd7\xa3\xbf\xbf\x1f\xc3\xc3\xc3\xb0\xdb\xed\xd0\xe9\x74\xd4\xdc\
-\x83\xc1\x20\x76\x76\x76\x10\x0e\x87\x31\x38\x38\x08\x9d\x4e\xa7\
-\xd8\x4b\x2a\x55\x53\x17\x21\xa3\x2e\x41\x94\xf6\x29\x8d\x24\x85\
-\xdc\xf8\xe2\xf9\x46\xf1\xf7\x8a\x9f\xe6\x5a\x4f\xb4\x56\xab\x85\
-\xc3\xe1\xc0\xc0\xc0\x00\x7a\x7a\x7a\x60\xb3\xd9\x10\x89\x44\x68\
-\x9c\xb2\xbb\xbb\x8b\x60\x30\x88\xc1\xc1\x41\x38\x1c\x0e\xc5\x53\
-\xc4\x46\x78\xc6\xa5\x04\xb9\x4a\x52\x4a\x8f\xa7\x95\x3b\x83\xae\
-\x74\x69\xe1\x38\x8e\x26\xaa\x44\x14\x62\xee\xc9\x64\x12\x91\x48\
-\x04\x07\x07\x07\x08\x87\xc3\xb0\x5a\xad\x35\x05\x69\xa4\x67\x5c\
-\x4a\x90\x72\xa4\xc8\xb2\x7c\xce\x53\x18\x86\x41\x34\x1a\xc5\xe3\
-\xc7\x8f\xa1\xd5\x6a\xa1\xd3\xe9\x3e\xda\xa1\xae\x44\x0c\x72\xf4\
-\x80\xe7\x79\x7a\x28\x87\x34\x7c\xe4\xab\x9a\x28\xa5\x04\x71\x1c\
-\x07\x8b\xc5\x02\x97\xcb\x85\x60\x30\x88\x50\x28\x44\x3f\x70\x26\
-\x9d\x4e\x23\x1c\x0e\xd3\xf8\x5e\xa9\x67\xcc\xcf\xcf\xe3\xe9\xd3\
-\xa7\x0d\x21\xe3\x52\x82\x94\x23\x25\x99\x4c\x7e\x44\x8a\x2c\xcb\
-\xb4\xa3\x27\x47\xcf\x94\x0a\x42\xaa\x23\x8f\xc7\x83\x78\x3c\x8e\
-\x93\x93\x13\xa8\x54\x2a\x7a\xa2\x96\x9c\x11\xac\x87\x36\xb3\xd9\
-\x8c\x9b\x37\x6f\x22\x16\x8b\xe1\xec\xec\x8c\x6e\xf9\x1c\x18\x18\
-\x80\xcd\x66\x83\x5a\xad\xae\xfa\x9e\x84\x0c\xb2\x4c\xcd\xcd\xcd\
-\xe1\xfd\xfb\xf7\xb4\xe9\xbb\x0c\x19\x97\x12\xa4\x1c\x29\x0c\xc3\
-\x9c\xf3\x14\xf2\xe1\x60\xc5\xf3\x14\x25\x03\x21\xf2\x89\x0c\x6a\
-\xb5\x1a\x7d\x7d\x7d\xb8\x7f\xff\x3e\xdc\x6e\x37\x7d\x9a\x3b\x3b\
-\x3b\xe9\x5a\x5f\x2d\xee\x28\xf7\x7d\xb3\xd9\x8c\xb1\xb1\x31\xe8\
-\xf5\x7a\x38\x9d\x4e\x84\xc3\x61\xe4\xf3\x79\xd8\x6c\x36\x78\x3c\
-\x1e\x0c\x0d\x0d\x55\x3c\x00\x5a\x5a\x4d\x3d\x7d\xfa\x94\x8a\xd1\
-\x08\x32\x1a\x22\x48\x3d\x29\xf1\x8d\x1b\x37\x14\x7b\x0a\x59\x9a\
-\x6c\x36\x1b\xbc\x5e\x2f\x7a\x7b\x7b\x91\x48\x24\x00\x00\x46\xa3\
-\x11\x56\xab\x15\x66\xb3\xb9\x6e\x6f\x22\xbf\xaf\x56\xab\x85\xd5\
-\x6a\x45\x22\x91\x40\x3e\x9f\x87\x56\xab\x85\xdd\x6e\x87\xc5\x62\
-\x29\x9b\xfc\x2a\xa9\xa6\x66\x67\x67\x2f\x45\x46\x43\x04\x51\x5a\
-\x7d\x45\xa3\xd1\x8a\xd9\x57\xb5\x27\x5b\xad\x56\xc3\x66\xb3\xc1\
-\x68\x34\xd2\x03\x35\xc4\x57\x2e\x32\x7e\x25\x5e\x42\x36\xa5\x91\
-\xad\x42\x64\x13\x42\xa5\x61\x55\x25\x32\x94\x64\x53\xd7\x22\x48\
-\xb3\xb2\x2f\x32\x43\xd7\xe9\x74\x0d\x4b\x81\x19\x86\x81\x46\xa3\
-\xa9\x79\x9e\xb0\x12\x19\xc5\xcb\x54\x23\x3c\xa3\x29\x82\x34\x83\
-\x94\xeb\x18\x7c\x95\x12\xda\x8c\x3e\xe3\x4a\x05\xa9\xe5\x29\xed\
-\x92\x12\x57\xea\x33\xc8\x3c\xa3\x19\x64\x34\x45\x90\x5a\x7d\x0a\
-\x49\x89\x09\x29\xe5\x26\x8f\xad\x70\xf2\xaa\x52\x36\x45\x3c\xa3\
-\x19\x64\x34\x55\x90\x4a\xa4\x04\x02\x81\x96\x9e\xa7\x28\x9d\xf4\
-\x35\x83\x8c\xa6\x0a\x52\x2b\x25\x2e\xf5\x94\x62\x52\xae\x73\x9e\
-\x72\x99\x49\x5f\x5b\x08\xd2\x2e\xa4\x34\x33\x9b\x6a\x29\x41\xea\
-\x25\xe5\x22\xd5\x57\x23\x3c\xa7\x91\xf3\x8c\xb6\x10\x44\x49\xf6\
-\x75\x1d\xa4\xd4\xf2\x8c\xab\x24\xe3\x4a\x05\xa9\x95\x7d\x91\x94\
-\x38\x16\x8b\xd5\xdc\x4b\xac\x24\xb3\x52\x4a\xce\x75\x56\x53\x2d\
-\x21\x88\x12\x4f\xf9\x70\xf6\xae\xa9\xa4\x28\xd9\x51\xd8\xec\x6a\
-\xaa\x25\x04\x51\x92\x12\x13\x4f\x21\xf3\x94\x8b\xf6\x29\x17\x21\
-\xa3\xda\x8e\xc2\x4f\x5a\x90\x62\x52\x72\xb9\xdc\xb7\x00\xfe\x37\
-\x1e\x8f\x97\x9d\x3c\x36\x72\x87\xe4\x65\x76\x14\x7e\xd2\x82\x14\
-\x93\x32\x31\x31\xf1\x27\xcf\xf3\xb4\xa3\x2f\x9d\xd1\x97\x56\x5f\
-\x97\xad\xa6\xae\xbb\xcf\x68\x69\x41\xae\x6a\x87\x64\x2b\xf5\x19\
-\x2d\x2d\x48\x35\x4f\x79\xfb\xf6\x6d\xd5\x1d\x92\x8d\x20\xe3\x3a\
-\xfa\x8c\xb6\x10\xa4\x1e\x4f\xa9\x87\x94\x76\x22\xa3\xa5\x04\xa9\
-\xc7\x53\xea\x21\xa5\x95\x3a\xf0\xb6\x14\x44\xc9\x3c\x45\x09\x29\
-\xcd\xd8\x51\xf8\x8f\x14\xa4\x9c\xa7\x94\xce\x53\x94\x90\x52\xec\
-\x19\xcd\xda\x1d\xf2\x8f\x12\x44\x49\x47\x5f\x8e\x14\x49\x92\x3e\
-\xf2\x8c\x66\xcf\xc0\xff\x11\x82\x94\x23\x05\x25\xbb\xee\x49\xf6\
-\x55\x3c\x4f\x69\x47\xcf\x68\x2b\x41\x6a\xa5\xc4\xe4\x23\x8f\x72\
-\xb9\x1c\xba\xba\xba\x10\x8d\x46\xe9\x39\xf0\x56\xc9\xa6\x3e\x29\
-\x41\xaa\xf5\x29\xc4\x53\x58\x96\x45\x20\x10\x80\xdb\xed\x46\x34\
-\x1a\xc5\xef\xbf\xff\x8e\xad\xad\x2d\x2a\xc6\x75\x67\x53\x9f\xa4\
-\x20\xd5\x3c\x65\x63\x63\x03\x27\x27\x27\xd8\xdf\xdf\x47\x3a\x9d\
-\xc6\xda\xda\x1a\x72\xb9\xdc\xb9\x1d\x85\xd7\x99\x4d\x7d\x92\x82\
-\xd4\xf2\x94\xb5\xb5\x35\x04\x83\x41\x6a\xec\xe3\xe3\xe3\xf4\x13\
-\x12\xda\x85\x8c\xb6\x14\xa4\x12\x29\xe4\x34\x94\xc9\x64\xc2\xc4\
-\xc4\x04\xbe\xfa\xea\xab\x96\xaf\xa6\x3e\x09\x41\x4a\x49\xd1\x68\
-\x34\x3a\x96\x65\xd3\x0e\x87\x03\xbb\xbb\xbb\x70\x38\x1c\xf8\xe1\
-\x87\x1f\x30\x33\x33\xd3\xf2\xd5\xd4\x27\x25\x08\x21\x25\x9b\xcd\
-\x66\xf6\xf7\xf7\x33\xb1\x58\x4c\x9b\x4a\xa5\xd0\xdb\xdb\x8b\x5b\
-\xb7\x6e\xb5\x25\x19\xe4\xfa\x3f\x41\xaf\xe1\x38\x76\x00\xbb\x9e\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x01\x8c\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x14\x00\x00\x00\x14\x08\x06\x00\x00\x00\x8d\x89\x1d\x0d\
-\x00\x00\x01\x53\x49\x44\x41\x54\x78\x5e\x9d\x94\xbd\x4a\x43\x41\
-\x10\x46\xaf\x45\x50\x24\x29\x54\x42\x1a\x2b\x0b\xa3\x08\x29\xc5\
-\x20\x82\x16\x16\x16\x42\xc0\x52\x1f\xc0\x4e\xb0\xf0\x05\xac\xc4\
-\x42\xec\xc4\x36\x20\xd8\x68\x61\xe5\x03\x08\xda\x59\x08\x56\x0a\
-\x5a\x6a\xeb\x0f\x46\x74\x3d\x7b\xef\xa8\x9b\x61\xee\x1a\xf3\xc1\
-\x81\x2c\x33\xe7\x4b\x72\xb3\x24\x49\x72\xe2\x92\xa4\x0e\x5b\x30\
-\xa6\x67\x5d\x87\xb2\x15\xf8\x80\x26\x94\xf5\xbc\xab\x50\xb4\x0f\
-\x0e\x1e\x60\x4a\xcf\xff\x1d\x4a\x2a\xf0\x26\xa5\x4f\x30\xa9\x77\
-\x3a\x0a\xe2\x52\xf0\xfa\x42\x0a\x3d\x37\x50\x0a\x77\xff\x0c\x42\
-\x01\x6e\xa1\x47\xce\x47\x41\xa1\x67\x5d\x3b\xd1\x20\x4c\x8b\x38\
-\x22\xe7\x4b\x55\x78\xad\x9d\x68\x10\x0e\x45\x9c\x80\xaa\xcb\x7e\
-\xe9\xb0\xd0\x53\x91\xdd\x9a\xf6\xdb\xc2\xc2\x22\x7c\x0a\x83\x70\
-\x6a\x94\x79\xe6\x65\x7f\x5b\x77\xfc\x84\xe1\x30\x3c\x8a\x70\xe5\
-\x7e\xaf\x8c\x45\x43\x9c\x33\x18\xd5\x5d\x69\x18\x1c\x04\x82\xf5\
-\x35\x43\x66\x61\x08\x5e\x61\x41\x77\xf9\xb2\x01\x68\x19\xa2\x85\
-\xbf\x97\x45\xd8\x95\x73\xfa\x69\x75\xe1\x9c\x21\xe6\x71\x02\x9b\
-\xc1\xb9\xae\xfb\xd2\x8b\x6c\x88\x79\x84\x8f\xe3\x19\x7a\x75\x9f\
-\x2f\x9c\x31\xc4\x4e\x68\xea\xae\x34\x0c\xfa\xe1\xc5\x10\x62\xbc\
-\xbb\xbc\x5f\xd8\x87\xe1\x9e\x21\xc5\x58\xd3\x1d\x6d\x61\xa1\x0c\
-\xf7\x86\x68\xb1\xa3\x7d\x33\x2c\x8e\xbb\xec\x1f\x45\x17\x7c\xe3\
-\x2f\xfe\xb2\xf6\xa2\x71\xd9\xf3\xdc\x80\x73\xb8\x93\x37\x38\x86\
-\x55\xe8\xd3\xfb\x61\xbe\x00\x43\x2f\x77\xb6\x34\x38\xfb\x7b\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\xc6\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x16\x24\x2e\x17\x61\x26\x96\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x09\x2a\x49\x44\x41\x54\x78\xda\xed\x9d\xc9\
-\x72\xdb\xd8\x15\x86\xbf\x0b\x92\xd6\xd0\x92\x6c\xab\x6d\xc7\xe9\
-\x76\x75\x75\xa5\x2a\x59\xf9\x15\xb2\x75\xb6\x59\x66\xdb\x79\x84\
-\xf4\x03\x65\x9b\xad\xb7\x79\x90\x0c\x2d\xcb\xb6\x44\x8a\xa4\x48\
-\x90\xe0\x84\x79\xb8\x59\x9c\x0b\x01\x52\xcb\x8b\x54\x91\x16\x48\
-\xdd\x53\x75\x0b\x2c\x2d\x24\x0a\x9f\xce\xfc\x13\x52\x5a\x6b\xac\
-\x35\xc7\x1c\x7b\x0b\x2c\x10\x6b\x16\x88\x05\x62\xcd\x02\xb1\x40\
-\xac\x59\x20\x16\x88\x35\x0b\xc4\x02\xb1\x66\x81\x58\xb3\x40\x2c\
-\x10\x6b\x16\x88\x05\x62\xcd\x02\xd9\x71\x6b\xaf\xe3\x9b\x84\xa1\
-\x26\x0c\x21\x0c\x34\x41\x00\x69\x0e\x99\x86\x5c\x2b\x32\xad\x28\
-\x76\x74\x07\xf6\xa4\x03\xc7\xdf\xc0\xf1\xa1\x5c\x0f\xf7\x1b\x03\
-\x04\xdc\x71\xc1\xc4\xd5\xfb\xae\xab\xdf\xfb\x31\xef\xa2\xc2\x21\
-\xca\x21\x2a\x20\xd3\x6a\x27\x81\x1c\x1d\xc2\x9b\x57\xfc\xfd\xfb\
-\x57\xfc\xf5\x8d\xd3\x24\x20\x81\x66\xe2\xea\xfd\xcb\xcb\x22\xbc\
-\xbc\x28\xf0\x7c\xc5\x2a\x87\x55\xe6\xb0\xca\x15\x49\xb1\x9b\x1e\
-\x72\xfa\x14\x56\xbf\xe3\x27\xc7\xc1\x7b\x7e\xc2\xcf\x2f\x9f\x37\
-\x04\x48\x10\x80\xeb\xea\xf7\x97\x17\x05\xff\xfe\x57\xce\x68\xe1\
-\xe0\xa5\x30\xcb\x14\xb3\x14\xe2\x1d\x05\xf2\xfa\x5b\x70\x14\x3c\
-\x3b\xe6\x6f\x3f\xfe\x96\x9f\x1b\x93\x43\x8a\x42\x93\xa6\xfa\x6d\
-\x14\x09\x1c\xdf\xd7\xf8\x29\xf8\x29\xac\x52\xc8\x1d\xd8\x7f\x22\
-\x67\xef\x09\x74\xda\x0d\xbf\xd3\x0a\x14\x50\x68\xd0\x45\x75\x4d\
-\x73\x88\xd3\xea\x2c\x02\x08\x22\x48\x52\xc8\xd7\xf4\x47\xb7\xbe\
-\x5b\xa3\x39\x30\x57\x94\x29\xdf\x1c\xa0\x05\xec\x75\xe0\xf4\x58\
-\x5c\xfc\xf4\xa9\xc4\x5a\xd5\x60\x10\xe5\x9b\x2b\x0a\xc8\x32\xc8\
-\x33\xc8\x72\xf0\x43\x98\xf9\xe0\xad\xe4\xda\xd8\x2a\xeb\x0b\xbf\
-\x1b\x2d\xf3\x03\x0e\xdb\xf0\xe2\x18\xde\xbc\x84\x37\xbf\x81\x67\
-\x27\xcd\x04\x52\xc2\x50\xe6\x64\x19\x24\x89\x9c\x34\x85\xe9\x12\
-\x06\x53\xf1\x18\x3f\xde\x06\x20\xa6\xbc\x55\xfa\xb6\x87\x1c\x76\
-\x04\xc8\x0f\xaf\xe0\x0f\x3f\xc0\xab\xd3\x86\x02\x51\xb7\x4f\x92\
-\x42\x1c\x41\x14\x41\x1c\xc3\x70\x0a\x5a\xc3\x2a\x02\x77\xde\x70\
-\x20\xfa\xce\xb5\x84\xd2\x02\x9e\xb4\xe1\xe8\x00\xbe\x3d\x81\xd7\
-\x2f\xe0\xbb\x97\xb5\xbf\xc8\x46\xba\x49\x55\xac\x2c\x14\x90\x41\
-\x1a\xca\x95\x1c\xd8\x60\x91\xd2\x5e\xbb\x83\xe8\xea\xf7\x2a\xbd\
-\xa4\xe3\x48\x1e\x39\x38\x80\xe3\x23\x38\x39\xf9\xe2\x3d\x78\x50\
-\x2b\xb4\xe4\x0d\x6d\xae\x41\x00\x51\x0c\xde\x0c\xc6\x63\x18\x4c\
-\x60\xea\xc9\xd7\xb3\x0c\xda\x7b\x4d\x05\x52\x73\x0f\x5d\x4b\xec\
-\x4a\x9b\x3c\xe2\x48\x75\x75\x78\x00\x47\x47\x70\xf2\xb4\x99\xc5\
-\x55\x9e\x4b\x02\xcf\x73\xb9\xe1\x4a\x49\xb8\x9a\xcd\xa0\x3f\x34\
-\x40\x02\xf0\x7d\x48\x33\xd8\x6f\xaa\x87\xe8\x3b\x55\x56\x7d\x50\
-\xe6\x94\x40\x8c\x87\x1c\xdd\xe3\x21\x4d\xb1\x34\xad\x9d\x44\x5c\
-\x37\x8a\xc0\x9b\xc3\x60\x28\x09\x7d\x91\x81\x9f\x09\xb0\xed\x08\
-\x59\xb5\x1c\xa2\xca\xd0\xa5\xa0\xdd\x92\xd9\xcf\xde\x1e\xec\xef\
-\x37\x03\x80\xd6\x72\xca\xd7\x99\xb9\xd1\x61\x28\x61\x69\x36\x87\
-\xe9\x1c\x26\x33\x70\x67\x30\x5d\x40\x08\x44\x26\x95\x6c\x55\xd9\
-\x7b\x17\xd0\xfd\x5f\x78\xe0\x9c\x51\x40\x91\x4b\x53\x97\xe7\x12\
-\x9a\x26\xd3\xea\xf4\xfa\x70\x31\x84\xd1\x42\x3c\x23\x04\x12\x93\
-\xdb\xf5\x36\x02\xf9\x12\x0b\xad\x25\x3e\x37\x01\x48\x96\x49\x3e\
-\xc8\x52\xf1\x88\xc1\x10\xae\xfa\x02\x63\xe0\xc2\x70\x52\x01\x89\
-\x80\x74\x57\x80\x34\x0d\x4a\x59\x49\x65\x99\xe4\x8b\x38\x16\x0f\
-\x19\x0c\xe1\xfc\x33\x9c\x7d\x00\x77\x01\xb3\x08\xe6\x31\x2c\x52\
-\x88\x4d\xc5\x5b\x6c\xb0\xf2\x6d\x6f\xfa\xe6\xeb\x7b\x40\x3c\x24\
-\x84\xf2\x4d\x15\x5a\x3a\xf0\xd0\xcc\xdf\x82\x00\xc6\x13\xe8\x5f\
-\xc3\x65\x0f\xce\x2f\x60\x16\x56\x39\x23\x32\x9e\xb1\x69\x6b\xfa\
-\x98\x6f\xed\x1e\x51\x98\x7c\x91\xe7\xd2\x5f\x4c\xa6\x30\x35\x39\
-\xe3\x73\x0f\x7a\xd7\xe0\xae\xc0\x2f\xaa\x10\x95\x7f\xc5\xf4\xf7\
-\x68\x80\xdc\xe4\x8c\xb4\x9a\x51\x79\x9e\x84\xa8\x5e\x5f\xf2\xc6\
-\x60\x22\x79\x63\x62\x80\xc4\xb5\xe6\xdc\x02\xd9\x40\x0c\x2d\x1b\
-\xbe\x38\x81\x28\x94\xae\xfb\x6a\x00\xe7\x9f\xe0\xec\x23\x78\xbe\
-\x84\xa9\x59\x08\x7e\x2e\xde\x51\xe6\x0b\x0b\x64\xcd\x30\x0a\x03\
-\x24\x31\x30\x7c\x5f\x80\xf4\x87\xf0\xe9\x12\xfe\x73\x26\x10\xa2\
-\x5a\xce\x78\x88\xbd\xda\xce\x02\xa9\xe7\x8c\xa2\x30\xe3\x73\x4f\
-\xc2\x94\xe7\xc1\xc4\x93\xc4\xdd\x1f\xc3\xd4\x87\x50\x57\x3d\xc6\
-\xd7\xf4\x88\x47\x07\xa4\xde\x7d\x4f\xa7\xe2\x11\xfd\x81\x5c\xaf\
-\xc6\xd0\x77\x25\x54\xd5\x9b\xbe\xfc\x01\xdf\xf7\x4e\x87\xac\x3c\
-\x97\x24\x9e\xa4\x10\x06\x26\x67\xf4\x25\x67\x7c\xba\x14\xcf\x98\
-\xfa\x32\x30\x0c\x75\x35\x59\x2f\x2c\x90\x0d\x79\x48\x2e\x5d\x78\
-\x12\x43\x10\x56\xe3\x90\xb3\x8f\x92\x33\x42\x2d\x9e\x11\x6a\x39\
-\x4d\x98\xee\xb4\x77\x2d\x44\x95\xd7\x28\x82\xf9\x02\xe6\x73\x19\
-\x89\xb8\xae\xf4\x19\x83\x89\x84\x28\x3f\x97\xb2\x36\xa9\x35\x7c\
-\x4d\x18\xb5\xed\x14\x90\xb2\xe1\xcb\x32\xa9\xa2\x5c\x17\x86\xd7\
-\x30\x30\xa7\x37\x32\x40\x4c\x07\x9e\x51\x95\xb6\x4d\x99\x7b\xb6\
-\x77\x2e\x44\x99\x5d\x86\xef\x83\x3b\x81\xee\x15\x7c\xbc\x80\x6e\
-\x1f\x26\x4b\xe9\xc2\x67\x61\x55\xd6\x6e\x78\x23\x6b\x3d\x24\x4d\
-\x65\x50\xb8\x5a\xc9\x6c\xaa\x7b\x05\xbf\x7c\x80\x8f\x97\x10\x14\
-\xd2\x81\x07\xa6\xdf\x80\xc6\x6d\x04\xb6\x17\x88\xae\x8b\xd8\xb4\
-\x94\xb5\x8b\x45\x75\x06\x23\xe8\x0d\x64\x14\xe2\x2e\xc4\x2b\x62\
-\xaa\xbc\xd1\x54\x31\xe5\xf6\x02\x29\x44\xbc\x56\xee\xc1\x97\x4b\
-\x18\xb9\x70\x7d\x0d\xa3\xb1\x4c\x6d\xbb\x43\xb8\xf6\x64\x7c\x5e\
-\xdf\x65\x34\x59\xd9\xba\xb5\x40\x8a\x5a\x88\x4a\x13\x58\xae\x44\
-\x19\x72\xd9\x83\x8b\x2e\x5c\x0d\x61\xbc\x00\x77\x09\x8b\xa8\x5a\
-\xbb\xe6\x0d\x0c\x53\x3b\x13\xb2\xf2\xda\x72\x69\xb5\x84\xb1\x0b\
-\xdd\x1e\xfc\x72\x06\xdd\x6b\xd1\x15\x2f\x33\x58\x99\x6d\x9f\x6e\
-\x68\xde\xd8\x4a\x20\xa5\x20\x41\xd7\x72\xc6\x72\x29\x9e\xb1\x5a\
-\x4a\x15\x75\x35\x94\xd9\xd4\x60\x0a\xe3\x59\x35\x24\x8c\x1f\x78\
-\x1c\xb2\x93\x40\xca\xc5\x52\x61\xf2\xc6\x62\x21\x39\x63\x3c\x96\
-\x6b\x7f\x08\x17\x03\x18\xcd\x60\x99\x08\x88\xa4\x81\x65\xed\x4e\
-\x79\xc8\x4d\xce\x48\xa5\x0b\xbf\x36\xeb\xd6\xcb\x9e\x78\xc6\x68\
-\x06\xa3\x39\x2c\x92\x6a\xe5\xda\xf4\x9c\xb1\xd5\x1e\x52\x17\x24\
-\x2c\x16\x70\x3d\x86\xcf\x5d\xf8\xef\x99\x08\xa1\x97\x89\xc0\x28\
-\x3d\xa4\xec\xc0\x2d\x90\x35\xe6\x8c\xf2\x75\x14\x49\xf7\xed\xfb\
-\xd2\xf4\x0d\x47\x52\xda\x5e\x0d\x65\x0f\x3e\x9a\x49\xae\xf8\x9a\
-\x82\x84\x47\x05\xa4\x2e\x48\x28\x72\x09\x51\xae\x2b\xe3\x90\xf1\
-\x44\x9a\xbe\xae\x29\x6d\x57\x69\xd5\xf0\x6d\x5b\x88\xda\x2a\x20\
-\x99\x11\xb0\xa5\x99\x4c\x6d\x87\xd7\x32\x0a\xe9\x5e\x19\x11\x9b\
-\x27\x7d\xc6\x2a\x7b\x18\x41\xc2\xe3\x01\x52\xdb\xf6\x25\xa9\xec\
-\x33\x66\x73\x99\xd8\x7e\xbc\x90\xd9\x94\xbb\x90\x0e\x7c\x1e\xdd\
-\xee\x33\x0a\x0b\x64\x7d\x39\xa3\xee\x1d\x69\x8a\x79\x18\x81\x2c\
-\x97\x5c\x57\x80\x74\xfb\x32\x28\x2c\x27\xb6\xe5\xc9\xd9\x0d\x6b\
-\x37\x05\xc6\x8d\x20\x21\x97\x19\xd5\xd4\x93\x1d\xf8\xd4\xab\x89\
-\xd8\x46\x32\x42\x0f\x8c\x66\x2a\xdd\x81\x10\xd5\x58\x0f\xa9\x0b\
-\x12\x92\x44\x54\x85\x7d\x23\x7c\xbe\xea\x43\x7f\x22\xcb\x25\xf7\
-\x1e\x11\x1b\x16\xc8\x06\x80\x98\x4d\x5f\x12\x9b\x0f\xc9\x78\xa2\
-\x0e\x39\xff\x0c\x67\xe7\xb2\x76\xf5\x8c\x88\x2d\xc8\xab\x11\xba\
-\xb6\x1e\xf2\xff\x9b\xfa\xc2\xeb\x32\x6f\x14\x66\x94\x9e\x24\x55\
-\xbf\x51\x4a\x76\x3e\x5d\x54\x22\xb6\xba\xf0\x79\x47\x1f\x0e\xf1\
-\x00\x1e\xa2\xb8\x51\x12\xd6\x45\x6c\x9e\x27\x61\xca\x33\x39\xe3\
-\xfc\xf2\xb6\x88\xad\x0c\x51\xbb\x0a\xe2\x41\x43\x96\xe6\xb6\x20\
-\x21\x34\x12\x9d\xc1\x7d\x22\xb6\xa0\x12\xb1\xed\x62\x12\x7f\x50\
-\x20\xe5\x07\x74\x6e\x54\x85\xf7\x89\xd8\x3e\x4b\x98\x2a\x05\x6c\
-\xa5\x87\x94\xde\x61\x3d\x64\x83\x49\xfc\xae\x88\xed\xaa\x0f\x1f\
-\xce\x25\x67\x04\x46\xc4\x16\x68\x39\xec\xb8\x67\x6c\x1c\xc8\xcd\
-\x27\x70\xcb\xce\xbb\x94\x75\x1a\x89\xce\x7c\x2e\xf3\xa9\x52\xc4\
-\x76\x61\x44\x6c\x53\x1f\x56\x79\x25\x48\xc8\x79\x3c\x30\x36\x06\
-\x44\xdd\x39\x14\x35\x20\x71\xa5\x99\x1a\x5e\x57\x42\xb6\xde\x48\
-\x7a\x0d\x2f\xbc\x2d\x48\xc8\x1f\x11\x8c\xaf\xe6\x21\x4a\x83\xbe\
-\xa3\x99\x2a\x45\x6c\x9f\xee\x11\xb1\x85\x34\x43\xf8\xbc\x73\x39\
-\xe4\xc6\x43\xf4\x6d\x0f\x59\xa9\x4a\x90\x70\x66\x44\x6c\xbe\x11\
-\xb1\x95\xfd\x06\x8f\xcc\x33\x36\x0a\xa4\x9c\xba\xe6\x26\xec\x04\
-\x99\x3c\xf4\x6b\xe8\xc2\x71\x4f\x1e\xb3\xd1\x1d\x48\xce\x18\x2f\
-\xaa\x41\x61\x39\x9f\x2a\x78\xbc\xb6\x31\x20\xb9\xb9\xb9\x31\xb2\
-\x52\x1d\xcd\x60\xaf\x2f\xbd\x47\xa7\x2d\x5b\xbe\xe1\x54\x46\xe8\
-\x21\xdb\x21\x62\xdb\x6a\x20\x59\x0d\x88\x4e\x44\x7c\x50\x68\x49\
-\xe8\x2d\x07\x26\x8b\xea\x83\xf9\x75\x11\x9b\x05\xb2\x89\x1e\xe3\
-\x8e\x87\xc4\x09\x14\x73\x08\x7c\x98\x8c\xa5\x41\xf4\x53\x79\xaa\
-\x8e\x5f\x5b\x2e\xed\xda\xa0\xf0\xc1\x80\x28\x05\xca\x61\xda\x72\
-\xf8\xce\x69\x81\xe3\x80\x72\x40\x2b\x03\xa7\x80\x20\x86\xcc\x84\
-\x27\x65\x46\x21\xe5\x29\xee\x2b\x04\xb6\xc0\xca\xc7\x4f\xa9\x26\
-\x02\x71\x1c\xa6\xad\x36\xdf\x75\x3a\xd0\xe9\x40\xbb\x80\x56\x0e\
-\x2d\x55\x8d\xc9\x4b\xaf\x51\xb5\xfe\xa2\x7c\x0c\xe0\x36\x5a\xab\
-\x06\x44\x35\x0d\x48\xab\x45\xbf\xdd\xe2\x6d\xa7\x03\xed\x36\xb4\
-\x33\x79\x70\x59\xf9\x86\x75\x0d\x82\xa2\x82\xa4\x76\x00\x88\xd3\
-\x60\x0f\xa1\xd3\x91\x2a\xaa\xdd\x92\xe4\xdd\x52\xb7\x81\xe4\x77\
-\xfe\x9a\xb6\xf9\xdf\x33\x34\xd6\x43\x3a\x1d\xc5\xc1\x81\x7a\x7f\
-\x7c\xc2\x5f\x4e\x4f\x15\x59\x4b\xd1\x0a\x15\xed\x08\x9e\x84\x10\
-\xe5\xb7\x93\xf6\xad\x2e\x7e\x8b\x72\xc6\x5d\x7b\x75\x0a\xcf\x4f\
-\xe0\x9b\x83\xf5\x3d\xad\x7b\x2d\xdf\x66\x7f\x1f\x9e\x9f\xaa\x7f\
-\x7c\x1f\x39\xef\x1c\xa5\x7e\x7a\xe1\xc3\x32\x51\x2c\x63\xc5\x32\
-\x91\x47\x74\xdf\xad\xa0\x7e\x35\xef\xda\x42\x7b\x76\x02\xbf\xff\
-\x11\x5e\xbf\xe0\x4f\x87\x07\x6b\x9a\x6e\xac\xe3\x1f\xdc\xcf\xe7\
-\x9a\x99\xa7\x99\xcd\x0a\x3c\x4f\xff\x31\x88\xd5\x9f\xa3\x4c\xbd\
-\x8b\x32\xf5\x36\xca\x14\x59\xa1\x7e\x35\x0a\x51\x5b\x58\x55\xdd\
-\xb5\xc3\x03\x81\xf1\xfa\x25\xff\x7c\xfd\x52\x1e\xa3\xde\x08\x20\
-\x49\x02\x71\xa4\x89\x63\x4d\x1c\xcb\x7e\x3c\x2b\x14\xb9\x96\xab\
-\xd6\xf7\xf7\x17\xdb\xfe\x5f\x45\x3a\x6d\x81\x72\x78\x20\xcf\xb3\
-\xdf\xdf\x6b\x08\x10\x6b\xeb\xed\x6d\xac\x59\x20\xd6\x2c\x10\x0b\
-\xc4\x9a\x05\x62\x81\x58\xb3\x40\x2c\x10\x6b\x16\x88\x05\x62\xcd\
-\x02\xb1\x66\x81\x58\x20\xd6\x2c\x10\x0b\xc4\x9a\x05\xb2\xcb\xf6\
-\x3f\x8d\xd4\x46\x6a\xca\x77\xbf\xa4\x00\x00\x00\x00\x49\x45\x4e\
-\x44\xae\x42\x60\x82\
-\x00\x00\x0b\x6e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x64\x00\x00\x00\x64\x08\x06\x00\x00\x00\x70\xe2\x95\x54\
-\x00\x00\x00\x06\x62\x4b\x47\x44\x00\xff\x00\xff\x00\xff\xa0\xbd\
-\xa7\x93\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\
-\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x00\x07\x74\x49\x4d\x45\x07\
-\xe2\x09\x01\x0d\x29\x34\x4f\xde\xed\x30\x00\x00\x00\x1d\x69\x54\
-\x58\x74\x43\x6f\x6d\x6d\x65\x6e\x74\x00\x00\x00\x00\x00\x43\x72\
-\x65\x61\x74\x65\x64\x20\x77\x69\x74\x68\x20\x47\x49\x4d\x50\x64\
-\x2e\x65\x07\x00\x00\x0a\xd2\x49\x44\x41\x54\x78\xda\xed\xdd\xcf\
-\x53\x1b\xe7\x1d\xc7\xf1\xf7\x4a\x0f\x62\x2d\xd6\x62\x2d\xcb\x66\
-\xa1\x58\x10\x44\x6c\x85\x50\x24\xbb\x18\x33\x76\xa6\x76\x67\x72\
-\xe9\x29\xc7\x1c\x7c\x4a\x6e\x3d\xf7\x1f\x70\xff\x80\xf6\x98\xde\
-\xf2\x77\x94\x49\x27\x13\x3c\xd8\xa1\x8e\x4a\x54\xfc\xa3\x8a\x23\
-\xe3\x85\x08\x8f\x50\x05\xac\xcd\x22\xaf\x96\x45\xea\x41\x06\x07\
-\xdb\x89\x01\x4b\x62\x57\xf0\x9d\xe1\xa6\x99\x87\xd5\x67\x5f\xfb\
-\x3c\xdf\xdd\x87\x45\xaa\x56\xab\x78\xbd\x74\x5d\x67\x72\x72\xb2\
-\x0a\x70\xf5\xea\x55\xa9\xbf\xbf\xdf\xb3\xc7\x22\xbc\x1c\x84\x69\
-\x9a\xe4\xf3\x79\x32\x99\xcc\x97\xd9\x6c\x16\x9f\x4f\xd0\xdd\xdd\
-\xf7\x27\x9f\x4f\xfe\x7b\x24\xa2\x12\x0c\xca\x47\x81\x34\xb3\xf2\
-\xf9\x3c\x13\x13\x13\xd5\xe9\xe9\x69\x32\x99\x0c\x81\x80\x82\x61\
-\xf0\xc5\xf2\x72\xf9\x8b\x2b\x57\x12\x52\x34\xaa\x1d\x05\xd2\x4c\
-\x19\xa9\x54\xaa\x3a\x35\x35\xc5\xec\xec\x3d\x4c\xd3\x22\x10\x70\
-\x98\x99\x49\x53\xa9\xc0\xf1\xe3\xed\x5f\x02\x9f\x7b\x4d\x8a\xf0\
-\xb2\x8c\xa9\xa9\x29\xd2\xe9\x34\xa5\x92\x43\x6f\x6f\x1c\x9f\x4f\
-\x90\xcf\xeb\x4c\x4f\x1b\x00\x9f\xad\xad\x95\x3f\xf3\x9a\x14\xe1\
-\x65\x19\x99\x4c\x06\x59\x96\x89\x46\x7b\x19\x1e\x1e\xc7\x71\x1c\
-\x52\x29\x03\xc3\x30\x98\x9d\x4d\x03\xde\x93\x22\xbc\x2c\x43\x96\
-\x65\xae\x5d\xbb\xc6\x85\x0b\xa3\xc4\x62\xe7\x30\x4d\x13\x55\x85\
-\x74\x3a\x4d\x36\xeb\x4d\x29\xc2\xcb\x32\xe2\xf1\x38\xe3\xe3\xe3\
-\x8c\x8e\x8e\xd2\xd5\xd5\x85\x69\x9a\x54\xab\x65\x7c\x3e\x78\xf6\
-\xcc\xa0\x50\xf0\x9e\x14\xe1\x65\x19\xe3\xe3\xe3\x24\x12\x09\xba\
-\xba\xba\x90\x65\x19\x21\x04\x89\x44\x82\xf6\xf6\x76\x00\x66\x66\
-\xbc\x27\x45\xb4\x82\x0c\x45\x51\x6a\x07\x23\x04\x9a\x56\xfb\xb2\
-\xcb\xe5\x32\xe0\x3d\x29\xa2\x15\x64\xbc\x5a\xaa\xaa\x7a\x56\x8a\
-\x68\x05\x19\xaf\x96\x2c\xcb\x9e\x95\x22\x5a\x49\x46\x2b\x48\x11\
-\xad\x24\xa3\x15\xa4\x88\x56\x94\xe1\x65\x29\xa2\x15\x65\x78\x59\
-\x8a\x68\x65\x19\x5e\x94\x22\x5a\x59\x86\x17\xa5\x88\xc3\x20\xc3\
-\x4b\x52\xc4\x61\x90\xe1\x25\x29\xe2\x30\xc9\xf0\x82\x14\x71\x98\
-\x64\x78\x41\x8a\x38\x8c\x32\xdc\x2c\x45\x1c\x46\x19\x6e\x96\x22\
-\x0e\xb3\x0c\x37\x4a\x11\x87\x59\x86\x1b\xa5\x88\x23\x19\xee\x92\
-\x22\x0e\x97\x8c\x2a\x54\x2b\xd8\xb6\x8d\xb9\xfe\x1c\x90\x50\x94\
-\x0e\x02\x81\x80\x6b\xa4\x88\x43\x25\xa3\x5a\x81\xea\x06\xe6\xda\
-\x2a\x8f\xe6\x72\x20\xf9\x89\xc5\x06\x08\x87\x03\xae\x91\x22\x0e\
-\x87\x8c\x5a\xd9\xb6\x8d\xb9\xb6\xca\xdc\xdc\x63\xee\xdc\xf9\x1e\
-\x24\x3f\x92\x24\x01\xb8\x46\x8a\x38\x14\x32\xb6\x4e\x98\xf5\xe7\
-\x3c\x9a\xcb\x71\xe7\xce\xf7\xfc\x63\x62\x02\xa8\x85\x51\xad\x56\
-\x5d\x23\x45\x1c\x06\x19\x2f\x7f\xcf\x75\xb2\x8f\x1e\x33\x7b\xf7\
-\x3e\x0f\x1e\xfc\x17\xc7\x71\x08\x85\x3a\xb1\x6d\x9b\xd5\xd5\x15\
-\xa2\xd1\x33\xa8\xaa\x8a\xa2\x28\xdb\xdb\x8a\x9a\x2d\xc5\x7f\xe3\
-\xc6\x8d\x77\x3e\xd0\x85\x85\x05\x26\x26\x26\xaa\x5f\x7d\xf5\x15\
-\xe9\x74\x1a\x21\x04\xd7\xae\x5d\xe3\xe3\x8f\x3f\x26\x91\x48\xd0\
-\xd3\xd3\x83\x2c\xcb\xf8\x7c\xbe\x03\x0d\x64\x71\x71\x91\x5b\xb7\
-\xa6\x98\x99\x99\x21\x97\xfb\x09\xc3\x30\x28\x16\x8b\xe4\x72\x39\
-\x16\x17\x73\xac\xac\xac\x20\x49\x12\xed\xed\xed\xc8\xb2\xfc\xda\
-\x25\x4c\x08\xb1\x1d\x98\x24\x49\x94\xcb\x16\xb9\x9c\xce\xd2\x52\
-\x9e\x72\x59\x3a\x0f\x6d\x37\x22\x11\xf5\x2f\x9d\x9d\xca\xc1\x08\
-\xf1\x8a\x0c\xa7\xe2\x60\x6d\x58\x14\x8c\x02\x73\xfa\x1c\x0b\x0b\
-\xf3\x94\x4a\x25\x4a\xa5\x12\x0b\x0b\xf3\xac\xac\x2c\x53\x28\x2c\
-\x51\x28\x14\x30\x0c\x83\x42\x21\x4f\x2c\xd6\x87\xa6\x69\x28\x8a\
-\x4a\x30\x58\x13\xd3\x0c\x29\xef\x24\xc4\x2b\x32\x4a\x76\x89\xa5\
-\xb5\x25\xee\x66\xee\xf2\xcd\x3f\xbf\xe1\x61\xe6\x21\x96\x65\x51\
-\xa9\x54\x00\xa8\x54\x2a\x58\x96\xc5\xca\xca\x0a\xba\xae\x33\x3f\
-\x9f\x65\x79\x79\x9e\xb5\xb5\x65\x36\x37\x25\x84\xd8\x29\xa6\x91\
-\x52\x44\x2b\xcb\xd8\x0e\xa4\x64\xb1\xb0\x90\x67\x6e\x2e\x47\xa1\
-\x50\xc4\x34\xcd\x9d\x82\x1c\x07\xd3\x34\xb7\x8f\xab\x50\xc8\x61\
-\x18\xb5\xcf\x16\x0a\x0e\xe6\x5a\x95\x63\xb2\x8c\xd2\x71\x0c\x24\
-\x5f\x43\xa5\xec\x2b\x10\xaf\x75\xe0\xe6\x53\x8b\xec\x6c\x9e\xec\
-\x7f\xf2\x98\x4f\xad\x5d\x9c\x70\x16\xd9\x6c\x9e\x95\x15\xd0\x75\
-\x78\xf6\x54\xa2\x2f\xaa\xd1\xd3\x7d\x12\x68\x03\xc9\xdf\xb0\xd5\
-\x97\x68\x65\x19\xdb\x02\x6c\x07\x73\xd5\xc4\x5c\x35\x71\x6c\x67\
-\x17\xfd\x8a\xc3\xca\x8a\x89\xe3\x18\x04\x02\x06\xa6\x69\xe2\x38\
-\x4e\x53\xee\x7d\x89\x56\x96\xf1\x72\x75\x04\x8a\x52\xfb\x11\x7b\
-\x38\x62\x45\x91\x19\x1c\xd4\x18\x1c\xec\x41\x39\x7e\x1c\xa4\x36\
-\x90\x7c\x0d\xed\x53\x44\x33\x64\x6c\xad\x72\x2c\xcb\xc2\x5a\xb7\
-\x76\x75\x96\xd6\xa3\x7c\x3e\x1f\x42\xb4\x61\x59\xcf\xd1\xb4\x30\
-\x23\xbf\x3d\x47\x65\x73\x1d\xad\xeb\x04\xc5\xe5\x02\xa5\x52\x19\
-\x90\x11\x22\x80\x2c\xb7\xe1\x38\x0e\x86\xb1\x46\xa9\x54\xc2\x71\
-\x2c\x42\xa1\x0e\x86\x3e\x78\x8f\xa1\xa1\x01\x42\x9d\xa1\xed\x4b\
-\x55\x23\xa5\x88\x66\xc8\xb0\x36\x2c\x96\xd6\x96\xc8\xe7\xf3\xe4\
-\xe7\xf2\x98\xab\x66\x53\x02\x09\x04\x02\x28\x4a\x08\x55\x55\x89\
-\xc5\x06\x79\x7f\x70\x80\xab\xbf\x1f\xe7\xe1\xc3\x7b\xdc\xba\xfd\
-\x35\x0b\x3f\xfd\x0f\xd0\x50\x94\x93\x68\xda\x71\x4c\xd3\x24\x9d\
-\xfe\x91\x85\x85\x79\x4c\x33\x8f\xda\x19\x22\x31\x32\x44\x62\x64\
-\x08\xb5\x33\xd4\x94\xbb\xc4\xa2\x19\x73\x86\x6d\xdb\xb5\x25\xe5\
-\xfc\x4f\x64\xd2\x3f\x52\x58\x2c\xe0\x38\x16\x95\x8a\xd3\xe0\x40\
-\xda\x51\x94\xe3\xf4\xf6\xf6\xf2\xe1\x87\x43\x44\xfb\x7a\xe8\x7f\
-\xbf\x9f\xd0\x49\x19\x49\xd8\x3c\x59\x5c\x7d\x11\x48\x18\x4d\x0b\
-\x61\xae\xad\xa1\x76\x6a\x64\xb3\x1a\xf9\xa5\xc7\x9c\x3d\x3b\xc0\
-\xc0\xc0\x40\xed\xec\x97\xda\xde\x3a\x5e\x3d\xa4\x88\x66\xcc\x19\
-\x4e\x79\x13\xb3\x50\x22\xff\x68\x99\xcc\xfd\x45\xe6\xb2\x8f\x30\
-\xcd\x3c\xb6\x6d\x36\xe5\x92\x15\x89\x44\x48\xa7\x63\x0c\x25\x3e\
-\x20\x79\x79\x84\x9e\x1e\x8d\xdf\x5d\xfa\x03\x17\x37\xdb\x76\x5e\
-\xb2\x36\xca\x24\x46\xce\x92\xcb\x2d\xf2\xc3\xc3\x1f\x09\x85\x42\
-\x44\x4e\xf5\xfc\xe2\xdc\xd1\x08\x29\xa2\x19\xab\x29\xe1\x13\x28\
-\xed\x0a\x91\xd0\x49\x7a\xbb\xbb\xb1\xcb\x25\x8a\xc6\x06\xc5\xa2\
-\x43\x71\xc9\xc0\x7c\x66\x36\x54\xcc\x93\x27\x8b\xb5\x4e\x7c\xb5\
-\x80\xb1\xf1\x94\xe1\xe1\x61\xce\x9d\x39\x47\xef\xe9\x6e\x54\x55\
-\x7d\x79\x52\x55\x37\xa1\x4f\x23\x1a\xd5\xe8\xd2\xba\x40\xf2\xa3\
-\x9e\x38\xf9\x8b\x73\x47\x23\xa4\xbc\xb1\x53\xaf\x77\x07\xee\xf7\
-\xfb\x51\x14\x85\x6e\xed\x14\xf1\x73\x51\x3e\x1c\x19\xe0\xfd\xe4\
-\x00\xea\xe9\xd3\x98\x06\x98\xcf\x6c\x1c\xc7\x62\x73\xd3\x6e\x48\
-\x20\x3b\x3a\xf1\xac\xce\x93\xf9\x27\x94\xd7\xcb\xf8\x7d\xfe\xed\
-\x8e\x1b\x00\x49\x02\x7c\xf8\x45\x00\xe5\x78\x88\x70\x38\x8c\xa2\
-\x74\xe0\xf7\xfb\xf7\x35\xee\x7e\x3a\x7a\xd1\x8c\x3e\x23\x10\x08\
-\x10\x0e\x07\x08\x9f\x08\x41\x9f\x86\x59\x3e\xc3\x92\xd9\x47\x20\
-\xa0\xf0\xf0\xfb\xff\xb1\xf0\x28\x8f\xcf\xd7\xb8\xa7\xc9\x3b\x3a\
-\xf1\x27\xb5\x45\x85\xec\x97\x51\x43\x2a\xb1\x58\xec\x67\x9f\x94\
-\x40\xf2\x13\x68\x3f\x46\xb8\xfd\xd8\x3b\x8f\xbb\x1f\x29\xa2\xa9\
-\x7d\x86\xe4\x03\xda\x90\xdb\x3a\xe8\x52\xa0\xab\x23\x8c\x2c\x02\
-\x4d\xef\x4b\x2c\xcb\xaa\xad\xf8\xf2\x79\x2c\xcb\x6a\xf8\x78\x7b\
-\x99\x53\x44\x73\x3b\xf0\xda\x19\x28\xfc\x01\x14\xa9\x8a\x12\x38\
-\x86\xf0\xf9\x9b\x1e\xc8\xcf\xc5\xbc\xa9\x03\xaf\x77\xed\x56\x4a\
-\xa9\x64\x7d\x2e\xbc\xdc\x81\x7b\xad\xde\x26\xe5\xfe\xfd\xf9\xcf\
-\x84\xae\xeb\x64\x32\x99\x2f\xa7\xa7\xa7\x99\x9d\x4d\x53\x2a\x19\
-\x44\xa3\x71\x2e\x5c\x48\xba\xf6\xde\x94\x57\xeb\x55\x29\xb6\xed\
-\xa0\xeb\x39\x72\xb9\x1c\xa9\x54\x8a\x6c\x56\x47\x4c\x4e\x4e\x56\
-\xb3\xd9\x2c\x99\x4c\x06\xd3\x34\xe8\xed\x55\x19\x1e\xee\x27\x16\
-\xeb\x3b\x92\xd1\x60\x29\xeb\xeb\x1b\xa4\xd3\x3a\x85\x42\x1a\x5d\
-\xcf\x00\x4e\x6d\x0e\x11\x42\xa0\x28\x0a\xa5\x92\x82\x10\x62\xc7\
-\x35\x56\x08\xb1\xfd\x6c\xf9\xa8\xea\xb5\x0c\x77\xb0\x6d\x13\xdb\
-\x36\xa9\x54\x1c\x82\x41\x99\xda\x2a\x4b\x20\xae\x5e\xbd\x2a\xf5\
-\xf5\xf5\x8d\x02\xdf\xcd\xcc\xa4\xc8\x66\x33\xa4\x52\x19\x54\xf5\
-\x5f\x54\xab\x6d\x24\x12\x89\x6d\x66\x47\x55\x9f\x2a\x16\xf3\xdc\
-\xba\x35\xc1\xcd\x9b\x53\xe8\x7a\x9a\x48\x24\xc2\xf5\xeb\x9f\x32\
-\x32\x32\x7c\x51\xf4\xf7\xf7\x23\xcb\x72\xaa\x5c\x2e\xff\x19\xf8\
-\xeb\xb3\x67\xe6\x8b\xf7\x4d\xdd\xc3\xe7\x13\xdb\x13\xd0\x8e\x8e\
-\xf6\xa8\xf6\x55\xa5\x92\x49\xb1\x98\x67\x76\x36\xc5\xed\xdb\x53\
-\x64\x32\x0f\x90\x65\x3f\xf1\x78\x8c\xf1\xf1\x31\x69\x6c\x6c\xac\
-\x76\xc9\x7a\x71\x4d\xfb\x5b\x7b\x7b\xfb\x4d\xe0\xbb\x74\x3a\x8d\
-\xae\xeb\x18\x86\xb1\x3d\x01\x1d\x49\xa9\x9f\x8c\xdb\xb7\xa7\x98\
-\x9e\x4e\xe3\x38\x7e\x92\xc9\x8b\x5c\xbe\xfc\x11\x91\xc8\xa9\x97\
-\x9d\xfa\xcf\x66\xff\x6d\x29\x86\x51\x7b\x33\x5b\x3a\x5d\x5b\x27\
-\x37\x43\x8a\x10\x62\xc7\x7e\xa8\x46\xf4\x1f\xcd\x68\x04\xdf\x26\
-\xe3\xde\xbd\x07\x38\x8e\x9f\xde\xde\x01\x46\x47\xc7\x48\x26\x93\
-\x92\xaa\xaa\xaf\xdf\x3a\x39\x68\x29\x5b\x27\x46\xa3\x96\xd9\x5b\
-\x0d\xb0\x5b\x64\x8c\x8e\x8e\x71\xe9\xd2\x25\x69\x60\xe0\x3d\x14\
-\xa5\xe3\xf5\x40\x0e\x4a\xca\xd6\x2a\x2f\x12\x51\x48\x26\x93\xf5\
-\x0f\xbc\x5a\x05\x2a\xe4\x72\x39\xa6\xad\xe7\x98\xe6\xba\x2b\x64\
-\x8c\x8d\x8d\x49\x03\x03\xef\x11\x0e\x9f\x78\xf3\xcd\xc5\x83\x92\
-\x22\xcb\x32\xaa\xaa\x31\x3c\x3c\xc8\x27\x9f\x7c\x42\x3c\x1e\xaf\
-\x73\x20\x9b\x50\xdd\x20\x95\x4a\xa1\xeb\x3a\x59\xf3\xb1\xeb\x64\
-\xfc\x6a\x20\xcd\x96\xb2\x25\x44\xd3\x34\xe2\xf1\x38\xc9\x64\xb2\
-\xce\x81\x38\x50\x29\x63\xac\x2e\xbf\xf6\x05\xb8\x45\xc6\xaf\x06\
-\xe2\x96\x39\xa5\xd5\x56\x53\xbf\x26\x63\x57\x81\xb8\x65\xf5\xe5\
-\xd5\x3e\x63\x2f\x32\x76\x15\xc8\x91\x94\xe6\xc9\xd8\x53\x20\x47\
-\x52\x1a\x2f\x63\x4f\x81\x1c\x49\x69\xbc\x8c\x7d\x05\x72\x24\xa5\
-\x71\x32\xf6\x15\xc8\x91\x94\xc6\xc9\x78\xa7\x40\xea\x25\x65\xe7\
-\x73\x01\xf9\x50\xcb\x78\xa7\x40\xea\x25\xc5\x71\x2c\x4c\x33\x5f\
-\xdb\x47\xab\x6a\x87\x5a\x46\x5d\x02\xd9\xbf\x94\x17\xbb\x4f\xda\
-\x6a\x7b\x6f\x55\x55\xdd\xde\x50\xd6\xc8\xa7\x93\x81\x80\x20\x1c\
-\x56\x38\x7d\x5a\x25\x1c\xde\xfb\x78\x8d\x94\x51\x97\x40\xf6\x2d\
-\xe5\xc5\xfe\x2c\xe5\xf8\x29\x06\x07\x2f\x80\xd4\x49\x24\x52\x0b\
-\xb7\x91\x0b\x81\xad\xbf\xf7\x40\xb2\x88\x44\xfa\xf7\x3c\x5e\x23\
-\x65\xd4\x35\x90\x7d\x49\x79\xb1\x6f\x36\x79\xfe\x3c\x5a\x77\x37\
-\x8a\x02\xd1\x68\xa3\x6e\xbd\x4b\x2f\xc7\x4b\x9e\x47\xeb\xee\x45\
-\x51\x34\xa2\xd1\xc1\x5d\x8d\xd7\x0c\x19\x75\x0d\x64\xbf\x52\x22\
-\x11\x95\x2b\x57\x12\x58\xd6\x39\x84\x80\x60\x50\x66\xeb\x41\x4d\
-\x7d\xf3\xa8\x89\x8c\x9c\x3a\xc3\x95\x8f\xfe\x88\x65\x95\x11\x42\
-\x26\x18\x54\x76\x35\x5e\x33\x64\x34\x24\x90\xbd\x4a\x09\x06\x65\
-\x9a\xf3\x82\xc9\x9a\x90\x60\x47\x27\xd1\x8e\x4e\x57\xcd\x19\x0d\
-\x0d\xa4\xd5\xfa\x94\x66\xca\x68\x68\x20\x5e\xef\xe8\x0f\x42\x46\
-\x43\x03\xf1\xba\x94\x83\x90\xd1\x94\x40\xbc\x26\xe5\x20\x65\x34\
-\x25\x10\xaf\x49\x39\x48\x19\x4d\x0d\xc4\xed\x52\xdc\x20\xa3\xa9\
-\x81\xb8\x5d\x8a\x1b\x64\x1c\x48\x20\x6e\x93\xe2\x26\x19\x07\x12\
-\x88\xdb\xa4\xb8\x49\xc6\x81\x06\x72\xd0\x52\xdc\x28\xe3\x40\x03\
-\x39\x68\x29\x6e\x94\xe1\x8a\x40\x9a\x2d\xc5\xcd\x32\x5c\x11\x48\
-\xb3\xa5\xb8\x59\x86\xab\x02\x69\xb4\x14\x2f\xc8\x70\x55\x20\x8d\
-\x96\xe2\x05\x19\xae\x0c\xa4\xde\x52\xbc\x24\xc3\x95\x81\xd4\x5b\
-\x8a\x97\x64\xb8\x3a\x90\x77\x95\xe2\x45\x19\xae\x0e\xe4\x5d\xa5\
-\x78\x51\x86\x27\x02\xd9\xbd\x94\x2a\x6a\x67\x88\x4a\xc5\xa1\xb8\
-\x5c\x60\x76\xf6\xdf\x9e\x93\xe1\x89\x40\x76\x2d\xc5\x2a\x91\x18\
-\x19\xc2\xb6\x4d\x6e\xdd\xfe\x9a\xdb\xdf\x7e\xeb\x39\x19\x9e\x0a\
-\xe4\x6d\x52\xec\x72\x99\x75\xb3\x84\x6d\x9b\xdc\xbc\x39\x45\xe6\
-\x87\x1f\x3c\x27\x63\xab\xa4\x6a\xb5\x8a\x57\xca\xb2\x2c\x0c\xc3\
-\x20\x93\xc9\x8c\x4e\x4e\x4e\x6e\x4b\xa9\x54\xfc\xf4\xfe\xe6\x2c\
-\x95\x8a\x83\x3e\x3f\x8b\x2c\x8b\x37\xca\x78\xf5\xff\x81\x1c\x09\
-\x69\x90\x94\xb9\xb9\x1c\xc5\xe2\x5d\x64\x59\x26\x12\x39\x45\x3c\
-\x1e\xe3\xf2\xe5\x8f\x48\x26\x93\x9e\x91\xe1\xc9\x40\x7e\x69\x4e\
-\x09\x06\x53\xdc\xbb\x97\x21\x12\x51\xb9\x7e\xfd\x53\xc6\xc7\xc7\
-\xa4\x48\xe4\xd4\x8b\x0d\xdc\x1d\x9e\x3a\x36\x4f\x06\xb2\x25\xc5\
-\xb2\xac\xd4\xfc\xfc\x3c\xba\xae\xe3\xf3\x39\x04\x83\x82\x91\x91\
-\xe1\x8b\x63\x63\x63\x78\xb5\xfe\x0f\x9c\x64\x10\x7d\x26\xa5\x38\
-\x2c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
 "
 
 qt_resource_name = b"\
@@ -7618,185 +399,38 @@ qt_resource_name = b"\
 \x00\x73\
 \x00\x61\x00\x72\x00\x74\x00\x6f\x00\x70\x00\x6f\x00\x5f\x00\x61\x00\x64\x00\x64\x00\x72\x00\x65\x00\x73\x00\x73\
 \x00\x0f\
-\x01\x0e\x52\x47\
-\x00\x72\
-\x00\x65\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2d\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
 \x00\x2d\xf5\x47\
 \x00\x74\
 \x00\x61\x00\x6c\x00\x6c\x00\x5f\x00\x78\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x01\x0e\x52\x47\
+\x00\x72\
+\x00\x65\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2d\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
 \x00\x10\
 \x0a\xb7\xe2\x67\
 \x00\x6f\
 \x00\x70\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x73\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0f\
-\x00\xe4\x10\x73\
-\x00\x73\
-\x00\x61\x00\x72\x00\x74\x00\x6f\x00\x70\x00\x6f\x00\x5f\x00\x6d\x00\x61\x00\x72\x00\x6b\x00\x65\x00\x72\x00\x73\
-\x00\x0d\
-\x06\x6e\x60\x27\
-\x00\x68\
-\x00\x6f\x00\x75\x00\x73\x00\x65\x00\x5f\x00\x72\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x14\
-\x06\x9a\x14\xe7\
-\x00\x73\
-\x00\x68\x00\x65\x00\x6c\x00\x74\x00\x65\x00\x72\x00\x5f\x00\x69\x00\x6e\x00\x5f\x00\x70\x00\x6c\x00\x61\x00\x63\x00\x65\x00\x2e\
-\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x04\xd8\x17\x07\
-\x00\x65\
-\x00\x76\x00\x61\x00\x63\x00\x2d\x00\x6c\x00\x65\x00\x61\x00\x76\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x0c\x05\x3b\x47\
-\x00\x66\
-\x00\x6f\x00\x6c\x00\x6c\x00\x6f\x00\x77\x00\x5f\x00\x75\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x0b\x67\x57\x87\
-\x00\x64\
-\x00\x6f\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x17\
-\x03\x05\xc5\x27\
-\x00\x73\
-\x00\x74\x00\x72\x00\x75\x00\x63\x00\x74\x00\x75\x00\x72\x00\x65\x00\x5f\x00\x64\x00\x65\x00\x73\x00\x74\x00\x72\x00\x6f\x00\x79\
-\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x07\xa2\x16\x07\
-\x00\x61\
-\x00\x73\x00\x73\x00\x69\x00\x73\x00\x74\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x04\xc8\x37\x67\
-\x00\x65\
-\x00\x76\x00\x61\x00\x63\x00\x2d\x00\x73\x00\x74\x00\x61\x00\x79\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0d\
-\x03\x38\x01\xe7\
-\x00\x65\
-\x00\x76\x00\x61\x00\x63\x00\x75\x00\x61\x00\x74\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x17\
-\x04\x5c\xe6\x67\
-\x00\x73\
-\x00\x74\x00\x72\x00\x75\x00\x63\x00\x74\x00\x75\x00\x72\x00\x65\x00\x5f\x00\x6e\x00\x6f\x00\x5f\x00\x64\x00\x61\x00\x6d\x00\x61\
-\x00\x67\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x13\
-\x00\xd6\x0e\x27\
-\x00\x65\
-\x00\x76\x00\x61\x00\x63\x00\x2d\x00\x6e\x00\x6f\x00\x2d\x00\x63\x00\x6f\x00\x6e\x00\x74\x00\x61\x00\x63\x00\x74\x00\x2e\x00\x70\
-\x00\x6e\x00\x67\
-\x00\x15\
-\x0d\xe9\x76\x47\
-\x00\x73\
-\x00\x74\x00\x72\x00\x75\x00\x63\x00\x74\x00\x75\x00\x72\x00\x65\x00\x5f\x00\x64\x00\x61\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x64\
-\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x11\
-\x06\xe0\x8e\xa7\
-\x00\x72\
-\x00\x6f\x00\x75\x00\x74\x00\x65\x00\x5f\x00\x62\x00\x6c\x00\x6f\x00\x63\x00\x6b\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\
-\x00\x14\
-\x0d\xb2\x4a\xa7\
-\x00\x73\
-\x00\x74\x00\x72\x00\x75\x00\x63\x00\x74\x00\x75\x00\x72\x00\x65\x00\x5f\x00\x66\x00\x61\x00\x69\x00\x6c\x00\x65\x00\x64\x00\x2e\
-\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x00\xb5\x45\xe7\
-\x00\x77\
-\x00\x61\x00\x72\x00\x6e\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0b\x46\xc4\x07\
-\x00\x72\
-\x00\x65\x00\x73\x00\x63\x00\x75\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x00\x88\x5a\xe7\
-\x00\x66\
-\x00\x69\x00\x72\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x06\
-\x04\xd6\x57\x47\
-\x00\x49\
-\x00\x43\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x0d\xaa\x82\x07\
-\x00\x61\
-\x00\x6e\x00\x69\x00\x6d\x00\x61\x00\x6c\x00\x5f\x00\x69\x00\x73\x00\x73\x00\x75\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
 "
 
 qt_resource_struct_v1 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
-\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x9a\x93\
-\x00\x00\x00\x92\x00\x02\x00\x00\x00\x13\x00\x00\x00\x06\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
 \x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x9d\xa7\
-\x00\x00\x03\x14\x00\x00\x00\x00\x00\x01\x00\x01\xc1\x51\
-\x00\x00\x02\xdc\x00\x00\x00\x00\x00\x01\x00\x01\xab\x7a\
-\x00\x00\x02\x2a\x00\x00\x00\x00\x00\x01\x00\x01\x36\x69\
-\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x38\
-\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x00\xfe\x79\
-\x00\x00\x01\xf6\x00\x00\x00\x00\x00\x01\x00\x01\x0e\x6d\
-\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xfa\x1e\
-\x00\x00\x03\x2a\x00\x00\x00\x00\x00\x01\x00\x01\xc2\xe1\
-\x00\x00\x01\x04\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x87\
-\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xa8\x99\
-\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x00\xa9\x8d\
-\x00\x00\x02\x86\x00\x00\x00\x00\x00\x01\x00\x01\x67\x99\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x23\
-\x00\x00\x02\xf8\x00\x00\x00\x00\x00\x01\x00\x01\xad\x90\
-\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\xce\xfe\
-\x00\x00\x01\x2a\x00\x00\x00\x00\x00\x01\x00\x00\xbf\x43\
-\x00\x00\x03\x3c\x00\x00\x00\x00\x00\x01\x00\x01\xcc\xab\
-\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x01\x7a\xe4\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x01\x39\xf7\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x03\x14\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x93\
 "
 
 qt_resource_struct_v2 = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x9a\x93\
-\x00\x00\x01\x71\x2e\x4d\x0a\xbe\
-\x00\x00\x00\x92\x00\x02\x00\x00\x00\x13\x00\x00\x00\x06\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x24\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x64\x0e\x39\x93\x81\
-\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x9d\xa7\
-\x00\x00\x01\x4b\x3e\x28\xeb\x20\
-\x00\x00\x03\x14\x00\x00\x00\x00\x00\x01\x00\x01\xc1\x51\
-\x00\x00\x01\x74\x32\x62\x3a\xe8\
-\x00\x00\x02\xdc\x00\x00\x00\x00\x00\x01\x00\x01\xab\x7a\
-\x00\x00\x01\x74\x32\x69\xed\xa8\
-\x00\x00\x02\x2a\x00\x00\x00\x00\x00\x01\x00\x01\x36\x69\
-\x00\x00\x01\x70\xfb\x39\xd0\x5b\
-\x00\x00\x01\x5e\x00\x00\x00\x00\x00\x01\x00\x00\xd7\x38\
-\x00\x00\x01\x65\x95\x57\x0b\x32\
-\x00\x00\x01\xd6\x00\x00\x00\x00\x00\x01\x00\x00\xfe\x79\
-\x00\x00\x01\x65\x95\x5c\x2b\x54\
-\x00\x00\x01\xf6\x00\x00\x00\x00\x00\x01\x00\x01\x0e\x6d\
-\x00\x00\x01\x65\x95\x55\x9b\x78\
-\x00\x00\x01\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xfa\x1e\
-\x00\x00\x01\x70\xfb\x3b\xa9\xa2\
-\x00\x00\x03\x2a\x00\x00\x00\x00\x00\x01\x00\x01\xc2\xe1\
-\x00\x00\x01\x65\x97\x48\x0e\xfe\
-\x00\x00\x01\x04\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x87\
-\x00\x00\x01\x70\xfb\x32\x19\x52\
-\x00\x00\x00\xb6\x00\x00\x00\x00\x00\x01\x00\x00\xa8\x99\
-\x00\x00\x01\x74\x32\x60\x5a\xd8\
-\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x00\xa9\x8d\
-\x00\x00\x01\x65\x95\x5d\xe8\xd8\
-\x00\x00\x02\x86\x00\x00\x00\x00\x00\x01\x00\x01\x67\x99\
-\x00\x00\x01\x65\x97\x36\x7f\x70\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\xe5\x23\
-\x00\x00\x01\x65\x95\x5b\x74\x02\
-\x00\x00\x02\xf8\x00\x00\x00\x00\x00\x01\x00\x01\xad\x90\
-\x00\x00\x01\x65\x95\x5c\xcb\x30\
-\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\xce\xfe\
-\x00\x00\x01\x65\x97\x4a\xfa\xf4\
-\x00\x00\x01\x2a\x00\x00\x00\x00\x00\x01\x00\x00\xbf\x43\
-\x00\x00\x01\x65\x95\x5d\x83\xcf\
-\x00\x00\x03\x3c\x00\x00\x00\x00\x00\x01\x00\x01\xcc\xab\
-\x00\x00\x01\x65\x95\x5e\x56\xb2\
-\x00\x00\x02\xae\x00\x00\x00\x00\x00\x01\x00\x01\x7a\xe4\
-\x00\x00\x01\x65\x95\x56\x94\x1f\
-\x00\x00\x02\x56\x00\x00\x00\x00\x00\x01\x00\x01\x39\xf7\
-\x00\x00\x01\x65\x95\x56\x24\x58\
+\x00\x00\x01\x74\x57\x5d\xb0\xc0\
+\x00\x00\x00\x48\x00\x00\x00\x00\x00\x01\x00\x00\x03\x14\
+\x00\x00\x01\xa1\x4f\x1a\x86\x8f\
+\x00\x00\x00\x6c\x00\x00\x00\x00\x00\x01\x00\x00\x0c\x93\
+\x00\x00\x01\x74\x57\x5d\xb0\xc0\
 "
 
 qt_version = [int(v) for v in QtCore.qVersion().split('.')]
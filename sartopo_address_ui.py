@@ -67,45 +67,6 @@ class Ui_Dialog(object):
         self.markerSymbolComboBox.setIconSize(QtCore.QSize(30, 30))
         self.markerSymbolComboBox.setFrame(True)
         self.markerSymbolComboBox.setObjectName("markerSymbolComboBox")
-        icon1 = QtGui.QIcon()
-        icon1.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/dot.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon1, "")
-        icon2 = QtGui.QIcon()
-        icon2.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/assisted.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon2, "")
-        icon3 = QtGui.QIcon()
-        icon3.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/evacuated.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon3, "")
-        icon4 = QtGui.QIcon()
-        icon4.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/rescued.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon4, "")
-        icon5 = QtGui.QIcon()
-        icon5.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/follow_up.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon5, "")
-        icon6 = QtGui.QIcon()
-        icon6.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/animal_issue.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon6, "")
-        icon7 = QtGui.QIcon()
-        icon7.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/shelter_in_place.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon7, "")
-        icon8 = QtGui.QIcon()
-        icon8.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/structure_no_damage.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon8, "")
-        icon9 = QtGui.QIcon()
-        icon9.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/structure_damaged.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon9, "")
-        icon10 = QtGui.QIcon()
-        icon10.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/structure_failed.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon10, "")
-        icon11 = QtGui.QIcon()
-        icon11.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/structure_destroyed.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon11, "")
-        icon12 = QtGui.QIcon()
-        icon12.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/warning.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon12, "")
-        icon13 = QtGui.QIcon()
-        icon13.addPixmap(QtGui.QPixmap(":/sartopo_address/sartopo_markers/route_blocked.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.markerSymbolComboBox.addItem(icon13, "")
         self.linkIndicator = QtWidgets.QLineEdit(Dialog)
         self.linkIndicator.setEnabled(False)
         self.linkIndicator.setGeometry(QtCore.QRect(46, 44, 56, 28))
@@ -184,9 +145,9 @@ class Ui_Dialog(object):
         self.clearAddressButton.setGeometry(QtCore.QRect(490, 3, 20, 39))
         self.clearAddressButton.setFocusPolicy(QtCore.Qt.NoFocus)
         self.clearAddressButton.setText("")
-        icon14 = QtGui.QIcon()
-        icon14.addPixmap(QtGui.QPixmap(":/sartopo_address/tall_x_icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
-        self.clearAddressButton.setIcon(icon14)
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap(":/sartopo_address/tall_x_icon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.clearAddressButton.setIcon(icon1)
         self.clearAddressButton.setIconSize(QtCore.QSize(12, 30))
         self.clearAddressButton.setObjectName("clearAddressButton")
         self.folderComboBox = STSFeatureComboBox(Dialog)
@@ -238,19 +199,6 @@ class Ui_Dialog(object):
         self.latLonField.setPlaceholderText(_translate("Dialog", "Lat/Lon (D.d)"))
         self.label.setText(_translate("Dialog", "Address"))
         self.locationCountLabel.setText(_translate("Dialog", "0 Locations loaded"))
-        self.markerSymbolComboBox.setItemText(0, _translate("Dialog", "Default"))
-        self.markerSymbolComboBox.setItemText(1, _translate("Dialog", "Assisted"))
-        self.markerSymbolComboBox.setItemText(2, _translate("Dialog", "Evacuated"))
-        self.markerSymbolComboBox.setItemText(3, _translate("Dialog", "Rescued"))
-        self.markerSymbolComboBox.setItemText(4, _translate("Dialog", "Follow-up"))
-        self.markerSymbolComboBox.setItemText(5, _translate("Dialog", "Animal Issue"))
-        self.markerSymbolComboBox.setItemText(6, _translate("Dialog", "Shelter In Place"))
-        self.markerSymbolComboBox.setItemText(7, _translate("Dialog", "No Damage"))
-        self.markerSymbolComboBox.setItemText(8, _translate("Dialog", "Damaged"))
-        self.markerSymbolComboBox.setItemText(9, _translate("Dialog", "Failed"))
-        self.markerSymbolComboBox.setItemText(10, _translate("Dialog", "Destroyed"))
-        self.markerSymbolComboBox.setItemText(11, _translate("Dialog", "Warning"))
-        self.markerSymbolComboBox.setItemText(12, _translate("Dialog", "Route Blocked"))
         self.label_4.setText(_translate("Dialog", "Map"))
         self.goButton.setText(_translate("Dialog", "Go"))
         self.modeComboBox.setItemText(0, _translate("Dialog", "Mode"))